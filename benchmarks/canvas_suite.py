@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+""" Time the core operations of the pattern canvas without a GUI.
+
+For each synthetic size x size chart we run, in this order,
+
+  - create_new_canvas
+  - pasting a 4x4 block tiled across the chart (paste_selection)
+  - painting all rows with a 6 stitch cable (_paint_cells)
+  - insert_rows and delete_marked_rows in the middle of the chart
+  - undoing and redoing everything
+  - save_project, read_project and load_previous_pattern
+  - export_scene as png
+
+After redoing everything the memory footprint of the canvas, its
+undo stack and copy selection is recorded as well (see
+sconcho.gui.memory_report); it is reported but not compared.
+
+The canvas is driven through the same entry points the main window
+uses; only the dialogs are skipped. Results are written as JSON and
+compared against a stored baseline. The exit status is 1 if any
+benchmark got slower than the baseline by more than the tolerance.
+
+On Qt builds with the QPA platform plugins no display is needed
+(QT_QPA_PLATFORM defaults to offscreen). Plain X11 builds of Qt4
+need a display, e.g., via xvfb-run. Usage:
+
+    python benchmarks/canvas_suite.py [--sizes 10,100,1000]
+                                      [--output FILE] [--baseline FILE]
+                                      [--save-baseline]
+
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+topLevelPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, topLevelPath)
+
+from PyQt4.QtCore import QT_VERSION_STR
+from PyQt4.QtGui import (QApplication,
+                         QColor)
+
+import sconcho.util.io as io
+import sconcho.util.symbol_parser as parser
+from sconcho.gui.color_widget import (ColorSelectorItem,
+                                      ColorSynchronizer)
+from sconcho.gui.memory_report import canvas_memory_report
+from sconcho.gui.pattern_canvas import PatternCanvas
+from sconcho.util.settings import DefaultSettings
+
+
+DEFAULT_SIZES = "10,100,1000"
+DEFAULT_TOLERANCE = 0.2
+CABLE_SYMBOL = "3 over 3 right"
+NUM_INSERTED_ROWS = 10
+PASTE_TILE = 4
+MAX_EXPORT_WIDTH = 2000
+
+defaultBaseline = os.path.join(topLevelPath, "benchmarks",
+                               "canvas_baseline.json")
+
+
+
+class Timer(object):
+    """ Collects the wall clock time of named benchmarks in ms. """
+
+    def __init__(self):
+
+        self.results = {}
+
+
+    def __call__(self, name, function, *args):
+
+        start = time.perf_counter()
+        result = function(*args)
+        self.results[name] = (time.perf_counter() - start) * 1e3
+        return result
+
+
+
+def paint_cables(canvas, cableSymbol):
+    """ Paint as many cables into each row as fit. """
+
+    cableWidth = int(cableSymbol["width"])
+    numCables = canvas._numColumns // cableWidth
+    if numCables == 0:
+        return
+
+    canvas.set_active_symbol(cableSymbol)
+    canvas.select_cells(canvas._items_in_col_row_range(0,
+                                numCables * cableWidth - 1,
+                                0, canvas._numRows - 1))
+    canvas.set_active_symbol(None)
+
+
+
+def select_rows(canvas, firstRow, numRows):
+    """ Select numRows complete rows starting at firstRow. """
+
+    canvas.select_cells(canvas._items_in_col_row_range(0,
+                                canvas._numColumns - 1,
+                                firstRow, firstRow + numRows - 1))
+
+
+
+def insert_rows(canvas):
+    """ Insert rows above the middle row. """
+
+    canvas.insert_rows(canvas._numRows // 2, NUM_INSERTED_ROWS, "above")
+
+
+
+def delete_rows(canvas):
+    """ Delete as many rows in the middle as were inserted. """
+
+    select_rows(canvas, canvas._numRows // 2, NUM_INSERTED_ROWS)
+    canvas.delete_marked_rows()
+
+
+
+def paste_tiles(canvas):
+    """ Copy the upper left corner and paste it tiled across
+    the chart.
+
+    """
+
+    numTiles = min(canvas._numRows, canvas._numColumns) // PASTE_TILE
+    if numTiles == 0:
+        return
+
+    canvas.select_cells(canvas._items_in_col_row_range(0, PASTE_TILE - 1,
+                                                       0, PASTE_TILE - 1))
+    canvas.copy_selection()
+
+    extent = numTiles * PASTE_TILE - 1
+    canvas.select_cells(canvas._items_in_col_row_range(0, extent,
+                                                       0, extent))
+    canvas.paste_selection()
+
+
+
+def undo_all(canvas):
+    """ Undo all commands on the undo stack. """
+
+    while canvas._undoStack.canUndo():
+        canvas.undo()
+
+
+
+def redo_all(canvas):
+    """ Redo all commands on the undo stack. """
+
+    while canvas._undoStack.canRedo():
+        canvas.redo()
+
+
+
+def load_project(canvas, knittingSymbols, result):
+    """ Load a project returned by read_project into canvas. """
+
+    (status, errMsg, patternGridItems, legendItems, colors,
+     activeItem, patternRepeats, repeatLegends, rowRepeats,
+     textItems, rowLabels, columnLabels) = result
+    if not status:
+        raise RuntimeError(errMsg)
+
+    canvas.load_previous_pattern(knittingSymbols, patternGridItems,
+                                 legendItems, patternRepeats,
+                                 repeatLegends, rowRepeats, textItems,
+                                 rowLabels, columnLabels)
+
+
+
+def export_png(canvas, exportFileName):
+    """ Export the chart as png at most MAX_EXPORT_WIDTH wide. """
+
+    bounds = canvas.visible_scene_bounds(True)
+    width = min(int(bounds.width()), MAX_EXPORT_WIDTH)
+    height = int(bounds.height() * width / bounds.width())
+    io.export_scene(canvas, width, height, 300, exportFileName)
+
+
+
+def run_suite(canvas, knittingSymbols, settings, size, workDir):
+    """ Returns the timings of all benchmarks for a size x size chart
+    and the memory report of the canvas with a full undo stack.
+
+    """
+
+    timer = Timer()
+    timer("create_new_canvas", canvas.create_new_canvas, size, size)
+
+    # paste before painting cables; copying part of a cable would
+    # give a non-rectangular copy selection
+    timer("paste_tiles", paste_tiles, canvas)
+    timer("paint_cables", paint_cables, canvas,
+          knittingSymbols[CABLE_SYMBOL])
+    if size > NUM_INSERTED_ROWS:
+        timer("insert_rows", insert_rows, canvas)
+        timer("delete_rows", delete_rows, canvas)
+    timer("undo_all", undo_all, canvas)
+    timer("redo_all", redo_all, canvas)
+    memory = canvas_memory_report(canvas)
+
+    projectFile = os.path.join(workDir, "chart_%d.spf" % size)
+    colors = [(QColor("white"), 1)]
+    timer("save_project", io.save_project, canvas, colors, None,
+          settings, projectFile)
+    result = timer("read_project", io.read_project, settings, projectFile)
+    timer("load_project", load_project, canvas, knittingSymbols, result)
+
+    timer("export_scene", export_png, canvas,
+          os.path.join(workDir, "chart_%d.png" % size))
+
+    return (timer.results, memory)
+
+
+
+def compare(results, baseline, tolerance):
+    """ Print results next to the baseline and return the number
+    of benchmarks slower than the baseline by more than tolerance.
+
+    """
+
+    numRegressions = 0
+    print("%-8s %-18s %12s %12s %8s" %
+          ("size", "benchmark", "baseline ms", "current ms", "change"))
+    for (size, timings) in sorted(results.items(), key=lambda x: int(x[0])):
+        oldTimings = baseline.get(size, {})
+        for (name, current) in sorted(timings.items()):
+            if name not in oldTimings:
+                print("%-8s %-18s %12s %12.1f" %
+                      (size, name, "-", current))
+                continue
+
+            old = oldTimings[name]
+            change = (current - old) / max(old, 1e-6)
+            flag = ""
+            if change > tolerance:
+                flag = "  SLOWER"
+                numRegressions += 1
+            print("%-8s %-18s %12.1f %12.1f %+7.0f%%%s" %
+                  (size, name, old, current, 100 * change, flag))
+
+    return numRegressions
+
+
+
+def main():
+    """ Run the suite, write and compare the results. """
+
+    argParser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    argParser.add_argument("--sizes", default=DEFAULT_SIZES,
+                           help="comma separated list of chart sizes")
+    argParser.add_argument("--output",
+                           help="file the JSON results are written to")
+    argParser.add_argument("--baseline", default=defaultBaseline,
+                           help="JSON results to compare against")
+    argParser.add_argument("--save-baseline", action="store_true",
+                           help="store the results as the new baseline")
+    argParser.add_argument("--tolerance", type=float,
+                           default=DEFAULT_TOLERANCE,
+                           help="relative slowdown reported as regression")
+    args = argParser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    app = QApplication(sys.argv)
+    settings = DefaultSettings("Sconcho", "sconcho-benchmark")
+
+    # exports have to be rendered, not fetched from the cache
+    settings.renderCacheSize.value = 0
+
+    symbolPath = os.path.join(topLevelPath, "sconcho", "symbols")
+    knittingSymbols = parser.parse_all_symbols([symbolPath])
+
+    canvas = PatternCanvas(settings, knittingSymbols["knit"])
+    colorObject = ColorSelectorItem(QColor("white"), ColorSynchronizer())
+    canvas.set_active_colorObject(colorObject)
+
+    workDir = tempfile.mkdtemp(prefix="sconcho-benchmark")
+    try:
+        results = {}
+        memory = {}
+        for size in sizes:
+            (results[str(size)], memory[str(size)]) = \
+                run_suite(canvas, knittingSymbols, settings, size, workDir)
+    finally:
+        shutil.rmtree(workDir)
+
+    report = { "date" : time.strftime("%Y-%m-%d %H:%M:%S"),
+               "python" : sys.version.split()[0],
+               "qt" : QT_VERSION_STR,
+               "results" : results,
+               "memory" : memory }
+
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as baselineFile:
+            baseline = json.load(baselineFile)["results"]
+    numRegressions = compare(results, baseline, args.tolerance)
+    print()
+    for (size, footprint) in sorted(memory.items(), key=lambda x: int(x[0])):
+        print("%-8s %-18s %12.1f KiB" % (size, "memory",
+                                         footprint["totalBytes"] / 1024.0))
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as baselineFile:
+            json.dump(report, baselineFile, indent=2, sort_keys=True)
+
+    return 1 if numRegressions else 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+""" Measure the import time of sconcho.sconcho_gui.
+
+Each run imports the module in a fresh interpreter with
+python -X importtime and keeps the fastest of all runs. The result
+is appended to a history file (one JSON object per line) and
+compared against the previous entry so regressions show up over
+time. Usage:
+
+    python benchmarks/import_time.py [--runs N] [--history FILE]
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+MODULE = "sconcho.sconcho_gui"
+DEFAULT_RUNS = 5
+NUM_REPORTED_MODULES = 15
+
+topLevelPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+defaultHistory = os.path.join(topLevelPath, "benchmarks",
+                              "import_time_history.jsonl")
+
+
+
+def measure_import(module):
+    """ Import module in a fresh interpreter and return a dictionary
+    mapping each imported module to its (self, cumulative) import
+    time in microseconds.
+
+    """
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([topLevelPath,
+                                         env.get("PYTHONPATH", "")])
+    process = subprocess.Popen([sys.executable, "-X", "importtime",
+                                "-c", "import %s" % module],
+                               env=env, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE,
+                               universal_newlines=True)
+    (dummy, output) = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError("failed to import %s:\n%s" % (module, output))
+
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            timings[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+        except (IndexError, ValueError):
+            # header line
+            continue
+
+    return timings
+
+
+
+def run_benchmark(runs):
+    """ Returns the timings of the fastest of runs imports. """
+
+    best = None
+    for dummy in range(runs):
+        timings = measure_import(MODULE)
+        if not best or timings[MODULE][1] < best[MODULE][1]:
+            best = timings
+
+    return best
+
+
+
+def load_last_result(historyPath):
+    """ Returns the last entry in the history file or None. """
+
+    if not os.path.isfile(historyPath):
+        return None
+
+    lastLine = None
+    with open(historyPath) as history:
+        for line in history:
+            if line.strip():
+                lastLine = line
+
+    return json.loads(lastLine) if lastLine else None
+
+
+
+def main():
+    """ Run the benchmark and report the result. """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help="number of imports; the fastest is kept")
+    parser.add_argument("--history", default=defaultHistory,
+                        help="file the results are appended to")
+    args = parser.parse_args()
+
+    timings = run_benchmark(args.runs)
+    total = timings[MODULE][1]
+    sconchoTotal = sum(selfTime for (name, (selfTime, dummy))
+                       in timings.items() if name.startswith("sconcho"))
+
+    print("import %s: %.1f ms (sconcho modules %.1f ms)" %
+          (MODULE, total / 1e3, sconchoTotal / 1e3))
+    print("\nslowest modules (self time):")
+    slowest = sorted(timings.items(), key=lambda item: item[1][0],
+                     reverse=True)
+    for (name, (selfTime, cumulative)) in slowest[:NUM_REPORTED_MODULES]:
+        print("  %8.1f ms  %8.1f ms  %s" %
+              (selfTime / 1e3, cumulative / 1e3, name))
+
+    previous = load_last_result(args.history)
+    if previous:
+        change = 100.0 * (total - previous["total"]) / previous["total"]
+        print("\nprevious run (%s): %.1f ms, change %+.1f%%" %
+              (previous["date"], previous["total"] / 1e3, change))
+
+    result = { "date" : time.strftime("%Y-%m-%d %H:%M:%S"),
+               "python" : sys.version.split()[0],
+               "total" : total,
+               "sconcho" : sconchoTotal,
+               "modules" : dict((name, selfTime) for
+                                (name, (selfTime, dummy)) in
+                                slowest[:NUM_REPORTED_MODULES]) }
+    with open(args.history, "a") as history:
+        history.write(json.dumps(result, sort_keys=True) + "\n")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+""" Compare the adaptive scene index and item cache policy of the
+pattern canvas against Qt's defaults.
+
+For charts of increasing size we time
+
+  - building a new chart (create_new_canvas)
+  - inserting rows in the middle of the chart
+  - undoing and redoing the insertion NUM_HISTORY_SWEEPS times
+  - looking up grid cells by row and column
+  - repainting the view at normal and high zoom
+
+once with the adaptive policy and once with an auto depth BSP index
+and the default item cache mode. Needs a display since the repaint
+benchmark shows the view. Usage:
+
+    python benchmarks/scene_index.py [--sizes 50,100,200]
+
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+topLevelPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, topLevelPath)
+
+from PyQt4.QtGui import (QApplication,
+                         QGraphicsScene)
+
+import sconcho.gui.pattern_canvas_objects as canvasObjects
+import sconcho.util.symbol_parser as parser
+from sconcho.gui.pattern_canvas import PatternCanvas
+from sconcho.gui.pattern_view import PatternView
+from sconcho.util.settings import DefaultSettings
+
+
+NUM_LOOKUPS = 2000
+NUM_REPAINTS = 10
+NUM_INSERTED_ROWS = 10
+NUM_HISTORY_SWEEPS = 5
+HIGH_ZOOM = 6.0
+
+
+
+def timed(function, *args):
+    """ Returns the wall clock time in ms it takes to call function. """
+
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1e3
+
+
+
+def set_policy(canvas, adaptive):
+    """ Switch canvas between the adaptive policy and Qt's
+    defaults.
+
+    """
+
+    canvasObjects.ADAPTIVE_SCENE_INDEX = adaptive
+    canvas.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+    canvas.setBspTreeDepth(0)
+
+
+
+def insert_rows(canvas, numRows):
+    """ Insert rows in the middle of the chart. """
+
+    canvas.insert_rows(numRows // 2, NUM_INSERTED_ROWS, "above")
+
+
+
+def sweep_history(canvas):
+    """ Undo all commands and redo them again a few times. """
+
+    for dummy in range(NUM_HISTORY_SWEEPS):
+        while canvas._undoStack.canUndo():
+            canvas.undo()
+        while canvas._undoStack.canRedo():
+            canvas.redo()
+
+
+
+def look_up_cells(canvas, numRows, numColumns):
+    """ Look up random grid cells by row and column. """
+
+    random.seed(0)
+    for dummy in range(NUM_LOOKUPS):
+        canvas._item_at_row_col(random.randrange(numRows),
+                                random.randrange(numColumns))
+
+
+
+def repaint(view, app):
+    """ Repaint the visible part of the chart a few times. """
+
+    for dummy in range(NUM_REPAINTS):
+        view.viewport().repaint()
+        app.processEvents()
+
+
+
+def set_zoom(view, zoom, adaptive):
+    """ Zoom the view to zoom, adjusting the item cache mode only
+    for the adaptive policy.
+
+    """
+
+    view.resetMatrix()
+    view.scale(zoom, zoom)
+    view.scene().set_zoom_level(zoom if adaptive else 1.0)
+
+
+
+def run_benchmarks(app, canvas, view, size, adaptive):
+    """ Returns the timings of all benchmarks for a size x size chart. """
+
+    set_policy(canvas, adaptive)
+    set_zoom(view, 1.0, adaptive)
+
+    results = {}
+    results["build"] = timed(canvas.create_new_canvas, size, size)
+    results["insert rows"] = timed(insert_rows, canvas, size)
+    results["undo/redo"] = timed(sweep_history, canvas)
+    results["lookup"] = timed(look_up_cells, canvas, size, size)
+
+    for zoom in (1.0, HIGH_ZOOM):
+        set_zoom(view, zoom, adaptive)
+        repaint(view, app)
+        results["repaint %gx" % zoom] = timed(repaint, view, app)
+
+    return results
+
+
+
+def main():
+    """ Run the benchmarks and print a comparison table. """
+
+    argParser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    argParser.add_argument("--sizes", default="50,100,200",
+                           help="comma separated list of chart sizes")
+    args = argParser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    app = QApplication(sys.argv)
+    settings = DefaultSettings("Sconcho", "sconcho-benchmark")
+    symbolPath = os.path.join(topLevelPath, "sconcho", "symbols")
+    knittingSymbols = parser.parse_all_symbols([symbolPath])
+
+    canvas = PatternCanvas(settings, knittingSymbols["knit"])
+    view = PatternView()
+    view.setScene(canvas)
+    view.resize(800, 600)
+    view.show()
+    app.processEvents()
+
+    print("%-8s %-12s %12s %12s %8s" %
+          ("size", "benchmark", "default ms", "adaptive ms", "gain"))
+    for size in sizes:
+        default = run_benchmarks(app, canvas, view, size, False)
+        adaptive = run_benchmarks(app, canvas, view, size, True)
+        for name in sorted(default.keys()):
+            gain = default[name] / max(adaptive[name], 1e-6)
+            print("%-8s %-12s %12.1f %12.1f %7.2fx" %
+                  ("%dx%d" % (size, size), name, default[name],
+                   adaptive[name], gain))
+
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,46 @@
 import sys, os
 
 
+PROFILE_STARTUP = "--profile-startup"
+EXIT_AFTER_STARTUP = "--exit-after-startup"
+
+
 def main():
     """ This is a simple wrapper for starting the main
-    sconcho gui. 
+    sconcho gui.
 
     For now we check if any command line arguments were
     passed. If yes, we assume the first one was meant to
-    be a sconcho spf file and then pass it on to 
+    be a sconcho spf file and then pass it on to
     sconcho_gui_launcher().
+
+    Options:
+
+      --profile-startup[=FILE]  print the time spent in each startup
+                                phase (including the import of sconcho)
+                                and write a cProfile dump to FILE
+      --exit-after-startup      quit as soon as sconcho is up, e.g.,
+                                to benchmark startup
     """
 
+    profileStartup = False
+    profileFile = None
+    exitAfterStartup = False
+    arguments = []
+    for argument in sys.argv[1:]:
+        if argument == PROFILE_STARTUP:
+            profileStartup = True
+        elif argument.startswith(PROFILE_STARTUP + "="):
+            profileStartup = True
+            profileFile = argument.split("=", 1)[1]
+        elif argument == EXIT_AFTER_STARTUP:
+            exitAfterStartup = True
+        else:
+            arguments.append(argument)
+
+    # Qt and sconcho only get to see the remaining arguments
+    sys.argv[1:] = arguments
+
     fileName = ""
     if len(sys.argv) > 1:
         fileName = sys.argv[1]
@@ -24,8 +54,13 @@ def main():
         fileName = None
 
     try:
-        from sconcho.sconcho_gui import main 
-        main(fileName)
+        # start timing before the import so it is included
+        from sconcho.util.startup_timer import (start_phase_timer,
+                                                mark_phase)
+        start_phase_timer(profileStartup, profileFile)
+        from sconcho.sconcho_gui import main
+        mark_phase("import sconcho")
+        main(fileName, exitAfterStartup)
     except ImportError as error:
         print("Failed to start sconcho - %s" % error)
 
@@ -28,7 +28,7 @@ from PyQt4.QtGui import (QColor,
                          QWidget,
                          QLabel)
 
-from PyQt4.QtSvg import QSvgWidget
+from sconcho.util.symbol_svg import SymbolIcon
 
 
 ###############################################################
@@ -148,15 +148,15 @@ class SymbolDisplayItem(QFrame):
         layout.setContentsMargins( 0, 0, 0, 0 )
         self.setToolTip(symbol["description"])
 
-        # add the symbol's svg
-        svgWidget = QSvgWidget(symbol["svgPath"]) 
+        # add the symbol's icon
+        iconWidget = SymbolIcon(symbol)
         svgWidth = int(symbol["width"])
         self.setMinimumWidth(svgWidth * 25)
         self.setMaximumWidth(svgWidth * 25)
         self.setMinimumHeight(25)
         self.setMaximumHeight(25)
 
-        layout.addWidget(svgWidget)
+        layout.addWidget(iconWidget)
         self.setLayout(layout)
 
 
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import json
+import logging
+import time
+import tracemalloc
+
+from collections import (deque,
+                         namedtuple)
+
+from PyQt4.QtCore import (QObject,
+                          Qt,
+                          SIGNAL)
+
+from PyQt4.QtGui import (QCheckBox,
+                         QDockWidget,
+                         QHBoxLayout,
+                         QPushButton,
+                         QTableWidget,
+                         QTableWidgetItem,
+                         QUndoCommand,
+                         QVBoxLayout,
+                         QWidget)
+
+import sconcho.gui.undo_framework as undo_framework
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+# number of records kept by a CommandProfiler
+RING_BUFFER_SIZE = 500
+
+
+# a single undo or redo of a command. wallTime is in ms, memoryDelta
+# in bytes of python heap (the C++ side of Qt objects is not seen).
+# NOTE: The command runs while tracemalloc is tracing, which slows
+# down every python allocation; wallTime is therefore inflated
+# compared to an uninstrumented run and best used to compare
+# commands with each other.
+CommandRecord = namedtuple("CommandRecord", ["timestamp", "command",
+                                             "text", "action", "wallTime",
+                                             "itemsCreated", "itemsRemoved",
+                                             "memoryDelta"])
+
+
+
+def undo_command_classes():
+    """ Returns all undo commands defined in the undo framework. """
+
+    return [value for value in vars(undo_framework).values()
+            if isinstance(value, type) and issubclass(value, QUndoCommand)
+            and value.__module__ == undo_framework.__name__]
+
+
+
+##########################################################################
+#
+# Records wall time, number of canvas items created and removed and
+# the change in python heap size of every undo and redo of the
+# commands in the undo framework.
+#
+# While disabled nothing is instrumented, so there is no overhead at
+# all. Enabling replaces the undo/redo methods of all commands as
+# well as addItem/removeItem of the canvas by measuring wrappers;
+# disabling puts the originals back.
+#
+# NOTE: Items removed via QGraphicsScene.clear() are not counted.
+#
+##########################################################################
+class CommandProfiler(QObject):
+
+
+    def __init__(self, canvas, numRecords = RING_BUFFER_SIZE,
+                 parent = None):
+
+        super(CommandProfiler, self).__init__(parent)
+
+        self.canvas = canvas
+        self.records = deque(maxlen = numRecords)
+
+        self._originals = []
+        self._startedTracing = False
+        self._itemsCreated = 0
+        self._itemsRemoved = 0
+
+
+
+    def is_enabled(self):
+        """ Returns True if commands are being recorded. """
+
+        return bool(self._originals)
+
+
+
+    def enable(self):
+        """ Start recording commands. """
+
+        if self.is_enabled():
+            return
+
+        for commandClass in undo_command_classes():
+            for action in ("redo", "undo"):
+                if action in commandClass.__dict__:
+                    self._instrument(commandClass, action)
+
+        self.canvas.addItem = self._add_item
+        self.canvas.removeItem = self._remove_item
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._startedTracing = True
+
+
+
+    def disable(self):
+        """ Stop recording commands and remove all instrumentation. """
+
+        if not self.is_enabled():
+            return
+
+        for (commandClass, action, method) in self._originals:
+            setattr(commandClass, action, method)
+        self._originals = []
+
+        del self.canvas.addItem
+        del self.canvas.removeItem
+
+        if self._startedTracing:
+            tracemalloc.stop()
+            self._startedTracing = False
+
+
+
+    def clear(self):
+        """ Forget all records. """
+
+        self.records.clear()
+
+
+
+    def dump_to_log(self):
+        """ Write all records to the log, one JSON object each. """
+
+        for record in self.records:
+            logger.info("undo command %s" %
+                        json.dumps(record._asdict(), sort_keys = True))
+
+
+
+    def _instrument(self, commandClass, action):
+        """ Replace the action method of commandClass by a wrapper
+        recording each call.
+
+        """
+
+        method = commandClass.__dict__[action]
+        self._originals.append((commandClass, action, method))
+
+        def wrapper(command):
+            self._record(command, action, method)
+
+        setattr(commandClass, action, wrapper)
+
+
+
+    def _record(self, command, action, method):
+        """ Call method for command and record what it cost. """
+
+        itemsCreated = self._itemsCreated
+        itemsRemoved = self._itemsRemoved
+        memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+
+        method(command)
+
+        wallTime = (time.perf_counter() - start) * 1e3
+        record = CommandRecord(time.time(), type(command).__name__,
+                               command.text(), action, wallTime,
+                               self._itemsCreated - itemsCreated,
+                               self._itemsRemoved - itemsRemoved,
+                               tracemalloc.get_traced_memory()[0] - memory)
+        self.records.append(record)
+        self.emit(SIGNAL("command_recorded"), record)
+
+
+
+    def _add_item(self, item):
+        """ Counting replacement for canvas.addItem. """
+
+        self._itemsCreated += 1
+        type(self.canvas).addItem(self.canvas, item)
+
+
+
+    def _remove_item(self, item):
+        """ Counting replacement for canvas.removeItem. """
+
+        self._itemsRemoved += 1
+        type(self.canvas).removeItem(self.canvas, item)
+
+
+
+##########################################################################
+#
+# debug dock showing the records of a CommandProfiler
+#
+##########################################################################
+class CommandProfilerDock(QDockWidget):
+
+
+    def __init__(self, profiler, parent = None):
+
+        super(CommandProfilerDock, self).__init__("command profiler",
+                                                  parent)
+
+        self.profiler = profiler
+        self.setObjectName("commandProfilerDock")
+
+        self.recordBox = QCheckBox("record commands")
+        dumpButton = QPushButton("dump to log")
+        clearButton = QPushButton("clear")
+
+        self.recordTable = QTableWidget(0, 7)
+        self.recordTable.setHorizontalHeaderLabels(["command", "text",
+                                                    "action", "time [ms]",
+                                                    "created", "removed",
+                                                    "memory [KiB]"])
+        self.recordTable.verticalHeader().hide()
+        self.recordTable.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        buttonLayout = QHBoxLayout()
+        buttonLayout.addWidget(self.recordBox)
+        buttonLayout.addStretch()
+        buttonLayout.addWidget(dumpButton)
+        buttonLayout.addWidget(clearButton)
+
+        layout = QVBoxLayout()
+        layout.addLayout(buttonLayout)
+        layout.addWidget(self.recordTable)
+        widget = QWidget()
+        widget.setLayout(layout)
+        self.setWidget(widget)
+
+        self.connect(self.recordBox, SIGNAL("toggled(bool)"),
+                     self.toggle_recording)
+        self.connect(dumpButton, SIGNAL("clicked()"),
+                     self.profiler.dump_to_log)
+        self.connect(clearButton, SIGNAL("clicked()"),
+                     self.clear)
+        self.connect(self.profiler, SIGNAL("command_recorded"),
+                     self.add_record)
+
+        for record in self.profiler.records:
+            self.add_record(record)
+
+
+
+    def toggle_recording(self, status):
+        """ Turn recording of commands on or off. """
+
+        if status:
+            self.profiler.enable()
+        else:
+            self.profiler.disable()
+
+
+
+    def clear(self):
+        """ Clear all records. """
+
+        self.profiler.clear()
+        self.recordTable.setRowCount(0)
+
+
+
+    def add_record(self, record):
+        """ Append record to the table, dropping the oldest rows
+        beyond the profiler's ring buffer size.
+
+        """
+
+        row = self.recordTable.rowCount()
+        self.recordTable.insertRow(row)
+
+        entries = [record.command, record.text, record.action,
+                   "%.2f" % record.wallTime, str(record.itemsCreated),
+                   str(record.itemsRemoved),
+                   "%.1f" % (record.memoryDelta / 1024.0)]
+        for (column, entry) in enumerate(entries):
+            item = QTableWidgetItem(entry)
+            if column > 2:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.recordTable.setItem(row, column, item)
+
+        while self.recordTable.rowCount() > self.profiler.records.maxlen:
+            self.recordTable.removeRow(0)
+
+        self.recordTable.scrollToBottom()
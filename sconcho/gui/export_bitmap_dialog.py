@@ -36,7 +36,6 @@ from PyQt4.QtGui import (QDialog,
                          QMessageBox)
 
 from sconcho.gui.ui_export_bitmap_dialog import Ui_ExportBitmapDialog
-from sconcho.util.canvas import visible_bounding_rect
 import sconcho.util.messages as msg
 
 
@@ -153,7 +152,7 @@ class ExportBitmapDialog(QDialog, Ui_ExportBitmapDialog):
     def update_dimensions(self):
         """ Update values with the current canvas dimensions """
 
-        size = visible_bounding_rect(self.canvas.items()) 
+        size = self.canvas.visible_scene_bounds()
   
         imageWidth = math.floor(size.width())
         imageHeight = math.floor(size.height())
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import logging
+import os
+
+from PyQt4.QtCore import QResource
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+
+# binary resource file generated from icons.qrc via rcc -binary
+ICON_RESOURCE_FILE = os.path.join(os.path.dirname(__file__), "icons.rcc")
+
+_iconsRegistered = False
+
+
+
+def register_icon_resources():
+    """ Make the :/icons resources available.
+
+    This is done on first use instead of at import time. We prefer
+    the binary resource file since Qt maps it directly without going
+    through the python interpreter. If it can not be found (e.g.,
+    inside a frozen library.zip) we fall back to the compiled
+    icons_rc module.
+
+    """
+
+    global _iconsRegistered
+
+    if _iconsRegistered:
+        return
+
+    if os.path.isfile(ICON_RESOURCE_FILE) and \
+       QResource.registerResource(ICON_RESOURCE_FILE):
+        _iconsRegistered = True
+        return
+
+    logger.info("failed to register %s; falling back to icons_rc" %
+                ICON_RESOURCE_FILE)
+    import sconcho.gui.icons_rc
+    _iconsRegistered = True
@@ -2,7 +2,7 @@
 
 # Resource object code
 #
-# Created: Sat May 11 12:28:54 2013
+# Created: Mon Oct 19 10:14:37 2026
 #      by: The Resource Compiler for PyQt (Qt v4.8.4)
 #
 # WARNING! All changes made in this file will be lost!
@@ -10,79 +10,77 @@
 from PyQt4 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x04\x58\
+\x00\x00\x04\x39\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
 \x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x04\x1f\x49\x44\x41\x54\x78\xda\xa5\x55\xcf\x4f\x54\x67\
-\x14\x3d\xef\xbd\x6f\xde\x30\x3f\x5b\xc6\x81\x86\x0a\x08\x84\xa8\
-\x11\x5c\xd8\x11\xc5\xc4\x1a\xd4\x88\xd1\xc4\x85\x89\x2b\x16\x06\
-\x97\x2e\x5c\x91\x2e\x5d\x55\x77\x25\x51\x17\x2e\xdc\x9a\xd0\x3f\
-\x40\x25\xda\x8d\x89\x71\xa5\xa8\x55\xab\x9a\x4a\x81\x02\x05\x40\
-\x1c\x98\x61\x7e\x31\x30\xef\xf5\xdc\x8f\x37\x93\x57\x16\xdd\x78\
-\x92\x3b\xf7\xcd\x8f\xef\x7c\xe7\x9e\xef\xde\x6f\x8c\x9f\x80\xe6\
-\x80\x65\xfd\xdc\x91\x4c\x0e\x28\xcb\xb2\xf1\x15\xd8\xac\x54\xca\
-\x13\xcb\xcb\x23\x1b\x95\xca\x55\x25\xa4\x43\xfd\xfd\x83\xc5\x62\
-\x11\xcb\x6b\x6b\x80\xeb\xc2\x0f\xd3\x30\x60\x9a\xa6\xce\x96\x97\
-\xcd\xed\xd9\x7b\x8e\xd4\xd5\xd9\x9b\xc0\xe0\x2f\x8f\x1e\x41\xb5\
-\x53\x69\xbe\x50\xc0\xfc\xee\xdd\x48\xa4\x52\xf0\xc3\xf0\x16\x69\
-\xd2\x60\x50\xbf\x37\x36\x37\x61\x4a\xf6\xc2\xff\x9c\x7f\xf7\x0e\
-\x91\xd7\xaf\x21\x9c\x4a\x99\xa6\x2d\x4a\x63\x9d\x9d\x70\xb8\xc8\
-\xaf\x34\xd2\xde\x0e\x9b\x11\x6c\x68\x40\x38\x91\x80\x20\xff\xe5\
-\x0b\xf2\x8b\x8b\x28\x7c\xfa\x84\xe8\xea\x2a\xe0\x23\x0e\xb6\xb5\
-\xa1\x3c\x36\x06\xe1\x54\x2e\xa4\x7a\x17\x1b\xd9\x2c\x9c\x8d\x0d\
-\x08\x54\x28\x84\x1d\xa7\x4e\xa1\x7e\xff\x7e\x6c\x47\x34\x99\xd4\
-\x81\xae\x2e\xfc\xfd\xec\x19\x2c\x12\x85\xc4\x3e\x5a\x61\xac\xaf\
-\xeb\x0d\x84\x53\x89\xa7\x12\xe5\x4c\x06\x16\xbf\xb0\xc3\x61\xec\
-\xba\x7c\x19\x75\x9e\xc2\x3f\x1e\x3f\xc6\xe7\x37\x6f\x50\xa1\xca\
-\x38\xed\x50\x4d\x4d\x48\x70\xc3\xb6\x23\x47\xb0\xeb\xd0\x21\xac\
-\x75\x74\x60\xee\xce\x1d\x34\x28\x05\x50\x98\x01\x68\x3e\xe5\xf0\
-\x45\x22\xfd\xfc\x39\x12\xdd\xdd\xf8\xee\xc2\x05\x4d\x5a\xe0\x46\
-\xbf\x0d\x0f\xa3\x71\x6e\x0e\xcd\xd1\xe8\x96\xd7\xdc\xd8\xa4\x6d\
-\xe6\xf8\x38\x26\xe9\x65\xd3\xc0\x00\x62\x54\x6f\x1d\x3d\x8a\x8d\
-\x87\x0f\x61\x93\x87\x32\x35\x9f\x29\x36\x68\x2b\xe6\xe7\x11\x88\
-\x44\x90\x3c\x7c\x18\x82\xd1\xeb\xd7\xd1\x36\x31\x81\xfa\x4a\x05\
-\x6e\x2e\x87\x6f\xfa\xfb\x61\xf5\xf5\xa1\xc4\x0d\xc1\xf7\xf6\xdb\
-\xb7\xc8\xdc\xbd\x0b\x41\xe7\xb1\x63\x98\xad\xaf\x07\xd8\x04\x86\
-\x08\xd6\xc4\xd8\x82\x65\x59\x68\x38\x7d\x1a\x82\xdf\xef\xdd\x43\
-\x9c\x8a\x14\x5b\xd0\xa5\xc2\x10\x0f\x25\x79\xe6\x0c\x5a\xcf\x9d\
-\xdb\x22\xe0\x67\x42\xee\xd2\xdf\xf4\x93\x27\x10\xc4\x0f\x1e\x44\
-\x81\x76\x91\x4f\x42\x2b\xd6\x65\x2a\x12\xc7\x79\x20\x82\x89\xfb\
-\xf7\xb1\x43\x0e\x93\x21\xc4\x26\xbf\xab\xc2\x09\x04\x84\x54\x93\
-\x1b\xcc\x72\x78\x82\x46\x76\x55\x7a\x61\xa1\xa6\x58\xb9\x9e\x2f\
-\xc1\x78\x1c\x91\xd6\x56\x08\x8a\x1f\x3f\xc2\x28\x95\xe0\x96\xcb\
-\x70\x85\x88\xde\xd6\xc0\xcf\x84\x58\x6f\xc6\xb5\x9b\xac\x4c\x2b\
-\x6e\x6e\x46\xc6\xb6\xb1\xb3\x4a\x2c\x46\x1b\x9e\xe2\x2a\x42\x7c\
-\x96\x29\xd3\x21\x65\x39\x0e\xaa\x30\xf5\x22\x47\xb2\x4c\x9b\xce\
-\x55\xac\xcb\xb3\xff\xf0\x20\xe4\x34\x3e\x37\x33\x03\x41\x78\xdf\
-\x3e\x21\xd5\xbe\x2b\x6f\x6c\xfd\x83\xe3\x1f\x67\x7b\xcf\x1e\x08\
-\xb2\xb3\xb3\xf8\x96\x03\xe6\x72\x53\x72\xd6\x3c\xd6\x24\x85\x0f\
-\x1f\x20\x68\x3e\x79\x52\x37\xbc\xf2\x54\xfb\x15\x73\xa1\x26\xb5\
-\xbc\xbb\x43\xf5\xf6\x42\xb0\xcc\xb5\x8d\xec\x73\x6f\xe0\xb8\xc6\
-\xf3\x58\x7e\x94\x63\x2f\x0a\xba\xcf\x9f\xc7\x6a\x2a\x55\xb3\xa3\
-\xfc\xea\x15\x72\xd3\xd3\x58\x99\x9a\x42\xf1\xc5\x0b\x58\x9e\x62\
-\xbb\xa7\x07\x41\x8a\x10\x4c\x73\x6d\xd2\x23\x76\xaa\xc4\xf0\x88\
-\x4b\x4f\x9f\x62\x61\x74\x14\x82\x1f\xae\x5d\x43\x91\x2d\xa4\x15\
-\xb3\xed\xb2\x97\x2e\x61\xe6\xe2\x45\xf4\xf0\x30\x35\x29\xfb\xdd\
-\x1e\x1a\x82\x60\x9c\x6b\xbe\x67\x5f\xb3\x42\x5d\x91\x53\xed\x0a\
-\x71\x50\x79\x9e\xe6\x6f\xde\x44\xfe\xc0\x01\x44\x38\xba\x5d\x37\
-\x6e\x60\xfa\xc1\x03\x04\x78\x27\xa8\xc9\x49\x48\xcf\x04\xf6\xee\
-\x85\xc1\x71\x0e\x1f\x3f\x0e\x41\x8e\x83\x35\x7d\xeb\x16\x7e\x8c\
-\x46\x75\x13\x88\x69\x9a\x73\x38\x1a\x75\xfb\xd8\x83\x61\x96\x51\
-\x2d\x1d\xb1\x18\x02\x57\xae\xa0\xe5\xec\x59\xfc\x1f\xfe\x64\xbf\
-\x2f\xde\xbe\x8d\x14\xab\xb0\x29\x4a\x88\x97\x56\x56\xf0\x2b\xaf\
-\x07\xe5\xf7\xb8\x16\x2c\xdd\xe2\x3d\xf1\x17\xa7\xca\x3c\x71\x02\
-\x09\xaa\x8c\xb7\xb4\x40\x90\x65\xe7\xc8\x41\xfd\x43\x4f\x77\xbe\
-\x7f\x8f\xde\x70\x58\x08\x6b\xe1\x78\x1e\xab\x8a\xe3\x94\x8b\xa5\
-\x92\x5d\x1f\x89\x54\x5b\xac\xf6\x4f\x11\x7f\xf9\x12\x16\x0f\xae\
-\x04\x60\x89\x15\xe5\xd9\x4e\x31\x46\x03\x07\xa1\x45\x29\x18\x3e\
-\x52\xd3\xcb\x9f\x79\x47\x0b\xa7\x5a\x29\x95\x46\x16\x32\x99\x41\
-\x07\x74\x20\x14\xfa\xef\xbf\xc3\xb6\x1c\x61\xb8\xb2\x49\xf5\x37\
-\x20\xbc\x2c\xef\x97\x79\x05\x4c\x2d\x2d\x41\x38\xc5\x8a\xab\x63\
-\x9c\xf1\x78\x3a\x3d\x40\x02\x1b\x5f\x01\x72\x95\xb3\xe5\xf2\x88\
-\x70\xfe\x0b\x44\xcb\xf0\x2c\x1e\xa0\xc6\x2d\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\xf7\
+\x00\x00\x04\x00\x49\x44\x41\x54\x78\x5e\xa5\x94\xff\x8b\x54\x55\
+\x18\xc6\x3f\xe7\x9c\x3b\x33\xbb\x3b\xcb\xcc\xae\xae\x9a\x62\x8b\
+\xa9\x56\xea\x22\x99\x10\x1b\xe0\x2a\x14\x45\x00\x42\x06\xd2\x1f\
+\x11\x54\x04\xf4\x53\x3f\x16\x11\x11\x54\x14\x04\xf5\x53\x04\x41\
+\x82\x94\x84\xe4\xb0\xa8\x68\x81\x41\xd9\x22\x96\xed\xae\xee\xea\
+\x18\xe2\x98\xee\xac\x33\xf7\xcb\xdc\x7b\xcf\x39\xdd\x7b\xf0\xe2\
+\xc0\x56\x60\xbd\xf0\xf0\xce\x73\xcf\xfb\x3e\xf7\xbc\x0f\x77\x5e\
+\x61\xad\xe5\x7e\xc3\xfb\xdc\x53\xaf\xee\x7a\x65\x6e\xc7\xaa\x1d\
+\x6b\x52\x9b\xda\x85\xa5\x85\xf6\xc7\xdf\x7c\xb8\xb5\xfd\x46\x37\
+\xa6\xa8\xe1\x3f\x84\x2d\xd9\xd2\xe4\xd8\xe4\x03\xdb\x46\xb6\x0d\
+\x86\x36\xa4\x56\xae\x95\xc0\x0e\x01\xff\x4f\x58\x68\x41\x90\x04\
+\xa6\x13\x77\x08\x08\x08\x93\xd0\x82\x00\xe0\xbe\x85\x07\x3f\xa9\
+\xec\xb2\xca\x8e\x5b\x05\x0a\x59\x0e\xe3\x80\x3b\xf1\x1d\x42\x42\
+\x82\xc4\xb7\x76\xc0\x3e\x3b\xfa\xf6\xb0\x2f\x52\x01\x86\x45\xe7\
+\xb1\x10\xa2\x02\x88\x7f\xf4\xf4\x09\x55\x7a\xeb\xa3\x37\xaf\x3e\
+\x35\xfe\xf4\x48\x98\x06\x84\x26\xca\x90\x65\x22\x02\x7c\x3e\xbb\
+\xfe\x29\xe7\xba\xe7\xb0\x15\x8b\x2d\x83\x5a\x94\x8b\xde\xf8\xf8\
+\xf8\xe9\x03\x07\x0e\x4c\x0e\x0d\x0d\xd9\x4a\xa5\x42\xa9\x54\x42\
+\x29\x25\x00\x99\x24\x89\x8d\xe3\x38\x1f\x95\xaa\xad\xaa\x4e\x7c\
+\x87\x28\x8d\x08\x75\x48\xa0\x03\x7e\x5e\xfe\x89\xe9\xdb\xd3\x5c\
+\x36\x97\x90\x03\x02\xa3\x9c\xff\x10\xdb\xf5\xde\xf0\xf0\xf0\x93\
+\x47\x8e\x1c\x51\x42\x08\xfa\xe3\xee\x24\x00\x4e\xec\xe5\xe9\x97\
+\x88\xbd\x1e\xd7\xba\xd7\x98\x6f\xcf\xf1\xdb\xed\x0b\xdc\xd2\xb7\
+\xc9\x2c\x40\x0e\x0a\x0c\x20\x8b\xde\x80\x8a\xa7\x94\x72\x02\xff\
+\x16\x9e\xf0\x38\xff\xc7\x0c\xdf\x5d\x3a\x86\x54\x0a\x00\x9f\x0e\
+\xae\x0d\x81\xd2\x8a\x7a\x67\x38\xbf\xad\x43\xfb\xda\xb2\x95\x59\
+\xac\x50\xf5\x7d\x9f\xe5\xe5\x65\x8a\x50\x52\x71\xec\xc5\x06\xef\
+\x3d\xf4\x01\xa7\x0f\xfd\x40\xe3\xf9\x13\x8c\xd9\x35\x00\x88\x04\
+\x36\x46\x1b\xf9\x7a\xef\xb7\x4c\x4f\x9d\x62\x7a\xf2\x14\xfe\x3b\
+\x3d\xe3\xe5\xe3\xde\xea\xde\x02\x2c\xdd\xc8\xe7\xd7\xe6\x05\x74\
+\xa8\xd1\xda\x60\xbc\x3c\x3b\x90\xea\x14\xbf\x15\x70\xfc\xec\x71\
+\x7a\x71\x8f\x28\x08\x29\xd5\x4a\x6c\x5f\xb5\x83\x31\xbd\x86\xa3\
+\xa7\x8e\x52\x92\x25\xaa\xb2\x0a\x09\xc2\xb3\x58\x71\x33\x69\x21\
+\x85\xe4\xc7\x9b\x67\xf9\xa5\x7b\x0e\x19\x48\xc2\x24\xe0\xaa\xbd\
+\x42\x90\xe5\x30\x0d\x89\x74\xc4\x33\xf1\x73\x7c\x79\xfd\x0b\x82\
+\xd8\xc7\x18\xc3\x23\xf5\x47\xd9\xb9\x7a\x82\xba\x19\xe1\xfd\x8b\
+\xef\x82\xc2\x45\xae\xe9\xe5\x05\x0b\xcb\x97\xe9\x26\x5d\x5e\xff\
+\xfe\x35\x12\x93\xb0\x59\x6d\x41\xa2\x98\xd7\xb3\xa0\x00\x01\x56\
+\x40\x37\xf6\xe9\x78\x1d\x84\x02\x12\x28\x87\x65\x64\x94\x5f\x22\
+\x5c\xf1\xb1\x7a\x3a\xd5\xdc\x8c\x5a\xae\xf1\xb1\x07\x1f\x07\x05\
+\xab\xd3\x31\x04\x82\xda\x50\x1d\x64\x3e\x13\x0e\x83\x17\x06\xd9\
+\xfd\xf0\x1e\x30\x60\xb7\x1a\x6c\x62\x39\xaf\xcf\xb3\xae\xb9\x9e\
+\xdd\xe3\x7b\x40\x83\xd0\xd0\xe0\x24\x5e\x9a\xa6\x6c\x2f\xed\x24\
+\x4a\x22\x5e\x28\x1d\x42\x1b\x8d\xee\x69\xd2\x24\xc5\xa4\x3a\xe3\
+\x06\xad\x53\xe7\xb3\xff\x67\xc0\xde\x2b\xfb\xc8\x7b\x4c\xc6\x75\
+\x6a\x5c\xbe\xd3\xec\xb0\x2e\x5e\x47\xaa\x35\xc2\x40\xc3\x9e\xb4\
+\x62\xd3\xa6\x4d\xe9\xfc\xfc\xbc\xb2\xd6\x3a\xdf\xf2\xdc\x6a\xb5\
+\x88\xa2\x88\x0d\x1b\x36\x38\xee\x60\x0c\x5f\x1d\x3e\xcc\xc1\x83\
+\x07\x0b\x8e\xb9\x7b\x76\xf2\xc4\x09\xa6\xa6\xa6\x0a\x4e\xf6\xa7\
+\xd3\xb2\xd7\xeb\x51\x88\x16\x39\x83\xbb\x95\x6b\x2e\x60\x2d\x49\
+\x92\x38\x5e\xa0\x38\x4f\xd2\xb4\xe0\x4e\xa3\x5a\xad\x22\x7d\xdf\
+\x77\x63\xf6\x15\x17\xc2\x4e\xac\x5f\x3c\x8e\xe3\x7b\xdc\xda\xa2\
+\xde\xbd\xd0\x02\x42\x08\x94\x94\x8c\x8e\x8e\xe2\x65\xc2\x72\x66\
+\x66\xc6\x89\x17\x58\x5a\x5a\x22\x7b\x4e\xb3\xd9\x74\x5c\xa7\xa9\
+\xf3\x7a\x71\x71\x91\x46\xa3\xe1\x6a\xd2\x0c\xc5\xd9\xe5\x85\x05\
+\x3c\xcf\xa3\x5c\x2e\xbb\x5d\x33\x32\x32\x22\x3c\x9b\xc5\xc4\xc4\
+\x84\xe8\xf7\xac\x75\xe3\x06\xed\x76\x9b\xcd\x5b\xb6\x38\x5e\x8c\
+\x38\x37\x37\xc7\xbe\xfd\xfb\x11\x90\x73\x57\x2f\x80\x33\x67\xce\
+\xb0\x3f\x7f\x2e\x25\x52\x88\x5c\x18\x09\xac\xb0\x41\x17\xe3\xdd\
+\x1b\xbb\xb0\x67\x85\x6d\xe4\xe3\x7b\x9e\xb3\x41\xe6\xc2\x4a\x51\
+\xaf\xd7\x85\x04\x9c\x88\x6b\xee\xf7\x58\xeb\x7e\xee\xe0\xea\xb4\
+\x2e\x6a\x8b\x35\xe8\x04\xc1\x79\xec\x90\x6d\x4c\xc4\xda\xb5\x6b\
+\x7f\xcf\x16\xce\xe6\xbf\x59\x9b\xb2\xef\x77\x91\x05\xe0\x08\xc0\
+\xc0\xc0\x00\xb5\x5a\xcd\x7d\x05\x59\xb6\x79\xce\xf6\x3a\xb3\xb3\
+\xb3\x17\xff\x02\x94\x66\xfa\x33\xc9\xd2\xe3\x5a\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x32\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
 \x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
@@ -90,6053 +88,536 @@ qt_resource_data = b"\
 \x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
 \x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
 \x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x05\x74\x49\x44\
-\x41\x54\x58\x85\xcd\x97\xcf\x6f\x1b\x45\x14\xc7\xdf\x9b\xd9\x1f\
-\xde\xb5\xd7\x89\xd3\x24\x35\x89\xc3\x8f\x42\x53\x08\x87\x22\x37\
-\x97\x56\x42\xa9\xc4\xc1\x7f\x40\x2b\x11\x11\x89\x14\xba\x51\xc4\
-\x81\x63\x11\x3d\x35\x39\x15\xc1\x91\x03\x8a\xb2\x15\xcd\xa1\x10\
-\x89\xe6\x0f\xc8\x01\xa9\xbd\xa4\x17\x17\x29\xa8\x0a\xa1\xa0\x40\
-\x89\x95\x5a\x69\xf3\xc3\xbb\xf6\xae\xf7\xd7\x0c\x07\x77\x93\x3a\
-\xb1\x13\x03\xaa\xc2\x93\x56\x5a\xcd\xce\xcc\xe7\xbb\x6f\xde\x9b\
-\x79\x83\xba\xae\xc3\x51\x1a\x39\x52\xfa\xff\x41\x80\xf0\x4f\x3a\
-\x8f\x18\x86\x20\x0b\x30\x24\x0a\x64\x14\x00\xfb\x08\x42\x1c\x00\
-\x80\x71\xa8\x00\xf0\x55\x3f\x60\x33\x6e\x00\x77\x6f\xe9\x7a\xd0\
-\xea\x9c\xd8\x4a\x0c\x4c\x1b\x06\xc9\x4b\xe4\xba\x20\xe1\x45\x29\
-\x2e\xa4\xe5\xb8\xa8\x12\x8a\x75\x7d\x58\xc8\xc1\xad\xf8\xb6\x57\
-\x09\x8a\x81\xc7\x6f\x0f\x7a\xec\xea\x98\xae\xb3\xff\x2c\x60\xcc\
-\x30\xfa\xa9\x42\x66\xe3\xc7\xe4\x01\x39\x2e\xc8\x87\xaa\x05\x00\
-\xb7\x12\xb8\x95\x0d\x77\x29\x74\xd8\xf0\xb4\xae\x3f\xfc\x57\x02\
-\xa6\x0d\x03\xf3\x12\xb9\x26\xa9\xe4\x72\x22\xad\x64\x90\xd4\xff\
-\x31\x70\x00\xdf\x0d\x01\x38\x00\x95\x08\xec\xf5\x08\x67\x1c\xca\
-\x45\xa7\xe0\xd9\xec\xc6\xa0\xc7\x26\xc7\x74\x9d\x37\xe2\x34\x8d\
-\x81\xbc\x44\xae\xc5\xbb\xe5\x2b\xb1\x76\x49\x8d\xda\x58\xc8\xa1\
-\xbc\xee\xae\x31\x37\x2c\x32\xc6\xd7\xc0\xe3\x77\x38\xa2\x85\x94\
-\x9f\x45\xc4\x7e\x51\x15\x4e\x28\x5d\x52\x9a\x0a\x04\x90\x20\x68\
-\x99\x78\xa6\xba\xed\x5d\xc9\xaf\xbb\x00\x00\x13\x2d\x7b\x60\xcc\
-\x30\xfa\x63\x1d\xd2\x8f\xc9\x8c\x9a\x89\xda\xaa\x25\xcf\xb6\xd7\
-\xdd\x45\xcf\x09\x3f\xb8\xa1\xeb\x7f\x36\x9a\x6c\xdc\x30\x4e\x31\
-\x01\x17\x3a\x4f\x6a\x1d\x44\xdc\x4d\x30\xb3\x60\x17\xaa\x9b\xde\
-\x7b\x8d\x96\x63\x5f\x1a\x4e\x1b\x06\xa1\x2a\x99\xd5\x7a\x95\x0c\
-\x90\x5a\x0f\x6b\xcd\x29\x94\x1f\x57\x27\xbf\x19\xf9\xe8\x5c\x33\
-\xf8\xb4\x61\x10\x50\xe8\x17\xed\x2f\xab\x0a\x91\x09\x44\x63\x81\
-\x00\x68\xbd\x4a\x86\xaa\x64\x76\xda\x30\xf6\xf1\xf6\x35\xe4\x65\
-\x72\x3d\xd1\xab\x0e\xa0\x44\x00\x28\x42\xd5\xf4\x6d\xd7\xf4\xbf\
-\x9e\xfa\xf0\xe3\x2f\x1b\x81\x23\x78\x5e\xa1\x73\xc9\xde\x58\x4e\
-\x4a\x49\x0a\x50\x04\xa0\x08\x2c\xe4\x00\x14\x01\x25\x02\x89\x5e\
-\x75\x20\x2f\x93\xeb\x07\x0a\x18\x31\x0c\x41\x50\xe8\x45\xb9\x5d\
-\x92\x81\x20\x30\x06\x60\x17\xdd\xc5\x96\xe0\x7d\x4a\x4e\x4a\xc9\
-\x0a\x10\x04\x20\x08\x9e\xe5\x3b\x4f\x97\xcd\xcd\x30\xe4\x00\x04\
-\x41\x6e\x97\x64\x41\xa1\x17\x47\x0c\xa3\x2e\xee\xea\x04\xc8\x02\
-\x0c\x49\x29\x29\x1d\x4d\x62\xad\x39\x6b\x9e\x1d\x7c\x70\x38\x5c\
-\xad\x87\x97\x7c\xc7\x5c\x75\xe6\x89\xcf\xcf\xd9\xc5\x6a\x31\x6a\
-\x97\x52\x52\x5a\x16\x60\xa8\xa9\x00\x51\xa6\xa3\x4a\xa7\xac\x22\
-\x45\x40\x8a\xc0\xdc\xb0\x78\xd0\x9a\xdf\x57\xe9\x5c\xf2\x95\x44\
-\x4e\xee\x94\x95\x68\x8c\x57\x0a\x1c\xab\x60\xcf\x0f\x3a\xe1\x85\
-\x29\x5d\xff\xd5\x2f\x07\x2b\xd1\x37\xa5\x53\x56\x45\x99\x8e\x36\
-\x15\x80\x88\x7d\x3b\x01\x84\x00\x3c\xe4\x6b\x07\xc1\xb5\xd7\x12\
-\x39\xb9\x53\x54\xa2\x60\x73\x4b\xbe\x63\xfd\x55\x9e\x3f\x63\x87\
-\x17\xa2\x5d\x90\x73\xfe\x90\x31\x0e\x40\x00\x88\x4c\x00\x11\xfb\
-\x9a\x0b\xa0\x10\x8f\xdc\xe5\x3b\x21\xf0\x80\xdd\x69\x0a\x3f\x91\
-\xc8\xc9\xc7\xa4\x1d\xb7\xbb\xdb\xbe\x63\xfd\x51\x0f\x07\x00\xe0\
-\x21\xdc\x0b\x5d\x06\x51\x3f\xa4\xb5\xf3\x23\xb2\x3d\x1b\x51\x2d\
-\x7a\xa3\x57\xce\xd1\x6a\x08\x7f\x43\xab\xc1\x9f\x99\xbb\xe1\x39\
-\xd6\xca\x7e\x78\xcd\xab\x5c\x8b\xb2\x62\x67\xe2\x66\x1e\xe0\x8c\
-\x57\x22\xa5\x34\x21\x00\x8a\x70\xb6\x0e\x9e\xa0\x73\x5a\x7f\x32\
-\x27\x77\xed\x06\x9c\xbb\xe5\x3b\xd6\x8a\xd5\x10\x0e\x00\x80\x22\
-\x39\x2f\x6a\xc2\x8e\x07\x38\xe3\x95\xe6\x02\x90\xaf\xb2\x80\xd5\
-\xd6\x4b\x22\x80\x88\xfd\x75\xf0\x93\xc9\x9c\xdc\x25\xed\xae\xf9\
-\xa6\xe7\x58\xbf\x9b\xf3\x67\xca\x8d\xe1\xcf\x04\xf4\x80\x80\x00\
-\x04\x80\x05\x0c\x38\xf2\xd5\xe6\x02\xec\x70\xc6\xdd\xf0\xec\x28\
-\x6a\xa5\x94\x74\x62\xdc\x30\x4e\xdd\x4f\xd0\xb9\xe4\x9b\x6d\xb9\
-\xd8\xf1\xe7\xa2\x7d\xcb\x77\xac\xdf\x0e\x86\x5f\x36\x8c\x57\x69\
-\x5c\x48\x47\x63\xdc\x0d\xcf\xe6\x76\x38\xd3\x54\x40\x25\x80\xbb\
-\xd5\xf5\xdd\xbc\x8d\xbf\x9e\x48\x33\x89\x2c\x24\xdf\x6a\xcb\xc9\
-\xdd\xcf\xb9\x7d\xc3\x73\xcc\xe5\xd2\x81\x70\x00\x00\x29\x29\x7e\
-\x97\x3c\xa5\xf5\x44\xe3\xaa\xeb\xd5\x62\x25\x80\xbb\x4d\x05\xdc\
-\xd2\xf5\x80\x55\xc2\xdb\xd5\x4d\xcf\x05\x82\x40\x55\x01\xba\xdf\
-\xed\xea\x90\x8f\xc7\x76\xe1\x4f\x3d\xc7\xfc\xe5\x70\xf8\xf8\xf7\
-\x37\x3f\x8b\xf7\x6b\xa7\x89\x4c\x6b\xf0\x4d\xcf\x65\x95\xf0\xf6\
-\xde\x6a\x69\xdf\x59\x90\xad\x04\x57\xad\x65\x73\x89\x47\xb9\x1b\
-\xa7\x3b\x87\x8a\xfb\xc4\x75\xcc\xa5\xed\x96\xe0\xb1\x6e\xe9\x53\
-\xa5\x27\xa6\x02\xa9\xd5\x06\xd6\xb2\xb9\x94\xad\x04\x57\xf7\xf6\
-\xdd\x27\x60\x4c\xd7\x59\xb8\xed\x0f\x9b\x0f\x4a\x85\x9d\xf4\xa1\
-\x08\xcc\x65\xb0\xb5\xb8\xe5\xf0\x72\xf8\xf9\x41\x6b\xfe\xc9\x0f\
-\x33\x0b\xda\xdb\xc9\x6b\xc9\x77\x52\x99\x68\xac\xf9\xa0\x54\x08\
-\xb7\xfd\xe1\x86\x59\xd2\xac\x22\x1a\x9f\xbd\x39\xa1\x0d\x24\xaf\
-\xa8\x7d\xea\x4e\x41\x12\x56\x43\x28\x2f\x9b\x45\x6f\xd3\x5b\x01\
-\x0e\x0f\x99\xc7\xee\x21\xa2\x86\x12\x39\x8f\x22\xf6\x50\x4d\x48\
-\xb7\x0d\xb4\xf5\x10\x69\xf7\xbf\xec\x55\xdb\xb6\x96\xcc\xaf\xa6\
-\x86\x2f\x4d\x34\xe2\x34\xad\x88\x06\xcb\xc1\x64\x7e\xc9\x04\xef\
-\x49\xf5\x72\xdb\xe9\x54\x06\x45\x02\x54\x15\xa0\x2d\xdb\x91\x06\
-\x80\x34\xf3\xd8\xb9\xa0\x1c\x5c\x42\x04\x10\xdb\xc4\x5a\x9e\x3f\
-\x67\xdc\x67\x50\x5a\xdc\x2a\xb8\x4f\xbc\x1b\x83\xe5\x60\x72\xaa\
-\x09\xa7\xb5\xa2\x34\x25\xce\x26\x4f\xa7\x06\x62\xe9\x58\x4b\x45\
-\x69\xb5\x58\x75\xcd\xc5\xad\xa5\x70\xcb\x3f\xb4\x28\xa5\xd9\x6c\
-\xf6\xc0\xc9\x7e\xca\x66\x37\xc6\x17\xf2\xd3\x8f\x36\xdc\x44\xf5\
-\xb1\xf3\x12\x67\x5c\x16\xe2\x54\x44\x91\xd4\x76\xd5\x67\x0f\x73\
-\x43\xb0\x1f\xd9\xb6\xf5\xf3\xf6\xaa\xfb\xa8\xf2\xed\x99\x52\xf0\
-\xfe\x84\xae\x3f\x3d\x4c\x6c\x4b\xf7\x82\xc8\x46\x0c\x43\x88\x0b\
-\x30\x84\x9a\x38\x8a\x00\x7d\x44\xc0\xda\xc5\x24\xe0\x15\x0e\xb0\
-\xca\x2d\x7f\xa6\xf2\x22\x2e\x26\x2f\xd2\x8e\xfc\x6e\x78\xe4\x02\
-\xfe\x06\x88\x39\xad\x57\x92\xe3\xa1\x6d\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x66\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x04\x2d\x49\x44\x41\x54\x78\xda\x7d\x55\xd9\x4b\xa3\x57\
-\x14\x3f\xd1\xb8\xaf\x55\x27\x6a\x5c\x12\xf7\xa9\x5b\xa2\x03\x63\
-\x8a\xce\x44\xd0\xd2\x97\x56\xda\xbe\x39\x4f\xa5\x21\x54\x2c\xe0\
-\x02\xf8\x6f\xf8\xa4\x55\xe8\x93\xd0\x06\x04\x4b\x09\x56\x2d\x75\
-\x04\xb1\x08\x51\x23\x06\xa3\x8e\xa8\xe0\x02\xa2\xc1\x7d\x8f\x71\
-\xe9\xf9\x1d\x9a\x8f\xaf\x69\x98\x0b\x87\xfb\xe5\xe6\xdc\xdf\x39\
-\xe7\x77\x96\xab\x79\x7e\x7e\xa6\x70\xab\xbb\xbb\x3b\xf1\xf1\xf1\
-\xf1\x8b\xe4\xe4\xe4\x37\x39\x39\x39\x6f\xd3\xd2\xd2\xca\xa2\xa3\
-\xa3\x35\xc7\xc7\xc7\x9b\x3e\x9f\xcf\xb5\xb1\xb1\xf1\xd7\xd5\xd5\
-\xd5\xd8\xf0\xf0\xf0\x55\xb8\xfb\x61\x81\x3b\x3b\x3b\x5b\x0b\x0a\
-\x0a\x7e\xaa\xab\xab\x4b\x31\x18\x0c\xe4\xf7\xfb\xff\x23\x77\x77\
-\x77\x74\x72\x72\x42\xf3\xf3\xf3\xe7\x6b\x6b\x6b\x3f\x8e\x8c\x8c\
-\xfc\xf2\x51\xe0\xae\xae\x2e\x1d\x7b\xf5\x73\x53\x53\xd3\x57\x3a\
-\x9d\x8e\x4e\x4f\x4f\x69\x73\x73\x93\x0e\x0f\x0f\x89\xbd\x14\xd0\
-\x84\x84\x04\x8a\x8d\x8d\xa5\x98\x98\x18\x88\xe8\x30\xb8\x93\xbd\
-\xb7\x4f\x4d\x4d\xf9\xfe\x07\xdc\xd1\xd1\xa1\xe3\xd0\xe7\x1a\x1b\
-\x1b\x0d\x91\x91\x91\xe4\xf5\x7a\x69\x65\x65\x85\x2e\x2f\x2f\x29\
-\x10\x08\x10\xff\x47\x4f\x4f\x4f\x04\x7d\x00\x42\x27\x22\x22\x42\
-\xf6\x9b\x9b\x1b\x44\xb1\xc3\x3a\xaf\x67\x67\x67\x05\x5c\xcb\x82\
-\x85\xcb\x03\xfc\x87\x61\x69\x69\x49\xf1\x10\x21\x97\x94\x94\x50\
-\x65\x65\x25\x55\x55\x55\x41\x4d\x8c\x41\x87\x39\x16\x63\x0f\x0f\
-\x0f\xb2\xe3\x2e\xcb\x00\xab\x7c\xab\x78\xdc\xd6\xd6\xd6\xca\x87\
-\xbf\x42\x01\x72\x7e\x7e\x4e\x1a\x8d\x86\xda\xdb\xdb\xa9\xb9\xb9\
-\x99\x42\x17\xee\x70\xd8\xd4\xdb\xdb\x0b\xae\x71\x47\x2d\xef\x96\
-\x97\x97\x1d\x1a\xbb\xdd\x8e\xec\x6f\xb3\xa4\xb3\xd0\xfd\xfd\xbd\
-\x78\xd1\xdf\xdf\x4f\xe0\x79\x7c\x7c\x9c\x46\x47\x47\x29\x2e\x2e\
-\x0e\xa1\x83\x0e\x31\xc6\x94\xd1\xc1\xc1\x01\xd9\x6c\x36\xf0\xac\
-\x06\x3e\x66\x31\x46\x56\x57\x57\x7f\xc9\x40\xdf\xb1\x00\x10\xe1\
-\x83\x6f\xaa\xa8\xa8\xa0\x9e\x9e\x1e\x72\xb9\x5c\x54\x53\x53\x43\
-\x16\x8b\x85\x6a\x6b\x6b\x29\x33\x33\x93\xa6\xa7\xa7\x69\x66\x66\
-\x86\x3e\x67\x03\xba\x17\x2f\x68\xf2\xfd\x7b\xdc\x0d\x4a\x3c\x8b\
-\x3b\x82\xb9\x7d\xc5\x42\x10\x78\x0b\x40\xab\xd5\x4a\x0e\x87\x83\
-\x9c\x4e\x27\x25\x26\x26\x52\x6a\x6a\x2a\xa5\xa7\xa7\x53\x56\x56\
-\x16\x65\x64\x64\x08\xef\x93\x93\x93\xf4\xc7\xd8\x18\xd5\x37\x34\
-\x50\x79\x79\x39\xa9\x30\x20\xaf\xb4\x00\x56\x27\xa1\xb8\xb8\x98\
-\x9e\x78\x1f\x1a\x1a\xa2\xb3\xb3\x33\x24\x11\x89\x92\x4b\xf1\xf1\
-\xf1\x74\x71\x71\x41\xeb\xeb\xeb\x48\x30\x0c\x0b\x25\xa5\xa5\xa5\
-\x12\x99\x0a\x47\x80\x4d\x41\x50\x48\x5e\x5e\x1e\xdd\xf9\xfd\x00\
-\x94\x04\x72\x22\xc0\x25\xf8\x06\xc7\xc2\xe7\xd1\xd1\x91\x94\x19\
-\x77\x21\x05\xd8\x43\xa3\xd1\x08\x2f\xd5\x3c\x9b\xb4\x21\x07\x0a\
-\x57\x68\x02\xd0\x80\xa4\xe1\x1c\xd9\x07\x30\xbe\xe1\x39\x16\xf6\
-\x00\xeb\x06\x69\x50\xe3\xc0\x63\x0f\x7f\x64\x05\x0f\xd6\x3f\x7c\
-\xa0\xcf\x2c\x16\xf1\xe2\xfa\xfa\x1a\xe0\xe8\x36\x18\x80\x97\x4a\
-\x82\x61\x24\x3f\x3f\x9f\x1e\xf9\xf7\xea\xea\x6a\x28\xb0\x07\xc0\
-\x6e\x0c\x9b\xe0\xe1\xb2\xd7\x2b\x5e\xb4\xb4\xb4\xd0\xde\xde\x9e\
-\x00\x26\x25\x25\x09\x78\x54\x54\x94\x00\x70\xfb\xca\x79\x43\x7d\
-\xbd\x18\xf2\x78\x3c\xa1\xc0\x6e\x01\x56\x87\xb0\xb8\xb8\x48\x53\
-\x5c\x3e\x6f\x38\xdb\xbb\xbb\xbb\x48\x0a\x5a\x18\x9e\x23\x74\x89\
-\x42\xab\xd5\x52\x8d\xd9\x8c\x8e\x94\x52\x9b\x9b\x9b\x53\xee\xff\
-\x3b\x22\xdc\x1a\x9e\x60\xea\x06\x81\x07\x02\xd0\xd7\xd7\x87\xd2\
-\x42\x0b\xc3\x23\x84\x0f\x03\xe2\xe9\xa7\x2f\x5f\x82\x2a\x49\xea\
-\xf7\x36\x1b\x8c\x21\x0a\x19\x52\xbc\x8e\x59\x8c\xd2\xd2\x66\xb3\
-\xb9\x95\x01\x95\x96\x06\x00\x92\x87\xae\x6a\xb4\x5a\x95\xe1\xa3\
-\x5e\x63\x5c\xc3\x03\x83\x83\xa2\x7b\x7b\x7b\x0b\x70\x8c\x02\x54\
-\xc7\x3b\xd6\x75\x28\xd3\xad\xac\xac\xec\x37\x06\xfd\x86\xc7\xa6\
-\x78\xcc\xc3\x1d\x97\x24\x82\x7c\x2e\xc1\x12\xae\xd5\x67\x36\x80\
-\x44\xa1\xae\xb3\xf5\x7a\xe2\xe1\x8f\x99\x0c\x6f\x01\x8a\x9c\xfc\
-\x0e\x8c\xd0\xe9\xd6\xc6\x9e\xd5\x72\xa8\x06\x24\x09\x61\x99\x4c\
-\x26\x44\x43\x30\x06\x2a\x10\x45\x9d\xc5\x02\x8e\xc5\xc0\xc4\xc4\
-\x04\xf1\x0b\x23\x11\x6d\x6f\x6f\xef\xf1\xfe\x43\xd8\x41\xaf\xd7\
-\xeb\x75\xbc\x0d\x66\x67\x67\x7f\x8d\x99\x80\x84\x81\xe7\xc2\xc2\
-\x42\xe2\x33\xa5\xf3\xf6\xf7\xf7\x21\x12\xfe\xd6\xd6\x16\xb9\xdd\
-\x6e\x27\x7f\xdb\x19\xcb\xf7\xd1\xa7\x29\x25\x25\xa5\x95\x81\xfa\
-\x8a\x8a\x8a\x3e\xc9\xcd\xcd\x45\xb9\xc1\x08\x3c\x46\xfd\x4a\x34\
-\x3b\x3b\x3b\xb4\xb0\xb0\x70\xc6\x89\x6d\x07\xa7\x61\x9f\xa6\x30\
-\x0b\xe1\xcb\x63\xca\x4d\xf1\x9a\xdf\xbd\x7a\x8e\xa6\x9a\x29\x42\
-\xab\x7b\xf9\xb9\xfa\x9b\x13\xe6\x62\xb5\x3f\xf9\x7e\xd8\xc7\xf4\
-\x1f\x85\x93\x46\x73\x71\x93\x58\x29\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x07\x39\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x06\xcb\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x03\xee\x00\x80\x00\x1a\x70\x07\x00\x04\x10\x0b\x32\x87\x91\x67\
-\x22\x76\x55\x7f\xff\x43\xf0\x3f\x20\xfb\x1f\x90\xfe\xcf\x20\xc3\
-\xc0\xf0\x3b\x1d\xc8\x0b\x02\xea\x62\x03\x0a\x6e\x67\x60\x60\x9d\
-\x01\x64\x5f\x63\x60\x62\x64\x60\x00\x79\x8b\x05\x4a\x33\x83\x68\
-\x46\x14\xe3\xfe\x7f\xc8\x83\xb3\x01\x02\x88\x85\x64\x27\xff\xff\
-\xe7\x0c\xb4\x7c\xa2\xb3\xb3\xb2\x76\x6c\xac\x36\x03\x3b\x3b\x0b\
-\xc3\xba\x75\x37\x73\x57\xaf\xbe\x16\x00\xb4\xad\x12\x68\xf3\x52\
-\x52\x8c\x03\x08\x20\xd2\x1c\xf0\xf7\x4f\x14\x33\x0b\xe3\xf4\xda\
-\x5a\x07\xbe\xb2\x52\x53\x06\x4e\x4e\x88\xf6\x90\x10\x55\x06\x27\
-\x27\x79\xd9\xd2\xb2\x03\x0b\xbf\x7c\xfe\x29\xc5\xc0\xc4\xda\x4d\
-\xac\x91\x00\x01\x44\x7c\x1a\xf8\xf3\x37\x86\x83\x83\x71\xee\xb4\
-\xe9\xee\x7c\xf5\x75\x96\x60\xcb\x6f\xbc\xfe\xcb\x70\xf6\xe9\x1f\
-\x06\x16\xe6\xbf\x0c\x19\x19\xfa\x0c\xab\x56\xf9\x32\x8b\x8a\x71\
-\x75\x31\xfc\xf9\x53\x49\xac\xb1\x00\x01\x44\x9c\x03\x7e\xff\x75\
-\x63\xf8\xff\x7f\x56\xef\x04\x37\x8e\xb4\x14\x5d\x50\x42\x60\xd8\
-\x7f\xff\x1f\x43\xeb\x51\x66\x86\xb6\xe3\x2c\x0c\x2b\x2f\xfd\x67\
-\xf8\xfb\xe3\x3b\x83\xa7\x87\x12\xc3\xbc\xf9\x5e\x0c\x7c\xfc\x6c\
-\x2d\x0c\x3f\xfe\x24\x31\x30\x32\x12\x34\x1a\x20\x80\x50\x1d\xf0\
-\x1f\x09\x23\x12\xa0\x0a\x90\x98\xd1\xda\x6e\xc7\x99\x95\xae\x07\
-\x96\xdc\x71\x87\x91\x61\xd2\x19\x26\x86\xaf\xbf\x81\x4e\xf9\xf3\
-\x87\x61\xce\xd9\x7f\x40\xfc\x87\xe1\xdb\x97\xaf\x0c\x3e\x5e\x8a\
-\x0c\xd3\x67\xb8\x32\x71\x72\x32\xf5\x31\xfc\xfe\xe7\x40\xc8\x01\
-\x00\x01\x84\xea\x00\x0e\x46\x08\x66\x67\x84\xa4\x62\x66\x46\x6e\
-\x86\x1f\x3f\x66\xc7\xc4\xe9\x29\x56\x94\x99\x81\x7d\x7e\xe4\xd1\
-\x3f\x86\x99\xe7\x19\xc1\x89\x9b\x85\xe1\x2f\x03\x23\xd0\x01\x6c\
-\xff\x7f\x33\x2c\x39\xfb\x9b\x61\xf5\x85\x5f\x0c\x7f\xbe\x7e\x61\
-\x88\x8a\x50\x67\x28\x2a\x33\xe3\x67\xf8\xf5\x6b\x0e\x50\x93\x34\
-\x3e\x07\x00\x04\x10\xaa\x03\x58\x18\x11\x98\x99\x81\x91\xe1\xcb\
-\xaf\x76\x03\x63\x29\x87\xde\x4e\x7b\x06\x26\x60\x56\xba\xf1\xe6\
-\x3f\xc3\xec\xf3\x4c\x0c\xa0\x80\x65\xfe\xf7\x97\xe1\xf7\xcf\xdf\
-\x0c\xbf\x7f\xfd\x02\x86\xc2\x6f\x06\x16\xa0\x23\xe6\x1c\xfb\xca\
-\xb0\xed\xea\x0f\x86\x5f\x5f\xbf\x31\x54\x94\x1a\x31\x78\xfb\xab\
-\x2a\x33\x7c\xfe\x35\x0d\xa8\x81\x03\xac\x09\x86\x91\x00\x40\x00\
-\x61\x8f\x02\x10\xf8\xfe\x37\x8a\x5f\x88\x23\x7b\xda\x74\x37\x06\
-\x31\x51\x4e\x86\x37\x5f\xff\x30\x4c\x3d\xcb\xc4\xf0\xe1\x27\x23\
-\x03\x2b\xd0\xe7\x3f\x7f\x81\x2c\x87\xe0\x3f\x40\x0c\xcc\x21\x0c\
-\x3f\x80\x0e\xea\xd9\xfd\x81\xe1\xcc\xbd\x6f\x0c\x5c\x2c\xff\x18\
-\x26\xf4\xdb\x33\x28\x6a\x08\xf9\x31\x7c\xfb\x5d\xc2\xc0\x8a\xe4\
-\x39\x24\x00\x10\x40\xa8\x0e\x80\xb9\xf0\xff\x7f\x25\x86\x7f\xff\
-\xda\xda\x3b\xec\x98\x2c\x4d\x25\x18\x7e\xff\xfe\xc3\x30\xe3\x1c\
-\x33\xc3\xfd\xf7\x8c\xc0\xd8\xf9\xcb\xf0\x0b\x68\xd1\x5f\xa8\xc5\
-\x7f\x60\x0e\x01\x8a\xb1\xfe\xff\xc3\xf0\xe6\xe3\x4f\x86\xb6\x2d\
-\x6f\x18\xee\x3c\xf9\xca\xa0\x28\xcd\xc1\x30\x79\xa2\x3d\x03\x1b\
-\x37\x6b\x05\x30\x3d\x58\x63\x0b\x01\x80\x00\x42\x75\x00\x28\x62\
-\x19\x81\x25\xdb\xc7\x5f\x13\xa2\x63\xb5\xe5\x32\x93\x81\x89\xee\
-\xff\x5f\x86\x15\xd7\x18\x19\xf6\x3d\x00\xca\xfd\xfd\xcb\xf0\xe9\
-\xeb\x4f\xa0\x03\x80\x71\xfd\x1b\xe6\x80\x3f\x60\x0c\x8a\x8a\x8f\
-\x5f\x7e\x02\x1d\xf6\x87\xe1\xd8\xcd\xcf\x0c\x5d\x5b\x5f\x31\x3c\
-\x7f\xf1\x85\xc1\xc3\x51\x8a\xa1\xa4\xc0\x90\x1b\x98\x62\x27\x03\
-\x4b\x44\x41\x06\x36\x54\x17\x00\x04\x10\x66\x36\x04\x66\x1f\x29\
-\x65\x01\xdf\xfa\x4a\x0b\x70\x7c\xbc\xfe\xfc\x9f\xe1\xf1\x27\x46\
-\x06\x4b\xc9\x3f\x0c\x06\xa2\xbf\x19\xf4\x45\xfe\x32\xb0\x31\xfc\
-\x61\xf8\x09\x0a\x05\x90\x23\x80\xf8\x17\x28\x0a\x80\x89\x51\x5f\
-\x8a\x99\xc1\x4c\x9e\x95\xc1\x59\x83\x83\xe1\xcd\x87\x9f\x0c\x37\
-\x9e\x7e\x63\x78\xfb\xe6\x0b\x43\x66\xb2\x16\x83\xa1\x95\xa4\x21\
-\xd0\x11\x35\xe8\xd6\x01\x04\x10\x23\x72\x7b\x80\x51\x66\x8a\x36\
-\xe3\xd7\xdf\xbb\x17\xce\xf6\x92\x8c\x0d\x51\x07\x1a\x0e\xf4\x19\
-\xb0\x0e\x60\x04\x3a\x84\x11\x18\x12\xff\x81\xf5\xc0\x1f\x20\xbf\
-\x64\xf3\x57\x86\x0b\x8f\x7f\x02\x13\xde\x1f\x70\x28\x7c\xff\xfe\
-\x9b\x81\x87\xf5\x2f\xc3\xcc\x58\x31\x06\x49\x7e\x66\x60\x5a\xf8\
-\xc7\xf0\x07\x68\xee\xaf\xdf\x40\x3d\x7f\xff\x31\x08\x09\x72\x30\
-\x5c\x06\x86\x8a\x77\xf8\xb6\x1f\xdf\xff\xff\xf7\xfe\xff\x3c\x77\
-\x1f\xcc\x4e\x80\x00\x42\x0d\x81\xef\x7f\xaa\xfc\x83\xd5\xc1\x96\
-\xff\x05\x6a\x04\x39\x8d\x19\x18\x2d\xe0\xf2\x84\x89\x19\x14\x3d\
-\x0c\x7f\xfe\x01\x0d\xff\xf3\x17\x98\xe6\xfe\x80\x1d\x08\xc1\xbf\
-\x21\xf4\x9f\x7f\x40\xf5\x4c\x0c\x5c\xbc\x1c\x0c\xdc\x3c\x1c\x0c\
-\x02\x7c\x9c\x0c\xfc\x02\x5c\x40\x4f\x30\x32\xd8\x5b\x4a\x30\xa4\
-\xa5\xe8\x70\x30\xfc\xfa\x87\x12\x0a\x00\x01\x84\x5a\x17\x70\xb1\
-\x70\x5c\xba\xfd\xee\xbf\xb9\xff\xea\xff\xbf\x7e\xfd\x85\x25\xcc\
-\x7f\xdf\xbf\xfe\x61\xd2\xd5\x14\x61\x5a\xd8\xeb\x00\x16\x00\xc5\
-\x33\x28\xd1\xfd\x87\x86\x00\x18\x03\x7d\xfc\x0f\x88\x39\x38\xd8\
-\x18\xaa\xfa\xce\x33\x6c\xd9\xf3\xf0\x1f\x17\x37\xeb\x3f\x98\x27\
-\x81\xee\x62\xf8\xf6\xe3\x0f\x13\x23\x2f\x0b\x8a\x9d\x00\x01\x84\
-\xea\x00\x56\xa6\xdc\x7b\xf7\x3e\xac\xb8\xf7\xeb\xef\x3f\xa4\x0c\
-\xf9\x97\xe1\xdb\x1f\x27\x4e\x46\xc6\xbc\x3f\xff\x21\xf9\xf4\xcf\
-\x1f\x88\xc5\x0c\x20\x07\x00\x1d\x02\xc2\x7f\x81\x72\xa0\x28\x02\
-\xc9\xdf\x79\xf0\x91\xe1\xf6\xb9\x97\xcb\x18\xb8\x59\x57\xa3\xd8\
-\xc1\xcc\xc4\xca\xc0\xc1\x7c\x0e\xd9\x4a\x80\x00\x42\xaf\x0d\x9f\
-\x01\x73\xc2\x6a\x06\x36\x66\x44\xb9\xc0\xca\x04\xca\xbb\x1c\xac\
-\xdc\xcc\x79\x20\x81\x7f\x40\xb7\x81\x82\xfc\x2f\xd4\x01\xbf\x81\
-\x6c\x30\x66\xfc\x0f\x8e\x36\x50\x28\xb0\x70\x00\xf5\xf3\xb0\x9e\
-\x67\xe0\x60\xd9\x04\x0c\x1a\x44\xd6\xc3\x52\x37\x00\x04\x10\xee\
-\xea\x18\x66\x39\xa8\x58\xfe\x0d\x2c\xc9\xa0\xe0\x1f\x28\x21\x82\
-\x12\x27\xd0\x01\xff\x90\xa3\x00\x24\x07\x4a\x37\xff\xa1\x16\x32\
-\x31\xb0\x83\x0b\x1f\x70\x4d\xfa\x1f\x23\xff\xc3\x00\x40\x00\xb1\
-\xe0\xb4\x1c\x94\x5f\x39\x99\x20\x6c\x66\x46\x08\x06\x85\x00\x30\
-\x11\xfe\xfd\x0d\x4d\x03\x0c\x7f\x10\x65\x01\x54\x0e\x14\x0d\xff\
-\x19\x19\x11\x7a\x40\x25\x1f\x30\x57\x30\xfc\xc2\xee\x08\x80\x00\
-\xc2\x74\x00\x28\xf6\xd9\x81\x16\x73\x33\x21\x52\x01\x33\x14\x43\
-\xe3\xf9\xf3\x97\x5f\x0c\xef\x3f\xfd\x00\x96\x7c\x7f\xc1\x05\xd0\
-\xb7\x6f\xc0\x02\x08\x58\x89\xfd\x85\x25\x1d\x26\x24\x3d\xe0\xc4\
-\xcd\x04\x11\xff\x8d\xd9\x05\x00\x08\x20\x16\x0c\xcb\x41\x3e\xe7\
-\x66\x46\x2b\x2d\x20\x65\x28\x28\xf8\x41\x96\xb8\x68\x71\x33\xa8\
-\x88\x30\x31\x30\xff\xff\x07\x4e\x90\xa0\x82\x88\x1d\xe8\x5b\x76\
-\x60\x90\xff\x02\x66\x45\x48\x91\xcb\x88\x88\x73\x10\xc5\x0d\x24\
-\xbe\xfd\x83\xd8\x81\x04\x00\x02\x08\xd5\x01\x20\xcb\x79\xb0\xb4\
-\x51\x80\xee\x61\x06\x1a\xce\xc9\xc6\xc2\xc0\x08\x6c\x09\x65\x79\
-\x88\x83\x0b\xa7\xbf\xa0\xe0\x06\x06\x3b\xd8\x61\x40\x83\xbf\xff\
-\xf8\xcd\xc0\x06\x4c\x37\xac\x6c\x4c\x90\xb4\x8f\x1e\xbe\xbc\xa0\
-\xbc\x88\x1a\x0a\x00\x01\x84\xaa\x84\x8f\x19\x7b\x4a\x61\x65\x62\
-\xfa\x04\x8c\xf3\x23\x57\xde\x00\x33\x08\x30\x0d\x80\x7c\x09\x72\
-\xc2\x7f\x50\xa2\x63\x80\x60\x06\x08\x83\xe3\xfd\x1f\x86\x57\x1f\
-\x7e\x00\x2d\x67\x66\x45\x6f\x0d\x83\x01\x0f\xaa\x18\x40\x00\x11\
-\xd7\x28\xe5\x64\x39\x7f\xf3\xf9\x97\xbb\xa1\xf9\xbb\x44\x81\xa1\
-\xfa\x1b\x9e\x36\x18\x91\x12\x2d\x2c\xaa\xfe\xff\x67\xfe\xfc\xfb\
-\xdf\x0f\x06\x6e\x96\x53\xc4\x18\x0d\x10\x40\x8c\x03\xdd\x37\x04\
-\x08\xa0\x01\xef\x19\x01\x04\xd0\x80\x3b\x00\x20\x80\x06\xdc\x01\
-\x00\x01\x06\x00\xd1\x67\xef\xf0\x4b\xda\xdd\x32\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\x2e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
-\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x08\xab\x49\x44\
-\x41\x54\x58\x85\x9d\x96\x7f\x50\x93\xf7\x1d\xc7\xdf\xdf\x3c\x4f\
-\x1e\x12\xe0\x49\x48\x94\x90\x88\x41\x08\x04\x70\x80\x08\x45\xa6\
-\xb4\xa0\x52\x7b\xae\x3a\x9d\xba\xea\xec\xd4\x93\x43\xab\x67\x67\
-\xdd\xe9\x79\xb5\xf6\xd4\xbb\xc2\xd9\x96\x9e\xd6\xcd\x9e\xd5\xae\
-\x76\x70\x95\xc1\xb9\xd3\x93\xde\xa0\xca\xbc\x95\xcd\x75\xd6\x41\
-\xaa\xa2\x41\x6a\x02\x92\x75\x44\x12\x13\x92\x10\x7e\xc4\xe4\x79\
-\xf2\x3c\xfb\xc7\x78\xc8\x8f\x41\xfb\xbd\xfb\xde\xe5\xc7\xe7\xfb\
-\xbc\x5e\xdf\xcf\xe7\xfb\xc9\x37\x10\x45\x11\xa2\x28\x02\x80\x34\
-\x23\x23\x83\x8d\xbc\xff\xb1\x13\x80\x14\x00\x35\x6f\xde\x3c\x0d\
-\x00\x7a\xaa\x78\x22\x8a\x22\xb4\x5a\x6d\x4c\x73\x73\xb3\x89\xa2\
-\xa8\x99\xf5\xf5\xf5\x05\x47\x8f\x1e\xfd\x0f\x7e\xc4\xd8\xb4\x69\
-\x93\xca\x68\x34\x1e\xd7\xeb\xf5\x6b\x04\x41\x88\x1e\x1c\x1c\xb4\
-\x9b\x4c\xa6\x43\x75\x75\x75\xf5\x93\xad\x21\x00\xa8\xf6\xf6\xf6\
-\x8e\x39\x73\xe6\x64\x00\xc0\xe0\xe0\x60\xb8\xb1\xb1\x71\xd7\xae\
-\x5d\xbb\xaa\x45\x51\xe4\xa7\x0b\xdf\xb6\x6d\x5b\x5e\x69\x69\x69\
-\xa3\x4a\xa5\x9a\xc5\x71\x1c\x78\x9e\x07\xc7\x71\x70\xbb\xdd\xdf\
-\x9d\x39\x73\xe6\x79\xb3\xd9\xec\x99\x68\x1d\x9d\x95\x95\xa5\xa4\
-\x69\x5a\x15\xf9\x80\x65\x59\x6a\xf9\xf2\xe5\x7f\xf8\xe4\x93\x4f\
-\xb2\x01\xfc\x76\x3a\xf0\x13\x27\x4e\x2c\xd8\xb8\x71\xe3\xd5\xe8\
-\xe8\x68\x25\xc7\x71\x88\x08\x38\x1c\x0e\x7b\x67\x67\xe7\x8b\x1d\
-\x1d\x1d\xde\xc9\xd6\x4a\xcc\x66\xb3\xe7\xf8\xf1\xe3\x2b\x86\x86\
-\x86\x78\x00\x18\x18\x18\xc0\xc0\xc0\x00\x52\x52\x52\xde\xd8\xb1\
-\x63\x47\xc1\x54\x70\xa3\xd1\xa8\x30\x18\x0c\xf5\x6a\xb5\x5a\xc9\
-\x30\x0c\xe4\x72\x39\x62\x62\x62\x30\x32\x32\xd2\xdb\xd2\xd2\x52\
-\x7a\xea\xd4\xa9\x87\xe2\x93\xc3\x31\xa1\x00\x00\x7c\xf6\xd9\x67\
-\xdf\xd6\xd7\xd7\x1f\xf4\x78\x3c\xf0\x78\x3c\xe8\xef\xef\x87\xd7\
-\xeb\x25\x0b\x17\x2e\xfc\xaa\xac\xac\x6c\xd1\x64\x8b\x09\x21\x64\
-\xcf\x9e\x3d\x9b\x0c\x06\x43\x2a\x4d\xd3\x88\x4c\x9f\xcf\xf7\xdf\
-\xb6\xb6\xb6\x82\xcf\x3f\xff\xdc\x32\xd5\x06\x24\x91\x17\xfb\xf7\
-\xef\x3f\xd6\xd4\xd4\x74\xd6\xed\x76\x8b\x1e\x8f\x07\x6a\xb5\x1a\
-\x3a\x9d\x8e\x2d\x2e\x2e\x6e\xde\xb3\x67\xcf\xbc\x89\x16\xa7\xa5\
-\xa5\x31\xb3\x67\xcf\x5e\x3b\x1a\xde\xdf\xdf\xff\xb0\xb1\xb1\xb1\
-\xf4\xfd\xf7\xdf\x77\x4e\x06\xcd\xcd\xcd\xd5\x8c\x13\x00\x80\xdd\
-\xbb\x77\xbf\x76\xfa\xf4\xe9\x15\x84\x10\xb7\x46\xa3\x81\x46\xa3\
-\x41\x7c\x7c\x3c\x9b\x9b\x9b\xfb\xaf\x49\x32\x11\xa5\x50\x28\x12\
-\xc7\xec\xde\x7c\xf9\xf2\xe5\xde\xc9\xe0\x85\x85\x85\xfa\xb7\xde\
-\x7a\xab\x7e\xdf\xbe\x7d\x3f\x1f\x27\x00\x00\x17\x2f\x5e\xbc\x52\
-\x5b\x5b\xfb\x6b\xab\xd5\xfa\x48\x2a\x95\x42\xaf\xd7\x63\xd6\xac\
-\x59\xb1\xc5\xc5\xc5\xcd\xaf\xbf\xfe\xfa\xfc\xd1\xb1\x14\x45\x89\
-\xb1\xb1\xb1\x33\x22\x70\xa9\x54\x8a\xc4\xc4\xc4\xbc\xb8\xb8\x38\
-\xd9\x44\xf0\xa5\x4b\x97\x26\x1f\x38\x70\xa0\xc1\x60\x30\x94\x16\
-\x15\x15\xfd\xce\x68\x34\x2a\xc6\x09\x00\x40\x43\x43\xc3\xd5\xda\
-\xda\xda\x57\xac\x56\xab\x8b\xa2\x28\xe8\x74\x3a\x68\x34\x1a\x36\
-\x3f\x3f\xff\xda\xce\x9d\x3b\x0b\x23\x71\x1c\xc7\x49\xe4\x72\xb9\
-\x2c\x02\xa7\x69\x1a\x5a\xad\x36\x7e\xf1\xe2\xc5\x99\x63\x9f\x59\
-\x52\x52\xa2\xdb\xbb\x77\xef\x05\x83\xc1\x90\x4f\xd3\x34\xd4\x6a\
-\xb5\x56\x22\x91\x30\x13\x0a\x00\xc0\xa5\x4b\x97\xfe\x59\x53\x53\
-\xb3\xc5\x62\xb1\xb8\x24\x12\x09\x74\x3a\x1d\x74\x3a\x1d\xbb\x60\
-\xc1\x82\xbf\x6d\xdf\xbe\x7d\x01\x00\xcc\x98\x31\x43\xce\xb2\xac\
-\x2c\x02\x8f\x88\x2c\x59\xb2\x64\xef\xd6\xad\x5b\x73\x08\x21\x14\
-\x21\x84\xbc\xf4\xd2\x4b\x49\x6f\xbf\xfd\xf6\x17\xa9\xa9\xa9\xcf\
-\x45\xe2\x44\x51\x0c\x08\x82\x30\x48\xfe\x4f\x87\x00\x00\xd6\xac\
-\x59\x53\xb2\x65\xcb\x96\x3f\x1b\x8d\xc6\x04\x00\xe8\xed\xed\x85\
-\xdd\x6e\x1f\x34\x99\x4c\xc5\xc5\xc5\xc5\xf9\x2b\x56\xac\xf8\xa3\
-\x20\x08\x18\x3b\x39\x8e\x13\x1c\x0e\xc7\x43\xbb\xdd\x7e\x53\xa9\
-\x54\xa6\x24\x27\x27\xe7\x8c\xfe\xbe\xad\xad\xed\xe3\xa3\x47\x8f\
-\xee\x9b\x52\x00\x00\x56\xad\x5a\xb5\x6c\xeb\xd6\xad\x75\xe9\xe9\
-\xe9\xf1\xc1\x60\x10\x0e\x87\x03\x7d\x7d\x7d\x23\x49\x49\x49\x43\
-\x1c\xc7\x69\x16\x2d\x5a\x04\xbb\xdd\x0e\x96\x65\x11\x1b\x1b\xfb\
-\x14\x22\x8a\xe2\x38\x31\x41\x10\xe0\x72\xb9\xfa\xdf\x79\xe7\x9d\
-\x82\xe6\xe6\x66\xdb\xb4\x04\x00\x60\xe5\xca\x95\xa5\xe5\xe5\xe5\
-\x75\x46\xa3\x31\x41\x10\x04\x38\x1c\x0e\xf4\xf6\xf6\x82\xe3\x38\
-\xb4\xb6\xb6\xc2\x66\xb3\x81\xe7\x79\x9c\x3c\x79\x12\x49\x49\x49\
-\x13\x82\x05\x41\xc0\xd0\xd0\x50\xa0\xba\xba\x7a\xfd\xb1\x63\xc7\
-\x9a\x80\x09\xba\x60\xb2\xd1\xd4\xd4\xf4\x55\x4d\x4d\xcd\x86\xfb\
-\xf7\xef\xfb\x24\x12\x49\xa4\x45\x61\xfa\xe6\x1a\xf2\x5c\x4d\x58\
-\x0d\x2b\xe4\x81\x00\xce\x9d\x3b\x07\x9e\xe7\x31\xba\x35\x23\xd3\
-\xe9\x74\xda\xaf\x5e\xbd\x5a\x16\x81\x03\x00\x3d\x5d\x01\x00\xc8\
-\xc9\xc9\x91\x07\x02\x01\x99\xd5\x6a\x85\xd1\x68\xc4\xed\xdb\xb7\
-\xd1\xd3\x7a\x05\x9f\xbe\x4a\x70\xcf\x1e\xc6\xc3\xae\x61\x58\x1f\
-\x3c\xc0\xd9\xb3\x67\xb9\xc2\xc2\xc2\xc1\x99\x33\x67\x7a\x87\x87\
-\x87\x5d\x7e\xbf\xbf\x77\x70\x70\xf0\x72\x65\x65\xe5\x97\x66\xb3\
-\xd9\x31\xfa\x99\xd3\x2e\xc1\xe1\xc3\x87\xd7\x96\x96\x96\xd6\xfa\
-\xfd\xfe\x68\xbf\xdf\x8f\xbb\x77\xef\xa2\xba\xba\x1a\x00\x50\x9e\
-\xcd\xa1\x50\x47\x70\xd6\x32\x03\xac\x21\x1f\x1e\x8f\x07\x1d\x1d\
-\x1d\xfd\x2c\xcb\xae\x0b\x04\x02\x6d\x32\x99\x4c\xe8\xea\xea\x0a\
-\x4d\x74\x27\x4c\x4b\xe0\xd0\xa1\x43\xaf\x95\x94\x94\x9c\x0a\x87\
-\xc3\xd2\xe8\xe8\x68\xd4\xd5\xd5\xc1\xeb\xf5\xa2\xbb\xbb\x1b\xdf\
-\x7f\xff\xfd\x33\xb1\xeb\x32\xe5\x98\x4d\x11\x7c\xed\x8d\x43\xbb\
-\xd3\xe9\x8e\x89\x89\x59\xd5\xdd\xdd\x7d\x63\xb2\x67\x4f\x59\x82\
-\x8a\x8a\x8a\xdf\x14\x15\x15\xfd\x9e\xa6\x69\x8a\x65\x59\xd8\x6c\
-\x36\xb4\xb4\xb4\x20\x3e\x3e\x1e\xa9\xa9\xa9\x00\xf0\x8c\xc4\x1b\
-\xf3\xfd\x40\x90\x82\xde\x16\x02\x90\x30\xb3\xdd\xe9\x6c\x34\x1a\
-\x8d\x2f\x5b\xad\xd6\xb6\x1f\x24\x40\x08\xa1\x0e\x1f\x3e\x7c\xa4\
-\xa0\xa0\xe0\x50\x5c\x5c\x9c\x84\x61\x18\x08\x82\x00\xbd\x5e\x0f\
-\x95\x4a\x05\x97\xcb\x05\x00\xe3\x24\xbe\xb0\x00\x07\x8b\x44\x00\
-\x21\x00\x8f\x00\x24\xcc\x68\x77\x3a\x9b\xd2\xd2\xd2\x56\x75\x75\
-\x75\xfd\x7b\x1c\x67\xa2\x12\xa4\xa4\xa4\xc8\xca\xca\xca\x2a\xb2\
-\xb3\xb3\xf7\xcf\x99\x33\x87\x44\xe0\x82\x20\x80\xe7\x79\x38\x9d\
-\x4e\x9c\x3f\x7f\x1e\x9d\x9d\x9d\x90\xc9\x64\x48\x4c\x4c\x7c\x5a\
-\x0e\x02\x60\x5f\x01\x8f\x37\x17\x12\xdc\xb3\x13\x98\x6c\x0c\xea\
-\x9d\x1a\xdc\x79\xf4\xc8\xab\x50\x28\x56\xde\xbf\x7f\xff\x9b\xd1\
-\xac\x71\x6d\xa8\xd5\x6a\x63\x36\x6f\xde\xfc\x51\x66\x66\xe6\x7e\
-\xbd\x5e\x4f\xa2\xa2\xa2\x40\x08\x01\x45\x51\xa0\x28\x0a\x52\xa9\
-\x14\x2a\x95\x0a\x1b\x36\x6c\x08\x33\x0c\xf3\xa5\xcb\xe5\x82\xdd\
-\x6e\x47\x6a\x6a\x2a\x92\x92\x92\x20\x02\xf8\xd0\x44\xe3\x83\x1b\
-\x22\x7e\x92\x28\xa2\x20\x39\x84\x57\x13\x1e\x61\x9e\x46\xa3\x1a\
-\x18\x18\xf8\xcb\xdc\xb9\x73\x0b\x47\xf3\x9e\x29\x41\x76\x76\xb6\
-\x7a\xc7\x8e\x1d\x1f\x1b\x0c\x86\x5f\xa9\xd5\x6a\x84\x42\x21\x10\
-\x42\x10\x91\x90\x48\x24\x08\x85\x42\x70\xbb\xdd\xc2\xf5\xeb\xd7\
-\x2b\xfb\xfb\xfb\xcf\xf9\xfd\xfe\xe7\x00\x24\x8c\x2d\xc7\x87\x26\
-\x1a\x00\x8f\x37\x17\x62\x6c\x39\x2e\xcf\x9d\x3b\xf7\x17\x9d\x9d\
-\x9d\x5f\x3f\x53\x82\x9c\x9c\x9c\x84\xb5\x6b\xd7\xd6\x24\x26\x26\
-\xfe\x4c\xa5\x52\x41\x2e\x97\x83\x61\x18\x44\x45\x45\x21\x2a\x2a\
-\x0a\x0c\xc3\x00\x00\x7a\x7a\x7a\xc4\x9b\x37\x6f\x56\xbd\xfb\xee\
-\xbb\x07\x09\x21\x92\xe4\xe4\xe4\xac\x40\x20\xf0\x57\x85\x42\xa1\
-\x8d\x8f\x8f\x9f\x56\x39\xda\x9d\x4e\xaf\x5a\xad\x5e\x7e\xef\xde\
-\xbd\x36\xfa\x09\x5c\xbf\x7e\xfd\xfa\x3a\x95\x4a\xf5\x02\x00\x04\
-\x02\x81\xc8\x85\x02\x9e\xe7\xc1\xf3\x3c\x82\xc1\x20\xec\x76\x3b\
-\xee\xdc\xb9\xf3\x69\x55\x55\xd5\x41\x00\x10\x45\x51\x20\x84\x98\
-\x8d\x46\xe3\x2f\xfd\x7e\xff\x25\x00\x9a\xe9\x64\x82\x10\xad\xaa\
-\xdd\xe9\xbc\x98\x91\x91\x91\x4f\x13\x42\xe8\x23\x47\x8e\x9c\x8b\
-\x8d\x8d\x7d\x61\x78\x78\x18\xe1\x70\x18\xe1\x70\xf8\x29\x38\xf2\
-\xf7\xda\xeb\xf5\xc2\x62\xb1\xfc\xa9\xaa\xaa\x6a\xe7\xe8\xb2\x89\
-\xa2\x28\x12\x42\x6e\xe8\xf5\xfa\x97\xfd\x7e\x7f\x13\x00\xed\x54\
-\x12\x66\x3e\x88\xa0\x2a\xb3\xaf\xa5\xa5\xc5\x4d\x67\x65\x65\x29\
-\x94\x4a\x65\xbe\xd7\xeb\x8d\xd4\xf9\xae\x44\x22\x49\xe7\x79\x3e\
-\x8a\xe7\x79\x84\x42\x21\x70\x1c\x07\x9b\xcd\xd6\x74\xe1\xc2\x85\
-\x6d\xef\xbd\xf7\xde\xb8\xae\x79\x92\x89\x5b\x69\x69\x69\xab\x9f\
-\x48\xc4\x4f\x24\xf1\x98\xe7\xa0\x57\x10\xfc\xdd\x8d\x07\x4c\x6c\
-\x70\xdd\xd3\x33\x50\x51\x51\x71\x93\x65\xd9\x3c\x87\xc3\x01\x93\
-\xc9\x94\xba\x6c\xd9\xb2\xb3\x00\x96\x32\x0c\x03\xa9\x54\x0a\xb7\
-\xdb\xfd\x8f\xca\xca\xca\x17\x45\x51\x0c\x8f\xa3\x8f\x1a\x84\x10\
-\x49\x7a\x7a\xfa\x4f\x7d\x3e\xdf\x25\xa5\x52\x99\x30\xf6\x4c\x00\
-\x80\x54\x2a\xed\x1c\x19\x19\x79\xde\xe7\xf3\x79\x9f\x76\x81\xcd\
-\x66\xdb\x3f\x7f\xfe\xfc\x46\xa5\x52\x29\x2f\x28\x28\xe8\x1e\x18\
-\x18\x00\x4d\xd3\xa0\x28\x0a\x43\x43\x43\xdf\x36\x37\x37\xaf\x9e\
-\x0a\x3e\x2a\x13\x37\x0c\x06\xc3\x0a\xbf\xdf\x7f\x65\x6c\x26\xfa\
-\xfa\xfa\x2c\xa2\x28\x2e\x8e\xc0\x9f\x0a\xf4\xf4\xf4\x5c\x93\xcb\
-\xe5\x6b\x32\x33\x33\x1b\x18\x86\x91\xfb\x7c\x3e\xb0\x2c\x0b\x9e\
-\xe7\x3b\x1a\x1a\x1a\x96\xdd\xba\x75\xcb\x3f\x15\x7c\x94\x84\x48\
-\x08\xb9\x9d\x9e\x9e\xfe\x8a\xcf\xe7\xbb\x10\x91\xd0\xeb\xf5\xdf\
-\x05\x83\xc1\xa5\x66\xb3\xd9\xf5\x4c\xd6\x22\x6d\x48\x08\x91\x94\
-\x97\x97\x97\x26\x27\x27\x7f\xa4\x54\x2a\x93\x7d\x3e\x9f\xa5\xb5\
-\xb5\x75\x79\x63\x63\xa3\x63\x3c\x66\xea\x41\x08\x91\x18\x0c\x86\
-\xdc\x91\x91\x91\x8b\x71\x71\x71\x9e\x70\x38\x5c\x6a\xb1\x58\xc6\
-\x6d\xe4\x99\x9f\x62\x42\x08\x49\x4b\x4b\x63\x64\x32\x99\xe6\xf1\
-\xe3\xc7\x8f\x26\xbb\x42\x7f\x80\x04\xc9\xcb\xcb\x9b\x19\x0e\x87\
-\x47\xda\xdb\xdb\x87\x27\x8a\xf9\x1f\x27\xb8\x88\xcb\x85\x50\xc5\
-\x5d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x42\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x04\xaf\x49\x44\
+\x41\x54\x58\x85\xcd\x57\xdf\x6f\x53\x55\x1c\xff\x9c\x5f\xf7\xb6\
+\xa5\x5d\xbb\x6e\x5d\x9a\xb5\x64\x60\xdc\x9c\x9a\xb9\x61\x14\x5d\
+\x22\x99\xfa\x40\x8c\x89\x7b\xda\xc3\x5e\x20\x24\x06\x4d\x90\x27\
+\xe3\x9b\xff\x07\x0f\x2e\x98\x65\x24\x46\x13\x9e\xd0\x84\x38\x35\
+\x41\x47\xb2\x44\x10\x86\x9a\xa9\x80\x80\x30\xc1\x09\x6c\xc3\xf6\
+\x76\xbd\xe7\xde\x73\xbe\x3e\x0c\x96\xb5\xeb\x1d\xdb\x90\xcc\x93\
+\x7c\x1f\x9a\x7e\x7b\x3f\x9f\x73\x3e\x9f\xef\xe9\xe7\x32\x22\xc2\
+\x56\x2e\xbe\xa5\xe8\xff\x07\x02\x72\x23\xcd\x23\xa7\xfb\xba\x38\
+\x63\x83\x20\x0c\x31\x8e\xa2\x25\x64\x01\x80\x33\xcc\x91\xc5\x0c\
+\x18\x8e\x5b\xa2\x13\x07\x5f\x99\xba\xb8\xde\x67\xb2\xf5\x78\x60\
+\xf4\xcc\xee\xbc\xd1\xc1\x18\x01\xfd\x64\xad\x22\xc0\x05\x11\x1e\
+\xfc\x92\x01\x00\x63\x60\x80\xcf\x38\x0f\x18\x30\x29\x1c\xb5\xff\
+\xc0\x8b\xdf\xff\xf5\xc8\x04\x8e\x4e\xf4\x0e\x13\xe7\x47\xac\xb5\
+\x49\x63\xac\x5a\xc7\xa6\x20\x04\x0f\x38\xe7\x65\x66\xed\xa1\xb7\
+\xf7\x5c\xf8\x74\x53\x04\x46\x4f\xed\xca\x84\x92\x8e\x01\x34\xa0\
+\x03\x93\xda\xe8\xb4\x30\xc6\xe0\x28\x51\x02\xd8\xb7\x32\x64\xfb\
+\x0e\xbc\x7a\x7e\xa1\x51\x5f\xa4\x07\x42\x49\xc7\x42\x63\xf7\xea\
+\x20\x74\x36\x84\xbc\xbc\x08\xa1\xb1\x29\x47\xc9\xbd\x90\xfc\x18\
+\x80\xb7\x1a\x75\x35\x9c\x82\xa3\x13\xbd\xc3\x44\x34\x50\xd5\xda\
+\xb1\x64\xf1\x28\x55\xd5\xda\x21\xa2\x81\xa3\x13\xbd\xc3\x8d\xb0\
+\x56\x49\x30\x7a\x66\x77\x3e\xf4\xf5\xb4\xb7\xe8\x37\x1b\x6b\x37\
+\xb7\x79\x00\x97\x7e\x08\xb1\xa3\x47\x42\x39\x80\xe0\x1c\xdb\xe2\
+\xee\xbc\x74\x9d\x67\xea\x8d\xb9\xea\x04\x42\xad\xc7\xaa\x3a\x48\
+\xea\x30\x84\xb1\x76\x53\x75\xe9\x9c\xc1\xf9\x2f\xb2\xf8\xe6\x63\
+\x89\xd2\x82\x81\x0e\x43\x54\x75\x90\x0c\xb5\x1e\xab\xc7\xab\x21\
+\x30\x72\xba\xaf\x8b\x08\xfd\xde\x62\x55\x59\x6b\xb1\x99\x9a\xbd\
+\x46\x98\xfe\x3a\x0b\xc9\x5d\x54\x6e\x37\x63\xfa\x3b\x09\x6b\x2d\
+\xbc\xc5\xaa\x22\x42\xff\xc8\xe9\xbe\xae\x48\x02\x9c\xb1\x41\xdf\
+\x0f\x94\xb5\x84\xcd\x54\x69\x0e\xf8\xe9\x64\x2b\x98\x49\x40\x4a\
+\x89\x74\x5e\xe3\xd9\xd7\xf4\xf2\xf7\xbe\x1f\x28\xce\xd8\x60\x24\
+\x01\x6b\x69\xa8\xaa\xb5\x5b\x63\x22\x0f\x08\xcd\xc3\xcd\xa6\x7d\
+\xc2\xf4\x97\x6d\x08\xbd\x6d\x10\x42\xc0\x4d\x10\x7a\xde\x98\x87\
+\x70\x6a\x0c\xe9\x5a\x4b\x43\x2b\x31\x6b\xc7\x90\xa1\xa8\x43\x03\
+\x63\x97\x8c\xa9\xcb\x0a\xbf\x8d\x17\x20\x63\x06\x9d\xaf\xdf\x82\
+\x8c\x85\xab\xdd\x06\x80\x08\xb8\x7c\xaa\x00\xef\x76\x12\x52\x02\
+\x8c\x01\x9d\x03\x77\x90\x68\xd5\x30\x2b\x7c\xac\x43\x03\x30\x14\
+\x23\x09\x30\xb0\x6c\x10\x86\x78\x30\x19\x0b\xd7\xb2\xa8\xdc\x4d\
+\x02\x00\x2e\x9e\x4c\x60\xe7\xc0\x75\xb8\x19\x6f\x15\x81\xd9\xf3\
+\xdb\x31\x77\x35\x03\x79\xff\x69\x85\x9e\x7b\x68\xe9\x9c\x43\xfd\
+\x10\x05\x44\x60\x60\xd9\x48\x09\x08\xa8\xd1\xb4\xa5\xfb\x26\x8a\
+\x3d\x1e\x84\x10\xa8\xcc\xc7\xf0\xfb\x57\x4f\xc2\xbb\x99\xab\xd5\
+\xfd\x6a\x3b\x6e\xfd\x9c\x83\x10\x02\x42\x08\xe4\x3a\x2c\xf2\xcf\
+\xdf\x88\xf4\x49\xfd\x7d\x5a\x37\x86\x34\xc7\x19\x96\x1d\x6d\xac\
+\x45\x6e\xd7\x65\x14\x9e\xd6\x90\x52\x22\xf4\x1d\xfc\x31\xb1\x13\
+\xde\x95\x27\x60\xad\x85\xbe\xd3\x86\x3f\xcf\x16\xc1\x99\x80\x94\
+\x12\xc9\x8c\x40\xe1\xa5\x2b\xb0\x08\x1a\x4e\x08\x67\x4b\x18\x91\
+\x12\x10\xd1\x0c\xe7\xa2\x60\xec\x4a\xad\x0d\x9a\xfb\xa6\xc1\xd1\
+\x87\xdb\x57\x63\x00\x01\x37\xce\xe6\x51\x5c\xcc\x60\x7e\x26\x0e\
+\x6b\x08\x52\x02\x9c\x33\x74\xbc\x7c\x1d\xd6\xfd\x07\x88\xb8\xbf\
+\x5c\x2e\x40\x44\x33\x91\x27\xc0\x38\x8e\x27\x62\x8e\x5f\xef\x70\
+\x03\x1f\x4d\xcf\xfd\x88\xb6\x1d\x76\xf9\xa8\x6f\xfd\xba\x0d\xd5\
+\x32\x5f\xfe\xbc\xe3\x85\x32\x6c\xf3\x95\x35\x27\x25\x11\x73\x7c\
+\xc1\xf9\xf1\x48\x02\xa5\x7b\xfa\x84\xa3\x64\x40\x0d\xb4\x0b\x51\
+\x41\xba\x77\x0a\xb9\xed\x1c\x52\xca\x9a\x6a\xef\x64\xa0\xf6\xa9\
+\x35\xef\x08\xb2\x84\x64\x22\x1e\x58\xa2\x13\x91\x04\xde\x7f\xf3\
+\x97\x8b\x15\xdf\x9f\x4c\x25\xe2\x41\x23\x0d\xab\x76\x01\xa9\x9e\
+\x73\xc8\xe6\xc5\xf2\xce\xd3\x2d\x0a\xb1\xce\x29\x84\xc6\x5f\xf3\
+\x86\xcc\xa6\x93\x01\xe7\x6c\xb2\x3e\x2d\xad\xfa\x2f\xa8\x7a\x76\
+\x3f\x17\xac\xcc\x39\x87\xb1\xb4\xaa\x3c\xfb\x37\x52\x3d\x17\x90\
+\x69\x75\x10\x8b\x39\x68\xed\xbd\x06\xcf\xce\x36\xec\x7d\x50\x4a\
+\x4a\xb4\xa4\x53\x65\xe5\x3a\xfb\xeb\xf1\x1a\x06\x92\x0f\x3f\xcb\
+\x0f\x0b\x21\x3e\xba\x57\xaa\xa4\xa2\x62\x48\x13\xeb\x46\x3c\xd8\
+\x89\x59\x79\x32\xa2\xe3\x3e\x00\x63\x78\xaa\xa3\xbd\xa4\xa4\x78\
+\xe7\x60\x83\x74\x14\x99\x88\x3e\xf8\xa4\xed\x73\x01\xb6\xd7\xab\
+\x56\x37\x19\x48\x96\xc0\x0b\xb9\x16\xdd\x9c\x4e\x8e\xbf\xbb\xe7\
+\xc2\xfa\x03\x09\x00\xdc\xd5\xc1\xbe\x20\x34\xe3\x89\x58\xac\xc4\
+\x58\x63\x39\xd6\x2a\x47\x29\x74\x77\x14\x4a\xcd\xe9\xe4\xb8\x6b\
+\xf8\xbe\x48\x92\x0f\xcb\x7a\x87\x47\xd3\xc3\x71\xe5\x1c\x09\x8d\
+\x4d\x56\xaa\xfe\x43\x43\x29\x63\x0c\xed\x2d\xd9\x20\x9f\xcb\x94\
+\x19\x70\xa8\xd1\xb1\x6f\x88\x00\x00\xbc\x37\x9a\xcc\x2b\xe6\x8e\
+\xb9\x8e\xec\x37\x86\x94\x0e\x02\xd7\x58\x8b\xd0\x18\x00\x0c\x8e\
+\x92\x70\x95\x44\xb6\x29\xe9\x67\xd3\xa9\x40\x30\x4c\xaa\x78\xec\
+\xbf\x89\xe5\x2b\xd7\xe1\x91\xa6\xae\x44\xdc\x1d\x14\x52\x0e\xc5\
+\x1d\x55\x74\x5d\x95\x75\x1c\x05\x57\xca\x39\x26\xf8\x8c\x23\xc4\
+\xe3\x79\x31\x79\x9c\x6b\xcb\xdf\x0d\xb7\x9c\xc0\xbf\xbd\x57\xbd\
+\x04\xb5\x69\x5e\x47\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x12\xf3\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
-\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\xbf\x49\x44\
-\x41\x54\x58\x85\xc5\x97\xcf\x4f\x22\x67\x18\xc7\xbf\xcc\x0f\x7e\
-\x65\x58\x4a\x56\x60\x41\x70\x91\xd6\x6d\x4c\x34\x2a\x49\x25\xde\
-\x09\x89\x37\x13\x23\xc9\x9e\xd6\x26\x5c\x76\xbd\x35\xfd\x13\x3c\
-\xf6\xb4\x47\x9b\x18\xec\xc1\x34\xc1\x18\x2e\xbd\xd4\xcb\x96\x78\
-\xa9\xf4\x60\x6b\xb2\x6e\x4d\x4a\x24\xc8\x10\xc8\xa4\x40\x18\xf0\
-\x1d\x66\x06\x7a\xa8\x4e\x19\x14\xdd\x1d\xdc\xee\x37\x99\xc3\xbc\
-\xcf\xf7\x7d\xde\xcf\xcc\x33\xef\x8f\x31\xf5\x7a\x3d\x7c\x4a\x31\
-\xf7\x19\x8e\x8f\x8f\x73\x1e\x8f\xe7\x73\x23\xc9\xab\xd5\xea\x5f\
-\xf3\xf3\xf3\x5f\x8d\x04\xe0\x74\x3a\xfd\x7e\xbf\xdf\x65\x04\x40\
-\x92\x24\xff\x7d\x1e\xca\x48\xe2\x87\xd4\x50\x80\x44\x22\x41\x27\
-\x93\xc9\x17\x92\x24\x71\x46\x93\x4b\x92\xc4\x25\x93\xc9\x17\x89\
-\x44\x82\x1e\xe6\x19\x5a\x02\x97\xcb\xe5\x51\x55\xf5\x35\x21\xe4\
-\x91\xaa\xaa\x86\x00\x08\x21\x8f\x00\xbc\x76\xb9\x5c\x3f\x03\x28\
-\x7f\x10\xc0\xb5\x14\x45\x81\x2c\xcb\x86\x00\x14\x45\xb9\xd7\x73\
-\x27\x80\xa2\x28\x23\x03\x28\x8a\x02\x9a\x1e\x5a\x81\xbb\x01\x3a\
-\x9d\x0e\x64\x59\x36\x0c\x20\xcb\x32\x3a\x9d\x0e\x2c\x16\xcb\x68\
-\x00\x9d\x4e\x67\x24\x80\xbb\xa4\x01\xa4\x52\xa9\xe7\x00\xbc\xd7\
-\xf7\x81\x40\x60\xbc\x5a\xad\xd2\xa3\x96\x40\x55\x55\x3a\x10\x08\
-\x7c\x93\x4a\xa5\x4a\x7d\xa1\xea\xfa\xfa\xfa\xae\x06\x90\x4e\xa7\
-\x6d\x66\xb3\x79\xb7\xdb\xed\x6a\x0e\x9e\xe7\x41\x08\x91\x47\x2d\
-\x41\xbb\xdd\x36\xf3\x3c\xff\xed\xe4\xe4\xa4\xd6\x4e\x51\x14\xd2\
-\xe9\xf4\x4f\x6b\x6b\x6b\x0d\x06\x00\x38\x8e\x9b\x6c\xb5\x5a\xe8\
-\x9f\x6e\x34\x4d\x83\xe7\x79\xe6\xf0\xf0\x10\xf9\x7c\xde\x10\x00\
-\xcf\xf3\x28\x97\xcb\xcc\xd4\xd4\x14\x58\x96\xd5\xe5\x76\x38\x1c\
-\x21\x00\xbf\x33\x00\xe0\x70\x38\xc2\x92\x24\x81\xa2\x28\x9d\x89\
-\x65\x59\xd3\xc1\xc1\x81\xa1\xc1\xaf\x65\x36\x9b\x4d\x57\xb9\xb4\
-\x36\x8a\xa2\xc0\x71\xdc\x53\x0d\xc0\x6e\xb7\x3f\xa3\x69\x5a\x37\
-\x5d\xee\x9a\x3a\x1f\xaa\x41\x00\x00\xb0\xd9\x6c\x5f\x00\x57\xdf\
-\x80\xd3\xe9\x7c\x1a\x0a\x85\x74\x06\xbb\xdd\x8e\x8d\x8d\x8d\x07\
-\x01\x38\x3f\x3f\xc7\xc2\xc2\x82\xae\xad\x5e\xaf\x87\x34\x00\x51\
-\x14\xdd\x26\x93\xe9\x46\xa7\x6c\x36\xfb\x20\x00\x13\x13\x13\xe8\
-\xff\x08\x01\xa0\xd9\x6c\x7a\x34\x00\x42\xc8\x63\x8e\xbb\xb9\xe7\
-\x9c\x9c\x9c\x3c\x18\xc0\xe0\xc1\x87\x10\xf2\x58\x03\xc8\xe5\x72\
-\x5f\x0a\x82\xa0\x33\x88\xa2\x78\xa3\x93\x51\x9d\x9e\x9e\xa2\x58\
-\x2c\xea\xda\xdc\x6e\xf7\xb3\x68\x34\xfa\x2f\xc0\xf4\xf4\xb4\x3c\
-\xf8\x8a\x3e\xb6\x0a\x85\x82\x0c\xfc\x57\x02\xdb\xff\x71\x36\x6c\
-\xb7\xdb\x68\x36\x9b\xf0\x7a\xbd\x20\x84\xd8\x80\xab\x03\x49\xb7\
-\xdb\x6d\x7f\xf4\xd1\x01\xb0\x2c\x0b\xab\xd5\x8a\xfe\x31\x19\x00\
-\xf0\x78\x3c\xf5\x5a\xad\xa6\x33\xb7\x5a\xad\x5e\x26\x93\x31\xb9\
-\xdd\x6e\xd8\xed\x76\x43\x03\xd6\xeb\x75\x10\x42\xb0\xb2\xb2\xd2\
-\x63\x18\xc6\x74\xbd\xd4\xd7\x6a\x35\x8c\x8d\x8d\x35\x34\x80\x4a\
-\xa5\x52\x1b\xdc\x32\x37\x37\x37\x1b\x56\xab\xe5\xb3\x37\x6f\x7e\
-\x81\xcf\xe7\x33\x04\x20\x08\x02\x16\x17\x17\x61\xb5\x5a\xab\x4b\
-\x4b\x4b\xde\xfe\x98\x24\x49\x7f\x6b\x00\xc5\x62\x51\xb0\xd9\x6c\
-\xba\xce\x7e\xbf\x8f\x79\xf2\xc4\x8b\x77\xef\xfe\xc4\xea\xea\xaa\
-\x21\x80\xbd\xbd\x3d\xc4\xe3\x31\xd4\xeb\x0d\xba\x54\x2a\xe9\x62\
-\x97\x97\x97\x82\x06\x50\x2e\x97\xab\x83\x4b\x6f\x3c\x1e\x37\x67\
-\x32\x19\xc4\x62\x31\xc4\xe3\x71\x43\x00\x8d\x46\x03\xc5\xe2\x05\
-\x22\x91\x88\xa5\x50\x28\xe8\x62\xaa\xaa\x56\x34\x00\x9e\xe7\xbf\
-\x67\x18\xe6\xd7\x7e\x43\x2c\x16\xfb\xe1\xe2\xa2\x84\x97\x2f\x5f\
-\x21\x1a\x8d\x1a\x02\xe8\xf5\x7a\xd8\xd9\xd9\xc1\xf8\xf8\x78\x27\
-\x97\xfb\xed\x79\x7f\x4c\x51\x94\x3f\x34\x80\xed\xed\xed\xb7\x00\
-\xde\xf6\x1b\xb2\xd9\xec\xee\xcc\xcc\x0c\xc2\xe1\x30\x18\xe6\xde\
-\xb3\xeb\xad\x0a\x87\xc3\xf0\xf9\x7c\x10\xc5\x16\xbb\xb5\xb5\xf5\
-\xe3\x6d\x9e\xa1\x99\x45\x51\xc4\xf2\xf2\x32\x82\xc1\x20\x06\xf7\
-\x89\xf7\x55\x30\x18\xc4\xec\xec\x2c\x06\x57\xd9\x7e\x0d\xfd\x31\
-\xd9\xdf\xdf\xef\x9e\x9d\x9d\x75\x59\x96\x05\xc3\x30\x86\x2e\x96\
-\x65\x91\xcf\xe7\x7b\x47\x47\x47\x43\xcf\xe7\x43\xdf\x00\x45\x51\
-\xd3\x73\x73\x73\xaf\x2a\x95\xca\xd7\xef\xfd\xc8\xb7\x28\x12\x89\
-\xec\x08\x82\xf0\xdd\xb0\xb8\xe9\x53\xff\x9e\xff\x03\xea\x33\x99\
-\x79\xb2\xbf\xb1\x29\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x04\xbb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x04\x82\x49\x44\x41\x54\x78\x5e\x95\x54\x5d\x68\x54\x47\
-\x18\x3d\x73\xef\x64\xff\xf3\x5b\x4d\xba\x69\xe2\x86\x6a\x52\xba\
-\xda\xb0\x94\xb0\x58\x35\x21\x60\x50\x20\x0a\x6a\xc9\x53\xe8\x53\
-\x81\xd6\x97\x58\x28\x02\x05\x03\xd2\x97\xbe\xd9\x00\x2d\x22\x16\
-\xc1\x50\x28\x56\x51\xa8\x88\x5a\x05\xb5\xd0\xa8\x11\xc4\xaa\x52\
-\x89\xec\xa6\x36\x92\xe8\x6e\x8c\xc9\x26\xee\xde\xbd\xb9\x77\x6f\
-\xcf\x0c\x4b\x34\x52\x4a\xf3\xc1\xe1\x63\x98\xef\x9e\xef\xcc\x99\
-\xf9\xae\xf4\x3c\x0f\x2b\x8d\x1f\x92\xc9\xcf\x6b\x9a\x9b\xbf\x08\
-\xad\x5a\xd5\xe4\x01\x32\x9f\xcb\x65\x27\xd2\xe9\x8b\x37\x46\x47\
-\x3f\xfb\xd9\xf3\x5c\x30\x24\x56\x10\x5f\x0b\x61\xb6\x6e\xdf\x7e\
-\x6d\xd3\xc0\xc0\xe6\xd8\xd6\xad\x78\x2d\x9a\xa6\xef\xdd\xfb\xb4\
-\xee\xc8\x91\x9d\x5f\x25\x12\xdb\xbe\xb9\x73\xe7\x8f\x15\x11\x37\
-\x25\x93\x3f\xb6\xf7\xf7\x6f\x7e\xa7\xbb\x1b\x2f\xe7\xe6\xb0\x98\
-\xcd\x42\x85\xa8\xac\x44\xa4\xad\x0d\x5d\x03\x03\xf5\xb3\x83\x83\
-\xe7\x3b\x85\x68\xfa\xdf\xc4\xdf\xc7\xe3\x89\xb0\xcf\xd7\x17\x69\
-\x69\x41\x75\x53\x13\x94\x85\xa9\xa7\x4f\x61\xe7\x72\x58\xd7\xd1\
-\x01\x5f\x30\x88\xfc\xfc\x3c\x1a\x4d\x33\xda\x95\x4c\x7e\x27\x85\
-\x10\x06\x80\xd5\x84\xc0\x7f\xc4\xb7\x89\xc4\x97\x56\x2a\x65\x66\
-\xee\xde\x45\x7d\x22\x81\x20\x55\xbe\xdb\xd9\x09\xdb\xb2\x34\x69\
-\xa9\x54\xc2\xe4\x83\x07\xb0\xa7\xa6\x10\x08\x85\xb6\xc9\x78\x3c\
-\x7e\xaf\xa7\xa7\xa7\x4d\x4a\xe9\x39\x8e\xe3\xd9\xb6\x0d\x42\xd8\
-\xc5\xa2\x51\x2c\x16\x61\x15\x0a\xb0\x98\xa9\xc6\x30\xa9\x28\x75\
-\xec\x18\x66\xa8\xb4\x6b\xff\x7e\x04\xab\xaa\x10\x08\x87\x35\xe9\
-\x6f\x87\x0f\xc3\x39\x73\x06\xe2\xd1\x23\x38\x2d\x2d\x2d\x32\x16\
-\x8b\xb5\x0d\x0d\x0d\x2d\xb3\xa4\x48\x15\xb9\x74\x1a\x15\x15\x15\
-\x98\x4b\xa5\xf0\xec\xe6\x4d\xfc\x79\xe5\x0a\xe6\x01\x64\x6f\xdf\
-\xc6\x02\x09\xad\xbd\x7b\x35\xb1\x0a\x67\x71\x11\x8f\xaf\x5d\x43\
-\x94\x35\xd5\x6c\x22\x4b\x25\x53\x59\x81\x37\xa3\xe4\xba\x30\xa4\
-\x44\x8e\xa4\x7f\x5f\xb8\x80\x85\x27\x4f\x50\x5c\x58\x80\xc1\x46\
-\x88\xc7\xb1\xf3\xe8\x51\xd4\x36\x36\x42\x05\x4f\x06\x9f\xdf\x8f\
-\x3e\x9e\x64\x98\x36\x6c\x18\x1d\x85\x15\x0e\x7b\xff\xfa\x8e\x67\
-\x67\x66\xf0\xf8\xf4\x69\x3c\x1b\x1e\xc6\xf3\x87\x0f\x91\x07\xb0\
-\xc8\x8f\x83\xbc\xb8\xb7\x36\x6d\x42\xc3\xba\x75\x50\x71\x92\xaa\
-\x55\xf3\x4f\xce\x9e\x45\x28\x12\x41\xf3\x8e\x1d\x08\x4f\x4c\xe0\
-\xae\x65\xb9\xd2\x75\x5d\xed\xa5\x6a\x90\xcf\xe7\x91\xc9\x64\x90\
-\x61\xe7\x17\x54\x9d\xa3\x2a\x87\x3e\xba\xf4\xd0\xe6\xda\xae\xaf\
-\x47\x25\xf7\xce\x1f\x3a\x84\xe7\xf7\xef\xe3\xed\xe3\xc7\xb1\x9e\
-\x7b\x27\xfb\xfa\xd0\xb8\x67\x0f\xfc\xe3\xe3\xb8\x15\x8b\xe1\xd7\
-\xeb\xd7\x4b\x8a\x18\x7e\xaa\x61\xe8\x5c\x53\x53\x03\x76\x83\xc9\
-\x0b\xf2\x8f\x8c\xc0\xa2\xdf\x2f\xd5\x29\x08\xbb\xbf\x1f\xb6\x94\
-\xb0\xcf\x9d\xc3\x7b\x7c\x09\xfe\xf6\x76\x04\x67\x67\xd1\xcb\x66\
-\xe2\xc4\x09\x5c\xa4\xb8\x0f\x0e\x1c\x80\xd7\xdb\x0b\xb9\x48\xe3\
-\x19\x5a\x31\x6f\x57\x67\x0d\xbe\xcf\x80\x6d\x43\x00\x70\x08\x3f\
-\x61\x71\xff\xe3\xa1\x21\xdc\x3a\x75\x0a\x0f\x2f\x5d\x82\xc1\xc1\
-\x50\x62\xdc\xba\x3a\x78\xf4\x7e\xf3\xbe\x7d\x70\xca\x7c\x9a\x98\
-\x44\xcb\x88\x4b\x84\xe0\x64\x85\xb8\x36\x94\x52\xc2\x47\x38\xae\
-\xab\xf7\x3e\xdc\xbd\x1b\xde\xae\x5d\x28\x95\xc5\x8c\xf0\x64\x1f\
-\x6d\xdc\xa8\xd7\x76\xd9\x56\xa9\xde\xed\xe4\xe4\x24\x54\x9e\xce\
-\x66\xf5\xc7\x19\xae\x73\xa6\x09\xdf\xfa\xf5\x28\x72\x3d\x4f\xe4\
-\x48\x90\xa1\x88\xcb\x97\x2f\x43\xd9\xe7\x3a\x8e\xce\x0e\x31\x36\
-\x36\x86\x67\xb4\x4e\xad\x0b\xb4\x4e\x08\xe1\xc9\x42\xa1\x50\x6a\
-\x68\x68\x30\x54\xe7\x68\x34\x0a\x95\xc7\x03\x01\xfd\x7e\x1b\x38\
-\x49\x0b\x00\x66\x88\x69\x62\x91\x8d\xba\xf9\x9f\xd0\x56\xbd\x76\
-\xba\x20\xfd\xee\xdc\xb2\x05\x2a\xc8\x87\x83\x07\x0f\x96\x24\x2f\
-\x47\x93\xb1\xdb\xd2\x07\xaa\xd8\xa4\xc7\x41\x45\x46\x54\x10\xb2\
-\x3c\x08\xe5\xfd\xa5\x5a\xaa\x43\x80\x42\x0c\x9e\x90\x04\x7a\xa8\
-\x6a\x6b\x6b\x85\x9c\x9b\x9b\xf3\x78\xac\x57\xc5\x65\x72\x76\xd4\
-\xc4\x79\xc2\x24\x0c\x82\xcd\x5f\x5d\x30\xa0\xc9\x04\xa0\x15\x9b\
-\x24\x56\x21\xb9\x47\x62\xc8\x79\xfe\x03\x6e\x70\x64\x49\xae\xfd\
-\x72\xcb\x1e\x5b\x1b\x36\x20\xc5\x41\xc8\x97\x3d\x5e\xa0\xb2\xc7\
-\x54\xfc\x0b\x87\x41\xa9\xf2\xfb\x7c\x7a\xe2\x7c\xcc\xd3\xd3\xd3\
-\x9a\xd8\x30\x0c\xdd\xb8\xaa\xaa\x4a\xea\xc9\xeb\xe8\xe8\x58\xe6\
-\xd9\x5f\xbc\x8c\xe2\xe0\x20\xde\xcf\x64\xb4\xb7\x59\x92\xbc\x5c\
-\xbb\x16\xb3\x7c\x56\xbd\x7c\xa3\x86\x10\x9a\x44\x83\x84\xe9\x74\
-\x1a\xad\xad\xad\xca\x16\x2d\x4c\xcf\x02\x80\x57\xc7\x2b\x67\x97\
-\x79\x8a\x39\x54\xb6\xa2\xb0\x7a\x35\xc4\x9a\x35\xf0\xa4\x84\x0e\
-\x21\x34\x84\x22\x66\x56\x56\xc8\xb2\x62\xa5\x5c\x13\x93\x48\xf0\
-\x52\x54\xd1\x12\x39\x2b\x30\xc1\xc7\x5f\xe4\x88\x5b\x4a\x85\xf2\
-\xd0\xb6\x91\xa7\x72\x16\x69\x78\x84\xbe\x1b\xd6\x56\x48\xa9\x95\
-\x9b\x84\x64\x7d\x25\xbf\x95\xd5\xd5\xd5\x63\xd1\xc6\xc6\x56\xbc\
-\x11\xaa\xe1\xd2\x62\x7c\x5c\x41\x2b\xfa\xa9\xbd\x5d\x44\x22\x11\
-\x8f\x40\x28\x14\x42\x38\x1c\x56\x59\x10\x9e\x9a\x42\x29\xa5\xb8\
-\x7a\xf5\xea\xef\xff\x00\x1e\xa4\xa9\x5c\x40\x6e\xf1\x36\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0b\x29\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x0a\xbb\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x2c\x30\x86\xa7\xa7\x27\x03\x23\x23\x42\x02\x18\x30\xc6\x9c\x9c\
-\x3c\x91\xc2\xc2\xe2\xd6\x3c\x3c\x3c\xb2\xbf\x7f\xfd\xfe\xf1\xe6\
-\xed\xeb\x6b\x0f\x1e\xdc\xd9\x7b\xf9\xf2\x85\xcd\xdf\xbe\x7d\xbf\
-\x87\xcb\x50\x3b\x3b\x3b\x06\x45\x45\x45\x86\xdf\xbf\x7f\x33\x80\
-\x42\x98\x89\x09\xe2\x4f\x76\x76\x76\x86\xc7\x8f\x1f\x33\xec\xde\
-\xbd\x1b\x6a\xc7\x7f\x06\x80\x00\x62\x41\xd6\xf8\xe7\xcf\x1f\xb0\
-\xe0\xdf\xbf\x7f\x18\xd4\xd5\x0d\xe6\xc7\xc6\xa6\xe9\xca\xca\x8a\
-\x33\x70\x70\xb0\x03\xc5\xfe\x32\xbc\x7d\xfb\x41\xf9\xda\xb5\xeb\
-\xbe\xbb\x76\x6d\x29\xdc\xbb\x77\x5b\xcb\xfd\xfb\xf7\xe7\x01\xb5\
-\xfd\x23\xc6\xa7\x20\xfd\x40\x07\xf1\xfe\xfb\xf7\x97\x19\xc8\xfd\
-\x00\x13\x07\x08\x20\xb8\x03\x18\xa1\xde\x7f\xfe\xfc\x05\xc3\xd5\
-\xab\x57\x19\x7e\xfd\xfa\x77\xf8\xc9\x93\x87\xba\x3a\x3a\x2a\x0c\
-\xbc\xbc\x6c\x40\x03\xfe\x31\x88\x8a\xf2\x31\xa8\xa9\xc9\x31\x18\
-\x1a\x1a\xc8\x2b\x28\xa8\xcc\x9e\x3f\x7f\x8a\xcc\xdd\xbb\x77\xdb\
-\x81\xda\x7e\xe2\xb2\x18\xe4\xa1\x1f\x3f\x7e\xf0\x08\x08\xf0\xbb\
-\x1a\x18\x18\x37\xde\xbf\xf7\xe0\xdf\xb9\x73\xe7\xd3\xde\xbf\x7f\
-\x7f\x0a\x24\x0f\x10\x40\x48\x21\x00\xf6\xb9\x04\x30\x14\xbe\x00\
-\x39\x5f\x8e\x1d\x3b\x5c\xf9\xfd\xfb\x37\x91\xaf\xdf\xbe\x85\xf9\
-\xfa\x78\x32\xf0\xf0\xb0\x30\xfc\xfb\xf7\x1f\xec\x50\x59\x59\x61\
-\x86\xe8\xe8\x58\x86\x77\xef\xde\x54\xcc\x9d\x3b\xf9\xd1\xc7\x8f\
-\x9f\xe6\xe1\xb2\x9c\x99\x99\xd9\xd4\xcc\xcc\xac\xdf\xc1\xc1\xd5\
-\x9a\x9b\x5b\x8c\x61\xe3\xa6\x8d\x0c\xac\xac\xac\x09\x40\xe9\xbb\
-\x40\xfc\x16\x20\x80\xe0\x89\xf0\xd7\xaf\x5f\xc6\x7a\x7a\x66\x97\
-\x35\x34\xb4\xd7\xb3\xb3\xb3\xa9\x02\xf5\x7e\x3a\x77\xee\x6c\x5a\
-\x7f\x5f\xd3\xd2\xf5\x1b\xb6\x00\x2d\xfb\x06\x36\xf0\xd7\xaf\x3f\
-\x40\xfc\x9b\x41\x4c\x8c\x8f\x21\x20\x20\x94\xdd\xd8\xd8\xa2\x00\
-\xa8\x5d\x1f\x39\x24\xd9\xd9\x39\x40\x69\x08\x18\xe4\x7f\x18\x74\
-\x74\x74\x9a\x0a\x0a\x0a\xad\xe5\xe5\x95\x18\x1e\x3f\x79\xc6\xb0\
-\x75\xeb\x9a\x97\xaf\x5e\xbd\x7a\x00\x52\x0a\x52\x0f\x10\x40\xf0\
-\x10\xe0\xe0\xe0\x8e\x8e\x8e\x4e\x14\x01\xc6\x93\xcb\xf7\xef\x3f\
-\x56\x1c\x3c\xb8\x27\xf6\xe7\xcf\x5f\xd7\x2e\x5f\xbe\x94\x3d\x79\
-\x62\xcb\xff\x1f\x3f\xbe\xc7\xf8\xfb\x79\x01\xa3\x83\x13\x98\x56\
-\xfe\x33\xb0\xb0\xfc\x07\x26\x34\x59\x06\x53\x33\x1b\xdd\xa3\x47\
-\x0f\x38\x03\xd5\x5e\x07\xf9\x43\x5e\x5e\x9e\x41\x4a\x4a\x92\xe1\
-\xfb\xf7\xef\x40\x87\xfe\xe4\x02\xf2\xb5\x3e\x7c\xf8\xc5\xf0\xf4\
-\xd9\x07\x86\xa3\x47\x0f\x32\x9c\x3b\x7b\xfc\x2c\x50\xdd\x31\x20\
-\x7e\x07\xb2\x17\x20\x80\xe0\x0e\x90\x90\x90\xb1\xe4\xe6\xe6\x61\
-\x50\x50\x90\x64\x28\x2f\x6f\x30\x02\x0a\x2d\xda\xbf\x7f\x77\x02\
-\xd0\x41\x57\x2e\x5f\xb9\x9c\x3e\x7b\x56\x3f\x9b\x8c\xb4\x4c\x98\
-\xad\xad\x19\x30\x2a\xfe\x00\x31\xc8\xa7\xac\x0c\x6a\xaa\x9a\x0c\
-\x42\x42\x22\x06\xcf\x9f\x3f\xe3\x07\xea\x79\x0d\x49\x6c\xbf\x40\
-\x0e\xe0\xd0\xd0\xd0\x98\x28\x23\xa3\x2e\x37\x6d\xda\x9c\xff\xf7\
-\x1f\xdc\xfb\x7f\xfc\xf8\xce\x3b\x9f\x3f\x7f\xde\x03\x54\x77\x15\
-\x96\x78\x01\x02\x08\xee\x00\x1e\x1e\x3e\x09\x50\x76\xf9\xf4\xe9\
-\x13\x83\xae\xae\x06\x43\x51\x51\x8d\x31\x0b\x0b\xeb\xe2\xbd\x7b\
-\xb7\x27\x02\x43\xeb\x02\x37\x0f\xf7\xd3\x5f\xc0\x6c\xf5\xe7\xcf\
-\x5f\xa0\xe5\x7f\xc1\x41\x0c\xca\x5d\x3c\x3c\xbc\x0c\x9c\x9c\x9c\
-\x22\x40\x23\xf8\x40\x0e\x90\x91\x91\x06\x59\xce\xa5\xab\xab\x37\
-\xcf\xcf\x2f\x2a\x7c\xc9\x92\x85\x5f\x16\x2e\x9c\x76\xe4\xdb\xb7\
-\x6f\x17\x80\x09\x19\x14\x4a\xc7\x91\x73\x01\x40\x00\xc1\x1d\x00\
-\x0c\xe2\x8f\xc0\x60\x64\xf8\xf9\x93\x05\x68\xf8\x4f\x06\x2d\x2d\
-\x35\x86\x8c\x8c\x22\x03\xa0\xe1\x4b\xde\xbf\x7f\x7b\xc1\xd3\x2b\
-\x38\x40\x5b\x4b\x0b\x94\xa2\xc1\x69\x01\x14\xd7\xa0\x8c\xf3\xf1\
-\xe3\x7b\x86\xaf\x5f\xbf\xfe\x00\xc5\x29\x2f\x2f\x2f\x83\xa4\xa4\
-\x24\xa7\x8e\x8e\xee\x3c\x0f\x8f\xb0\xf0\x65\xcb\x16\xff\x98\x3d\
-\x7b\xc2\x6e\xa0\xb9\x8b\x81\xf2\x47\x80\xf8\x23\x28\x9a\x90\x13\
-\x2a\x40\x00\xc1\x1d\xf0\xe2\xc5\xe3\x0b\xaf\x5f\xbf\xd6\xe7\xe1\
-\x91\x03\x97\x07\x4c\x4c\x7f\x18\xd4\xd4\x95\x19\xf2\x0b\xaa\xb5\
-\x7f\xfe\xf8\xae\x2d\x2e\x2e\x06\x4c\x27\xcc\x40\x07\xfe\x41\xca\
-\xb6\xff\xc0\x21\x21\x28\x28\x28\xf6\xf2\xe5\x0b\x60\xc8\xe9\x70\
-\xe8\xeb\x1b\x2e\x71\x75\x0d\x0a\x9a\x3f\x7f\xd6\xe7\x85\x0b\xa7\
-\xef\x04\x26\xd8\x45\x40\x85\xfb\x41\x39\x0b\x5b\x4e\x01\x08\x20\
-\xb8\x03\xee\xdd\xbb\xb3\xed\xc6\x8d\xeb\xf1\x32\x32\x32\xe0\xd4\
-\x0b\xf1\x25\x03\x83\x88\x30\x3f\x90\x16\x00\x17\x24\xdf\xbf\xff\
-\x42\xc9\x62\xac\xac\xcc\x0c\xce\xce\x0e\x0c\xdf\x7f\x7c\xb3\x9e\
-\x33\xbb\xbf\xc4\xd2\xd2\x4a\xc4\xc3\x23\x34\x68\xd6\xac\xa9\x20\
-\xcb\xb7\x02\xa3\x6b\x29\x50\xe9\x5e\x20\xfe\x8e\xab\x9c\x00\x08\
-\x20\xb8\x03\x80\x96\x6f\xde\xb5\x6b\xe3\x5e\x65\x15\x0d\x67\x19\
-\x69\x71\x70\x31\x0a\x2a\x1b\x80\xe5\x23\xbc\x9c\x80\x78\x9d\x81\
-\x81\x99\x85\x15\xc8\x63\x04\x87\x82\xb0\x30\x1f\x83\xbb\x9b\x13\
-\x03\x13\xe3\xef\x74\x1d\x1d\x23\x86\x29\x53\xfa\xde\x2d\x5f\x3e\
-\x0f\x64\xf9\x32\xa0\xea\x43\xf8\x2c\x07\x01\x80\x00\x82\x97\x03\
-\x40\x5f\x7f\x3f\x7c\x78\x5f\xe5\xea\xd5\x0b\x9e\x3c\x7b\xfe\x8a\
-\x81\x85\x95\x1d\x68\x01\x33\x38\x88\x41\x05\xd0\xbf\x7f\x20\x5f\
-\x33\x02\x2d\x66\x66\x78\x76\xfb\x0e\xc3\xdb\x27\x8f\x18\xf8\x85\
-\x85\x19\x3e\x7e\xf8\xc0\x70\xeb\xe6\x25\x06\x55\x35\x6d\x86\x3d\
-\x7b\xf7\x30\x9c\x3a\x79\xe8\x39\xd0\xf2\xf5\x50\x9f\x7f\x23\x54\
-\x44\x03\x04\x10\x23\xac\x3a\x86\x15\xc5\xc0\x22\xd3\xc9\xd6\xd6\
-\x69\x82\x8f\x4f\x98\xae\x8a\xaa\x3a\x03\x37\x37\x37\x03\x0b\x33\
-\x33\xd8\xff\xff\x80\xbe\xbe\xbc\x6c\x0e\xc3\xaf\xc3\x3b\x18\x7e\
-\x32\xb2\x30\xa8\x97\xd5\x32\xfc\xe4\x00\x16\xd3\xc0\x82\xf8\xc9\
-\x93\xfb\x0c\xce\x4e\x4e\x0c\x87\x0f\x9f\x66\x98\x3d\xbb\x6f\xc9\
-\xe5\xcb\x17\xf3\x81\x0e\x79\x87\xcf\x72\x90\xdd\x00\x01\x84\xe1\
-\x00\x10\x60\x66\x66\xd2\x91\x95\x95\x4b\xd1\xd1\x31\xf4\x95\x93\
-\x53\x90\x12\x14\x14\x61\xff\xfa\xed\xcb\xbf\xef\x4c\xcc\x7f\x04\
-\x4e\x1c\x61\x4b\x0b\xf1\x62\x64\x02\x46\xc3\x82\xde\x3e\x06\xa9\
-\xe2\x46\x86\x5f\x6c\x2c\x0c\x7e\x1e\x8e\x0c\x72\x72\x32\x0c\xaf\
-\xdf\x7c\x61\x58\xb1\x62\x2d\xc3\x82\x79\x53\x96\x5e\xbc\x74\xbe\
-\x00\x98\x76\xde\xe0\x73\x00\x40\x00\x81\x09\x1c\x8d\x12\x1e\x20\
-\x36\x63\x62\x62\x4c\x60\x65\x65\xa9\x04\xb2\x0b\xc4\x38\x39\xbb\
-\xab\x14\xe5\xbf\xbd\x5e\xb5\xf4\xff\xbb\xed\x5b\xfe\x1f\x76\xb6\
-\xfb\x5f\x2e\x21\xf1\x7f\xdb\xfa\xcd\xff\x7f\xfc\xfa\xff\xff\xe3\
-\xc7\x2f\xff\x81\x39\xe8\xff\xdb\x37\x5f\xff\x4f\x9c\xb4\xe0\xbf\
-\x85\x85\xd5\x5a\xa0\x5e\x31\x7c\x0e\x00\x08\x20\x16\x3c\x21\x04\
-\xca\x36\xa7\x80\xf1\x7f\x06\x58\xf2\xfd\xd3\x66\x64\xb2\x09\x10\
-\xe2\x8b\x8e\x4e\x4d\xe2\x64\x60\x66\x65\x78\xb1\x7f\x2f\x03\x0b\
-\x30\x6d\x58\xbc\x7d\xc5\x70\xae\xbc\x98\x41\x54\x42\x92\x41\x55\
-\x47\x87\xe1\xdb\xd7\x9f\xc0\x68\xe4\x64\x88\x8c\x08\x06\x55\x3a\
-\x41\x40\x4b\xfe\x9d\x3f\x7f\x26\x17\x98\x1d\x5f\x60\xb3\x04\x20\
-\x80\x30\x1c\xc0\x06\xc4\xe2\xc0\xb8\xfe\x01\x8c\x11\x4d\x60\x03\
-\x42\x9b\x93\xfb\xdf\xcf\xef\x5f\x13\x6c\xf4\xb5\x7b\x03\x4a\x8a\
-\x84\x18\xd9\x38\x18\x5e\x1e\x39\xc4\xf0\xe1\xe0\x7e\x86\x37\x57\
-\xae\x31\x7c\xfb\xfd\x8f\xe1\xcf\xdb\xb7\x0c\x3f\x80\xe5\xc3\xcf\
-\x9f\xbf\x19\x98\xfe\xff\x05\xe7\x14\x21\x21\x2e\xa0\x23\x02\x41\
-\x51\x1b\xc2\xc2\x3a\x83\xfd\xf4\xa9\xe3\x99\x40\x47\x3c\x45\xb7\
-\x0f\x20\x80\xe0\x0e\x70\x07\xa6\x81\x9f\xff\x21\xe5\xa9\x16\x30\
-\xd1\xfd\x61\x61\x61\xf8\xc1\xc4\xcc\xc1\xfc\xed\x53\x6b\x60\x58\
-\x50\x91\x5d\x4e\x2e\xc3\xb7\x17\x2f\x18\xde\x1e\x3b\xcc\xf0\xe5\
-\xf0\x01\x86\xa7\x57\xaf\x31\x1c\x91\x55\xfa\x27\x68\x6a\xcb\xa4\
-\xa8\xa1\xc9\x20\x2c\x26\xc5\xf0\xf9\xc3\x17\x60\xfd\x80\xf0\x13\
-\x2f\x2f\x07\x43\x48\x88\x2f\x28\xf7\xf8\x02\xdd\xc4\x78\xfa\xf4\
-\xf1\x34\xa0\x23\x9f\x23\x3b\x00\x20\x80\xe0\xaa\x2d\x41\xbe\x06\
-\xb5\x09\x80\xec\xaf\xa0\xf2\xf2\xf7\x6f\x11\x61\xa6\xff\xf3\x22\
-\xaa\x4a\x7d\x75\x63\xe2\x18\x3e\x5c\x3c\xcf\xf0\xf1\xf8\x31\x86\
-\x6f\xa7\x4f\x30\x7c\xb8\x79\x83\x61\x0b\x27\xdf\xbb\xe5\x4f\x9f\
-\xed\x74\xd7\xff\x69\xa4\xa7\x6f\xae\x0e\x6c\x78\x01\x8b\xe9\x9f\
-\x40\xcb\xfe\x81\x0b\x0b\x58\x9a\x16\x11\xe6\x61\x08\x0f\xf3\x03\
-\xf1\x7d\x98\x98\x98\x67\x9f\x3a\x79\x34\xf3\xc7\xcf\x5f\x8f\x61\
-\xf6\x02\x04\x10\xa2\x2e\x80\x62\x50\x72\xfc\xfd\xf7\x8f\xac\x1c\
-\x1f\xd7\xf2\xb8\xfe\x6e\x6b\x19\x57\x4f\x86\xf7\x47\x0f\x31\x7c\
-\xb9\x74\x9e\xe1\xeb\xc5\x33\x0c\x3f\xae\x5e\x61\x38\xc4\xc6\xfb\
-\x67\xf3\xe7\x6f\x47\x7e\x7d\xfb\x36\x73\xd7\xc6\x55\x5f\x19\x7e\
-\x7c\x9b\x19\x13\x93\x69\xa4\xa3\xad\x0e\x6e\x2b\x40\x72\xd5\x7f\
-\x70\xf9\xf1\xf5\xeb\x77\x60\x51\xcd\xcb\x10\x12\xec\x03\x2c\xe2\
-\xff\x79\xb3\xb0\xb0\xcc\x3e\x7e\xfc\x70\x3a\xb0\xca\x7f\x08\x52\
-\x07\x10\x40\x18\x69\x00\xe8\x07\x19\x65\x41\x9e\x75\x89\xf3\x66\
-\x99\x08\x9b\x59\x31\x7c\x3c\xb0\x97\xe1\xfb\xc5\x73\x0c\xdf\x80\
-\x0e\xf8\x73\xf5\x22\xc3\x59\x66\x0e\x86\xc5\x5f\x7f\x9d\x7e\xf7\
-\xed\xdb\x6a\xa0\xf2\xb3\xc0\x8a\xe6\xcb\x8e\xed\x9b\x62\x81\xec\
-\x25\x11\x91\xa9\x86\x06\xfa\x3a\xe0\xb4\x00\xca\xd6\x7f\x81\xa5\
-\xd7\xf3\xe7\x6f\x19\x2e\x5c\xbc\xc3\xe0\x60\x6f\xc8\x10\x16\xea\
-\x0b\x2c\x45\x59\xdc\xdf\xbf\x7f\xd7\x7c\xfe\xfc\xd9\x5c\x50\xe5\
-\x04\x10\x40\x28\x0e\x00\xb6\x61\x45\x94\x79\x39\x57\x24\xcd\x99\
-\x69\x22\x64\x6a\xc5\xf0\xe9\xe0\x1e\x86\x1f\x57\x2e\x30\x7c\xbb\
-\x7c\x8e\xe1\xff\xf5\x2b\x0c\x37\xff\x30\x33\xcc\xfa\xf1\xef\xea\
-\xfd\xcf\x9f\x96\x03\x95\xef\x81\x55\x30\xc0\x52\xf4\xda\xae\x9d\
-\x5b\xa2\xff\xfd\xfb\xb7\xf0\xff\xff\x34\x53\x90\x23\x40\x21\x01\
-\xcc\xc2\x0c\xac\xc0\xb4\x04\xaa\x2c\xbf\x7c\xf9\xc1\xf0\xee\xfd\
-\x17\x86\xcf\x9f\x3f\x32\x7c\xfb\xf6\x55\x1e\xa8\x0d\x84\x2f\x01\
-\x04\x10\xdc\x01\x7f\xff\xff\x67\x02\x66\xd8\x89\xd1\x7d\x5d\xd6\
-\x42\x96\x36\x0c\x5f\x0e\xec\x62\xf8\x75\xf9\x3c\xc3\x0f\x60\xdc\
-\x33\xdc\xb8\xcc\xf0\x10\x58\xda\x4d\xfb\xc9\x72\xef\xfc\xc7\x8f\
-\x2b\x81\xca\x37\x81\x2a\x50\x94\x90\x03\xb6\x88\x80\x8e\x88\x05\
-\x86\xfb\xc2\x7f\x7f\xd3\xcc\x8d\x0c\x0d\x80\x95\xd4\x4f\x70\x5a\
-\xd0\xd5\x51\x06\x36\xc7\xde\x32\x6c\xde\xbc\x99\x61\xf5\xaa\x39\
-\xb7\x6e\xde\xbc\xb1\x13\xa8\xe5\x3d\x48\x1f\x40\x00\xb1\x20\x9a\
-\xa4\xff\x23\x7c\x32\xe3\xa3\x24\xdd\xdc\x19\xbe\x1f\xde\xc3\xf0\
-\xfb\xca\x39\x86\x9f\x97\x2f\x30\x30\xde\xba\xca\xf0\xf8\xc7\x3f\
-\x86\xc9\x3f\xd9\x9e\x1d\xfc\xf8\x09\x18\xec\xff\xd7\x02\x95\x3f\
-\xc4\x96\xa7\x81\x21\x71\x73\xf7\x9e\xed\xb1\xc0\x8a\x0a\x18\x12\
-\x29\x96\x46\x86\x7a\xc0\x9c\xc0\x0d\x6c\xce\x7f\x61\xd8\xb5\x67\
-\x17\xc3\xaa\x55\xb3\x6f\x5c\xbd\x72\x05\x54\x43\xae\x02\xe2\x27\
-\x20\x3d\x00\x01\x04\x77\x80\x82\x20\x57\xa6\x9e\xa7\x1b\xc3\x1f\
-\xa0\xaf\x7f\x5f\x01\x62\x20\xcd\x72\xe7\x1a\xc3\x9d\x6f\x7f\x19\
-\x7a\xbf\xb1\x3e\xdb\xf1\x09\x68\xf9\xff\x7f\x20\xdf\xdf\xc0\x57\
-\xbe\x03\x83\xfe\xf6\xee\xdd\x5b\xe3\x81\xb9\x61\xc1\xdf\x7f\x49\
-\x56\xca\x4a\xea\x0c\x07\x0f\xed\x61\x58\xb9\x7c\xe6\x4d\x60\x73\
-\x1f\xd4\x30\x01\xa5\x9d\x3b\x30\xf5\x00\x01\x04\x77\x00\xcb\xef\
-\xdf\xfc\x8c\xc0\x4a\xe6\xaf\x00\xb0\x75\x75\xe9\x14\xd0\xf2\xeb\
-\x0c\xa7\x3e\xfe\x65\xe8\xfe\xc4\x78\x7f\xdf\xb7\x4f\x2b\x80\xf9\
-\x0b\xa4\xf1\x12\x31\x1d\x11\x60\x48\xdc\xde\xbb\x67\x47\x1c\x30\
-\x1f\x4c\xd7\xd2\x36\x72\xdd\xbd\x6b\x13\xd0\xee\xab\x20\x9f\xaf\
-\x00\xe2\xfb\xc8\x6a\x01\x02\x08\x5e\x17\x58\x33\x30\x44\xaf\x15\
-\x61\xff\xfe\xcd\x5c\xea\xff\x7d\x55\xde\xff\x53\x84\xb9\xfe\x6a\
-\xb3\xb1\x9d\x01\xaa\xa9\x06\x62\x4d\x72\xfa\x91\x6c\x6c\x6c\x72\
-\xc0\x66\x5a\x3e\x30\x47\xa4\x00\xb9\x2a\xd8\xea\x02\x80\x00\x82\
-\xd7\x86\x4c\x8c\x8c\x4c\x40\x5b\x52\x74\x58\x19\x93\x80\xad\x01\
-\x96\xf3\x7f\xfe\x5d\xf9\xf8\xff\xef\x2e\x68\xa3\xe2\x09\x05\xfd\
-\x4f\x56\x28\xfe\x8e\x68\xd5\x20\x1c\x00\x10\x40\xe8\xd5\x31\xa8\
-\xdf\xa6\x00\x2a\xc0\xa0\x0d\xc8\xc7\xd0\x82\x91\x26\x00\x64\x37\
-\x40\x80\x01\x00\x1b\xec\xcf\x8a\xf9\x42\x05\x71\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x12\x17\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1b\xaf\x00\x00\
-\x1b\xaf\x01\x5e\x1a\x91\x1c\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x40\x00\x00\x00\x40\x00\xea\xf3\xf8\x60\x00\x00\x0f\xf4\
-\x49\x44\x41\x54\x78\xda\xed\x9b\x59\x90\x5c\xd5\x79\xc7\x7f\xe7\
-\x6e\xbd\xcd\xf4\x6c\x2d\x89\x11\x8b\x85\x62\x20\xc8\x82\x8a\x5d\
-\x85\x52\x94\x13\x9c\xe0\xe2\xc1\x7e\x81\x0a\x89\xed\xe4\x89\xaa\
-\xe4\x25\x7e\xc8\x43\x2a\x09\x95\xed\x21\x15\xdb\xe5\x8a\x1d\x3f\
-\x04\x17\x4b\x05\x84\x02\x18\x83\x59\x44\x28\xa5\x02\xa9\x12\x65\
-\x09\x04\x48\x01\x44\x0d\xa0\x20\x66\x46\xa3\x85\xd1\x8c\x46\x9a\
-\xad\xa7\xbb\xef\x72\xee\x39\x27\x0f\xf7\xf6\x4c\x6b\xd4\x33\x7d\
-\x7b\x24\x95\xf3\x90\xaf\xea\x56\xdf\xe5\xdc\x73\xcf\xff\xff\x7d\
-\xe7\x5b\xce\xbd\x2d\xf8\xbf\x2c\x4f\x01\x53\x40\x9e\x3c\x82\x5f\
-\xc7\xe1\x2e\x1c\xee\xc2\x66\x27\x16\xd7\x20\x28\xa5\x2d\x1b\x28\
-\xa6\xd0\x7c\x42\xcc\x01\x14\x07\x51\x7c\xca\x3c\x01\x3b\x80\x6f\
-\xad\xfd\x08\xd1\x61\x08\x9d\xae\x5f\x3d\x31\x18\x7e\x40\x9e\x1c\
-\xbf\x89\xe0\xdb\x38\x7c\x1d\x87\xeb\x71\x29\x38\x9e\x43\xce\xcb\
-\x91\xb3\x73\x00\x84\x2a\x24\x8c\x42\x62\x19\x83\xc4\x47\x72\x86\
-\x98\xfd\x28\x9e\x43\x72\x04\x8b\x80\xbf\x6e\xff\x18\x67\x9d\x21\
-\xe4\x80\x7e\xc0\xfd\x95\x10\xf0\x6d\xb6\xf2\x1b\xfc\x11\x82\x3f\
-\xc0\x65\xab\x9d\xb7\xb9\xb6\xff\x5a\x76\x56\x76\xb2\x63\x60\x07\
-\xc3\xc5\x61\x7a\xdc\x1e\x00\x6a\xb2\xc6\x54\x63\x8a\x63\xf3\xc7\
-\xf8\x78\xf6\xe3\xc2\xe4\xc2\xe4\xcd\xca\x57\x37\x03\xf7\xa2\x79\
-\x1e\x9f\x47\x80\x51\xfe\x1c\xf8\xc9\xc5\x8f\x59\x4b\xc3\x02\xd8\
-\xdc\xdf\xdf\xbf\x6b\xd7\xae\x5d\xbf\x56\x28\x14\xec\xab\x8d\xd7\
-\x18\x83\x10\x02\xa5\x94\x79\xdb\x7d\x7b\xd3\xdc\xed\x73\xdf\xa0\
-\x9f\x9d\x14\xb0\x87\x07\x87\xf9\xfa\xf5\x5f\xe7\xab\x5b\xbe\xca\
-\xd6\xe2\x56\x3c\xdb\x43\x20\x30\x98\x74\xb0\xc9\x7e\xa4\x22\xce\
-\x36\xce\x72\xe8\xdc\x21\xf6\x9f\xd9\xcf\xd4\xdc\x14\xf8\x28\x24\
-\x87\x30\xfc\x3d\x1e\x6f\x22\x31\xfc\x55\x36\x02\xae\xbb\xe7\x9e\
-\x7b\xee\x7f\xf8\xe1\x87\xff\xac\xbf\xbf\xbf\x5f\x6b\x6d\x56\xae\
-\x8a\x75\x6f\x6e\xdf\xa3\xb8\xa8\xf3\xb5\x64\xdf\xf8\x3e\x1e\x7c\
-\xf7\xc1\xfc\x8c\x98\x29\x5a\xbd\x16\xb7\x0f\xdf\xce\x7d\xdb\xee\
-\xe3\xa6\xbe\x9b\xb0\x84\x85\x46\xa3\x54\x8c\xd2\x0a\x4c\x4a\x80\
-\x10\x58\x96\x8d\x6d\x3b\x49\x1b\xad\x19\x5d\x1c\xe5\x95\x93\xaf\
-\x30\x32\x35\x82\xae\x69\x08\x39\x86\xe6\x2f\xd0\xbc\x86\x85\xe1\
-\xc1\xe4\x79\xeb\x4d\x01\x8a\xc5\xa2\xdd\xdf\xdf\xdf\x67\x3b\xce\
-\x80\x96\x12\x81\x00\x91\x3c\xb0\xc9\x7c\x13\xcd\xf2\xb9\x56\x72\
-\x5a\x41\xb7\x23\xa0\xa5\xad\x40\xf0\xd6\xd4\x21\x7e\x74\xec\x47\
-\xcc\xd8\x33\x58\x65\x8b\x2f\x6f\xfd\x32\xf7\x6d\xbb\x8f\x4a\xbe\
-\xc2\xa2\x5e\xc0\x12\xa0\xe3\x18\xbf\xde\x20\x6f\xf2\x58\x22\x31\
-\x4c\x6d\x14\xa1\x08\xc8\x97\x8a\x58\x8e\x83\x31\xb0\xa5\x67\x0b\
-\xf7\x7f\xf1\x7e\x6c\xc7\xe6\xe8\xd9\xa3\xe8\xaa\xde\x41\xc0\x8f\
-\x31\x34\x18\xe0\x00\xdf\x03\xfe\xae\x03\x01\x00\x5a\x6b\xb4\x94\
-\xc4\x71\x9c\x0c\x53\x24\x03\x17\xed\x40\xaf\xfa\x5d\x97\x90\x96\
-\x63\x0b\xc1\x89\xc5\x13\x7c\xef\xf0\x3f\x72\x6c\xe9\x18\xf4\xc1\
-\xf6\x2d\xdb\xb9\xfb\xba\xbb\x71\x1d\x87\x45\x3d\x8f\x23\xc0\x16\
-\x10\x85\x3e\x26\x80\x7b\x6f\xfc\x3d\x06\x0b\x43\x00\xcc\xf9\xb3\
-\xbc\x38\xf1\x0c\xd2\x6d\x90\xb3\x0a\x28\x03\xb1\x01\xd7\x71\xb8\
-\xfb\xba\xbb\x59\x54\x8b\x8c\x99\x31\x30\xec\x20\xe0\x1f\x98\xe1\
-\x8f\xa9\x30\x8e\x9b\x81\x80\x15\x10\x02\x21\x32\x12\xb0\x86\xf6\
-\xd7\x22\xc1\x97\x01\x4f\x1c\x7b\x82\x77\xe6\xde\x81\x5e\x28\x0f\
-\x94\xb9\x63\xcb\x1d\xd8\x8e\x45\x55\xcf\xe3\x01\xae\x00\x47\x40\
-\x10\xd7\x31\x81\x43\xd9\x2d\x33\x90\x4b\x08\x88\x63\x49\x10\x54\
-\x11\xf9\x18\xe1\x95\x88\x01\xa9\x21\xd2\x60\xbb\x16\x77\x5c\x73\
-\x07\x33\xe1\x0c\x55\x55\x05\xc5\x6f\x63\xf8\x2e\xc7\xf9\x5b\xbe\
-\x4f\xb0\x1e\x01\xcd\x09\x76\x11\xf8\x15\x32\x56\xc0\x75\xd2\x78\
-\x27\xed\x1f\x99\x3e\xc2\x4b\x13\x2f\xa1\xf3\x1a\xd1\x23\xb8\x71\
-\xe0\x46\x7a\x72\x3d\x2c\xa5\xe0\x35\x60\xac\x64\x40\x91\xaa\x11\
-\x87\x2e\xda\xa8\x15\x2b\x35\x0a\x3f\x5c\xc0\x55\x12\x17\x49\xa4\
-\x21\x32\x10\x1a\x08\x35\xf4\xe6\x7a\xb8\x71\xe0\x46\x46\x82\x11\
-\x8c\x34\x16\x8a\xef\x30\xc8\x7f\xf0\x97\xbc\xd1\xd1\x02\x52\x85\
-\x5f\x02\x3e\xab\xb9\x37\xf7\xdb\x92\x80\xa0\x1e\x35\x78\x69\xfc\
-\x45\xa6\xe3\x69\xe8\x81\x42\xa9\xc0\xe6\xd2\x66\x1a\xba\x8a\x12\
-\x06\x23\x40\x18\xb0\x00\x0b\x43\xac\xea\x84\x61\x1e\xad\xf5\x0a\
-\x01\x5a\x13\x86\x4b\x08\x1d\xa0\x8c\x44\x21\x90\x29\xf8\x40\x43\
-\xa0\x05\x9b\x4b\x9b\x29\x94\x0a\x34\x82\x06\x84\x6c\x45\xf2\x87\
-\x7c\x87\x23\x99\xa7\x40\xab\xa6\xb3\x98\xfe\x45\xfb\x6b\x68\x5f\
-\x18\xc1\xe8\xfc\x28\x07\xcf\x1d\x4c\xb2\x8e\x02\xf4\xe6\x7b\x41\
-\x18\xea\x66\x01\x63\xc0\x32\xe0\x18\xd0\x06\x8c\x30\x28\x5d\x27\
-\x0a\x63\x8c\x59\x21\xc0\x18\x4d\x14\xd6\xf0\x74\x1d\x23\x62\x94\
-\x11\xc4\x86\x65\x12\x7c\x0d\x96\x65\xe8\x2d\xf4\xd2\x28\x34\xc0\
-\x07\x24\xbf\xcb\x76\x6e\xcb\x44\x40\x3b\x32\x2e\xd1\x7a\x17\xd3\
-\xa0\xd9\x52\x6b\xc5\x91\x99\x23\x4c\x46\x93\xd0\x0b\x78\x10\xdb\
-\x31\x4b\x6a\x1e\xcb\x72\xb0\x01\x07\x83\x27\x52\x02\x00\xa3\x7c\
-\xa2\x10\x4c\x4b\x54\x36\xda\x20\xc3\x3a\x46\x55\xc1\x48\x74\xea\
-\x04\x23\x0d\xa1\x16\xf8\x1a\x96\x54\x8c\xb2\x62\xf0\x48\xc8\x0e\
-\xb9\x96\x22\xbf\xd3\xb5\x05\xac\x07\xbe\x9d\xd6\xdb\x01\x6f\x1e\
-\x37\x22\x9f\xa3\x73\x1f\x20\x2d\x99\xe4\x9b\x0e\x2c\xc8\x39\x26\
-\x66\x23\x36\xeb\x5e\xfa\x6c\x87\x92\x0d\x35\x1b\x4a\x36\x14\x6d\
-\x68\xcc\x45\x44\x55\x0b\xdd\x62\x01\xda\x68\x96\xaa\x35\xa2\xe9\
-\xf3\xd4\x43\x8f\x86\x86\xba\x4a\xb6\x5a\x0c\x55\x1d\x73\xce\x5a\
-\x62\x41\xd4\x12\xb7\x9f\x03\x5c\xf2\xe4\xf9\xad\xcc\x16\x70\xd1\
-\x14\x68\x07\x34\xe3\x34\x68\x92\x60\x0c\x2c\x06\x8b\x4c\xd4\x4f\
-\x26\x83\x72\x00\x0b\x8c\x6f\xa8\x9f\x0e\xd0\x72\x88\xd8\x29\x10\
-\x58\x02\x6d\x09\x02\x21\xa8\x0a\xd0\x52\x31\xe8\x6e\xc6\x16\x2b\
-\x43\xb7\x85\x43\x4e\x6d\x66\x7e\x22\x62\x71\xd2\x46\x6a\x90\xc6\
-\x10\x69\x83\xd4\x86\x58\xf9\x34\x9c\x00\x6e\x30\xcb\x44\xa7\x44\
-\xdc\x9a\x3d\x0c\xae\x4e\x78\xd6\xd1\xf6\x9a\x4e\xb0\x65\xdf\x68\
-\xcd\x62\xb0\xc8\xac\xba\x70\x31\x01\x0d\xd8\x52\x1f\xe6\xa7\xf7\
-\xee\x66\x5b\xe5\x0b\x18\xb3\x92\xee\x26\x37\x1a\x5c\xdb\x65\x73\
-\x79\x78\x79\x7c\x9b\xcb\xc3\x7c\xff\xf7\x1f\x47\x2a\xb9\xfc\x5c\
-\xd3\x92\x25\x9e\xba\x70\x8a\x3f\xf9\xf7\x07\xa8\xf9\xa7\x13\xed\
-\xdb\xcb\x24\x6c\xce\x46\x40\x3a\x80\xae\x2d\x60\x9d\x69\x60\x8c\
-\x21\x90\x3e\x81\x09\x96\xc1\x03\xa0\xc0\x89\x5d\x6e\x18\xf8\x02\
-\xdb\x2a\xdb\x33\x59\xa7\x63\xbb\x5c\x3b\x78\xc3\x9a\xd7\x75\xda\
-\xa7\x50\xe9\x00\xac\x94\x04\x97\x7c\x67\x02\x56\x62\x60\x5b\x2d\
-\x77\xb4\x84\x35\xac\xc2\x18\x43\xac\x14\xc6\x32\xad\x2c\x5f\xbd\
-\xfa\xbb\xb5\xe3\x26\x01\x76\xe7\x4c\xd0\xb4\xde\xbf\x16\xf8\x4e\
-\x71\xff\x12\x42\xd2\x8e\x6d\x2c\x3c\xdb\x4b\x0e\x9a\x16\x60\x43\
-\xec\x48\xce\xcc\x9f\xc2\xb2\xc5\x72\xb8\x13\xcb\xcc\x81\x6b\xbb\
-\x6c\xe9\x1b\xc6\xb1\x93\x4a\x3d\x56\x92\x73\x8b\x53\xe9\x14\x48\
-\xda\x34\x07\x2e\x84\xc5\x99\xf9\x53\xc4\xb6\x4c\x40\x37\x81\xd8\
-\x80\x45\x98\x3d\x0a\x64\x01\x9f\xc1\x02\x5a\x49\xc8\x8b\x02\xfd\
-\x4e\x3f\xa8\x96\x67\x15\x61\xa6\x38\xc5\x77\xff\xf3\x01\x8a\xb6\
-\x8b\x2b\xc0\xb3\xd2\x4d\x80\x96\x9a\x8a\xb7\x8d\x1f\x7e\x6b\x0f\
-\x5b\x07\x12\xb3\x9f\xa9\x4e\xf1\x37\x2f\x3c\xc0\x6c\x74\x12\xe1\
-\x59\x44\x3a\x4d\x85\xd3\x50\xd8\x50\x92\x0b\xa5\x29\x28\xb6\xa8\
-\xd4\x02\x34\x73\x99\x32\xc1\xb6\x20\xb2\x80\x6f\x01\xbc\x1c\x3e\
-\x5b\xda\xf7\xd8\x25\x86\x9d\xe1\x24\xd7\x4d\x37\x93\x03\xbd\x4d\
-\x72\x41\x9e\xa6\xc7\x86\xb2\x03\x8e\x03\xae\x93\x84\x42\xb9\x08\
-\xb5\x19\x41\xac\xe5\xf2\x18\x95\x96\xd4\xad\x53\xe4\x6f\x98\xc0\
-\xeb\x87\x9a\x82\x28\x86\x20\x86\xa5\x18\x96\x34\x68\x07\x8c\xbb\
-\xf2\x1c\x04\xe0\x73\x32\xb3\x13\xec\x44\x42\xc7\x36\xab\xf6\x2d\
-\xcb\xa2\xe0\x15\xb8\xc5\xbd\x85\xd7\xe4\x6b\xc4\x3a\x86\x18\xb4\
-\x0d\xca\x03\x51\x02\xc7\x05\xd7\x85\x9c\x0b\x05\x07\x8a\x0e\x48\
-\x07\x54\x43\x20\xac\x96\x01\x5a\x90\xeb\x11\x38\x15\xf0\x06\x40\
-\x29\x90\x12\x42\x09\xb6\x04\x11\x83\x92\xa0\x63\x12\x6b\x33\x80\
-\x21\x62\x9a\x91\x6c\x79\x40\x6b\x02\xd4\xa5\x0f\x68\x67\x01\x02\
-\xb0\x6d\x8b\x9c\x97\xe3\x4b\xde\x97\xa8\x04\x15\xa6\xc5\x74\x5a\
-\xf5\x80\xb4\x20\x20\x89\x58\x9e\x01\xd7\x80\x9d\x0c\x1a\xa5\xc0\
-\x6b\xce\xe5\x95\xe1\xa1\x6c\x08\x14\x38\x32\x49\x7e\xea\x12\x1a\
-\x31\x04\x29\x11\x91\x04\xa3\x5b\xa6\x80\xe4\x02\xc7\x38\xda\x55\
-\x2a\x2c\x56\x81\xcd\x04\x7e\x0d\x12\x2c\xcb\xc2\xcb\x7b\x6c\x2f\
-\x6e\xe7\xb6\xa5\xdb\x98\xb6\xa6\x93\x6b\x1a\x54\x5a\xc4\xb8\x1a\
-\x6c\x9d\xd4\x03\xe8\x24\x9c\x99\x18\xca\xab\x08\x30\x02\x62\x3b\
-\x01\x6e\x05\x2b\x19\x60\x5d\x42\x43\x82\x1f\x43\xac\x5a\xee\xb1\
-\x80\x59\x46\x38\xc8\x67\x16\x19\x44\xd0\x7e\x0e\xaf\x06\xbf\xae\
-\xb3\x5c\x45\x9a\x65\x59\xe4\x72\x39\x2a\xe5\x0a\x5f\xb3\xbf\x46\
-\xbf\xe8\x5f\xf1\xd2\x3a\xd1\x58\x23\x84\x7a\x08\xb5\x00\x96\x42\
-\xa8\x06\xb0\x24\x21\x6a\x13\x2b\x23\x91\x5c\x5b\x6c\xb6\x4b\xef\
-\xad\x87\x10\x46\xa9\xf6\x21\x79\x46\xcc\x02\xef\xf1\x4b\xce\x73\
-\x3e\x13\x01\xab\x93\x98\xd6\x7a\xa0\x55\xf3\xab\x89\x69\x67\x01\
-\xcb\x44\x09\x81\xe7\x79\xf4\xf6\xf5\xf2\x95\xe2\x57\xb8\x53\xde\
-\x89\x70\x44\x12\x98\x45\x32\xe0\x40\xa6\xe0\x03\xa8\xfa\xb0\xe8\
-\x43\x35\x82\xb0\xd5\x0a\xd3\xfd\x00\xa8\x86\x69\x9b\x00\x96\xfc\
-\xe4\xbe\x20\x4a\x2c\x0a\x41\x33\xfb\x33\x9c\xe4\x6d\xf6\xf1\x01\
-\x50\xcd\x5e\x0b\xac\x06\xd3\x06\x64\x47\x3f\xd1\xd2\x46\x08\x81\
-\x6d\xdb\xf4\xf4\xf4\x30\x3c\x34\xcc\x37\x17\xbe\xc9\x98\x1c\x63\
-\xb4\x30\x9a\xda\x35\xe8\x28\xf1\xe4\x5a\x82\xb4\x21\x72\xc0\x8e\
-\xa1\x8a\xe4\x4c\xed\x14\x26\xed\xeb\xf3\xda\x29\x96\xb4\xa4\x1a\
-\x26\x3e\x22\x54\xe0\xab\x64\x41\x44\x09\x92\xfc\xbf\x59\x05\xce\
-\x30\xca\xcb\xec\x63\x9e\xb3\x40\x2d\x7b\x14\xc8\x98\x0b\x64\x05\
-\x4f\x3a\x0d\xf2\xf9\x3c\x83\x95\x41\x76\xcc\xef\xe0\xfe\x73\xf7\
-\xb3\xc7\xdb\xc3\x74\x71\x7a\xd9\xdc\x74\x98\x00\x8a\xe3\x64\x5a\
-\xb8\x06\x26\xd4\x14\x7f\x7a\xf0\x01\xbc\x34\x11\x92\x5a\x32\x1d\
-\x4e\x11\x3a\x89\xf7\x8f\x0c\xc4\x80\x71\x52\xe0\x79\xa0\x00\x2c\
-\x31\xcd\xab\xbc\xc0\x21\x3e\x01\xe6\x00\x3f\x73\x14\x58\x17\x5c\
-\x86\xf0\xd8\x6e\xdd\x00\xc0\x71\x1c\xca\xe5\x32\xc3\x5b\x87\xb9\
-\xb3\x7e\x27\x8d\xf3\x0d\x9e\xbf\xe6\x79\xce\xf5\x9c\x4b\x4c\xd6\
-\x06\x13\x40\x2c\x41\xc5\x89\x56\x1b\x5a\xb2\xd0\x38\xbd\x52\x57\
-\x90\x38\x42\x6d\x40\x0b\x30\x76\xaa\xf5\x26\xf0\x26\xf8\xbd\x3c\
-\xcf\x2f\x78\x87\xe4\x85\x5b\x95\x24\xaa\x66\xb3\x80\x2c\xa9\x70\
-\xb7\xe0\x9b\xe7\x0a\x85\x02\x9b\x36\x6d\x22\x0c\x42\xee\x1a\xbf\
-\x0b\xfb\x73\x9b\x57\x87\x5f\x65\xa2\x3c\x81\xf6\x74\xa2\xc5\x00\
-\x4c\x98\x90\xa0\x14\x49\xc8\x6c\xa2\x6f\x2d\x70\x9a\xf5\x7e\x9e\
-\x24\xf3\xf3\x30\x4c\x71\x92\xe7\x78\x99\x17\x39\x84\xe6\x34\x70\
-\x3e\xe9\x31\x31\x92\x6c\xd2\xce\xf1\x75\x22\x25\x03\x78\x00\xdb\
-\xb6\x29\x95\x4a\x0c\x6f\x1d\x4e\x5e\x78\x4c\xc0\xc0\xe9\x01\xf6\
-\x0f\xed\xe7\xe8\x96\xa3\x54\xf3\xd5\xc4\xf3\x05\x24\xbf\x92\x24\
-\xa1\x69\x92\xb0\x52\xdd\x25\x64\x15\x40\xe4\x05\xf9\x30\xaf\xe5\
-\x01\x79\x3c\x7e\x2e\x7e\x95\x0f\x39\x0c\x4c\x00\x67\x81\x7a\xda\
-\x43\xb6\x65\xf1\x4c\xe9\x2f\x6c\x08\x7c\x53\x5c\xd7\xa5\x5c\x2e\
-\x73\xdd\x75\xd7\x61\xdb\x36\xb9\xd3\x39\x2a\x33\x15\x76\xce\xed\
-\xe4\xbd\x4d\xef\x31\x3a\x30\xca\x62\xef\x22\xaa\xa8\xd6\x25\xc0\
-\xb6\x6d\xfa\xe2\x3e\x6e\x9e\xb9\x99\x9b\xc6\x6f\x0a\xde\xf8\xd7\
-\x37\x3e\x9a\x1c\x9f\x3c\x06\x8c\x03\x93\xa4\xa6\xdf\x7c\x6e\x57\
-\x16\xb0\x2e\x09\x6b\x84\xca\x2c\xe0\x9b\xe7\x5c\xd7\xa5\xaf\xaf\
-\x0f\xc7\x71\x28\x14\x0a\x94\x7a\x4b\x0c\x4c\x0d\x70\xcb\xe4\x2d\
-\x9c\x39\x7b\x86\x89\xe2\x04\xa7\x8b\xa7\x99\xf5\x66\xa9\xdb\x75\
-\xa4\x48\xaa\x3f\x37\x76\x29\xa9\x12\x95\xb0\xc2\xf5\x8d\xeb\xd9\
-\xde\xd8\xce\x0d\xd6\x0d\x38\x9e\xa3\xde\xf7\xde\x9f\x99\x64\x72\
-\x02\x38\x03\x2c\x91\xf8\xc7\x65\xe9\xae\x16\x80\x35\x3d\x7f\x5b\
-\x32\xba\x00\xdf\x4a\x42\x6f\x6f\x2f\x9e\xe7\x51\x2a\x95\x18\x1c\
-\x1c\x64\xd3\xf9\x4d\x0c\xcf\x0d\x73\xeb\xd2\xad\xd4\xce\xd5\xa8\
-\xa9\x1a\x3e\x3e\x71\x8a\xc5\xc1\xa1\x20\x0a\xf4\x58\x3d\xf4\xe4\
-\x7b\xe8\x1d\xec\x65\xb0\x32\x88\x65\x59\x6a\x70\x68\xf0\x02\x70\
-\xae\x1d\xf8\xae\x2c\xe0\x22\xc0\x5d\x58\x44\x56\xf0\xad\x62\xdb\
-\x36\xc5\x62\x31\x49\x94\x7a\x7b\xa9\x54\x2a\x54\xab\x55\xaa\xd5\
-\x2a\xb5\xa5\x1a\xbe\xef\x23\x23\x89\x52\x6a\xb9\xbd\x9b\x73\x29\
-\x14\x0a\xf4\xf4\xf4\x50\x2e\x97\xe9\xeb\xeb\x23\x8a\x22\x5d\x2e\
-\x97\x1b\x24\xde\x43\xd1\x46\xb2\xaf\x08\x71\xe9\x1c\x5f\x7d\xee\
-\x4a\x80\x6f\x3d\xef\xba\x2e\x8e\xe3\x90\xcf\xe7\x9b\x80\x08\xc3\
-\x90\x28\x8a\x90\x52\x2e\xbf\x1c\xb1\x2c\x0b\xd7\x75\xf1\x3c\x8f\
-\x5c\x2e\x47\x2e\x97\xc3\xf3\x3c\x16\x17\x17\x71\x1c\xa7\xb5\x04\
-\xda\x00\x01\xab\xb4\x2f\xd6\x39\xb7\x36\x87\x1b\x27\xa4\x39\x2d\
-\x5c\x37\xd1\xb0\xd6\x1a\x63\xcc\xf2\x6f\xb3\x8d\x65\x59\x58\x96\
-\xb5\x9c\x66\x37\x8f\x3b\x49\xe6\x05\x91\xb5\xbc\x7f\xa7\x79\x7f\
-\xa5\xac\xa1\x15\xe8\x95\x94\xae\x32\x41\xd1\xe6\xdc\x45\xd7\x45\
-\x27\x5b\xb8\x7c\x42\xae\xb4\x74\x9d\x08\xb5\xd5\x7e\x46\xb0\x57\
-\x0a\x7c\xd3\xf4\x57\xef\xb7\x8a\x65\x59\x68\x63\xd6\x9e\xfc\xdd\
-\x10\xd0\xba\xa4\x75\xc9\x00\x33\x9a\xfe\x95\x00\x6f\x8c\x59\x06\
-\xdc\xba\xdf\xb6\x2d\xa0\xb5\x59\xfe\x8c\xe6\xb2\x08\xb8\x88\x84\
-\xd5\xc0\xb3\x76\x70\x19\xe0\x9b\x60\x57\x6f\xad\x8e\x70\x75\x3f\
-\x96\x65\x11\x2b\x8d\xee\x60\x02\xdd\x2d\x89\xad\x01\x7c\x23\xda\
-\xef\x06\x7c\x13\xa8\x31\x06\xa5\x54\xf2\xd9\x4e\x9b\x68\xd0\xec\
-\xa7\xf9\xd1\x94\x8c\xe3\x75\xad\xa4\x6b\x02\x3a\x01\xcf\xdc\x47\
-\x06\x82\x56\x6b\x5a\x6b\x8d\x52\xaa\xcd\xa6\xd3\x7c\xa0\x19\x12\
-\x2d\x6c\xdb\xc2\x76\x3d\x1a\x61\x14\x07\x41\x18\xb3\x52\x35\x6c\
-\x90\x80\x96\x64\x68\xf9\x78\x83\xe0\xba\x05\xdf\x04\x1a\xc7\x31\
-\x4a\x29\xa4\x94\x48\x29\xd3\x64\x28\x4e\x2d\x42\xa5\x9a\x4e\xb4\
-\xef\xe6\xf3\x58\xae\x52\x47\x0e\xbf\xfb\xe1\xc8\xc8\x87\x13\x24\
-\x9f\x44\xb4\x35\x85\x0d\xa5\xc2\x57\xc2\x0a\xd6\x93\x56\xf0\x71\
-\x1c\x13\xc7\x31\x32\x8e\x09\x83\x90\x30\x0c\x08\x82\x24\x1b\x8c\
-\xa4\x44\xa5\xc4\x18\x4c\xba\xb6\x50\x44\xdb\xb6\xf9\xe8\xfd\xf7\
-\xfe\xfb\xc7\x3f\xfc\xc1\x33\x17\xce\x9f\x1f\x21\xa9\x03\xda\x4a\
-\xe6\x28\xb0\x9a\xbe\x8d\xcc\xeb\x6e\xb4\xdf\x0a\x3e\x8a\x22\x7c\
-\xdf\xa7\xe1\xfb\xf8\xbe\x4f\xe0\x07\x49\x4a\x2c\x25\xb1\x94\x68\
-\x63\xc8\x79\x1e\xfd\xfd\x7d\xe4\x72\x1e\x9f\xfd\xcf\x27\x9f\x3c\
-\xf2\xd0\xbf\x3c\xfe\xf1\x47\x1f\xbd\x49\x52\x02\xcb\xb5\xc6\xb8\
-\x61\x27\x98\x05\x70\xb7\xb2\x7a\xbe\x37\xc1\x37\x1a\x0d\x6a\xb5\
-\x3a\x8b\xd5\x45\xea\xb5\x3a\x41\x10\x10\x45\x11\xda\x18\x0a\xf9\
-\x3c\x95\x4a\x85\xca\xa6\x0a\x02\xc3\xf1\xcf\x8e\x4f\xfc\xec\x67\
-\xcf\x3c\xf6\xd6\x5b\x87\xf6\x77\x02\xdf\x35\x01\x97\x03\x78\x23\
-\xda\x97\x52\xe2\xfb\x3e\xf5\x7a\x9d\x85\x85\x05\x2e\xcc\x5e\xc0\
-\xb6\x6c\xbc\x9c\xc7\xe0\xe0\x00\x43\x43\x43\x0c\x0e\x0e\xe2\xba\
-\x2e\xd5\x6a\x95\xe3\xc7\x3f\x9d\xde\xbb\x77\xef\xa3\x2f\xbf\xb4\
-\x77\x5f\x16\xf0\x1b\x22\xa0\x93\x15\x6c\x84\x9c\x56\xf0\xad\x16\
-\x10\x86\x21\x8d\x86\x4f\xbd\xde\x60\x69\x69\x09\x21\x04\xbb\x76\
-\xdd\x41\xb9\x5c\xc6\xb6\x93\xcf\x64\x83\x20\x60\x76\x6e\x96\xb1\
-\xb1\xd1\xb9\xd7\x5e\x7f\xed\xb1\x3d\x4f\xee\xf9\x45\x56\xf0\xb0\
-\xf2\x56\x3e\x03\xf2\xd6\x77\x51\xed\x93\x8f\xec\x5d\xad\xad\xfd\
-\x26\x78\x29\x25\x41\x10\xa6\x73\xbf\x41\xc3\x6f\xe0\x3a\xc9\x62\
-\x49\x2e\x97\x03\x0c\xbe\xef\x33\x3b\x3b\xcb\xf8\xf8\xd8\xd2\x81\
-\x03\xbf\xdc\xbd\xfb\x89\xdd\x4f\xc5\xb1\xca\x0c\xbe\x3b\x02\x36\
-\x08\x36\x4b\xfb\xd6\xf4\xb6\x49\x40\x14\x45\x04\x61\x40\x10\x04\
-\x89\xe3\x0b\x42\x4a\xa5\x12\x8e\xe3\x10\xc7\x12\xdf\x0f\x98\x9b\
-\x9b\x63\xfc\xc4\x58\xfd\xd0\xa1\xb7\xf6\x3c\xb9\x7b\xcf\xa3\x8b\
-\x8b\xd5\xd3\xdd\x80\xef\x8a\x80\xab\x5d\x9b\xb5\xb3\x80\x28\x4c\
-\x16\x40\x82\x20\x44\x2b\xcd\xd0\xd0\x20\x40\x2b\x78\xff\xf0\xe1\
-\x77\x9f\x79\xfa\xa9\x67\x1e\x9a\x9c\x3c\x7b\x8a\x36\x4b\x5e\x9d\
-\xa4\x3b\x1f\xb0\xaa\x36\xbf\xd2\x04\x34\xe7\x7f\x1c\xc7\x44\xcd\
-\x84\x27\x4d\x7a\xf2\xf9\x1c\x43\x43\x43\x04\xc1\x8a\xe6\x0f\x1f\
-\x7e\xf7\x99\x9f\x3f\xfb\xdc\x4f\xc6\xc6\xc6\x27\x36\x02\xbe\x7b\
-\x02\x8c\xc9\xe4\x00\x37\x02\xbe\xf9\xbb\x6c\x05\x71\x9a\x07\xa4\
-\xd9\xde\x96\xe1\x61\x72\xb9\x1c\xb3\x73\xb3\x8c\x9f\x18\x5b\x3a\
-\xf4\xf6\xa1\x27\x9f\x7e\xea\xe9\x87\xc6\x46\xc7\x4f\x6e\x14\x7c\
-\xd7\x04\x64\x85\x7e\x39\xd6\xb1\x62\x09\x69\xae\xaf\x15\x39\xcf\
-\x63\xcb\x35\x5b\xa8\x56\xab\x8c\x8d\x8d\xce\x1d\x38\x78\xe0\x89\
-\x3d\x4f\xfe\xdb\xa3\x9f\x9f\xf9\xfc\xf4\xe5\x80\xef\x9a\x00\xb3\
-\x6a\x41\x74\x23\xb2\x9a\x9c\x76\xf5\x7d\x42\x42\x7a\x6c\x60\x70\
-\x68\x08\xc7\xb6\x38\xfe\xd9\xa7\x53\xff\xf5\xfa\xeb\x8f\xee\x7e\
-\x72\xcf\x53\xf3\x73\xf3\x9f\x5f\x2e\xf8\x4e\x04\xa4\x1f\xa5\xb4\
-\x0c\xfe\x72\x9f\xb6\x06\x21\xed\x6b\xfa\xe4\xb7\x50\x2a\xd1\xd7\
-\xdf\xc7\xe8\xe8\xe8\x89\xbd\xaf\xec\x7d\xf8\xc9\xdd\x7b\x5e\x88\
-\xe3\xf8\xec\x95\x00\xdf\x89\x80\x4b\x19\x49\xff\xd9\xb5\x7a\x7f\
-\xbd\x76\x59\xaf\xad\xfe\x1c\x3f\xa9\xea\x0a\xe4\x5c\xd7\x4c\x4c\
-\x9c\xf8\xf8\xe7\xcf\x3e\xfb\xc8\x8b\x2f\xbc\xb8\x8f\xe4\xcd\xee\
-\x15\x01\xdf\x91\x00\x91\x08\xb6\x6d\x27\x35\x77\x86\xf5\xff\x76\
-\xe7\xb3\x1c\x0b\x21\x10\x96\x85\x65\xdb\xd8\x8e\x8b\x9b\x2f\x92\
-\xb3\x3c\x75\x6c\xe4\xe8\x91\xc7\x1f\x7d\xf8\xb1\x03\x07\x0e\xbe\
-\x71\xa5\xc1\x77\x24\xa0\xd1\x68\xc4\x73\x73\x73\x0b\x80\x30\x9d\
-\x96\x56\xd6\x27\x72\xcd\x6b\xc6\x18\xb4\x01\xa5\x35\xb1\x52\x44\
-\x52\x11\x4a\x49\x2d\x88\xe2\xa3\x1f\xbc\xff\xc1\x4f\xff\xf9\x9f\
-\x9e\xfa\x68\x64\xe4\x4d\x60\xfa\x4a\x83\x87\x75\x16\x74\x81\x4d\
-\xe9\x1f\x27\xbf\x58\x28\x14\xec\xcb\xc0\xdf\x51\x4c\xba\x7a\xab\
-\x97\xc3\x20\x04\x61\x20\x3f\x3d\x76\x6c\xec\xdc\xf4\xd4\xc8\xd5\
-\x02\xbf\x1e\x01\x90\x7c\x66\xd0\x47\xf2\xc6\xfd\x57\x21\x1a\x68\
-\x00\xb5\xab\x05\xbe\x13\x01\x59\xae\x5f\x6d\xb9\x7a\x66\xf7\xff\
-\x92\xc8\xff\x02\x85\xd4\x27\x29\xf9\x96\x51\xb8\x00\x00\x00\x25\
-\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\
-\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x33\x3a\x30\x32\
-\x3a\x31\x31\x2d\x30\x37\x3a\x30\x30\x4b\xf9\xc3\xed\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
-\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\
-\x36\x3a\x31\x35\x2d\x30\x37\x3a\x30\x30\x06\x3b\x5c\x81\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
-\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\
-\x33\x32\x3a\x31\x31\x2d\x30\x37\x3a\x30\x30\xce\xd9\x51\xa3\x00\
-\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\
-\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\
-\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\
-\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\x20\x6f\x72\
-\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\
-\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\
-\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\x2f\x5b\x8f\
-\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\
-\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\
-\x54\x31\x33\x3a\x30\x32\x3a\x31\x31\x2d\x30\x37\x3a\x30\x30\x14\
-\x48\xb5\xd9\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\
-\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\
-\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x13\x74\x45\x58\x74\
-\x53\x6f\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\x6e\x20\x49\x63\
-\x6f\x6e\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\x45\x58\x74\x53\
-\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\
-\x2f\x77\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\x69\x63\x6f\x6e\
-\x73\x2e\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\xd4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x02\x9b\x49\x44\x41\x54\x78\x5e\xed\xd4\x01\x48\x93\x61\
-\x10\x06\x60\xe1\xe6\xbf\xe1\x92\x24\x13\xd1\x32\x8c\xb0\x96\x65\
-\x53\x44\xd3\x52\xdd\x66\xd5\xb0\x0d\x20\x47\x5a\x11\x26\x61\x53\
-\x75\x45\xaa\x2b\xcd\xb2\xe1\x54\x02\xcb\x11\x40\x41\x09\xe8\x14\
-\x62\xa5\x96\x26\x05\x60\x22\x2d\x93\x14\x2c\x43\xdd\x44\x4a\x43\
-\xca\x54\x29\x0a\xd4\x6d\xff\x7f\xd7\x50\x12\x22\x45\xad\x02\x90\
-\x3e\x78\xe1\xe0\x83\x87\x83\x83\xd7\x85\x88\xfe\x49\x56\x11\x0c\
-\xca\x41\x21\x28\xac\x47\xfc\x92\x07\x1a\x0f\x15\x0d\xbd\x8a\xc9\
-\x1b\xec\x14\x67\xf4\x9b\x05\xca\x4e\x1d\x1c\x7c\x21\x5a\x31\x0c\
-\x0a\x8b\x70\xfd\x31\x8b\xa9\xc8\x38\xca\x75\x0d\x4e\xa1\x83\x45\
-\x42\x44\xfa\xf1\x46\x3f\xdb\xa9\xdc\x34\xcc\x86\xa8\x3b\x86\x21\
-\xee\x71\xf4\xb2\x60\x88\x7f\x2d\x0a\x4a\xef\xff\xd4\xf0\xf2\x2b\
-\x59\xc6\x38\x1a\x98\x40\xb2\x8c\x73\x64\x1d\x9f\x9b\xe7\x33\x8e\
-\xf4\x66\xc4\x46\xea\xeb\xdd\x76\xfe\xbe\xfa\x0a\x88\xbd\xcb\x2c\
-\x0a\x83\xbc\x53\x21\x4e\xef\x71\xd4\xb4\x7f\x23\x53\xd7\x14\x95\
-\xd4\x8d\x62\x9a\xc1\xc2\x25\x5c\xee\x26\x59\x76\x07\x9d\x36\xf4\
-\x72\x46\xf3\x17\x6a\xec\x47\x7a\xd0\x37\x97\xfa\x1e\x3b\xe5\x57\
-\xf6\x3a\xf8\xd2\x6a\xe3\x82\x30\x1c\x30\xfb\xba\x2b\xcd\x33\x67\
-\xaa\x3e\x52\xe2\x55\x2b\x6e\x48\x6a\x9b\x04\x59\x73\x2e\xc8\x9a\
-\x44\xb3\xff\x92\x3a\x80\x58\x93\xdc\xe7\x70\xd3\x58\xd6\x9d\xb7\
-\xa4\x7f\x8a\xa4\x6f\x41\x2a\x76\x46\xf7\xc4\x46\x7b\xd3\x1b\x6d\
-\x10\x79\xe3\xe8\x2f\x30\x3f\xbe\xb5\xcd\x2f\xb1\x95\xbc\x13\x5a\
-\xa6\x79\xb2\xa6\x4c\x90\x36\xf0\x16\x3c\x68\x54\xe5\x46\x6f\x45\
-\x0d\xaa\xaa\x6c\xa4\x32\xe2\x6c\x12\xaa\x91\x14\x86\x0f\xe4\x16\
-\x53\x31\xf9\x13\x0c\xb2\x47\x27\x40\xfa\x90\x04\xf2\xe6\x6e\x90\
-\xdc\xf3\x5a\xea\xda\x8c\xf4\xf6\x3b\xdf\xb3\x56\xda\x52\x86\xb4\
-\xb9\x14\xc9\xbf\x04\x69\x53\x31\x47\xae\x11\x7a\x16\x42\x0b\x03\
-\xe6\x61\x9e\xe4\xfe\x08\xb3\xbf\xce\x00\x31\xb5\xb0\x18\x06\x11\
-\x06\x7f\x88\xac\xb0\x43\x44\x39\x07\xe1\x65\xe8\x71\xb2\x83\x7c\
-\x74\x48\xde\x57\x90\xbc\x8a\x90\x3c\x2f\x21\xf1\xe3\x8d\x08\x21\
-\x39\x1c\x84\x9c\xe3\x20\x2c\xbf\xcf\x05\xa2\xab\x84\x4b\x6d\x09\
-\xe1\xa5\x7c\xde\x9e\xf2\x76\x46\x76\x0b\x3d\x73\x27\x9c\x10\x4b\
-\xeb\x0a\x91\x3c\x2e\x22\xad\x2d\x40\x72\xcf\x47\x12\x6a\x1d\x24\
-\x38\xd5\x4b\x10\x9c\xc5\xc1\xae\x34\xcd\xb2\x3b\x00\x42\x0b\xf8\
-\xbc\xdd\xba\xe7\x4c\xdc\x4d\x74\xd7\xce\xd0\x9a\x0b\x4e\xec\x3c\
-\x92\x9b\x16\x49\x90\x87\xc4\xa8\xdf\x3b\xd1\x4c\x16\x82\x52\x34\
-\x2b\xee\x0a\x10\x6b\xf8\x10\x9a\x67\xe6\x49\xae\x21\x93\x3d\x4d\
-\x4c\x2e\x92\x6b\x0e\x12\xa4\x0e\x13\x88\x53\x59\xd8\x71\x5c\xf3\
-\xdb\x5d\x01\x3b\x53\x18\x08\xce\x30\x43\x94\x1e\x21\x6b\x9a\x20\
-\x65\x88\x20\x28\x99\x85\xed\x2a\xcd\x1f\x97\x10\x88\x54\x8c\x13\
-\x7b\x06\x61\x5a\x84\xc0\x24\x16\xb6\x29\x35\x7f\xad\xdd\x20\x40\
-\xce\x40\x60\x62\x2d\x6c\x95\xab\x57\x59\x1f\xff\x87\xbf\x03\xea\
-\x01\x27\x6b\xe4\x0e\xa9\xe9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x02\xb6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xd8\x07\x13\
-\x10\x02\x36\x23\x9f\x44\xe8\x00\x00\x02\x36\x49\x44\x41\x54\x58\
-\xc3\xe5\x57\x3d\x6f\xd3\x40\x18\x7e\xee\x6a\x13\x29\x60\x20\x42\
-\xb8\x8d\xda\x14\x09\x09\x2c\xa4\x4a\x48\x08\xc4\xc2\x84\xc4\xc0\
-\xc4\xc2\x1f\x60\x46\x4c\x4c\x4c\xa8\x12\x42\xb0\xc0\x2f\xe0\xf7\
-\x20\x31\x31\xb0\x14\xf1\x35\x90\x96\x34\x6d\x21\x29\xcd\xc7\xd9\
-\x7e\x5f\x06\x37\xca\xc5\x39\x17\x3b\xbe\xa8\x43\x6f\xb0\xcf\x96\
-\xec\xe7\xe3\x7d\xde\x3b\x5b\x30\x33\x8e\x73\x48\x1c\xf3\x70\xf4\
-\x0b\x71\xfd\x51\x50\x5b\x5a\x7d\xeb\x2f\xaf\xdc\x04\x73\x64\x13\
-\x48\xc8\x05\x67\xb7\xb5\xb5\xd1\xfe\xf9\xfd\x29\x7f\x7c\xf7\xc1\
-\x48\xe0\x74\xcd\x7f\xf1\xfa\xf9\xe3\xfb\x0f\x6e\xf9\x50\x21\x90\
-\xbb\x38\x22\x39\x31\x25\xf3\x51\x55\xe9\xf0\xc0\x00\x4e\xb9\xc0\
-\xfb\xaf\xbd\x8b\x4f\x9e\xbd\x79\x05\xe0\xae\x91\xc0\x79\x7f\x31\
-\xb8\x13\xf8\xf0\x5d\x00\xae\x3d\xf5\x7c\xc8\xf1\xf6\xe5\x2a\xea\
-\x2b\xab\x8d\xcc\x12\x30\x71\xac\x62\x1e\x4b\xca\x0b\xc0\x09\x08\
-\x69\xca\x99\xb4\x39\x03\x15\x07\x18\x28\x80\x88\xc8\x6a\x08\x47\
-\xe0\xac\xa9\x1d\x81\x33\xb4\x72\xf0\x78\x9e\xe9\xc0\xac\xe0\x64\
-\x00\x21\x00\x55\x77\xec\xe4\x20\x62\x63\xa6\x64\x69\x70\x18\xd4\
-\xc2\xac\x56\x88\xe9\xe2\x66\x3a\x20\x84\xd0\xc0\x38\x97\x72\xd6\
-\x88\xb0\x81\xb0\x8a\x80\x61\x5c\xd2\x81\xa3\x94\x4f\x80\xa7\x18\
-\xa8\x18\xf8\xf6\x07\x68\x76\x67\xc8\x80\xee\x46\x4c\xfc\x7f\xe5\
-\x0c\x44\x29\x02\x21\x59\x0a\xe1\x51\xca\x47\x17\xc3\x18\x50\x34\
-\xbd\x16\xd8\xe9\x02\x9e\x56\xae\xa7\x7d\xe7\x80\x8d\x6a\x89\xc6\
-\x99\x29\x97\x81\x94\x72\x32\x58\x4d\x00\xe2\xd4\xfd\xc5\x33\x02\
-\x0f\x03\x51\xde\x01\xe6\xa4\x9d\x58\x00\x14\x03\x6e\xea\x0d\x75\
-\x4f\xe4\xd9\x36\x66\x27\x50\x71\x26\xdb\xb3\xec\xd7\x84\x63\xb2\
-\x38\xef\x88\x00\x84\xb6\x3f\x48\x8a\x6c\x43\x61\x46\xb2\x4b\x11\
-\x20\x2e\x96\x07\x62\x8b\x25\x10\x00\x6e\x2c\xc9\x42\x6b\x02\xd9\
-\x2c\xc1\x6e\xbf\xe0\xa2\xc4\x49\x7f\x5b\x23\x30\x8c\x8a\x13\xb0\
-\xda\x05\xa2\x60\x17\xd4\x1c\x01\xd8\xee\x82\x13\xf7\x5f\x20\x67\
-\x5d\x03\xe6\xe3\x80\x94\x0b\xf3\x06\x14\x52\xca\x4c\x02\xf1\x7e\
-\xfb\xc7\xbc\x09\x0c\x7e\xff\xda\xce\xde\x0b\xfe\x6e\xae\xbb\xf7\
-\x5e\xfa\xb5\x4b\x6b\x57\x7a\xad\xcf\x91\x74\x2a\xa8\x5e\x68\x20\
-\xec\x75\xd0\xdf\x6b\xc2\xab\x5f\x05\xa4\xc4\xb0\xd3\x82\xea\x75\
-\xe0\xd5\x83\xe4\xb1\xad\x0d\xb8\xd5\x73\xa8\x9c\xf5\x01\x08\xa8\
-\x83\x3d\xa8\x6e\x1b\xde\xf2\x35\x0c\x3a\xdb\x50\xfb\x3b\xf0\x1a\
-\x6b\x4e\x77\xf3\x4b\xb3\xdf\xfc\xb4\x3e\xe1\xc8\x89\xff\x3b\xfe\
-\x07\x5d\x3e\x25\xc2\x5e\x8a\xcf\x86\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x14\x21\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
-\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x12\x34\
-\x49\x44\x41\x54\x68\xde\xbd\x9a\x69\x8c\x65\x47\x75\xc7\xff\xa7\
-\xea\xee\xef\xbe\xb5\xfb\xbd\x5e\x66\xba\xa7\x67\x1f\xcf\xe0\x0d\
-\xdb\x80\x50\x14\x08\x18\x8c\xb1\x1d\x93\x08\x88\x51\x04\x28\x9f\
-\x22\x21\x22\x81\x22\x12\x65\x43\x11\xf0\x25\x8a\x94\x40\x50\x40\
-\x91\xb2\x01\x01\x44\xb0\xc1\x01\x6c\x8f\xd7\xe0\x84\xc4\x1e\x63\
-\x33\xb6\xc7\x1e\x33\x3d\x63\xcf\x4c\x77\x4f\xf7\xeb\xfd\xdd\xb7\
-\xdc\xb5\xaa\x4e\x3e\xf4\x8c\x69\x06\xdb\xd3\x03\x84\xf7\x74\x74\
-\xee\xad\x5b\xb7\xde\xf9\xdd\x73\xaa\x4e\x55\xdd\x47\xf8\x05\x3f\
-\xf7\x3f\x74\x0f\x98\xf9\x35\xeb\x10\x11\x6e\xba\xf1\x96\x5f\xf4\
-\xa7\x5e\xb9\xed\xcb\xbd\xe1\x81\x87\xef\x85\x31\x06\x00\xe0\xba\
-\x2e\xba\xbd\xae\xb0\x2d\xdb\x23\xa2\x0a\x80\x10\x80\x7b\xbe\x6a\
-\x06\xa0\xcf\xcc\x5d\xa5\x54\x5a\x0e\xcb\x26\xcd\xd2\x97\xdb\xb9\
-\xf9\x9d\xb7\xfd\xea\x01\x0e\x3f\x78\x0f\x00\x83\x34\xcd\x84\xb4\
-\x64\x43\x0a\x79\x50\x4a\x79\xad\x94\xf2\xa0\x94\xd6\xa4\x94\xa2\
-\x26\x48\xb8\x00\x60\x8c\xc9\xb4\xd6\x1d\x6d\xf4\x8c\xd6\xfa\xb8\
-\x31\xe6\xa8\xd6\xea\xb8\xd6\x66\x4d\x4a\x69\x88\x08\xb7\xbc\xeb\
-\xf6\x5f\x1d\xc0\xe1\x07\xbf\x07\x22\x21\xb4\x2e\xa6\x84\x90\x6f\
-\x73\x1d\xf7\x16\xdf\x0f\xae\x2b\x05\xa5\x61\xcf\xf7\x5d\xc7\x76\
-\x84\x94\x12\x44\x04\x80\x61\x8c\x81\x52\x1a\x79\x9e\x99\x24\x4d\
-\xb2\x38\x8e\x57\x92\x34\x7e\x2a\xcf\xf3\x7b\x94\x52\x8f\x48\x29\
-\xcf\x18\x63\xcc\xad\x37\xbf\xe7\xff\x17\xe0\xf0\x83\xdf\x83\x10\
-\x02\x5a\xeb\x06\x11\xbd\xcb\xf3\xbc\x0f\x55\x2b\xb5\x37\xd6\xaa\
-\xf5\x9a\xef\xfb\x60\x30\xb2\x3c\x43\x9a\xc4\x48\xb3\x0c\x4a\x29\
-\x00\x80\x65\x59\x70\x5d\x17\x9e\xeb\xc1\xb6\x6d\xb0\x61\xc4\x49\
-\x8c\x28\x8a\x3a\xdd\x6e\x74\x24\xcd\xb2\x2f\x33\x9b\xc3\x00\xd6\
-\xb4\xd6\x78\xcf\x6d\xef\xfd\xe5\x03\xdc\xf7\xc0\x77\x61\xb9\x0e\
-\x8a\x34\xdb\x63\xdb\xf6\x47\xaa\x95\xda\xef\xb4\x5a\x23\xe3\x41\
-\x10\x20\x4d\x13\xac\xae\xae\x60\x69\x79\x19\x6b\xeb\x1d\xd3\x1f\
-\x24\x2a\xcd\xb5\xd2\x1a\x06\x00\x2c\x49\xc2\x75\xa4\x55\x2e\xf9\
-\xd6\xd0\x50\x4d\x0c\x0f\x37\x51\xaf\xd5\x60\x49\x07\xfd\x7e\x0f\
-\xcb\x2b\xcb\xf3\xdd\x5e\xf4\x8d\xa2\x28\xbe\x90\xab\xe2\x94\x6d\
-\x59\xf8\xad\xdb\xde\xf7\xcb\x03\xb8\xff\xa1\x7b\x40\x44\x42\x29\
-\x75\xad\xe7\x79\x7f\xd1\x6a\x8e\xde\xd4\x6a\x8d\x78\x79\x91\x61\
-\x7e\x7e\x0e\x33\x33\x73\x3c\xbf\xd8\x89\xd7\x63\x8a\x06\x3a\x88\
-\x32\x94\xfa\x8a\xdd\xcc\x40\x6a\x00\x10\x50\xd2\x42\xe6\xba\x14\
-\x87\xa1\x15\x57\x1b\x25\xaa\x6e\x1b\xad\x07\x13\x13\xdb\xa9\x35\
-\xdc\x02\x03\x58\x5a\x5a\x4c\x57\x56\x96\xef\x4f\xb3\xf4\xd3\x52\
-\xca\xa3\xac\x94\xb9\xfd\xf6\xf7\xff\xe2\x00\x77\x7f\xf7\x4e\x04\
-\x41\x40\x4a\xa9\xeb\x3d\xcf\xff\xd4\xf6\xf1\xed\x37\x36\x1a\xc3\
-\xd6\x5a\x67\x05\xd3\x27\xa7\x71\x66\x66\x29\x6e\x77\xad\xc5\x1e\
-\x86\x17\x0b\x59\xef\x43\xba\x9a\x48\x30\x01\xc4\x00\x33\x33\x0c\
-\x83\x8d\x61\x30\x1b\x90\xc9\x2d\x0f\x51\xb9\x26\x56\x47\xc6\x6b\
-\x66\x64\xd7\x8e\xd1\x60\xe7\xd4\x4e\xf8\x9e\x8f\xe5\xe5\x65\xb5\
-\xd0\x9e\x7f\x28\xcd\xd2\x4f\x5a\xa0\x27\x07\x59\xca\x1f\x78\xff\
-\x07\xb7\x0c\x60\xbd\x52\xa1\x94\x12\x59\x96\xed\xf1\x3d\xff\x4f\
-\xc6\xc7\xb6\xdf\x38\x34\xd4\xb4\xe6\xdb\x73\x78\xfe\xf8\x71\xf3\
-\xd2\x5c\x6f\x65\x45\x8f\xcc\x14\xce\xc8\xba\xb4\x7d\x13\x48\x90\
-\x20\x08\x00\x64\x98\xc1\x0c\x18\xc3\xcc\xcc\x6c\x0c\xb1\x66\x62\
-\xad\xfd\x22\x65\x7f\x6d\x89\x1b\xdd\x41\x67\x65\xa5\x97\x2e\xec\
-\x88\xe3\x64\x78\xff\xbe\x7d\xa2\x35\x32\x62\x19\x36\x37\x9e\x9b\
-\x3f\x97\xa4\x69\xfa\xc7\x82\xc4\xc9\xcb\xf1\x80\xbc\xb8\xe0\x3f\
-\xbe\x77\x17\x98\xb9\x6a\xdb\xf6\x27\xc6\x46\xc7\x3f\x30\x3a\x32\
-\xea\xcc\xb7\xe7\xf0\xf4\x33\xcf\xe9\xe3\x67\xe3\x95\x99\x6c\x62\
-\x26\x95\x43\xa9\x10\xd2\x01\x6b\x57\x6b\xed\x28\xad\x1d\x30\x5b\
-\x8e\x25\xd9\x92\x82\x84\x20\x02\x43\x66\x85\x72\xb3\x5c\x39\x85\
-\x52\x4e\xa1\x94\x9d\x29\x96\x7d\xe5\x15\xeb\xa9\x3b\x48\xfb\x6b\
-\x36\x54\xd7\xaf\x55\x2b\x62\xa8\x31\x24\x94\x52\x3b\xe3\x78\x40\
-\x4a\xa9\xc7\xdf\xfb\xde\xdf\xce\xee\xba\xf3\xdb\x3f\xb7\x07\x24\
-\x11\xdd\x5c\xab\xd6\xee\x18\x69\x8d\x7a\x6b\xeb\xab\x38\x7e\xfc\
-\xc7\x7a\xfa\x5c\xb6\xf2\x52\x7f\x64\x50\x2a\xfb\x23\xbe\xad\x04\
-\x09\x45\x00\x81\x00\xe4\x85\xa1\xb5\x41\x91\x6d\x6b\xd5\xdb\x81\
-\xe7\xa6\x86\x99\xf2\xa2\x70\xd6\xa2\x68\xb4\xe2\x5b\xae\x6b\x4b\
-\x63\x36\x62\x0b\x00\x90\x15\x2e\xff\x78\xbd\x3e\x10\xa2\xcb\xae\
-\xf3\x62\xf3\xd0\xc1\x2b\xe4\xd8\xe8\x98\x37\x18\x0c\xee\x58\x2d\
-\x56\x8e\x18\x6d\xbe\x09\x40\x5f\x36\xc0\x5d\x77\x7f\x03\xcc\x3c\
-\xe9\xb9\xfe\x87\x47\x46\xc6\x46\x94\x56\x38\x75\xea\x24\x4e\x2f\
-\xf4\xd7\x96\xf4\xc4\xac\xe3\xdb\x23\xbf\xf9\xe6\xa9\x52\xb3\xe6\
-\x83\x68\xa3\x03\x11\x11\x96\x3a\x31\x7d\xe7\x7f\xce\x90\x10\x24\
-\x1d\x5b\x0a\xc3\x60\x21\x84\x2c\x79\xd2\xbf\xf5\xcd\x53\x6e\xb3\
-\x16\x80\x0d\x33\x63\x23\xc4\x96\xd6\x63\xdc\xf5\xdf\x2f\xc5\x73\
-\x89\x37\x5b\x99\x5f\x16\xd5\xca\x5c\x6b\xf7\xae\x3d\x18\x1d\x19\
-\x1d\xe9\xf5\xbb\x1f\x4e\x92\xe4\xc8\x97\xbf\xfa\x2f\xa7\x3f\xf4\
-\xbb\xbf\x77\x49\x00\xb1\xf9\x84\x88\x24\x80\x77\xd4\x6a\xb5\x37\
-\x85\x61\x48\xf3\x0b\x73\x38\x33\xb7\x94\xac\x9b\xb1\xb3\xe4\xd6\
-\x52\xcf\x95\x62\xa4\xee\xa3\x56\x92\xd0\x2a\x47\x92\xa6\x94\x64\
-\x29\x65\x59\x0e\x00\x70\x6c\x4b\x38\x8e\x25\x1c\x5b\x0a\xc7\x96\
-\x82\x40\xc8\xf3\x9c\xb2\x34\x43\x9a\x65\xc4\x46\xa3\x1e\x5a\xdc\
-\x08\x6d\xb6\xa5\x40\x8a\x30\x5e\x48\x86\xce\x9e\x99\x5b\x4c\x3a\
-\xd1\x3a\xea\xf5\x06\xd5\xaa\xf5\x37\x01\xf4\x0e\x6c\xd8\xb2\x75\
-\x0f\xfc\xf3\x97\xfe\x09\x5a\xab\xa6\xe7\x86\x37\x0d\x0d\x0d\xd7\
-\x92\x24\xc6\xdc\xb9\x79\x5e\x89\xdd\x45\xe3\x8e\x46\x3e\x23\x48\
-\x53\x22\x10\x61\xad\x9b\xe2\x9e\xc7\x67\xd0\x4b\x75\x6e\x49\xc1\
-\x85\x32\x30\xa0\xc2\x73\x2d\x6c\x78\x80\xd9\x73\x6d\x68\xa6\xfc\
-\xa1\x1f\xb5\x61\x49\xe2\x42\x19\x6a\x54\x1c\xfb\x3d\xbf\xb6\x9b\
-\x68\xa3\x19\x12\x52\xd0\x00\x43\x9d\x76\xb7\xbf\xd8\x6e\x2f\xee\
-\xa8\xd5\xea\x34\x3c\x34\x5c\x5b\x5d\x5d\xb9\x29\xcf\xb2\xef\x7c\
-\xfe\x0b\x9f\x6d\xff\xc1\x47\x3e\xb6\x35\x00\xad\x24\x98\xb1\x3f\
-\x08\x4a\xd7\x04\x41\x09\x8b\x4b\xf3\x58\x5e\xeb\x27\x03\x1a\x5d\
-\xf6\x7c\x1f\x79\x9e\x8b\x9c\x08\x44\x44\xca\x30\xba\xb1\x2a\x6a\
-\xb5\xea\x4a\xb9\xe4\x17\x00\x43\x0a\x61\x7c\xcf\x51\x82\x48\x68\
-\x03\xae\x94\x7c\xb5\x7b\x72\x74\x29\xcb\x15\x94\x61\xee\xf5\x53\
-\x3b\x8a\xd3\x51\xc3\x70\x84\x10\x20\x22\x58\x52\x10\x49\x47\xaf\
-\xab\xfa\xd2\xe2\x5a\xd4\x9a\x1c\xf4\x83\x4a\xa5\x8a\x20\x08\xae\
-\xe9\xf5\x7b\xfb\x0d\xa8\xbd\x65\x0f\x58\xb6\x92\x42\x78\xd7\x84\
-\x61\x38\x0e\x30\xd6\xd6\xd6\x10\xa5\xb2\xcb\x6e\x23\x76\x1d\x4b\
-\x68\xa3\x48\x08\x22\x29\x08\x96\x20\x72\x6c\x0b\x43\xd5\x52\x51\
-\xaf\x94\xf2\xf3\xb1\xcd\x86\x99\x98\x01\x61\x18\x52\x0a\xd8\xb6\
-\x2c\xb4\x61\x56\x9a\x8d\x14\x82\x7b\xbd\x02\x52\x08\x62\x29\x58\
-\x08\x01\x69\x09\x58\x96\xa4\x4c\x57\xfa\x6b\xfd\x28\x8a\xba\xdd\
-\x60\xdb\x78\x05\x61\x58\x1e\x5f\x5e\x59\xb9\x46\xc0\xfc\xe0\x52\
-\x9d\xf9\x65\x00\x22\xb8\x96\xb4\x0e\xfa\x7e\xe0\x16\x45\x8e\xa8\
-\xdb\xd7\x19\x97\xba\x96\xe3\x6b\x4b\x0a\x29\x85\x20\x65\x18\x4b\
-\x9d\x84\xd2\x34\x43\x61\x0c\x48\x9c\x1f\x32\x41\x60\x80\xc4\x06\
-\x07\x19\x03\x63\x0c\x03\xc4\x02\xc4\x86\xc1\x24\xa5\x20\xa5\x0d\
-\x96\x3a\x09\x8a\xa2\x20\xad\x37\xca\x2c\x4b\x90\x82\xab\x06\xda\
-\xef\x76\x7b\xfd\xd6\x76\x40\x96\x82\xd0\xb5\xa4\x75\x90\x88\x5c\
-\x00\xf1\x16\x01\xa8\x24\xa5\x35\xe9\x38\x0e\x65\x59\x8a\x38\xcd\
-\x95\x96\x43\xb1\x6d\xdb\x90\x52\x90\x6d\x4b\xce\x15\x17\x87\x9f\
-\x98\x11\xcc\x4c\x85\xa6\xc2\xb1\x25\x4b\x29\x80\x8d\x0c\x0c\x00\
-\x1b\x89\x8c\x58\x68\x01\x03\xc3\x44\xda\x10\x88\xc9\x71\x2c\xc4\
-\xa9\xc9\xef\x3d\x32\x03\x6d\x0c\x72\x8d\xdc\xb1\x2d\x30\x88\x93\
-\x82\x54\xcf\x38\xbd\x7e\x9c\x29\x6d\xb4\xf4\x3d\x8f\xa4\x94\x93\
-\x44\xa2\xb4\x65\x00\x00\x81\x10\xa2\x21\xa5\x44\x9c\x24\x28\x14\
-\x2b\x96\x41\x2e\x85\x24\x21\x88\x2a\xa1\xaf\x0e\xec\x1c\x5f\x02\
-\x20\xa4\x24\x72\x1d\x89\x30\xf0\x34\x09\x22\x02\x5d\x98\x94\x10\
-\x33\x40\xc4\x00\x43\x10\xb1\x39\x0f\x47\x61\xe0\x15\xbb\xa7\xc6\
-\xdb\xb9\x52\xd0\x8a\x39\x2c\x4c\xbe\x1e\x9b\xde\xe9\x76\xb7\x7f\
-\x6e\x25\x4d\xf7\x36\x52\x1c\x6c\xe9\x7d\xc6\x18\xd7\x76\x1c\x48\
-\x21\x1a\x00\x82\x2d\xf7\x01\x66\x76\x00\xf8\x04\x82\xd6\x1a\x86\
-\x89\x85\xb4\x0d\x09\x42\x52\x18\xc5\x05\x15\xa1\xe7\xaa\x92\x2f\
-\x2d\xc7\x96\xd2\x12\xb4\x11\x41\x62\x63\x44\xd9\x58\x07\x6c\x78\
-\x80\x04\x83\x0c\xa0\xc1\xc4\x20\x66\x30\xd9\x6c\x71\xe0\x8b\x34\
-\x8f\x8b\x7c\xa9\x9b\x25\x2f\x2e\xa4\x83\x33\x8b\x83\xb4\xd3\xcf\
-\x55\x96\x1b\xae\x58\x26\xc9\x15\x0a\x66\x86\x10\x02\x20\xf2\xcf\
-\xdb\xb4\x35\x00\x63\x98\x0c\x9b\x97\xb3\xa5\x10\x02\x24\x04\x56\
-\x7a\x2a\x39\xb9\x10\xf7\x93\x82\x75\xb5\xe4\x58\xa3\x75\xd7\x6d\
-\x55\x1d\xaf\x1e\xda\x6e\xc9\x93\xb6\x6b\x91\xb4\x2d\x12\x72\xc3\
-\x11\x44\x00\x83\x89\x35\xb3\xce\x34\x9b\x41\xc6\x45\x14\xab\x7c\
-\xb9\x9b\x27\xe7\x56\xf3\xe4\xdc\x5a\x9a\x2e\x47\x79\xde\x4f\x0a\
-\x63\x34\x93\x90\x12\xd2\x22\x48\x29\x20\x04\x93\x10\x17\x1e\x04\
-\x83\x8d\xb9\xe4\x7a\x65\x13\x80\xce\xb4\xd2\x89\x31\x06\x52\x4a\
-\xd8\x96\x10\x45\xa2\x70\x6c\x66\x10\xcd\xad\x66\xa9\x65\x09\xb9\
-\xd6\x4b\xe5\xcc\x32\x29\xd7\x96\x83\xd0\x77\xe2\x4a\x39\x50\x25\
-\xdf\x12\x25\x57\x4a\x5b\x0a\x21\x25\x11\x33\x38\x55\xac\x93\xcc\
-\xe8\x6e\xa2\xd5\x5a\xbf\xc8\x3b\xb1\x52\x83\xa4\x30\x45\x96\xb8\
-\xaa\x50\x36\x98\x6d\x57\x82\x15\x89\x44\x1b\x32\xc2\x00\x81\x2b\
-\x2c\xcf\x25\x29\x85\x84\xd6\x29\x94\x52\x89\xd6\x3a\xdb\x32\x80\
-\x52\x3a\x2e\x8a\x62\xad\x28\x72\xd8\x96\x0d\xcf\x91\x56\x9c\xc4\
-\x3c\xdf\x11\xa9\x81\x30\xc4\x3a\x70\x4d\x77\xf7\x78\xcd\x2d\x01\
-\x84\xe5\x28\x4a\xba\x79\x6b\x5a\xd8\x7e\x1f\xa4\x01\x10\x0c\xc0\
-\x86\x01\x65\xc0\x5a\x33\x2b\xcd\xac\xb4\x61\xa5\xc9\xc0\xe8\x60\
-\x48\x76\x0f\x8c\x34\xec\x40\x6b\x83\x85\x4e\x36\x58\x2f\xca\xd3\
-\x06\x56\x5f\x4a\x60\x28\x84\x5f\x0e\x1c\xdb\xb2\x6c\xe4\x59\x86\
-\xa2\x28\xd6\x94\xd6\xf1\xd6\x01\x8a\x7c\x90\xe7\xd9\x6c\x92\x24\
-\xa8\x37\x6a\x08\x7c\xc7\x62\x35\x70\xd2\x22\x30\x42\x5a\x6c\x58\
-\x51\x3d\x94\xa5\xf7\xbf\x65\x57\x99\x19\xf8\xc6\xa3\x2f\x89\x85\
-\x02\x82\x84\x64\x10\x01\x20\x80\x01\x26\x30\x6d\x28\x26\x30\x0b\
-\x10\x4b\x62\xb0\x26\x31\x5a\xb3\xc3\x3b\xde\xba\x2b\x34\xc6\xe0\
-\x4b\x0f\x9e\x42\xd4\x21\x21\x48\xc2\x21\x16\xdb\xaa\x5c\xad\x57\
-\x4a\x8e\x90\x12\x83\x78\x80\x2c\xcf\x66\x8b\xa2\x18\x6c\x19\x40\
-\x6b\x9d\x65\x59\xf6\x5c\xaf\xd7\x4d\x87\x86\x87\xbd\x4a\x39\x14\
-\x0d\x6f\xa5\xe6\x5b\x85\x3d\x30\x4e\x6a\x43\xb0\x25\xa5\x69\xd5\
-\x4b\xa6\x50\x1a\x52\x0a\xa3\x0b\xa9\x89\x2c\x43\xe7\x01\xcc\xc6\
-\x7a\x1e\x2c\x98\x19\x60\x00\x86\xc8\x40\x1a\x66\xa3\x24\x3b\x8e\
-\xc5\x63\x43\x21\x33\x1b\x38\xb6\x64\x12\x02\x60\xc9\x0d\xaf\x70\
-\x77\x36\xa9\xd9\xa8\x55\x2d\x63\x0c\xa2\x28\x4a\xb3\x2c\x7b\x4e\
-\xab\xe2\x92\x21\xf4\xf2\x64\x4e\x4a\xa9\xf3\xa2\x78\xa6\x13\x45\
-\xf3\x4a\x29\x54\x2a\x15\x4c\x0e\xc9\xe6\x54\x35\xab\x1b\x26\xd6\
-\x1b\x03\x0c\x33\x33\xb4\x31\xac\x35\x93\x2e\xd2\x40\x67\x83\x50\
-\x65\x83\xd0\x14\x69\xc0\x20\x62\x61\x19\x08\xcb\x10\x91\x10\x3a\
-\x0d\x85\x8a\x2b\x42\x0f\x2a\xc2\x64\x21\x33\x84\x01\x98\x41\x1b\
-\x5f\x21\x20\x84\xc0\x9e\xe1\xa2\xbe\x67\xd4\x6f\x56\x2a\x15\xc4\
-\x83\x18\xeb\x9d\xf5\xf9\x3c\xcf\x9f\x21\xcb\xbe\xe4\x94\xfa\x65\
-\x80\x8f\x7e\xe4\xe3\x30\xc6\x9c\x88\xa2\xe8\xe9\xa8\x13\x21\x0c\
-\xcb\x18\x1b\x2e\x85\xd7\x8e\x25\x53\xbe\x6d\x2c\x03\xc1\xbc\x91\
-\x71\xe1\x58\x16\x86\x2b\x8e\xbb\x3d\x18\xec\xdb\x66\xaf\x5d\xd9\
-\xa2\xe5\xab\xe4\x60\x7e\x2f\xeb\xdc\x65\x69\x31\x49\x8b\x05\x17\
-\x9e\x9f\x2e\xec\x9b\xb0\x57\xae\xde\xe5\xaf\x5f\xbd\xb3\x9c\x1c\
-\x68\x56\x1d\xd7\xb6\xe4\xf9\x79\x38\x40\x24\x10\xba\x6c\xbf\x61\
-\xa2\x98\x9a\x1c\xad\x87\xae\xeb\x63\x79\x65\x19\x9d\x4e\xe7\x69\
-\xad\xf5\x89\x3f\xfb\xa3\x3f\xbf\x94\xfd\x3f\xbd\x1e\x10\x24\x97\
-\x93\x24\x3e\xbc\xb0\x30\xff\x1b\x8d\xa1\x46\xbd\x39\x3c\x24\xae\
-\xdc\x76\x6e\xea\x64\xd4\x9f\x7d\x6a\xc1\x8f\x00\x00\x44\x68\xd5\
-\x03\x7c\xe8\xa6\x83\x42\x69\x53\x22\x21\xb0\xb4\x3e\xc0\x57\x1e\
-\x3e\xcd\x6d\x40\x08\x69\x31\x00\x70\x01\x31\x1c\xca\xd2\x07\xdf\
-\xbe\xab\xdc\xaa\x07\x60\xc3\xb0\x2d\xc1\xf5\xd0\x45\x7b\xbd\x0f\
-\x22\x02\x09\xc2\x0d\xdb\x92\xb1\xeb\x76\x7a\x53\xa3\xcd\x96\xc8\
-\xd2\x14\xb3\xb3\x33\xeb\x83\x78\x70\xd8\x12\x62\xf9\x92\xd6\x5f\
-\x0c\xa0\x59\x69\x18\x3c\xbc\xbc\xb2\xfc\xc4\xca\xf2\xca\x3b\x9b\
-\xcd\x61\x9a\x1c\x1d\x84\x6f\x19\x74\x5f\xb7\x1a\x8b\xe7\x0b\xcd\
-\x68\xaf\xc5\x50\x9a\x69\x83\x85\x40\xcc\x50\x9a\xc1\x04\x08\x69\
-\x41\x5a\x16\x40\x80\xc9\x2d\xc0\x10\x94\x66\x28\x6d\x60\x0c\x23\
-\xd7\x9a\x06\x69\x8e\xc5\xb5\x01\x72\xc5\xd8\x5d\xcf\x6b\x37\xee\
-\x2d\x0e\xed\x9b\xdc\x16\x7a\x9e\x8f\xe9\x93\xd3\xdc\x5e\x6c\x3f\
-\xa1\x95\x7e\xd8\x18\xde\xd2\x8a\xec\x67\x12\xc5\xdf\x7f\xf1\x73\
-\x92\x19\xef\x1b\x1d\x1d\xfb\xec\xd5\x57\x5d\x3d\x42\x12\x98\x99\
-\x9d\xd3\x4f\xbc\x94\xce\x3c\x32\x6d\x75\x2d\xdb\xb3\x1d\xeb\xe5\
-\xf4\x0b\x12\x84\x42\x19\x5a\x4b\xd0\x37\x8d\xdd\x27\x84\x5f\xeb\
-\x83\x00\x13\x77\x42\xb1\xf6\xe2\xfe\x86\x4f\xa1\x6d\x11\xb3\xe1\
-\x8d\xe4\xc4\x8c\x2c\xd7\xcc\x26\x2f\x6e\xbe\x52\x56\xde\x76\x65\
-\x73\x72\x6a\x62\x52\xae\xae\xae\xe2\xb1\x23\x8f\x2d\xce\xcd\xcd\
-\x7e\x8c\x88\xbf\xf9\x89\x3f\xfc\xd3\x2d\x01\xfc\xcc\xaa\xe7\x96\
-\x5b\x6f\xe6\xa2\xc8\x67\xf3\x3c\x1b\x66\xe6\x6b\x5a\xad\x11\x2b\
-\x08\x7c\x51\xb6\xb2\x72\xc9\xd6\xd9\xc9\x6e\x65\xfa\x74\x5c\x3b\
-\xb3\x6e\xca\x0b\x11\xca\x0b\x5d\x54\x16\x06\xb2\xbe\x40\x61\x6b\
-\xd9\xf2\xc3\x54\x5a\x36\x84\x10\x44\xd2\xd6\xc6\x2e\xaf\x77\x11\
-\xb6\xd7\x55\xb8\xb0\xae\x4a\x0b\xab\x45\xb0\xb0\x9a\xfb\x0b\xd5\
-\x00\xc9\xad\x07\xf5\xc4\xaf\x5f\xd1\x98\xd8\x39\x39\x61\x25\x49\
-\x82\x67\x8f\x3d\x13\xcf\xce\xcc\xfc\xb3\x36\xfa\x1f\xa7\xa7\x4f\
-\xa6\x53\x3b\xa7\xf0\xc2\xf1\x1f\x5f\x3e\xc0\xbd\xf7\x1c\xc6\xad\
-\xb7\xdd\x92\x15\x45\x71\x3a\x8e\xe3\x29\x22\xb1\x67\xa4\x35\x22\
-\x4b\x81\x27\xaa\x5e\x51\x19\xf5\xe3\x80\x2c\x7b\xd0\xe1\x6a\x47\
-\xcb\x30\x95\xae\x9f\x4b\xd7\xcf\xa5\xe3\x15\xc2\xb2\x21\x5e\xde\
-\x1f\x25\x66\x61\x17\x90\x4e\x0e\xe9\xe4\x46\xd8\x79\xc9\x25\xbe\
-\x7e\xac\x3f\x72\xeb\xfe\xc1\xeb\xde\xb4\xaf\x31\x31\xb9\x6d\xbb\
-\x95\xe7\x05\x7e\x74\xf4\x47\x78\xf2\xa9\x27\x4f\xbf\x70\xe2\xc4\
-\xd7\x8f\x1d\x3b\xd6\x1e\x0c\x62\xad\x94\x52\xaf\xbb\xf2\x10\x5e\
-\x7f\xdd\xb5\x38\xf6\xec\x73\x5b\x07\x00\x80\xfb\xee\x3d\x8c\x5b\
-\x6e\xb9\x75\x2d\xcd\x92\x17\x7b\xfd\xde\x2e\x02\x76\x36\x9b\x4d\
-\xaa\x94\x43\x51\xf3\x75\x65\xdc\xef\x8d\x8c\xb8\xfd\x12\xc0\x2a\
-\x35\x76\xa1\xd8\x62\x43\x92\x81\x8d\xf4\x65\x36\xf6\x86\x60\xb4\
-\x01\xb1\x16\x25\x91\x3a\xfb\xcb\xeb\xad\xb7\x6f\x5b\x3a\xf4\xd6\
-\xa9\xfc\xca\xab\x76\xb5\x9a\x63\x23\xa3\x22\x4b\x33\x1c\x7d\xfa\
-\x28\x9e\x7c\xea\x49\xb4\xdb\x6d\x2f\x49\xd3\x6b\x3c\xdf\x7f\x9b\
-\x6d\x59\x37\x08\x21\x60\x8c\x39\x63\x8c\xd1\xaf\xe5\x89\x57\x9d\
-\x2c\x7d\xee\xf3\x7f\x8b\x34\xcd\x49\x08\xbe\x26\x08\x82\x4f\xee\
-\xd8\xb1\xe3\x5d\xfb\xf6\xee\xf3\x82\x52\x09\x71\xd2\x47\x27\xea\
-\x9a\x95\x28\x1b\x2c\xf4\xad\xa5\x73\x71\xb0\xb4\x94\x05\x51\x5f\
-\x7b\x49\xc1\x52\x03\x04\x9b\x0a\x59\x96\x99\xdf\xf2\xe2\xea\xb6\
-\x52\xda\xda\x5e\xe5\xd6\x78\x23\x2c\x35\x87\x86\x85\xeb\x7a\x58\
-\x5d\x5d\xc5\xf1\x17\x9e\x8f\x7f\xf8\xe4\x93\x33\x67\x67\x67\x77\
-\x5c\x71\x60\xbf\x5f\x2e\x97\x61\xdb\x16\xe2\x24\x31\x27\x4f\x4c\
-\x9f\x5a\x58\x68\x7f\x8a\x99\xef\x24\xa2\xec\x5b\x77\xde\x7d\x79\
-\x00\x00\xf0\x37\x9f\xfd\x6b\x50\x41\x28\x44\xb1\xdf\xb1\x9d\xdf\
-\x6f\x36\x9b\x77\xec\xde\xb5\x67\x6c\x6c\x6c\x14\x96\x6d\x21\xcd\
-\x52\x24\x71\x8c\x38\xcd\x75\x9c\xe9\x3c\x55\x9c\x2b\x03\x05\x00\
-\xb6\x20\xcb\x77\x84\x53\xf6\x6d\x27\x2c\x05\x32\x2c\x85\x70\x5d\
-\x0f\x69\x92\x62\x66\x76\x06\x27\x4f\x4e\x2f\x2c\x2d\x2f\x7d\xed\
-\xc8\x13\x4f\x1d\x89\xba\xbd\xcf\xbc\xf1\x86\xd7\xef\x1b\x1a\x1a\
-\x42\xa3\xd1\x40\x63\xa8\x8e\xd5\xd5\x55\x1c\x39\xf2\xc4\x89\xf6\
-\x42\xfb\xd3\xc6\x98\xbb\x98\x39\x0d\x02\x0b\x5f\xfb\xb7\x6f\x5d\
-\x3a\x84\x2e\x7c\xee\x3f\xfc\x20\x6e\xb9\xf5\x66\x64\x45\xb1\xaa\
-\x95\xfa\x61\xb7\xd7\x7b\x71\x65\x65\xa5\x12\x45\x9d\x61\x30\xbc\
-\x52\x10\xa2\x52\xae\xa0\x5a\xa9\x88\x46\xb5\x6c\x37\x6b\x25\x6f\
-\xb4\x11\x06\x63\x8d\x72\x30\x3a\x54\xf5\x9a\x43\x75\xbb\x5a\xa9\
-\x0a\xd7\xf5\x90\xa6\x29\x66\xce\x9e\xc5\x73\xcf\x1f\x8b\xa6\x4f\
-\x9e\xf8\xc1\xd2\xf2\xd2\x5f\x15\x45\xf1\xaf\xf7\x3d\xf0\x9f\x73\
-\xbe\xe7\xdd\x58\xaf\x57\x77\x09\x21\xd0\xed\xf6\x30\xe8\x0f\x30\
-\x32\xd2\x42\xb3\x39\x3c\x1c\x75\xa2\x43\xfd\x7e\x7f\x59\x29\x75\
-\x82\x59\xfc\x4c\x38\x5d\x72\xef\xe5\xbe\xc3\xf7\xe3\xa1\x07\x1e\
-\xc2\xea\xda\x52\xf2\xf4\xd1\xa7\x8f\x0b\x29\x1e\x8d\xa2\xe8\xc5\
-\xc5\xc5\x45\xbd\xb4\xb8\xe8\x75\x3a\x91\x93\x24\xa9\xa3\x8a\x02\
-\x5a\x1b\x68\x6d\xa0\x0a\x8d\x24\x49\xd1\x89\x22\x2c\xb4\x17\x70\
-\xea\xd4\xc9\xf8\xf8\x0b\xc7\xcf\x4d\x9f\x9c\x7e\x74\x7e\x7e\xfe\
-\x8b\xed\x85\xf6\xdf\x7d\xfd\x6b\xff\xfe\xf8\x5d\x77\x7e\x3b\x71\
-\xfd\x00\x41\x29\xb8\x3e\x0c\xc3\xeb\x4a\xbe\x47\x4b\x4b\x8b\xe8\
-\xf5\xfa\x28\x0a\x8d\xf1\xf1\x71\xb4\x5a\xcd\xe1\x28\x8a\xae\x8a\
-\xe3\x78\x99\x99\xa7\x0f\x1e\xba\xe2\xa7\x20\xb6\xfa\x86\xe6\xa7\
-\xea\xdd\x74\xd3\x3b\xe4\xf5\x37\x5c\xd7\xb4\x1d\xfb\x90\x6d\xdb\
-\x57\x3b\x8e\x73\xc0\x75\xdd\xed\xb6\xed\xd4\x2c\x29\x3d\x00\x50\
-\x5a\x65\x79\x96\x47\x69\x96\x9e\x8b\xe3\x78\x7a\x30\x18\x1c\x9b\
-\x9b\x3b\xf7\xc2\x43\x0f\x3e\xb2\xba\xb2\xbc\xa2\x2f\xb4\xe9\xb8\
-\x2e\xef\x39\x70\xc5\xbb\x5b\xad\xd6\x67\x0e\xec\xdf\xbd\x37\xf0\
-\x1c\x74\xbb\x5d\x94\x4a\x65\x4c\x4c\x6c\xc7\x9e\xbd\xbb\xd1\xeb\
-\xf5\xf0\xf8\x63\x8f\x9f\x68\xb7\x17\x3f\x63\x8c\xb9\x93\x99\xd3\
-\x72\xb9\x8c\xaf\x7c\xe9\xab\x5b\x02\xa0\x4d\x7a\xb3\x30\x00\x4c\
-\xed\x9c\x72\x6e\x78\xc3\x75\xa5\x52\x10\x54\xa4\x65\x95\xa4\x14\
-\xae\x31\x4c\x59\x96\x15\xf1\x60\x90\x2c\x2e\x2d\x0f\x8e\x3d\xfb\
-\x5c\x12\x75\x22\x8d\x8d\xb9\x97\xb8\xf8\x81\x84\x95\x8a\xb7\x7d\
-\xc7\xce\xdb\x47\x47\x5b\x1f\x3f\x78\x60\xef\x4e\xcf\x75\x10\x45\
-\x11\xc2\x30\xc4\xc4\xc4\x04\xf6\xed\xdf\x8b\x28\x8a\xf0\xf8\x63\
-\x8f\x9f\x98\x9f\x5f\xf8\xb4\x52\xea\x9b\xb6\x6d\xe7\xdf\xba\xf3\
-\xee\x4b\x02\xbc\x9a\xf1\xe2\x22\x8d\xd7\xb8\xbe\x59\x5e\xad\x0e\
-\x5c\xdf\xf7\x27\x76\x4c\xbd\x7b\xfb\xf6\x6d\x1f\x3d\x78\xc5\xbe\
-\x1d\xbe\xe7\xa0\xd3\x89\x50\x2a\x6d\x40\xec\x3f\xf0\x32\xc4\xa9\
-\xf9\xf9\xf6\x5f\x12\xe1\x2e\x00\xe9\xa5\xfa\xc0\x66\xe3\xc4\x6b\
-\x68\x71\xbe\x3f\x49\x6c\xcc\xaf\x36\x6b\xb9\xe9\xfa\xe6\x7a\x17\
-\xea\xd8\x00\x1c\xad\x94\xec\xf7\x7a\xf3\x10\xb2\x9b\x17\x6a\x57\
-\xbd\x56\xaf\x95\xc3\x12\x7a\xbd\x2e\x92\x24\x85\x52\x0a\xe3\xe3\
-\xe3\x68\xb6\x9a\x8d\xf5\x4e\xe7\x50\x3c\x18\x9c\x05\x70\xea\x72\
-\x00\x5e\xc9\x78\xc2\xa5\xe1\x36\x43\xbe\x9a\x87\x2c\x00\xb6\xd6\
-\x9a\x06\xbd\xee\x2c\x0b\xd9\xc9\xf3\x62\x77\xa3\xd1\xa8\x96\xcb\
-\x25\x74\xbb\x3f\x81\x98\xdc\x31\x09\xdb\xb1\x86\x17\xe6\xe7\xfb\
-\x49\x92\x7e\xff\x72\x01\x70\xd1\xf9\x2b\x5d\xa7\x57\xb9\xff\x82\
-\xe6\xf3\xf2\x4a\x6d\x09\xad\xb5\xee\xf7\xba\x67\x20\xe4\x72\x5e\
-\x14\x7b\xeb\x8d\x5a\xad\x1c\x86\xe8\x76\xbb\x00\x80\x46\xa3\x8e\
-\xf5\xf5\x8e\x9a\x9d\x99\xfd\x7e\x14\x45\x97\x05\xf0\x4a\xe5\x9b\
-\x8f\xf9\x22\x0d\x60\xe3\x8d\xe5\x26\xa3\xcd\x26\x7d\x41\xf4\xa6\
-\x72\x06\x00\xa3\xb5\x1a\xf4\xfb\xa7\x49\xca\xf5\x3c\x57\x7b\xea\
-\xf5\x5a\xad\xd1\xa8\xa3\x5a\xab\x22\xea\x76\xf1\xec\x33\xc7\x8e\
-\xb5\x17\x17\xff\xe1\xd1\x47\x1e\x3d\xbd\x95\x3d\xf8\xcd\xc6\xf2\
-\x45\x06\x6d\x96\x8b\x0d\xbd\x60\xd8\x85\x63\x0d\x40\x5d\x24\xc5\
-\xa6\x63\xbd\x49\x58\x6b\xa5\xfb\xbd\xfe\x59\x08\xd1\xcb\xf2\x62\
-\x8f\xe7\xba\x95\x6e\xaf\x67\x5e\x78\xe1\xc4\x8b\x67\xce\x9c\xf9\
-\xe2\x33\x47\x9f\xf9\xdf\x2c\xcb\x7f\xbe\x3c\x80\x57\x0f\x9d\xd7\
-\x0a\xa3\xd7\x6a\xfb\x42\xe7\xb6\x37\x89\x05\xc0\x76\x3c\xaf\xb4\
-\x7d\x72\xc7\x5b\x2a\xd5\xea\x5b\x08\xbc\xde\xed\x74\xfe\x6b\xf6\
-\xec\xd9\xa3\x79\x9e\xf7\x00\xa4\x97\xfb\x67\x8f\x0b\x31\xbc\x95\
-\x90\xba\xdc\x76\x37\x8f\x66\x16\x7e\x32\x42\xd9\x52\x4a\xd7\xf3\
-\xfd\x50\x15\x85\xc9\xb2\xec\x82\xd7\xb2\x9f\x07\xe0\xb5\x0c\xf8\
-\x65\xb4\xb1\x79\x94\xba\x30\xec\x5e\x80\xb9\x70\x7e\xe1\x21\x16\
-\x00\x8a\xff\x03\x34\x60\x05\x5e\xc6\x0b\x52\x9c\x00\x00\x00\x25\
-\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\
-\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\
-\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\xca\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
-\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\
-\x36\x3a\x31\x38\x2d\x30\x37\x3a\x30\x30\x67\xec\x3d\x41\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
-\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\
-\x31\x31\x3a\x34\x31\x2d\x30\x37\x3a\x30\x30\x35\x62\x5d\x05\x00\
-\x00\x00\x34\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\
-\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\
-\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\
-\x65\x73\x2f\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\x6a\x06\xa8\x00\
-\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\
-\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\
-\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\xdd\x31\x7c\xfe\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\
-\x67\x9b\xee\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\x74\x53\x6f\x75\
-\x72\x63\x65\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\x6f\x6e\x20\x54\
-\x68\x65\x6d\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\x74\x45\x58\x74\
-\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\
-\x2f\x2f\x61\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\x6f\x72\x67\x2f\
-\x32\xe4\x91\x79\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x10\xe5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0a\x61\x00\x00\
-\x0a\x61\x01\xfc\xcc\x4a\x25\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x0e\xe7\
-\x49\x44\x41\x54\x68\xde\xed\x9a\x6b\x90\x5d\x55\x95\xc7\x7f\xfb\
-\x71\xce\xbd\xe7\xdc\xdb\xb7\x3b\xdd\x9d\x90\x74\xa0\x09\x2f\x0d\
-\x82\x56\x90\x97\x52\x8c\x58\x0a\xc5\xa4\x8a\x42\x60\x54\x90\xb2\
-\x9c\x94\x02\x2a\xe0\x0b\x10\x07\x9c\x1a\x47\x1e\x23\x50\x28\x01\
-\x81\x91\xf0\x18\x29\x40\xb0\xd0\x11\x70\x24\x08\x54\x80\xd1\xe1\
-\x11\x03\x81\xe8\x20\x01\x92\xce\xd3\x74\x42\x77\xfa\x71\xfb\x9e\
-\x7b\xef\x79\xec\x3d\x1f\xce\xb9\x27\xdd\x9d\xdb\x1d\xc5\x0f\x33\
-\x1f\xe6\x54\xef\xba\x8f\x3e\xfb\xec\xff\x7f\xad\xff\x5a\x6b\xaf\
-\xdd\x0d\xff\x7f\xfd\x1f\xbc\xac\xb5\x58\x6b\xcb\xd6\x5a\xf9\xbf\
-\x8d\x65\x5f\x97\x98\x81\x80\x5a\x71\xc7\x8a\xc7\xde\x5c\xbf\x7e\
-\x69\x14\x47\x02\x04\x22\xbb\xb3\x7f\xd1\xc1\x1c\xfd\xe1\x8f\xe0\
-\x17\x5c\x94\x4c\xf9\x09\x21\xd2\x81\x00\x91\xde\x2b\x84\x44\x0a\
-\x81\x90\x22\x7d\x2f\x65\x7a\x8f\x14\xd8\x74\x11\xc0\x66\x3f\xa6\
-\xb5\x70\xfe\x1d\xd6\x10\x1b\xcb\x44\xbd\xc9\xf3\xcf\x3e\xc5\x96\
-\x4d\x9b\xb0\xe9\x4c\xac\x05\xad\xb5\x39\xf2\xc8\x23\x1e\xd5\x6d\
-\x59\x09\x91\x7c\xf9\x8b\x5f\x3a\xb5\x5a\xad\x8a\xb1\xf1\x31\x94\
-\x54\xcc\x9f\xbf\x00\x80\x72\xb9\xcc\xc2\xfe\x45\x74\x78\xc5\x9c\
-\xc0\xac\xd6\x11\x02\xd2\x9f\xcc\x5a\x02\x33\xfc\x0e\xc3\x2b\x6e\
-\xa7\x70\xf0\xc1\xf8\x4b\x8e\xa6\x78\xc4\x11\x20\x04\x32\x9b\x94\
-\x1a\x03\xe2\x24\x61\xb4\xd6\xa0\x5c\x2a\xd3\x68\x34\xa7\x3c\x3b\
-\x6c\x86\xf2\x8d\x3f\xbe\xf1\x09\x3d\xd3\xe2\xd6\x1a\x35\x5e\xad\
-\x12\x86\x11\x51\x1c\x30\x9f\xfd\xa6\x00\x93\x52\xec\x93\x40\x8e\
-\x7f\xb2\x9f\x93\x98\xd1\x3b\x6f\xc7\x6e\xdd\xcc\xd8\xab\xaf\x30\
-\xf1\xe4\x13\x54\x3e\xfa\x31\x3a\xcf\x38\x0b\xd9\xdb\x3b\x65\x8e\
-\x30\x93\x27\x9a\xbd\x9e\x6d\x8c\x91\x33\x12\x30\x06\x5c\xd7\x65\
-\xfe\x82\xf9\x04\x13\x35\x4c\x6b\xbe\xb5\x08\x01\x52\x08\x5e\x7d\
-\xfb\x4f\xfb\x24\x30\xcd\x2c\x14\xd6\x7d\x93\x79\x83\x96\x28\x30\
-\x38\xe5\x32\x8d\x17\x5e\x60\xd3\xe3\x8f\x53\x5a\xf9\x38\xe3\xe7\
-\x5f\x82\x3a\xf8\x90\xdc\x5b\x4b\x0e\x5b\x80\x14\x02\x8b\xdd\xb3\
-\xfe\x64\x8c\xd6\xa2\x67\x5e\xcc\x10\xc7\x31\x7f\xda\xb6\x9d\x38\
-\x49\xe8\xf7\xbd\x29\x56\x55\x12\x8e\x5b\xbc\x70\x1f\xe6\x4f\x6f\
-\x6e\xd9\x71\xfb\xea\x2b\xe9\xed\x5b\x45\xe1\xd3\x0b\x18\xf8\xf1\
-\x5c\x2a\x03\x75\x8a\xa5\x12\xfe\xb1\xc7\xb2\xe3\x91\x47\xe8\x18\
-\xdc\xc1\xe2\x87\x7f\x4e\xb1\xbf\x3f\x95\x49\x12\xa7\xcf\xb0\xed\
-\x3d\x80\x35\xcc\xa8\x01\x63\x2c\xbd\x3d\x3d\xcc\x9f\x3f\x9f\xfd\
-\x17\x2e\xc4\x18\x8b\x31\x16\x6b\x2d\x42\x88\x4c\x42\xe9\x6b\xbb\
-\xa1\xf2\x91\x92\x1d\x59\xbf\x82\xee\xda\x8f\x28\x77\x74\xd3\x94\
-\x3b\xb9\x3f\xda\xc8\xa6\x89\x09\x1a\x41\xc0\xc4\xd3\x4f\x33\xef\
-\x9c\x73\x18\x7d\xf9\x65\xde\xfa\xfc\x32\x84\xb0\x48\xb9\x27\xc3\
-\xa4\x1e\x68\x3f\x66\x24\x90\xa5\xd2\xbd\x46\xcb\xb0\x2d\x80\x7a\
-\x86\xa1\x54\x36\xa4\x60\x7c\xdb\x4a\x9c\x6d\x57\x50\xee\xec\xa5\
-\x1e\x8c\x73\xe3\x43\x92\x9f\xaf\x2b\x70\xc1\xf8\x38\xaf\x05\x01\
-\x61\x10\x30\xf2\xd0\x43\x34\x7d\x9f\xe1\x67\x9f\x65\xf8\xf1\x95\
-\x24\xc6\x92\x18\x72\xa3\xcd\x34\x66\x21\x60\xda\x0e\xb0\x99\x95\
-\x41\x6a\x81\x54\x6d\x3c\xa0\xf6\x7c\x5f\x7b\x67\x2d\xcd\x3f\x7c\
-\x9e\xce\xae\x6e\xa2\xb0\xc1\x03\x4f\xc6\x3c\xfc\x9b\x4e\xc2\x30\
-\x64\xc7\xc4\x04\xe7\x8d\x8f\xb3\x5a\x0a\x02\xa5\xd8\x11\x45\xec\
-\xaa\x54\xa8\x6d\x78\x3b\x23\x60\x30\xd6\x62\x8d\x6d\x8b\xc5\x18\
-\xc3\xac\x41\x3c\xa3\x67\x26\x49\x9c\x69\x59\xc6\x4e\xba\xb7\x36\
-\xba\x85\xea\xcb\x9f\xa4\xb7\xdb\x27\x49\x62\x56\xfd\x2e\xe4\x96\
-\x47\x7a\x48\x92\x84\x5a\xad\x46\xad\x56\x23\x4a\x62\xf8\xaa\x47\
-\xb4\x3e\x21\x7e\x22\x24\x90\x12\x7d\xec\x71\xc4\x89\x21\x49\x0c\
-\x58\x8b\xb1\xed\x83\xd8\xee\x2b\x88\xdb\x13\x00\x6b\xd2\x87\x3f\
-\xf6\xbb\xf5\xd8\x29\x90\x27\xdd\x17\x4d\x70\xf8\xe8\x32\x0e\xec\
-\x31\x08\x24\xaf\xbe\xd9\xe4\x3b\xf7\xcf\x25\x4e\x22\x82\x20\x20\
-\x08\x02\xc2\x30\xe4\xb2\x73\x5d\x3e\xf6\xc1\x88\xe2\x87\x24\xde\
-\x3c\x9f\x0d\x47\x7c\x9f\xdf\xd4\x7d\xf4\x4b\x6f\xf2\xd1\x25\x8b\
-\x52\x09\xcd\x80\xc7\x18\xfb\xee\x3c\x60\x2c\xc4\x89\xe5\x94\xa3\
-\x0f\xc9\xbd\x30\x65\x6e\x1c\x32\xb2\xfa\x4c\xe6\x74\x07\x28\xa7\
-\xc4\x86\xcd\x23\x5c\x7e\xd7\x5c\x26\x6a\x4d\x1a\x8d\x06\xb5\x5a\
-\x8d\x7a\xbd\xce\x39\x27\x6b\xfe\xfe\x54\x43\xc1\x55\xf8\x9e\xc3\
-\xc2\xaf\xde\xc4\xfe\xdd\xa7\x52\xa9\x54\xd0\x8e\x4b\x9c\x24\x18\
-\x52\xad\xb7\xc7\x33\x8b\x84\x52\xbd\xb7\x23\x96\xea\x32\x36\x06\
-\x91\xb4\xdb\x89\x58\x86\xd7\x5c\xcc\x5c\x35\x80\xeb\xf7\x32\xb8\
-\x63\x90\xcb\xef\xea\x61\xe7\x70\x48\x14\x45\x39\xf8\x93\x96\x48\
-\xae\xfc\xac\xa0\xe0\x0a\x7c\x4f\x31\xd1\x7b\x29\x4d\xff\x24\x3c\
-\x21\x49\x0c\x88\xc4\x90\x24\x29\x70\x63\x4c\x5b\x3c\xb3\x7a\xa0\
-\x95\x71\xf6\x9a\x64\xd3\xf4\x95\x24\x16\xd1\xc6\xad\x23\xaf\xdf\
-\xc0\x5c\xfb\x5b\x8a\x95\x05\x8c\x0e\x6f\xe7\xda\x07\x7b\x79\x73\
-\x73\x8d\x38\x8e\x73\xdd\x2f\xee\x87\x1b\x2f\x52\x14\x0a\xe0\x7b\
-\x9a\x89\xca\x67\x18\xf3\x3f\x89\x27\x24\x42\xaa\xd4\xc3\xc6\x10\
-\x1b\x93\x4a\xc8\xd8\xb6\x78\xf6\x21\xa1\x19\x08\x18\x93\x49\x68\
-\x6f\xf0\xc1\x96\x9f\xd2\x53\xff\x09\x7e\xcf\x7b\x08\xc6\x07\x59\
-\xf1\xeb\x45\x3c\xb3\x66\x2b\xd6\x5a\xea\xf5\x3a\x41\x10\x30\xb7\
-\x2b\xe1\xd6\x4b\x14\x1d\x3e\x94\x3c\x4d\xdd\x3f\x89\x9d\xc5\x2f\
-\x52\x94\x0a\xa4\x02\x21\x31\x16\x4c\x16\xc4\x86\x2c\x1b\xb5\xc1\
-\x63\xac\xf9\xcb\x83\xd8\x98\x34\x33\xc4\x89\xc1\xda\x3d\xf2\x0f\
-\x87\x9e\xa3\x73\x64\x39\xe5\xb9\x1f\xa0\x19\xec\xe6\xe7\x2f\xf4\
-\x71\xdf\x2f\xdf\xca\xc1\xd7\x6a\x35\xb4\x68\x70\xdb\x37\x24\x0b\
-\xba\xa1\xe4\x6b\xa2\xe2\xfb\x18\xd0\x97\x53\x90\x1a\x21\x24\x42\
-\x28\xac\x10\xc4\x99\xe0\x13\x63\xb0\xc6\x62\xac\x61\xa6\x4a\xfc\
-\xee\x82\x38\xcb\xd1\xab\xdf\xd8\x0e\x80\x6a\x6c\xe4\x38\xf9\x5d\
-\x3a\x16\x1c\x41\x14\x05\x3c\xf7\xfb\x32\xcb\xef\xdb\x88\x31\x86\
-\x30\x0c\xd3\x74\xd9\x0c\xb8\xfd\x52\xc5\xe2\x03\xc1\xf3\x14\xa1\
-\x5e\xc0\x63\xdb\x2e\x24\xd1\x55\x0a\xc5\x08\xb7\xe8\x51\x2c\x78\
-\x68\xc7\x05\x29\xc1\x5a\x8e\x3a\x74\xbf\x4c\x42\xa6\xfd\x5e\xc8\
-\x30\x8b\x07\x66\x0b\x62\x2c\x49\x62\x38\xea\xd0\xfd\x88\x1b\x43\
-\x94\x07\xbe\xc7\xbc\xbe\xf7\x63\x8c\xe1\xad\xed\x31\xff\x72\xcf\
-\x36\x1a\x8d\x26\x71\x1c\xe7\x29\xf3\xea\xf3\x34\x27\xbc\xdf\xe2\
-\x7b\x1a\xa7\xd0\xc5\x6b\xf1\x3f\xb2\xe8\x80\x83\xf0\x3c\x1f\xcf\
-\xf3\x29\x7a\x1e\x9e\xef\xa3\x94\xca\x5b\x82\xc4\xd8\x3c\xe6\xda\
-\xe1\xb1\xb3\x16\xb2\x99\x82\x38\xdb\x83\x44\x18\x6c\x1c\xd0\x35\
-\x78\x0d\xbd\x0b\x8f\x04\xe9\xb2\x73\xb8\xca\x15\xb7\x8d\x32\x34\
-\xb4\x1b\x6b\x2d\x41\x10\x50\xab\xd5\xf8\xd2\xe9\x96\x4f\x9c\x68\
-\xf1\x3d\x45\xb1\x58\xe4\xa5\xfa\x25\xd4\x54\x5f\x1a\xb4\x42\x82\
-\x90\x48\xe5\x60\x11\x69\x6c\xb5\x7a\x1a\x6b\x01\x91\xae\xd9\x06\
-\x8f\x9d\x2d\x8d\x32\x63\x16\x4a\xd3\x28\x49\x4c\xe7\xe0\x35\xf4\
-\x74\x77\x21\xdd\x0a\xbb\x87\x77\xf3\xed\x1f\x55\xd9\xb0\x71\x0b\
-\xc6\x98\x5c\xf7\x4b\x8f\x8b\xb8\xf0\xcc\x34\x55\xfa\x9e\xcb\xea\
-\xea\xf9\x0c\xdb\xf7\x50\xd4\xad\xa0\x55\x48\xed\x22\x94\x9a\x02\
-\x3e\x05\x08\x92\x74\x1b\xc1\x5f\x9c\x85\x66\x92\x50\x6c\xb0\xd6\
-\xe2\x0c\xfe\x90\xb9\x3d\x1d\xe8\x62\x37\xe3\xc3\x5b\xb8\xfe\xbe\
-\x1a\x6b\x5e\x79\x1d\x6b\x6d\xae\xfb\x25\x87\x84\x5c\x7d\x9e\xc4\
-\xf7\x24\x25\xcf\xe1\xb5\xea\xdf\xb1\xa5\x7e\x2c\x45\x4f\x22\xa4\
-\x04\x14\xd2\x71\xd0\x8e\x8b\x31\x7b\x5a\xcb\x29\x58\x95\x4c\x0b\
-\x5a\x5b\x09\xcd\x56\x07\x66\x08\xe2\x35\xab\x5f\xe0\xb0\xb9\x6f\
-\x70\xda\x89\x1d\xb8\xa5\x45\x04\xe3\x3b\x78\x60\x95\xcf\xaf\x9e\
-\x7c\x0e\x6b\x6d\xae\xfb\xbe\xee\x80\x9b\xbe\x62\x29\xfb\x12\xbf\
-\xa8\x58\xf9\x72\x0f\xf7\xfd\xe6\x1d\x1c\x7d\x3f\xda\xd1\x68\xad\
-\xd1\x8e\x4b\xb1\x58\x44\xce\xd4\xd9\x09\x41\xa1\x50\x60\xfb\xa6\
-\x0d\x38\xda\x69\x23\x92\xd9\x2a\x71\xdb\x34\x2a\x38\x61\x49\x99\
-\xa5\xc7\xc6\x14\x3b\x17\xd3\x6c\x8c\xf1\x1f\x2f\x3a\xdc\x71\xef\
-\xca\x2c\x3b\x19\x82\x20\xc0\x77\x6b\xdc\xfa\x75\xc3\xbc\x39\x8a\
-\x92\xe7\xf0\xea\xa6\x4e\x56\xac\xec\x43\xca\x2a\x89\x56\x28\x95\
-\x12\x28\x14\x0a\x24\xcd\x20\x93\x8d\xcd\xa5\x6b\xf3\xcf\xe9\x77\
-\x5a\xab\xb6\x78\x66\xed\xc8\x6c\x9b\xc2\xb1\xb8\x3f\xe4\x0b\xa7\
-\x77\x52\xea\xfb\x38\x51\x30\xc8\xaa\xd5\x35\x7e\x78\xf7\xb3\x84\
-\x61\x98\xe7\x7b\x9b\xd4\xb8\xf9\x6b\x11\x07\x2f\x4c\xc1\x6f\x19\
-\xf2\xb9\xfa\xfe\x05\xc4\xc6\xa0\x55\x42\x02\x08\x04\x42\x6b\x6c\
-\x56\x6d\xdf\xed\x35\x6b\x16\x9a\x5e\xba\xf7\x9b\x63\xf8\xf2\x27\
-\x8b\x74\x2e\x3c\x99\x38\x9c\x60\xcd\xeb\x55\xae\xbe\xf9\x29\x76\
-\xef\x1e\x01\x20\x0c\x43\x9a\x8d\x80\xeb\x2f\x68\x72\xd4\x7b\x15\
-\x65\x4f\x33\x56\x2f\xf0\x0f\xf7\xf4\xd1\x88\x24\x4a\x89\xbc\xc5\
-\x54\x5a\x23\x95\x9a\x71\xbb\xf2\xe7\x5e\xb3\x7a\x60\x72\xda\xaa\
-\xf8\x82\xaf\x9c\xb1\x9b\xbe\xf7\x5e\x88\x15\x2e\x6f\xae\x7f\x9d\
-\x2b\xaf\x5f\xc3\xc8\xc8\x28\x40\xbe\x49\xbb\xf4\xd3\x75\x4e\x3e\
-\x46\x52\xf2\x14\x09\x2e\xdf\xbc\x73\x01\xbb\xab\x1a\xad\xd2\xa3\
-\x12\x90\x68\xad\x73\x3d\x9b\xbf\x92\xc0\xac\x31\x40\x26\x21\xd7\
-\x81\x6f\x9c\x5b\xe0\x3d\xc7\x2c\x03\x3d\x87\xed\x03\x6b\xb9\xec\
-\x86\x75\x0c\xee\x1c\x9a\xa2\xfb\x73\x3f\x56\xe3\xdc\x93\xa1\xe4\
-\x2b\x0a\xae\xcb\xd7\xff\x75\x2e\x9b\x06\x35\x4a\x41\x2a\x1a\x50\
-\x4a\xe2\x3a\x4e\xba\xfd\x30\x7f\x1d\x78\x60\x1f\x1d\x19\x06\x29\
-\x04\xe7\x2d\x1d\xe4\xfd\x1f\xbc\x00\x55\x7a\x1f\xef\x6c\x7d\x91\
-\x7f\xba\x79\x0d\x03\x9b\xff\x94\xf7\xa4\xf5\x7a\x9d\x93\x3e\x50\
-\xe3\x92\xb3\x2d\xbe\x9f\xea\xfe\xaa\x07\x7a\x79\x6d\x63\x19\xc7\
-\xd1\xe8\x2c\x68\x5d\xd7\xa5\x5c\x2a\xa1\xb5\x9e\xdc\xad\x67\x96\
-\xb4\xf9\x6b\xdb\x31\x43\xd3\xc4\xec\x5b\x09\x38\xe3\x84\x1d\x9c\
-\xf4\xf1\xd3\xd1\x5d\x47\x33\xba\xfd\x19\xbe\xbb\xfc\x39\x5e\x5a\
-\xf3\x56\xbe\x60\x18\x86\x1c\x7e\x40\x8d\xef\x9d\x9f\x50\xf6\x35\
-\x65\x5f\xf3\xdc\x86\x0f\x51\x3a\xf0\x44\x3e\xb3\xd8\xa3\x58\x2c\
-\xe2\xfb\x3e\xe5\x72\x99\xfe\x03\x0e\x60\x4e\x77\x77\x26\xa5\x76\
-\x72\xb0\x6c\xd9\xbc\x99\xcb\x2e\xbd\x0c\xad\x54\x7e\xfc\x98\x06\
-\xbf\xa2\x2f\x3b\x19\x9c\x2a\x92\x59\x3c\xf0\x37\x47\x8e\x72\xf6\
-\x19\x27\xe2\xf6\x7c\x84\x60\xe8\x45\x6e\xb9\xf7\x0f\x3c\xf3\xfc\
-\xdb\xe9\x6e\x94\x54\xf7\xf3\x2a\x35\x96\x5f\x14\xd2\xd9\xa1\x28\
-\xf9\x9a\x35\x9b\x0f\xe3\x89\xdf\x1f\x8e\xe7\x05\x18\x63\x48\x92\
-\x04\x80\xae\xae\x2e\xa2\x38\x66\x68\x68\x08\x60\x0a\x89\x96\x95\
-\x85\x10\x74\x76\x75\xe1\x79\x45\x7c\xcf\x4f\xad\x6e\x21\x89\x13\
-\xaa\xc1\x04\xc6\x24\x7b\x13\x48\x66\x20\xf0\xdf\x0f\xf5\x9c\xd1\
-\x77\x60\x19\x6f\xff\x4f\x11\x4e\x6c\xe1\xb6\xbb\x56\xf2\xe0\x2f\
-\xf6\x80\x37\xc6\x50\x54\x35\x6e\xb9\x38\x60\x7e\xaf\xa4\xe4\x6b\
-\x36\xec\xea\xe3\xdf\xd7\x7e\x18\xd7\x75\x71\x1c\x07\xc7\x71\x70\
-\x5d\x97\x9e\x9e\x1e\x7a\x7a\x7a\x10\x42\xe4\x40\x27\x5f\xad\x22\
-\xd6\x22\xac\xa4\x42\x2a\x09\x36\xb5\xb0\xd4\x0a\xad\x34\x71\x1b\
-\x02\xd2\xc4\x7b\x13\x78\x69\x45\xe1\x84\xf9\xf3\xba\x1f\xe8\x38\
-\xf8\x3c\x9a\x63\x7f\xe4\xee\xbb\xef\xe6\xde\x47\xaa\x39\x78\x6b\
-\x2d\x36\x09\xf8\xc1\xc5\x35\x0e\xeb\x4f\xc1\xef\xaa\xce\xe1\x0b\
-\xd7\x09\x6a\x8d\x55\xa9\xe6\xa5\xc2\x62\x29\x14\x8a\x5c\x73\xed\
-\x35\x68\xad\xf3\x13\xec\xb4\x3d\xdc\xa3\x69\x6b\x2d\x49\x92\x90\
-\x24\x09\x52\x4a\x5a\x27\x4f\x56\x58\xb0\x02\xac\xc9\xe7\xed\xe5\
-\x81\xb6\x41\x3c\xef\xeb\xdf\xf2\x3a\xd7\xf9\xe1\xee\x97\x78\xf4\
-\x97\xbf\xe6\xb6\x87\x63\xe2\x78\x0f\xfb\x28\x6c\x72\xd5\xb2\x71\
-\x8e\x39\x1c\x4a\x45\x45\xad\x59\xe2\xd6\xa7\x4e\x60\xd7\xd0\x6f\
-\x91\x52\x23\x95\x44\xc9\xf4\x38\x3d\x0a\x23\x3c\xcf\xcb\xad\xdf\
-\x92\x8f\x31\x26\x1f\x2d\x09\xc5\x71\x9c\x9f\x4a\x67\xa5\x38\x27\
-\xd8\x02\xbb\x4f\x09\x3d\xba\xfc\x73\xe5\xce\xbe\xe3\xff\x76\x5b\
-\x72\x28\x6f\x3c\x7d\x2b\xd7\xfe\xb8\x41\x1c\xef\x71\x79\x14\x45\
-\x5c\x74\xfa\x18\x4b\x8f\xb7\x94\x3c\x4d\x42\x81\xe5\x4f\x1c\x4f\
-\xb5\xd9\xb1\x27\xf2\xad\x45\x8a\xf4\xf4\x3a\x0c\xc3\x7c\x61\x21\
-\x04\x49\x92\xe4\x52\x99\x4c\xa0\xf5\xbe\x45\xd4\x5a\x83\xcd\x36\
-\x77\x36\x7b\xa6\x69\xd3\xc2\x1a\x39\x8d\x40\x79\xce\xbc\xd3\xfc\
-\xca\x5c\x37\x6c\x6a\xf6\x5b\x7c\x3e\xe5\xf2\x5d\x34\x47\x6a\xb9\
-\x05\xce\x3c\x61\x8c\x65\x4b\x63\x4a\x9e\x46\x69\xc5\x8d\xbf\x38\
-\x92\x1d\x63\x73\x28\x16\x55\x4e\x40\x4a\x81\xeb\x16\x52\x6d\x4f\
-\x02\xdd\x1a\x2d\xb9\x4c\x3f\xae\x6c\x05\xbc\xc9\x4e\xdc\xd2\xbf\
-\x71\x98\x74\x4c\x22\xe0\x38\x1a\xc7\x71\x88\xe3\x18\x63\xe2\xa9\
-\x47\x8b\x5d\xf3\x0f\x3c\x3d\x6c\x0c\x13\xd6\x06\x71\xc5\x28\x5f\
-\x5b\xb6\x84\x39\x15\x07\x6b\x2d\x1f\x7a\xef\x38\xdf\xfa\x4c\x93\
-\x92\xa7\x29\xb8\x8a\x2b\xef\x2c\xb0\x76\xa0\x33\xdd\x55\xea\x96\
-\x1d\x04\xae\xe3\xa2\xb5\xce\x0e\x64\xa7\x5a\xb8\xf5\xb9\x15\xc8\
-\xad\xdf\x45\x51\x44\x18\x86\x84\x61\x48\x92\x98\xb4\x89\x8f\xd3\
-\xa6\x3e\x49\x4c\xd6\x95\xa5\xf3\x11\x82\x38\x23\x1b\x4f\x96\xd0\
-\x2f\x7f\xf0\xb9\x82\xd4\xe2\xf4\x66\x30\x48\x33\xd8\x45\x18\xec\
-\xa2\xaf\x3b\xe0\xdb\x5f\x98\xcb\x13\xff\xb9\x95\xcb\x3f\x55\xa3\
-\xa3\x94\x82\xbf\xe5\x67\x9a\x87\x9f\xd1\x1c\x77\xbc\x42\xa9\x74\
-\xa4\xe0\xd3\xec\x93\x6a\x3a\x21\x8e\x63\x9a\xcd\xb4\xb5\x9c\x6c\
-\xf1\xc9\x84\x5a\xa3\x75\x8f\x49\x12\x92\x78\xaa\x87\x6c\x0b\x7c\
-\xe6\x29\x63\x0d\x52\xc8\xa9\x41\xac\x7c\xe7\x14\xed\x8a\x52\x0b\
-\x7c\xfa\xfa\x0e\x8e\xac\x71\xe6\x29\xfd\x34\xac\xa1\xe0\x8e\xf1\
-\xb3\xe7\x04\x37\xfe\x54\x51\x2c\x38\x94\x4a\x25\x7a\x7b\x7b\xe9\
-\xee\xee\xa6\x58\x2c\xe0\x3a\x4e\xba\x18\x36\x6f\x40\xe2\x38\xce\
-\xdc\x3d\xd5\x0b\x2d\x29\xb5\xe4\x94\xe4\x56\x4d\xef\x6f\xd5\x01\
-\x63\x5b\x31\x93\xa4\x1b\x41\xa5\x08\x83\x26\xae\x5b\x00\x98\x4c\
-\xa0\xeb\x9c\xb8\x39\x42\x18\x0c\x11\xd6\x87\x89\x9a\xa3\x58\x13\
-\xe3\x16\xbb\x71\xbd\x1e\xd6\x8f\xf4\xf3\x93\x27\xff\x8b\x07\x9f\
-\x0a\xa9\x94\xd3\x2a\x7b\xcc\xd1\x47\xb3\xe8\xa0\x83\x50\x4a\x91\
-\x24\x09\x13\x61\x98\x26\x10\x6b\x10\x52\xe6\xad\xe5\x74\xb0\x33\
-\x79\x21\x27\x16\x27\x58\xa6\x7b\x20\x25\xd8\x6c\xd4\xf3\x8c\x95\
-\x7b\xe0\xba\x6f\x9e\xe3\xde\xf3\xd8\xfa\x4f\x9f\xbd\x74\x21\xf3\
-\x3a\xeb\x24\x51\x0d\x90\xe8\xe2\x1c\xaa\x41\x91\xc7\x9e\xdd\xc9\
-\x8b\xaf\xee\xa2\x19\x7b\x54\x3a\xca\xb8\xae\x43\xd1\x4b\xb7\x08\
-\x2d\xf0\x95\x8e\x0a\x43\xbb\x87\xf3\x73\x1c\x69\x0c\xdd\x3d\x3d\
-\x44\x51\x94\x03\x6b\x05\x71\x8b\xc0\x64\x22\x2d\x2f\x25\x71\x42\
-\x2c\xe3\x2c\x25\xa4\x67\x4f\x89\x49\x72\x09\x35\x1a\x0d\x7c\xbf\
-\x44\x10\xd4\x51\x4a\xa6\x04\xde\xde\x3e\x76\xf6\xe6\x6d\x23\xce\
-\x0d\x77\x6c\xe7\xb3\xa7\xed\xc7\x91\x87\xfa\xd8\xb8\x38\xbe\xea\
-\xf9\xd1\x77\x56\xad\xde\x7a\x48\xbd\x99\x20\x84\x44\xc9\xf4\xb1\
-\x49\x62\x30\x49\x5a\x1f\xa2\x28\x22\x8e\x63\xfe\xf9\xea\xab\xf2\
-\x34\xd8\x02\x17\xc7\x31\xe3\xe3\xe3\x53\xac\xdb\xb2\xea\xf4\xec\
-\x34\x59\xe3\x49\x12\x67\x7d\x71\xe6\x2d\x6b\xa6\xd4\x81\x89\x89\
-\x6a\xf6\x4e\xa7\x04\x06\xb6\x8f\x9e\x5a\xad\x56\xa9\xd5\x6a\x7c\
-\xff\xee\x5d\xc1\x05\x67\x1d\x71\xdd\xf3\xaf\x6c\xbd\xfb\xd9\x97\
-\xb7\x1e\xd4\xbf\x70\xff\x7b\xb5\xd6\x87\x4c\x29\xe1\xd2\x00\x22\
-\xd7\x77\x1c\xc7\x44\x51\x34\x25\x55\x4e\x2e\x58\x71\x1c\xef\xe5\
-\x81\x16\xd1\xc9\x57\x8b\x58\x9c\xc4\xd3\x2a\x6e\x6a\xb4\xbd\xaf\
-\x04\xfd\x9d\x65\x1f\x95\xbf\x7a\x6d\xf8\x2c\x49\x38\xd4\x5b\xd1\
-\x37\x2e\x9c\xe3\xdf\x7a\xc5\x4d\x4f\x36\x80\x0e\xa0\xf9\xd6\xc6\
-\x8d\xff\x76\x50\x7f\xff\xa5\x85\x82\x3b\x67\x4f\x41\x8b\x99\x98\
-\xa8\xb2\x6b\xd7\xce\x5c\xab\xd3\x0b\xd3\x74\xd9\xb4\x7e\x3f\xbd\
-\x81\x17\x59\x60\xb6\x62\x04\xc4\x5e\x9b\x67\xc1\xde\x1d\x62\x56\
-\x18\xc7\xf4\xc0\x58\xb4\xd8\x73\x92\x2b\xd6\xaf\xdf\x72\x7f\x35\
-\x68\xaa\x35\xd0\x09\xf4\x00\x45\xa0\x10\x46\xe1\xe0\xc6\xcd\x9b\
-\x7e\x56\xa9\x74\x2e\x02\x2b\x01\xeb\x15\x8b\x62\xff\xfd\x0f\x70\
-\xd7\xad\x5b\x57\x71\x5d\x57\x4b\xa5\xa4\x92\x52\x49\x29\x95\x52\
-\x4a\x6a\xad\x95\x10\x52\x49\x29\xa5\x10\x48\x21\x64\xaa\xe8\x34\
-\x91\x9b\xd4\x39\x26\x01\x91\x58\x6b\x63\x6b\x4d\xd2\x6c\x36\xc3\
-\x5a\x2d\x88\xca\x1d\xe5\xf1\x5d\xbb\x76\xd6\x32\xef\x4c\xde\xf9\
-\xe5\x5d\xbe\x10\xc2\x4a\x29\x47\xc2\x30\x7a\x41\x64\x40\x7b\x33\
-\x8b\xbb\x80\xcc\x26\xca\xec\x73\x09\x28\x03\xad\x73\x0d\x5b\xa9\
-\x54\xc4\x51\x47\x1d\xd5\xb9\x68\xd1\xa2\x52\x47\x47\x87\x2c\x16\
-\x8b\xda\x75\x5d\xd9\x1a\xad\x7f\x2b\x90\xe9\x9e\x48\x48\x29\xad\
-\x94\x12\xad\x75\x22\x84\x30\x52\x4a\x23\x53\x1d\xc6\xd6\xda\x28\
-\x8e\xe3\xb8\x5e\xaf\xd7\xc6\xc7\xc7\x1b\x6b\xd7\xae\x1d\x7b\xfa\
-\xe9\xa7\x47\xeb\xf5\xfa\x6c\xdd\xbe\x05\x22\xa0\xda\x62\x98\x9e\
-\x32\xa5\x43\x4e\x1b\x4e\x36\xd4\x24\x8b\xd8\x52\xa9\x44\xb9\x5c\
-\xc6\x71\x1c\x9b\xed\x36\xad\xe3\x38\xf9\x6b\x46\xc2\xb8\xae\x8b\
-\x52\xca\x2a\xa5\x6c\x06\xde\x6a\xad\xad\x94\xd2\x2a\xa5\x6c\x46\
-\x04\x29\xa5\xa9\x56\xab\x6c\xdd\xba\xd5\x0e\x0c\x0c\x58\x68\xff\
-\x7f\x1c\xd3\x48\x24\xff\x03\x59\x56\xe3\x0b\xd4\x6d\xfb\x67\x00\
-\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\
-\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x37\
-\x3a\x30\x32\x3a\x33\x35\x2d\x30\x37\x3a\x30\x30\x10\x90\x85\xa6\
-\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\
-\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\
-\x33\x3a\x32\x36\x3a\x31\x35\x2d\x30\x37\x3a\x30\x30\x06\x3b\x5c\
-\x81\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\
-\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
-\x30\x39\x3a\x33\x31\x3a\x32\x34\x2d\x30\x37\x3a\x30\x30\xf9\x59\
-\xc2\xe4\x00\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\
-\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\
-\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\
-\x65\x6e\x73\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\
-\x20\x6f\x72\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\
-\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\
-\x69\x63\x65\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\
-\x2f\x5b\x8f\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\
-\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x30\x33\
-\x2d\x31\x39\x54\x31\x30\x3a\x35\x33\x3a\x30\x35\x2d\x30\x36\x3a\
-\x30\x30\x2c\x05\xbc\x4f\x00\x00\x00\x13\x74\x45\x58\x74\x53\x6f\
-\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\x6e\x20\x49\x63\x6f\x6e\
-\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\x45\x58\x74\x53\x6f\x75\
-\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\x69\x63\x6f\x6e\x73\x2e\
-\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x03\x78\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x03\x3f\x49\x44\x41\x54\x78\xda\xad\x95\x8f\x4b\x13\x61\
-\x18\xc7\x0d\x28\x03\x11\xcf\x52\x96\xf7\xab\x61\x69\x14\x05\xfe\
-\x09\x01\x44\x40\xad\xa2\xa8\x48\x8d\xae\x0c\x82\x4a\x29\xca\x52\
-\x22\xa7\x23\x47\xaa\xcd\x48\x75\x29\x6b\x67\x35\xc4\xd2\x50\x65\
-\x4b\x99\xcd\x2d\x64\x9a\x99\x9c\xb5\x2c\x98\xd5\x05\x9a\x55\x12\
-\x97\x8a\xa2\x69\x7e\xbb\x9d\xcc\x08\x33\xeb\xea\x81\x87\xf7\xee\
-\xe5\x7d\x3e\x3c\x3f\xbe\xef\x5d\x08\x00\xc5\xff\xc4\x1c\x8e\x76\
-\xa2\xa3\xe3\xb9\xe0\xf5\xfa\x16\x0c\x08\xf2\xfe\x16\x5c\x37\x33\
-\x03\xb4\xb5\x3d\xfb\xbf\x60\x39\x5b\x04\xac\xb9\xb9\x73\x5e\x80\
-\xdd\xee\xe5\x1e\x3c\x78\x22\xaa\x02\x77\x76\xbe\x50\xc0\xb5\xb5\
-\x9e\x9f\x02\x78\xde\xc1\x75\x77\xfb\x21\x8a\x1f\xa0\x0a\xec\x72\
-\x3d\xc1\xe4\xe4\x34\x64\xd0\x5c\x40\x61\x61\x15\xe7\xf1\x08\x08\
-\x98\x20\xf4\xa9\x03\x37\x34\xb4\x41\x92\x46\x51\x5c\x5c\xa3\x04\
-\x64\x64\x94\x71\x2e\x57\xb7\x02\x1d\x1e\x1e\x87\xd5\x6a\xe7\x55\
-\x81\x6d\x36\x27\x06\x06\x86\x90\x9b\x5b\x89\xa3\x47\x8d\x72\x4f\
-\xbb\x64\xe0\x18\xfa\xfb\x3f\xa1\xa4\xa4\x56\x28\x2b\xbb\x47\xa8\
-\x02\x5f\xbf\x5e\x0f\xbf\x7f\x00\xe7\xcf\x97\xa2\xa6\xc6\xad\x00\
-\x7d\xbe\x37\xc8\xc9\xb9\x21\x18\x0c\x56\x42\xb5\x2a\x4c\xa6\x6a\
-\xa5\xbf\x72\xc9\xe8\xed\x15\x15\xd9\xa5\xa5\x99\x04\xd9\x89\x3f\
-\x92\x5b\x6b\x06\xbd\xcb\x7b\x91\xc9\xee\x32\x30\xd9\x4f\x8d\x0c\
-\x17\xdc\x3f\x93\x7a\x09\x7a\xbd\x05\x01\xd9\x39\x1c\x1d\x48\x4a\
-\xd2\x0b\x89\x89\x7a\x62\x51\x1d\xd7\x1e\xa7\xb5\xce\x73\xb4\x30\
-\xd4\x48\x03\xfe\x58\xe0\x63\x3c\x46\x1f\xc5\xe3\xe5\x55\x56\xf0\
-\x5f\x61\x39\x5b\x99\x11\x01\xc9\x65\x66\x9a\xb1\x6f\xdf\x05\x41\
-\xa7\x3b\x4b\x2c\x7a\x41\x78\x8e\x22\x9c\xe7\x62\x24\xb8\xa3\xf0\
-\xe9\x2e\x89\xb7\x16\x06\xc3\x0e\x2d\x30\x30\x0b\x1f\xeb\x59\x8f\
-\xfb\x8d\xc9\x30\x5c\xbc\x86\xd3\x07\x0f\x21\x08\x5d\x14\x5c\x91\
-\x44\xf1\x63\xb7\xc2\xd1\x6d\xd4\xa0\xe9\x0c\xad\x94\xdf\x67\x62\
-\x37\x8f\xb7\x6a\x95\xcc\x31\xb2\x11\x18\xdc\x84\xc1\xbb\x6b\xf0\
-\xf6\x66\x2c\x9e\xe7\x31\xa7\x64\xe7\x7c\x79\xcc\xef\x5b\xd1\x94\
-\xba\x02\x5f\xad\xa1\x28\x4f\xa2\x8a\x82\x87\xda\xb3\x18\xe2\x73\
-\x3d\x03\x88\xb1\xf8\xd6\x1b\x87\x57\x56\x2d\x30\xb4\x01\x13\x3d\
-\xf1\x98\x7a\xb1\x4e\x59\xfd\xe5\xab\x25\x79\x16\x09\x0b\x82\x1f\
-\x9f\x0d\xc3\x87\xfc\x65\xc8\xdb\x41\x9e\x0a\x1e\x92\x33\xe7\x27\
-\x9c\x31\xf8\xda\xc6\xa0\x3d\x87\x11\xde\x37\xca\xe0\xc1\xb8\x59\
-\xf7\xad\x05\x5e\xc9\xab\xb8\x16\x42\x01\x2b\x2e\x08\x6e\x3d\x1e\
-\x06\x98\x43\x50\x75\x68\x85\x94\xbf\x93\x2c\xb2\xa5\x90\xee\x41\
-\xcb\x4a\x4c\xd8\xa3\x11\x18\xa8\x33\x9d\x26\xfa\xab\x19\xc0\xcf\
-\xe2\xdd\x4d\x56\x7a\x7d\x95\xe5\xfc\x26\xb6\x6e\xf2\x21\x8b\xcf\
-\x76\x06\x2d\xe9\xf4\xae\x5f\x82\x0b\x74\x1a\xf7\x17\x43\x88\x02\
-\x47\xa5\xec\x77\x96\xa2\xcf\x14\x89\xfa\x34\x92\x97\xd5\xa2\xf4\
-\xf1\xcd\x0d\x12\xd3\xae\x18\x78\xb3\x98\xb9\xaa\x7c\x26\x5a\x9c\
-\xf1\xac\x42\x63\x1a\x9d\xfd\x4b\x70\xd6\x16\x92\xc8\xd9\x4a\xf2\
-\x0d\x29\x11\x52\xcb\x89\x08\xd8\x8e\x68\x84\x8a\x64\x4a\x19\xe2\
-\x0f\x88\x06\xa3\x35\x2b\x51\x9f\x4a\x6f\x0e\xee\xc9\xcf\x6e\x78\
-\x22\x71\xe7\x18\x95\xad\xfa\xe6\xb5\x66\x68\xc4\xe9\xea\x30\x58\
-\x92\x29\x3e\xf0\x5e\xba\x9f\x22\x3c\x99\xd1\xd2\xd8\xed\x70\x54\
-\x72\xff\x00\x36\x1f\xa0\xf8\x29\xcb\x32\xf8\xf4\xe1\xc8\xdd\x46\
-\xd6\x55\x1c\xd0\x88\x23\xa5\xa1\xe8\xd1\x47\xc0\x9c\x48\x25\xa8\
-\x06\x17\xed\x21\xb5\x55\x87\xa3\x24\x94\xca\x21\xe5\xb3\x3e\x52\
-\xb8\x04\xa6\xdd\x64\x9d\xea\x5f\x53\xd0\x8c\x3a\x32\xc1\xbc\x37\
-\x5a\x6c\x3f\xb9\x1c\x8e\x14\x39\xf3\xed\x24\x7f\x59\x47\xce\xfb\
-\x08\x7d\x07\xda\xb0\x04\xf6\xc6\x1c\xb1\x3a\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x61\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x06\xf3\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\x03\x36\x90\xc6\xc8\xc8\x40\x0a\xf8\x0f\xc5\xdf\
-\x81\xf8\x1f\x03\x83\x95\xbe\x81\xfe\x5c\x4e\x46\x16\xc1\x53\x57\
-\xaf\x6c\xdc\xfb\xeb\xe7\xc4\x97\x0c\x0c\xd7\xc0\xea\xd0\xec\x03\
-\x08\x20\x16\x06\x2a\x82\xff\x4c\x4c\x91\x32\x06\x26\x01\x7a\xea\
-\xca\x76\x61\x65\xc5\x12\x7f\x66\x74\x33\x58\x7c\xfb\x90\x26\xfd\
-\xee\x8b\xf3\xfc\xd7\x2f\xd3\xde\x30\x30\xec\x43\xd7\x03\x10\x40\
-\x2c\xf8\x7c\x44\x2c\x00\x85\xd5\x1f\x06\x86\x08\xf3\xec\x92\x65\
-\x1e\x15\xe5\x0c\x82\x02\x7c\x0c\xbf\x1e\x5c\x67\xe0\x12\xff\xc3\
-\x60\xa6\xce\xc6\xc0\x75\x97\x4f\xf9\xf0\x9b\xd7\x05\x6f\xfe\xff\
-\xbb\x0e\x54\xfa\x1c\x59\x2f\x40\x00\x31\xe1\x32\x94\x8d\x04\xfc\
-\x9b\x81\x41\x4c\x42\x4b\xad\x5a\x2f\x2a\x8a\x41\x4a\x4c\x90\xe1\
-\xe7\xe7\xcf\x0c\xdb\x6e\xfd\x67\xd8\xa9\x57\xc0\xf0\x21\x38\x91\
-\xe1\x0f\xcb\x0f\x86\x2f\xff\xff\x71\x01\x95\x8a\xa2\xdb\x03\x10\
-\x40\x38\x1d\xc0\x42\x24\x06\xf9\x9e\x85\x91\x21\x3b\xb2\xb1\x48\
-\xc7\xc2\x88\x8f\xe1\xca\xa1\xf5\x0c\xe7\x2e\xbd\x66\x30\x31\x55\
-\x62\x78\xf6\x83\x9b\x61\x03\x9b\x39\xc3\xa5\xd0\x52\x86\xff\x9c\
-\x3c\x3f\x81\x4a\x7f\xa0\xdb\x03\x10\x40\x38\x1d\xf0\x87\x48\xfc\
-\x8d\x81\x41\xcd\xc8\xdb\x29\x5f\x2f\x24\x84\xe1\xf3\xc3\xf3\x0c\
-\x6f\xbe\x0b\x33\xa8\xe8\xa8\x32\x48\x4a\xf1\x30\xf0\x70\xb2\x31\
-\xdc\xbb\xf9\x84\xe1\x9b\xa8\x22\x83\xac\x9c\x92\x24\x50\x39\x3b\
-\xba\x3d\x00\x01\x84\x33\x0d\xfc\x23\x22\xee\x41\x6a\x78\x39\xd8\
-\x9a\xfc\x5b\x5a\xf8\x7f\xbd\xb9\xc9\x70\xec\x2a\x1f\x83\xa8\x9e\
-\x3d\xc3\x7f\x60\xb0\xbc\xfe\xc8\xc0\xf0\xeb\xc5\x09\x06\x19\xa6\
-\xeb\x0c\xaf\xef\x2b\x31\x7c\x78\xfe\x04\xa4\x85\x07\xdd\x0c\x80\
-\x00\xc2\x19\x02\xcc\x44\x60\xa0\x03\x3c\x9c\xf3\x72\x82\xa5\x74\
-\x24\x18\x4e\x9e\x7c\xc1\xc0\x28\x63\x07\x4e\xbd\x3f\x7f\x31\x30\
-\xbc\x7c\x0f\x8c\xf0\x77\xeb\x18\x12\xb8\x26\x33\x7c\xda\xdd\xfb\
-\xe7\xe2\xa7\x77\x17\x80\x5a\x3e\xa0\xdb\x03\x10\x40\x38\x43\x80\
-\x9d\x40\xaa\xff\x0c\x54\x22\xa1\xa4\x54\xe7\x94\x9b\xcc\xf2\xfc\
-\xfa\x45\x86\x67\x8c\x66\x0c\x62\x5c\x6c\x0c\x3f\x80\xb1\xcc\x02\
-\x4c\x99\xf7\xaf\xdd\x62\xd0\xf9\x7d\x8a\xe1\xd5\xf3\x5f\x0c\x7b\
-\x2f\xdf\xbb\x0a\x2c\x1f\xf6\x00\xb5\x3d\x44\x37\x0b\x20\x80\x70\
-\x86\x00\x13\x1e\xcc\x08\x09\x81\x44\xf7\xe2\x3c\x4b\x1e\xa1\x77\
-\x0c\xc7\x2e\x73\x31\xb0\x09\xcb\x30\xfc\x06\xfa\xfc\x37\x30\x04\
-\x3e\x02\x6d\xfb\x74\x76\x09\x83\xf4\xdf\x37\x0c\xd3\xf6\x30\x7c\
-\x39\xf7\x8b\x61\x3f\x50\xcb\x71\x48\x92\x41\x05\x00\x01\x84\xd3\
-\x01\x3f\xf1\xe0\x2f\x0c\x0c\xb2\xaa\xe6\x16\x15\x36\x49\x8e\x0c\
-\x57\x8f\x5d\x64\xf8\xc8\x66\xca\xc0\xca\x04\x09\xfa\x7f\x40\xfa\
-\xf6\xd5\xc7\x0c\x3a\x9f\x16\x33\x5c\xbf\xc9\xc0\xb0\xe4\x16\xc3\
-\x39\xa0\x96\xdd\x40\xfc\x18\x9b\x3d\x00\x01\x44\x72\x36\x04\x15\
-\x50\x6c\x2c\x6c\xf9\x7e\x4d\xf9\xf2\xff\x3f\x5e\x60\x38\x77\x47\
-\x96\x81\x9d\x47\x90\xe1\xd7\x77\x48\xc8\x7c\x00\xba\xee\xfb\xb1\
-\x6e\x06\xb5\xbf\x0f\x18\x26\x1e\x60\x78\x09\x4c\x7a\xbb\x80\xc2\
-\x67\xa1\x99\x06\x03\x00\x04\x10\x13\xbe\x34\x80\x0d\x03\x13\x9e\
-\xb1\x69\xa0\x57\x8e\xb2\x8d\x28\xc3\xd3\x2b\xd7\x18\x7e\xf2\x1a\
-\x31\x30\x02\x5d\xf5\x17\xe8\x7b\x50\xea\xbf\x7e\x78\x3f\x83\xcb\
-\xef\x39\x0c\xfb\xcf\x33\x30\x6c\x7c\xc3\x70\x14\xa8\x05\x14\xfc\
-\xaf\x70\xd9\x03\x10\x40\x24\x15\xc5\x20\x2f\x08\x0b\x09\x37\x7b\
-\x54\xc5\xb2\x33\xbc\x3c\xc4\x70\xff\x39\x50\x3b\x87\x14\xc3\x3f\
-\x60\xbc\x30\x02\x5d\x77\xf3\xca\x4b\x06\xd5\x9b\x45\x0c\xc2\xc0\
-\x2a\x69\xe2\x29\x86\xdb\xc0\x08\xdf\x09\xd4\x72\x19\x5f\xc9\x0e\
-\x10\x40\x4c\xf8\x52\x3a\x3a\x06\x7a\x32\xc8\x36\x3d\xcc\x53\x44\
-\xee\x17\xc3\x8f\x3b\x47\x18\x5e\x7e\x97\x67\x60\x67\x61\x62\x00\
-\x55\x9c\x0f\x1e\x7d\x67\xf8\x7d\xa8\x80\x21\x40\xf8\x02\xc3\x92\
-\x63\x0c\xbf\x8f\x7f\x67\x38\x00\xd4\x72\x04\x92\x61\x70\x03\x80\
-\x00\xc2\xe9\x80\xdf\x68\xf8\x2b\x03\x83\xa0\xbc\x96\x5a\xbd\x6d\
-\x8a\x03\x03\xc3\x93\x03\x0c\x3f\x5e\x5c\x65\x78\xf6\x96\x19\x9c\
-\xe5\x6e\xde\x78\xc3\xf0\x76\x77\x0e\x43\x8a\xe8\x0a\x86\x5b\x77\
-\x18\x18\x66\x5d\x67\xb8\xf0\x1b\x12\xf7\x77\x08\x15\x66\x00\x01\
-\xc4\x42\x8c\xcb\xfe\x43\xf8\x71\x0e\xe9\xbe\x7a\x1c\xac\x8f\x18\
-\x18\x5e\x9c\x62\xe0\x60\x7c\xc5\x70\xfd\xc2\x49\x86\x3d\xe7\xf9\
-\x19\x34\xfe\x2d\x60\xc8\x57\xdd\xc2\x20\x04\xb4\xb5\xf5\x28\xc3\
-\xa7\x9b\xff\xc0\xf1\x7e\x12\x12\x68\xf8\x01\x40\x00\xb1\xe0\x2b\
-\x09\x61\x00\x58\xb6\xa8\x6a\x59\x19\x56\x1b\x07\xa8\x03\xc3\x7a\
-\x3d\x30\xa9\x5f\x67\xe0\x60\xfd\xcf\x50\x62\xbe\x94\xe1\xc1\xd3\
-\x65\x0c\x66\x82\x5f\x18\x78\x81\x56\xed\x00\x26\xb9\x95\xcf\x19\
-\x4e\x40\xb3\xdd\x53\x62\xaa\x72\x80\x00\x62\x21\x24\x01\x4a\x78\
-\x5c\x9c\xdc\x45\x9e\xa5\xfe\xa2\x0c\x9f\x80\x59\xfa\x2d\x10\xff\
-\xf9\xc1\xf0\xff\x2f\x03\x83\xb2\xc0\x57\x06\x65\x56\xa0\x03\x81\
-\x2d\x8d\xd7\xc0\x80\x99\x73\x96\xe1\xd9\x0b\x48\x89\x77\x81\xc8\
-\xea\x84\x01\x20\x80\x98\x08\x35\xb1\x80\x0e\xb0\xd2\xf3\x52\x4f\
-\x95\xd5\x05\xa6\xa5\x67\x07\x81\x65\xd9\x4b\xb0\xc4\x3f\x60\x70\
-\xff\x02\xe6\xf9\xaf\xef\x80\x5c\x60\x09\xbf\xfb\x14\xc3\xbf\x1d\
-\x5f\x19\x0e\x42\xb3\xdd\x1b\x62\x1b\x33\x00\x01\x84\x33\x04\xbe\
-\x22\x1c\x21\xf5\xf9\xe6\x75\xe6\xcb\xab\xbf\x32\x48\xca\x3d\x64\
-\x10\xe6\x00\xe6\x08\xa0\xc5\xff\x81\xf1\xf2\x17\x48\x33\x02\xf3\
-\xda\x8b\x7b\x0c\x0c\xb3\x6f\x33\xdc\xf8\x0a\xf1\xfd\x0d\x52\x9a\
-\x71\x00\x01\x84\x33\x04\x80\xb5\x29\xc3\x7b\x48\xd1\xcb\xae\x63\
-\x65\xca\xa0\xe1\xda\xce\xf0\xf7\xba\x0a\xc3\xbd\x4b\x5c\x0c\x1f\
-\x98\x98\x18\xfe\x03\x83\xe6\x2f\x50\xd1\x3f\xa0\x5f\x57\x9f\x61\
-\xf8\x76\xec\x37\xc3\x5e\xa0\xf2\x43\x90\x92\x9a\x78\x00\x10\x40\
-\x38\x1d\xc0\x0a\x49\x88\xec\xda\x0a\x1c\x05\x06\xa9\xa9\x0c\xac\
-\x9f\x2f\x32\x88\x03\x3d\x27\xfb\x98\x97\xe1\xf3\x5e\x29\x86\x47\
-\x5f\xd8\x19\x98\x80\xf9\xff\x16\xb0\x95\xb7\xe0\x39\x03\xb0\xbe\
-\x01\xfb\xfe\x11\xa9\x0d\x59\x80\x00\xc2\x5b\x19\x71\x32\x30\x84\
-\x3b\x24\x79\x9b\x70\x08\x01\x1b\x33\x17\x16\x02\xe3\xe5\x0f\x03\
-\xdb\xf7\x77\x0c\xd2\x77\xff\x30\x7c\xdf\x22\xc2\x70\xea\x3c\x33\
-\xc3\xbc\x6b\x0c\x6f\xaf\x43\x52\xfd\x19\x62\xb2\x1d\x3a\x00\x08\
-\x20\x16\x3c\x4d\x32\x6e\x5d\x03\xa1\x34\xad\xd0\x24\x60\x61\xba\
-\x16\x98\xfa\x1f\x80\x13\xc6\xff\x77\xcc\x0c\x5f\x5e\x7f\x65\xb8\
-\xfb\xec\x0f\xc3\xc2\x4f\xff\x9e\xed\x85\x14\x38\x20\xdf\xbf\x20\
-\xa7\x29\x0f\x10\x40\x38\x1d\x00\x6c\x3b\x99\xd9\x84\xba\x58\x33\
-\x83\x52\xdb\xed\xad\x10\xcb\x3f\xb1\x30\xfc\x7b\xcf\xc2\xf0\xe0\
-\xcd\x1f\x86\xf9\x9f\x7e\xdc\xdd\xc8\xf0\x7f\x31\x50\x29\x50\x92\
-\xe1\x0a\xb1\xd9\x0e\x1d\x00\x04\x10\x4e\x07\x48\x0b\x33\xd8\x2b\
-\xea\x08\x03\xd3\xf4\x36\x60\xc1\xf3\x08\xdc\x94\x60\xfc\xc0\xc2\
-\xf0\xe9\x2d\x03\xc3\xba\x0f\xbf\x3e\x6d\x67\xf8\xbf\x05\xa8\x6c\
-\x35\x03\xb4\xc7\x43\x2e\x00\x08\x20\x9c\x0e\xb8\x2b\xe6\xe5\x73\
-\xe9\xc4\x03\x06\xe5\x6f\x67\x18\xc4\x40\xf9\xf1\x0b\x50\xe9\x3b\
-\x16\x86\x53\xaf\x7f\x33\x2c\xf8\xf3\xf7\x38\x30\xb2\x81\x2e\x63\
-\xb8\x45\x69\x6f\x0a\x20\x80\x70\x26\xc2\xe7\x7a\xc5\x0c\xec\x19\
-\x6b\x18\xd6\x8a\xd6\x33\xec\xbd\x25\xcb\xf0\xfb\xc1\x1f\x86\x9b\
-\x4f\xff\x31\xb4\x7f\xfa\x79\x19\xd8\xb0\x03\x96\xc7\x0c\xa7\x71\
-\x35\x32\x48\x01\x00\x01\x04\xee\x2c\x62\xc3\x1a\x7a\x33\x67\x6c\
-\xb8\xfe\xef\xff\xa6\x37\xff\xff\x6f\xbb\xf4\xe6\xff\x22\x5b\xf7\
-\xff\x01\xc0\xd4\x00\xd4\x53\x09\xc4\x8a\xd4\xb2\x0f\x20\x80\x70\
-\x46\xc1\xf3\x27\x0f\xce\x2c\x5e\xf6\x36\x5d\x48\xf0\x1b\xc3\xa7\
-\xc7\x97\x3e\xef\xbb\xc7\x7c\xf7\x35\x03\xc3\x1a\x68\xbc\xdf\xa7\
-\x56\x87\x16\x20\x80\x18\x71\x75\xcf\x19\x19\xc5\x84\x99\x39\xa4\
-\x13\xff\xfd\x7e\xaf\xfc\xff\xef\x53\x60\x83\xf2\x0f\x28\xa5\x5f\
-\x82\x36\xad\xff\x53\x12\x02\xc8\x00\x20\xc0\x00\xbe\xfd\x98\x77\
-\x14\xb9\x22\xb6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x06\xd4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x06\x66\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x03\xee\x00\x80\x00\x1a\x70\x07\x00\x04\x10\x0b\x32\x87\xd1\x64\
-\x16\x2e\x75\xaa\x0c\xff\x19\x56\x32\xfc\xfe\xab\x02\x64\xff\x02\
-\x8b\x80\x92\x0e\x23\x0e\x33\x59\x98\xde\x31\x30\x31\x26\x01\xd9\
-\x07\xb0\x29\xf8\x7f\x26\x0d\xce\x06\x08\x20\x16\xa2\x9c\xf9\xf3\
-\x8f\x83\xa2\x0c\xbf\x61\x67\xb1\x25\x03\x17\x07\x33\xd0\x1d\xff\
-\x21\x0e\x60\xf8\x0f\x45\x90\x84\xcc\x08\x74\x10\x0b\x33\x13\x43\
-\xdb\xbc\x0b\xfc\xc7\x4f\x3d\xf3\x60\xe0\x60\x3e\x40\xc8\x68\x80\
-\x00\x22\xce\x01\x7f\xfe\x33\x0a\xf1\xb0\x32\x04\x3a\x2a\x02\x2d\
-\x40\xf6\xf6\x7f\x54\x0c\xca\x51\x8c\x2c\x0c\x4b\xb6\xdd\x61\x38\
-\xfe\xfb\xdf\x7f\x06\x76\x66\x4c\xb3\x18\x51\x83\x0d\x20\x80\x88\
-\x73\x00\x23\xc3\xff\x7f\x40\xf3\xbe\x7c\xff\xc5\x20\xc0\xc5\xca\
-\x70\xec\xc9\x7f\x86\xf7\xdf\xff\x33\x30\x02\x2d\xfc\xfb\xe7\x2f\
-\xc3\x6f\x20\x66\x61\xf8\xc7\x60\x26\xcd\xc0\x20\xc6\xcf\xc6\xf0\
-\xeb\xf7\x3f\xb0\x1e\xcc\x14\x87\x19\x67\x00\x01\xc4\x42\x52\x8a\
-\x05\xea\xff\x07\xb4\x74\xed\x4d\x26\x86\xab\xaf\x19\x19\x58\xfe\
-\xfd\x66\xf8\xfd\xeb\x1f\xc3\xf7\xef\x7f\x18\x78\x98\xfe\x30\x68\
-\xf9\xb2\x32\x48\x30\xfe\xc7\xad\x19\x0b\x00\x08\x20\x92\x1c\x00\
-\x0a\xe1\x7f\xff\xfe\x31\xb0\x02\xbd\xc7\xfc\xff\x2f\x03\x33\xd0\
-\x01\xff\xff\xfd\x62\x60\xf9\xff\x07\xc8\xff\x03\x74\x1c\x13\x38\
-\x3d\x60\x78\x1e\x87\xe5\x20\x00\x10\x40\x44\x3b\xe0\x3f\xdc\x11\
-\xa0\x60\xff\xcd\xf0\xf7\xe7\x5f\xa0\x6b\x7e\x31\xfc\xf9\xf5\x07\
-\x88\x81\x7c\xe6\x3f\x0c\xff\xff\xb0\x02\x1d\xf4\x1f\xd5\x7a\x3c\
-\x96\x83\x00\x40\x00\x11\xeb\x80\x3f\xb0\x3c\x07\x4a\x0b\x7f\x7e\
-\xff\x05\x5a\x0a\xcc\x8d\xff\x20\x96\x83\x31\xf3\x5f\x60\x08\xa0\
-\xa4\x9b\xbf\x84\x2c\x07\x01\x80\x00\x42\x77\x00\x2f\xc3\xdf\x7f\
-\xba\x0c\x7f\xff\xb3\x20\x79\xfa\x3b\xc3\xaf\xbf\xea\x20\x4b\x41\
-\x71\x00\x8c\x01\xa0\x03\x40\x71\x0f\x0a\xfe\x3f\x60\xfa\xf7\x4f\
-\x20\x66\xfd\xcb\xf0\xf7\xef\x5f\x70\x14\xfd\xf9\x03\x54\xf4\xeb\
-\xaf\x2c\x10\x1b\x03\xf5\x73\xa1\x84\x06\x0b\xd3\x4d\x20\xeb\x15\
-\x4c\x08\x20\x80\xd0\x1c\xf0\x7f\x86\x20\x1f\x7b\x14\x2b\x90\xf5\
-\xf7\x1f\xa2\xa4\xf9\xc3\xc6\xcc\x20\xc8\xcb\xc6\xc0\xc4\xf4\x1f\
-\x1a\x02\x7f\xc0\x18\x1c\x02\x40\xc7\x80\xf1\xff\x7f\x0c\xff\xfe\
-\xfe\x03\xbb\x5a\x90\x9b\x95\x81\x5f\x80\x33\x9e\x95\x87\x35\x1e\
-\xc5\x74\xa0\x71\x6f\xbf\xfe\x06\x95\x0d\x8e\x30\x31\x80\x00\x42\
-\x75\xc0\xf7\xbf\xa2\x66\x16\xe2\x0c\x53\x2a\x6c\x80\x59\xeb\x0f\
-\xd8\x32\x90\x89\xff\x80\x86\xb3\xb3\x32\x33\xb0\x02\x1d\xf0\x13\
-\x18\xf7\x7f\xff\x40\x82\x1e\xe4\x80\xbf\xbf\x40\x18\x98\x06\x80\
-\x3e\x07\xa9\xfb\xfe\xfd\x37\x43\x55\xb2\x2e\x43\x66\x98\x3a\x30\
-\xcb\x03\x1d\x0c\x0c\xb8\xbf\x40\x87\x89\x8b\x70\x32\x74\x2f\xb9\
-\xce\x30\x7b\xf9\x35\x11\x64\x2b\x01\x02\x08\xd5\x01\x1c\xcc\xcd\
-\xfb\x8f\x3e\xb2\xba\xf3\xf0\x23\xb7\x87\xb5\x2c\xd0\xfc\xdf\xe0\
-\x20\x67\x06\x1a\x04\x2c\x08\x80\x96\xff\x66\x60\x02\x25\xc2\xdf\
-\x90\xa0\x67\x80\x45\x01\x08\x03\x2d\x07\x15\x3b\xbf\x80\x6a\x80\
-\x45\x01\x83\x80\x28\x1b\xc3\xf7\x1f\x90\x68\xe1\xe5\xe6\x60\x78\
-\xf9\xe9\x0f\xc3\xa6\xdd\xf7\xff\x02\x7d\xd1\x8b\x6c\x25\x40\x00\
-\xb1\xa0\x65\x97\xc3\xbf\x7e\xfc\xed\xcf\x6f\x3b\x54\xb3\x77\xbe\
-\x3f\x83\xb4\x30\x1b\xc3\xe3\x77\xbf\x19\xe6\x9d\xfd\xc3\xf0\xeb\
-\xd7\x5f\x06\x46\x90\x85\x40\xcb\x1f\xbd\xf9\xc5\xc0\xf4\xf7\x37\
-\x24\x2a\x40\x0e\x01\x86\xc8\x57\x60\x48\x34\xad\x7d\xca\xc0\xca\
-\xf8\x17\x1c\x4a\x5f\xbf\xfe\x62\x48\x75\x13\x67\x30\x56\xe1\x65\
-\xf8\xcf\xc4\xc2\x90\xd7\x73\x92\xe1\xe5\xab\x6f\xeb\x18\x78\x58\
-\x97\x22\x5b\x09\x10\x40\x4c\x18\x79\x8d\x93\xa5\xe3\xd6\xad\xb7\
-\x27\x1a\x67\x9c\x01\x3a\x88\x85\x41\x82\xe7\x3f\x03\x3f\x30\x81\
-\x6d\xbb\xfa\x83\x61\xef\x4d\x20\xbe\xfe\x8d\xe1\xfd\xa7\x9f\x0c\
-\xff\xa1\xa1\x00\xca\x0d\xff\x80\x69\xe0\x3b\xb0\x94\xdc\x77\xe9\
-\x1d\xc3\xd6\xd3\x6f\x18\xd6\x1d\x7c\x06\xf4\xf9\x1f\x06\x75\x69\
-\x2e\x06\x21\x41\x2e\x86\x79\x5b\xee\x31\x1c\x38\xf4\xf8\x29\x03\
-\x17\x4b\x19\xd0\x8e\xdf\xc8\x56\x02\x04\x10\xb6\xea\xf8\x2b\x03\
-\x1f\x7b\xf6\xbc\x95\x57\xdf\x2c\xdd\x7a\x9b\x81\x93\x87\x83\x21\
-\xde\x90\x99\xc1\x42\x1a\x18\xff\x40\x4b\xd8\x81\x39\xf2\xff\xdf\
-\xdf\x50\xcb\x7f\x83\xcb\x81\xdf\xbf\x21\xa1\xc1\xce\xf8\x0f\xcc\
-\x57\x96\x60\x67\xa8\x09\x97\x67\x90\x04\xc6\xfb\xb9\x3b\x9f\x18\
-\x3a\x67\x5f\xfc\x03\xb4\x3c\x0f\x98\x28\x1e\xa0\x5b\x06\x10\x40\
-\x4c\x38\x8a\xcd\x73\xff\x18\x19\x7b\x4a\xba\x8f\x31\x5c\xbb\xff\
-\x89\x41\x54\x90\x8d\x21\xdb\x9a\x9d\x41\x88\xe3\x1f\xc3\xe7\xaf\
-\xd0\xc2\x07\x96\xfa\xa1\x18\x14\x0a\xdf\xbe\xfd\x64\x60\x02\x46\
-\x53\x35\xd0\x72\x0d\x19\x6e\x86\x6f\x7f\x99\x18\x0a\x7b\x4f\x33\
-\x7c\xfc\xf8\x6b\x21\x30\xee\xd7\x61\xb3\x0a\x20\x80\x98\x70\x16\
-\x7b\x1c\x2c\x13\x5f\xbe\xfc\xba\x3e\xa5\xee\x00\xc3\xbb\x2f\x7f\
-\x19\xd4\x25\x58\x19\xca\x9c\xb9\x81\xc5\xef\x1f\xa0\x45\xbf\xc0\
-\xbe\x87\x25\x40\x10\xfb\xc7\x8f\xdf\x60\xf1\xb2\x20\x59\x06\x67\
-\x7d\x21\x06\x56\x2e\x0e\x86\xaa\x29\xe7\x19\x2e\x5c\x78\x75\x1e\
-\x18\xef\x55\x0c\x38\xaa\x08\x80\x00\xc2\xd7\x22\xfa\xc1\xc0\xc3\
-\x9e\x75\xfc\xf8\x93\x4b\x35\x53\xcf\x32\xb0\x01\x0d\xb4\x53\xe5\
-\x60\xc8\x75\xe2\x03\xc7\xf7\x0f\x60\x76\xfb\x0b\x2d\x86\x41\xb9\
-\xe3\xdd\xc7\xef\x0c\x29\xae\x92\x0c\xd1\x0e\x12\x0c\x02\x82\xdc\
-\x0c\xb3\x37\xdd\x63\x58\xb2\xee\xd6\x1b\xa0\xe5\x49\xc8\x05\x0f\
-\x3a\x00\x08\x20\x02\x4d\xb2\xff\x2f\x80\xe9\x21\x7e\xfa\x92\x2b\
-\x6f\x26\xae\xb8\xce\xc0\xc5\xcb\xc9\x10\x68\xc4\xcb\x90\xed\x22\
-\xc4\xf0\xe5\xeb\x4f\xb0\x43\x40\xa5\xe0\xbb\xf7\xdf\x19\x62\xec\
-\xc5\x18\x72\x7d\x65\x80\x89\x8e\x9b\x61\xcf\xb9\xd7\x0c\x8d\x93\
-\xcf\xff\x06\x26\xe8\x0c\x60\xbc\x5f\xc0\x67\x03\x40\x00\x31\x11\
-\x51\x07\x5f\x60\x60\x63\x2e\x2c\xef\x3e\xc1\xb0\x7c\xcf\x23\x06\
-\x41\x21\x6e\x86\x04\x3b\x21\x86\x12\x5f\x09\x70\xdc\x7f\x02\xe6\
-\x88\x64\x37\x49\x86\xaa\x30\x05\x06\x09\x51\x6e\x86\x8b\x0f\x3e\
-\x33\xa4\x37\x1e\x65\xf8\xfe\xeb\x4f\x2b\xb0\xd8\x5d\x4b\xc8\x78\
-\x80\x00\x22\xae\x32\x62\x63\x5a\xf2\xe7\xe7\x5f\xe1\xb4\x9a\x43\
-\x7d\xbf\xeb\xad\x99\x22\x5d\x64\x19\xe2\x1d\x44\x19\x14\x84\x59\
-\xc0\x89\xd2\x51\x5f\x90\x41\x4c\x84\x9b\xe1\xe4\x8d\x8f\x0c\xc9\
-\xb5\x47\x18\xde\xbc\xfb\x31\x09\x98\xea\x9b\x18\x88\xe8\x72\x00\
-\x04\x10\x0b\xd1\x75\x31\x3b\xf3\xc4\x6f\x3f\xfe\xb2\x65\x35\x1d\
-\xed\xfa\xfc\xcd\x94\x21\xd6\x43\x81\xc1\xdb\x8c\x05\x52\x5c\xb3\
-\x30\x33\xec\x3d\xff\x86\x21\xab\xf5\x04\xc3\xab\x97\x5f\x67\x00\
-\xe3\xbd\x84\xe1\x3f\x03\x51\x3d\x1e\x80\x00\x62\x44\xee\x19\xe1\
-\x69\x15\xc3\xaa\x58\x06\x86\xdf\xff\x42\x19\x7e\xfd\x9b\xe4\x6a\
-\x2b\x23\x91\x14\xa4\xca\xc0\x09\xac\xa8\x56\xed\x7a\xc0\xb0\x6c\
-\xdb\xdd\xaf\xc0\x56\x59\x2d\xd0\xa1\xfd\x04\xfd\x83\xd4\x2a\x06\
-\x08\x20\xd2\x1c\x80\x00\x5a\x0c\xdf\x7e\xe7\x00\xe3\xd8\x91\x91\
-\x89\x91\xf5\xff\xcf\xbf\xa7\x80\x41\x3e\x03\x98\xe0\x0e\x11\x15\
-\xa0\x48\x0e\x00\x08\x20\xc6\x81\xee\x1b\x02\x04\xd0\x80\xf7\x8c\
-\x00\x02\x68\xc0\x1d\x00\x10\x40\x03\xee\x00\x80\x00\x03\x00\xa7\
-\x41\xee\x45\xc4\x9b\xf9\x86\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x05\x7e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x05\x10\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x2c\x20\x82\x91\x31\x39\x8d\x87\x8b\xa9\x8e\x83\x9d\x89\xfb\xdf\
-\xff\xff\x7f\x41\x62\xe0\x80\x61\x04\x31\xc0\x88\x01\x26\x86\x1c\
-\x5e\xff\x19\xd0\xe4\x61\xfa\x90\xe5\x31\xf4\x31\x32\xfe\xfd\xf3\
-\x8f\xe1\xcf\xcf\xbf\x93\xfe\xff\x9f\xd7\x08\x10\x40\x8c\xa0\x28\
-\xe0\xe3\x4d\x7b\xda\xd8\x13\x2f\xc5\x2b\x2f\xc5\xf0\xf5\xdb\x7f\
-\x86\xbf\xff\x18\x18\x80\x6a\x18\xfe\x02\x75\xfd\x05\x3a\xe7\x0f\
-\x88\xfe\x07\xc5\x50\xf6\x1f\xa8\x1c\xb2\x5a\x10\xfd\x0f\x99\x0f\
-\x94\x07\x32\xc1\x34\x48\x3d\x48\x8e\x81\x85\x91\xe1\xc3\xd3\xd7\
-\x0c\x17\xe6\xce\x7b\xf5\xeb\xeb\x0c\x71\x80\x00\x02\x87\x00\x37\
-\x17\x2b\x97\x84\x8e\x32\xc3\x0f\x71\x09\x06\xf6\x6f\x10\x43\x59\
-\x90\x0c\x62\xf9\x8b\x30\x1c\xe6\x00\x98\xe5\x7f\x91\x2c\xff\x8b\
-\x84\x41\x6a\x7f\x83\xe8\xff\xa8\x6a\xff\x03\x6d\xfc\xcd\x21\xc8\
-\xc0\xc4\xce\xc1\x0a\xb2\x1b\x20\x80\xc0\x0e\xf8\xf7\x8f\xe9\xef\
-\x97\x2f\x7f\x18\x1e\x03\xd9\x1f\x3f\x41\xc2\x0e\x64\xe0\x7f\x98\
-\xaf\xfe\xa3\x5a\xfe\x0f\x66\x30\x4c\x0e\x29\x84\x60\xec\xff\x50\
-\xf5\x70\xbd\x50\xcc\xcc\x01\x34\xff\xc7\x6f\xa0\xd9\x4c\xa0\xf0\
-\x60\x00\x08\x20\x48\x1a\x60\x62\x62\xf8\xf5\x87\x91\x61\xe5\x9a\
-\x07\x0c\xdf\x3f\x7e\x67\x60\x60\xc2\x8c\x5f\x6c\xe0\x3f\x72\x44\
-\x23\x33\x19\x19\x30\x34\x82\xb8\x4c\x40\xf1\x7f\xcc\x6c\x0c\xd2\
-\xb2\x7c\x60\x3b\x41\x00\x20\x80\x58\x20\x1a\x98\x19\x3e\x7c\xfd\
-\xcb\xe0\x2c\xf5\x81\xa1\x30\x57\x16\xe8\xd2\xff\x0c\xe8\xb9\x93\
-\x11\x27\x07\x37\x40\x56\xf6\x1f\xc8\x61\x03\xc6\xff\xc2\xdd\x2f\
-\x19\x96\x5c\xff\x0d\x4c\x8a\xcc\x60\x71\x80\x00\x62\x81\xb8\x8e\
-\x89\xe1\x37\x30\x95\x08\x8b\xf0\x30\xa8\x2a\x09\x53\x39\xa3\xfd\
-\x07\xc7\xe5\x3f\x60\x3c\x30\x31\xb3\x30\x48\x8a\xff\x64\xf8\x73\
-\x05\x14\x1c\x90\x10\x00\x08\x20\x88\x03\x18\x99\x20\xa9\xf4\xef\
-\x3f\xf2\xac\x80\x06\x17\x88\xfe\x0f\x8e\xf3\x7f\x50\xfa\x3f\x54\
-\x0c\x98\xb3\x80\x66\xf3\xf2\xfe\x07\xe6\x88\xbf\xc0\xb4\xc1\x0c\
-\x77\x00\x40\x00\x41\xa2\x80\x89\x19\x18\xec\x8c\xf8\x23\x1c\xab\
-\xc5\x10\x1f\xc2\x68\x84\x85\x30\x47\x21\x1c\xf0\x1f\x5e\x18\x30\
-\x82\x13\xe6\x7f\x26\x48\x14\x00\x04\x10\x13\x24\x04\x18\xc1\x21\
-\x40\x56\xf0\x32\x20\x1c\x81\x6c\x39\x32\x06\x39\xec\xdf\xbf\xff\
-\x50\x17\x03\xd9\xa0\x04\xc1\x08\x49\x21\x00\x01\x04\x89\x02\x60\
-\x70\xfc\x05\x0a\xb2\x50\xe4\x73\x06\xb8\xe5\x88\x28\xf8\x07\xe5\
-\x43\xd9\xe0\xfc\x09\xcd\xa6\x4c\x10\x07\x00\x04\x10\x24\x22\x80\
-\x0e\xf8\xf3\x8f\x12\x9f\xa3\xfb\x9a\x01\x8d\xfd\x0f\x11\x0d\x0c\
-\x90\xb2\x81\x81\x19\xe2\x5d\x80\x00\x82\x86\x00\x23\xc4\x55\xff\
-\xc9\x8b\x73\x98\x1c\x8c\x8f\xe1\x73\xa0\x03\x40\x89\x10\x2e\x0e\
-\xa9\x12\xc0\xfa\x00\x02\x08\x5a\x0e\xb0\x00\xd3\x00\x23\x11\x69\
-\x10\xd3\xe7\x90\x92\x14\x39\xbe\xff\xa1\x25\x48\x44\x1a\x00\xa7\
-\x03\x06\x48\x14\x00\x4b\x22\x30\x1b\x20\x80\x90\xd2\x00\x31\xbe\
-\x67\x40\x09\x72\x90\x45\x7f\xff\xc2\x52\xfb\x3f\xb8\xdc\xbf\x7f\
-\x08\x1a\xe4\x20\x98\xe5\x60\x07\x81\xcd\x60\x04\xdb\x09\x02\x00\
-\x01\x04\x77\xc0\x9f\x7f\x58\xca\x4f\x9c\xf9\xfc\x3f\xdc\x97\xc8\
-\x89\x10\x35\xff\x43\x82\x1d\x16\x02\x7f\xff\x01\xf3\xff\x5f\x66\
-\xb0\xcb\xc0\x6e\x86\x66\x43\x80\x00\x62\x41\x4e\x84\xff\x19\x89\
-\xf7\x39\x22\xbe\x91\x83\x9a\x01\x25\x0d\xc0\x1c\x03\xe6\x83\xd4\
-\xfd\x83\x84\x00\x38\x96\xa0\xb9\x00\x20\x80\xe0\x25\x21\x28\x1b\
-\x22\x3b\xe0\x3f\x52\x4d\x83\xcd\xe7\xc8\x71\x0b\x4b\xe5\x98\x89\
-\xf0\x1f\xdc\x01\x30\x36\xd8\x1c\xb0\x5d\x90\x28\x00\x08\x20\x48\
-\x08\x30\x33\x81\x2b\x20\x06\x26\xcc\x04\x87\x88\xd7\xff\x58\x13\
-\x17\xc2\xe7\x0c\x18\xa1\x02\x0e\xfa\xbf\x10\x8b\xff\xfc\x01\x05\
-\xfd\x5f\x78\x22\x64\x82\x46\x01\x40\x00\x21\xd2\xc0\x7f\xe4\xa2\
-\x18\xb9\x38\x65\xc0\x61\x29\x7e\x9f\xc3\xca\x7f\x94\x50\xf8\x0b\
-\x55\xf7\x9f\x01\x5e\x1d\x03\x04\x10\xb4\x28\x66\x66\x40\xae\x87\
-\xd0\x2d\x47\x2e\xd3\x91\x13\x1f\x6a\xbc\xff\xc7\xe1\x18\x24\xc7\
-\xfe\xfb\x07\x6d\x38\x22\x6a\x43\x80\x00\x42\x4d\x84\x28\x71\x8e\
-\x59\xe0\x20\x1b\x86\x9c\xb5\x50\xe3\x1a\xe4\xf3\xbf\x60\x71\x50\
-\xb0\xc3\x72\xc3\x1f\x20\xfe\xfb\xef\x3f\xbc\x71\x00\xcb\x86\x00\
-\x01\xa8\x2c\x83\x14\x00\x80\x10\x04\x62\xff\xff\xb3\xa9\xd5\xc2\
-\x1e\x82\x20\x0f\x51\x43\xf9\x41\xf8\xc6\x22\x42\x6b\x37\x62\x6b\
-\x95\xdc\x37\xdc\xb8\x80\xf9\x9c\xc8\x5f\x9b\x26\x71\xc8\xa8\x46\
-\xc5\xb1\x5c\x50\x43\x64\x74\x16\xca\x01\x0b\x37\x8c\x53\x5d\x08\
-\x5b\x00\x01\x88\x28\x77\x1c\x00\x40\x10\x86\x62\x74\xf1\xfe\x47\
-\x95\xc4\x5f\xb4\x02\x1a\x5c\x59\xda\x3c\xda\x3a\x01\x35\x50\xb9\
-\x11\x97\x4a\x73\xe1\x6f\x82\x0a\x28\x3e\x33\x03\xa3\x84\x47\x0b\
-\x9e\x8d\xd7\x7f\xc0\xeb\xb6\xed\x8f\xe1\x8a\xca\xec\x26\xd1\x88\
-\x12\xf6\xd1\xbb\xdc\xb3\x13\x38\x02\x08\x56\x17\x30\xf1\xf2\xb2\
-\x33\x9c\xbf\xc7\xce\x10\xd1\x7b\x1f\xec\x18\x70\xad\x05\x2b\x6a\
-\xff\x23\xb5\x11\x41\x16\x31\x40\xe4\xc1\x16\x82\xfc\x07\xaf\x74\
-\x18\xe1\x7d\x03\x58\x7a\xfe\x87\x54\x7e\x30\x33\x7d\x63\x78\xf1\
-\x19\x18\x8a\x7c\x9c\x0c\x7f\x19\x21\x95\x01\x40\x00\x81\x1d\xf0\
-\xfb\x1f\xe3\x9f\x77\x6f\xde\x32\x70\xcb\x4b\x30\xbc\xfb\xf2\x17\
-\xac\x09\xd6\x2a\x86\xb7\x82\x19\xa0\xcd\x6b\xa4\xd6\x30\x8c\xff\
-\x8f\x01\xa9\x65\x8c\xd4\x82\x46\x37\xe3\x3f\xb8\x5f\xc0\xc4\xc0\
-\xf4\xe3\x3d\x3c\xc1\x03\x04\x10\xd8\x01\xbf\xfe\x31\x4c\x3c\xb6\
-\xf1\x60\x3e\x13\xa8\xd1\xf6\xff\xff\x3f\x6c\xad\xdb\xff\x58\xaa\
-\x24\x0c\xfe\x7f\xfc\xf2\x50\xe3\x18\xff\xfd\x07\x26\xa2\x7f\x7f\
-\x16\x82\xc4\x00\x02\x88\x71\xa0\x3b\xa7\x00\x01\x34\xe0\x9d\x53\
-\x80\x00\x1a\x70\x07\x00\x04\x18\x00\x56\x99\xc4\xad\x26\xe6\xd3\
-\x76\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0e\x4a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\x48\x00\x00\
-\x00\x48\x00\x46\xc9\x6b\x3e\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x0c\x42\
-\x49\x44\x41\x54\x68\xde\xed\x9a\x7d\x6c\xd5\xd7\x79\xc7\x3f\xe7\
-\x9c\xdf\xef\xfe\xee\xbd\xf8\xda\x5c\x5e\x6c\x0f\xfc\x32\x1a\xd7\
-\xd0\x80\x33\x12\x2a\xb2\x41\x18\x21\xca\xdc\x04\x10\xa3\x0d\xac\
-\x62\x49\x34\x16\xa9\x89\xa2\x54\x50\xb5\x51\x44\x93\x4a\x49\x15\
-\xb5\xcb\x3a\x4d\x61\x68\xd9\x1a\x2d\x51\xa5\xa6\x6a\x57\x2d\x59\
-\x32\x5e\x1a\xda\x94\xaa\xb0\x40\x82\xb3\x18\xec\x05\xf3\x62\xe3\
-\x60\xb0\xb1\x31\x06\x5f\xfb\xbe\xfd\xde\xcf\xfe\x30\xf7\xca\x76\
-\x8c\x71\x42\x48\x34\xa9\x8f\xf4\x48\x57\xbf\xf3\x7b\x79\xbe\xe7\
-\xfb\x3c\xcf\x79\xce\x73\xae\xd0\x5a\xf3\xff\x59\xe4\xe7\x6d\xc0\
-\x1f\x00\x7c\xde\x06\x5c\xaf\x18\x00\xa1\x10\x88\x71\x03\x21\xa0\
-\x80\x63\xd3\xa7\xf3\xf4\xca\x95\x78\x52\x22\xb5\x66\x74\xcc\x4c\
-\xf4\x7b\x82\x6b\x7f\xa9\xb5\x7e\x5c\x6b\x5d\x2a\xa5\xdc\x01\xbc\
-\x3c\x99\x41\x5a\x6b\x0c\xc3\x60\xe9\xd2\xa5\x98\xa6\x89\xd6\x9a\
-\x30\x0c\x8b\x1a\x04\x01\xbe\xef\xe3\xba\x2e\x61\x18\x8e\x00\xb8\
-\x81\xf2\xb0\xef\xfb\xff\x6c\x9a\xa6\x69\x59\x16\x99\x4c\xe6\x25\
-\xc3\x30\x84\x10\xe2\xa5\x49\x67\xd5\x30\x10\x42\x4c\xe9\x03\x37\
-\xca\x85\x4c\xe0\x87\xae\xeb\xbe\x98\x48\x24\xcc\xc7\x1f\x7f\x9c\
-\xed\xdb\xb7\x53\x55\x55\x85\xeb\xba\xdb\x81\xc6\xab\x3d\xa8\xb5\
-\x26\x1a\x8d\xa2\x94\xfa\xdc\x00\x24\x80\x5f\xe6\xf3\xf9\xef\xd6\
-\xd4\xd4\xf0\xdc\x73\xcf\xb1\x6c\xd9\x32\x66\xcf\x9e\xcd\xd6\xad\
-\x5b\x29\x29\x29\x99\xe6\xfb\xfe\x2f\x80\x3b\xae\x06\xc0\xb2\x2c\
-\xa4\x94\x4c\x25\xc5\x7f\xda\x00\xe6\x01\xbf\xce\xe5\x72\x5f\x5d\
-\xbc\x78\x31\xcf\x3e\xfb\x2c\xb5\xb5\xb5\x64\x32\x19\xd2\xe9\x34\
-\xf5\xf5\xf5\x3c\xf6\xd8\x63\x00\x33\xc2\x30\x7c\x59\x08\xf1\x47\
-\x42\x08\x46\x2b\x50\x04\xf0\x59\x33\x70\x4f\x18\x86\xfb\x6c\xdb\
-\xfe\xb3\x35\x6b\xd6\xf0\xf4\xd3\x4f\x53\x5e\x5e\x4e\x36\x9b\xc5\
-\xf7\x7d\xf2\xf9\x3c\xe7\xce\x9d\x63\xc9\x92\x25\x3c\xf4\xd0\x43\
-\x04\x41\x50\xaf\xb5\x7e\x19\x98\x3e\xc6\x20\x29\x99\x36\x6d\xda\
-\x94\x66\xff\xd3\x04\x70\xbf\xe7\x79\xaf\x87\x61\x38\xef\x81\x07\
-\x1e\x60\xeb\xd6\xad\xc4\x62\x31\x32\x99\x0c\xf9\x7c\x1e\xc7\x71\
-\x00\x88\x46\xa3\x64\xb3\x59\xd6\xae\x5d\xcb\xfa\xf5\xeb\xb1\x6d\
-\xfb\x5e\x60\x87\x10\x42\x09\x21\xd0\x5a\xa3\x94\x22\x1e\x8f\x4f\
-\x19\xc0\xf5\x66\x21\x01\x7c\xd7\x75\xdd\x1f\xc4\xe3\x71\x1e\x79\
-\xe4\x11\x1a\x1b\x1b\x8b\x33\x1e\x86\x21\x96\x65\x61\x59\xd6\x98\
-\x87\x7c\xdf\xe7\xfe\xfb\xef\xa7\xa3\xa3\x83\xd6\xd6\xd6\x07\x63\
-\xb1\xd8\x59\xe0\x7b\x42\x08\x4c\xd3\x24\x1a\x8d\x7e\x26\x0c\x4c\
-\x03\x7e\xec\x38\xce\x0f\x66\xcd\x9a\xc5\xb6\x6d\xdb\x68\x6c\x6c\
-\x44\x6b\x4d\x10\x04\x44\x22\x11\x4a\x4a\x4a\x8a\x3a\x6d\xda\xb4\
-\xa2\x5a\x96\x45\x22\x91\x60\xcb\x96\x2d\x54\x57\x57\xe3\x38\xce\
-\x53\xc0\xe6\x02\x4b\x53\xf5\xff\xeb\x01\x50\xa9\xb5\xde\x6d\xdb\
-\xf6\xc3\x8b\x16\x2d\xe2\xc9\x27\x9f\x64\xe1\xc2\x85\xf8\xbe\x8f\
-\xd6\x1a\xd3\x34\xb1\x2c\x0b\xd3\x34\x51\x4a\x61\x9a\x26\x91\x48\
-\x64\x8c\x02\xd4\xd4\xd4\xb0\x6d\xdb\x36\x2a\x2b\x2b\xf1\x3c\x6f\
-\x47\x18\x86\x8d\x91\x48\x64\xca\x19\x08\x3e\x99\x0b\x2d\x0e\xc3\
-\xf0\xe7\xae\xeb\x7e\x69\xd5\xaa\x55\x6c\xdc\xb8\x91\x44\x22\x51\
-\xfc\xa8\xef\xfb\x28\xa5\xb8\x78\xf1\x22\x2d\x2d\x2d\x9c\x3f\x7f\
-\x9e\x59\xb3\x66\x91\x4c\x26\x8b\xb1\x00\x23\x8b\x55\x81\x89\xbb\
-\xef\xbe\x9b\x3d\x7b\xf6\x24\x3c\xcf\xfb\xb7\x58\x2c\xb6\x5e\x29\
-\xf5\xbf\x41\x10\x08\xc0\xd3\xe3\x56\xff\xeb\x05\xb0\x29\x08\x82\
-\xed\x52\xca\xf2\x0d\x1b\x36\xb0\x7c\xf9\x72\xa4\x94\xc5\xa0\xf3\
-\x3c\x0f\x29\x25\x43\x43\x43\x1c\x38\x70\x80\xbd\x7b\xf7\x32\x7b\
-\xf6\x6c\xca\xca\xca\x30\x4d\x13\x80\x30\x0c\x01\x08\x82\xa0\x68\
-\x98\x69\x9a\x34\x34\x34\xe0\xba\x6e\x4d\x18\x86\x07\x86\x86\x86\
-\xfa\x85\x10\x83\x52\xca\xcb\xc0\x80\x10\xa2\x0f\xe8\x01\xce\x02\
-\xa7\x84\x10\x27\x00\x67\x3c\x00\x09\xcc\x05\x92\x40\x0a\xe8\x03\
-\xdc\x51\x0b\xfa\x16\xd7\x75\x9f\x4f\x24\x12\x72\xd3\xa6\x4d\xcc\
-\x9d\x3b\x17\xc7\x71\xa8\xaa\xaa\x42\x6b\x8d\xeb\xba\x00\x28\xa5\
-\x18\x1c\x1c\xa4\xab\xab\x8b\x77\xdf\x7d\x97\xd5\xab\x57\x53\x53\
-\x53\x43\x43\x43\x03\xa5\xa5\xa5\x58\x96\x85\x61\x18\x28\xa5\xf0\
-\x3c\x8f\x7c\x3e\x8f\x6d\xdb\xe4\xf3\x79\xb2\xd9\x2c\x99\x4c\xa6\
-\x24\x97\xcb\x95\xe4\xf3\x79\x0a\x9a\xcd\x66\xc9\xe5\x72\xb8\xae\
-\x8b\xe7\x79\x81\x94\xb2\x4d\x6b\xbd\x4d\x6b\xfd\xab\x02\x80\x99\
-\x18\xc6\x76\xea\xea\x36\x52\x52\x22\xc2\x0b\x17\x82\xb0\xb7\xb7\
-\x43\xf9\xfe\x6e\x29\xc4\xaf\x34\xac\x77\x5d\xf7\x3b\x55\x73\xe6\
-\xb0\x69\xd3\x26\x3c\xcf\x23\x95\x4a\xb1\x64\xc9\x92\xa2\xdf\x17\
-\x44\x6b\x8d\x94\x92\x8a\x8a\x0a\x32\x99\x0c\x9d\x9d\x9d\xa4\x52\
-\x29\xf6\xef\xdf\x8f\x61\x18\xcc\x98\x31\x83\x64\x32\x49\x22\x91\
-\x20\x16\x8b\x11\x8b\xc5\xb0\x2c\x8b\x48\x24\x82\x65\x59\x94\x96\
-\x96\x92\x4c\x26\xc7\xb0\x14\x86\x21\x8e\xe3\x30\x38\x38\x48\x7f\
-\x7f\xbf\xea\xec\xec\x6c\xc8\x64\x32\x2f\x0a\x21\x16\x09\xad\x35\
-\x9e\x10\x7f\xaf\xbe\xf5\xad\x27\xe4\xa3\x8f\x82\x6d\x43\x36\x0b\
-\x1d\x1d\xa4\x5e\x7b\x8d\x17\xba\xbb\xc3\xfd\x95\x95\x62\xc1\x17\
-\xbe\x20\xee\xbb\xef\x3e\xba\xbb\xbb\xf1\x7d\x9f\xbb\xee\xba\x8b\
-\x58\x2c\x46\x10\x04\x63\x7c\x4c\x4a\x49\x3a\x9d\x26\x95\x4a\xb1\
-\x77\xef\x5e\xde\x7f\xff\x7d\xaa\xab\xab\x49\x26\x93\x48\x29\x19\
-\x18\x18\x60\x78\x78\x18\xcf\xf3\xc6\x00\x1f\x5d\xbc\x15\xea\x21\
-\xcb\xb2\x50\x4a\x15\xb3\x92\x52\x8a\x30\x0c\x49\xa5\x52\xf8\xbe\
-\x7f\x5c\x4a\xb9\x54\x68\xad\xc9\x97\x94\xb4\x46\x5f\x7d\xb5\x41\
-\x94\x96\x8e\x18\x1f\x04\xf4\x0e\x0f\xf3\xa3\x03\x07\x38\xfa\xe1\
-\x87\xfc\xc5\xf2\xe5\xfc\xf9\x8a\x15\x1c\x6d\x69\x21\x97\xcb\xb1\
-\x66\xcd\x1a\x66\xcd\x9a\x85\xef\xfb\x13\x06\x8a\xd6\x9a\x74\x3a\
-\x8d\xe3\x38\x5c\xbe\x7c\x99\x5c\x2e\x47\x79\x79\x39\x55\x55\x55\
-\xa4\x52\x29\xba\xba\xba\xe8\xed\xed\x25\x97\xcb\x15\xcb\x63\xcf\
-\xf3\xf0\x7d\x9f\x30\x0c\x49\x24\x12\xb4\xb4\xb4\x70\xf9\xf2\x65\
-\x0c\xc3\x38\x29\x84\x78\x0b\x88\x5d\x79\x7d\x4a\x4a\xd9\x2e\xa5\
-\xdc\x23\xa5\xec\x36\x00\xbc\x20\x10\xd6\x99\x33\x88\x64\x12\x6c\
-\x9b\x6c\x36\xcb\xdf\xbd\xf3\x0e\xa7\x86\x86\xf8\xab\xb5\x6b\x69\
-\x68\x68\xa0\xad\xad\x8d\x74\x3a\xcd\x6d\xb7\xdd\x46\x32\x99\xc4\
-\xb6\xed\x49\xa3\x3d\x1e\x8f\x63\x9a\x26\xb1\x58\x0c\x21\x44\x91\
-\xad\xb2\xb2\x32\x6e\xb9\xe5\x16\x6a\x6b\x6b\xe9\xed\xed\xa5\xaf\
-\xaf\x0f\xdb\xb6\x11\x42\xa0\x94\x42\x08\x81\x65\x59\x04\x41\xc0\
-\xa1\x43\x87\xd0\x5a\x57\x4a\x29\x7f\x29\xa5\x7c\x7b\xa2\xef\x48\
-\x00\xc7\xb6\x8f\x79\xef\xbc\x03\xfd\xfd\xd0\xdb\xcb\xff\xb4\xb7\
-\x73\x6c\x60\x80\xaf\xac\x5a\xc5\x9d\x77\xde\x49\x67\x67\x27\xf9\
-\x7c\x9e\xb9\x73\xe7\x72\xd3\x4d\x37\x61\xdb\x36\xbe\xef\x4f\xaa\
-\x41\x10\xa0\x94\x22\x12\x89\x60\x9a\x26\x9e\xe7\xe1\xba\x2e\xb6\
-\x6d\xe3\x38\x0e\xf1\x78\x9c\xba\xba\x3a\x6e\xbd\xf5\x56\xea\xeb\
-\xeb\x29\x2b\x2b\xc3\xf3\x3c\xb2\xd9\x2c\xa9\x54\x8a\x64\x32\xc9\
-\xa2\x45\x8b\x10\x42\x94\x85\x61\xf8\x52\x10\x04\xf3\xc3\x30\xfc\
-\x48\x4a\x35\x18\xc9\x47\xfb\x73\xcd\xcd\x5f\xb7\x2a\x2b\x21\x9f\
-\x67\x5a\x26\x83\x15\x8b\x71\xfa\xcc\x19\x8e\x1c\x39\x42\x45\x45\
-\x05\xb3\x67\xcf\xa6\xa2\xa2\x02\xa5\xd4\x55\x5d\xe7\xe3\x48\x21\
-\x76\xa2\xd1\x28\xd5\xd5\xd5\xcc\x99\x33\x87\xe1\xe1\x61\xce\x9f\
-\x3f\xcf\xa5\x4b\x97\xc8\x66\xb3\x54\x55\x55\x61\xdb\x36\xed\xed\
-\xed\xf3\xa5\x94\x3f\x03\x56\x6b\xad\x2f\x6a\xad\x29\xd4\x4e\x42\
-\x6b\xcd\x19\x21\x1a\x8c\x92\x92\xf7\xe6\xdc\x73\x8f\x25\xa5\x44\
-\xdb\x36\xff\x68\xdb\xfc\x36\x1e\x47\x09\x41\x59\x34\xca\xbc\x79\
-\xf3\xb8\xf7\xde\x7b\x99\x3b\x77\x2e\x9e\xe7\x5d\x37\x80\x09\xdd\
-\x41\x4a\x84\x10\xb8\xae\xcb\x85\x0b\x17\x8a\x01\xdf\xd4\xd4\x44\
-\x4f\x4f\x0f\x96\x65\xed\x02\x36\x00\x6e\x31\xf8\xb5\xd6\x74\x08\
-\x41\x08\xbb\x2a\xe6\xcf\x5f\x5b\x56\x51\x01\x8e\xc3\xe5\xee\x6e\
-\x7e\xa3\x75\xee\x77\x0d\x0d\xbf\x39\x5f\x56\xb6\x48\x67\xb3\x75\
-\x35\xd5\xd5\x6c\xde\xbc\x99\x99\x33\x67\xde\x30\x10\x85\x6c\x54\
-\xc8\x38\xae\xeb\x72\xee\xdc\x39\x76\xef\xde\x4d\x4f\x4f\x0f\x91\
-\x48\xe4\x05\xe0\x9b\x85\xfb\xd5\x33\xcf\x3c\x43\xdf\xf7\xbf\x8f\
-\x0f\x8e\x9f\xcb\x7d\x3d\x19\x86\x90\x4a\x11\x73\x5d\x92\xfd\xfd\
-\xe6\x1f\x77\x75\xbd\xee\x44\xa3\xeb\xfb\x2b\x2b\x23\xc3\x97\x2e\
-\xad\xe8\xe9\xe9\xa1\xbe\xbe\x1e\xcb\xb2\x28\xf8\xe4\x8d\xd0\x20\
-\x08\x08\xc3\x10\xa5\x14\xe5\xe5\xe5\xcc\x9b\x37\x8f\x8e\x8e\x0e\
-\xd2\xe9\xf4\x52\xa5\xd4\x65\xa0\xa9\xc8\xc0\x51\x21\xd0\x30\x5d\
-\x08\xd1\x54\x1f\x89\x7c\x31\x1e\x86\x10\x04\x0c\x6b\x4d\x87\xd6\
-\x29\x47\xa9\x65\xbf\x58\xb9\xf2\xf8\xd9\xf2\xf2\x5f\x87\xd9\x6c\
-\xe3\xe2\xc5\x8b\xd9\xb0\x61\x43\x71\x96\x3e\x0b\x89\x44\x22\x9c\
-\x3e\x7d\x9a\x57\x5e\x79\x05\xc7\x71\x3c\xc3\x30\x36\x02\xff\x25\
-\xb9\xe2\x50\x1e\xa4\xf2\x5a\xff\xf8\xa2\xe3\x80\xe7\x41\x18\x52\
-\xaa\x35\x71\x98\x1e\x06\xc1\xb7\x57\x35\x37\x13\x73\xdd\xbf\x89\
-\xc4\x62\x4d\x2d\x2d\x2d\xec\xdb\xb7\xaf\xb8\x4a\x06\x41\x70\xc3\
-\x35\x9f\xcf\x53\x5b\x5b\xcb\xba\x75\xeb\x50\x4a\x99\x61\x18\xbe\
-\x0c\xdc\x51\x04\xe0\x02\x3e\xbc\x76\x1e\x2e\x8f\xce\xf0\x15\x80\
-\x0d\x6b\x67\xa6\x52\x95\xf5\x67\xcf\xf6\x79\xa6\xb9\x29\x62\x9a\
-\xa7\x0f\x1e\x3c\x48\x53\x53\x13\x42\x88\x31\x7d\x9b\x1b\xa9\xae\
-\xeb\xb2\x70\xe1\x42\x56\xac\x58\x01\x30\x53\x6b\xfd\x94\x64\x64\
-\xf6\xf1\x46\x00\x74\x65\x60\x6f\xdf\x28\x00\xa5\x40\x04\x2a\x73\
-\xb0\xfa\x4f\xda\xda\x98\x3e\x3c\xdc\xa9\x4d\xf3\x6f\x81\xc1\xb7\
-\xde\x7a\x8b\x93\x27\x4f\x22\xa5\xfc\x4c\x58\x28\xac\x2f\xb7\xdf\
-\x7e\x3b\xe5\xe5\xe5\x68\xad\x6f\x1a\xc3\xc0\x15\x16\xfe\xa5\x13\
-\xdc\x02\x0b\x0a\x98\x01\xe4\xe0\x4f\xe3\xb9\x1c\xf3\x3b\x3b\x09\
-\xa5\xfc\x6f\xa5\xd4\x13\xae\xeb\xf2\xe6\x9b\x6f\xd2\xdd\xdd\x8d\
-\x10\xe2\x86\x03\x00\x70\x1c\x87\xb7\xdf\x7e\x9b\x4b\x97\x2e\x21\
-\xa5\x3c\x31\x11\x80\x83\x29\x78\xfd\xec\x28\x16\xa6\x8d\x30\x54\
-\x97\x05\x51\x77\xf2\x24\xc9\xe1\x61\x42\xc3\x78\xc9\x34\xcd\xa7\
-\x86\x86\x86\xd8\xbd\x7b\x37\xa9\x54\xea\x86\xba\x53\xa1\x48\xdc\
-\xb5\x6b\x17\x07\x0f\x1e\x04\x68\x96\x52\x7e\x7b\x8c\x0b\x15\x34\
-\x80\xe7\x4f\x82\x93\x2b\x64\x00\x20\x84\x19\x0e\x98\xd2\xf7\xa9\
-\x3b\x75\x0a\x46\xf2\xf5\x0f\x4d\xd3\x7c\xb1\xbf\xbf\x9f\x7d\xfb\
-\xf6\x61\xdb\x76\x31\x05\x7e\x9a\x2a\x84\xa0\xaf\xaf\x8f\x37\xde\
-\x78\x83\xe3\xc7\x8f\x63\x9a\xe6\x4e\x21\xc4\x3d\x40\xc7\x48\x2d\
-\x34\x4e\x7d\x38\x3c\x08\xaf\x76\x8e\x62\xc1\x03\xc3\x03\x91\x07\
-\x2a\xba\xba\x48\xa4\x52\x84\x23\x65\xee\x77\x22\x91\xc8\x7f\x9e\
-\x3a\x75\x8a\x03\x07\x0e\xe0\x79\xde\xa7\x96\x99\xc2\x30\x44\x08\
-\x41\x7b\x7b\x3b\x3b\x77\xee\x2c\x2c\x64\xff\x2a\x84\xd8\x04\x5c\
-\x84\x2b\xb5\x90\xcb\x47\x25\x80\xe7\x3b\xe0\xab\x8b\x20\xee\x8f\
-\x00\xf3\x04\x68\x01\x18\x8e\xc3\xec\xbe\x3e\xd2\x33\x66\x20\x3c\
-\x2f\x0b\x3c\x6c\x9a\xe6\x17\x5b\x5a\x5a\x1a\xe2\xf1\x38\x4b\x96\
-\x2c\x61\xa2\xc2\xeb\xe3\x48\xa1\x53\x77\xec\xd8\x31\x0e\x1d\x3a\
-\x84\xe3\x38\x4e\x24\x12\xd9\x06\x6c\x1f\xfd\x5e\xa3\xe0\x42\x13\
-\xc8\xfb\x7d\xb0\xb7\x0b\xbe\xe6\x8e\x00\xb8\x60\x5c\xc1\x1a\x02\
-\xa5\x17\x2e\xa0\xe6\xcf\x1f\x71\x25\xad\x2f\x09\x21\x36\x1b\x86\
-\xb1\xa7\xa9\xa9\xa9\xb2\xa4\xa4\x84\xba\xba\xba\x4f\x5c\x6e\x28\
-\xa5\x08\x82\x80\xa3\x47\x8f\xd2\xdc\xdc\x8c\x10\xe2\x92\x61\x18\
-\xdf\x00\x5e\x1f\x7f\xef\x55\x19\xb8\x72\x7d\x4f\x3b\x7c\x2d\x02\
-\xd8\x70\x3a\x52\x98\x1d\x20\x36\x30\x80\x95\xcf\xe3\xc6\xe3\x88\
-\x91\xd5\xb8\x59\x08\xf1\x48\x10\x04\xff\xde\xd4\xd4\x14\x2b\x29\
-\x29\x61\xfa\xf4\xe9\x1f\xbb\x72\x35\x0c\x03\xc7\x71\x38\x7c\xf8\
-\x30\xed\xed\xed\x18\x86\xd1\x23\x84\x78\x40\x6b\xfd\xfb\x09\x99\
-\xd2\x5a\xb3\xfd\xea\xbd\xf8\x05\x0a\x5a\x80\x88\x03\xeb\x04\xec\
-\x2a\xce\x12\xf0\xe1\x97\xbf\x4c\xdf\xcd\x37\xa3\xc6\xce\xf4\x5f\
-\xfb\xbe\xff\xd3\x64\x32\xa9\x56\xae\x5c\x59\xdc\x9c\x4c\x45\x22\
-\x91\x08\xd9\x6c\x96\xc3\x87\x0f\xd3\xd7\xd7\x87\x52\x6a\x9f\x10\
-\x62\x33\xd0\x7d\xb5\x83\x95\x49\x19\x00\x7a\x35\x84\x1a\xda\x05\
-\xfc\x6e\xf4\x80\x06\xa2\xa9\x14\xe2\xa3\x7e\xfe\x73\xd3\x34\xbf\
-\x34\x38\x38\xf8\xbd\xa6\xa6\x26\x96\x2d\x5b\x56\xdc\x2a\x5e\x4d\
-\xb4\xd6\xc4\x62\x31\xfa\xfb\xfb\x79\xef\xbd\xf7\x18\x1e\x1e\xc6\
-\x34\xcd\x9f\x68\xad\xb7\x00\x99\x49\x19\xbb\x06\x80\x04\x23\x87\
-\x15\x3f\x05\xb2\xa3\x07\x7c\xc0\x1c\x1c\xc4\xf0\x3c\xb4\x52\x30\
-\x16\xc8\xb3\xa6\x69\xd6\xf6\xf6\xf6\x3e\xf8\xc1\x07\x1f\xb0\x60\
-\xc1\x82\x62\xdb\x65\xbc\xe1\x85\xed\xe6\x99\x33\x67\x68\x6d\x6d\
-\xc5\x75\x5d\xdf\x30\x8c\x1f\x01\xcf\x70\xd5\xf0\x1c\x07\x60\x92\
-\xbb\x6e\x06\x9a\x81\x1d\xe3\x07\x04\x20\xd2\x69\x44\x10\x10\x1a\
-\xc6\x78\x26\x5c\xe0\x51\xc3\x30\x2a\x4e\x9d\x3a\xd5\x68\x59\x16\
-\xd5\xd5\xd5\x64\xb3\xd9\x62\xbd\x5f\xe8\x44\x47\xa3\x51\x3a\x3a\
-\x3a\x68\x6b\x6b\x43\x08\x31\x6c\x18\xc6\x37\xb5\xd6\xaf\x5c\xcb\
-\xf0\x31\x00\x26\x49\x76\x87\x34\xdc\x07\x0c\x4f\x04\x20\x9c\x3c\
-\x4d\x66\x85\x10\xdf\x50\x4a\xfd\xbe\xad\xad\x6d\x5e\x34\x1a\xa5\
-\xb4\xb4\x94\x5c\x2e\x87\x10\xa2\xd8\xdc\x3a\x76\xec\x18\x5d\x5d\
-\x5d\x28\xa5\xce\x09\x21\x1e\x04\xf6\x4f\xd5\x78\xb8\x76\x73\x37\
-\x03\x9c\xbb\xea\xe8\x95\xd3\xcd\xf1\xa7\x2c\xa3\x4e\x5b\xce\x0a\
-\x21\x1e\xd6\x5a\x0f\xb7\xb6\xb6\x92\xcd\x66\x8b\x3d\x1e\x21\x04\
-\x2d\x2d\x2d\x05\xe3\x8f\x0b\x21\xd6\x7d\x5c\xe3\xa7\x02\xe0\x9a\
-\x22\xae\xec\x63\x27\xd1\xdf\x2a\xa5\x1e\xf4\x3c\xcf\x39\x71\xe2\
-\x44\xb1\x29\x70\xe4\xc8\x11\x06\x06\x06\x30\x4d\xf3\x3f\xa4\x94\
-\x77\x00\x47\x3f\xc9\xf7\xaf\xeb\x80\x23\x88\xc7\xd1\x4a\x4d\x94\
-\x89\xc6\xcb\x4e\xa5\xd4\x13\xe9\x74\xfa\x9f\x9a\x9b\x9b\x09\x82\
-\x00\xd7\x75\x51\x4a\xfd\x03\xf0\x14\x53\x08\xd6\x1b\x02\x20\x34\
-\x0c\xf4\x14\xcf\x73\x81\x1d\x4a\x29\x1c\xc7\xd9\x0c\xb8\x4a\xa9\
-\x9f\x69\xad\x5f\x60\xd2\x10\xbc\xb6\x88\x3f\xfc\x5b\xe5\x73\x96\
-\xff\x03\x78\xa9\x39\x37\xc6\x78\x8a\x32\x00\x00\x00\x25\x74\x45\
-\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\x32\x30\
-\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x36\x3a\x30\x38\x3a\x34\
-\x34\x2d\x30\x37\x3a\x30\x30\x76\x96\xce\x47\x00\x00\x00\x25\x74\
-\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\
-\x30\x31\x30\x2d\x30\x32\x2d\x32\x32\x54\x31\x33\x3a\x34\x38\x3a\
-\x33\x38\x2d\x30\x37\x3a\x30\x30\x28\x74\xc0\x74\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\
-\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\x32\x32\
-\x3a\x31\x33\x2d\x30\x37\x3a\x30\x30\x98\xc8\x9f\x4a\x00\x00\x00\
-\x35\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\x74\
-\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\
-\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\x73\
-\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\x2f\x3b\xc1\xb4\x18\x00\x00\
-\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\x74\
-\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x36\x3a\
-\x30\x38\x3a\x34\x34\x2d\x30\x37\x3a\x30\x30\x29\x27\xb8\x73\x00\
-\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\
-\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\x79\
-\x71\xc9\x65\x3c\x00\x00\x00\x0d\x74\x45\x58\x74\x53\x6f\x75\x72\
-\x63\x65\x00\x4e\x75\x76\x6f\x6c\x61\xac\x4f\x35\xf1\x00\x00\x00\
-\x34\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\
-\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x63\x6f\x6e\x2d\
-\x6b\x69\x6e\x67\x2e\x63\x6f\x6d\x2f\x70\x72\x6f\x6a\x65\x63\x74\
-\x73\x2f\x6e\x75\x76\x6f\x6c\x61\x2f\x76\x3d\xb4\x52\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x44\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x06\xd6\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x03\xee\x00\x80\x00\x62\x41\x17\x60\x34\x99\x05\x65\x00\xf1\x8f\
-\x7f\x0c\x0c\xbf\xff\x43\xd8\x70\x05\x0c\x7c\x0c\x7f\xff\x4f\x65\
-\xf8\xf2\x47\x90\x81\x9d\xa5\x99\xe1\xff\xff\x93\x0c\x7f\x81\xe2\
-\xff\x80\xea\x80\xca\x81\x72\x0c\x70\xfe\x5f\x24\xb1\x7f\x10\xb1\
-\xff\xbf\x0a\x51\xec\x03\x08\x20\xdc\x21\x00\x4a\x1a\xac\x40\x9b\
-\xd1\x55\xfc\xfe\xa7\x2b\xcc\xc7\x1e\xe3\xea\xac\xe0\xcd\xfc\xfb\
-\xef\x1e\x86\xef\x7f\xaa\x81\xa2\xec\xe4\x86\x00\x40\x00\xe1\x8f\
-\x02\x66\xa0\x03\x38\x98\x51\xc5\xfe\xfe\x67\xe2\x60\x62\x64\x98\
-\xd1\xee\xc8\xb0\x7a\x8e\x37\x8f\xa2\x2c\x7f\x0b\xc3\xfb\x1f\xbb\
-\x80\x21\xa1\x4b\x8e\x03\x00\x02\x08\xbf\x03\xfe\x43\x55\x70\xa0\
-\x2a\xfb\x03\x0c\xd2\x3f\xbf\xff\x31\x04\xba\x2b\x31\xec\xdb\x10\
-\xcc\x10\x9b\xa8\x67\xc7\xf8\xe5\xcf\x6e\x60\x68\x14\x00\xa5\xd9\
-\x48\x71\x00\x40\x00\x11\x97\x08\x19\x81\x21\xc1\xca\x84\xe6\x36\
-\x70\xa4\x32\x28\x48\xf3\x30\x2c\x98\xe8\xca\x30\x6b\x9a\x9b\xb8\
-\x88\x20\x47\x3f\xc3\xe7\x5f\x0b\x81\xe9\x44\x94\x58\x07\x00\x04\
-\x10\x71\x0e\xf8\x0f\x4d\x94\x2c\xe0\xd4\xf8\x1d\x92\x16\x81\x09\
-\x0a\x98\xd8\x9e\x7f\x04\x12\x40\x46\x4a\xb4\x36\xc3\x9e\x2d\x21\
-\x0c\xc6\xe6\x92\x11\x0c\x6f\xbf\x6f\x07\x26\x38\x6d\x62\x8c\x06\
-\x08\x20\x16\x2c\x62\xaa\x0c\x3f\xff\xda\x30\xfc\x01\x26\x59\x46\
-\x06\x48\x29\x05\xf2\xec\x1f\x20\xf3\xff\xff\x3f\x0c\xdf\xfe\x68\
-\xfc\xe1\x60\x65\x00\x15\x60\x8c\x8c\xff\x18\xe6\x5f\x62\x62\x90\
-\xe2\x65\x60\x88\xd4\xf9\xc3\xa0\xaf\x25\xc2\xb0\x6b\x7d\x30\x43\
-\x79\xcd\x21\xe3\x39\xd3\x2f\xec\x01\xe6\x92\x7c\x06\x16\xa6\x55\
-\xf8\x1c\x00\x10\x40\x2c\x58\x7c\xbb\x5a\x49\x86\x57\x5f\x90\x9b\
-\x0d\x98\xde\xfe\x43\x3c\xff\x0f\x9a\xb5\x80\xd4\xef\xef\x7f\x19\
-\x44\xf9\xd8\x19\xd8\x58\x98\x18\xfe\xff\xfb\xc7\xf0\x0b\x98\x4d\
-\x17\x5f\x61\x65\x78\xf8\x91\x91\x21\xc5\xf0\x2f\x83\xb4\x00\x1b\
-\xc3\xac\xc9\xae\x0c\x4a\x8a\x02\x12\xb5\x55\x87\x56\xfc\xfd\xf3\
-\x5f\x88\x81\x95\x79\x06\x03\x03\xf6\x12\x17\x20\x80\x30\xcb\x81\
-\xbf\xff\x94\x3a\x4b\xcc\x19\xbc\xac\xa4\x18\xbe\x7e\xff\x03\xcc\
-\x08\x8c\x0c\x8c\x4c\x4c\x90\xa2\x00\x94\x16\x80\x2c\x66\x60\xc4\
-\xb1\x03\x73\xc8\xcf\x1f\xbf\x81\x21\xc3\xc4\xc0\x01\x14\x3f\xfd\
-\x9c\x85\xe1\xe9\x67\x66\x86\x3c\xd3\xbf\x0c\x3a\xe2\x0c\x0c\x95\
-\xc5\xa6\x0c\x12\xe2\x5c\x8c\x99\xe9\xbb\x27\xff\xfc\xf5\x87\x9d\
-\x81\x99\x79\x22\x36\x07\x00\x04\x10\xb6\x34\xf0\x8b\x1d\xe8\xbb\
-\x7f\x3f\x7f\x03\x7d\xfb\x8b\xe1\x37\xd0\x92\xdf\x40\xf6\xdf\x5f\
-\x7f\x18\xfe\xfd\x01\x06\xc3\x5f\x08\xfd\xfd\xe7\x1f\x86\xbf\xc0\
-\xa8\xf9\xf3\xe7\x0f\xc3\x9f\x9f\xbf\x18\xb8\x98\xfe\x30\xbc\xfa\
-\xc6\xc0\xd0\x76\x8c\x99\xe1\xe0\x7d\x46\x70\x70\x25\xc6\x68\x33\
-\x4c\x99\xe2\xc2\xc2\xce\xc2\xd8\xc7\xf0\xfb\xaf\x1f\x36\x07\x00\
-\x04\x10\xb6\x34\x00\x34\xf4\x2f\xd0\xe7\xff\x19\x76\x5d\xf8\xc0\
-\xb0\xec\xc4\x47\x06\x6e\x4e\x56\x06\x56\x36\x56\x06\x66\x56\x16\
-\x20\x86\xd0\xac\xac\xcc\x0c\x2c\x6c\x2c\x40\x4b\x99\x19\x98\x81\
-\x39\xef\xd7\xaf\xdf\x0c\x6c\xc0\x0c\xf8\xf3\x0f\x0b\xc3\x84\x33\
-\x4c\x0c\x5f\x80\xd9\xd4\x5b\xed\x1f\x43\x4a\xa2\x0e\xc3\x97\x2f\
-\xbf\x98\x0a\xf3\x76\x4f\x65\x60\x66\xbb\x0e\x34\xfe\x36\xb2\x5d\
-\x00\x01\xc4\x82\x33\xe7\x01\xf1\xcb\xf7\xbf\x18\x4e\xdd\xfa\xc8\
-\xc0\xcb\x03\x8c\x73\x76\x36\x06\x16\x76\x88\x43\x58\x58\xd9\xc0\
-\x96\xb3\x00\xd9\x5c\xc0\x04\xc9\xc6\xc1\xc8\xf0\xe7\x17\x24\x8d\
-\xb0\x01\xcb\x44\x46\x26\x16\x86\xd9\x17\x98\x80\xe9\xef\x1f\x83\
-\xbb\xca\x7f\x86\xdc\x2c\x43\x86\xcd\x9b\xee\xc8\xec\xdb\xf3\x20\
-\x07\xa8\x2a\x1f\xd9\x1e\x80\x00\xc2\x9a\x0d\xff\x01\x13\xdf\x3f\
-\x50\xc2\x03\x26\x7f\x56\x20\x06\x26\x47\x06\x16\x60\x56\x63\xf9\
-\xf7\x07\x8a\x7f\xc3\xd9\xff\x40\x51\x00\xf4\x3d\x0c\x83\xa2\x8b\
-\x09\x24\x07\x34\x79\x1e\x30\x87\x5c\x7b\xf5\x0f\x18\xfd\x8c\x0c\
-\x59\xd9\x86\x20\x6f\x39\xa2\xdb\x05\x10\x40\x38\x43\xe0\xdf\xff\
-\x7f\xc0\xe8\xfe\x03\x34\xf0\x27\xc3\x6f\x36\x46\xa4\x02\x01\x94\
-\x1b\x11\x69\xfa\x3f\x72\x61\x01\x6d\x5b\x80\xf2\x0e\x0b\x30\x3a\
-\xbe\xfd\x65\x61\xf8\xfc\x13\x22\xc6\xcd\x0d\x2a\x20\x19\x31\x4a\
-\x49\x80\x00\x62\xc1\x5d\xf8\x80\x8a\x5b\x60\x62\xfb\xf6\x9b\x81\
-\x15\xe8\x1d\x50\xfa\x63\x01\x86\x0a\x2b\x30\xe1\x31\x43\xd9\x7f\
-\x80\x6c\x0e\x44\xe6\x80\x17\x9a\x20\x2b\x3f\xff\x62\x62\x88\xd4\
-\xfb\xc7\x60\x2e\x09\x11\x5f\xbc\xf8\x0a\x28\x75\x9d\x41\xb7\x06\
-\x20\x80\xf0\x84\xc0\x7f\x60\x35\xf0\x9f\x81\x8b\xf9\x1f\x03\x3b\
-\x30\x2e\x59\x81\x98\x19\x44\x33\x02\xa3\x02\x68\x0b\x0b\x23\x30\
-\x8e\x19\x40\x51\xc0\xc8\xf0\x9b\x11\x5a\x62\xfd\x87\xd4\xc2\xc0\
-\x40\x63\x08\xd1\x63\x62\x88\xd5\x01\x56\x64\x2c\x9c\x0c\x1b\x37\
-\xdf\x63\x58\xb6\xf8\xfa\x17\x60\xb0\xcc\x40\xb7\x07\x20\x80\x58\
-\x70\x15\xbd\x9f\xbf\xfd\x61\x70\x37\x12\x62\xb0\xd2\x12\x00\x5a\
-\xcc\xc8\xc0\xc4\xc2\xcc\xc0\x04\xa2\x81\x65\x02\x33\x10\x83\x68\
-\x50\xc8\xf4\xec\xfe\xc0\x70\xee\xc9\x2f\x06\x3e\xa0\xcf\xbf\x83\
-\x4a\x4b\x60\xb0\xc4\x9a\xb2\x32\x24\x1a\x03\xcb\x0a\x4e\x0e\x86\
-\x83\x47\x1e\x33\xa4\xa6\xed\x00\x99\x5a\xcb\xc0\xc4\x78\x04\xdd\
-\x2a\x80\x00\xc2\xe2\x00\x46\x66\x76\x36\x26\x06\x21\x01\x4e\x06\
-\x4e\x60\x0a\x67\x67\x03\x5a\x0c\x0a\x57\x50\x81\x04\x6a\x1e\x00\
-\x2d\x06\x31\x7e\x02\xcb\x81\xdf\xbf\xfe\x02\x13\xe8\x3f\x70\x3a\
-\xf9\x08\x74\x35\x27\x27\x1b\x43\xbe\x1d\x37\x43\xa8\x11\x1b\x03\
-\x27\x2f\x27\xc3\x89\xd3\x2f\x18\xa2\xa3\xb7\x32\xbc\x7e\xf1\x65\
-\x1a\x03\x07\xdb\x04\x70\xf0\xa0\x01\x80\x00\xc2\x70\xc0\x7f\x66\
-\x86\x2f\x3d\x4b\xae\x0a\xac\xde\xcb\xc3\xf0\xfb\x0f\x22\x51\x31\
-\xfe\x63\x04\x87\xef\x9f\x5f\xff\x18\x84\x79\xd8\x18\x4a\x53\x75\
-\x19\x40\xe9\xea\x07\x30\xd5\xbf\xfb\xf4\x8b\x41\x57\x1e\x28\xe6\
-\xc5\xcb\xe0\xa8\xc1\x01\xb6\x7c\xf3\x8e\x07\x0c\x49\x49\x3b\x19\
-\xde\xbc\xf8\x36\x89\x81\x8b\xbd\x04\x9c\x40\x99\x19\x31\x1c\x00\
-\x10\x40\x2c\x58\xaa\xde\xe4\x83\xc7\x9e\x39\x03\x83\xf2\x2f\xbc\
-\x29\xf6\x17\x5e\x19\x01\x53\xe5\x5f\x59\x61\x21\xce\xf8\xd4\x08\
-\x75\x06\x1e\x11\x76\x86\xaf\xdf\x7e\x31\xb8\x00\x2d\xad\xf2\x17\
-\x66\xd0\x90\xe1\x62\x60\x64\xe7\x60\xe8\x99\x72\x81\xa1\xae\xfa\
-\xe8\xef\xef\xdf\xff\xb4\x31\xf0\xb2\x36\x02\xf5\xe2\x6c\x7a\x03\
-\x04\x10\xb6\x34\xb0\x0b\xd8\x0a\xda\x05\x0a\x0a\x44\x8a\x84\x3a\
-\x00\x14\x84\x4c\xcc\xc6\x2c\x3c\xac\xf1\xa0\x64\x07\x2c\xe3\x19\
-\x92\x1d\x84\x19\x74\xe5\x38\x19\xa4\xc4\x79\x18\x3e\x7e\xff\xcf\
-\x50\x5a\xbc\x9f\x61\xe1\xdc\x2b\x6f\x19\x38\x58\x32\x19\x38\x59\
-\x56\x33\x10\x68\xf5\x03\x04\x10\x0b\x49\xed\x27\x48\x52\xe7\x02\
-\x07\xca\x3f\x48\x61\x65\xa6\xc2\xc5\x20\x28\xc2\xc3\x70\xfa\xe2\
-\x3b\x86\xbc\xf2\x23\x0c\xe7\x8e\x3d\x3b\xcf\xc0\xcf\x96\x04\x54\
-\x7b\x01\xdc\x18\x25\x00\x00\x02\x88\x38\x07\xc0\x5a\xb6\xc8\x42\
-\x40\xcb\x79\xb9\x81\xda\x99\x59\x19\x26\xcc\xbe\xce\xd0\xd6\x73\
-\xfa\xcf\xc7\x37\x3f\x16\x31\x08\xb0\x57\x01\xd5\xbf\x24\xc6\x72\
-\x10\x00\x08\x20\xfc\x0e\x60\x84\xc5\xff\x3f\x0c\x61\x11\x61\x4e\
-\x86\xe7\x6f\x7e\x33\xe4\x35\x1c\x66\xd8\xb7\xfd\xc1\x33\x60\x70\
-\xe7\x31\xf0\xb1\xad\x05\x5b\x4c\x42\x67\x0b\x20\x80\xf0\x3b\x00\
-\x5c\xaa\xa0\x99\x06\xcc\x93\xff\x80\xe5\x41\xef\xdc\x2b\x0c\x6b\
-\xd7\xdd\xf9\xf3\xf2\xd9\x97\x0d\x0c\xbc\x6c\x65\x40\x57\xdd\x07\
-\x3b\x96\x44\x00\x10\x40\x2c\x78\xe3\xfb\x07\x16\xaf\xb0\x32\xdd\
-\x7e\xf5\xf1\xe7\xf1\x69\xb3\xaf\xf0\x03\x8b\xc3\x6e\x06\x5e\xf6\
-\xa5\xc0\x04\xfa\x1b\x5b\x1e\x27\x06\x00\x04\x10\xe3\x40\x77\x4e\
-\x01\x02\x68\xc0\xfb\x86\x00\x01\x34\xe0\x0e\x00\x08\x30\x00\xdb\
-\x43\x72\xa0\x2a\x63\x1e\xb1\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x04\xc6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x04\x43\x49\x44\
-\x41\x54\x58\x85\xcd\x57\x4b\x6f\x1c\x45\x10\xfe\xaa\xab\x7b\x66\
-\x76\x67\xbc\x99\xc5\x96\xd7\xeb\x68\x51\x14\x10\x0e\x48\xe1\x21\
-\x21\xf9\x10\x59\x1c\x82\x20\x42\x42\xf2\xc1\xe2\x60\x9f\x80\x28\
-\xc6\x37\x9f\xf2\x1f\xb8\x71\x5b\x62\x41\x38\xd9\x07\xe4\x83\x4f\
-\x48\x20\xe5\x80\xac\x1c\x2c\x21\x11\x40\x09\x09\x20\x04\x58\x89\
-\x6d\xc0\xec\x26\x59\x3f\x76\x5e\xcd\xc1\x8f\x9d\xd9\x99\xb1\xf3\
-\x42\xa6\xa4\x3a\x4c\x75\x4d\xd7\x37\x5f\x57\x57\xd5\x90\xd6\x1a\
-\x47\x29\xe2\x48\xa3\xff\x1f\x00\xc8\x87\x71\x7e\xbf\x6e\x0d\x11\
-\xc4\x28\x0b\x31\x16\x41\xd7\xa2\x48\x97\x01\x40\x08\x6a\x08\xd0\
-\x72\x18\x45\xf3\x1a\xd1\xc2\xa7\x53\xdb\xb7\x1e\x74\x4f\x7a\x90\
-\x1c\x98\x9c\xb1\xab\x5a\xd3\x2c\xa0\x87\x9f\x72\x4b\x5c\xee\xb1\
-\x4d\x4b\x49\x18\x6a\x07\xbf\xe7\x07\xd8\xf6\x03\x34\xee\x6f\xb4\
-\xff\x69\xde\x0b\x01\x5a\x22\xd2\x13\x97\x2e\x6c\xac\x3c\x36\x80\
-\xf3\xf5\xe2\x38\x88\xea\x03\xbd\x6e\x61\xb0\xaf\xac\x88\xe8\x40\
-\x7f\xad\x35\xee\xfc\xdd\xf0\x57\xd7\x9b\x5b\xd0\x7a\xea\x93\xa9\
-\xcd\xb9\x47\x02\xf0\xee\x47\x65\x57\x59\xde\x9c\x94\x72\xe4\xe4\
-\xf1\x8a\x53\xb0\x8c\xee\x50\x07\x02\xd9\xda\xf6\xf0\xeb\xed\xb5\
-\x56\x10\x84\x8b\xfe\xb6\x31\xfe\xd9\x74\xa3\x99\xe5\x97\x9b\x84\
-\x6c\x79\x73\x6e\xc9\x39\x7b\xea\xc4\xa0\x63\x1a\x12\x51\x14\x75\
-\xa9\x3e\x50\x4d\x43\xe1\xd4\x89\xe3\x8e\x5b\x72\xce\xb2\xe5\xe5\
-\xb2\x90\xc9\xc0\xf9\x7a\x71\xdc\x50\xf2\xd2\x73\x4f\x0f\x3a\x59\
-\x94\xff\x79\xed\x59\x7c\xf5\xf9\x6a\xc2\xf6\xc6\x3b\x03\xe8\x7f\
-\xf9\x97\x94\xaf\xd6\x1a\x3f\xfd\x71\xa7\xe5\xf9\xc1\x64\xd6\x71\
-\xa4\x18\x98\x9c\xb1\xab\x92\xb9\x5e\x1b\xe8\x73\x34\x34\x22\x1d\
-\xa5\xd4\xe0\x02\x98\x39\xa1\x06\x17\x92\x7e\xbb\x4c\x69\xad\x51\
-\xab\xf4\x39\x92\xb9\x3e\x39\x63\x57\x0f\x05\xa0\xa4\x9a\xed\x75\
-\x4b\x05\x43\xca\x5c\x7a\x41\x94\x02\x00\xa2\xa4\x9f\xee\xa8\xa1\
-\x24\x7a\xdd\x52\x41\x49\x35\x7b\x20\x80\xe9\xcb\xa5\x21\x16\x3c\
-\xec\x3a\x45\x95\x3e\xf3\x8e\x12\x89\x14\x00\x22\x91\xf2\x0b\x63\
-\x7a\xcc\x29\x28\x16\x3c\x3c\x7d\xb9\x34\x94\xcf\x80\x34\x46\xed\
-\xa2\xc9\x3b\x34\xea\x5c\x25\x42\x06\x00\x20\xd4\xba\xa3\x19\xcc\
-\xd9\x45\x93\x21\x8d\xd1\x44\xc8\xf8\x83\x21\xc5\x98\xa5\xa4\x19\
-\x45\x9d\xc4\x6c\xfe\xf8\x4c\x02\xa3\x06\xb0\xb9\x1a\xed\xd0\x1e\
-\x93\xb5\xdf\x23\x14\xdb\x27\xbb\x19\x86\xfb\x7c\x27\x31\x4d\x25\
-\xcd\x20\x08\xc6\x00\x7c\x98\x09\x80\x49\xd4\x88\x08\x51\x14\xed\
-\xdb\xae\x5d\xc9\xba\xa9\xcd\x14\x80\x9f\xaf\x37\x81\xeb\x69\xdf\
-\x91\xa1\xce\xc7\x10\x11\x98\x44\x2d\xbe\x9e\x00\x20\x98\xcb\x1a\
-\x3b\x54\xee\x83\xea\x0a\xf4\xb0\x12\x67\x73\x2f\x46\x2e\x00\xc9\
-\xc9\xaf\x07\x00\x29\x1f\xaa\x5f\xa5\x01\xe8\xae\xfd\x38\x59\x57\
-\x92\x47\xc0\xdc\x08\xc3\xb0\x12\xaf\x4d\x4f\x92\x81\xdd\xe4\x6d\
-\xe4\x03\x10\xb4\x1c\x86\x54\x89\xa3\x7e\xfd\xed\x64\x12\x02\xc0\
-\xda\xb2\x87\x1b\x3f\xdc\x49\xd8\x5e\x38\x3d\x88\x4a\xad\xbb\x5f\
-\x00\x2b\xd1\x52\x67\x7f\x16\x60\x41\xcb\xf9\x00\x98\xe7\x65\xa4\
-\x4f\xfb\x41\x60\xee\xd9\x6e\xdb\xa9\xda\x81\x52\xff\x9b\x29\x66\
-\x8a\xfd\xf7\x70\xdb\xfe\x32\xe5\x1b\xef\x59\x26\x73\x9b\x99\xe7\
-\xe3\xcb\x89\xb4\x15\xac\x16\x2c\xd3\x08\x0f\x6b\x34\x40\x46\x25\
-\x44\xbc\x12\x66\x17\x30\xcb\x54\xa1\x60\xb5\x90\x0b\xe0\xe2\xb9\
-\x9b\xb7\x98\xc5\x92\x5d\x30\xfd\xac\x1e\xb0\xa7\x99\x85\x08\x48\
-\x75\xca\x30\xa6\x76\xc1\xf2\x99\x79\xe9\xe2\xb9\x9b\x89\x69\x29\
-\x95\xe2\xa2\xc0\x13\x2e\xdb\x37\xb7\xda\x9e\xf2\xfc\x20\x4d\x29\
-\xb0\x5f\x8a\x13\x36\x21\x12\xd7\x37\x2e\x86\x92\x70\x7b\xec\xad\
-\xd0\xc0\x44\x2a\x5e\xb7\x61\x7a\xe4\xc6\x0a\x29\x31\x35\xd0\xe7\
-\xb6\xb4\x4e\xd3\x19\xee\x5e\xd3\xf4\x11\x20\x93\x76\xad\x35\xaa\
-\x7d\x6e\x8b\x94\x98\x9a\x1e\xb9\x91\x1a\xd1\x72\x27\xa2\x8f\xbf\
-\x7e\xf1\x8b\xbb\xad\xcd\xb3\x2b\xeb\x0d\xa3\xdb\xa7\xc7\x2a\xc3\
-\x2d\x56\x76\x1e\x76\x97\x9a\x9b\x6b\xb8\xbf\x9d\xb8\x61\x20\x22\
-\x54\xfb\xca\xde\x31\xa7\x78\xe5\x83\xd7\xbe\x7f\x2b\x2b\x4e\x6e\
-\x95\xb1\x34\x8f\xf3\x31\x7b\xae\xa7\x68\x8d\xfc\xb6\xf2\x97\xb3\
-\xd5\xf6\xb0\x17\xf1\xee\xe6\x3a\xee\x6e\xae\xe7\xbd\x0a\x00\x28\
-\x98\x06\x4e\x54\xfb\x5b\x4a\xf1\xa2\x0a\xc4\x78\x9e\xdf\xa1\x43\
-\xe9\xcc\xd5\x57\xc6\x49\xeb\xfa\xda\x7a\xb3\xb0\xba\xde\x54\x87\
-\xf9\x13\x11\x06\x7a\x5d\xbf\xd2\xeb\x6e\x69\xa2\xa9\x0b\x67\xbe\
-\x7d\xb4\xa1\x34\x01\x62\xf1\xd5\x2a\xb4\x3f\xab\x81\xe1\xc6\xbd\
-\x16\x37\x5b\x1b\x66\xdb\xf3\xe1\xf9\x21\x00\xc0\x90\x0c\xd3\x50\
-\x70\x7b\xec\x76\xb9\xe4\x84\x04\x2c\x81\xd4\xc4\x85\x91\x6f\x1e\
-\x7f\x2c\x8f\xcb\xe5\xab\x2f\x0d\x69\x4d\xa3\x41\x14\x8d\x11\xa8\
-\x26\x98\xca\x00\x10\x85\xba\xa1\xa1\x97\xa5\x10\xf3\x44\x7a\xe1\
-\xbd\x33\xdf\x3d\xd9\x1f\x93\xff\x52\x8e\xfc\xdf\xf0\xc8\x01\xfc\
-\x0b\x5d\x94\xad\x35\x93\x65\x15\xa5\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x04\x39\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x04\x00\x49\x44\x41\x54\x78\x5e\xa5\x94\xff\x8b\x54\x55\
-\x18\xc6\x3f\xe7\x9c\x3b\x33\xbb\x3b\xcb\xcc\xae\xae\x9a\x62\x8b\
-\xa9\x56\xea\x22\x99\x10\x1b\xe0\x2a\x14\x45\x00\x42\x06\xd2\x1f\
-\x11\x54\x04\xf4\x53\x3f\x16\x11\x11\x54\x14\x04\xf5\x53\x04\x41\
-\x82\x94\x84\xe4\xb0\xa8\x68\x81\x41\xd9\x22\x96\xed\xae\xee\xea\
-\x18\xe2\x98\xee\xac\x33\xf7\xcb\xdc\x7b\xcf\x39\xdd\x7b\xf0\xe2\
-\xc0\x56\x60\xbd\xf0\xf0\xce\x73\xcf\xfb\x3e\xf7\xbc\x0f\x77\x5e\
-\x61\xad\xe5\x7e\xc3\xfb\xdc\x53\xaf\xee\x7a\x65\x6e\xc7\xaa\x1d\
-\x6b\x52\x9b\xda\x85\xa5\x85\xf6\xc7\xdf\x7c\xb8\xb5\xfd\x46\x37\
-\xa6\xa8\xe1\x3f\x84\x2d\xd9\xd2\xe4\xd8\xe4\x03\xdb\x46\xb6\x0d\
-\x86\x36\xa4\x56\xae\x95\xc0\x0e\x01\xff\x4f\x58\x68\x41\x90\x04\
-\xa6\x13\x77\x08\x08\x08\x93\xd0\x82\x00\xe0\xbe\x85\x07\x3f\xa9\
-\xec\xb2\xca\x8e\x5b\x05\x0a\x59\x0e\xe3\x80\x3b\xf1\x1d\x42\x42\
-\x82\xc4\xb7\x76\xc0\x3e\x3b\xfa\xf6\xb0\x2f\x52\x01\x86\x45\xe7\
-\xb1\x10\xa2\x02\x88\x7f\xf4\xf4\x09\x55\x7a\xeb\xa3\x37\xaf\x3e\
-\x35\xfe\xf4\x48\x98\x06\x84\x26\xca\x90\x65\x22\x02\x7c\x3e\xbb\
-\xfe\x29\xe7\xba\xe7\xb0\x15\x8b\x2d\x83\x5a\x94\x8b\xde\xf8\xf8\
-\xf8\xe9\x03\x07\x0e\x4c\x0e\x0d\x0d\xd9\x4a\xa5\x42\xa9\x54\x42\
-\x29\x25\x00\x99\x24\x89\x8d\xe3\x38\x1f\x95\xaa\xad\xaa\x4e\x7c\
-\x87\x28\x8d\x08\x75\x48\xa0\x03\x7e\x5e\xfe\x89\xe9\xdb\xd3\x5c\
-\x36\x97\x90\x03\x02\xa3\x9c\xff\x10\xdb\xf5\xde\xf0\xf0\xf0\x93\
-\x47\x8e\x1c\x51\x42\x08\xfa\xe3\xee\x24\x00\x4e\xec\xe5\xe9\x97\
-\x88\xbd\x1e\xd7\xba\xd7\x98\x6f\xcf\xf1\xdb\xed\x0b\xdc\xd2\xb7\
-\xc9\x2c\x40\x0e\x0a\x0c\x20\x8b\xde\x80\x8a\xa7\x94\x72\x02\xff\
-\x16\x9e\xf0\x38\xff\xc7\x0c\xdf\x5d\x3a\x86\x54\x0a\x00\x9f\x0e\
-\xae\x0d\x81\xd2\x8a\x7a\x67\x38\xbf\xad\x43\xfb\xda\xb2\x95\x59\
-\xac\x50\xf5\x7d\x9f\xe5\xe5\x65\x8a\x50\x52\x71\xec\xc5\x06\xef\
-\x3d\xf4\x01\xa7\x0f\xfd\x40\xe3\xf9\x13\x8c\xd9\x35\x00\x88\x04\
-\x36\x46\x1b\xf9\x7a\xef\xb7\x4c\x4f\x9d\x62\x7a\xf2\x14\xfe\x3b\
-\x3d\xe3\xe5\xe3\xde\xea\xde\x02\x2c\xdd\xc8\xe7\xd7\xe6\x05\x74\
-\xa8\xd1\xda\x60\xbc\x3c\x3b\x90\xea\x14\xbf\x15\x70\xfc\xec\x71\
-\x7a\x71\x8f\x28\x08\x29\xd5\x4a\x6c\x5f\xb5\x83\x31\xbd\x86\xa3\
-\xa7\x8e\x52\x92\x25\xaa\xb2\x0a\x09\xc2\xb3\x58\x71\x33\x69\x21\
-\x85\xe4\xc7\x9b\x67\xf9\xa5\x7b\x0e\x19\x48\xc2\x24\xe0\xaa\xbd\
-\x42\x90\xe5\x30\x0d\x89\x74\xc4\x33\xf1\x73\x7c\x79\xfd\x0b\x82\
-\xd8\xc7\x18\xc3\x23\xf5\x47\xd9\xb9\x7a\x82\xba\x19\xe1\xfd\x8b\
-\xef\x82\xc2\x45\xae\xe9\xe5\x05\x0b\xcb\x97\xe9\x26\x5d\x5e\xff\
-\xfe\x35\x12\x93\xb0\x59\x6d\x41\xa2\x98\xd7\xb3\xa0\x00\x01\x56\
-\x40\x37\xf6\xe9\x78\x1d\x84\x02\x12\x28\x87\x65\x64\x94\x5f\x22\
-\x5c\xf1\xb1\x7a\x3a\xd5\xdc\x8c\x5a\xae\xf1\xb1\x07\x1f\x07\x05\
-\xab\xd3\x31\x04\x82\xda\x50\x1d\x64\x3e\x13\x0e\x83\x17\x06\xd9\
-\xfd\xf0\x1e\x30\x60\xb7\x1a\x6c\x62\x39\xaf\xcf\xb3\xae\xb9\x9e\
-\xdd\xe3\x7b\x40\x83\xd0\xd0\xe0\x24\x5e\x9a\xa6\x6c\x2f\xed\x24\
-\x4a\x22\x5e\x28\x1d\x42\x1b\x8d\xee\x69\xd2\x24\xc5\xa4\x3a\xe3\
-\x06\xad\x53\xe7\xb3\xff\x67\xc0\xde\x2b\xfb\xc8\x7b\x4c\xc6\x75\
-\x6a\x5c\xbe\xd3\xec\xb0\x2e\x5e\x47\xaa\x35\xc2\x40\xc3\x9e\xb4\
-\x62\xd3\xa6\x4d\xe9\xfc\xfc\xbc\xb2\xd6\x3a\xdf\xf2\xdc\x6a\xb5\
-\x88\xa2\x88\x0d\x1b\x36\x38\xee\x60\x0c\x5f\x1d\x3e\xcc\xc1\x83\
-\x07\x0b\x8e\xb9\x7b\x76\xf2\xc4\x09\xa6\xa6\xa6\x0a\x4e\xf6\xa7\
-\xd3\xb2\xd7\xeb\x51\x88\x16\x39\x83\xbb\x95\x6b\x2e\x60\x2d\x49\
-\x92\x38\x5e\xa0\x38\x4f\xd2\xb4\xe0\x4e\xa3\x5a\xad\x22\x7d\xdf\
-\x77\x63\xf6\x15\x17\xc2\x4e\xac\x5f\x3c\x8e\xe3\x7b\xdc\xda\xa2\
-\xde\xbd\xd0\x02\x42\x08\x94\x94\x8c\x8e\x8e\xe2\x65\xc2\x72\x66\
-\x66\xc6\x89\x17\x58\x5a\x5a\x22\x7b\x4e\xb3\xd9\x74\x5c\xa7\xa9\
-\xf3\x7a\x71\x71\x91\x46\xa3\xe1\x6a\xd2\x0c\xc5\xd9\xe5\x85\x05\
-\x3c\xcf\xa3\x5c\x2e\xbb\x5d\x33\x32\x32\x22\x3c\x9b\xc5\xc4\xc4\
-\x84\xe8\xf7\xac\x75\xe3\x06\xed\x76\x9b\xcd\x5b\xb6\x38\x5e\x8c\
-\x38\x37\x37\xc7\xbe\xfd\xfb\x11\x90\x73\x57\x2f\x80\x33\x67\xce\
-\xb0\x3f\x7f\x2e\x25\x52\x88\x5c\x18\x09\xac\xb0\x41\x17\xe3\xdd\
-\x1b\xbb\xb0\x67\x85\x6d\xe4\xe3\x7b\x9e\xb3\x41\xe6\xc2\x4a\x51\
-\xaf\xd7\x85\x04\x9c\x88\x6b\xee\xf7\x58\xeb\x7e\xee\xe0\xea\xb4\
-\x2e\x6a\x8b\x35\xe8\x04\xc1\x79\xec\x90\x6d\x4c\xc4\xda\xb5\x6b\
-\x7f\xcf\x16\xce\xe6\xbf\x59\x9b\xb2\xef\x77\x91\x05\xe0\x08\xc0\
-\xc0\xc0\x00\xb5\x5a\xcd\x7d\x05\x59\xb6\x79\xce\xf6\x3a\xb3\xb3\
-\xb3\x17\xff\x02\x94\x66\xfa\x33\xc9\xd2\xe3\x5a\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\xfb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\
-\x0d\xd7\x01\x42\x28\x9b\x78\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x02\xd8\
-\x49\x44\x41\x54\x68\xde\xe5\x99\xc1\x6b\x53\x41\x10\xc6\xbf\x9d\
-\x79\xf5\x5a\xa4\x20\xad\x58\x2a\x05\xff\x10\xcf\xed\x51\x29\x01\
-\xa1\x82\x82\x1e\x44\x53\x10\xbc\x14\xfa\x82\xc5\x43\x11\x52\x72\
-\x51\xac\x48\xf1\xa0\xb4\x05\x4f\xe6\xee\x1f\x20\x88\x22\x1e\x44\
-\x0f\x6d\x3c\xaa\x18\xbd\xb4\x3b\xb3\x59\x0f\x4d\x9e\x7d\x7d\x69\
-\xd2\xa6\xe0\x7b\xab\x03\x7b\x48\xc2\x24\xdf\x2f\xbb\x33\xf3\x25\
-\x6b\xbc\xf7\x08\x39\x28\x6f\x01\xff\x3d\x40\x74\xd4\x84\x72\xb9\
-\x3c\x6f\x8c\xb9\x9b\xb3\xee\x4a\xb5\x5a\x8d\x53\x00\xcb\xab\xab\
-\x67\x8d\x33\x4f\x22\xe6\xf3\xfb\xab\xc2\x39\x57\xb9\x75\x65\x36\
-\x06\x00\x11\x99\xaf\xd5\x6a\x03\x7d\x6a\xab\xd5\x4a\x96\x73\x2e\
-\xf5\xf8\xa0\xe7\xbb\xc5\xd2\xd2\xd2\x02\x80\x34\x80\xb3\xee\xd5\
-\xf8\xe9\xb1\x89\x53\x23\x23\x30\xc6\xa4\x12\xde\xbc\xff\x90\x24\
-\xec\xec\xec\x1c\x4b\x78\x3f\xc1\x9d\xd5\xab\xb9\xec\xd5\x90\x00\
-\xa8\xe8\xc4\xc9\xe1\x61\xbc\x7e\xfb\x0e\xce\xed\x23\xf7\xa8\x77\
-\x4b\xee\x17\xde\xfb\x43\x0b\xee\xbc\x76\x98\xae\xd8\x1d\x40\x15\
-\x22\x0a\xa7\x0e\x77\x6e\x5c\x37\x07\x25\x6f\x6f\x6f\x2f\x96\x4a\
-\xa5\x5c\x6b\xc0\x18\x53\xc9\x00\x38\x55\x88\x58\xa8\x6a\xcf\xe4\
-\x8d\x8d\x8d\x45\x00\x8b\x79\x02\xec\x8d\xa4\x8d\xaa\x2a\xac\x15\
-\xa8\xe8\x71\xde\x2f\x5f\x00\x51\x81\x3a\xc9\x5b\xd3\x80\x00\x4e\
-\x61\x45\xa1\xce\xe5\xad\x69\x30\x00\xa7\x0a\xb5\x02\x17\xf2\x11\
-\xb2\x6a\xa1\x1a\xea\x11\x52\x07\x2b\x0a\x09\xec\x08\xa5\xe6\x80\
-\x8a\xc0\x49\x6f\x80\xb9\xb9\xb9\x97\x00\xa6\x72\xd6\x5d\xaf\x56\
-\xab\xd3\x29\x00\xa7\x0a\xb1\x02\xef\x1d\xae\x95\x6f\xa7\xc6\xa1\
-\x07\x2a\x8f\x96\xef\xc7\x00\x60\xad\x9d\x2a\x80\x17\x4a\xbe\xc0\
-\x3f\x3b\xe0\x14\x56\x04\xa3\xa3\x63\x99\x84\xcd\xad\xcd\x00\xbc\
-\x90\x2a\x44\x04\x5b\x8d\xad\x6e\xe4\x61\x78\x21\x2b\x0a\x55\xc5\
-\xb3\x95\x87\xa6\x47\x72\xbd\x54\x2a\xe5\x5e\x03\x19\x00\xd7\x9e\
-\xc4\xae\x8f\x17\x5a\x5f\x5f\x9f\xce\x59\x7c\x2a\x52\x73\x40\xad\
-\xf4\x35\x73\x45\x8b\x14\xc0\x8e\x08\x24\x64\x00\xd1\x80\x77\x00\
-\xc0\xa1\x3a\x40\xd1\x22\x01\x20\x22\x30\x31\x88\xc2\xfa\xa7\x65\
-\x0f\x00\x83\x99\x41\xc4\x79\x6b\x1a\x10\x80\x09\x11\x33\x38\xb0\
-\x1d\x48\xe6\x00\x11\x21\xe2\x08\xc4\xbd\x01\x0a\x6b\xe6\x88\x78\
-\x77\x17\xa2\x21\x5c\xbc\x7c\x35\x55\xcd\xae\x85\xca\x8b\xa7\x8f\
-\x63\xa0\xc0\x66\x8e\x98\xc0\x11\x63\xfc\xcc\x38\xfc\x3e\x23\xf1\
-\xa5\xd1\x28\xbe\x99\xeb\x14\x71\xa3\xd1\xc8\x92\x1b\x53\x7c\x33\
-\x47\x44\xed\x2e\x44\x78\xbe\xf2\x20\x3c\x33\xc7\x6d\x00\xee\x53\
-\xc4\x85\x35\x73\xc4\xbc\xbb\x82\x9d\x03\xb4\x3b\x07\x82\x9e\xc4\
-\x11\x85\xbc\x03\xed\x36\xca\x1c\x2a\x40\xa7\x0b\x71\xc0\x47\x88\
-\x03\xac\x81\xd4\x24\x26\x26\x98\xfe\x5e\x28\x06\xb0\x90\xb3\xee\
-\xec\x25\x5f\x67\x07\x86\xa2\x13\xb8\x39\x5f\x49\x8f\xc3\x96\xaf\
-\xd7\xee\xc5\xd3\x00\x60\xad\x5d\x28\x80\x17\xca\x5e\xf2\x11\x51\
-\xf3\xeb\xb7\xef\xc3\xe7\x26\x27\x33\x97\x7c\x1f\x3f\x7f\x4a\x26\
-\x6f\x61\xbd\x50\x64\xf8\x42\xf3\xc7\xaf\x4b\xcd\xe6\xcf\xd9\x4c\
-\x86\xf1\x95\x6e\xc9\xfd\xe2\x6f\x78\x21\x73\xd4\xdf\xc1\x33\x33\
-\x33\xb1\xf7\x3e\xd7\x1a\x30\xc6\x54\xd6\xd6\xd6\xe2\x81\x00\x8a\
-\x16\x61\xf5\xcc\x7f\x11\xe0\x37\xca\x49\x61\x45\xc1\x6f\xd2\xbb\
-\x00\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\
-\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\
-\x37\x3a\x30\x32\x3a\x33\x35\x2d\x30\x37\x3a\x30\x30\x10\x90\x85\
-\xa6\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
-\x65\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
-\x30\x39\x3a\x33\x31\x3a\x30\x39\x2d\x30\x37\x3a\x30\x30\xab\xf6\
-\x1c\xe5\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
-\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\
-\x54\x30\x39\x3a\x33\x31\x3a\x30\x39\x2d\x30\x37\x3a\x30\x30\xda\
-\xab\xa4\x59\x00\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\
-\x73\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\
-\x63\x65\x6e\x73\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\
-\x2f\x20\x6f\x72\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\
-\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\
-\x6c\x69\x63\x65\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\
-\x31\x2f\x5b\x8f\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\
-\x64\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x30\
-\x36\x2d\x30\x33\x54\x30\x39\x3a\x35\x38\x3a\x31\x37\x2d\x30\x36\
-\x3a\x30\x30\xd8\xd5\x41\x44\x00\x00\x00\x19\x74\x45\x58\x74\x53\
-\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x13\
-\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\
-\x6e\x20\x49\x63\x6f\x6e\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\
-\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\
-\x69\x63\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x13\x8e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
-\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x11\xa1\
-\x49\x44\x41\x54\x68\xde\xbd\x9a\x69\x8c\x64\x57\x75\xc7\xff\xe7\
-\xde\xfb\xd6\xda\xab\xbb\x7a\x9b\x9e\x99\x1e\x7b\x16\x7b\xcc\xe2\
-\x15\x50\xc8\x82\x88\xc1\x36\x63\x63\x88\x08\x31\x1f\x92\xaf\x91\
-\x10\x5f\x90\x12\xa2\x84\x04\x45\xc0\x87\x44\x91\x12\x12\x24\x50\
-\xa4\x80\x42\x12\x40\x04\x6f\x08\x2f\xe3\x05\x07\x27\x08\x6c\x63\
-\x33\x1e\x8f\x3d\xc3\xcc\x78\xec\x59\xbb\xab\xbb\xab\xbb\xeb\xd5\
-\xf2\xd6\x7b\xef\xc9\x87\xea\x1e\xb7\x27\xb6\x67\x06\x08\xa5\x3a\
-\x3a\x6f\xb9\x75\xfb\xfc\xee\x39\xf7\x9c\xf3\xaa\x9a\xf0\x4b\xbe\
-\x1e\x79\xfc\x41\x30\xf3\x5b\x8e\x21\x22\xdc\x72\xf3\xbe\x5f\xf6\
-\x4f\xbd\xf1\xdc\x97\xfb\x81\x47\x7f\xf0\x10\xac\xb5\x00\x00\xcf\
-\xf3\xd0\xeb\xf7\x84\xa3\x1c\x9f\x88\xaa\x00\xca\x00\xbc\xf5\xa1\
-\x19\x80\x01\x33\xf7\xb4\xd6\x69\xa5\x5c\xb1\x69\x96\x9e\x9f\xe7\
-\xb6\x0f\xde\xf1\xeb\x07\xd8\xff\xd8\x83\x00\x2c\xd2\x34\x13\x52\
-\xc9\xa6\x14\x72\xaf\x94\xf2\x3a\x29\xe5\x5e\x29\xd5\x36\x29\x45\
-\x5d\x90\xf0\x00\xc0\x5a\x9b\x19\x63\xba\xc6\x9a\xd3\xc6\x98\xc3\
-\xd6\xda\x03\xc6\xe8\xc3\xc6\xd8\x55\x29\xa5\x25\x22\xec\xbb\xf5\
-\xce\x5f\x1f\xc0\xfe\xc7\x1e\x00\x91\x10\xc6\x14\x73\x42\xc8\xf7\
-\x7b\xae\xb7\x2f\x08\xc2\x1b\x4a\x61\x69\xdc\x0f\x02\xcf\x75\x5c\
-\x21\xa5\x04\x11\x01\x60\x58\x6b\xa1\xb5\x41\x9e\x67\x36\x49\x93\
-\x2c\x8e\xe3\x4e\x92\xc6\xcf\xe5\x79\xfe\xa0\xd6\xfa\x09\x29\xe5\
-\x49\x6b\xad\xbd\xfd\xb6\x8f\xfc\xff\x02\xec\x7f\xec\x01\x08\x21\
-\x60\x8c\x69\x12\xd1\xad\xbe\xef\xff\x51\xad\x5a\x7f\x77\xbd\xd6\
-\xa8\x07\x41\x00\x06\x23\xcb\x33\xa4\x49\x8c\x34\xcb\xa0\xb5\x06\
-\x00\x28\xa5\xe0\x79\x1e\x7c\xcf\x87\xe3\x38\x60\xcb\x88\x93\x18\
-\x51\x14\x75\x7b\xbd\xe8\xe9\x34\xcb\xfe\x8d\xd9\xee\x07\xb0\x6a\
-\x8c\xc1\x47\xee\xf8\xd8\xaf\x1e\xe0\xe1\x47\xbf\x0f\xe5\xb9\x28\
-\xd2\x6c\xa7\xe3\x38\x9f\xac\x55\xeb\x7f\x30\x31\x31\x39\x13\x86\
-\x21\xd2\x34\xc1\xca\x4a\x07\x4b\xcb\xcb\x58\x5d\xeb\xda\xc1\x30\
-\xd1\x69\x6e\xb4\x31\xb0\x00\xa0\x24\x09\xcf\x95\xaa\x52\x0a\xd4\
-\xd8\x58\x5d\x8c\x8f\xb7\xd0\xa8\xd7\xa1\xa4\x8b\xc1\xa0\x8f\xe5\
-\xce\xf2\x7c\xaf\x1f\x7d\xa7\x28\x8a\xaf\xe4\xba\x78\xd9\x51\x0a\
-\x1f\xbd\xe3\xf7\x7f\x75\x00\x8f\x3c\xfe\x20\x88\x48\x68\xad\xaf\
-\xf3\x7d\xff\xaf\x26\x5a\x53\xb7\x4c\x4c\x4c\xfa\x79\x91\x61\x7e\
-\xfe\x2c\x4e\x9f\x3e\xcb\xf3\x8b\xdd\x78\x2d\xa6\x68\x68\xc2\x28\
-\x43\x69\xa0\xd9\xcb\x2c\xa4\x01\x00\x01\x2d\x15\x32\xcf\xa3\xb8\
-\x5c\x56\x71\xad\x59\xa2\xda\x96\xa9\x46\xb8\x75\xeb\x2c\x4d\x8c\
-\x4f\x80\x01\x2c\x2d\x2d\xa6\x9d\xce\xf2\x23\x69\x96\x7e\x41\x4a\
-\x79\x80\xb5\xb6\x77\xde\xf9\xf1\x5f\x1e\xe0\xfe\xef\xdf\x8d\x30\
-\x0c\x49\x6b\x7d\xa3\xef\x07\x9f\x9f\x9d\x99\xbd\xb9\xd9\x1c\x57\
-\xab\xdd\x0e\x8e\x1d\x3f\x86\x93\xa7\x97\xe2\x76\x4f\x2d\xf6\x31\
-\xbe\x58\xc8\xc6\x00\xd2\x33\x44\x82\x09\x20\x06\x98\x99\x61\x19\
-\x6c\x2d\x83\xd9\x82\x6c\xae\x7c\x44\x95\xba\x58\x99\x9c\xa9\xdb\
-\xc9\x2b\xb6\x4f\x85\x3b\xe6\x76\x20\xf0\x03\x2c\x2f\x2f\xeb\x85\
-\xf6\xfc\xe3\x69\x96\x7e\x4e\x81\x9e\x1d\x66\x29\x7f\xe2\xe3\x7f\
-\x78\xc9\x00\xea\x8d\x2e\x4a\x29\x91\x65\xd9\xce\xc0\x0f\xfe\x7c\
-\x66\x7a\xf6\xe6\xb1\xb1\x96\x9a\x6f\x9f\xc5\x4b\x87\x0f\xdb\x13\
-\x67\xfb\x2b\x1d\x3d\x79\xaa\x70\x26\xbb\xd2\xf1\x4d\x20\x49\x08\
-\x82\x04\x40\xcc\xa3\x8a\x60\x2d\xb3\x65\x66\x6b\x89\x8d\x25\x36\
-\xd6\xd7\x09\x07\xab\x19\x37\x7b\x83\xb5\xe5\x95\x5e\xb2\xb0\x3d\
-\x8e\x93\xb1\x3d\xbb\x77\x8b\x89\xc9\x49\x65\xd9\xde\x7c\x6e\xfe\
-\x5c\x92\xa6\xe9\x9f\x09\x12\xc7\x2f\xc7\x03\xf2\xc2\x0b\xdf\x7b\
-\xe0\x1e\x30\x73\xcd\x71\x9c\x3f\x9d\x9e\x9a\xf9\xc4\xd4\xe4\x94\
-\x3b\xdf\x3e\x8b\xe7\x0f\xbe\x68\x8e\x9d\x4b\x17\x3a\xb8\xf2\x38\
-\x85\x53\x83\xd0\xf7\x84\xef\x90\x54\x8a\xa4\x92\x42\x28\x49\x90\
-\x42\x90\x1c\x69\x48\x41\x24\x05\x11\x11\x48\x10\x09\x22\x00\x90\
-\x36\xa7\x4a\x3c\xd0\x41\x37\xe9\xaf\x38\x36\xef\x95\xea\xb5\x8a\
-\x18\x6b\x8e\x09\xad\xf5\x8e\x38\x1e\x92\xd6\xfa\xa9\x8f\x7d\xec\
-\xf7\xb2\x7b\xee\xbe\xef\x17\xf6\x80\x24\xa2\xdb\xea\xb5\xfa\x5d\
-\x93\x13\x53\xfe\xea\xda\x0a\x5e\x3a\xfc\x73\xfb\x4a\xbb\x58\xe8\
-\xca\x9d\x27\xbc\xa0\x5e\x78\xae\x50\x92\x88\x88\x46\x55\xd6\x5a\
-\x16\x71\x9a\x39\xda\x58\xc1\x0c\x58\x66\xb6\x0c\x26\x90\x75\x1d\
-\x27\x13\x02\x86\x8c\x15\x96\x98\x2d\x13\x6b\x5b\x8d\xdb\x46\xbe\
-\x2c\xe7\xcf\xc1\x73\x4f\xcc\x5c\xb3\xf7\x6a\x31\x3d\x35\xed\x0f\
-\x87\xc3\xbb\x56\x8a\xce\xd3\xd6\xd8\xef\x02\x30\x97\xed\x81\x7b\
-\xee\xff\x0e\x88\x68\xce\xf7\x82\xcf\x6e\xdb\x36\xf7\x4e\x21\x04\
-\x1d\x39\x72\x18\x3f\x3f\xb9\xda\x59\xa1\x2b\x4e\xb8\x61\x33\x0f\
-\x7d\xa9\x1c\x29\x84\xa3\xa4\x50\x52\x08\x47\x09\x91\x17\xda\x3b\
-\xd5\x5e\xd9\x62\x4d\x31\x66\xad\xa9\x1b\xad\xeb\x69\x96\x35\xd6\
-\xfa\x71\xa9\x52\x0a\x86\x9e\xa3\x2c\x88\x40\x00\x88\x40\x44\x20\
-\x03\xb7\x48\xad\x1b\x73\xda\x29\x95\x3c\x94\xc6\xc7\x5b\x50\x52\
-\x96\xa2\x5e\xb7\x5c\xe8\xe2\x47\x77\x7e\xf4\xc3\xdd\xfb\xee\xfd\
-\xde\xe5\x79\x80\x88\x24\x80\x0f\xd4\xeb\xf5\xf7\x94\xcb\x65\x3a\
-\x75\xfa\x55\x9c\x3c\xbb\x94\xac\xd9\xe9\x53\x2a\x6c\xa6\xa1\x2f\
-\x94\x23\xa5\x90\x52\x90\x14\x44\x62\x3d\x36\x92\x2c\x97\xf5\x92\
-\xe3\x7f\xf8\xbd\x3b\xfc\x89\x7a\xc8\x00\xb0\xb8\x16\xe3\xbe\xff\
-\x79\x45\x08\x01\xe9\xba\x92\x48\x93\xd0\x42\x58\x63\x2d\xac\x65\
-\x90\xb1\x22\xb3\xd5\x61\x3b\xcd\x4e\x9d\x3c\xbb\x58\x1e\x1b\x1b\
-\x0b\x1a\x8d\x26\xd5\x6b\x8d\xf7\x24\x49\xfa\x01\x10\x7d\xed\x52\
-\xbc\x20\x36\x0e\xbe\xfe\x8d\xaf\xc1\x18\xdd\x72\x1d\xf7\x96\xb1\
-\xb1\xf1\x7a\x92\xc4\x38\x7b\x6e\x9e\x3b\xb1\xb7\x68\xfd\xc9\x5e\
-\xe8\x2b\xe5\x2a\x25\x5c\x47\xbe\x5e\x5c\x29\x1c\x25\xc9\x73\x15\
-\x26\x1b\x21\xb7\x6a\x0a\xad\xaa\xc2\x64\x23\x84\xef\x2a\x28\x25\
-\xc9\x71\x24\x39\x8e\x12\x8e\x23\x85\xe3\x28\x52\x4a\x8e\x44\x4a\
-\x1a\x70\x73\xad\xdd\x93\x8b\xed\xf6\x22\x83\x80\xf1\xb1\xf1\xba\
-\xeb\x38\xb7\x58\xad\x5b\x5f\xfe\xca\x97\x2e\xea\x81\xf3\x00\x46\
-\x4b\x30\x63\x4f\x18\x96\xae\x0d\xc3\x12\x56\xd7\x56\xb0\xbc\x3a\
-\x48\x86\xd4\x5a\xf6\xfc\x80\x5d\x57\x8d\xc2\x46\x49\x72\x95\xa4\
-\xf3\x00\x4a\x0a\x47\x49\x21\x88\x88\x19\x64\x8d\x85\xb1\x16\x0c\
-\x06\x09\x82\x92\x92\x1c\xa5\x84\xe3\x48\x72\x94\x24\x25\xc5\x48\
-\x2b\x49\x8e\x12\x44\xca\xb3\x6b\xba\xb1\xb4\xb8\xda\x4b\xe2\xe1\
-\x00\xd5\x6a\x0d\x61\x18\x5e\xcb\xe0\x3d\xf6\x12\x3a\x9d\xf3\x00\
-\xca\xd1\x52\x08\x71\x6d\xb9\x5c\x9e\x01\x18\xab\xab\xab\x88\x52\
-\xd9\x63\xaf\x19\x7b\xae\x92\x8e\x14\xa4\x94\x80\xe3\x48\x72\x5c\
-\x49\xae\xa3\xe0\x39\x8a\x5c\x47\x91\xa3\x46\xb9\x94\x08\xa3\x94\
-\x23\x46\x81\x2e\x88\xc8\x75\x24\xb9\x8e\x84\xeb\x48\x38\x8e\x84\
-\xeb\x2a\x38\xce\x08\x40\x2a\x49\x4a\x09\x64\x54\x1d\xac\x0e\x10\
-\x45\xbd\x1e\x5c\xd7\x45\xb9\x5c\x99\x11\x42\x5e\x2b\x60\xe5\xc5\
-\x00\xce\xef\x01\x22\x78\x4a\xaa\xbd\x41\x10\x7a\x45\x91\x23\xea\
-\x0d\x4c\xc6\xa5\x9e\x72\x03\xe3\x28\x21\xa5\x14\x00\x91\xe8\xc7\
-\x99\x47\x60\x29\xa5\x20\x31\x4a\x91\x88\x86\xa9\x6b\x2c\x0b\x5a\
-\xdf\xa1\xeb\x7b\x15\x96\x99\x06\x49\x1a\x58\x06\x69\x63\x59\x1b\
-\xcb\xc6\x32\x03\x64\x5c\xd7\xc9\x14\xa4\x01\x88\x0c\x3c\x3d\x34\
-\x41\xaf\xd7\x1f\x4c\xcc\x02\xb2\x14\x96\x3d\x25\xd5\x5e\x22\xf2\
-\x00\xc4\x97\x08\x40\x25\x29\xd5\x36\xd7\x75\x29\xcb\x52\xc4\x69\
-\xae\x8d\x1c\x8b\x1d\xc7\x81\x14\x82\x84\x94\x94\x66\x99\x73\xec\
-\xe4\xc2\x74\xe0\x49\xd7\x53\x12\xa0\xd1\x5b\x1b\x4b\xcd\xaa\xe7\
-\x38\x6a\xa3\x1b\x05\x1c\x47\xa0\x56\x72\x9d\x4e\x34\x98\x4a\xe2\
-\x21\x5b\x1e\x55\xe8\xbc\x30\x18\x66\x36\xdd\x36\x33\x79\xc6\x73\
-\xdd\xb4\x30\xcc\x49\x41\x45\xdf\xba\xfd\x41\x9c\x69\x63\x8d\x0c\
-\x7c\x9f\xa4\x94\xdb\x88\x44\xe9\x92\x01\x00\x84\x42\x88\xa6\x94\
-\x12\x71\x92\xa0\xd0\xac\x59\x86\xb9\x14\x92\x84\x14\xa4\xa4\x20\
-\x66\x88\xb2\xaf\xdc\x0f\xbf\x77\x87\x3f\xd9\x08\xd8\x32\x68\x23\
-\x4a\x5d\x47\xa2\x56\x72\xc1\xa6\x00\x03\xdc\x28\x7b\xb8\xeb\xfd\
-\xbb\x44\x56\x18\x0f\x00\x98\x47\x35\x63\x3d\x3b\x21\xc9\x0d\xaf\
-\xc6\x79\x72\xfc\xdc\x60\x38\xbf\x92\xa6\xbb\x9a\x29\xf6\x4e\x98\
-\xdd\xd6\x5a\xcf\x71\x5d\x48\x21\x9a\x00\xc2\x4b\x0e\x21\x66\x76\
-\x01\x04\x04\x82\x31\x06\x96\x89\x85\x74\x2c\x09\x42\x5a\x58\x9d\
-\x6a\x70\x56\xb0\x72\x94\xc4\x64\x23\xe0\xc9\xba\x07\x63\x2d\x00\
-\x3a\xbf\xd5\xd8\x6a\xf0\xf9\x13\x83\x5a\x28\xb1\x51\x6a\x2c\x03\
-\x52\x08\x6b\x2c\x23\x37\xc8\x5f\x78\xa5\xbf\xd2\x8e\x78\xb5\x3b\
-\xc8\x75\x96\x5b\xae\x2a\x9b\xe4\x1a\x05\x33\x43\x08\x01\x10\x05\
-\xeb\x36\x5d\x1a\x80\xb5\x4c\x96\xed\xf9\xe7\x5b\x21\x04\x48\x08\
-\x74\xfa\x3a\x39\xbe\x10\x0f\x92\x82\x8d\x2b\x74\x75\x4b\x59\x6f\
-\x29\x0c\x94\x05\x11\x83\x48\x8c\x62\x86\x00\x7e\x0d\x86\x41\x20\
-\x62\x02\xd8\xf2\x48\x8c\x61\xab\x2d\xdb\xa4\xb0\xdc\x8d\x75\xfe\
-\xea\x92\x8e\x0b\x76\x0a\x21\x25\x49\x45\x90\x52\x40\x08\x26\x21\
-\x68\x63\x41\xc1\xd6\x5e\x34\x0d\x6d\x02\x30\x99\xd1\x26\xb1\xd6\
-\x42\x4a\x09\x47\x09\x51\x24\x1a\x87\x4e\x0f\xa3\xb3\x2b\x59\xaa\
-\x1c\x05\xc9\x85\x13\xd8\xbc\x38\xb9\x38\xd0\x99\x66\x80\x79\xd4\
-\xec\x10\xc8\x73\x24\xea\x15\x0f\xb0\x06\x0c\x30\x43\xf0\x6a\x3f\
-\xe3\x34\x37\xb0\xcc\xcc\x16\x4c\x02\x68\xaf\xc4\x94\xe5\x06\x52\
-\xba\x60\x28\x58\x6b\x20\x2c\x10\x7a\x42\xf9\x1e\x49\x29\x24\x8c\
-\x49\xa1\xb5\x4e\x8c\x31\xd9\x25\x03\x68\x6d\xe2\xa2\x28\x56\x8b\
-\x22\x87\xa3\x1c\xf8\xae\x54\x71\x12\xf3\x7c\x57\xa4\x16\x82\x47\
-\xf9\x51\x9a\xc5\x9e\x1e\x7c\xf3\x89\x57\x8c\xe7\xca\xd1\x7a\x13\
-\x60\x8c\x15\x5b\xc6\xfc\xe0\xe3\xef\xdb\x25\x9a\x15\x07\x00\xb0\
-\xd2\xcf\xf8\x3b\x4f\x1c\xb7\x67\x3a\x49\x4c\x42\x58\xac\x7b\x36\
-\x2b\x34\x2d\xf6\x74\x2c\x9d\x92\xb5\x56\x12\xc0\x90\x12\x18\x2b\
-\x23\xa8\x84\xae\xa3\x94\x83\x3c\xcb\x50\x14\xc5\xaa\x36\x26\xbe\
-\x74\x80\x22\x1f\xe6\x79\x76\x26\x49\x12\x34\x9a\x75\x84\x81\xab\
-\x58\x0f\xdd\xb4\x08\xad\x90\x12\x16\x04\x2b\xbd\x34\x91\xe3\x47\
-\x5e\x1d\xb0\x20\x21\x36\x62\x15\xb6\xc8\x42\xcb\xe9\xd5\x85\xb6\
-\xa1\x20\xc1\x0c\x20\xd7\x96\x4e\x77\x92\xf4\xc5\x8e\xfb\x12\x4b\
-\x3f\x66\x6b\x89\xed\x46\x88\x96\x2d\x94\x4a\x85\xb1\x60\x48\xb8\
-\x04\xb1\xa5\xc6\xb5\x46\xb5\xe4\x0a\x29\x31\x8c\x87\xc8\xf2\xec\
-\x4c\x51\x14\xc3\x4b\x06\x30\xc6\x64\x59\x96\xbd\xd8\xef\xf7\xd2\
-\xb1\xf1\x71\xbf\x5a\x29\x8b\xa6\xdf\xa9\x07\xaa\x70\x86\xd6\xc9\
-\x14\x84\xb0\x90\xda\x28\xbf\xaf\x94\x80\x90\x12\x42\x08\x22\x21\
-\x18\xd9\xd0\x08\x91\x5b\x10\x01\x42\xac\x37\x6d\x04\x29\xa5\x95\
-\x7e\x65\x00\xa7\x34\xb0\xd6\xc2\x1a\x0b\x6b\x0d\xac\x31\x20\x63\
-\x48\xc0\xc0\x5a\x70\x23\xd4\xfe\x8e\x16\xb5\x9a\xf5\x9a\xb2\xd6\
-\x22\x8a\xa2\x34\xcb\xb2\x17\x8d\x2e\x2e\x1a\x42\xe7\x2b\xb1\x94\
-\xd2\xe4\x45\x71\xb0\x1b\x45\xf3\x5a\x6b\x54\xab\x55\x6c\x1b\x93\
-\xad\xb9\x5a\xd6\xb0\x2c\xd8\x30\x59\xcb\xc4\x16\x04\xc3\x02\x96\
-\x69\xe4\x15\x08\x8c\x42\x8c\xf8\x7c\xab\xb9\xb1\xaf\x09\x10\xa3\
-\x1a\x02\x21\x05\x8d\x9a\x40\x41\x42\x08\x12\x42\x8e\x12\x85\x14\
-\xd8\x39\x5e\x34\x76\x4e\x05\xad\x6a\xb5\x8a\x78\x18\x63\xad\xbb\
-\x36\x9f\xe7\xf9\x41\x52\xce\xa5\x37\x73\x9f\xfa\xe4\xa7\x61\xad\
-\x3d\x1a\x45\xd1\xf3\x51\x37\x42\xb9\x5c\xc1\xf4\x78\xa9\x7c\xdd\
-\x74\x32\x17\x38\x56\x69\x26\x36\x20\x36\x4c\xd6\x80\xac\x81\x60\
-\x03\x69\x2d\x49\xcb\x34\x0a\x25\x31\x5a\xf5\x91\x6c\xb4\x13\x4a\
-\x42\x2a\x05\x29\xd5\xc8\x6b\xeb\x42\x52\x00\x42\xa0\xec\xb1\xf3\
-\xae\xad\xc5\xdc\xb6\xa9\x46\xd9\xf3\x02\x2c\x77\x96\xd1\xed\x76\
-\x9f\x37\xc6\x1c\xfd\xec\x67\xfe\xf2\x62\xf6\xbf\x06\x00\x00\x82\
-\xe4\x72\x92\xc4\xfb\x17\x16\xe6\xd7\x04\x49\xb4\xc6\xc7\xc4\xdb\
-\xb7\x60\xee\xda\xc9\xfe\x34\xd1\x68\xa5\x2d\x88\x47\x5a\xd8\x75\
-\xcd\x4c\x82\xf3\xc2\x50\x7b\x2d\xa6\x73\x9d\x21\xcd\x77\x86\xd4\
-\x5e\x8b\xa9\xd0\x96\xc4\xeb\x0c\x1f\xa5\x66\x21\x04\x04\x8d\xf4\
-\x4d\x5b\x92\xe9\x1b\x76\xf8\x73\x53\xad\x09\x91\xa5\x29\xce\x9c\
-\x39\xbd\x36\x8c\x87\xfb\x95\x10\xcb\x17\xb5\x1e\x17\x3c\x0f\x18\
-\xd6\x06\x16\x3f\x58\xee\x2c\x3f\xd3\x59\xee\x7c\xb0\xd5\x1a\xa7\
-\x6d\x53\xc3\xf2\x6f\x0f\xa3\xb7\xad\xe4\xa5\xfe\xc9\x61\x6d\x8d\
-\xe8\x7c\xd7\x06\x08\xc1\x10\x12\x52\xb9\x66\x79\x88\xc1\xb7\x9f\
-\x3c\x65\x3d\x47\xf1\x46\xb6\x59\x1e\x22\x56\x65\xd7\xb2\x94\x04\
-\x66\x30\x0b\x08\xc1\xa3\x1c\x4f\x96\x77\x35\xb3\xc6\xcd\xbb\x8a\
-\xb7\xed\xde\x36\x5b\xf6\xfd\x00\xc7\x8e\x1f\xe3\xf6\x62\xfb\x19\
-\xa3\xcd\x0f\xac\xe5\xcb\x7f\x22\x7b\xe8\x81\x87\xb1\x6f\xdf\xad\
-\xbd\x3c\xcf\x0b\x6d\xcc\x6f\xb5\xc6\x5b\xe5\x72\xa5\x4c\x2e\x92\
-\x72\x48\x43\xb7\x1d\x07\x2b\x7d\xe3\x67\x52\x4a\x12\x62\xb4\x91\
-\xa5\x14\x90\x8e\x6b\xac\x57\xe9\x46\xa8\xb6\x57\xb9\xba\xb0\x66\
-\xab\x0b\x11\xaa\x0b\x36\x68\x2e\x91\x1b\x26\x58\xff\xa6\x02\x0c\
-\x58\x30\x8c\x05\xcf\x96\x93\xca\x9d\x7b\xba\xd7\xfd\xc6\x9e\xb1\
-\xed\x5b\xa6\x67\xc4\xea\xea\x2a\x0e\x1e\x3a\xb8\xd4\xe9\x2c\xff\
-\x0d\x11\xff\xf8\x33\x7f\xf2\x17\x7c\xd9\x00\x00\xb0\xef\xf6\xdb\
-\xb8\x28\xf2\x33\x79\x9e\x8d\x33\xf3\xb5\x13\x13\x93\x2a\x0c\x03\
-\x51\x91\x49\xbd\xae\x06\xfe\x6a\xe6\x76\x7b\x3a\xc8\x48\x48\x28\
-\xb9\x9e\x8d\x94\xc3\xd2\x2b\x65\x2a\x2c\x67\x4e\x50\xc9\x54\x50\
-\xca\xa4\x1b\x66\x50\x7e\x0e\xac\x57\x55\x00\xd6\x32\x60\x19\x3b\
-\xaa\x83\xfa\x47\x76\xaf\x5d\xff\x9b\xbb\x6b\x57\xee\xd8\xb6\x55\
-\x25\x49\x82\x17\x0e\x1d\x8c\xcf\x9c\x3e\xfd\x75\x63\xcd\xbf\x1c\
-\x3b\x76\x3c\x9d\xdb\x31\x87\x23\x87\x7f\x7e\xf9\x00\x0f\x3d\xb8\
-\x1f\xb7\xdf\xb1\x2f\x2b\x8a\xe2\xd5\x38\x8e\xe7\x88\xc4\xce\xc9\
-\x89\x49\x19\x86\xbe\xa8\x3a\x69\x63\xc2\xeb\xd7\x08\x9c\x77\x0b\
-\x3f\x2e\xe0\x18\x21\x36\xbc\x31\xea\x58\xc5\xe8\xab\x08\x62\x66\
-\x62\x6b\xc9\x5a\xc6\xba\x70\x28\x0b\xf7\xc6\xd6\xea\xec\xbe\x2b\
-\xa3\xeb\xdf\xbd\xb3\x31\xb7\x6d\x76\x56\xe5\x79\x81\x9f\x1d\xf8\
-\x19\x9e\x7d\xee\xd9\x57\x8f\x1c\x3d\xfa\xed\x43\x87\x0e\xb5\x87\
-\xc3\xd8\x68\xad\xf5\xdb\xde\x7e\x0d\xae\xbf\xe1\x3a\x1c\x7a\xe1\
-\xc5\x4b\x07\x00\x80\x87\x1f\xda\x8f\x7d\xfb\x6e\x5f\x4d\xb3\xe4\
-\x44\x7f\xd0\xbf\x82\x80\x1d\xad\x56\x8b\xaa\x95\x8a\xa8\x07\xa6\
-\x3a\x13\xf4\x27\x27\xbd\x41\x09\x80\x4e\xd9\xc9\x35\x94\xb5\x24\
-\x19\x20\x30\x13\x2c\x8f\x56\xdb\x1a\x0b\x62\x23\x4a\x22\x75\x77\
-\x57\xd6\x26\x7e\x77\xcb\xd2\x35\xef\xdb\x51\xbc\xfd\x1d\x57\x4c\
-\xb4\xa6\xa7\xa6\x44\x96\x66\x38\xf0\xfc\x01\x3c\xfb\xdc\xb3\x68\
-\xb7\xdb\x7e\x92\xa6\xd7\xfa\x41\xf0\x7e\x47\xa9\x9b\x84\x10\xb0\
-\xd6\x9e\xb4\xd6\x9a\xb7\xf2\xc4\x9b\x36\x4b\xff\xf8\xe5\x7f\x40\
-\x9a\xe6\x24\x04\x5f\x1b\x86\xe1\xe7\xb6\x6f\xdf\x7e\xeb\xee\x5d\
-\xbb\xfd\xb0\x54\x42\x9c\x0c\xd0\x8d\x7a\xb6\x13\x65\xc3\x85\x81\
-\x5a\x3a\x17\x87\x4b\x4b\x59\x18\x0d\x8c\x9f\x14\x2c\x0d\x40\x70\
-\xa8\x90\x15\x99\x05\x13\x7e\x5c\xdb\x52\x4a\x27\x66\x6b\x3c\x31\
-\xd3\x2c\x97\x5a\x63\xe3\xc2\xf3\x7c\xac\xac\xac\xe0\xf0\x91\x97\
-\xe2\x9f\x3e\xfb\xec\xe9\x53\x67\xce\x6c\xbf\xfa\xaa\x3d\x41\xa5\
-\x52\x81\xe3\x28\xc4\x49\x62\x8f\x1f\x3d\xf6\xf2\xc2\x42\xfb\xf3\
-\xcc\x7c\x37\x11\x65\xf7\xde\x7d\xff\xe5\x01\x00\xc0\xdf\x7f\xe9\
-\xef\x40\x05\xa1\x10\xc5\x1e\xd7\x71\xff\xb8\xd5\x6a\xdd\x75\xe5\
-\x15\x3b\xa7\xa7\xa7\xa7\xa0\x1c\x85\x34\x4b\x91\xc4\x31\xe2\x34\
-\x37\x71\x66\xf2\x54\x73\xae\x2d\x34\x00\x38\x82\x54\xe0\x0a\xb7\
-\x12\x38\x6e\xb9\x14\xca\x72\xa9\x0c\xcf\xf3\x91\x26\x29\x4e\x9f\
-\x39\x8d\xe3\xc7\x8f\x2d\x2c\x2d\x2f\x7d\xeb\xe9\x67\x9e\x7b\x3a\
-\xea\xf5\xbf\xf8\xee\x9b\xae\xdf\x3d\x36\x36\x86\x66\xb3\x89\xe6\
-\x58\x03\x2b\x2b\x2b\x78\xfa\xe9\x67\x8e\xb6\x17\xda\x5f\xb0\xd6\
-\xde\xc3\xcc\x69\x18\x2a\x7c\xeb\x3f\xee\xbd\x78\x08\x6d\xbc\x1e\
-\xd9\xff\x18\xf6\xdd\x7e\x1b\xb2\xa2\x58\x31\x5a\xff\xb4\xd7\xef\
-\x9f\xe8\x74\x3a\xd5\x28\xea\x8e\x83\xe1\x97\xc2\x32\xaa\x95\x2a\
-\x6a\xd5\xaa\x68\xd6\x2a\x4e\xab\x5e\xf2\xa7\x9a\xe5\x70\xba\x59\
-\x09\xa7\xc6\x6a\x7e\x6b\xac\xe1\xd4\xaa\x35\xe1\x79\x3e\xd2\x34\
-\xc5\xe9\x53\xa7\xf0\xe2\x4b\x87\xa2\x63\xc7\x8f\xfe\x68\x69\x79\
-\xe9\x6f\x8b\xa2\xf8\xd7\x87\x1f\xfd\xaf\xb3\x81\xef\xdf\xdc\x68\
-\xd4\xae\x10\x42\xa0\xd7\xeb\x63\x38\x18\x62\x72\x72\x02\xad\xd6\
-\xf8\x78\xd4\x8d\xae\x19\x0c\x06\xcb\x5a\xeb\xa3\xcc\xe2\xff\x84\
-\xd3\x45\x1f\x9a\x1f\xde\xff\x08\x1e\x7f\xf4\x71\xac\xac\x2e\x25\
-\xcf\x1f\x78\xfe\xb0\x90\xe2\xc9\x28\x8a\x4e\x2c\x2e\x2e\x9a\xa5\
-\xc5\x45\xbf\xdb\x8d\xdc\x24\x49\x5d\x5d\x14\x30\xc6\xc2\x18\x0b\
-\x5d\x18\x24\x49\x8a\x6e\x14\x61\xa1\xbd\x80\x97\x5f\x3e\x1e\x1f\
-\x3e\x72\xf8\xdc\xb1\xe3\xc7\x9e\x9c\x9f\x9f\xff\x6a\x7b\xa1\xfd\
-\x4f\xdf\xfe\xd6\x7f\x3e\x75\xcf\xdd\xf7\x25\x5e\x10\x22\x2c\x85\
-\x37\x96\xcb\xe5\x1b\x4a\x81\x4f\x4b\x4b\x8b\xe8\xf7\x07\x28\x0a\
-\x83\x99\x99\x19\x4c\x4c\xb4\xc6\xa3\x28\x7a\x47\x1c\xc7\xcb\xcc\
-\x7c\x6c\xef\x35\x57\xbf\x0e\xe2\x52\x7f\xa1\x79\xdd\xb8\x5b\x6e\
-\xf9\x80\xbc\xf1\xa6\x1b\x5a\x8e\xeb\x5c\xe3\x38\xce\x3b\x5d\xd7\
-\xbd\xca\xf3\xbc\x59\xc7\x71\xeb\x4a\x4a\x1f\x00\xb4\xd1\x59\x9e\
-\xe5\x51\x9a\xa5\xe7\xe2\x38\x3e\x36\x1c\x0e\x0f\x9d\x3d\x7b\xee\
-\xc8\xe3\x8f\x3d\xb1\xd2\x59\xee\x98\x8d\x39\x5d\xcf\xe3\x9d\x57\
-\x5d\xfd\xa1\x89\x89\x89\x2f\x5e\xb5\xe7\xca\x5d\xa1\xef\xa2\xd7\
-\xeb\xa1\x54\xaa\x60\xeb\xd6\x59\xec\xdc\x75\x25\xfa\xfd\x3e\x9e\
-\xfa\xc9\x53\x47\xdb\xed\xc5\x2f\x5a\x6b\xef\x66\xe6\xb4\x52\xa9\
-\xe0\xdf\xbf\xf1\xcd\x4b\x02\xa0\x4d\x7a\xb3\x30\x00\xcc\xed\x98\
-\x73\x6f\x7a\xd7\x0d\xa5\x52\x18\x56\xa5\x52\x25\x29\x85\x67\x2d\
-\x53\x96\x65\x45\x3c\x1c\x26\x8b\x4b\xcb\xc3\x43\x2f\xbc\x98\x44\
-\xdd\xc8\x60\xd4\xba\x88\x0b\x17\xa4\x5c\xad\xfa\xb3\xdb\x77\xdc\
-\x39\x35\x35\xf1\xe9\xbd\x57\xed\xda\xe1\x7b\x2e\xa2\x28\x42\xb9\
-\x5c\xc6\xd6\xad\x5b\xb1\x7b\xcf\x2e\x44\x51\x84\xa7\x7e\xf2\xd4\
-\xd1\xf9\xf9\x85\x2f\x68\xad\xbf\xeb\x38\x4e\x7e\xef\xdd\xf7\x5f\
-\x14\xe0\xcd\x8c\x17\x17\x68\xbc\xc5\xfd\xcd\xf2\x66\x63\xe0\x05\
-\x41\xb0\x75\xfb\xdc\x87\x66\x67\xb7\x7c\x6a\xef\xd5\xbb\xb7\x07\
-\xbe\x8b\x6e\x37\x42\xa9\x34\x82\xd8\x73\xd5\x79\x88\x97\xe7\xe7\
-\xdb\x7f\x4d\x84\x7b\x00\xa4\x17\xdb\x03\x9b\x8d\x13\x6f\xa1\xc5\
-\xfa\x7e\x92\x18\xf5\x57\x9b\xb5\xdc\x74\x7f\xf3\xb8\x8d\x31\x0e\
-\x00\xd7\x68\x2d\x07\xfd\xfe\x3c\x84\xec\xe5\x85\xbe\xa2\x51\x6f\
-\xd4\x2b\xe5\x12\xfa\xfd\x1e\x92\x24\x85\xd6\x1a\x33\x33\x33\x68\
-\x4d\xb4\x9a\x6b\xdd\xee\x35\xf1\x70\x78\x0a\xc0\xcb\x97\x03\xf0\
-\x46\xc6\x13\x2e\x0e\xb7\x19\xf2\xcd\x3c\xa4\x00\x38\xc6\x18\x1a\
-\xf6\x7b\x67\x58\xc8\x6e\x9e\x17\x57\x36\x9b\xcd\x5a\xa5\x52\x42\
-\xaf\xf7\x1a\xc4\xb6\xed\xdb\xe0\xb8\x6a\x7c\x61\x7e\x7e\x90\x24\
-\xe9\x0f\x2f\x17\x00\x17\x9c\xbf\xd1\x7d\x7a\x93\xcf\x6f\x68\x5e\
-\x97\x37\x9a\x4b\x18\x63\xcc\xa0\xdf\x3b\x09\x21\x97\xf3\xa2\xd8\
-\xd5\x68\xd6\xeb\x95\x72\x19\xbd\x5e\x0f\x00\xd0\x6c\x36\xb0\xb6\
-\xd6\xd5\x67\x4e\x9f\xf9\x61\x14\x45\x97\x05\xf0\x46\xd7\x37\x1f\
-\xf3\x05\x1a\xc0\xe8\x17\xcb\x4d\x46\xdb\x4d\x7a\x43\xcc\xa6\xeb\
-\x0c\x00\xd6\x18\x3d\x1c\x0c\x5e\x25\x29\xd7\xf2\x5c\xef\x6c\x34\
-\xea\xf5\x66\xb3\x81\x5a\xbd\x86\xa8\xd7\xc3\x0b\x07\x0f\x1d\x6a\
-\x2f\x2e\xfe\xf3\x93\x4f\x3c\xf9\xea\x45\xeb\xc0\x05\xc6\xf2\x05\
-\x06\x6d\x96\x0b\x0d\xdd\x30\x6c\xe3\xd8\x00\xd0\x17\x48\xb1\xe9\
-\xd8\x6c\x12\x36\x46\x9b\x41\x7f\x70\x0a\x42\xf4\xb3\xbc\xd8\xe9\
-\x7b\x5e\xb5\xd7\xef\xdb\x23\x47\x8e\x9e\x38\x79\xf2\xe4\x57\x0f\
-\x1e\x38\xf8\xe3\x2c\xcb\x7f\xb1\x3a\x80\x37\x0f\x9d\xb7\x0a\xa3\
-\xb7\x9a\x7b\x63\x73\x3b\x9b\x44\x01\x70\x5c\xdf\x2f\xcd\x6e\xdb\
-\xfe\x3b\xd5\x5a\xed\x77\x08\xbc\xd6\xeb\x76\xff\xfb\xcc\xa9\x53\
-\x07\xf2\x3c\xef\x03\x48\x2f\xf7\x9f\x3d\x36\x62\xf8\x52\x42\xea\
-\x72\xe7\xdd\x9c\xcd\x14\x5e\xcb\x50\x8e\x94\xd2\xf3\x83\xa0\xac\
-\x8b\xc2\x66\x59\xb6\xe1\xb5\xec\x17\x01\x78\x2b\x03\x7e\x15\x73\
-\x6c\xce\x52\x1b\x69\x77\x03\x66\xe3\x7c\x63\x11\x0b\x00\xc5\xff\
-\x02\x12\xd2\x41\x9a\x06\x51\x80\xd4\x00\x00\x00\x25\x74\x45\x58\
-\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\x32\x30\x30\
-\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\
-\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\xca\x00\x00\x00\x25\x74\x45\
-\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\
-\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\x36\x3a\x31\
-\x38\x2d\x30\x37\x3a\x30\x30\x67\xec\x3d\x41\x00\x00\x00\x25\x74\
-\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\
-\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\x31\x31\x3a\
-\x34\x30\x2d\x30\x37\x3a\x30\x30\x93\x15\x56\xb1\x00\x00\x00\x34\
-\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\x74\x70\
-\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\
-\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\x73\x2f\
-\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\x6a\x06\xa8\x00\x00\x00\x25\
-\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\x74\x65\x00\
-\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\
-\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\xdd\x31\x7c\xfe\x00\x00\x00\
-\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\
-\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\
-\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\
-\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\x6f\x6e\x20\x54\x68\x65\x6d\
-\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\x74\x45\x58\x74\x53\x6f\x75\
-\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x61\
-\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\x6f\x72\x67\x2f\x32\xe4\x91\
-\x79\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x13\x85\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
-\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x11\x98\
-\x49\x44\x41\x54\x68\xde\xbd\x9a\x69\x8c\x64\x57\x75\xc7\xff\xe7\
-\xdc\xfb\x96\x7a\xb5\x57\x75\x55\x2f\xd3\xd3\xd3\xe3\xd9\xec\x19\
-\xc0\xe3\x8d\x25\x0a\x21\x21\x06\xdb\x8c\x1d\x03\x22\x2c\x1f\x92\
-\xaf\x91\x10\x5f\x90\x12\xa2\x84\x04\x45\xc0\x87\x44\x91\x12\x12\
-\x24\x50\xa4\x80\x42\x16\x10\xc1\x36\x46\x78\x19\x2f\x2c\x8e\x10\
-\xd8\xc6\x66\x3c\x1e\x7b\x86\xd9\xf0\x4c\x4f\x4f\x75\x75\x57\x77\
-\x75\xbd\x5a\xde\x7e\xef\xcd\x87\x9a\x1e\xb7\x27\xf6\x2c\x40\x78\
-\xd2\xd1\xbd\xef\xbd\x5b\xb7\xcf\xef\x9e\xff\x3d\xf7\xde\xaa\x26\
-\xfc\x8a\xd7\x63\x4f\x3e\x0c\x63\xcc\x65\xdb\x10\x11\xee\xb8\xfd\
-\xc0\xaf\xfa\xa7\x5e\xbf\xef\x6b\xfd\xc0\xe3\xdf\x7b\x04\x5a\x6b\
-\x00\x80\xe3\x38\xe8\x0f\xfa\x6c\x49\xcb\x25\xa2\x12\x80\x02\x00\
-\xe7\x42\xd3\x18\xc0\xd0\x18\xd3\xcf\xb2\x2c\x2a\x16\x8a\x3a\x8a\
-\xa3\x8b\xfd\xdc\xf5\xde\x7b\x7e\xf3\x00\x07\x9f\x78\x18\x80\x46\
-\x14\xc5\x2c\xa4\xa8\x09\x16\x7b\x85\x10\x37\x09\x21\xf6\x0a\x21\
-\xe7\x84\xe0\x0a\x13\x3b\x00\xa0\xb5\x8e\x95\x52\x3d\xa5\xd5\x82\
-\x52\xea\xa8\xd6\xfa\x90\x52\xd9\x51\xa5\x74\x57\x08\xa1\x89\x08\
-\x07\xee\xbc\xf7\x37\x07\x70\xf0\x89\x87\x40\xc4\xac\x54\x3a\xcf\
-\x2c\xde\xed\xd8\xce\x81\x5c\xce\xbb\x25\xef\xe5\x27\xdc\x5c\xce\
-\xb1\x2d\x9b\x85\x10\x20\x22\x00\x06\x5a\x6b\x64\x99\x42\x92\xc4\
-\x3a\x8c\xc2\x38\x08\x82\xd5\x30\x0a\x9e\x4f\x92\xe4\xe1\x2c\xcb\
-\xbe\x2f\x84\x38\xa3\xb5\xd6\x77\xdf\xf5\xfe\xff\x5f\x80\x83\x4f\
-\x3c\x04\x66\x86\x52\xaa\x46\x44\x77\xba\xae\xfb\xc7\xe5\x52\xe5\
-\x6d\x95\x72\xb5\x92\xcb\xe5\x60\x60\x10\x27\x31\xa2\x30\x40\x14\
-\xc7\xc8\xb2\x0c\x00\x20\xa5\x84\xe3\x38\x70\x1d\x17\x96\x65\xc1\
-\x68\x83\x20\x0c\xe0\xfb\x7e\xaf\xdf\xf7\x9f\x89\xe2\xf8\xdf\x8d\
-\xd1\x07\x01\x74\x95\x52\x78\xff\x3d\x1f\xfa\xf5\x03\x3c\xfa\xf8\
-\x77\x21\x1d\x1b\x69\x14\xef\xb4\x2c\xeb\xe3\xe5\x52\xe5\x23\xcd\
-\xe6\xe4\x8c\xe7\x79\x88\xa2\x10\x6b\x6b\xab\x58\xe9\x74\xd0\x5d\
-\xef\xe9\xe1\x28\xcc\xa2\x44\x65\x4a\x41\x03\x80\x14\xc4\x8e\x2d\
-\x64\x31\x9f\x93\xf5\x7a\x85\x27\x26\x1a\xa8\x56\x2a\x90\xc2\xc6\
-\x70\x38\x40\x67\xb5\xd3\xea\x0f\xfc\x6f\xa6\x69\xfa\xa5\x24\x4b\
-\x4f\x59\x52\xe2\x03\xf7\xfc\xe1\xaf\x0f\xe0\xb1\x27\x1f\x06\x11\
-\x71\x96\x65\x37\xb9\xae\xfb\xd7\xcd\xc6\xd4\x1d\xcd\xe6\xa4\x9b\
-\xa4\x31\x5a\xad\x45\x2c\x2c\x2c\x9a\xd6\x72\x2f\x58\x0f\xc8\x1f\
-\x29\xcf\x8f\x91\x1f\x66\xc6\x89\x35\x84\x02\x00\x46\x26\x24\x62\
-\xc7\xa1\xa0\x50\x90\x41\xb9\x96\xa7\xf2\x96\xa9\xaa\xb7\x75\xeb\
-\x2c\x35\x27\x9a\x30\x00\x56\x56\x96\xa3\xd5\xd5\xce\x63\x51\x1c\
-\x7d\x4e\x08\x71\xc8\x64\x99\xbe\xf7\xde\x0f\xff\xea\x00\x0f\x7e\
-\xf7\x3e\x78\x9e\x47\x59\x96\xdd\xea\xba\xb9\xcf\xce\xce\xcc\xde\
-\x5e\xab\x4d\xc8\x6e\x6f\x15\x27\x4e\x9e\xc0\x99\x85\x95\xa0\xdd\
-\x97\xcb\x03\x4c\x2c\xa7\xa2\x3a\x84\x70\x14\x11\x63\xac\x7e\x18\
-\x63\x0c\xb4\x01\xb4\x36\xc6\x18\x0d\xd2\x89\x74\xe1\x17\x2b\xbc\
-\x36\x39\x53\xd1\x93\xd7\x6d\x9b\xf2\xb6\xcf\x6f\x47\xce\xcd\xa1\
-\xd3\xe9\x64\x4b\xed\xd6\x93\x51\x1c\x7d\x46\x82\x9e\x1b\xc5\x91\
-\xf9\xd8\x87\xff\xe8\xaa\x01\xe4\xeb\x3d\x14\x42\x20\x8e\xe3\x9d\
-\x39\x37\xf7\x17\x33\xd3\xb3\xb7\xd7\xeb\x0d\xd9\x6a\x2f\xe2\xe5\
-\xa3\x47\xf5\xe9\xc5\xc1\xda\x6a\x36\x79\x36\xb5\x26\x7b\xd2\x72\
-\x55\x4e\x80\x99\x48\x02\x63\xcf\x8d\x01\xb4\x31\x46\x1b\x63\xb4\
-\x26\x28\x4d\x5a\x69\x37\x0b\x4d\xae\x1b\xeb\x5a\x7f\xb8\xde\x59\
-\xeb\x87\x4b\xdb\x82\x20\xac\xef\xd9\xbd\x9b\x9b\x93\x93\x52\x1b\
-\x7d\xfb\xf9\xd6\xf9\x30\x8a\xa2\x3f\x67\xe2\x93\xd7\x12\x01\x71\
-\xe9\x83\xef\x3c\x74\x3f\x8c\x31\x65\xcb\xb2\xfe\x6c\x7a\x6a\xe6\
-\x63\x53\x93\x53\x76\xab\xbd\x88\x17\x0e\xbf\xa4\x4e\x9c\x8f\x96\
-\x56\xb1\xe3\x24\x79\x53\x43\xcf\x75\xd8\xb1\x48\x48\x49\x42\x0a\
-\x22\xc9\x0c\x21\x98\x84\x60\x48\x41\x24\x98\x88\x99\x40\x44\xc4\
-\x44\x44\x64\x08\x2c\x75\x82\x62\x30\xcc\x72\xbd\x70\xb0\x66\xe9\
-\xa4\x9f\xaf\x94\x8b\x5c\xaf\xd5\x39\xcb\xb2\xed\x41\x30\xa2\x2c\
-\xcb\x9e\xfe\xd0\x87\x3e\x18\xdf\x7f\xdf\xb7\x7f\xe9\x08\x08\x22\
-\xba\xab\x52\xae\x7c\x74\xb2\x39\xe5\x76\xd7\xd7\xf0\xf2\xd1\x9f\
-\xeb\x5f\xb4\xd3\xa5\x9e\xd8\x79\xda\xc9\x55\x52\xc7\x62\x29\x98\
-\x88\xc6\xfe\x81\x00\x68\x6d\x30\x08\x42\x2b\x8e\x53\xa1\xc7\x91\
-\x30\x44\xac\x73\x39\x37\x66\x66\x45\x0a\x46\x6b\x63\x34\x91\xc9\
-\x74\x29\x68\x2b\x71\x4a\xb4\xce\xc3\xb1\x4f\xcf\xec\xdb\x7b\x03\
-\x4f\x4f\x4d\xbb\xa3\xd1\xe8\xa3\x6b\xe9\xea\x33\x5a\xe9\x6f\x01\
-\x50\xd7\x1c\x81\xfb\x1f\xfc\x26\x88\x68\xde\x75\x72\x9f\x9e\x9b\
-\x9b\xbf\x91\x99\xe9\xd8\xb1\xa3\xf8\xf9\x99\xee\xea\x1a\x6d\x3f\
-\x6d\x7b\xf5\xd4\x73\x84\xb4\x24\xb3\x25\x99\xa5\x60\xb6\x04\x93\
-\x94\x02\x61\x14\xb9\xa7\x7e\xb1\x30\x13\x05\x83\x89\x2c\x09\x2b\
-\x83\xfe\xa0\xda\xe9\xae\xe7\x2b\x95\xd2\xc8\x75\x6c\x0d\x10\x68\
-\xbc\xab\x20\x22\x90\x82\x9d\x46\xda\x0e\x4c\xb4\x9a\xcf\x3b\xc8\
-\x4f\x4c\x34\x20\x85\xc8\xfb\xfd\x5e\x21\xcd\xd2\x1f\xdd\xfb\x81\
-\x3f\xe8\x7d\xfb\x81\xef\x5c\x5b\x04\x88\x48\x00\x78\x4f\xa5\x52\
-\x79\x7b\xa1\x50\xa0\xb3\x0b\xaf\xe0\xcc\xe2\x4a\xb8\xae\xa7\xcf\
-\x4a\xaf\x1e\x79\xae\xb0\xac\xb1\x4c\x58\x32\x81\x05\x83\x89\x00\
-\x02\xf9\xad\x91\x37\x55\xcb\x15\x3f\xf8\xee\xbd\xb2\x52\x70\x71\
-\x7e\xa5\x8f\x6f\x3e\xf1\x12\x33\x20\x6c\x4b\x10\x11\x71\xc6\x6c\
-\x94\xd6\xd0\xda\x80\x94\xe6\x58\x97\x46\xed\x28\x3e\x7b\x66\x71\
-\xb9\x50\xaf\xd7\x73\xd5\x6a\x8d\x2a\xe5\xea\xdb\xc3\x30\x7a\x0f\
-\x88\xbe\x72\x35\x51\xe0\x8d\xca\x57\xbf\xf6\x15\x28\x95\x35\x6c\
-\xcb\xbe\xa3\x5e\x9f\xa8\x84\x61\x80\xc5\xf3\x2d\xb3\x1a\x38\xcb\
-\xca\x9d\xec\x7b\xae\x94\xb6\x14\x64\x5b\x82\x6d\x4b\x90\x10\x24\
-\xa2\x28\x72\x7b\xfd\x81\xb7\xd8\x5a\x29\x77\xbb\xdd\xea\xcd\x7b\
-\xa6\xe5\xae\xd9\x2a\x26\x6b\x2e\xa6\x1b\x45\xb8\x8e\x05\x69\x09\
-\xb2\x2c\x49\x96\x25\xd8\xba\x50\x97\x52\x8c\x4d\x08\x1a\x9a\xda\
-\x7a\xbb\x2f\x96\xdb\xed\x65\x03\x02\x26\xea\x13\x15\xdb\xb2\xee\
-\xd0\x59\xd6\xf8\xe2\x97\xbe\x70\xf5\x11\x50\x99\x80\x31\xd8\xe3\
-\x79\xf9\xfd\x9e\x97\xc7\xf2\x4a\x0b\x9d\xee\x30\x1c\xd1\x54\xc7\
-\x75\x73\xb0\x6d\x49\x63\xb9\x30\x59\x92\x69\x34\x0a\xed\x23\xc7\
-\x4e\x4f\x39\x92\xec\x52\xde\x11\xef\xdc\x3f\x2b\xdf\x71\xe3\x56\
-\xd2\x3a\x33\x66\x9c\x4b\x41\x4c\x90\x42\xb0\x35\x9e\x31\x9a\x48\
-\x13\x29\x0d\xde\xd0\x11\x69\xa4\xe4\xe8\xf5\xac\xba\xb2\xdc\xf5\
-\x9b\x73\xa3\xa1\x57\x2a\x95\xe1\x79\xde\xfe\xc1\x70\xb0\x47\x83\
-\xda\x57\x0d\x20\xad\x4c\x30\xbb\xfb\x0b\x85\xc2\x0c\x60\xd0\xed\
-\x76\xe1\x47\xa2\x0f\xa7\x16\x38\xb6\x64\x29\x98\xa5\xdc\x00\x10\
-\xa4\x8d\x16\x9e\x23\xdc\x8f\xdc\xbe\xcf\xd9\xb1\xb5\x6e\x72\x8e\
-\x84\xd6\x19\xd2\x34\x21\x66\x69\x88\x08\x4c\x74\xb1\x3d\x08\x6c\
-\x00\x4d\x4c\x50\xca\x00\x44\x00\x11\x0c\x69\x13\xab\xd2\xb0\x3b\
-\xf4\x7d\xbf\xdf\xf7\xb6\xcc\x94\x50\x28\x14\x67\x3a\xab\xab\xfb\
-\x19\xfa\x47\x57\x92\xd1\x45\x09\x11\xc1\x91\x42\xee\xcd\xe5\x3c\
-\x27\x4d\x13\xf8\xfd\xa1\x8a\x4d\xbe\x2f\x6d\x4f\x59\x82\x49\x0a\
-\x06\x8f\xf5\x4f\x2c\x98\x98\x19\x44\x80\x36\x06\xa3\x30\xa1\x6e\
-\x3f\x04\xc0\x10\x42\x82\xc7\x79\x93\x08\x04\x79\x21\x6a\x52\x8c\
-\x65\x23\x84\x20\x31\x9e\xf8\xe3\x67\x42\x10\x84\x93\x8d\x54\xae\
-\xdf\x1f\x0c\x15\x01\xc8\x7b\x05\x47\x0a\xb9\x97\x88\x1c\x5c\xe1\
-\x92\xaf\x02\x50\x5e\x08\x39\x67\xdb\x36\xc5\x71\x84\x20\x4a\x32\
-\x25\xea\x81\xb4\x24\xc4\xd8\x61\x12\x3c\x76\x9c\x99\xc9\xb1\x2d\
-\x13\x26\x3a\xbd\xff\x07\xc7\x48\x30\x51\xbd\xe4\xca\x8f\xdd\x75\
-\x23\xaa\x05\x1b\x84\x0b\x03\xcc\x44\x42\x32\x09\x29\x48\x83\xa0\
-\xc7\xc8\xe3\x97\x4a\x03\x80\x49\x95\x41\x98\x52\x3a\xd0\xf6\x60\
-\x18\xc4\x99\xd2\x4a\xe4\x5c\x97\x84\x10\x73\x44\x9c\x07\x10\x5c\
-\x6d\x16\xf2\x98\xb9\x26\x84\x40\x10\x86\x48\x33\x93\x19\xe1\x25\
-\x82\xc7\xa3\xbe\xb1\x48\x09\xc1\xc4\x44\x28\x97\xf2\xd9\x3b\x6e\
-\xdd\xb7\xac\xb4\xa6\x6e\x6f\x60\xaf\x2c\xb5\x27\xd3\x54\x59\x82\
-\xc9\x18\x8c\x93\x26\x11\x20\x98\x21\x05\x93\x36\x30\x06\xe3\x75\
-\x03\x4a\x9b\x28\xd1\xaa\xbd\x9e\x44\xa7\x5a\xa3\x51\x6b\x2d\x8a\
-\x76\xd5\x22\xec\x6d\xaa\xdd\x5a\x6b\xc7\xb2\x6d\x08\xe6\x1a\x00\
-\xef\xaa\x23\x60\x8c\xb1\x01\xe4\x08\x04\xa5\x14\xb4\x21\xcd\xc2\
-\xd2\xc4\x8c\x30\x35\x59\x90\x2a\x93\x77\x49\xe6\x05\x59\xc4\x44\
-\x52\x08\xd4\x6b\xa5\x54\x30\x43\x30\xd3\xfa\xea\xaa\x21\x22\x10\
-\x33\x11\x60\x36\x12\xfe\x86\xec\x84\x06\x25\x99\x51\xfd\x48\xa5\
-\x4b\xdd\x28\x3c\xdd\x0e\x46\x67\x96\x83\xb0\x37\x4c\xb2\x38\xd1\
-\xa6\x24\x75\x98\x64\x48\x8d\x31\x60\x66\x80\x28\x77\xc1\xa7\xab\
-\x03\xd0\xda\x90\x36\xfa\xe2\xf9\x96\x99\x89\x98\xb1\x3a\xc8\xc2\
-\x93\x4b\xc1\x30\x4c\x8d\xaa\xe4\x6d\x39\x59\x75\xdc\x66\xd9\x76\
-\x2a\x79\xe9\x14\x72\xd2\x72\x2d\x23\x94\x86\x36\x20\x03\x02\x98\
-\x08\x66\x1c\x00\xa3\x35\xcc\x30\x32\x49\xe2\xab\xd1\x8a\x1f\x47\
-\xe7\xd7\xe2\xf0\x7c\x37\x8e\x3a\x7e\x9c\x8e\xc2\x54\x29\x65\xc0\
-\x42\x40\x48\x82\x10\x0c\x66\x43\xcc\xb4\x31\xa0\x30\x5a\x5f\xf1\
-\xbc\xb2\x09\x40\xc5\x2a\x53\xa1\xd6\x1a\x42\x08\x58\x92\x39\x0d\
-\x33\x1c\x59\x18\xf9\x8b\x6b\x71\x24\x2d\x41\xdd\x00\xf1\x62\x2f\
-\x0b\x5d\x3b\x66\xcf\x95\x5c\xc8\x09\x59\x70\xa5\x48\x82\x51\x11\
-\xc3\xb4\x1e\x25\x86\xa2\x0c\x30\x06\x26\x48\x0c\x56\xfc\x64\xf4\
-\xb3\x75\xff\x7c\x2a\xb4\x3f\x08\x33\x9d\x24\x4a\x67\x4a\xc1\x18\
-\x82\x90\x12\x44\x0a\x5a\x13\x58\x03\x9e\xc3\xd2\x75\x48\x08\x16\
-\x50\x2a\x42\x96\x65\xa1\x52\x2a\xbe\x6a\x80\x2c\x53\x41\x9a\xa6\
-\xdd\x34\x4d\x60\x49\x0b\xae\x2d\x64\x10\x06\xa6\xd5\xe3\x48\x83\
-\x0d\x48\xc0\x10\x91\x32\xac\xa3\x8c\x74\x12\x1a\xf2\x63\x95\x12\
-\x19\x13\x0d\x63\xb3\x85\xb3\x24\xca\x8c\x9d\xa8\x71\x10\x93\xcc\
-\x20\x4c\x75\xb6\x1a\xea\x84\x5c\x64\x1a\x0c\x96\x80\x64\x82\x51\
-\x0a\x9a\x5e\x1d\x5c\x21\x80\x7a\x01\xb9\xa2\x67\x5b\x52\x5a\x48\
-\xe2\x18\x69\x9a\x76\x33\xa5\x82\xab\x07\x48\x93\x51\x92\xc4\xe7\
-\xc2\x30\x44\xb5\x56\x81\x97\xb3\xa5\xc9\x46\x76\x94\x7a\x9a\x85\
-\xc0\x38\x8b\x30\x34\x31\x88\x98\x40\x6c\x98\x18\x60\x06\x58\x8c\
-\x55\x43\x04\x22\x36\xe3\x14\x4f\x04\x22\x10\x0b\x23\xa4\x34\xac\
-\x35\x69\xad\x41\x1b\xce\xab\x71\x7a\x37\x00\x6c\x02\x6f\x29\x9b\
-\x72\xb5\x94\xb7\x59\x08\x8c\x82\x11\xe2\x24\x3e\x97\xa6\xe9\xe8\
-\x4a\x00\x17\xd7\x01\xa5\x54\x1c\xc7\xf1\x4b\x83\x41\x3f\x62\x96\
-\x28\x15\x0b\x5c\x73\x93\x4a\x4e\xa6\x56\x66\x58\x6b\xb0\xd1\x60\
-\xa3\xc0\x46\x83\x2e\xde\x6b\x12\x5a\x83\x8d\x01\x19\x80\x0c\x31\
-\x83\x88\x31\x3e\x2b\xd1\x05\x8d\x4b\xb0\x10\xaf\x6b\x44\xc2\xd4\
-\x3c\xe3\x6c\x6f\x50\xa3\x56\x29\x4b\xad\x35\x7c\xdf\x8f\xe2\x38\
-\x7e\x49\x65\xe9\x15\x25\x74\x11\x40\x08\xa1\x92\x34\x3d\xdc\xf3\
-\xfd\x56\x96\x65\x28\x95\x4a\x98\xab\x8b\xc6\x7c\x39\xae\x6a\xc3\
-\x46\x19\xd2\xda\x8c\x1d\x57\x10\x46\x83\xb5\x26\x36\x1a\xc2\x18\
-\x62\x0d\x82\x21\x26\x08\x66\xb0\x60\x10\x6f\x64\xa1\x0b\x00\x52\
-\x40\x88\xb1\x8d\xd7\x92\x71\x49\x82\xb1\x73\x22\xad\xee\x9c\xca\
-\x35\x4a\xa5\x12\x82\x51\x80\xf5\xde\x7a\x2b\x49\x92\xc3\x24\xad\
-\xab\xdf\xcc\x7d\xe2\xe3\x9f\x84\xd6\xfa\xb8\xef\xfb\x2f\xf8\x3d\
-\x1f\x85\x42\x11\xd3\x13\xf9\xc2\x4d\xd3\xe1\x7c\xce\xd2\x32\x33\
-\x64\x14\xc8\x28\x43\x5a\x81\xb4\x1a\x83\x68\x4d\xac\x0d\x31\xe2\
-\x44\x51\x6b\xa5\x8f\xb3\x4b\x3d\x3a\xbb\xd4\xa3\x56\xa7\x8f\x24\
-\x53\x24\xe4\x78\xa4\x85\x78\x6d\x14\x48\x8c\xe5\x57\x70\x8c\xf5\
-\xd6\xad\xe9\xfc\xdc\x54\xb5\xe0\x38\x39\x74\x56\x3b\xe8\xf5\x7a\
-\x2f\x28\xa5\x8e\x7f\xfa\x53\x7f\x75\x25\xff\x5f\xbb\x9d\x66\x12\
-\x9d\x30\x0c\x0e\x2e\x2d\xb5\x7e\xaf\x56\xaf\x55\x1b\x13\x75\x7e\
-\xf3\x96\xf3\xf3\x27\xfd\xc1\xe2\x4f\x57\x1a\xe7\x34\xd8\x10\x08\
-\x04\xbe\xb0\xb5\x61\x02\xd8\xb0\x74\x54\xbb\xa3\x86\x5f\xfe\xce\
-\x8b\xda\xb2\xa4\x01\x80\x34\xcd\xa8\x3b\xd2\x81\x35\xed\x68\x12\
-\x1b\xc7\x0e\x03\x63\x0c\xd8\x18\x18\x6d\x60\x98\x71\xdb\x4c\x38\
-\x7d\xcb\x76\x77\x7e\xaa\xd1\xe4\x38\x8a\x70\xee\xdc\xc2\xfa\x28\
-\x18\x1d\x94\xcc\x9d\x2b\x7a\x7f\x29\x80\x32\x99\x82\xc6\xf7\x3a\
-\xab\x9d\x67\x57\x3b\xab\xef\x6d\x34\x26\x68\x6e\x6a\x54\xf8\x9d\
-\x91\xff\xa6\xb5\x24\x3f\x38\x33\x2a\xaf\x8f\x27\x30\x01\xe3\x09\
-\x6c\x88\x19\xec\x95\x43\x9e\xbd\xf1\xe5\xbe\xd1\x8c\x0b\x27\x34\
-\x63\x00\xab\xc6\x9a\x9c\x42\x64\x40\x04\x63\x60\x0c\x83\x79\x0c\
-\x61\x48\x9b\x5d\xb5\xb8\x7a\xfb\xae\xf4\x4d\xbb\xe7\x66\x0b\xae\
-\x9b\xc3\x89\x93\x27\x4c\x7b\xb9\xfd\xac\xca\xd4\xf7\xb4\x36\xd7\
-\x7e\x22\x7b\xe4\xa1\x47\x71\xe0\xc0\x9d\xfd\x24\x49\xd2\x4c\xa9\
-\x77\x36\x26\x1a\x85\x42\xb1\x40\x36\xc2\x82\x47\x23\xbb\x1d\xe4\
-\xd6\x06\xca\x8d\x85\x10\xe3\x3d\xd1\x05\x39\x08\x69\x19\x99\x2f\
-\xc5\x4e\xa1\x12\xdb\xf9\x4a\x6c\xe5\xcb\xb1\xf4\x4a\xb1\x70\xbc\
-\x04\xc4\x17\x47\x1e\x06\xd0\x30\x50\x1a\x66\xb6\x10\x16\xef\xdd\
-\xd3\xbb\xe9\xb7\xf6\xd4\xb7\x6d\x99\x9e\xe1\x6e\xb7\x8b\xc3\x47\
-\x0e\xaf\xac\xae\x76\xfe\x96\xc8\xfc\xf8\x53\x7f\xfa\x97\xe6\x9a\
-\x01\x00\xe0\xc0\xdd\x77\x99\x34\x4d\xce\x25\x49\x3c\x61\x8c\xd9\
-\xdf\x6c\x4e\x4a\xcf\xcb\x71\x51\x84\x95\x8a\x1c\xba\xdd\xd8\xee\
-\xf5\xb3\x5c\x4c\x2c\x30\xde\xa1\x0a\xb0\x60\x5c\x80\x22\x66\x41\
-\x34\x5e\x8e\x09\xc6\xd0\x86\xf3\x06\xe3\x73\x33\xb4\xc1\xf6\xd2\
-\xb0\xf2\xfe\xdd\xeb\x37\xff\xf6\xee\xf2\x8e\xed\x73\x5b\x65\x18\
-\x86\x78\xf1\xc8\xe1\xe0\xdc\xc2\xc2\x57\x95\x56\xff\x7a\xe2\xc4\
-\xc9\x68\x7e\xfb\x3c\x8e\x1d\xfd\xf9\xb5\x03\x3c\xf2\xf0\x41\xdc\
-\x7d\xcf\x81\x38\x4d\xd3\x57\x82\x20\x98\x27\xe2\x9d\x93\xcd\x49\
-\xe1\x79\x2e\x97\xac\xa8\xda\x74\x06\x65\x82\x49\x7a\xa9\x1b\xa4\
-\xb0\x14\xf3\x6b\xa3\xc1\x9b\xbe\x1f\x35\x66\x7c\x7c\xbc\x60\xc6\
-\x13\xa9\x7d\x6b\xa3\x3b\x7b\x60\x87\x7f\xf3\xdb\x76\x56\xe7\xe7\
-\x66\x67\x65\x92\xa4\xf8\xd9\xa1\x9f\xe1\xb9\xe7\x9f\x7b\xe5\xd8\
-\xf1\xe3\xdf\x38\x72\xe4\x48\x7b\x34\x0a\x54\x96\x65\xd9\x9b\xde\
-\xbc\x0f\x37\xdf\x72\x13\x8e\xbc\xf8\xd2\xd5\x03\x00\xc0\xa3\x8f\
-\x1c\xc4\x81\x03\x77\x77\xa3\x38\x3c\x3d\x18\x0e\xae\x23\x60\x7b\
-\xa3\xd1\xa0\x52\xb1\xc8\x95\x9c\x2a\xcd\xe4\x06\x93\x93\xce\x30\
-\x0f\x20\x8b\x8c\x95\x64\x90\x5a\xd3\x78\x31\x33\x86\x36\xbe\xd4\
-\x82\x56\x1a\x64\x14\xe7\x39\xb2\x77\x17\xd7\x9b\xbf\xbf\x65\x65\
-\xdf\xef\x6e\x4f\xdf\xfc\x96\xeb\x9a\x8d\xe9\xa9\x29\x8e\xa3\x18\
-\x87\x5e\x38\x84\xe7\x9e\x7f\x0e\xed\x76\xdb\x0d\xa3\x68\xbf\x9b\
-\xcb\xbd\xdb\x92\xf2\x36\x66\x86\xd6\xfa\x8c\xd6\x5a\x5d\x2e\x12\
-\x6f\xb8\x59\xfa\xa7\x2f\xfe\x23\xa2\x28\x21\x66\xb3\xdf\xf3\xbc\
-\xcf\x6c\xdb\xb6\xed\xce\xdd\xbb\x76\xbb\x5e\x3e\x8f\x20\x1c\xa2\
-\xe7\xf7\xf5\xaa\x1f\x8f\x96\x86\x72\xe5\x7c\xe0\xad\xac\xc4\x9e\
-\x3f\x54\x6e\x98\x1a\xa1\x00\x82\x45\xa9\x28\x8a\x38\xd7\x74\x83\
-\xf2\x96\x7c\xd4\x9c\x2d\x9b\xe6\x4c\xad\x90\x6f\xd4\x27\xd8\x71\
-\x5c\xac\xad\xad\xe1\xe8\xb1\x97\x83\x9f\x3e\xf7\xdc\xc2\xd9\x73\
-\xe7\xb6\xdd\x70\xfd\x9e\x5c\xb1\x58\x84\x65\x49\x04\x61\xa8\x4f\
-\x1e\x3f\x71\x6a\x69\xa9\xfd\x59\x63\xcc\x7d\x44\x14\x3f\x70\xdf\
-\x83\xd7\x06\x00\x00\xff\xf0\x85\xbf\x07\xa5\x84\x94\xd3\x3d\xb6\
-\x65\xff\x49\xa3\xd1\xf8\xe8\x8e\xeb\x76\x4e\x4f\x4f\x4f\x41\x5a\
-\x12\x51\x1c\x21\x0c\x02\x04\x51\xa2\x82\x58\x25\x51\x66\x92\x4c\
-\x23\x03\x00\x8b\x49\xe6\x6c\xb6\x8b\x39\xcb\x2e\xe4\x3d\x51\xc8\
-\x17\xe0\x38\x2e\xa2\x30\xc2\xc2\xb9\x05\x9c\x3c\x79\x62\x69\xa5\
-\xb3\xf2\xf5\x67\x9e\x7d\xfe\x19\xbf\x3f\xf8\xfc\xdb\x6e\xbb\x79\
-\x77\xbd\x5e\x47\xad\x56\x43\xad\x5e\xc5\xda\xda\x1a\x9e\x79\xe6\
-\xd9\xe3\xed\xa5\xf6\xe7\xb4\xd6\xf7\x1b\x63\x22\xcf\x93\xf8\xfa\
-\x7f\x3e\x70\x65\x09\x6d\x5c\x8f\x1d\x7c\x02\x07\xee\xbe\x0b\x71\
-\x9a\xae\xa9\x2c\xfb\x69\x7f\x30\x38\xbd\xba\xba\x5a\xf2\xfd\xde\
-\x04\x0c\xdc\xbc\x57\x40\xa9\x58\x42\xb9\x54\xe2\x5a\xb9\x68\x35\
-\x2a\x79\x77\xaa\x56\xf0\xa6\x6b\x45\x6f\xaa\x5e\x76\x1b\xf5\xaa\
-\x55\x2e\x95\xd9\x71\x5c\x44\x51\x84\x85\xb3\x67\xf1\xd2\xcb\x47\
-\xfc\x13\x27\x8f\xff\x68\xa5\xb3\xf2\x77\x69\x9a\xfe\xdb\xa3\x8f\
-\xff\x60\x31\xe7\xba\xb7\x57\xab\xe5\xeb\x98\x19\xfd\xfe\x00\xa3\
-\xe1\x08\x93\x93\x4d\x34\x1a\x13\x13\x7e\xcf\xdf\x37\x1c\x0e\x3b\
-\x59\x96\x1d\x37\x86\xff\x8f\x9c\x2e\x0b\x00\x00\x8f\x1e\x7c\x0c\
-\x4f\x3e\xfe\x24\xd6\xba\x2b\xe1\x0b\x87\x5e\x38\xca\x82\x9f\xf2\
-\x7d\xff\xf4\xf2\xf2\xb2\x5a\x59\x5e\x76\x7b\x3d\xdf\x0e\xc3\xc8\
-\xce\xd2\x14\x4a\x69\x28\xa5\x91\xa5\x0a\x61\x18\xa1\xe7\xfb\x58\
-\x6a\x2f\xe1\xd4\xa9\x93\xc1\xd1\x63\x47\xcf\x9f\x38\x79\xe2\xa9\
-\x56\xab\xf5\xe5\xf6\x52\xfb\x9f\xbf\xf1\xf5\xff\x7e\xfa\xfe\xfb\
-\xbe\x1d\x3a\x39\x0f\x5e\xde\xbb\xb5\x50\x28\xdc\x92\xcf\xb9\xb4\
-\xb2\xb2\x8c\xc1\x60\x88\x34\x55\x98\x99\x99\x41\xb3\xd9\x98\xf0\
-\x7d\xff\x2d\x41\x10\x74\x8c\x31\x27\xf6\xee\xbb\xe1\x35\x10\x57\
-\xfb\x0b\xcd\x6b\xda\xdd\x71\xc7\x7b\xc4\xad\xb7\xdd\xd2\xb0\x6c\
-\x6b\x9f\x65\x59\x37\xda\xb6\x7d\xbd\xe3\x38\xb3\x96\x65\x57\xa4\
-\x10\x2e\x00\x64\x2a\x8b\x93\x38\xf1\xa3\x38\x3a\x1f\x04\xc1\x89\
-\xd1\x68\x74\x64\x71\xf1\xfc\xb1\x27\x9f\xf8\xfe\xda\x6a\x67\x55\
-\x6d\xf4\x69\x3b\x8e\xd9\x79\xfd\x0d\xef\x6b\x36\x9b\x9f\xbf\x7e\
-\xcf\x8e\x5d\x9e\x6b\xa3\xdf\xef\x23\x9f\x2f\x62\xeb\xd6\x59\xec\
-\xdc\xb5\x03\x83\xc1\x00\x4f\xff\xe4\xe9\xe3\xed\xf6\xf2\xe7\xb5\
-\xd6\xf7\x19\x63\xa2\x62\xb1\x88\xff\xf8\xda\x7f\x5d\x15\x00\x6d\
-\x2a\x37\x9b\x01\x80\xf9\xed\xf3\xf6\x6d\x6f\xbd\x25\x9f\xf7\xbc\
-\x92\x90\x32\x2f\x04\x3b\x5a\x1b\x8a\xe3\x38\x0d\x46\xa3\x70\x79\
-\xa5\x33\x3a\xf2\xe2\x4b\xa1\xdf\xf3\x15\xc6\x7b\x2f\xbe\x74\x40\
-\x0a\xa5\x92\x3b\xbb\x6d\xfb\xbd\x53\x53\xcd\x4f\xee\xbd\x7e\xd7\
-\x76\xd7\xb1\xe1\xfb\x3e\x0a\x85\x02\xb6\x6e\xdd\x8a\xdd\x7b\x76\
-\xc1\xf7\x7d\x3c\xfd\x93\xa7\x8f\xb7\x5a\x4b\x9f\xcb\xb2\xec\x5b\
-\x96\x65\x25\x0f\xdc\xf7\xe0\x15\x01\xde\xc8\x79\xbe\xa4\xc4\x65\
-\xde\x6f\xb6\x37\x6a\x03\x27\x97\xcb\x6d\xdd\x36\xff\xbe\xd9\xd9\
-\x2d\x9f\xd8\x7b\xc3\xee\x6d\x39\xd7\x46\xaf\xe7\x23\x9f\x1f\x43\
-\xec\xb9\xfe\x22\xc4\xa9\x56\xab\xfd\x37\x44\xb8\x1f\x40\x74\xa5\
-\x39\xb0\xd9\x39\xbe\x4c\xc9\x17\xe6\x93\xc0\x78\x7f\xb5\xb9\x14\
-\x9b\xde\x6f\x6e\xb7\xd1\xc6\x02\x60\xab\x2c\x13\xc3\xc1\xa0\x05\
-\x16\xfd\x24\xcd\xae\xab\x56\xaa\x95\x62\x21\x8f\xc1\xa0\x8f\x30\
-\x8c\x90\x65\x19\x66\x66\x66\xd0\x68\x36\x6a\xeb\xbd\xde\xbe\x60\
-\x34\x3a\x0b\xe0\xd4\xb5\x00\xbc\x9e\xf3\x84\x2b\xc3\x6d\x86\x7c\
-\xa3\x08\x49\x00\x96\x52\x8a\x46\x83\xfe\x39\xc3\xa2\x97\x24\xe9\
-\x8e\x5a\xad\x56\x2e\x16\xf3\xe8\xf7\x5f\x85\x98\xdb\x36\x07\xcb\
-\x96\x13\x4b\xad\xd6\x30\x0c\xa3\x1f\x5e\x2b\x00\x2e\xb9\x7f\xbd\
-\xf7\xf4\x06\x9f\xdf\x28\xcd\x05\x7b\xbd\xbe\x58\x29\xa5\x86\x83\
-\xfe\x19\xb0\xe8\x24\x69\xba\xab\x5a\xab\x54\x8a\x85\x02\xfa\xfd\
-\x3e\x00\xa0\x56\xab\x62\x7d\xbd\x97\x9d\x5b\x38\xf7\x43\xdf\xf7\
-\xaf\x09\xe0\xf5\x9e\x6f\xae\x9b\x4b\x4a\x00\xe3\x5f\x2c\x37\x39\
-\xad\x37\x95\x1b\xa6\x36\x3d\x37\x00\xa0\x95\xca\x46\xc3\xe1\x2b\
-\x24\xc4\x7a\x92\x64\x3b\xab\xd5\x4a\xa5\x56\xab\xa2\x5c\x29\xc3\
-\xef\xf7\xf1\xe2\xe1\x23\x47\xda\xcb\xcb\xff\xf2\xd4\xf7\x9f\x7a\
-\xe5\x8a\xeb\xc0\x25\xce\x9a\x4b\x1c\xda\x6c\x97\x3a\xba\xe1\xd8\
-\x46\x5d\x01\xc8\x2e\xb1\x74\x53\x5d\x6d\x32\xa3\x54\xa6\x86\x83\
-\xe1\x59\x30\x0f\xe2\x24\xdd\xe9\x3a\x4e\xa9\x3f\x18\xe8\x63\xc7\
-\x8e\x9f\x3e\x73\xe6\xcc\x97\x0f\x1f\x3a\xfc\xe3\x38\x4e\x7e\xb9\
-\x75\x00\x6f\x2c\x9d\xcb\xc9\xe8\x72\x7d\x6f\x4c\x6e\x6b\x93\x49\
-\x00\x96\xed\xba\xf9\xd9\xb9\x6d\xef\x2a\x95\xcb\xef\x22\x98\xf5\
-\x7e\xaf\xf7\x3f\xe7\xce\x9e\x3d\x94\x24\xc9\x00\x40\x74\xad\xff\
-\xec\xb1\xa1\xe1\xab\x91\xd4\xb5\xf6\xbb\x39\x9b\x49\xbc\x9a\xa1\
-\x2c\x21\x84\xe3\xe6\x72\x85\x2c\x4d\x75\x1c\xc7\x1b\x51\x8b\x7f\
-\x19\x80\xcb\x39\xf0\xeb\xe8\x63\x73\x96\xda\x48\xbb\x1b\x30\x1b\
-\xf7\x1b\x83\x98\x02\x48\xff\x17\x2a\x28\x31\xec\xe8\x9a\x9b\xdf\
-\x00\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\
-\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\
-\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\
-\xca\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
-\x65\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\
-\x32\x33\x3a\x32\x36\x3a\x31\x38\x2d\x30\x37\x3a\x30\x30\x67\xec\
-\x3d\x41\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
-\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\
-\x54\x30\x39\x3a\x31\x31\x3a\x33\x39\x2d\x30\x37\x3a\x30\x30\x0c\
-\x48\x1a\x7b\x00\x00\x00\x34\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\
-\x73\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\
-\x63\x65\x6e\x73\x65\x73\x2f\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\
-\x6a\x06\xa8\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\
-\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\
-\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\
-\xdd\x31\x7c\xfe\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
-\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\
-\x74\x53\x6f\x75\x72\x63\x65\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\
-\x6f\x6e\x20\x54\x68\x65\x6d\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\
-\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\
-\x74\x74\x70\x3a\x2f\x2f\x61\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\
-\x6f\x72\x67\x2f\x32\xe4\x91\x79\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x09\xe8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x09\x7a\x49\x44\x41\x54\x78\xda\x6c\
-\x88\xc1\x0d\x80\x40\x10\x02\xe1\xb4\x5b\x3b\xf1\x63\x35\x36\xe4\
-\xcb\x22\x14\x0e\xbd\xfd\x98\x38\xc9\x84\x09\xb4\x8d\x07\x2e\xc4\
-\x3f\xf9\x95\x71\x8b\x1c\xaa\xfa\xcb\x06\xf1\xc4\xdd\x56\x68\x72\
-\x44\x7a\xa8\x19\xb8\xaa\x0b\xef\xc7\xbb\x5d\x00\x31\x31\x50\x02\
-\xfe\x31\x22\x61\x26\x7d\x86\x3f\xff\x3a\x18\xbe\x7f\x5d\x0b\x34\
-\x5e\x89\x58\x23\x00\x02\x88\x32\x07\x30\x40\x43\x06\x14\x42\x3f\
-\x7e\xfc\x8a\xb3\x8d\x65\x88\x73\x48\x0a\x64\xf8\xf2\xf9\x08\xc3\
-\xdf\x3f\xb1\xc4\x68\x07\x08\x20\xca\x1d\x00\x8a\xa2\xff\xc0\x20\
-\xfe\xfd\xef\xaf\xb2\x88\x22\xc3\x82\xac\x39\x0c\x7d\xa9\x53\x25\
-\x39\x18\x59\x16\x30\xfc\xf8\xda\xcf\xc0\xc8\xc8\x86\x4f\x37\x40\
-\x00\xb1\x10\x69\x8b\x08\xc3\xff\x7f\x9a\x0c\x7f\xfe\xab\x32\xfc\
-\x65\xe0\x06\xfa\xf8\x1f\xc3\x7f\x68\x14\x80\x43\x80\xe9\x37\xc3\
-\x0f\x06\xc5\xaf\xdf\xbf\x02\xed\x63\x64\x28\xf4\xce\x62\x30\x51\
-\x36\x61\x4a\x99\x98\x51\x70\xeb\xc1\x75\x6d\x06\x4e\x21\x50\x68\
-\xbc\xc4\x66\x30\x40\x00\xe1\x77\xc0\x3f\x06\x45\x86\x5f\xff\xf3\
-\x81\xb4\x2b\x17\x37\x8f\xba\xb4\x90\x34\x33\x0f\x1b\x2f\xd0\x2d\
-\x0c\xd0\x04\xc9\x00\x4d\x90\xc0\x18\xf8\xf6\x8b\x41\x4e\x48\x81\
-\xe1\x37\xc3\x37\x86\x43\x7f\x57\x32\xd8\x6a\x84\x32\x1c\x6c\xdd\
-\xc5\x10\xdc\x1e\xe5\x7a\xec\xe2\xd1\x8d\x0c\x9c\x82\x01\x40\xd5\
-\x2f\xd0\xad\x00\x08\x20\x46\xac\xb9\x80\x91\x81\x0d\x68\x52\x19\
-\xc3\x5f\xc6\x4a\x17\x2d\x17\xae\x54\xdb\x54\x06\x67\x55\x57\x06\
-\x61\x1e\x01\xa0\xbd\xff\x19\xfe\x33\xfc\xc7\x4c\x0a\x40\xc8\xcc\
-\xc8\xcc\xf0\xf9\xff\x7b\x86\x29\x5f\x72\x19\x38\x18\x78\x18\x92\
-\xf9\x9b\x18\x18\xbe\xf0\x30\x04\x34\x45\x32\xec\x3f\x7b\xe0\x04\
-\x03\xa7\x80\x17\xc3\x7f\xa0\x02\xa4\x5c\x00\x10\x40\xd8\x1c\xc0\
-\x09\x0c\xce\x59\xd2\x42\x32\x31\x93\x23\x27\x33\x04\x1a\x04\x30\
-\x7c\x62\x78\xc3\x70\xf6\xcb\x01\x86\xdb\xbf\x2e\x33\x7c\xff\xff\
-\x0d\xa8\xfb\x3f\xce\xf4\xf0\xf7\xff\x1f\x86\x17\x7f\x1f\x00\xd5\
-\x7d\x61\xe0\x61\x12\x60\x48\x14\xa8\x62\x10\xfe\xa5\xc0\xe0\x52\
-\x11\xcc\x70\xe1\xce\xb5\x26\x06\x56\xf6\x7a\xb0\x03\xb6\x3d\x04\
-\xeb\x00\x08\x20\xf4\x28\x60\x06\xfa\x7c\xbe\x82\x98\x42\xf8\xf6\
-\xbc\x1d\x0c\x4a\x12\xf2\x0c\xf3\x9f\xf7\x30\xec\xff\xb2\x91\xe1\
-\xe3\xdf\xb7\x0c\x9c\x4c\xdc\x0c\xac\x8c\xec\xf8\x13\x24\x10\xb0\
-\x31\xb2\x82\x13\xc9\xd3\xbf\xb7\x18\x2e\x33\x9d\x61\x08\x16\x37\
-\x64\xd0\x94\xd7\x62\xb8\x70\xed\x92\x0a\x03\x33\x07\x8a\x0e\x80\
-\x00\x62\x41\xd1\xfc\xe7\x7f\xa4\x08\xa7\x48\xf8\xda\x94\x75\x0c\
-\xe2\x02\x42\x0c\x25\xd7\x12\x18\xce\x7f\x3b\xce\x20\xcd\xa6\xc0\
-\x10\x2c\x94\xc9\x60\xc1\x67\xcf\xc0\xc5\xcc\x0b\x8d\x82\xff\xe8\
-\xf6\x32\xfc\xfb\xf3\x8f\xe1\xed\xcf\x37\x0c\x5d\xcf\x2b\x18\xde\
-\xfc\x79\xc1\x90\x28\x56\xc0\x10\x2c\x96\xca\xd0\xbb\x72\x06\xc3\
-\xca\x5d\xab\xbf\x30\x70\xf2\x4e\x47\x77\x32\x40\x00\x21\x87\x80\
-\x30\xd0\xf7\x75\x15\xfe\x95\x0c\x46\xb2\x86\x0c\xd9\x57\xa3\x19\
-\xf6\x7d\xd8\xc1\xe0\xc4\xef\xc3\x50\xaf\xd8\xc3\xc0\xf9\x87\x97\
-\xe1\xd0\x8d\x63\x0c\x4f\xdf\x5f\x60\x60\x62\x60\x44\x2d\x09\x81\
-\xec\xdf\x7f\xfe\x30\x98\xc8\x1b\x32\x28\xca\xab\x30\xfc\xfc\xf6\
-\x9f\x21\x43\xb2\x96\x21\x44\x32\x86\xa1\x73\xf9\x34\x86\x8a\xd9\
-\x8d\x3f\x18\x98\xd9\x93\x80\x2e\x3d\x82\xee\x00\x80\x00\x42\x38\
-\xe0\xcf\x7f\x4f\x11\x01\x51\x95\x38\xc3\x38\x86\xb5\x0f\x97\x33\
-\x6c\x7e\xb6\x91\x41\x87\xdb\x80\xa1\x49\x61\x02\xc3\xcd\x47\x77\
-\x19\x72\x96\xe6\x31\x9c\xbf\x73\x0e\x58\xd4\xfe\xb9\x03\x2e\x66\
-\xff\x33\x31\xc2\x8b\xe7\x7f\x8c\xff\x18\x3e\x7f\xd7\xc9\x0a\x2f\
-\x13\x6c\x56\x28\x65\x68\x56\x9c\xc8\xa0\xc8\xa6\xce\x90\x3f\xa3\
-\x96\x61\xd2\xda\x99\x5f\x18\x58\xb9\xd2\x19\x98\x98\x57\xc3\x43\
-\x0d\xa9\x48\x06\x08\x20\x84\x03\x7e\x32\x38\x3b\x68\x3b\x30\x72\
-\xb0\x71\x30\xf4\xdd\xee\x66\x78\xfa\xf1\x2b\xc3\x34\xd5\x52\x86\
-\x37\x6f\x3e\x30\x04\x4d\x0a\x62\x78\xf9\xe6\xd9\x42\x06\x0e\xde\
-\x62\x06\xe6\xff\x6f\xc1\x25\x1f\x03\xac\x6c\x67\x84\xd0\xec\x4c\
-\xdb\x99\x18\x99\x3d\x84\x38\x44\x18\x9e\x3d\x7b\xc3\xe0\x3f\x27\
-\x8e\x61\xef\xa9\xbd\xf7\x19\x38\xf9\xd3\x80\x96\xef\x01\x5b\xfe\
-\x1f\xaa\xf6\x1f\xc2\x01\x00\x01\xc4\x82\x94\x8f\x74\x2d\x15\xad\
-\x80\xd4\x3f\x86\x68\xc9\x44\x86\x58\xc9\x64\x06\x47\x11\x27\x86\
-\x96\xcd\x1d\x0c\x2f\x5f\x3f\x3b\xce\xc0\xcd\x97\x02\xb4\xec\x0f\
-\xd0\x04\x06\x06\x16\xa0\x41\xbf\x18\x21\x71\x0f\x32\xec\x1f\x2b\
-\x48\x8a\x91\x8d\x89\x8d\x61\xd9\x81\xb5\x0c\x85\xb3\xeb\x19\x5e\
-\xbd\x7a\xb1\x99\x81\x47\x30\x1b\x68\xe0\x63\x70\x59\xfd\x1f\x5a\
-\x67\xa0\x01\x80\x00\x42\x38\x80\x91\x51\xe6\xd5\xe7\xd7\x0c\xc7\
-\x6e\x1f\x67\x50\xfa\xa7\x01\xd6\x70\xe4\xd6\x09\x86\x83\xb7\x8e\
-\x02\xf3\x06\xeb\x0e\x86\xff\xcc\x7f\x18\x80\x21\xcd\xc0\xfa\x1f\
-\x62\x10\x07\x90\xfd\x1b\x68\xf9\x17\x4e\x88\x7e\x36\x1e\x86\xa5\
-\x07\x37\x32\x4c\x58\x3f\xe7\xdd\x3f\x50\xa5\xc4\xcd\xd7\xcd\x00\
-\xd4\x02\x29\xac\x98\x19\x18\x70\xe4\x5c\x80\x00\x42\x94\x03\x29\
-\xec\xe7\x58\xfe\x31\x29\x00\xed\xf8\xf3\x1f\x5a\xba\x31\xfe\x67\
-\x66\xf8\xf3\x97\x89\xe3\x3f\x03\x53\x19\x90\x33\x83\x81\xf5\x37\
-\x24\xec\xff\x31\x49\x02\xe9\x67\xc0\x10\xf8\xcf\xf0\x4e\x00\x66\
-\xd6\x1e\x86\x5f\xff\xf8\x18\x98\x58\x32\x80\xd1\x74\x0e\xe8\x58\
-\x26\x70\x99\x82\x5a\x63\x42\xd3\x0e\xf3\x9f\xff\xfb\x6e\xfe\x00\
-\x69\x02\x08\x20\xa4\x28\x60\xb4\xfe\xf3\x0f\x58\xab\x80\x32\xf0\
-\x3f\x68\x7c\x81\x68\x60\xd0\x00\xf1\x77\x06\xe6\xbf\xa0\x20\x17\
-\x67\xf8\xfb\xaf\x1f\x18\x24\xb2\x40\x09\x5b\x48\x6e\x84\x07\x6b\
-\x16\x03\x33\xcb\x33\x20\xfd\x05\xe8\x58\x90\x5a\x4f\xa0\xda\x85\
-\x0c\xdf\x7f\xfe\x01\x5a\xf8\x0f\x58\xaa\x42\x1c\xc0\xc8\xc2\xc2\
-\xc0\xc6\x09\x8c\x16\x06\x63\x90\x26\x80\x00\x42\xce\x86\xdf\x19\
-\x18\x81\x0a\x98\x18\x21\x09\xec\x3f\x94\x06\x05\x23\x38\xb2\x7f\
-\x79\x02\x0d\xeb\xe5\xe1\x11\xd3\xfc\xfa\xe3\xe7\x21\x78\x88\x32\
-\xff\x86\x34\x38\xfe\x33\xdd\x82\x86\x29\x44\xfd\xaf\xdf\x22\xf2\
-\x62\xb2\xc2\x13\xb2\x5a\x19\x38\x18\xb9\x80\x85\x27\x23\x03\x13\
-\xeb\x3f\x60\x69\x78\x9d\xa1\x7a\x7a\x2f\x3c\x15\x02\x04\x10\x0b\
-\x8e\x88\x81\x60\x16\xb0\xe5\x5c\x0c\x3f\xbe\xd7\xb1\x31\x73\x94\
-\xb5\xc4\xf6\x33\x32\x33\xb1\x32\x14\xcf\x2e\x00\xa6\x05\x60\xdc\
-\xff\x01\x96\x8a\xa0\x74\xc1\xf4\x07\x12\xc4\x8c\xb0\x56\x13\x30\
-\xce\xbf\x7e\xb3\xb5\xd5\x34\x63\x08\xb0\x74\x65\x78\xcb\xf0\x00\
-\x58\xba\x7f\x63\x90\x66\xd0\x62\xe0\x62\xe5\x66\xf8\xfb\xe3\xcf\
-\x7b\x98\x55\x00\x01\x84\xbd\x3d\xc0\xf4\x0f\x82\x19\x18\x64\x19\
-\xbe\x7c\x5b\xaf\x2a\xa6\x5e\xbe\xad\x62\x07\x63\xa9\x4f\x01\x03\
-\x17\x1b\x17\xa8\xcc\xf8\xcf\xf0\x97\x15\x52\x15\x63\xa9\x96\x18\
-\xbe\x7d\xc9\xe6\xe2\xe4\x8b\xce\xf6\x4b\x05\xd6\x23\xaf\x19\x9a\
-\x9f\x67\x30\x4c\x7a\x59\xc3\xf0\x8b\xe1\x33\xc3\xf1\x0b\xe7\x80\
-\x59\xfe\xf7\x43\x98\x6a\x80\x00\x42\x84\x00\x46\x3b\xef\xbf\x29\
-\xc3\xe7\x1f\x4b\x3c\xcd\x7c\xd5\xe6\xa7\xcd\x63\x10\x16\xe0\x65\
-\xf8\x03\x34\xe2\xd7\xcf\x5f\x0c\x0c\x9f\xff\x6a\x31\x70\x7c\x5d\
-\x09\x74\x00\x13\xa2\x4d\x00\x8e\x63\x60\x5c\x33\x29\x4b\x09\x4b\
-\x19\xf7\xe4\xb5\x33\x58\xe8\xe8\x33\xcc\x7c\xd5\xc4\xf0\xf4\xcb\
-\x33\x86\x70\x91\x2c\x06\xb6\xff\xbc\x0c\xab\xf6\x6f\x03\x46\x1b\
-\xdb\x51\x98\x2d\x00\x01\x84\x9c\x08\x91\xec\xfe\xaf\xcb\xf0\xed\
-\xc7\xc6\x70\x87\x18\xc9\x85\x40\xcb\x9f\xfe\xbb\xc3\x30\xe9\x7e\
-\x29\x43\xa1\x7c\x1b\x83\x9d\x9a\x2d\x43\x79\x6c\x8d\x28\x33\x2b\
-\x67\x18\xbc\x4d\x00\x6d\xac\x82\xea\x02\x25\x29\x65\x06\x0f\x53\
-\x07\x06\x59\x71\x31\x86\xc5\x2f\x27\x31\x6c\x79\xb3\x82\x41\x9e\
-\x4d\x8d\xc1\x47\x30\x96\x61\xcb\xe1\x83\x0c\xe7\x2e\x5d\xfe\xc4\
-\xc0\xce\xb9\x1e\x66\x15\x40\x00\xb1\x60\xa9\xd0\x64\x18\xbe\xfe\
-\x58\x9b\xe4\x92\x2e\x39\x37\x6d\x06\xc3\xe9\x0f\x87\x18\xda\x1e\
-\x94\x80\x0b\xa8\x27\x9f\x1e\x31\x48\xcb\xc9\x33\x94\x26\xe4\x01\
-\x93\xc8\x7f\xec\xd5\x31\xb0\x42\xb9\xfb\xe5\x32\x43\xcf\xf5\x39\
-\x0c\xe7\xbf\x9e\x60\x90\x62\x95\x61\x28\x50\x6c\x65\xf8\xfd\x99\
-\x89\xa1\x62\x5a\x2f\xa8\x31\x33\x17\x18\xbf\x17\x60\x3a\x00\x02\
-\x08\x51\x0e\x24\xf0\x40\x44\x7e\x7d\x9f\x6c\xac\x68\x9e\x73\xa4\
-\x6e\x3f\xc3\xf1\xf7\xfb\x19\x1a\xef\xe5\x33\xb0\x30\xb1\x00\x0b\
-\x3f\x36\x60\x9e\x00\x55\x43\x8c\x58\x1b\x24\x10\xeb\x19\x81\x0d\
-\xa8\x9f\x0c\xef\xff\xbc\x65\x00\xea\x60\x30\xe5\xb3\x61\x28\x53\
-\x69\x66\x10\xfe\x2f\xc3\x10\x51\x53\xc0\xb0\x79\xef\xee\x53\x0c\
-\xdc\x3c\x2e\x40\xa5\x9f\xff\x1f\x87\xb8\x01\x20\x80\x58\x50\x9a\
-\xd8\xe0\xe0\x67\x79\xff\xe5\xdb\x67\x86\x4f\x1f\x3e\x31\xf0\x31\
-\xf2\x03\x4b\x58\x36\x86\xf7\x7f\x3f\x31\x70\x03\xdb\x02\x42\xac\
-\x22\x40\x87\xb0\xe0\x75\x80\x20\x13\x27\x83\x19\x9f\x23\x83\xaf\
-\x58\x08\x83\x85\xb0\x2d\xc3\xc5\xdb\x77\x18\x42\x3a\x63\x19\x4e\
-\x9d\x39\x73\x81\x81\x97\x2f\x02\xa8\xf5\x33\xb2\x1e\x80\x00\x42\
-\x84\x40\x2c\x1f\x4c\x88\x97\xe1\xcb\x97\x2d\x0e\xba\x6e\x76\x6b\
-\xb3\x97\x33\x3c\xfe\x77\x8f\x21\x1b\xd8\x2e\x78\xf7\xfb\x0d\xc3\
-\x02\x8d\x75\x0c\xca\x5c\xc0\x76\x29\xd3\x5f\xcc\x94\x0f\x75\x00\
-\x33\x10\x32\xfe\x61\x66\xb8\xfd\xf4\x11\xc3\xec\x9d\xab\x19\xd6\
-\xec\xd8\xca\xf0\xe1\x13\x30\xc1\x72\x70\x01\xf3\xee\x7f\x78\x9b\
-\xf0\xff\x09\x48\x08\x00\x04\x10\xa6\x03\xc0\x65\x37\x8b\x04\xc3\
-\xe7\x2f\x5b\x4d\x54\x2d\x8d\x96\x67\x2e\x60\x60\xe4\xf9\xc3\xd0\
-\x70\xb3\x8a\xa1\x54\xa9\x8a\xe1\xc6\xd5\xc7\x0c\x53\xb7\xcd\x66\
-\x60\x63\xe5\x82\x26\x3e\x44\x8f\x09\x54\xfa\x7e\xff\xf5\x8b\xe1\
-\xd1\xeb\x57\x0c\x8f\x5f\xbc\x78\xff\xff\xdb\x8f\x33\x0c\x6c\x1c\
-\xfd\xc0\x54\xbf\x1d\x23\xb3\x42\x1d\x00\x10\x40\x38\x1c\x00\xea\
-\x56\xb1\xca\x01\x1d\xb1\x40\x5d\x46\xdb\x71\x4a\x42\x2f\x83\xa1\
-\x92\x26\xc3\xcf\xbf\xbf\x18\x66\x6c\x5f\xca\xd0\x3c\xb7\xfe\x31\
-\x03\x1b\xdf\x22\x48\x36\x64\x42\xca\x86\xc0\x92\xe8\x3f\xf3\x0f\
-\x06\x26\xb6\x87\xc0\x62\xef\x34\x30\xb1\x5d\x41\x2b\xae\x31\x1c\
-\x00\x10\x40\x78\x9a\xe5\xff\x1f\x31\x70\xf1\x79\xdd\x7c\x7c\xa7\
-\xcf\xb7\x23\x32\xb3\x26\xb8\x94\x21\xd7\x33\x9e\x81\x8b\x1d\xe8\
-\x73\x36\xde\xbb\x0c\x1c\xdc\x35\xe0\x12\x0f\xa5\x1c\x40\x62\x83\
-\x2d\xfe\x8f\x68\xaf\xe1\x00\x00\x01\x44\xa0\x63\xf2\xff\x07\xd0\
-\xa2\xac\x1f\xbf\xfe\x5d\xa8\x59\xd8\xdc\x7a\xed\xf1\x6d\x11\x41\
-\x1e\x61\xa0\x99\xac\x4c\xc0\xe6\x2f\xa4\x18\x06\xd5\x17\x28\x89\
-\x92\xb0\xa5\xc8\x00\x20\x80\x08\xf7\x8c\x40\xbe\x60\x66\x99\xc5\
-\xc0\xc1\x72\x78\xd9\xee\xb5\x13\x19\x59\xb9\x5c\x81\x4d\x2c\x56\
-\xf4\x76\x29\xb9\x00\x20\x80\x88\xec\x9a\x81\x6c\x62\xba\xce\xc0\
-\xc9\xe5\xfd\xff\x37\x73\x25\x30\xde\x15\xa1\xde\xa4\xd8\x09\x00\
-\x01\x06\x00\x00\x1a\x79\xe3\x89\x7d\x54\xa5\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\x85\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x09\x17\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x03\xee\x00\x80\x00\x62\x41\xe6\xac\x66\x64\x44\x91\xfc\xcb\xc0\
-\x10\x05\x8c\xa0\x0c\x26\x56\x56\xf9\x5f\xbf\x7f\x1f\x07\xba\xb6\
-\xf3\x1f\x03\xc3\x79\xa0\x38\xc3\x1f\x88\x3c\x03\x72\x04\xfe\x87\
-\x60\x95\xdf\x0c\x0c\x15\xcc\x2c\x2c\xce\xbf\xff\xfc\x79\x0f\xe4\
-\x2f\x00\xea\x9b\x0e\x54\xff\x1b\xa4\x07\xa8\x9f\xa1\x0a\x29\xda\
-\x01\x02\x08\x67\x08\x00\x0d\xa9\xe5\x53\x53\x5b\x6c\xbd\x64\x89\
-\xad\xd3\xde\xbd\x72\x86\x4d\x4d\xe1\xff\x59\x59\xb7\x03\x2d\x75\
-\x66\xc4\xa1\x07\x28\x67\x04\xb4\x64\x87\x51\x7e\x7e\x72\xe0\xde\
-\xbd\x0a\xbe\xeb\xd6\x19\x8a\x9b\x99\x4d\xfc\xce\xc0\x30\x11\xdd\
-\xb3\x30\x00\x10\x40\x0c\xa0\x44\x08\xc3\xab\x80\x02\x20\xbc\x94\
-\x81\xa1\x65\xbb\x9e\xde\xff\x8f\xd7\xae\xfd\x47\x06\xf7\x96\x2e\
-\xfd\xbf\x80\x8b\xeb\xf5\x1c\x06\x06\xb7\xd9\x40\x75\x33\x80\x78\
-\x3a\x14\x4f\x65\x60\x30\x9c\xc8\xcc\x7c\xf7\x5c\x5f\x1f\x58\xed\
-\x2f\x20\xfe\x0b\xc4\x9f\x9f\x3d\xfb\xbf\xdc\xc9\xe9\x7f\x33\x03\
-\xc3\xdc\x0e\x06\x06\xd6\x56\x50\x28\x21\xd9\x09\x10\x40\x18\x0e\
-\x58\xc2\xc0\x50\xb7\x5d\x5f\xff\xff\x97\x7b\xf7\x20\xb6\xee\x5d\
-\xf3\xff\x4f\x96\xef\xff\xbf\x4f\x21\xfc\x7b\xcb\x97\xff\x9f\xcb\
-\xc5\xf5\x0a\x68\xb9\xd3\x4c\xa0\xfa\x69\x40\x3c\x05\x64\x39\x23\
-\xe3\xfd\x0b\x50\xcb\x3f\xbd\x7d\xf5\xff\x5e\x42\xc0\xff\x27\x33\
-\xfb\xfe\xff\x04\xf2\xbf\xbc\x7c\xf9\x7f\x89\x83\xc3\xff\x7a\xa0\
-\x9b\xdb\x18\x18\xd8\x90\xed\x04\x08\x20\x14\x07\xac\x00\xc6\xf9\
-\x16\x75\xf5\xff\x9f\x6f\xdc\x00\x1b\xf4\xef\xe0\xa6\xff\x7f\x4c\
-\xf9\xff\xff\x94\x60\xf8\xff\x3d\xd4\xfc\xff\xaf\x97\x4f\xc0\xe2\
-\x77\x96\x2c\xf9\x3f\x93\x9d\xfd\x15\xd0\x72\x2b\x20\xd6\x98\xc0\
-\xc8\x78\x0b\xe6\xf3\xcf\x1f\x3f\xfc\xbf\x1b\xe1\xf9\xff\x02\x2b\
-\xc3\xff\xf3\xa2\x8c\xff\x1f\xce\x9b\xfa\xff\x07\x50\xfc\xe3\xf3\
-\xe7\xff\xe7\x5a\x5a\xfe\x6f\x64\x60\x28\x43\xb6\x13\x20\x80\x50\
-\x1c\xb0\x8c\x81\xe1\xe8\xc3\xe5\x2b\x20\x96\xef\x59\xfd\xff\x8f\
-\x99\xd0\xff\x9f\x1a\x0c\xff\xbf\x19\x30\xfc\xff\x24\xc7\xf0\xff\
-\x63\xa0\xf1\xff\x1f\x4f\xee\x83\xe5\x6f\x01\x1d\x31\x85\x8d\xed\
-\x69\x1f\x03\xc3\xbd\x73\xdd\xdd\x10\xcb\x81\x3e\xbf\x13\xe1\xfe\
-\xff\x22\x0f\xc3\xff\x0b\x32\x0c\xff\xcf\x88\x32\xfc\x3f\x21\xcc\
-\xf6\xff\xce\xd4\x5e\xb0\x23\xee\xec\xd9\xf3\xbf\x89\x9d\xfd\x0a\
-\xb2\x9d\x00\x01\x84\x92\x30\x18\x81\xa9\x9d\x5b\x59\x19\xcc\xfe\
-\xb7\x6e\x21\xc3\xdf\x47\xef\x18\xfe\x4a\x00\x13\x17\x30\x75\xfd\
-\xe3\x03\xa6\xfc\x93\x67\x19\x7e\x67\x86\x30\xfc\x9d\xb6\x86\x41\
-\x35\x3a\x9a\xe1\xcf\x8f\x1f\x52\x3f\x3e\x7e\x64\x30\x2c\x2a\x62\
-\xf8\xf2\xfe\x2d\xc3\xcb\xcc\x18\x86\xaf\xdb\x76\x31\xfc\x17\x00\
-\xea\x01\x26\xf7\x7f\x6c\x0c\x0c\xbf\x9e\xfd\x62\x78\xbf\x78\x31\
-\x83\x48\x62\x06\x03\xaf\x9c\x1c\x03\x0b\x37\xb7\x08\xb2\x9d\x00\
-\x01\x84\x12\x02\x8b\x18\x18\xd6\x5c\x6e\x69\x01\xfb\xe6\xcf\xc3\
-\xdb\xff\xbf\x85\x9a\xfc\xff\x24\xcf\xf0\xff\x83\x0e\xc3\xff\xb7\
-\xda\x0c\xff\x5f\x69\x32\xfc\x7f\x26\xc9\xf0\xff\xb9\xa7\xc1\xff\
-\x2f\x8f\xef\x81\x13\x19\x38\xa1\xbd\x7b\xfd\xff\x4e\x88\xd3\xff\
-\x0b\xbc\x40\x9f\x4b\x33\xfc\x3f\x2b\xc5\xf0\xff\x14\x10\x1f\xe1\
-\x02\x86\x80\xae\xd2\xff\x27\xc7\x0e\xfd\xff\x03\x54\x77\x66\xf6\
-\xec\xff\xd5\x4c\x4c\xfb\x91\xed\x04\x08\x20\x14\x07\x00\x53\xbf\
-\xc9\x62\x0e\x8e\x17\xa0\xd4\x0e\x4e\xc9\x2f\x9f\xfe\xff\x18\x64\
-\xfe\xff\x8d\x14\xc4\xf2\xe7\xea\x0c\xff\x9f\x00\xf1\x03\x60\xd0\
-\x3e\xf2\x30\xfa\xff\xe9\xe9\xa3\xff\x9f\x3e\x7f\xfa\x7f\x27\xcc\
-\x0d\x1e\xec\x60\xcb\x81\x8e\x3c\xc2\x09\xb4\x5c\x47\xf9\xff\x93\
-\x53\x27\xc0\x96\xdf\xde\xb9\xf3\x7f\xab\x90\xd0\xb7\x1a\x06\x06\
-\x2f\x64\x3b\x01\x02\x88\x11\xb9\x2e\x58\x0e\x2c\x88\x7e\x01\x53\
-\x37\x03\x17\xd7\x0a\xbb\xb9\x73\x45\x15\x23\x22\x18\x7e\x3e\xbd\
-\xcf\xf0\x25\x33\x98\xe1\xd7\x99\xf3\x0c\xff\x78\x81\x41\xfb\x1f\
-\x12\xbc\x7f\x3e\x00\x33\xb6\x8d\x25\x03\x03\x37\x0f\xc3\xe7\x2d\
-\xbb\x19\xfe\xc3\xe4\x40\x65\xc8\x47\x06\x06\x66\x79\x79\x06\x99\
-\x85\x2b\x18\x24\x4c\x2c\x18\x1e\xec\xdb\xc7\xb0\x2a\x32\xf2\xeb\
-\xe7\x57\xaf\xd2\x80\xb1\xb2\xac\x01\xc9\x4e\x80\x00\xc2\x70\x00\
-\xc8\x00\xa0\x23\xdc\x80\x8e\x58\x6a\x3f\x7b\xb6\x88\x72\x54\x14\
-\xc3\xf7\xa7\x0f\x19\x3e\xa6\x06\x31\xfc\x38\x73\x8e\xe1\x3f\x1f\
-\x34\x7e\x41\x16\x7d\x05\xd2\x40\x0d\xff\x39\x81\x0e\x02\x89\x01\
-\x8d\xfa\x09\x74\x18\xb3\x82\x02\x83\xec\xbc\xa5\x0c\x12\x16\x56\
-\x0c\x0f\x76\xed\x62\x58\x19\x19\xf9\xf3\xeb\xbb\x77\x69\xac\x0c\
-\xa0\x58\x66\x60\x40\x76\x00\x40\x00\x31\xe1\xa8\x20\x76\xfd\xfe\
-\xf6\x2d\x62\x4f\x62\xe2\xab\xdb\x4b\x96\x30\x70\x4a\xcb\x33\xf0\
-\xcc\x58\xc5\xc0\x6c\x64\x00\xf6\x39\xc8\xa7\x60\x0b\xd9\x81\x18\
-\x6a\x39\xc8\xe1\x3f\x3f\x01\x43\x45\x49\x9e\x41\x76\xe1\x72\x06\
-\x71\xa0\xe5\xf7\x77\xef\x66\x58\x11\x15\xf5\xe5\xcb\xbb\x77\x49\
-\x30\xcb\xd1\x01\x40\x00\xa1\x38\xe0\x3f\x6a\x25\xb1\xf7\xff\xaf\
-\x5f\x81\xbb\x52\x52\x1e\x5f\x9b\x3f\x9f\x81\x53\x4e\x99\x41\x60\
-\xc1\x56\x06\x16\x6b\x5b\x86\x3f\xdf\xa0\x96\xc2\x30\xc8\x41\xc0\
-\xf2\x96\x55\x53\x8b\x41\x6e\xc9\x5a\x06\x61\x53\x0b\x86\x3b\x5b\
-\xb6\x30\x2c\x0b\x09\xf9\xf0\xfd\xed\xdb\x38\x50\xb0\x63\xb3\x03\
-\x04\x00\x02\x08\x25\x1b\x7e\x46\x52\x00\xa5\xdf\xfc\xfe\xf9\xf3\
-\xd7\xcf\x0f\x1f\x18\xc0\xe5\x3f\x2f\x2f\xc3\x3f\x6e\x2e\x48\xb6\
-\xfc\x0f\xc1\x7f\x61\x34\x50\x8c\x99\x83\x83\x81\x49\x40\x10\xac\
-\x16\x94\x3d\x7f\x7c\xfb\xf6\x1b\xc8\x7e\xf9\x07\x52\xb7\x80\x43\
-\xe9\x1f\x9a\x03\x00\x02\x08\x67\x08\x80\x2a\x16\xa0\xa6\xed\xf6\
-\xdd\xdd\xca\x86\x85\x85\x0c\x5f\xdf\xbd\x62\x78\x95\x14\xcc\xf0\
-\x65\xeb\x4e\x70\x9c\xff\x83\xfa\x1e\x66\x39\x28\x3a\x3e\x9f\x3a\
-\xc7\x70\x27\x22\x90\xe1\xed\x8d\x6b\x0c\x3a\xc0\x72\x22\x74\xde\
-\x3c\xd1\xff\x6c\x6c\xeb\x7f\x21\x55\x60\xe8\x21\x00\x10\x40\x58\
-\xd3\x00\xd0\x5c\xc3\x7f\xcc\xcc\xab\x6d\xfb\xfa\x94\x0c\x4b\x4a\
-\x18\xbe\x7c\x7c\xcf\xf0\x2a\x3d\x9a\xe1\xcb\xb6\xdd\xc0\x50\x80\
-\x06\x3b\xa8\x4a\xfe\x01\x4c\xb0\x5f\xa1\x3e\x03\x79\x8d\x87\x81\
-\xe1\xe3\xc9\x4b\x0c\x37\x62\xa3\x18\x5e\x5c\xbd\xc2\xa0\x13\x1b\
-\xcb\x10\x3c\x77\xae\x18\x13\x27\xe7\x8a\xdf\xa0\x84\x8d\x05\x00\
-\x04\x10\x46\x08\x00\x0d\x33\xfc\xc3\xc8\xb8\x0e\xe8\x73\x25\x90\
-\xcf\xbf\xbc\x7b\xcd\xf0\x2a\x2d\x8c\xe1\xeb\xce\x3d\x0c\x0c\x02\
-\x10\xcb\x40\xc1\xfe\x0b\x94\x0d\x55\xd4\x19\xd8\x0d\x0c\xc0\x6c\
-\x58\xf6\x64\xe4\x67\x60\xf8\x74\xe6\x22\xc3\x35\xa0\x23\x9e\x01\
-\x1d\xa1\x1b\x13\xc3\x10\x3a\x77\xae\x08\xd0\x11\x4b\x7e\x83\xb2\
-\x38\x1a\x00\x08\x20\x74\x07\xa8\xfe\x65\x66\x5e\x61\xdb\xdb\xab\
-\xa0\x0f\xb2\xfc\xd3\x47\x86\x97\xd9\xf1\x40\x9f\xef\x61\xf8\xcf\
-\x8f\x48\x70\x60\xcb\x81\x59\x4d\x7a\xf6\x32\x06\xf9\x45\x6b\x19\
-\xd8\x8d\xf5\x19\x7e\xbe\x43\x72\x04\x30\x24\x3e\x9c\xbf\xcc\x70\
-\x25\x3e\x1e\xe8\x88\xab\x0c\x3a\x91\x91\x0c\xa1\x33\x67\x8a\x02\
-\xd3\xc8\x72\xa0\x12\x4b\x64\x3b\x01\x02\x08\xa5\x24\x04\xb6\x1a\
-\x16\x1c\x2a\x2c\x84\x54\xa9\xaf\x9e\xff\xbf\x13\x09\xad\x58\x40\
-\xc5\xab\x34\xb4\x84\xe3\x66\xf8\x7f\x5c\x53\x01\x58\xc2\x1d\xff\
-\xff\x1d\xa8\x0e\x54\xc9\x3c\xbd\x7e\xf5\xff\x3e\x23\xdd\xff\xeb\
-\x81\x7e\xd8\x00\x54\xbf\x16\xa8\x66\x15\xb0\x24\x5c\x0c\xe2\x1b\
-\xea\xff\xbf\x7d\xf6\x0c\x58\xdd\xae\x8e\x8e\xff\x99\x0c\x0c\xdb\
-\x90\xed\x04\x08\x20\x94\x10\x60\x62\x61\x71\x52\x0a\x09\x01\xa7\
-\xd8\xd7\x65\x19\x0c\x5f\x56\xef\x84\x54\x2c\xff\x11\x3e\x67\x96\
-\x07\x16\x32\xf3\x97\x32\x88\x03\xb3\xda\x83\x4d\x9b\x18\xae\x03\
-\xcb\x09\x51\x0d\x2d\x06\x95\xc5\xcb\x18\xb8\x8c\x80\x21\xf1\x05\
-\x91\x3d\x19\x81\xf9\xef\xd5\xf9\x8b\x0c\x17\x32\x32\x19\xde\xbf\
-\x7b\xc7\xa0\xe6\xeb\xcb\xc0\x29\x20\x60\x80\x6c\x27\x40\x00\xa1\
-\x38\xe0\xcf\xbf\x7f\x6f\x7e\xbc\x7e\xcd\xc0\x0c\x64\xb3\x59\x3a\
-\x30\xfc\x13\x64\x63\xf8\xf3\x13\x12\xef\x60\xcb\x95\x95\x18\x64\
-\x17\x2c\x63\x10\x37\x07\x96\x70\x7b\xf6\x30\xac\x8e\x8f\xff\xbc\
-\x2a\x21\xe1\xdd\x15\xa0\x23\x24\xb4\x74\x18\xd4\x17\x2d\x61\xe0\
-\x06\x39\xe2\x3b\xb4\x6c\xf8\x03\x31\x57\xd0\xca\x92\x81\x8d\x9b\
-\x9b\x01\x58\x26\x30\xfc\xfc\x09\x72\x22\x02\x00\x04\x10\x4a\x14\
-\xf4\x32\x30\x64\x2f\x31\x33\xfb\xff\x19\xd8\x78\x00\xb5\x64\x40\
-\x8d\x89\x13\xc2\x4c\xff\x0f\x33\x32\xfc\x3f\xa9\xab\x02\xaf\x58\
-\xee\x00\x2b\x96\x16\x01\x81\x6f\xd5\x0c\x0c\x81\x55\x0c\x0c\x36\
-\x95\x6c\x6c\xaf\xce\x2c\x5a\x04\xd6\x73\xff\xca\xe5\xff\x1b\x8c\
-\x8d\xfe\xcf\x02\x06\x3f\x08\xef\x2b\x29\xfe\xff\xea\xfb\xf7\xff\
-\x1f\x3e\x7e\xfc\x3f\xc9\xcb\xeb\x7f\x0a\x03\x43\x2b\xb2\x9d\x00\
-\x01\x84\x9e\x06\xd8\x80\x4d\xa6\xe9\xcb\x80\xcd\xa7\xcf\xc0\x66\
-\x14\xc8\xc0\x3b\x53\x7b\xfe\x9f\xb2\x34\x87\x57\xa9\x77\xf6\xee\
-\xfd\xdf\x26\x26\xf6\xa5\x12\xd8\x7a\x02\x36\xb1\x18\x6a\x81\xb8\
-\x14\x98\xba\xcb\x39\x38\x5e\x9d\x06\xd6\xa2\x60\x3d\x67\xce\xfe\
-\x5f\x6d\x6e\xfe\x7f\x77\x5e\xde\xff\x57\x3f\x7e\xfc\xff\xf0\xe9\
-\xf3\xff\x99\xa1\xa1\xff\x13\x18\x18\xd6\x67\x31\x30\xf0\x21\xdb\
-\x09\x10\x40\x28\x95\xd1\x24\x48\x65\xc4\x0a\xcc\xda\x33\x14\x9c\
-\x9c\x92\xfc\x97\x2e\x65\x60\x93\x90\x00\x96\x68\x5f\x19\x78\xb8\
-\xb8\x19\xee\x03\x2b\x96\x55\x68\x15\xcb\x3f\x68\x09\x07\xae\xc0\
-\x38\x39\x97\x02\x53\xbb\x88\x3e\x30\xff\xbf\x7f\xf3\x86\x81\x0d\
-\x58\x72\x32\xff\xfc\xc9\xb0\x32\x35\x95\xe1\xf8\xaa\x55\x9b\x80\
-\xe5\x57\x34\xb0\x40\xfa\x32\x15\xc9\x4e\x80\x00\xc2\xe6\x00\x10\
-\x66\x01\x3a\x62\x8a\xac\xa5\x65\xba\x7d\x73\x33\x03\xaf\xa4\x24\
-\xc3\xa3\x63\xc7\x18\x76\x95\x97\x7f\x06\x56\x2c\x19\xc8\x65\xfb\
-\x3f\xa4\x22\x16\x18\xf5\xce\xc0\x3e\xc4\x32\x8f\x96\x16\x31\x0d\
-\x4f\x4f\x86\xef\xc0\xe2\x78\x57\x5b\x1b\xc3\xb9\xed\xdb\xd7\x03\
-\x2d\x8f\x07\x95\xf6\xa0\x12\x11\xd9\x01\x00\x01\x84\xcb\x01\x20\
-\xcc\x06\x2c\xe8\x8a\x18\x59\x58\x22\x58\x05\x04\xc4\xbf\xbe\x79\
-\x73\x15\xa8\xb9\x17\x98\x40\xb7\xa3\x95\x9a\xc8\x7a\x40\x39\xc8\
-\x1c\x98\x6e\xab\xb9\x84\x84\x8c\x7f\x7e\xfd\xfa\x09\x98\xe8\x36\
-\x00\x43\xab\x0d\x5a\xd5\x30\xa0\x3b\x00\x20\x80\x18\x07\xba\x73\
-\x0a\x10\x40\x03\xde\x37\x04\x08\xa0\x01\x77\x00\x40\x80\x01\x00\
-\xa8\xdb\x4a\x1b\x31\xff\xfc\x96\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x08\x17\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xa8\x00\x00\x00\xa8\x08\x06\x00\x00\x00\x74\x4b\xa5\xb4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x15\x88\x00\x00\x15\x88\
-\x01\xc4\xd7\x40\xa0\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x07\x94\x49\x44\
-\x41\x54\x78\x9c\xed\xdc\x5d\xa8\x65\x65\x1d\xc7\xf1\xef\x7f\xc6\
-\xf1\xa5\x98\xc9\x3c\x4e\xa3\x52\x96\x16\x98\x2f\x0c\x6a\x31\x34\
-\x63\x52\x9a\x4d\xbe\x6b\xe3\xa0\x45\x28\x04\x22\x74\x91\x85\x18\
-\x61\x45\xa5\x52\x43\xa0\x17\xa5\x17\x51\x37\x95\x51\x59\x08\x82\
-\xd2\x8b\x10\xdd\x58\x58\x88\xf6\x62\x8e\xe9\x50\xa3\x94\x15\xcd\
-\x98\x99\xd3\x4c\xa3\xf9\xeb\x62\xed\x68\x38\xce\x39\x7b\xed\x73\
-\x9e\x67\x3d\xff\xb3\xe7\xf7\x81\xcd\x61\x38\x67\x3f\xeb\x3f\x9b\
-\xef\x59\x6b\xaf\x7d\xd6\xde\x21\x09\xb3\xac\x96\xb5\x1e\xc0\x6c\
-\x3e\x0e\xd4\x52\x73\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\xe6\x40\
-\x2d\x35\x07\x6a\xa9\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\x52\x73\
-\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\x6a\xa9\
-\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\x03\xb5\
-\xd4\x1c\xa8\xa5\x76\x50\xeb\x01\x22\xe2\x78\x60\x55\xeb\x39\x6c\
-\x4e\x8f\x4b\xfa\x57\xab\x8d\x47\xcb\xb7\x1d\x47\xc4\x32\xe0\x8f\
-\xc0\xd1\xcd\x86\xb0\x71\x3e\x24\xe9\xcb\xad\x36\xde\xfa\x10\xbf\
-\x01\xc7\x99\xdd\xa6\x96\x1b\x6f\x1d\xe8\x65\x8d\xb7\x6f\xe3\x9d\
-\x15\x11\xaf\x6e\xb5\x71\x07\x6a\xe3\x1c\x04\x5c\xd4\x6a\xe3\xcd\
-\x02\x8d\x88\x75\xc0\xeb\x5a\x6d\xdf\x26\xd2\xec\x30\xdf\x72\x0f\
-\xea\xbd\xe7\xd2\xb1\x31\x22\x5e\xd9\x62\xc3\xcd\xce\xe2\x23\x62\
-\x1b\xf0\xc6\x26\x1b\x87\x3d\xc0\xdf\x81\x67\x67\xdd\x76\x03\x6b\
-\x80\x63\xe8\x4e\xde\xd6\x00\x51\x79\x96\x97\xe8\x5e\xc9\xf8\xcb\
-\xe8\xb6\x03\x58\x09\xcc\x00\x47\x8e\xbe\xce\x00\x87\x56\x9e\x63\
-\x9c\xcd\x92\xee\x1a\x7a\xa3\x4d\x5e\x07\x8d\x88\x53\x19\x2e\xce\
-\xbd\xc0\xaf\x81\x5f\xec\x73\x7b\x4c\x3d\x7e\x33\x23\xe2\xcd\xc0\
-\x27\x81\xf7\x03\xcb\x2b\xcc\xf6\x23\xe0\x63\x92\x7e\xd3\x63\x96\
-\x19\xe0\x6d\xc0\x19\x74\xaf\x7e\xac\x03\x0e\xab\x30\xd3\x5c\x36\
-\x01\x83\x07\x8a\xa4\xc1\x6f\xc0\xcd\x80\x2a\xde\x76\x01\x77\x00\
-\xe7\x00\x87\x14\x98\xf7\x9d\x74\x7b\xba\x92\x33\x6e\x59\xe4\x4c\
-\x2b\xe8\x22\xfd\x02\xf0\xd7\xca\x8f\xa7\x80\x7f\x00\x07\x0f\xde\
-\x4a\xa3\x40\xb7\x56\x7a\x10\xef\x07\xae\x06\x56\x55\x98\xf9\xeb\
-\x05\xe7\xfc\x27\x30\x53\x70\xb6\x15\xc0\x66\xe0\xbe\x0a\xbf\x48\
-\xfb\xde\xce\x9b\xfa\x40\x81\x93\x2a\x3c\x70\xdf\x07\x4e\xae\x3c\
-\xf7\x71\x05\xe7\xbd\xbd\xf2\x9c\x5f\x02\x5e\xa8\xf0\x38\x7f\x75\
-\xe8\x5e\x5a\x9c\xc5\x97\x3c\x7b\xdf\x4a\xf7\x5b\x7d\xbe\xa4\xdf\
-\x16\x5c\x77\x7f\x9e\xa4\x7b\x3e\x5b\xc2\xef\x0a\xad\xf3\x32\x92\
-\xfe\x20\xe9\x5a\x60\x2d\xdd\x73\xdc\x92\x2e\x19\xfd\x79\x7a\x30\
-\x2d\x02\xdd\x5c\x60\x8d\x67\x80\x6b\x81\xb5\x92\x7e\x58\x60\xbd\
-\xb1\x24\xfd\xef\x6c\xbb\x84\xbf\x15\x5a\x67\x4e\x92\xb6\x4a\x3a\
-\x17\xb8\x18\x78\xa2\xd0\xb2\xab\x81\xb7\x17\x5a\xab\x97\x41\x03\
-\x8d\x88\x37\xd1\xfd\x66\x2f\xc6\x4f\x81\x53\x24\xdd\x26\xe9\xc5\
-\x02\x63\x4d\xe2\xa9\x42\xeb\xec\x28\xb4\xce\x58\x92\xee\x01\x4e\
-\x01\x3e\x43\xf7\xfc\x74\xb1\x06\x7d\xd1\x7e\xe8\x3d\xe8\x62\xf7\
-\x9e\xb7\x03\x67\x49\xfa\x73\x89\x61\x16\x60\x4f\xa1\x75\x9e\x29\
-\xb4\x4e\x2f\x92\xf6\x4a\xba\x09\x38\x0f\xd8\xb9\xc8\xe5\xde\x5b\
-\x60\xa4\xde\x86\x0e\x74\xa1\xcf\x3f\x77\x03\x57\x49\xfa\xb0\xa4\
-\x17\x4a\x0e\xd4\x48\x89\x3d\xd9\xc4\x24\xdd\x07\xbc\x05\x78\x68\
-\x11\xcb\x1c\x1b\x11\x6f\x2d\x34\xd2\x58\x83\x05\x1a\x11\xaf\x07\
-\x16\xf2\x1f\x7b\x0a\xd8\x20\xe9\x8e\xc2\x23\x1d\x90\x24\x3d\x49\
-\xf7\x62\xff\xd7\x16\xb1\xcc\x60\x87\xf9\x21\xf7\xa0\x0b\xd9\x7b\
-\xfe\x89\xee\x90\xfe\xcb\xd2\xc3\x1c\xc8\x24\xed\x91\xf4\x41\xe0\
-\x13\x0b\x5c\xc2\x81\xd2\xfd\x75\xe4\x5d\x92\x7e\x5f\x63\x18\x03\
-\x49\x5b\x58\x58\xa4\x27\x44\xc4\x49\xa5\xe7\xd9\x9f\x41\x02\x8d\
-\x88\x63\x80\xf5\x13\xdc\x65\x27\x70\x8e\xa4\x6a\xaf\x17\x5a\x67\
-\x14\xe9\xa7\x16\x70\xd7\x41\x4e\x96\x86\xda\x83\x6e\xa2\xff\x55\
-\x41\xcf\x02\xef\x96\xf4\x48\xc5\x79\x6c\x1f\x92\x3e\x07\x7c\x7a\
-\xc2\xbb\x0d\x72\x98\x1f\x2a\xd0\xbe\x87\xf7\xbd\xc0\x05\x92\x1e\
-\xae\x39\x8c\xbd\x9c\xa4\x9b\x81\x1b\x27\xb8\xcb\xe9\x11\xf1\x86\
-\x3a\xd3\xfc\x5f\xf5\x40\x23\xe2\x35\xc0\x99\x3d\x7f\xfc\x7a\x49\
-\x3f\xab\x39\x8f\xcd\x4d\xd2\x67\x81\x6f\x4f\x70\x97\xea\x87\xf9\
-\x21\xf6\xa0\x97\xd2\xef\x5a\xca\x3b\x25\xdd\x56\x7b\x18\x1b\xeb\
-\x6a\x60\xec\xf5\xa9\x23\xd5\x0f\xf3\x43\x04\xda\xe7\xf0\xfe\x18\
-\xdd\x03\x63\x8d\xa9\xfb\x90\x86\x4d\x74\xe7\x02\xe3\x6c\x88\x88\
-\x35\x35\xe7\xa9\x1a\x68\x44\x1c\x01\x9c\x3d\xe6\xc7\x76\x01\x97\
-\x49\x7a\xbe\xe6\x2c\xd6\x9f\xa4\x6d\xc0\x95\x74\x97\xd8\xcd\x67\
-\x19\x70\x49\xcd\x59\x6a\xef\x41\x2f\x66\xfc\xdb\x4a\xae\x91\xf4\
-\x68\xe5\x39\x6c\x42\x92\xee\xa5\x7b\xe7\xc3\x38\x55\x0f\xf3\xb5\
-\x03\x1d\x77\x71\xc8\x5d\x92\xbe\x55\x79\x06\x5b\xb8\x1b\xe9\xde\
-\xa5\x30\x9f\xb3\x23\xe2\xf0\x5a\x03\x54\x0b\x34\x22\x56\xd1\xbd\
-\x27\x68\x2e\xcf\xd1\x5d\xd3\x69\x49\x8d\xae\x81\xbd\x86\xf9\x2f\
-\xd4\x5e\x01\x5c\x58\x6b\x86\x9a\x7b\xd0\x0b\x81\x43\xe6\xf9\xfe\
-\x0d\x92\x9e\xae\xb8\x7d\x2b\x40\xd2\x56\xe0\xf3\x63\x7e\xac\xda\
-\x61\xbe\x66\xa0\xf3\x1d\xde\x1f\x00\x9a\x7d\x62\x9a\x4d\x6c\x0b\
-\xdd\xdb\x6b\xe6\xf2\x9e\x88\x78\x45\x8d\x0d\xd7\x0c\xf4\x1b\xc0\
-\xbd\xc0\xec\xab\xde\x5f\xa4\x3b\x31\x6a\x72\x4d\xa4\x4d\x4e\xd2\
-\x5e\xba\x43\xfd\xfe\xce\xea\x1f\xa0\xbb\xe0\xa4\xca\x07\x5c\x54\
-\x0b\x54\xd2\xdd\x92\x2e\xa2\xfb\x94\x8e\x8f\x00\x0f\x8e\xbe\x75\
-\xab\x7a\x7c\x50\x81\xe5\x22\xe9\x7e\xe0\x2b\xa3\x7f\x3e\x0c\x7c\
-\x1c\x38\x4e\xd2\x7a\x49\x5f\x94\xb4\xab\xc6\x76\x07\xfd\xe8\x9b\
-\x88\x38\x11\xd8\x2e\x69\xf7\x60\x1b\x2d\x28\x22\x7e\x00\x9c\x5b\
-\x60\xa9\xd3\x96\xe2\x35\xae\xa3\x13\xdf\xa3\x24\x3d\x3e\xd4\x36\
-\x07\xfd\xe8\x9b\xd1\x13\x6e\x5b\xa2\x24\x3d\x47\xf7\xea\xcb\x60\
-\x5a\x7f\x3e\xa8\xd9\xbc\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\x6a\xa9\
-\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\x03\xb5\
-\xd4\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\x6a\xa9\x39\x50\x4b\xcd\x81\
-\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\xe6\
-\x40\x2d\x35\x07\x6a\xa9\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\x52\
-\x73\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\x6a\
-\xa9\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\x03\
-\xb5\xd4\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\x6a\xa9\x39\x50\x4b\xcd\
-\x81\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\
-\xe6\x40\x2d\x35\x07\x6a\xa9\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\
-\x52\x73\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\
-\x6a\xa9\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\
-\x03\xb5\xd4\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\x6a\xa9\x39\xd0\xc9\
-\x94\x7a\xbc\xfc\xb8\xf7\xe4\x07\x6a\x32\x2b\x93\xad\x33\xf5\x1c\
-\xe8\x64\x0e\x4f\xb6\xce\xd4\x73\xa0\x93\x71\xa0\x03\x73\xa0\x93\
-\x71\xa0\x03\x73\xa0\x3d\x45\xc4\xc1\xc0\x61\x85\x96\x7b\x55\xa1\
-\x75\xa6\x9e\x03\xed\xaf\x64\x54\xde\x83\xf6\xe4\x40\xfb\x2b\x19\
-\x95\x03\xed\xc9\x81\xf6\xe7\x40\x1b\x70\xa0\xfd\xcd\x24\x5d\x6b\
-\xaa\x39\xd0\xfe\x4e\x2f\xb8\xd6\x69\x11\xb1\xbc\xe0\x7a\x53\xcb\
-\x81\xf6\xb7\xa1\xe0\x5a\x2b\x81\xb5\x05\xd7\x9b\x5a\x0e\xb4\x87\
-\x88\x08\x60\x7d\xe1\x65\xcf\x2c\xbc\xde\x54\x72\xa0\xfd\x6c\x04\
-\x8e\x28\xbc\xe6\xfb\x0a\xaf\x37\x95\x1c\x68\x3f\xd7\x55\x58\x73\
-\x7d\x44\xac\xab\xb0\xee\x54\x71\xa0\x63\x8c\x22\xda\x58\x69\xf9\
-\x1b\x2a\xad\x3b\x35\x1c\xe8\x3c\x22\x62\x35\xf0\xbd\x8a\x9b\xb8\
-\x34\x22\x3e\x5a\x71\xfd\x25\xcf\x81\xce\x21\x22\xd6\x00\x77\x03\
-\xc7\x56\xde\xd4\x2d\x11\xf1\x81\xca\xdb\x58\xb2\x1c\xe8\x2c\xd1\
-\xb9\x1c\x78\x84\xb2\x2f\x2d\xcd\x65\x39\xf0\xcd\x88\xf8\x6e\x44\
-\x1c\x35\xc0\xf6\x96\x94\x90\xd4\x7a\x86\xe6\x46\x61\x9c\x08\x5c\
-\x00\x5c\x01\xbc\xb6\xd1\x28\xff\x01\x7e\x0c\xdc\x09\xfc\x1c\xd8\
-\x26\xe9\xdf\x8d\x66\x49\x61\xea\x03\x8d\x88\xa3\x81\x77\xd0\xfd\
-\x79\xf1\xc8\x59\x5f\x57\x03\xc7\x93\xf7\xf2\xb7\x97\x80\xed\xc0\
-\xd3\xc0\x0e\x60\xe7\xac\xaf\xdb\x25\xfd\xa4\xd9\x74\x03\x38\x10\
-\x02\xbd\x02\xf8\x4e\xeb\x39\x2a\xf9\x95\xa4\x53\x5b\x0f\x51\x93\
-\x9f\x83\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\x03\xb5\xd4\x0e\x84\
-\x93\xa4\xd5\xc0\xc9\xad\xe7\xa8\xe4\x79\x49\x0f\xb6\x1e\xa2\xa6\
-\xa9\x0f\xd4\x96\x36\x1f\xe2\x2d\x35\x07\x6a\xa9\x39\x50\x4b\xcd\
-\x81\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\
-\xe6\x40\x2d\x35\x07\x6a\xa9\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\
-\x52\x73\xa0\x96\x9a\x03\xb5\xd4\x1c\xa8\xa5\xe6\x40\x2d\x35\x07\
-\x6a\xa9\x39\x50\x4b\xcd\x81\x5a\x6a\x0e\xd4\x52\x73\xa0\x96\xda\
-\x7f\x01\xf5\x70\xad\x3a\xf1\xc7\x57\x9c\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x3d\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\xba\x49\x44\
-\x41\x54\x58\x85\xed\xd6\x31\x0a\x02\x41\x0c\x05\xd0\xff\x67\xa6\
-\x58\x11\x05\x4b\x4b\x4f\xa3\xb5\x85\x62\x9f\x63\xcd\x05\xb4\xd8\
-\x5a\x3d\x84\x57\xf0\x02\x82\xb0\x32\xa0\x88\x3b\x1e\x40\x17\x76\
-\x25\xb0\x85\x49\x9b\x22\x2f\x09\x81\x50\x44\xd0\x67\xb8\x5e\xab\
-\x1b\xc0\x00\x06\x30\x80\x01\x00\x84\xa6\xc4\xbc\xdc\x6d\x0b\x97\
-\x87\x1a\x45\xee\x35\xd3\x61\xb9\x5a\xb7\x06\xc4\x18\xb9\x99\x8e\
-\x16\xb3\x09\xc7\x1a\x80\xf3\x35\x57\x31\x46\x8a\x48\x6e\x05\x00\
-\x00\x06\x07\x16\x3a\x1b\x62\xa8\x1b\x73\x8d\x00\x04\x82\x03\xaf\
-\x02\x40\xf8\x68\xbc\x05\xc0\x13\xd0\x02\xf8\xd7\x0f\x00\xd5\x09\
-\xb0\x3b\xc0\x79\x82\x85\x0e\xc0\xf9\x8e\x00\x11\xc9\x97\x63\xb9\
-\xbf\x9d\x92\xca\x19\x3e\x9e\x48\xdf\x2e\x00\x00\x68\x3f\xa1\x01\
-\x0c\x60\x00\x03\xfc\x3d\xe0\x0d\x62\x08\x25\xb8\x8c\xc0\x27\xd8\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x12\xf3\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x03\xd0\x00\x00\x02\xb3\x08\x06\x00\x00\x00\xf6\xb9\xe5\xa8\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\x00\x2e\x23\
-\x01\x78\xa5\x3f\x76\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\
-\x65\x52\x65\x61\x64\x79\x71\xc9\x65\x3c\x00\x00\x12\x80\x49\x44\
-\x41\x54\x78\xda\xec\xda\x5f\x68\x9d\xe5\x1d\xc0\xf1\xe7\x34\xe7\
-\x5f\xad\x5b\x73\x62\xa9\x54\x5b\xc9\x08\x14\xc5\xb6\x68\xb2\x48\
-\x6f\xc6\x32\xc7\x60\xbb\xf4\xaa\xe9\x81\x46\x48\xa1\xd4\x3f\x30\
-\x1c\x65\x82\x57\x2d\x54\x61\x17\xb5\xca\xaa\x48\x20\x71\x84\x99\
-\x16\x77\xe1\xa0\x1b\xae\x17\xc3\xe6\x6e\x38\x76\x5a\xd2\x5e\x59\
-\xea\x9c\xad\x96\x7a\x31\x54\x3c\x39\x6f\x4e\x4c\xde\x25\xcc\x0b\
-\x31\x1d\xf4\xbc\xbc\x8e\x27\xc7\xcf\x07\x4e\x73\xf5\x83\x97\xdf\
-\xfb\xf0\xf6\x7c\x39\x6f\xa1\x54\xa9\xa6\x01\x00\x00\x00\xfe\x6b\
-\xb6\x9d\xb4\x46\xac\x61\xad\x0d\x56\x00\x00\x00\x00\x02\x1a\x00\
-\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
-\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
-\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
-\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x40\x37\x28\x66\x1d\x6c\
-\x27\x2d\xdb\x23\x1a\xb5\xbe\x5a\x68\xce\x27\x1d\xcf\x4d\x4f\x4d\
-\x86\xd1\x7a\xdd\x02\x89\xc2\xb3\x47\x8e\x84\x93\xa7\x5e\xe9\x78\
-\x6e\x70\xcf\xae\xf0\xb7\x77\xff\x6e\x81\x44\xa3\x5c\xdd\xe8\xbb\
-\x05\xeb\xde\xde\x47\x86\x43\x63\xee\x72\xc7\x73\xe3\x63\x07\xc2\
-\x6b\x13\x13\x16\x48\x14\xce\xcc\xcc\x84\xb1\xf1\x83\x16\x91\x23\
-\xbf\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\
-\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
-\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
-\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\x02\x1a\
-\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
-\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
-\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
-\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
-\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\x00\x00\
-\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
-\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x20\
-\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
-\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
-\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
-\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
-\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\
-\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
-\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
-\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
-\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\
-\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
-\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
-\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
-\x00\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
-\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
-\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\
-\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
-\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\
-\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
-\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\
-\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
-\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
-\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\
-\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
-\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x70\x5b\x8a\x56\x00\x90\xaf\xe5\x9b\xef\
-\x85\xa5\x77\xcf\x76\x3c\x37\xb4\x74\x3d\xec\xdf\xbd\xbd\xe3\xb9\
-\xfb\xee\x2e\x86\xc5\xb3\x27\x3a\x9e\x2b\xf4\x6e\x0d\x85\xcd\x5b\
-\xdd\x30\x72\x37\xbc\x63\x4b\xa6\xb9\xa5\xb9\x73\x96\x47\x34\x76\
-\x6e\x2e\x85\x9e\x0c\x67\xb9\xbf\xd8\x74\x96\x89\x46\xdf\x67\xef\
-\x67\x7a\x26\xdf\x51\xee\xe9\xfd\x7c\x74\x60\xc4\x06\x6f\xf1\xfd\
-\xa9\x54\xa9\xa6\x59\x06\xdb\x49\xcb\xf6\x88\x46\xad\xaf\x16\x9a\
-\xf3\x49\xc7\x73\xd3\x53\x93\x61\xb4\x5e\xb7\x40\x72\xb5\x1a\xb3\
-\xad\x37\x5e\xb5\x08\x00\x80\x2e\xe3\x15\x6e\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
-\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
-\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
-\x00\x00\x01\x0d\x00\x00\x00\xf1\x2b\x66\x1d\x7c\xf6\xc8\x11\xdb\
-\x23\x1a\x0b\xc9\x42\xa6\xb9\x3f\xbc\xf9\x66\xb8\xd0\x68\x58\x20\
-\xb9\x1a\x5a\xba\x1e\x7e\x6e\x0d\x00\x00\x5d\xa7\x50\xaa\x54\x53\
-\x6b\x00\xc8\xcf\xfe\xdd\xdb\xc3\x6f\x07\x96\x2d\x02\x00\xa0\xcb\
-\x78\x85\x1b\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
-\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
-\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\
-\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x40\xfc\
-\x8a\x59\x07\x07\xf7\xec\xb2\x3d\xa2\x71\xf1\xd2\xe5\xb0\x9c\x76\
-\x3e\xb7\x73\xe0\x07\xe1\xce\x4d\x9b\x2c\x90\x5c\xdd\x77\xf7\xea\
-\xa3\xf5\x13\x8b\x00\x00\xe8\x32\x85\x52\xa5\x9a\x66\x19\x6c\x27\
-\x2d\xdb\x23\x1a\xb5\xbe\x5a\x68\xce\x27\x1d\xcf\x4d\x4f\x4d\x86\
-\xd1\x7a\xdd\x02\xc9\xd5\xe2\xd9\x13\xa1\xf5\xc6\xab\x16\x01\x00\
-\xd0\x65\xbc\xc2\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
-\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
-\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\
-\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\
-\x20\x7e\x45\x2b\x00\xc8\x57\xa1\x77\xeb\xba\xb8\xce\x9e\x07\x1e\
-\x0c\xa5\xfb\x07\xdd\x30\x72\xf7\xab\x97\x67\x32\xcd\xbd\xf8\xcb\
-\xba\xe5\x11\x8d\x17\x4f\xff\x25\x5c\xff\xe4\xdf\x1d\xcf\xfd\xe8\
-\xa1\xfb\xc3\x63\x3f\xf6\x6c\x25\x0e\x97\xae\x7e\x14\x5e\xff\xd3\
-\x6c\xc7\x73\xbd\xa5\x0d\xff\xfa\xf5\xb6\xc5\xdf\xd9\xa0\x80\x06\
-\xf8\xf6\x03\x7a\xf3\xfa\x08\xe8\xd5\x78\x2e\xef\x3b\xea\x86\x91\
-\xbb\x89\xc7\x7f\x93\x69\xee\x94\xf3\x48\x44\xfe\x78\xe2\xcf\xa1\
-\x31\x77\xad\xe3\xb9\x2f\x77\x8d\x84\x7d\xce\x32\x91\xb8\x32\x33\
-\x13\x26\x1a\xbf\xcf\x32\xfa\xc1\xf1\xa4\xe5\x20\xdf\x82\x57\xb8\
-\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
-\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
-\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
-\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\
-\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
-\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
-\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
-\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
-\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
-\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\
-\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
-\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
-\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
-\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
-\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\
-\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
-\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\
-\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
-\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
-\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
-\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
-\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
-\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\
-\x04\x34\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
-\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\
-\x34\x00\x00\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\
-\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\
-\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\
-\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
-\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
-\x00\x40\x40\x03\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
-\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\
-\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\
-\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\
-\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\
-\x68\x00\x00\x00\xb8\x2d\x85\x52\xa5\x9a\x66\x19\xdc\x74\x47\xd5\
-\xf6\x88\x46\x73\x3e\xc9\x34\x57\x2a\xf6\x84\x72\xb9\x64\x81\xe4\
-\x6a\xf0\xde\xbb\xc2\x5b\x0f\xa6\xd1\x5f\xe7\xb1\x1b\xd5\x30\x75\
-\xe9\x63\x37\x8c\x68\x9e\xc9\xbe\x5b\x10\x93\xf9\x56\x12\xd2\x0c\
-\x8f\xf2\x0d\x1b\x0a\x61\x63\xb5\x62\x81\x44\x61\xe9\xcb\xa5\x90\
-\xb4\x17\xb3\x8c\x7e\xd4\x4e\x5a\xdb\x6d\x70\xad\xe2\xff\xfb\x3f\
-\x47\x88\xc9\xe2\xca\x43\x65\xf5\x03\x79\x4a\x92\x85\x95\x7f\xcb\
-\xd1\x5f\xe7\xc2\xe2\xa2\x67\x39\x5d\x11\xde\x10\x93\xe5\xe5\xd4\
-\x59\xa6\x1b\x6c\xb2\x82\x5b\xf3\x0a\x37\x00\x00\x00\x08\x68\x00\
-\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
-\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
-\x80\x80\x06\x00\x00\x80\xf8\x15\x4a\x95\x6a\x9a\x65\x70\x7a\x6a\
-\xd2\xf6\x88\xc6\xa1\xc3\x87\x43\xd2\x5e\xec\x78\xee\x99\xa7\x9f\
-\x0a\x0f\x0f\x0e\x5a\x20\xb9\xea\xfb\xec\xfd\xb0\x77\xf6\xf5\xe8\
-\xaf\xf3\xca\x9e\x47\xc3\x95\xfe\x9f\xb8\x61\xe4\x6e\x6c\xfc\x60\
-\xa6\x39\xdf\x2d\x88\xc9\xf1\xe7\x8f\x87\xf7\xae\xfe\xb3\xe3\xb9\
-\x5f\xfc\xec\xa7\x61\xff\xfe\xba\x05\x12\x85\x0b\x8d\x46\x38\x79\
-\xea\x95\x2c\xa3\xff\x68\x27\xad\x1f\xda\xe0\x5a\xc5\xac\x83\xa3\
-\x75\x0f\x06\xe2\xf1\xc4\x4a\x08\x87\x0c\x01\xbd\x1a\xcf\xce\x32\
-\x79\x5b\x9a\x3b\x17\x9a\xeb\x20\xa0\x77\x0f\xdc\x1b\x86\xf6\x39\
-\xff\xc4\x13\xd0\x9e\xc7\xc4\xe4\xa5\x97\x4e\x66\x9a\xdb\xb6\xed\
-\x1e\x67\x99\x6e\xf0\x85\x15\xdc\x9a\x57\xb8\x01\x00\x00\x40\x40\
-\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
-\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
-\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
-\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
-\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
-\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
-\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
-\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\
-\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
-\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\
-\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
-\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\
-\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
-\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
-\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\
-\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
-\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\
-\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
-\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
-\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
-\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
-\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
-\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
-\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
-\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
-\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
-\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
-\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
-\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
-\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
-\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
-\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
-\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
-\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
-\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
-\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\
-\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
-\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\
-\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
-\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
-\x00\x00\x08\x68\x00\x00\x00\xe0\x6b\x0a\xa5\x4a\x35\xb5\x06\x80\
-\xfc\x0c\xef\xd8\x12\xde\x1e\x2a\x47\x7f\x9d\xcf\x7d\xd8\x13\x26\
-\x1a\xd7\xdc\x30\x00\xe0\x9b\x3e\x6d\x27\xad\x9a\x35\xac\xe5\x17\
-\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\
-\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
-\x00\x00\x00\x04\x34\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
-\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
-\x00\x00\xba\x42\xa1\x54\xa9\xa6\x59\x06\xdb\x49\xcb\xf6\x88\x46\
-\xad\xaf\x16\x9a\xf3\x49\xc7\x73\xd3\x53\x93\x61\xb4\x5e\xb7\x40\
-\x72\xb5\x34\x77\x2e\x34\x5f\x78\x32\xfa\xeb\xac\x3e\x76\x20\x94\
-\xf7\x1d\x75\xc3\xc8\x5d\xb9\xba\x31\xd3\x9c\xef\x16\xc4\x64\xef\
-\x23\xc3\xa1\x31\x77\xb9\xe3\xb9\xf1\xb1\x03\xe1\xb5\x89\x09\x0b\
-\x24\x0a\x67\x66\x66\xc2\xd8\xf8\xc1\x2c\xa3\xb3\x2b\xcf\xe4\x11\
-\x1b\x5c\xcb\x2f\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
-\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
-\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\
-\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
-\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
-\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\
-\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\
-\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\x02\x1a\x00\x00\x00\x04\
-\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\
-\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\
-\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\
-\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
-\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
-\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\
-\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x20\xa0\x01\x00\x00\
-\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\
-\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x40\
-\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
-\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
-\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
-\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\x02\x1a\x00\
-\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
-\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
-\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
-\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
-\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\x00\x00\x20\
-\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
-\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x20\xa0\
-\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
-\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
-\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
-\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\
-\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
-\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\
-\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
-\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
-\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
-\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\
-\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
-\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
-\x00\xf0\x35\xc5\xac\x83\x87\x0f\x1d\xb2\x3d\xa2\xb1\xb0\xd0\xce\
-\x34\x77\xfa\xf4\x4c\x38\x7f\xfe\xbc\x05\x92\xab\xfe\x62\x33\x3c\
-\xb9\x0e\xae\xf3\xad\xd9\x46\x78\xe7\xaf\x9e\xe5\xc4\xc3\x77\x0b\
-\x62\x72\xe3\xe6\xcd\x4c\x73\x17\x2f\x5e\x70\x96\x89\xe7\x1c\xdf\
-\xf8\xd8\x12\x72\x56\x28\x55\xaa\xa9\x35\x00\xe4\x67\x78\xc7\x96\
-\xf0\xf6\x50\x39\xfa\xeb\x7c\xee\xc3\x9e\x30\xd1\xb8\xe6\x86\x01\
-\x00\xdf\x34\xdb\x4e\x5a\x23\xd6\xb0\x96\x57\xb8\x01\x00\x00\x40\
-\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
-\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
-\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
-\x00\x00\x00\x04\x34\x00\x00\x00\xc4\xaf\xb8\xf2\x39\x66\x0d\x74\
-\x81\x87\x56\x3e\xbd\x19\xe6\x2e\xae\x7c\x3e\xb5\x3e\xf2\xb4\xfd\
-\x7b\x95\xfe\x10\xd2\xc7\x63\xbf\xce\x9d\x77\xf6\xcc\xae\xfc\x39\
-\xef\x8e\xf1\x2d\x18\xc9\x38\xe7\x3c\x12\x93\xfe\xaf\x3e\x9d\xfa\
-\xe0\xab\x0f\xac\x67\xce\xf0\xff\x50\x48\xd3\xd4\x16\x00\x72\xf4\
-\xf9\xe8\xc0\x6a\x3c\xbc\xb3\x0e\x2e\xf5\xd8\xf7\xcf\x5c\x3d\xea\
-\x8e\x01\x00\xdc\x1e\xaf\x70\x03\x00\x00\x80\x80\x06\x00\x00\x00\
-\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
-\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\
-\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
-\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
-\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
-\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
-\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\
-\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
-\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\
-\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
-\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\
-\x34\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
-\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\
-\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\
-\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
-\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
-\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
-\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\
-\x40\x40\x03\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
-\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\
-\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\
-\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\
-\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
-\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
-\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
-\x00\x00\x04\x34\x00\x00\x00\x7c\xc7\xfd\x47\x80\x01\x00\xf7\x97\
-\x58\xc2\x71\xe4\x3e\xe5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x04\x4e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
-\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\xcb\x49\x44\
-\x41\x54\x58\x85\xc5\x97\xcb\x6e\xdb\x46\x14\x86\xff\xb9\x91\x43\
-\x51\x8c\x15\x59\xa8\x9d\xd6\x41\x11\xa0\x28\x60\xa0\xed\xba\x40\
-\x37\x7a\x8a\xbe\x86\x91\x27\xf0\x23\x04\x7e\x22\xed\xb2\x11\xba\
-\x33\x60\x74\x99\x22\x29\x7a\x01\x2a\xea\x46\x91\x73\xed\x42\x9e\
-\x69\x6c\x51\x8e\xa4\x0a\xed\x01\x04\x11\x1c\xce\x99\x6f\xfe\x73\
-\xe6\x1c\x92\x78\xef\xd1\x66\x84\x10\xda\x3a\x70\xa0\x79\xef\x5d\
-\xeb\x3a\x6d\x00\x37\x37\x37\x17\x97\x97\x97\xaf\xbd\xf7\x47\x81\
-\x20\x84\xb8\xbb\xbb\xbb\x37\x57\x57\x57\xef\xdb\xc8\x1e\xfc\x86\
-\xc3\x21\x1f\x8f\xc7\x6f\x95\x52\xfe\x98\xbf\xf1\x78\xfc\x76\x38\
-\x1c\xf2\xc7\xeb\x6d\xec\x70\x3e\x9f\x13\xc6\x98\x3c\xc6\xce\x3f\
-\x36\xc6\x98\x9c\xcf\xe7\xe4\xf1\xfd\xa3\xc6\xf9\x10\xfb\xdf\x01\
-\xf8\x2e\x0f\xfd\x3a\x59\xa2\x31\xad\x49\xdc\x6a\x94\x00\x5f\x0e\
-\x8a\xe3\x01\xfc\xfc\xcb\xef\xd0\x9e\xa0\x69\x1a\x78\xef\xe1\x9c\
-\x03\xa5\x14\x59\x96\x61\xb9\x5c\x82\x52\x0a\xce\x79\x1c\xcb\x3b\
-\xd9\x71\x00\x1a\xa5\xe1\x01\x70\xce\xb0\x58\xac\xe0\xbd\x07\xe7\
-\xeb\x29\x8c\x31\x38\xe7\xa0\xb5\x46\xa7\xd3\x81\x52\x0a\x84\x10\
-\x48\x29\xc1\x08\x60\x8c\x01\x00\x10\x42\xc0\x18\x3b\x0c\xe0\xa7\
-\x77\x7f\xa1\x51\x1a\x8c\x25\xc8\x73\x1a\x17\x8f\x47\xe8\x5e\x85\
-\x60\xde\x7b\xa4\x82\xe1\xfb\xaf\xce\x76\xda\xfd\x27\x01\x16\x8b\
-\x05\xe6\x8b\x25\x18\x63\xd0\x5a\x83\x10\x82\x7e\xbf\x8f\xd9\x6c\
-\x06\xad\x35\x4e\x4e\x4e\x50\x96\x25\x84\x10\x30\xc6\xc0\x7b\x8f\
-\x8b\xcf\xcf\x77\x5e\xfc\x93\x00\x49\x92\x20\xcf\xd7\xd7\x52\xae\
-\x4b\x03\xa5\x14\x52\xca\xb5\xd4\x8c\xa1\x28\x0a\x08\x21\x60\xad\
-\x05\x25\x04\xab\xaa\x8a\xf2\x03\xff\x32\x04\x42\x08\x10\xba\x39\
-\x59\x4a\x09\x63\x0c\x08\x21\xc8\xb2\x6c\xfd\x2f\x53\xfc\xf0\xf5\
-\x7e\xbb\xdf\x0a\x10\x62\x5c\x96\x25\x16\xcb\xf5\x8e\xa4\x94\xa8\
-\xeb\x1a\x94\x52\x50\x4a\xa1\x94\x82\x10\x02\x94\x52\x58\x6b\xf1\
-\xe2\xfc\x0c\x5a\xeb\x0d\x5f\x41\x81\x6d\x4d\x6f\xab\x02\xde\x7b\
-\xf4\x7a\x3d\x74\x8b\x67\x3b\xed\x84\x12\x82\xf7\x93\x15\x00\xe0\
-\xb4\x90\xe8\xa6\xff\xb8\xde\xb6\xf8\x56\x80\xa0\x80\x31\x06\xab\
-\xba\x41\xd3\x34\x60\x8c\x81\x10\x02\xce\x79\x94\x3f\xd4\x83\x34\
-\x4d\x51\xd7\x35\x6e\xa7\x53\x30\xc6\xf0\xdd\xab\x73\xe4\x09\xdb\
-\xf0\xb9\x33\x80\x73\x0e\xce\x39\x54\x55\x85\x72\x3a\x43\x9a\xa6\
-\xa8\xaa\x0a\x8c\x31\x30\xc6\x60\xad\x45\x92\x24\x50\x4a\xa1\xaa\
-\x2a\x9c\x9e\x9e\x42\x29\x05\x4a\x29\x9a\xa6\x81\x31\x26\x86\x83\
-\x10\x02\x4a\x29\x9c\x6b\xaf\xa4\x4f\x2a\x90\xe7\x39\x52\x99\x45\
-\x28\x4a\x37\x5b\x87\x52\xea\xfe\xb4\xe4\xf1\xde\x6f\xd3\x1a\x9d\
-\x54\xa0\xd7\x49\x1e\xf8\xdb\x1b\x40\x6b\x0d\xa5\x4d\xbc\x16\x42\
-\x40\x29\x05\x29\x25\x9c\x73\xb1\x32\xd6\x75\x1d\x41\x00\xa0\x2c\
-\x6b\x7c\xf1\x3c\x83\xf7\xe2\x81\xcf\xbd\x00\x9c\x73\x50\x4a\x61\
-\x52\x4e\xc1\x39\x87\x10\x22\x2e\x04\x00\xab\xd5\x2a\x16\xa0\xa0\
-\x4c\x28\xc7\xd6\xda\x18\x86\x10\x82\x83\x4e\x41\x96\x65\x10\x49\
-\xda\x3a\xde\xed\x76\xb7\xce\x23\x84\xe0\x43\x59\xe3\xcf\x85\xc2\
-\xcb\x7e\x8e\x93\x4c\xb4\x3e\xbb\x15\x20\xc8\x3b\x9b\xcd\xa0\x8d\
-\x8d\x27\x22\x4d\xd3\x38\xd6\xed\x76\x31\x9d\x4e\x63\x7f\x08\x21\
-\x32\xc6\x20\x49\x12\x4c\xef\x13\xf9\xb3\xe2\x25\xbc\xe4\x5b\x93\
-\xb0\xf5\x85\x24\xe4\x40\x28\x34\x42\x88\x18\xff\x20\x65\x38\x92\
-\xc0\xba\x33\x86\x02\xc5\x39\x87\xd6\x1a\x9c\xf3\x98\xfd\x07\x25\
-\xa1\x73\x0e\x49\x92\x80\xb2\xf5\x23\xd6\xda\xb8\x58\xb0\x8f\xc3\
-\x10\xba\xe2\x1f\x1f\xde\xe1\xe2\x6c\x80\x5e\xbf\x07\x00\x90\x82\
-\x45\x88\xbd\x00\xbc\xf7\x58\x2e\x97\x50\x7a\x9d\x64\xab\xd5\x6a\
-\x23\x0c\x42\x08\x10\xb2\x7e\x51\x19\x0c\x06\x51\x95\x6f\x5f\xbd\
-\x80\x10\x62\xc3\xdf\xce\x00\x61\x92\x10\x02\xce\xaf\x3b\x60\x9e\
-\xe7\x31\xc1\xc2\xf1\xb3\xd6\x82\x10\x12\x63\xef\x9c\x43\xb5\x5c\
-\xa0\xaa\xaa\x07\xea\xb4\xd5\x8f\x27\x01\x42\x25\xfc\xe6\xe2\xf9\
-\x93\x75\xbc\xcd\xaa\x81\xdc\x68\xbf\xc1\xdf\xce\x00\x41\xb2\x8e\
-\xd8\xff\xa5\x39\x4f\x9e\x45\x1f\x8f\x7d\xee\x0d\x70\x4c\xdb\x19\
-\xa0\x28\x0a\x6f\xad\xad\xb7\x49\x76\xa8\x59\x6b\xeb\xa2\x28\x36\
-\x28\x36\x00\x46\xa3\x91\xb9\xbe\xbe\xfe\x71\x32\x99\xbc\x76\xce\
-\x1d\xe5\xc3\x85\x52\xea\x6e\x6f\x6f\xdf\x8c\x46\x23\xf3\x78\xac\
-\xf5\xeb\x18\xf8\xef\x3e\xcf\xff\x06\x58\x83\xac\x48\x6e\x20\xe6\
-\xfb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x19\x75\
-\x00\
-\x00\x61\xea\x78\x9c\xed\x9c\x7d\x58\x52\xd9\xd6\xc0\x31\x2c\xad\
-\xf1\xb3\x9a\x26\x95\x34\xcd\x32\x6f\x29\xa9\xe5\x47\x21\x54\x36\
-\x95\xe3\x07\xf7\xde\x66\xa6\x26\x3f\x98\x46\x1d\xc7\x31\x45\x31\
-\x15\x03\xc1\xcc\x34\xd3\xb2\xb4\xd4\xc2\xa4\x9a\x9b\xce\xdc\x29\
-\xad\xcc\x30\x3f\x00\xa5\x22\x72\x8c\x8c\x99\x48\x51\x3e\x42\x45\
-\x43\xe5\x28\x2a\x20\x28\xef\x11\x6b\xee\xbf\xef\x9f\x73\xdf\x17\
-\x9f\x87\xc7\x7d\x60\xed\xdf\x5a\x7b\xed\xb5\xf7\x5a\xe7\x79\xf6\
-\x39\x85\x7f\x0f\x3f\x60\xb9\xc2\x7e\x05\x04\x02\xb1\x0c\x3e\xb8\
-\xef\x9f\x10\x88\x59\x3b\xf8\xb9\x6a\xbe\x0c\xfc\xe6\x24\x34\xfd\
-\x13\xf0\x9f\x69\xda\xde\xe0\x2f\xcd\xc1\x3f\xa2\x79\xec\x59\xf0\
-\x7a\x79\xca\xc1\x6f\xd2\x20\x10\xcf\x0d\x0b\x1f\x13\xfc\x6d\x54\
-\x06\xf8\xa5\xdd\x89\xcf\x8f\x9c\x38\x84\xfd\xfe\x44\xe6\x31\x5c\
-\x1c\x24\x33\x33\xd3\x33\x21\x39\x31\x2d\xe6\x58\x4a\x9c\x27\x16\
-\x17\x4f\x19\x47\xd8\x43\x20\xeb\x21\xc1\xfb\xf6\x7c\x89\xaf\x1a\
-\xed\x17\xe0\x04\x6f\x1f\x9f\xe9\x5e\x0e\xac\xef\x19\x73\x55\xe8\
-\x6f\xec\x4a\x8a\x70\xb9\x0f\x87\x54\xda\x7c\xde\x3b\xfe\xa5\xdb\
-\xa3\x9a\x67\x3f\x1f\x5d\xfa\x4f\xb3\xd2\xc3\x9e\x9f\x22\xf5\x89\
-\x96\xbc\xed\x4b\x21\x8b\x7f\xf6\xc5\x8c\x59\xe8\x87\x36\x53\xf4\
-\xb9\xa9\xd9\x62\xf3\x46\xbe\xb9\xd5\x62\x6b\xb7\xa5\x2d\x6c\xb1\
-\x95\x63\xef\xe2\xff\x41\x72\xc7\xbe\x94\x0f\xad\x1f\xcf\x8a\x3f\
-\xb4\x7e\xb7\x69\x37\x59\x6c\xfd\xec\x9c\xfb\x01\xf9\xf7\x20\x23\
-\xd0\x08\x34\x02\x8d\x40\x23\xd0\x08\x34\x02\x8d\x40\x23\xd0\x08\
-\x34\x02\xff\x5f\x00\xef\xeb\xff\x70\x82\x88\x3d\xec\xf2\x8f\xa9\
-\xff\xa0\x1a\xbe\xc4\x53\x6b\x12\xae\x91\xa6\xe3\x21\xf8\x4f\x96\
-\xe9\xa3\x97\xf4\x65\x6e\x38\x29\x2a\x12\xbf\x33\xf0\x80\xcc\xa6\
-\xcf\x92\xa3\xb3\xa3\x56\x9b\x35\x85\x99\x9a\x35\x4d\x5e\x07\xb2\
-\xb3\xdb\x48\x3a\x5a\x76\x9e\xbe\x23\x71\xc9\x82\x04\x96\x7b\x22\
-\x3d\x10\x13\x48\xa5\x9e\x0d\x84\xc0\x41\x85\x0e\x87\x4d\x88\xcf\
-\x3b\x81\xec\xb6\x52\x7e\x7b\xef\xbf\x16\x21\xd4\x26\x2b\x5f\x01\
-\x84\x1e\xf5\x78\x42\xfd\x87\xe2\x13\x29\x93\xb0\x29\x17\xba\xd5\
-\xd7\x84\xe8\xf0\x98\xdd\xa5\x1c\x93\x3a\x2d\x4d\xed\x76\x58\x10\
-\x54\xff\x9a\x7c\x66\x2c\xcd\xb3\x9b\xa0\x55\x47\xc3\x18\x73\x1d\
-\xb9\x36\xc0\x05\x10\xf9\xd8\x8e\x49\xeb\x26\x44\xbe\x49\x56\xaa\
-\xa3\x57\xa3\x4d\x0d\xc3\x13\xd7\x5f\xad\x73\xc4\xf2\x35\x66\xf2\
-\xda\x20\x35\xcd\xcf\xa6\x20\x07\xa7\xc5\xcc\x99\x40\x48\x8d\x0a\
-\x53\x60\x07\x51\x14\x91\x68\x2a\x1a\x54\x2c\x17\xbf\x0b\x58\x90\
-\x6e\xc5\xf0\x23\xae\x63\x83\x54\x09\xdf\x70\x29\xec\xda\x41\x19\
-\xf7\x70\xbd\xd7\x80\x99\x33\xb1\xcd\xed\x6f\xf9\xd0\xbb\xfb\x52\
-\x72\x7a\xd2\x21\x98\x20\x15\xa9\xc1\x4a\x20\x63\xc7\xfa\x45\x2d\
-\x51\xdb\x3f\xa1\xd5\x67\xca\x03\x0d\x3e\x7b\x94\x1c\x76\x8a\x5a\
-\x30\xa0\x9b\x8e\xd3\x91\x9a\x9b\xeb\x54\x3e\x68\x8d\xb5\x5b\xc7\
-\xd3\x94\x1b\x57\xcc\xad\x5a\x13\x29\xee\xc0\x40\x06\x04\xf5\xfd\
-\x05\x11\xdb\x95\x1d\x83\xab\x2a\x97\xc9\x34\xda\x96\xb9\xef\x8b\
-\xa6\xdc\xed\xe6\x3b\x50\x77\x6e\x19\x7c\x70\x51\xa6\xf1\xb6\x0c\
-\x81\x90\xc3\x5f\x1e\xc2\xf5\xba\x71\x59\x2b\xe9\xd4\x21\xf5\x5c\
-\x7a\xc3\xb3\xc8\xef\xd4\x69\x9e\xce\x88\xac\x6c\x45\x77\xac\x3f\
-\x50\x07\x0e\x97\x46\xdb\x83\x81\xaa\x59\x0f\x1c\xad\x39\xd2\x80\
-\xac\xd0\xc9\x7b\x11\xef\xd4\x4d\xa6\xca\xfe\x49\x82\xf4\x7c\x52\
-\x77\xe6\x61\xae\xa2\x15\x65\x70\x6b\x78\x55\x34\xf2\x7a\x86\x92\
-\x5f\xe3\xca\x0b\x08\x70\x2a\xe5\x25\x58\x89\xd1\xb5\x01\x24\x72\
-\x80\x2b\x95\x5a\x0a\x7f\x0c\xfb\xc3\xbf\x8e\x41\x15\xf0\x06\x38\
-\x63\x9b\x49\x7e\x27\xac\x59\xdb\xcc\x25\xbb\xa1\xb6\xb0\x6f\x1f\
-\x9d\x17\xcb\xcb\x65\x6c\x57\x6b\xf6\x80\xf4\xe1\x9d\x7e\x62\x36\
-\xac\xdc\x06\xe9\xe9\x4c\xac\xa2\xed\x77\x62\xc7\x36\x59\x49\x5a\
-\x14\xad\x23\xae\x39\x0b\x81\xc7\x6c\x49\xcb\xe6\x02\x55\xa1\x52\
-\xef\xa5\xa4\x6a\xbe\xf2\x22\x82\x5a\x56\x2f\x85\xd1\x19\x55\x65\
-\x64\x45\x19\xaa\x20\x56\x75\xe2\x71\x3d\x3e\x51\xae\x4c\x4b\x6e\
-\xb1\x7a\xe7\x17\x43\xb3\xb1\xda\x0e\x86\x5a\x34\xfa\x94\xe2\xc1\
-\xf1\x2c\x52\x28\x72\xab\x89\xce\x29\x66\x32\xe1\xe0\xfc\xdb\x8d\
-\x4e\x05\x03\xac\x4a\xc4\x68\x19\xeb\x22\x2c\x23\xcd\x1c\x54\xb4\
-\xb6\x1c\xe5\xc2\xee\x9c\x16\x12\x0c\x71\xa4\x78\xa5\x99\x4e\xbf\
-\x56\xee\x0e\xf0\x56\xb6\xd7\x0e\x8c\x04\x68\xbc\x37\x91\xab\xcb\
-\xc8\x6e\x01\xd5\x43\x75\x3e\xb0\x52\x84\x47\x37\x02\xce\x5d\x22\
-\xda\x3f\x91\x64\x41\x9d\xdc\x49\x12\x9d\x97\xec\xf5\x07\xde\x14\
-\x8a\x99\x2d\x8d\x55\x69\x0d\xd7\x7b\xa3\xa1\x6a\x64\x9a\x29\xb9\
-\xb2\x94\xed\xae\xd9\xfe\xd2\x56\x47\x0d\x9a\x2c\xe9\x87\x75\xa0\
-\x8a\x39\x05\xfd\x08\x5b\xd2\x5b\x8f\x88\x5b\x70\x67\x62\x24\x66\
-\x6b\xd6\x57\x2d\x4f\xb1\x86\xb8\x97\xbd\x69\x26\xbe\xa4\x9d\x0b\
-\xbc\x3e\x94\xee\x58\xc6\xcb\x12\x2e\x9b\x4b\x2c\xe5\xd6\x0e\x70\
-\xdd\xb3\x60\xb2\xeb\x5b\xd8\xbc\xc1\x8d\x2f\x29\xe9\x2f\x6e\x6b\
-\xee\xc0\x51\x43\xd3\x5f\xaa\xdb\xd6\x7a\xe6\x41\xbf\x02\x83\x85\
-\x1f\x9f\xab\x28\x85\x59\xa5\x99\xea\x9b\x42\x49\x64\xfb\x52\xf2\
-\x78\x29\xf9\x3c\xa7\x36\x6a\x32\x81\xb1\x0f\xc8\xc6\xbd\x75\xd3\
-\xce\xad\x64\x56\xac\x25\xf9\xe4\x96\xdc\x5f\xba\xd3\x10\x7f\x07\
-\x68\x33\x5b\xa8\xde\x7c\xb9\x72\x25\x93\xcb\x99\xaa\x42\xa0\xdc\
-\xb8\x9d\x1a\x11\x18\x54\x7a\x6f\xf4\xa9\x92\xce\x40\xf6\x48\x55\
-\xd5\x4c\x27\xd7\x03\x9e\xfa\x62\x63\x31\xfc\x40\xb1\xdb\x63\x32\
-\x1c\xb7\x30\xc4\xbf\x07\x9b\x9a\xe1\xd7\x31\x19\x61\xa0\xca\x02\
-\x2f\xcd\xbd\xe3\xa7\xe7\x13\x50\xe8\x5c\x7d\x62\x05\x71\xa7\xab\
-\x13\x18\x21\xc7\xac\x86\xb4\x73\xde\x96\xf4\x90\xfc\x7e\xa2\x2f\
-\xfe\xd1\x4f\x43\x4b\x0c\xf1\xd6\x8a\xe5\x13\xae\xd4\xf3\x65\x1b\
-\x73\x51\x6e\xb2\x7a\x4e\x42\x28\xdd\xaa\xf3\xeb\x61\xb4\xb2\xed\
-\x85\x57\x45\xf0\x44\xed\x6f\xf1\x79\xe4\xae\xd6\xea\xb4\x42\x89\
-\x60\xbc\x21\x69\x8c\xe6\x02\xce\xdc\xef\x2b\xdb\x4d\xbe\x87\xef\
-\x55\x7b\xf5\x50\xe1\x11\xb7\xc8\x6b\xcb\x4a\x3a\x67\xd9\xc7\xac\
-\x24\x7a\xe2\x11\x17\xb5\x57\x80\x63\xe9\x9c\x57\xcf\xba\xd2\x54\
-\xd4\x01\xa0\xf1\x67\x6b\x79\x11\xb6\xde\x4f\x68\x58\xb5\x9b\x1f\
-\x79\xbc\x96\x2b\xe3\x56\x20\xc0\x91\x5d\xae\xa2\x96\x2a\x91\x59\
-\xb3\xa5\x08\x6b\xe5\x6a\xb5\x97\x52\x1c\xfe\x52\x59\x42\xce\xfe\
-\x02\xe9\xa6\x41\x6c\xc4\xcc\x70\x64\xb2\x80\x73\xf5\xa7\x03\xf9\
-\xf1\xa7\xac\x1f\x4f\xcd\x38\x3d\xfe\xac\xd3\x44\x08\xb3\x85\x89\
-\xe3\x20\x4e\xa5\xc5\x3c\x9d\x42\x4a\x0a\xb5\x0a\xc2\xf5\xb9\x95\
-\xb4\x04\x9c\x24\xf7\xb9\x91\x61\x65\x28\xc7\xa1\x69\xf5\x45\x04\
-\xac\x6c\x2e\xc6\xdb\x11\x6e\x4b\x7c\x1b\x37\x2f\x3f\x91\x35\xf1\
-\x99\x97\x61\xe7\xc3\x63\x1e\x4d\x10\x08\x37\x54\x2b\x99\xca\xcb\
-\xa1\x98\x32\x9e\x6c\x20\x2b\xb4\xfa\x59\x2c\x6a\xab\xec\x24\x5a\
-\x19\x20\xc1\xd4\x0c\x28\xfd\xa9\xb6\xf3\x0a\x1e\xec\xb9\x93\x37\
-\xfa\xb4\x42\x89\x8b\x98\x92\x75\x09\xee\x62\x19\x51\x82\x92\xf4\
-\x75\x74\xcc\x99\x14\x9e\x98\x19\xb1\x21\x17\xaa\xe8\x4f\x99\xc6\
-\x07\xbe\x24\xd0\x30\xf3\xaa\x01\x64\x80\xa7\xb3\xee\x98\x1f\x96\
-\x3c\x2f\xa9\x24\xe2\x23\xdf\x14\x0c\xa8\xb7\x1d\x00\xfa\x83\xbc\
-\x1d\x4b\x25\xf7\x0a\xc5\x31\xd1\xe8\x5c\xc1\x9a\x75\x0b\x06\x08\
-\x2b\xc6\xbe\x1e\xa6\x34\x30\x95\xdb\x0f\x00\x23\x21\xb8\xf9\xd2\
-\xd0\x96\x10\x88\x53\x4d\xec\xd1\x25\x6a\x5e\x40\x56\x55\xf9\xf4\
-\x76\xeb\x31\x44\x95\xcc\x86\xf4\x9c\xd8\xbf\x1f\xd8\x91\x2c\x7b\
-\x9f\x44\x3b\xf4\x4e\xa0\x48\x4a\x8e\xda\xe4\x65\x6b\xd5\x9a\xea\
-\xe2\xcf\x1c\x8d\xa8\x25\x1d\xcc\x90\x65\xd9\x13\x69\x21\x19\x31\
-\x0f\x44\x1b\x0b\xfa\x5b\xc7\x34\x13\x17\x61\x25\x1c\x56\xd0\x24\
-\xe0\x9c\xa5\xf6\xaf\x9f\x8b\x79\x40\x08\x7d\x56\x10\x90\x1b\x4f\
-\xd5\xda\x7e\x18\x7a\x1d\x17\x8a\x29\x9a\x3e\x34\x34\xd7\x55\xa2\
-\xfc\x7a\xb8\xd6\xab\xc7\x52\x39\xc7\x19\x41\xa0\x4f\x91\xb3\xab\
-\xcd\x4e\x38\xbe\x0c\x51\x3b\x96\xb1\xdc\x7b\xd0\x4a\x1b\xae\x44\
-\x83\xdb\x85\xa3\x86\x0c\x23\x3d\xf8\x72\x8f\x6e\xec\x53\x20\xc2\
-\x59\xb7\x74\x61\xe4\x2e\xb9\xd0\xd6\xe3\xbf\xb3\xbc\x6f\x07\x8e\
-\x96\xa6\x16\x8a\x45\xdf\xa9\x91\x3d\x4e\xa5\x2c\xaf\x00\xc4\xa6\
-\x02\x6b\x8e\x24\x06\xa7\xde\xd0\x43\x0e\x7d\x56\xa2\x2c\x1f\x66\
-\xc5\x0c\x91\xbf\x65\xc7\x1e\x39\xd0\x49\xc3\x9a\x1a\x62\x0c\x2e\
-\x18\x7b\xc5\x37\x9f\xaf\xca\x82\x2b\x0b\x62\x67\xab\xaa\x32\xd3\
-\x20\xe4\x6b\xa5\x23\x97\xab\xc2\x39\x4a\x25\xa2\x32\xcd\x7f\x23\
-\x5b\xa6\x51\x3f\x63\x55\xc2\x6a\x07\x24\x0f\x61\xf2\xca\x2c\x7b\
-\xdd\xbd\x2c\x4d\x22\x6b\x48\x2e\xdb\x2a\xb8\x23\xd2\x9c\x95\xaf\
-\x6e\x4a\x48\x11\x77\x2d\x46\x1e\xde\x73\x0f\x11\x26\x6b\x14\xc0\
-\xbd\x88\xd4\xd1\x0b\xca\x37\xb2\x16\x6b\xce\x78\xcc\x03\xed\x06\
-\x3b\xfd\x91\x3a\xeb\x10\x53\xd4\x80\xf7\x72\xba\xa5\xe4\xd1\xde\
-\x85\x44\x98\xa3\x4a\x20\xac\x51\xef\x5c\x3a\xbf\x83\x43\xe5\x3c\
-\x64\xe4\xbd\xef\x0f\x08\x40\x6d\xd4\xd6\xc6\xaa\x2e\x8f\x32\x36\
-\x69\xe3\xd8\x2f\xe6\x46\x56\xb6\xd2\x26\x08\xe7\x25\x2a\x17\x75\
-\x9b\x38\x1b\x4b\x98\xa2\x84\x9e\x86\x62\xcf\x98\x5b\xa5\xdc\x7f\
-\xa6\x18\x85\xf3\xc4\xac\x4a\x0b\x16\xae\x9f\x1b\x4f\x2a\x61\x77\
-\xcd\xde\x0b\xcd\x21\x5f\x0b\x52\xab\xfd\xb1\xbf\x54\xc7\xd0\xc3\
-\x4e\x93\x05\x2b\xa3\xe6\x96\x7d\xd0\xb4\x59\x15\x00\xc6\xf3\xa1\
-\x52\x78\x70\x86\x32\xf0\xf9\xf4\x1d\x60\xa2\x13\x71\xdc\x87\x44\
-\xb7\x90\x8d\x56\x24\xbd\x56\xb1\x70\xd7\xcb\x63\x60\xe8\x0a\x9f\
-\x76\xea\x10\x86\xdc\x4d\xaa\x2b\x20\x7f\x2d\x1b\xd4\x64\xb8\x10\
-\x9b\x67\x03\x41\x37\x53\x36\x82\x6e\x9e\x79\x67\xdd\x91\xb0\x5c\
-\xdc\x12\x62\xee\x34\xc3\x49\xa9\x8a\x51\xa5\x84\xe6\x5b\x2b\xa7\
-\x54\x80\xe4\x01\xfd\x73\x20\xdd\x1e\x61\x6b\x48\xd2\xe2\xb6\xde\
-\x0b\xd1\xf5\x11\x37\x51\x71\xf4\x02\x7f\x57\xde\x65\x8b\xda\x58\
-\xb5\xb7\x28\x13\x86\x72\x63\x1d\x43\x3e\x98\x10\x24\x5f\x09\x7a\
-\x40\xf1\xa4\xad\xb3\xe6\xc9\x7f\x01\x0e\x79\xb6\x65\xcb\x2f\x0b\
-\xde\xac\xad\x6e\x6d\xcd\x76\x27\x42\xb1\xd7\xc0\xd1\xb1\x93\x0b\
-\x25\x9d\x4e\x95\xac\x7b\x79\x40\x7a\x52\x8c\xfa\x58\xa1\x98\x72\
-\x25\xc6\x33\xe2\x16\x56\x75\xc4\x50\x42\x08\xa9\x09\x0d\x6f\xee\
-\xbe\xca\xec\x54\xbd\xe1\x00\x70\x8a\xf6\xbc\x36\x20\xa7\x5e\xe5\
-\xc6\x4e\x5f\x42\x8c\xcc\x55\x55\xc2\x5e\x56\xa8\xdb\x02\x1d\x74\
-\x55\x9d\xab\x55\x6d\x25\xa5\x5d\x5c\x8b\xc3\x28\x7d\x7f\x43\x7b\
-\x52\xa1\x55\xeb\x52\x30\x5c\x9f\xfe\x8a\x5a\xe1\xb7\xaa\x8f\x95\
-\xb2\x5c\xf2\x0d\x7f\x56\xb4\xb5\x84\x22\x67\x7d\x9f\xe4\xd6\xfe\
-\xb9\x21\x31\xe3\x19\x8f\x04\x37\xa9\xb8\xc7\x58\xff\x38\x2b\x31\
-\xe5\xd2\xf8\xb1\x34\x4c\x6a\x60\x5d\x6a\x24\x7f\x3b\xb6\x90\x7e\
-\x5e\x28\x68\x68\xe7\xf7\xbf\xa9\xfd\x95\x46\x57\x5d\x7a\x23\x4f\
-\x91\x79\x31\x29\xae\xb9\x50\x1d\xb3\xe9\xb1\x27\x79\xce\x52\x1e\
-\x20\xa2\xe5\xaa\xa7\xbd\x97\x1b\x0a\x9c\x48\x74\x6e\xbd\xf4\x8f\
-\x44\x88\x08\xfb\xe6\xe4\x76\x69\xba\x29\xb5\xdc\xa3\xdb\x07\x5b\
-\x44\xef\xec\x84\x90\x8e\x44\x27\x53\x2b\x64\x44\x8c\xd9\x84\x7c\
-\x47\xb2\x23\x86\x6a\x32\x1e\x9a\x22\x0e\x5b\x88\x23\xd5\xec\xd4\
-\xc5\x56\x0b\x49\x88\x05\xc3\x4a\xc2\xf2\x3d\xa7\x50\x7a\x5f\xa4\
-\x98\x2e\x46\x4c\xd2\xae\xe5\xd5\x83\xcd\x85\x42\xf8\xb8\x4f\x9d\
-\x6a\xbd\x5f\xe2\x6f\x20\x28\xd1\x61\x4a\x3e\xf6\x8a\x86\x6d\xa9\
-\xeb\x1f\x8a\xb1\xf0\x7b\x33\xed\xfb\x9e\x1f\xf1\x13\x17\x7d\xbc\
-\xd0\x4a\x37\x04\x6e\xf6\x82\xe8\xe9\xf7\x49\x4f\x84\xf3\x5f\xf9\
-\x27\xd7\x09\x36\x2e\x56\x63\xbf\x8e\xfd\x9c\x8e\xeb\x59\x93\x4d\
-\x40\xa7\x12\x18\xa9\xfd\x57\x70\xd7\x6a\x99\x7c\x9b\xf9\xef\xd6\
-\xc4\x7f\x61\xc5\x03\x99\x47\xdf\xf8\x12\xa9\xca\x93\x93\x84\xd6\
-\xd9\xde\x74\x73\x33\x3c\x0f\xe4\x30\x7e\x50\xf2\xc5\x29\x5b\xce\
-\xe9\x7f\x30\x14\x5d\x0a\x7e\xc9\xb8\x53\x78\x27\x6b\xcc\x15\x3f\
-\xb4\x16\x19\xdb\xb3\x32\xb0\xc2\x64\x72\xcc\xf3\xbd\x3c\x63\xb8\
-\x20\xf2\x9d\x6a\x67\x0a\xdd\xf2\x5d\xa2\x29\xc3\xcf\x12\xcc\x39\
-\xd8\x6a\x73\x2b\x20\x6d\x7c\x46\xce\x58\xc9\xfc\xe0\x64\xd1\xfc\
-\x69\xc2\x59\xd6\xc3\x3c\xf9\xc8\x83\x89\x81\xe6\x8d\xb3\xbe\xf9\
-\xf5\xfc\x74\x7b\x22\x38\x6b\x0f\x89\x58\x07\x26\xf6\x0c\x20\x2f\
-\xd1\xf4\xdb\x24\x87\x9c\x10\x67\x82\xc5\x96\x4e\x8c\x30\xf4\xcb\
-\xc1\x88\x9b\xcf\x63\x69\x41\xa2\xe4\x22\x3a\x28\x2b\xf8\x7a\xe4\
-\x2a\x54\x35\xab\xdb\x99\xa3\x7f\xb2\x7b\xb6\xab\xa1\xdd\x44\x98\
-\x37\x71\x98\x0c\xc9\xf1\x13\x9f\xe4\xa7\x19\x3a\xe8\x6b\x9c\xaf\
-\xd2\xf6\x63\x68\x07\xa8\xbe\xb6\x84\xe6\x27\x63\x49\x36\xa0\x5b\
-\xa5\x7f\x48\x15\x4b\x81\x27\x6d\xe8\x1b\x67\x41\xcb\x7a\x4b\xe6\
-\xdf\x3a\x8c\x23\x96\x19\x2a\xb8\x88\x50\x0a\xa1\x84\xb7\x29\x1a\
-\x0d\x3f\x3d\x73\x57\x9d\xbd\xee\xb9\xe2\x6e\x84\x89\x8e\xb0\xa7\
-\xaf\xed\xef\xe2\xae\x8f\x55\x28\x09\x0d\xdf\x3b\x3d\x75\x32\x64\
-\x4a\x3e\xfd\x93\x7a\xce\x87\x7d\xa9\xa8\x9f\x49\x71\xfb\x50\xe9\
-\xea\x90\x75\x1b\xa6\xda\xbe\x9d\xf3\xe9\xd6\xc6\x43\xfd\x77\x7f\
-\xfa\xa1\xc4\x15\xab\x1e\x5e\x7f\x29\x7c\xa6\x90\xdf\x9b\x6b\x98\
-\xd0\xce\x6a\xda\x54\xd0\x05\xbf\x2e\x56\xbf\xa2\xce\xb6\x31\x8e\
-\xe2\x29\x40\xbd\x3e\x3b\x2f\x94\x2f\x17\x2f\x14\xc6\x62\x94\xd4\
-\x7a\xaf\xa1\x27\x39\xae\x72\xdc\x4c\xbe\xe3\x24\x06\x9d\xaf\xdf\
-\x9c\xa7\x1f\x76\x94\xa5\x6f\x35\xc3\xfb\xfc\xd9\x59\x94\xfe\x24\
-\xba\x96\x4e\x13\x69\x7b\x1a\xb3\xbb\x9c\xda\xdc\x98\x94\x0d\x1f\
-\x6d\xa9\xa9\xe9\x5c\xad\xfe\xf1\x08\xa3\x9a\x4a\x99\xa1\xef\x98\
-\xce\x4e\x0c\x99\x22\x70\x17\x53\x96\x5b\xe8\x3c\x60\x90\x9a\x67\
-\x27\x3f\x51\x28\xce\x8c\x47\xa0\x2a\x14\xc4\xfe\xb9\xf0\x1b\xe5\
-\x1f\xea\x73\x20\x3f\x14\x65\xf5\x96\x3c\x38\xaa\x88\x60\x98\x01\
-\x35\x85\x1f\xaa\x71\x2c\xf7\xee\xab\x6c\xf8\x77\xfa\xd0\xbe\x35\
-\xcc\x53\x1f\xeb\x76\xa6\x60\xa2\xe1\x66\x84\x7a\x99\xd0\x03\x44\
-\x63\x27\x57\x45\xd8\x18\x5c\xa5\xfb\x42\xf5\xf2\x13\xb3\x9f\x5d\
-\x3e\xd8\x73\x42\xb3\x25\xe2\x36\xf4\x77\xdb\x8f\x7e\xbc\x39\xe2\
-\x56\xdb\x50\x9f\xf1\x13\xac\x86\x5f\xd6\x5f\xd3\x6a\xe2\xf2\xe7\
-\xdd\xc2\xbe\xbf\xe8\xed\x87\x11\x68\x04\x1a\x81\xff\x77\x80\x80\
-\x7e\xb4\xe7\x94\x05\x78\xc5\x5c\x4f\x96\x13\x88\xb7\x6d\x17\x7e\
-\x61\xe6\x7f\x54\xf0\x6d\xd0\x47\xa5\xf7\x9c\x3f\xf6\x7b\x7b\xf1\
-\x23\xeb\xf8\xc1\x8f\x7c\x5f\xd7\x8f\x3a\x1d\x56\x7e\xb4\xc3\x72\
-\xf9\x07\xdb\x8c\x38\x23\xee\xbf\x0f\x37\xe7\xd8\xdb\xf5\xf1\x2c\
-\xc0\x5f\xdb\x52\x23\xce\x88\x33\xe2\x8c\x38\x23\xce\x88\x33\xe2\
-\x8c\x38\x23\xce\x88\x33\xe2\x8c\x38\x23\xce\x88\x33\xe2\x8c\xb8\
-\xbf\x2e\xce\x86\x90\xb1\x7e\x01\xb2\xed\xb9\x68\xd6\x11\x93\x60\
-\xfa\x97\x36\xd6\x88\x33\xe2\x8c\x38\x23\xce\x88\x33\xe2\x8c\x38\
-\x23\xce\x88\x33\xe2\x8c\x38\x23\xce\x88\xfb\x3f\x8f\xfb\x4e\xfa\
-\xcd\xc4\xc7\xb3\x00\x7f\x6d\x4b\x8d\x38\x23\xce\x88\x33\xe2\x8c\
-\xb8\xff\x05\xee\xe7\x36\x42\x44\x38\x8c\xd3\xb1\x6d\x36\xed\x5e\
-\xa2\x50\x1f\x55\xdb\xb9\xcc\xb5\xeb\x8c\x6b\x59\xf9\xd3\x5f\x5a\
-\xe2\x6b\x7a\xee\x7c\x7a\x73\xf7\xb7\x9f\xce\x7c\x75\x26\xb7\xe4\
-\xfa\xf2\x85\x4e\xbb\xed\xfe\x3c\x5a\x19\xf7\xe7\x81\xca\xcb\xff\
-\x39\x97\xf9\x9f\xd3\x98\x46\x41\xa3\xe0\x7f\xbb\xe0\xa8\x5e\x44\
-\x86\x30\x1b\x1c\xc6\x11\x0b\x97\x39\xfc\x74\x85\xec\x2c\x32\xc4\
-\x54\x2d\xdf\x97\x92\x63\x36\xcd\xeb\x16\x5e\x6c\x4e\x35\xbc\xf0\
-\xa8\x2e\xcb\x35\x47\x7b\xdc\x56\x5c\x6f\xdb\x6e\x32\xbe\xbd\x40\
-\x31\xa0\xb5\xfc\x41\x84\x78\x74\xa0\x42\x59\xbd\x2a\xa8\xb4\xeb\
-\x84\x01\x57\x5f\x3b\x87\xb8\x4f\xb9\x30\x18\x7f\x2e\xa8\xce\x5a\
-\x02\x49\x71\xb2\x85\x89\xad\x94\x96\xdf\x13\x94\x01\x03\xc4\x86\
-\x9d\xa2\x7b\x2f\x65\xb5\xae\x2d\xba\x62\x83\x75\x4c\xf9\xd1\xfd\
-\xc0\xa1\x37\x28\x4c\x64\x3e\xe0\x9b\x0f\x4d\xa1\x98\x5b\xa5\x04\
-\xa1\x02\x3d\x2b\xd6\xbf\x5f\xc3\x4e\xd8\x79\xc1\x4e\x9f\xd6\x1f\
-\xce\xef\xf2\xea\x5b\x5c\xe2\xad\x75\x83\xae\x6a\xdd\x37\xef\xee\
-\x07\x60\xf6\x4f\x34\xfe\x02\x20\x21\x7d\x2e\xb9\xd0\xc8\x6e\xbf\
-\x92\x31\x6f\x59\xe7\x70\x76\x28\xee\xe0\xe4\x55\x2f\x3c\x77\x95\
-\x38\x8a\x7e\xc0\xb0\x3d\x88\xd3\x3d\x36\xa8\x75\x57\xdf\xc5\xbf\
-\xa4\xfa\xbc\xf4\xd2\x5d\xa6\xf2\xc4\x9b\x3a\x4c\xc6\x37\x80\xbd\
-\xb6\x99\x8d\x22\xed\x66\x63\xd7\xd6\xb0\x3d\xed\xc2\x79\xa9\x55\
-\x17\xb8\xb1\xea\x2b\x16\x4e\x9a\x15\x62\x8a\x27\x27\xe2\xe5\x3f\
-\xfe\xd4\x99\xb1\xb2\x95\x1b\x80\x27\xbb\x6a\x60\xa8\x08\x98\x95\
-\x34\x91\x95\xaa\xd3\x79\xf5\x6b\x52\xad\xde\xb1\xb6\xed\x48\x71\
-\x86\x89\xbd\xc1\x21\xd6\x3a\x61\xee\xc0\xbe\x76\x51\x6f\x9f\x0b\
-\x24\xba\x66\xa1\xf3\xb3\xbd\x8f\x97\x76\x6d\x8b\x4a\x0b\xf5\xd5\
-\x16\x3b\x67\xaf\x5a\x3c\xb4\x1d\xdd\x83\xfb\xf5\x69\x56\xaf\x76\
-\x03\x47\xa1\xf4\x22\xc6\x56\xd9\x60\x83\xf0\x64\x64\x39\xb6\x07\
-\xb9\x64\x1b\xe8\xd3\x97\xf4\x0e\x95\xbb\x9d\xb0\xa6\xb2\x4d\xeb\
-\xc8\xd0\x1e\x7a\xed\x54\x36\x7f\x71\x8a\x1a\xac\xbf\x34\xa5\x8d\
-\x6d\xb8\x6e\x9f\x59\x71\xfc\x42\xb0\xf0\xd9\x36\x7a\xd5\x12\xbe\
-\x61\x3f\x14\x2f\x6d\xb4\x05\x4d\xcb\x25\x7f\x6f\x21\x26\xbb\xb2\
-\x9c\x78\xfb\xd4\xec\x87\xb3\x03\xc7\xec\x9f\x5f\xdd\xab\xe6\xbb\
-\xe2\x7d\x16\x1e\x4a\xba\x63\xd3\x6e\xb2\x9f\xf5\x4e\x27\x27\x3d\
-\x44\xcf\x3a\x8f\x84\x4b\xbb\x9d\xca\xc6\x2b\x4f\x50\x83\x69\x21\
-\xb3\x51\xaf\xc3\x56\x2d\x8c\x36\xfe\x81\xe6\x4a\xaa\xfb\xd4\x53\
-\x92\x98\xd2\x64\xb7\x30\xd5\x39\x15\x7f\xec\x07\x32\x30\x40\x82\
-\x3d\xb1\x72\x2f\x5e\xef\x65\x25\xb6\x28\x48\xd8\x5c\xeb\x10\x84\
-\x17\x95\x1c\xd0\xfa\x26\x0a\xce\x68\x2d\x56\xe2\xb3\x5c\xfc\x99\
-\x5c\x87\x27\xce\xbc\xb0\xc1\x4d\x23\xf9\xff\x92\x97\x26\x53\xaa\
-\x9a\x07\xb6\x2f\x05\x78\x9e\x01\xc9\x65\x73\xbe\x3d\xe1\x21\x6b\
-\x2d\xd9\xb1\xca\xea\xe3\x22\x9f\x79\xb3\x5d\x63\x66\xf4\xab\x6e\
-\xed\x05\x9d\x65\xe2\x4d\x4f\x16\xcc\xbf\xd1\x34\x48\x17\xd7\x16\
-\x6b\x73\xd1\x02\x4f\x2b\x46\x99\x44\x14\xac\x27\x58\x48\xfa\x8f\
-\x1d\xbd\x34\x89\x77\x7c\x33\x52\xe0\x9e\xa7\x92\x9b\x20\x8a\xd2\
-\xfe\x01\xc3\x07\x83\x9a\x86\xe5\x35\xc0\xc5\x29\x2c\xaf\xc2\x4b\
-\x3b\xe1\x6f\xc9\x49\xad\x80\x95\x70\x8e\x51\x88\xc9\xa5\xdc\x31\
-\x35\x79\xb8\xce\xc9\x8d\xa9\x3d\xf4\x60\x97\xab\x80\x96\x0a\x07\
-\xba\x90\x9c\xef\x23\x37\xcd\x25\xae\x24\x26\x05\x4f\x6d\x39\x66\
-\x70\xfe\xe6\x5b\x77\x5f\xa7\x99\x52\x6b\xdb\x51\x3e\xf9\x00\x77\
-\x53\x0e\x39\x94\xe5\xcf\x4e\x38\x28\xdb\x8e\x24\x9d\x01\x46\xee\
-\xf6\xae\xa5\xcf\xc8\xcb\xeb\x3d\x58\x01\xbb\x41\x6d\xc0\xfb\x72\
-\xd1\x05\x5d\xb3\xbe\x2f\x54\x30\x39\x25\x7d\xa2\x92\x5c\x26\x1e\
-\x7f\x26\xf5\x91\x4a\x3d\xa5\x4f\xb3\x2b\x46\xad\x39\xe3\x81\x3d\
-\x61\x26\xc4\x86\x5d\x66\x40\x58\x0d\x44\x68\xaa\x08\x9b\xdc\x90\
-\x53\x24\x31\x2c\xb2\xb7\xde\x79\x99\xbc\xd4\x83\xb8\xaa\x19\x88\
-\xbe\xea\xd1\x77\xba\x83\xe1\x05\xa9\xdb\x64\x27\x42\x2f\xcc\xa9\
-\xbf\x89\xe3\x53\xf5\xdf\x54\x50\x43\x6e\xd5\x87\x9d\x16\x29\xdd\
-\x4c\x2e\x83\xf1\xab\xeb\x0b\xaa\x15\x15\x8b\xee\x20\x92\xca\x58\
-\x9b\x02\x2c\x0e\x41\x44\x9b\x18\x7e\x1c\x86\x4f\xdd\x89\xea\x84\
-\x5f\xa6\xa4\xee\x59\xbb\x8a\x4d\x88\x34\xf4\x23\xf0\x87\xe3\xd7\
-\x36\xf0\xe8\x92\xc7\xb0\x0e\xbe\x4b\xd3\x36\xc3\x52\x3e\xb3\xb5\
-\x62\x1f\xf5\xc7\x99\x14\x7b\x5a\x04\x0c\xc9\x1e\xe4\xb6\xb0\x56\
-\xb7\x5b\x73\x6e\x86\x5c\xe8\x5f\xdb\x51\xc2\x5a\xcd\x2a\x50\x38\
-\xb7\x62\x5a\xa7\x7b\xeb\xdb\x64\x68\xe8\xe6\x3d\xa6\x66\x6b\x1b\
-\xfd\xce\xf6\x3b\x07\xb4\x6d\x64\x87\x4d\xf6\x94\x98\xe8\x32\x2b\
-\x74\xf7\x83\x49\x96\x1c\x52\x73\xd1\xe8\xac\x57\x0e\x83\xb1\x11\
-\xab\x8d\xa5\x39\x94\x8c\x65\xec\xf4\x8d\x51\x0b\x93\x5f\x4e\x10\
-\xec\x58\x8c\x25\xea\x17\x0f\x86\x17\x9f\x58\x5e\xdd\xe0\x6b\x29\
-\x74\x0b\x5a\xd5\x01\x46\xe8\xba\x32\x5e\x82\x4e\x37\xf1\x6a\x23\
-\x35\x0a\x57\xe9\xa2\xf6\x92\x76\x4f\x8b\xa0\x78\x06\x5e\xbb\x35\
-\x9a\x30\xc0\x85\xe2\x7f\x04\xe7\xcd\x25\x27\x3e\x72\xd9\x5c\xe5\
-\xc8\x10\x8e\xa2\xbb\x1f\x26\x6c\x19\xf0\xe0\xad\x1c\xe6\xd1\xb6\
-\x5a\x47\x4d\xa6\x7e\x41\xba\x5e\x4a\x8b\x7a\x20\x2a\x59\xf5\xae\
-\x25\xe9\x81\xa0\x4a\xaa\x4a\xbe\x20\xb1\xa3\x62\x95\x3e\x79\xfa\
-\xca\x65\xb4\xc3\x06\x85\xbf\xf3\xbe\x7e\xaf\xa9\xac\x6d\xd7\x7a\
-\xe5\xa8\xfa\xf1\xbf\x75\xde\x70\x0a\xe7\xc8\xb6\xad\x9b\x6b\xc2\
-\x0d\x7a\x49\x65\x95\x9d\x71\xdd\x15\x9d\x3f\xc1\xc9\xe9\xda\x66\
-\xb1\xe5\xe5\x8d\xb9\x50\x22\x43\xa3\x5d\x21\x61\x0f\xdc\x43\x23\
-\x67\x07\x4a\x5c\xb1\x82\x58\xd1\xf9\x63\xcd\xa2\xf3\xa2\x26\xdd\
-\x70\x19\x26\x6a\x55\x7b\xad\x7a\x2e\x3d\xd6\x42\xd2\xe2\x9e\x83\
-\x2d\x3b\x4e\x59\x4b\xbf\x5a\x8d\xb1\x90\x58\xee\x31\x44\xc9\xb9\
-\x23\xc5\x09\xd6\x3c\xb3\x32\x16\xc2\x56\x18\x46\x20\xab\x64\x71\
-\xaf\xac\xb3\x27\xbd\xce\x00\x41\x35\x81\x1d\x69\x56\x92\xce\x8d\
-\xdd\xfc\x0b\x8d\x28\xe7\x2d\x28\x4c\x8b\xa3\xf8\x97\xb3\x62\x66\
-\xa7\x7d\xfe\xb1\xb7\xc7\x7b\xdb\xe5\xd4\x32\x31\x65\x40\x75\x71\
-\xb4\x39\xc1\x1a\x18\xc3\x43\x4f\xc2\x4a\xb9\x61\x93\xf5\x48\x4d\
-\x63\xb0\x30\x93\x23\x70\xcf\x12\xb8\x6a\xdd\x73\x14\x3e\x61\xa7\
-\xe3\x8b\xc5\x2d\xa1\x32\x8d\x63\x87\x60\x3d\xbd\xcf\x07\x61\xcb\
-\x30\xac\x86\x7f\x0d\x3e\x18\x3e\x64\xe1\x54\xb3\x56\x68\xcd\xf9\
-\x25\x24\x9c\x85\x87\x0d\x05\x03\xc5\xb6\x44\x64\x39\x4f\xac\x7a\
-\x02\xc4\x01\x74\x19\xd7\x14\xff\x37\xd0\xa3\x2a\x77\x20\x20\xcf\
-\xa9\x8c\xe8\x58\x36\x26\x58\xfd\xef\x96\x89\xde\xe4\x83\xc8\x4c\
-\x29\x52\xa2\xb7\xaf\x31\x17\x96\x84\xdc\x56\xf8\xc5\x98\x8b\xe2\
-\x8e\xee\xcc\xbe\xb6\x44\x24\x83\x31\x05\xeb\x91\x4e\x63\xfb\xf0\
-\x38\xc2\xdf\x0c\x23\xc4\xe3\x92\xa2\xc6\x6b\x2b\xae\xd9\x08\xad\
-\xa5\xf1\x97\xa2\x6a\x7e\x51\x24\x2c\xd1\xf9\x48\xbf\x54\x3b\xcb\
-\xda\xda\x05\x85\xc0\x4c\xda\xcb\x44\x13\x5d\x75\x82\xe2\xc0\x77\
-\x01\x4c\xd4\x39\x73\xab\x6d\x3f\x06\xa9\xdd\x65\xee\x63\x63\xa9\
-\xcd\xdf\x52\xa7\xe6\xb2\x56\xe8\x32\x9f\x99\xcf\x23\x8b\x43\x6e\
-\x33\xe2\x23\xad\xb2\x51\xa1\x7b\x10\x52\xa1\x58\xeb\x9e\xab\xc0\
-\x21\xf5\xd7\xcc\xb9\xaa\xb8\xd7\x15\x13\x82\x7d\x8b\xc1\xd2\xf8\
-\xf3\x8b\x20\x87\x8e\x5a\x59\x54\x4d\x21\x50\xcc\x6e\xb5\x98\xf5\
-\x8a\xb1\xc0\x2c\x03\x22\xb4\xa7\xeb\xc7\x96\x92\x92\x38\x27\x72\
-\x6a\xc1\x29\xd3\x45\x66\xfd\x60\x25\x51\x5e\xce\xa0\x4e\x9c\x99\
-\x4f\x6a\xee\xa9\x9a\x11\x65\x29\x9e\xdd\x7e\x25\x6a\x49\xd3\x91\
-\x04\xd5\x1b\xd4\xf3\xbf\x57\xc9\x60\x2c\x59\x21\x98\x25\xe0\x15\
-\xfb\xb9\x2f\x62\x3c\x11\x86\x2a\xb1\xfa\x88\x3e\x9b\x02\xc4\x16\
-\x4b\x94\xff\xbe\x12\x55\x33\xd7\x9e\x26\x7c\x91\x7a\xe1\x5d\x67\
-\x76\x7b\x45\xe7\x2d\x78\x90\x7a\x52\x53\x6a\x63\x75\x79\x7d\x2e\
-\x14\x9e\xd4\xfb\x19\xf1\xc2\x8b\x31\xba\x98\x83\xf7\x09\x60\x54\
-\xbb\xd6\x4a\x35\x11\xe5\x0a\xed\xc0\xe1\x52\x1a\x32\x8b\xb2\xa9\
-\x55\x54\x23\x53\x66\xed\xfa\x74\x7e\xc7\xba\x6a\xe5\x76\xb5\xae\
-\xa9\x19\x85\xdf\x5a\x68\x58\x61\xf5\x43\x5b\x72\x6b\xaf\x2e\xe3\
-\x06\xe4\x73\xdb\x09\x76\x4f\x2a\xb4\xb9\xa2\x73\x92\x4d\xcc\x53\
-\xaf\xc1\xf4\xd8\xfd\x62\x0d\x42\x44\xf2\x45\x17\x64\xda\x55\x20\
-\x51\xd5\xcf\xb0\x47\x1f\x5d\x22\x64\x09\xe9\xbe\x0c\xe4\x01\x20\
-\x2a\xed\x21\x38\x7b\xd4\xe5\x86\x5d\x01\xd8\xd9\xbb\xb9\xdf\x33\
-\x51\x98\x3f\x16\x43\x3f\x30\x31\x73\xa4\x48\xa4\xca\x07\x1a\x07\
-\x5f\x9b\x54\x97\x82\x1e\x16\xfe\x9e\x34\x99\xc6\xb9\x19\xf6\xcc\
-\x81\x3d\x88\xdb\x53\x5b\xbc\x47\x5b\xa9\x38\x24\xec\x04\x02\x51\
-\xf4\xf8\xe2\xfe\x92\x7d\x40\x44\xc8\x2d\x43\x0e\x6f\xdc\xaa\x7a\
-\x5f\x8d\xaa\xad\x92\x4e\xe3\x38\xca\xc1\x58\x35\xee\xa8\xee\xa8\
-\x0d\x63\x35\xbd\xfe\x4c\x4a\x2a\x0c\x6f\x0f\x06\xc7\x0f\x76\x1d\
-\xfc\x19\xf6\x88\xcf\x7e\xb9\x66\x59\x5a\x35\x30\x5e\xc3\x97\x61\
-\x23\x1c\x7d\x96\x29\x78\x53\x4a\xcd\x44\x25\x95\x70\x1a\xfb\x19\
-\x3b\xb0\xf3\xe6\x27\xef\x0c\x9b\x15\x0f\x77\xe5\x45\x86\x7d\xeb\
-\xf5\x15\xd4\x92\x00\x3c\xbc\x22\x58\xb1\x86\xed\x9d\x83\xf9\x44\
-\x02\x41\xa3\x4d\xcd\xa2\xa3\x1b\xe0\x78\x87\x0e\x19\x85\x99\x44\
-\x48\x20\xed\x9f\xf0\x3d\x4b\xe3\xca\xa4\x1e\x32\x4a\x77\x36\x69\
-\x3f\xe0\x9b\xe7\x26\xaa\x08\x02\x53\x58\x88\xa1\x62\xcf\xb9\x06\
-\x06\x2a\x87\x5b\x08\x0c\x4e\x0e\x27\xae\x12\xd3\x6a\xda\x15\x51\
-\x6b\xfa\xab\x25\xcc\x43\x2b\xdb\x4d\xe8\x94\x20\x35\x51\xe8\x27\
-\x53\x4a\x89\xa3\x87\xa3\x29\xd8\x9d\x15\xf5\x5d\xab\xa4\x4a\xcb\
-\x61\x64\x0c\x90\xbc\x41\x8d\x5b\xd1\xf7\xcf\x61\x83\x3d\xa2\xc6\
-\xe7\xad\x7d\x4e\xba\xd7\x5f\xaa\x71\x2e\xc4\x2c\x12\xda\x82\xa1\
-\xc2\xda\xc3\xd7\x2e\x4b\x85\xa9\xd9\x20\x87\x74\x0d\x2b\xf4\x2d\
-\x92\x29\x1f\xc8\xc6\x4a\xf7\xcd\xbd\x9b\xd5\xf8\x0f\xc9\x62\xd5\
-\x08\x0f\x3a\xa5\x9a\x66\x4b\x2c\xa3\x3a\xb7\xce\x39\x1c\x5d\x7c\
-\x93\xc7\xef\x0f\x1f\x6d\xd7\xf4\xe6\x84\xef\xba\xd8\x10\x79\x1d\
-\xe7\x91\x83\x39\xba\x66\xae\xd7\xd5\x9f\xc9\x03\x31\x6f\x3c\xb0\
-\xde\xb2\xdd\x6d\x7d\x65\x6e\x76\x58\x47\x41\x22\x3f\x79\x4d\x85\
-\xf6\x9c\xbe\x67\x8e\x09\x6f\x33\x3c\x1e\x8b\x60\x34\x42\xfa\xf7\
-\x03\x8d\x85\x40\xa2\x33\xb8\x00\x6d\x89\xcf\x07\xd7\x5a\x01\x53\
-\xe0\x8c\x13\x05\x9f\xe9\xd8\x25\x93\xd9\x54\x20\x89\x5e\x00\x74\
-\x9d\x51\xce\x88\x68\x7e\x97\x13\x09\xa7\x30\x11\x2b\xe6\x5e\x6b\
-\x0d\xaf\xc8\xa8\x97\xbc\x76\x55\xe3\x82\xa7\x7c\xf3\xeb\x3d\x4a\
-\x84\xd1\x69\x09\x2b\x89\x1a\x42\x39\x19\xca\x3c\x04\xe6\x62\x47\
-\xde\xfe\x09\xcd\xa6\x34\x12\x12\x9d\x87\xbd\xa6\x1c\x3c\x1f\x43\
-\x08\x9a\x7d\xbe\xba\xc9\x66\x31\xd6\xe2\x92\xa8\xe3\x8d\xe6\xc2\
-\xf0\xd3\xa2\xa3\xf6\xd9\x49\x68\x20\xa3\x93\xdd\x32\xb3\x8c\xe6\
-\xe4\x0f\xa0\xdd\x72\xa1\xa1\x75\xa1\xa7\xdd\xf8\x2a\xf1\xd5\x20\
-\xfc\x64\x60\x0e\xad\x37\x18\xc8\xba\xa5\x7b\x1d\x2d\xe6\x97\xef\
-\x65\xcc\x18\x5e\x60\x01\xe8\x92\x3d\x0a\x49\x49\xf6\xba\x5e\xa4\
-\x84\xbf\x57\xfd\x71\xbc\x9e\x89\xb5\x74\xbf\x22\xbe\x8c\x3d\xb3\
-\xdf\x67\x0b\xbf\x8b\xfd\xe8\xf1\xf8\x25\x88\x27\x7e\x21\xa4\x98\
-\x89\x11\x56\xc3\x08\x7b\x70\x2f\x12\xd2\x33\xb6\x90\xea\xc3\x0b\
-\x28\x4b\xcc\xaa\x4f\x81\x85\x18\x63\x66\xa8\xae\xdf\x4d\xf7\x66\
-\x3a\xcd\x14\x0b\xc5\x3b\x30\x64\xca\xc8\x2c\xc3\xfb\x04\xa2\x79\
-\x47\x4d\xb1\x5c\x41\x5c\x17\xb8\x13\x8e\x28\x12\xb5\xb9\x45\x7d\
-\x4c\xde\xaa\x76\x93\xba\x96\x1d\x96\x48\x2a\x3c\x06\x9c\x4e\xa2\
-\x1d\x83\xbf\x89\x39\xb6\xd4\x30\xaa\xad\x51\x82\x7f\xa7\x26\x91\
-\x81\x90\x76\x82\x07\x89\x26\x4b\x64\x1c\xb2\x31\x5b\x08\xfb\x57\
-\x4d\xf7\xe1\xf8\x07\x24\x9e\x1f\x1a\xaf\x2a\x92\x97\xfb\xdd\x28\
-\x31\x4d\xd1\x9e\x5a\x34\xaa\x79\x75\x75\xc5\xb1\xd9\xde\xd7\xc3\
-\x9d\x6b\x91\x77\xaa\x50\x88\xa5\xc9\xee\x27\xc4\xdf\x2c\xbc\x75\
-\xc5\xa3\xb6\x5d\xb1\x5c\x92\x76\xc7\xf1\x1a\x99\x1f\xdd\xb0\x86\
-\x11\x96\x63\x58\x19\x15\x7d\x47\xd7\x64\x27\x35\x13\xec\xda\xe0\
-\x61\xa7\x44\x7d\x9f\xc0\xc4\x57\x41\xe9\x4f\xfc\x6a\xda\x05\x60\
-\x82\xf0\x3b\x95\x4d\x3f\x30\x16\x87\x10\x0d\x70\xcd\x52\xfe\xb1\
-\x58\x8c\x75\x1e\xcd\xa3\x67\x26\x4c\x85\xdc\xd4\xbe\x36\xc5\x4f\
-\xfa\xe4\x93\xf5\x4f\x6b\x98\xa7\xdc\xc0\x8c\xdc\x17\xef\x41\xc2\
-\x50\x56\x60\x83\x54\xf7\xf0\x74\x50\x83\xc1\x26\x08\x2d\xb2\x48\
-\x3c\xa6\xd9\xc0\x9e\xcc\xe6\x57\x43\x11\x57\xce\xc3\xc7\x21\x77\
-\x5a\xb6\x59\xd2\x8b\xff\xa8\xc8\x9d\x69\x0c\x64\xd4\x8f\xe9\x93\
-\xe0\x86\xaa\x73\xfd\xe3\x36\x3f\x3c\x61\xfe\xa0\x0d\xa6\x25\x79\
-\x6c\x42\x17\xf2\xc4\x55\xcc\xa9\x34\x35\xc3\xff\xd6\x38\xf8\x0a\
-\x1e\xa5\x7d\x3e\x40\x7b\x6b\xb9\x20\x17\x99\x96\xf0\xa3\xf6\xa8\
-\x39\x23\x9d\x34\xd2\x06\x6e\x04\xc1\x29\x39\x5b\xea\x46\x2d\xe9\
-\x6b\xea\xf4\xa3\xd2\x49\x83\x91\xe2\xf2\x90\x89\xd9\x4b\x09\x0a\
-\x8a\x49\xdf\x6a\x7f\xa0\x18\x0c\x40\x07\x47\x0b\xc9\x98\xa6\xad\
-\x3e\xea\x24\xda\x50\xae\xdf\x6e\xbc\x97\x86\xb6\x61\xc8\x9a\x15\
-\xd8\xbf\xb9\x98\xa0\xbf\x30\x35\x6b\x62\x5d\x77\x26\x6a\x74\x47\
-\x81\x35\xcc\x85\xc4\x92\x83\x92\x7f\x6d\x8e\x41\x32\xd6\xb4\x2e\
-\x4d\xb9\xb1\xf0\x40\x74\xf8\xe1\xbd\x78\xdc\xae\x1f\x8b\x84\x86\
-\x0a\x9c\xdc\xf9\xd3\x3f\x74\xaf\x19\x76\xe4\xf5\x8e\x26\xe8\x70\
-\xd0\x48\xe6\x79\x9b\x6a\x84\x63\xcb\x99\xc5\xfa\xb9\xbe\x69\xcd\
-\xc9\xf1\x42\xa9\x88\xbc\x19\x66\xb2\x14\x74\xa8\x75\xf3\x86\x3c\
-\x72\xd4\xec\x67\x64\xc3\xcc\xa6\x94\x44\xdc\x97\xd5\xad\x75\xcd\
-\x81\x7e\x05\xfe\x46\x7e\x0d\xf5\x42\xd8\xb6\x1a\x94\xea\xef\xb6\
-\x40\x2f\xaa\x2d\xbf\x04\x2b\x6d\xdd\xe7\xd6\xcf\x80\x22\xac\xd2\
-\xaf\xd5\x6c\x71\x27\x9c\xc7\x89\x6d\x19\xa7\xfe\xbd\xf0\xb0\x3d\
-\x47\xb4\x9a\x65\xb8\xb5\x9f\xff\xf5\x09\xf6\xc6\x4e\xd0\x3a\xc6\
-\x6e\x1b\x83\xd8\x7c\x70\x1e\x56\x7c\x05\xa4\xea\xa1\x8b\xeb\x19\
-\x60\xb8\x9e\x84\xd6\x87\x9a\x9a\xa9\x0b\x6c\x7f\x33\xe8\xd8\xd1\
-\xe1\xcb\xcc\xfe\xf3\xd1\xc7\x17\x6f\xe7\x19\xfa\x0f\x6d\x88\xba\
-\xe5\xbf\xe1\xce\xcb\x28\x68\x14\x34\x0a\x1a\x05\x8d\x82\x46\x41\
-\xa3\xa0\x51\xd0\x28\xf8\x17\x12\x44\x9e\xb9\x9a\x0c\x81\x98\x04\
-\x2d\x9c\x05\xf8\x6f\xb0\xf7\x2f\x2b\xa8\x37\x11\xd5\xff\xaa\x23\
-\xb7\x7e\x45\x5c\xb8\x0e\xfe\x3c\x7c\x5f\xdd\xde\x6f\x73\xff\x07\
-\xa3\xb2\xff\x60\
-\x00\x00\x07\x1d\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x06\xaf\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x03\xee\x00\x80\x00\x62\x41\x17\x60\x64\xec\x83\x3a\x8d\x11\x88\
-\x81\x34\x33\x90\x66\x46\xe7\x03\x31\x23\x48\x37\x98\xd6\x61\xf8\
-\xf1\xa7\x9a\x81\x9b\x85\x95\x81\x85\x29\x17\x28\xfa\x1c\x6e\xd8\
-\x7f\xa8\x17\x79\x99\x21\x6a\x41\x42\x67\xd2\x50\xec\x03\x08\x20\
-\xd2\x43\x00\x96\x64\x18\x19\xd8\x18\xbe\xfd\xce\x64\xfa\xf6\x7b\
-\x77\x60\xa0\x5a\x84\xb2\xa2\x40\x20\xc3\xaf\x7f\xd6\x0c\x7f\x81\
-\x0a\x40\xf8\x0f\x54\x21\x37\x33\xc4\x11\x38\x00\x40\x00\x91\xee\
-\x00\x90\x47\xfe\xfd\x57\x66\x78\xff\x73\xad\xb4\x34\xef\xb4\x85\
-\xb3\xbd\x24\xd6\xcd\xf1\x62\x10\x16\x60\x67\x60\xf8\x0d\xb4\xf9\
-\x1f\xd4\x01\x20\x75\xdc\x4c\x10\x1a\x0f\x00\x08\x20\x16\x12\x2d\
-\x67\x64\xf8\xf1\x37\x9a\xe1\xdf\xbf\xd6\xd8\x44\x5d\xb9\xba\x4a\
-\x0b\x06\x15\x05\x7e\x86\xbf\x7f\xff\x31\xfc\xfa\xf5\x17\x11\x3e\
-\xa0\x28\x02\x59\xce\x84\x14\x62\x38\x00\x40\x00\x11\xef\x00\x46\
-\x46\x1e\x86\x4f\x3f\x3b\x04\x44\xb9\xb2\x3a\x3a\xec\x18\xd3\x13\
-\x75\xc1\xa6\xff\xf9\xfd\x07\xd5\x0e\x50\x5a\xe1\x00\xf9\x9c\x11\
-\x62\x39\x81\x10\x00\x08\x20\x16\xe2\x82\x9c\x41\x8d\xe1\xdb\xb7\
-\x39\x86\xa6\x52\xb6\xd3\xa7\xbb\x31\x98\x1b\x4b\x00\x0d\xff\xcb\
-\xf0\xfa\xf3\x7f\x06\x1e\xb6\xff\x0c\xcc\xcc\x60\x5b\xfe\x01\x2d\
-\xff\xcb\xc0\x0e\x0d\x76\x22\x8b\x17\x80\x00\x62\x21\x68\xf9\xef\
-\xbf\x1e\x8c\x0c\x7f\xa7\xc7\x26\x1b\x2a\xf4\x74\xd8\x31\x88\x8a\
-\x70\x32\xfc\x06\xfa\x7a\xf9\x35\x46\x86\xc7\x9f\x98\x18\x8a\x4d\
-\x7f\x33\xfc\xff\xc7\xc8\xf0\xfd\xdb\x1f\x26\x86\xaf\xbf\x9d\x80\
-\xc1\xce\x01\xd4\xc7\x01\xcf\x3d\x8c\x50\x9a\x95\x89\x89\x81\x93\
-\xe5\x2c\x90\x75\x09\xd9\x0a\x80\x00\x62\x21\x60\x79\x2c\x50\xff\
-\xcc\xb6\x4e\x47\xce\xb2\x12\x53\x70\xe8\xbe\xf9\xfa\x87\x61\xfa\
-\x39\x66\x86\xfd\x0f\x19\x19\x2c\x25\x7e\x33\x30\xfe\xfb\xcb\xc0\
-\xc8\xcc\xc2\xa0\xa7\x29\xc2\xc4\xc9\xc8\x98\xc7\xca\xcd\x9c\x07\
-\x4f\x07\xcc\x10\x83\x98\x59\x19\x81\xb1\xf7\x9b\xe1\xe6\xf3\x2f\
-\xb7\x81\x02\x6a\xc8\xd6\x00\x04\x10\x0b\x4e\xcb\xff\xfe\x89\xe6\
-\xe0\x64\x9c\x3d\x61\xa2\x1b\x7b\x7a\xaa\x1e\x38\x84\xaf\xbf\xfe\
-\xcf\x30\xe5\x0c\x33\xc3\xa3\x8f\x8c\x0c\x5c\xc0\xd0\x66\xfc\xfb\
-\x97\x01\x54\x92\xff\x07\xd2\x0b\x7a\x1d\x80\x39\xef\x3f\x52\xd8\
-\x83\x24\x80\x99\x02\x98\x23\x38\xd9\x59\x18\x8e\x5c\x79\xc3\x10\
-\x9a\xbf\x4b\x1c\xdd\x2a\x80\x00\xc2\xee\x80\xff\xff\x5c\x59\x58\
-\x18\xa7\x4f\x9d\xe6\xc1\x9e\x94\xa0\x03\x36\xec\xf0\xc3\xff\x0c\
-\xb3\x2e\x30\x01\x7d\xc2\xc8\xc0\xc9\xfc\x87\xe1\xd3\x8f\x5f\xc0\
-\xa8\xf8\xcb\xf0\xe7\x2f\x13\x10\x03\x1d\x03\x0c\xaa\xff\x0c\x20\
-\x0b\xff\x01\x33\x09\x90\xfe\xf7\x0f\x68\x0c\x30\x91\x02\xf9\x8c\
-\x7f\x59\x18\xd8\x98\xff\x83\x62\xe3\x37\xba\x55\x00\x01\x84\xcd\
-\x01\xb2\xc0\xb0\x9f\x50\x57\xef\xc0\x0b\xb1\xfc\x1f\xc3\xd6\x5b\
-\x8c\x0c\x73\x2e\x30\x83\xa3\x93\x03\xe8\xf3\xdf\x3f\xff\x30\x30\
-\xfd\xfd\xc3\x70\xeb\xe5\x1f\x86\x92\xcd\x7f\x18\xfe\xfc\x01\x3a\
-\xe4\xd7\x1f\x60\xa0\x01\xd9\xbf\x7f\x83\x73\xc6\x5f\x20\xfe\xfc\
-\xe5\x17\x83\x8b\x16\x37\x43\x96\x87\x38\xd8\x61\xd8\xea\x3d\x80\
-\x00\xc2\xe2\x80\x5f\x99\xae\xae\x2a\x5a\xa5\x25\x66\x60\xde\xbe\
-\xfb\x0c\x0c\x73\x2e\x02\xe3\x11\x98\xb8\x99\x81\xf1\xfd\xf3\xd7\
-\x6f\x86\xbf\x40\xfc\x1f\x68\xd9\x47\x60\xbc\x3e\x7f\xfd\x0b\x6c\
-\xf1\x6f\x20\xfb\x0f\x54\xee\x37\x08\x03\xf9\xef\x3f\xfd\x60\x50\
-\x11\x61\x82\x67\x0a\x6c\x39\x12\x20\x80\xb0\x38\x80\x31\x30\x36\
-\x56\x87\x81\x83\x83\x99\xe1\xda\xab\xbf\x0c\xf3\x2e\x32\x83\x35\
-\x32\x01\xb3\xdd\xaf\x5f\x10\x4b\x60\xf8\x1f\xd0\xb7\x2c\xff\xff\
-\x00\x03\x09\x58\x16\x00\x31\x03\x94\xfd\x0f\x44\x33\xfc\x61\x60\
-\x05\xd2\x4c\xff\xff\x31\xfc\x05\x45\xc7\xff\xff\x58\x73\x26\x40\
-\x00\x61\x73\x00\x1b\x3b\x3b\x38\xf9\x32\x7c\xfd\xf5\x9f\xe1\x3b\
-\xc8\x5c\x60\x70\xff\x06\x05\xef\xaf\x5f\x48\x0e\x80\x06\xf7\x2f\
-\x48\x90\x83\xd9\x40\x5f\xff\xfe\x8d\x70\x20\x28\x24\x40\xa1\x03\
-\x0f\x7b\x2c\x41\x00\x10\x40\x58\xea\x82\x7f\x3b\xd6\xad\xbb\x09\
-\x2e\x5e\x4d\xa5\xff\x33\x84\xa9\xfe\x62\xf8\xfc\xed\x0f\xc3\xaf\
-\x9f\xbf\xa0\x16\x21\xf0\x6f\xa0\x23\xbe\x7f\xff\x0d\xc4\xbf\xa0\
-\xf8\x37\x12\xff\x37\xb0\xec\xfa\x05\xd4\xf7\x1b\x9e\x20\xb1\x05\
-\x01\x40\x00\x61\x71\x00\xeb\xb4\x95\x2b\xaf\x3d\x99\x33\xf7\x0a\
-\xd0\xc5\xac\x0c\xc1\xea\x7f\x19\x42\xd4\x80\xf1\xfd\xf5\x37\xc3\
-\x8f\x1f\xbf\xc1\x89\x0b\xe4\xfb\xdf\xc0\xd0\x00\xba\x82\x81\x87\
-\xf5\x2f\x10\xff\x03\xe2\xff\x0c\xbc\x6c\xff\x18\x78\x81\x6c\x5e\
-\xb6\xff\x60\xcc\xcf\xc1\xc0\xc0\x0e\xac\x86\x81\xf6\xe3\x04\x00\
-\x01\x84\x2d\x0a\xae\x02\x63\xbc\xaa\xb4\x74\xff\x02\x39\x39\x3e\
-\x26\x4f\x0f\x05\x86\x38\x83\xaf\xc0\xa2\x8d\x89\x61\xce\xb1\xdf\
-\x0c\x3f\x81\x21\xc1\x0a\x4c\x0f\x5f\xbe\xfe\x62\xd0\x97\x62\x66\
-\xa8\xf2\x12\x03\xe6\x02\x60\xd6\x03\xc5\x31\xd0\x97\xa0\x90\x83\
-\x64\xc5\x7f\x60\x36\xc8\x01\xdf\x7e\xfc\x01\xa7\x01\x46\x2c\x51\
-\x00\x10\x40\x38\x0a\x22\xe6\xc5\x9f\x3f\xfd\x94\x8a\x8f\xdf\xd2\
-\x31\x7f\x81\x37\x83\xb7\xa7\x3c\x43\xb4\xc1\x3f\x06\x01\x56\x76\
-\x86\xde\x3d\xdf\x19\xde\x7e\xfc\x09\x4c\xed\x7f\x18\x98\xff\x33\
-\x32\x48\xf2\x33\x03\xeb\x02\x36\x60\xa2\x65\x05\xa7\x75\xb0\x43\
-\xa0\x8e\x01\xc5\xfd\x2f\x90\x23\x58\x99\x19\xd8\xdf\xff\x06\x49\
-\x33\xa3\x5b\x05\x10\x40\xb8\x8b\x62\x26\xd6\xce\xd7\xaf\xbe\xb3\
-\x46\x47\x6d\x6a\x9c\x3e\xcb\x9d\x29\x32\x54\x95\xc1\x1b\x58\x01\
-\x8a\x72\xf1\x31\xb4\x6d\x79\xc3\x70\xfc\xe6\x77\x86\x9f\x12\xc0\
-\x44\xfa\xeb\x1f\x03\x37\x0f\x1b\x43\x55\xdf\x79\x86\x3b\x0f\x3e\
-\x32\xb0\x70\x00\x8d\x64\x04\x3a\x80\x11\xda\x82\x02\x52\xac\x6c\
-\x4c\x0c\xaf\x3e\xfc\x60\xf8\xfc\xfb\xdf\x77\x74\x6b\x00\x02\x88\
-\x05\x67\xab\x07\x14\x5c\xac\x2c\x2d\x1f\x3f\xfc\x7e\x91\x9c\xb0\
-\xbd\xf7\xfa\xf5\xb7\x7c\x65\x25\x86\x0c\x16\xaa\xdc\x0c\x7d\x61\
-\xff\x19\xba\x36\xff\x63\x78\x03\x0a\x09\x70\xa9\xf7\x9f\x61\xcb\
-\x9e\x87\xff\x6e\x9f\x7f\xb9\x0c\x98\x18\xce\x03\xf5\xb2\xa3\x54\
-\x46\x20\x5b\x58\x98\x59\x81\xcd\xb6\x53\xe8\x56\x01\x04\x10\x0b\
-\xc1\xe6\x17\x07\xcb\x9c\xef\x7f\xfe\xdf\x6d\xae\x3f\x32\xe7\xfc\
-\xf9\x97\x4a\x13\xfa\xed\x18\x54\x65\x79\x18\x1a\x02\x19\x18\x6e\
-\x3c\xfb\xce\xf0\xeb\x37\x24\x85\x73\x71\x03\x53\x1f\x37\xeb\x6a\
-\x06\x2e\x96\x4d\xe0\x5a\x0b\xdd\x01\x4c\xd8\x1b\x06\x00\x01\xc4\
-\x44\x54\x1b\x90\x85\x71\x3f\x03\x0f\x87\xe3\x96\x0d\x77\xb6\xb8\
-\x79\x6d\x64\xd8\x71\xe8\x25\x83\xa4\x14\x1f\x83\xbe\x02\x37\xb8\
-\x22\xfa\xf7\xff\x1f\xc4\xac\xff\x40\xab\x7e\xe3\xce\xf3\xd8\x00\
-\x40\x00\x31\x91\xd0\x1c\x7b\xc4\xc0\xcf\x1e\x7a\xef\xce\x87\xba\
-\xa0\xf0\x2d\x5f\x1b\x3a\xcf\x32\xfc\xfa\xcf\xcc\x20\x24\xc8\x09\
-\x8e\x06\x14\x07\xff\xfc\x4f\x54\x6b\x08\x04\x00\x02\x88\x78\x07\
-\x40\x6a\xda\x1f\xc0\x38\x6e\xfe\xf9\x8f\xc1\xa3\xb5\xe9\xe4\x05\
-\xff\xe8\x1d\x0c\x57\x6e\x7d\x66\x10\x17\xe1\x06\xd7\x15\x70\x2b\
-\x41\x0e\xfa\xfe\x0f\x54\x8f\x11\x6c\x1d\x01\x04\x10\x79\x1d\x13\
-\x16\xa6\x23\x0c\xfc\x6c\x4e\xe7\xce\xbc\xec\xf3\x0a\xdb\xfa\xa3\
-\xa8\xf9\x24\x30\xaf\x03\xeb\x65\x66\x46\x16\x48\xc5\xc1\x00\x29\
-\x7e\xbf\xfd\x23\x18\x12\x00\x01\xc4\x88\xde\x37\x24\xaa\x63\x02\
-\x63\x83\x3a\x1b\xff\xff\x3b\x33\xfc\xfe\x57\xc3\xc8\xc3\xc2\xf4\
-\x9f\x89\x31\x19\x28\x7a\x07\xa3\x63\x02\x6a\x21\xb3\x40\xf4\xa1\
-\x77\x4c\x00\x02\x88\x71\xa0\x3b\xa7\x00\x01\x34\xe0\x7d\x43\x80\
-\x00\x1a\x70\x07\x00\x04\x18\x00\x16\x94\xf6\xf0\x5b\x47\x37\xa4\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0b\x54\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd6\x00\x00\
-\x0d\xd6\x01\x90\x6f\x79\x9c\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x09\xb4\
-\x49\x44\x41\x54\x68\xde\xd5\x5a\x5b\x6c\x9c\x47\x15\xfe\xce\xfc\
-\x97\xbd\xfc\xeb\xbd\x38\x17\x93\xd8\x8d\xed\x26\x0d\xb9\xbb\x8d\
-\x1f\x0a\x0f\x8d\xfa\x00\xe5\x22\x52\x10\x02\x81\x1a\x55\x11\x08\
-\x15\x15\xc1\x2b\xb4\x4f\x81\x27\xc4\x03\x52\x24\x10\x52\x05\x85\
-\x88\x46\x55\x69\xda\x50\x1a\xa9\x34\x79\x29\xa2\xaa\x54\x52\x92\
-\x26\x69\x92\x52\x25\x6d\x5c\xdb\x71\xec\xb5\xbd\xeb\xf5\xae\xf7\
-\xf2\xff\x33\xe7\xf0\xb0\xeb\xf5\xae\xe3\xdb\xda\x0e\x12\x47\xfa\
-\xb5\xff\xcc\x3f\x97\xf3\xcd\x77\x66\xce\xcc\x99\x25\x11\xc1\xff\
-\xb3\xd8\xad\x14\x3e\xf1\xda\x6b\x49\xd1\xf4\x1d\x81\x44\xd6\xda\
-\x31\x09\x9d\xfb\xde\xb7\xbf\x7e\x7d\xed\xed\xac\x90\x81\x3f\x9c\
-\x3a\xd3\xbb\xbd\x73\xd3\x87\x7b\xb6\xf7\x86\x62\xb1\x18\xaa\xd5\
-\xee\xae\x4b\x44\x8d\x09\xcc\xa6\x0c\x33\x0a\x85\x22\x32\xd9\x0c\
-\x06\x47\x46\x30\x3e\x99\xc9\x5a\x81\xd7\x73\xe4\xc8\x57\xa6\xd7\
-\x02\x60\xc5\x0c\xdc\xbe\x7e\xf1\xd3\x4d\x89\x43\xc5\x58\xac\x2d\
-\xe4\x38\x36\x1c\xc7\x69\xbd\x33\xdb\x06\x0b\xa3\x54\xa9\xa0\xcd\
-\xf3\x52\x37\x06\x86\x5e\x05\xf0\xc5\xb5\x00\x50\x2b\x2d\x78\xec\
-\xd8\x31\xce\xe4\xf3\xa7\x82\xc0\x47\xbe\x30\xb3\xaa\xce\x42\xae\
-\x0b\xcf\x8b\xa2\x3d\x99\x84\x65\xd9\x38\xb8\xf7\xb3\x5f\xf8\xfd\
-\x8b\x2f\xff\xe4\x7f\x02\x00\x00\x44\xf8\xd5\xd1\xf1\x09\x28\x45\
-\xf0\x7d\xbf\xe5\xce\x88\x08\x91\x70\x18\x5e\x34\x0a\xdb\xb2\xb0\
-\x73\xc7\x0e\x24\xbd\xf0\xf1\x13\xa7\xfe\xb6\x7f\xb5\x00\x5a\x9a\
-\xc4\x3a\x93\x7e\x6b\x60\x78\xa4\xb8\xad\x73\x6b\xb4\xe2\xfb\xb0\
-\x2c\x0b\x27\x4f\x9e\x6c\xb9\x53\x6d\x0c\x76\xef\xdb\x8f\x50\x28\
-\x84\x47\x3e\xf7\xb0\x7a\xed\xcd\x73\x67\x5f\x78\xe1\xdc\x03\x4f\
-\x3e\xf9\x58\xeb\xd4\x8a\x48\x4b\xcf\x4b\xaf\xff\xfd\x46\xb1\x58\
-\x94\xec\xd4\x94\x30\xf3\xaa\x9e\xc9\x6c\x56\x2e\x5c\xba\x22\x22\
-\x22\xbe\xef\xcb\xbb\xe7\xcf\xcb\xf3\x7f\x39\x7d\xb2\x55\x5d\x44\
-\xa4\x35\x06\x6a\x90\xcb\x20\x82\x70\x75\x05\x3a\x73\xe6\x0c\x32\
-\x99\x4c\x4b\x2d\x54\x02\x83\xbe\x87\x1e\xac\x9a\x80\x6d\x63\xcf\
-\xae\x5d\xb8\xfa\xd1\xcd\x23\xcf\xbd\xf8\xca\xe9\x1f\x3e\xf1\xad\
-\xd3\xf7\x94\x81\x17\x4e\x9f\x39\x5f\x2a\x95\x65\x72\x32\xb3\x6a\
-\x06\x6e\x0d\x0e\xcb\xfb\x57\x3e\x90\x59\xd1\x5a\xcb\x8d\x9b\x37\
-\xe5\xf8\xf3\x27\x06\x7e\xfe\xf2\xcb\xee\x3d\x65\x80\x45\x0a\x00\
-\x60\x59\x56\xeb\xe4\xd5\xa4\x58\x2a\xe1\xdd\x4b\x57\x31\x34\x9a\
-\x46\x67\xc7\x66\xdc\xd7\xb9\x15\xf7\x75\x75\x61\x53\x3c\xd6\x1d\
-\x4c\xe5\x7f\x04\xe0\xf8\x4a\xdb\x5a\xd2\x91\x0d\xff\x99\x8e\x31\
-\x59\xfb\x60\xe0\x31\xd8\x13\x03\xef\x62\xe2\xb7\xbb\x0f\x3f\xfe\
-\x83\xa8\xef\x07\xf0\xbc\xe8\xaa\x00\x30\x33\x86\x47\xc7\x70\x6b\
-\x70\x08\x1f\x7d\x7c\x0b\xc3\x23\xa3\xb0\x2c\x85\x9d\x3d\xdd\x18\
-\xbc\x7d\xbb\x08\x87\xba\x9e\x79\xfa\xe9\xec\x4a\xda\x5a\x94\x81\
-\xeb\xa7\xc8\x8d\xc1\x7a\x36\xd9\xde\x19\x6a\xcc\x0f\xbb\xdb\x01\
-\x10\x94\x65\x61\x7c\x7c\x1c\x6f\xbc\xf1\xc6\xaa\x99\x00\x00\x57\
-\x04\x5f\x3e\xf4\x79\x7c\xfc\xe9\x30\xce\x5f\xba\x82\xa8\x6b\x47\
-\x43\xb1\xf8\x4f\x01\x3c\xbb\x26\x00\xd1\x02\x1e\x82\xe5\x84\x02\
-\xcd\xd5\x0c\x01\x2a\xd2\x86\xe4\xe6\x8d\x00\x00\x45\x84\x4d\x9b\
-\x36\xe1\xe8\xd1\xa3\x6b\x02\x00\x00\xe5\x4a\x05\xdd\xdb\xb6\x61\
-\xd7\x03\xf7\xe3\xd2\xfb\x97\x31\x34\x91\xe9\x5b\x69\xdd\x45\x01\
-\x68\x8d\x7e\xdb\xb2\x11\x04\x73\x26\x36\x85\x0e\xb4\x27\x12\xd5\
-\x8a\xb6\x85\x0b\x17\x2e\xe0\xea\xd5\xab\x6b\x06\xf0\xc4\x91\x23\
-\xf0\xa2\x55\x0f\xdd\xde\x9e\xc2\xf0\xc0\x7b\x8f\xfe\xf5\x67\xf6\
-\x59\xd6\xe6\xb6\x36\x18\x13\x20\xcd\x8c\x34\x31\xd2\x44\xb8\xf6\
-\xdd\xdf\xc8\xc8\xb2\x00\x98\xb1\xd1\x30\x21\xd0\x82\xd9\x4d\xdb\
-\xa4\x6c\xc1\xce\x64\x02\x80\x40\x29\x0b\xfd\xfd\xfd\xe8\xef\xef\
-\x5f\x33\x00\x00\x88\x46\xc2\xa8\x78\x1e\xc2\xae\x8b\x89\xcc\x54\
-\xa4\xe7\xc0\x86\xc7\x12\x31\x05\x13\x30\x8c\x11\x04\x01\x63\x34\
-\x5d\xc2\x9d\xd1\xe2\xaf\x00\x3c\xb3\x3c\x03\x06\x71\x18\xa0\x6e\
-\x42\x00\x46\x4c\x2f\x1e\x4e\x26\x6a\x00\x79\x55\x5e\x78\xbe\xec\
-\xdb\xb7\x0f\xfd\xfd\xfd\x70\x6b\xfb\xa4\x40\x07\xa0\x20\x87\x20\
-\x10\xe8\x40\x50\x9d\x6f\x84\x90\xa5\xe0\x86\x2c\xb0\x41\xac\xb1\
-\xfe\xe2\x0c\x18\x24\xb4\x01\x44\x0b\x20\x80\xc0\x82\x49\x1c\x84\
-\x6d\xdb\x10\x11\x28\xa5\xd6\xc5\xfe\x1b\x25\x1c\x0a\x21\x3f\x9d\
-\x83\xcd\x53\x08\xb4\xd4\xd8\x07\x66\x2d\x40\x18\x30\x06\xde\x8a\
-\x00\x68\x83\xb8\xa5\x05\x42\x0c\x01\x90\x95\x6d\xd8\xd1\xbb\x63\
-\x5d\x15\x9e\x2f\xb6\x6d\x63\x60\x78\x18\x11\xe4\xa1\x35\x43\xeb\
-\x86\x13\x87\x00\x86\x01\xcd\x2b\x64\xc0\x30\x12\x6c\x00\x45\x02\
-\x41\xd5\x7c\x1e\xed\xda\x0a\x80\x40\x04\x9c\x3d\x7b\x16\xa3\xa3\
-\xa3\x6b\x52\xb8\xbd\xbd\x1d\x87\x0f\x1f\xae\xa7\x0b\x85\x02\x86\
-\x86\xef\x60\x87\x33\x09\x5f\x0b\xfc\xa0\xd9\x47\x31\x03\xa6\x05\
-\x00\x71\x18\x80\x84\x41\x2c\xc8\x07\x36\xec\xf4\x3b\x98\x18\x98\
-\x80\x9f\x4f\x63\x67\x30\x8e\x6e\x27\x8d\x4a\x21\x8d\xf2\x74\x1a\
-\x95\xfc\x38\xb4\x31\x50\x6e\x0c\xca\x89\x81\xdc\x18\xc8\xf1\x60\
-\x85\x62\x50\x6e\x0c\x96\xeb\xc1\x72\x63\x50\xae\x87\x50\x5b\x07\
-\x92\x9d\x7b\x90\xec\xdc\xdb\xd4\x67\x7a\x7c\x1c\x53\xb9\x0c\x62\
-\xc9\x3c\x74\xa0\xa0\x35\x37\x9d\xf9\x8c\x08\xcc\x52\x73\xe0\xdf\
-\xc7\xe9\x7e\x36\x78\x4c\x18\x5f\x62\xc1\xc1\xc8\x74\x09\x0a\x01\
-\x9c\xc4\x66\x1c\x4a\xbe\x8f\xdc\xc5\x1b\xb0\x23\x31\xd8\xd1\x18\
-\xda\x62\x31\xa4\x36\x84\x21\xd2\x05\xe1\x4e\x88\x30\x58\x04\x10\
-\x81\x98\xea\xbb\x08\x43\x58\xc0\x5c\x82\x36\x79\x14\x73\xd3\x98\
-\x4e\xe7\x30\x36\x95\xc3\xd5\x4c\x0e\xb9\xa9\x1c\x94\x9b\x42\xb2\
-\x73\x2f\x52\x9d\x7b\x30\x59\x72\xe1\x95\xae\xc2\xb4\x31\x44\x08\
-\x81\x6e\x1e\x54\x36\x4b\x30\xf0\xde\xaf\xe9\x9b\xcc\x78\x45\xb9\
-\x1e\x45\xe3\x1d\x88\x26\x3e\x03\x2f\xde\x01\xd7\x4b\x01\xd4\x58\
-\xa5\x29\x01\x02\x40\xb5\x6d\xd1\x52\xbb\x23\x02\x90\xda\xb8\x01\
-\x9d\xf3\xf2\x4b\xc5\x32\xa6\x33\x39\x4c\x4d\x5d\xc6\xc4\xf0\x10\
-\xf6\xaa\x41\x14\x27\x80\x6c\x38\x8c\x90\xe3\xd4\x7b\x93\x59\x13\
-\x5a\x8c\x01\x63\xf0\x35\x6f\x63\x0f\x6d\xdd\xf9\xc8\x3c\xd4\xc1\
-\x42\x7a\x2f\x0a\xa8\x55\x71\x43\x16\x36\x6e\x69\xc7\xc6\x2d\xed\
-\xd8\xb1\xbb\x17\x95\xb2\x8f\x9b\x1f\x0e\xe0\x5f\xef\x5c\x86\x45\
-\x3e\xda\xdb\x9d\x3a\x00\x23\x4b\x30\x60\x18\x0f\x7a\xc9\xce\x39\
-\x85\x97\x13\x5a\x36\x63\x55\xe2\x38\x84\xdd\x07\x7a\x31\x34\x78\
-\x07\x33\xf9\x51\xc4\xb5\xcc\x2e\xa2\x60\x61\xf0\x62\xcb\xa8\x31\
-\xe8\x76\x22\x71\x98\x05\x00\xac\x58\x35\x6a\xb9\xc6\xa2\xe2\x79\
-\x21\x64\xd3\x06\x81\x99\x73\xa4\xb5\x39\xb0\x08\x00\x86\x11\xd6\
-\x60\xe3\xb7\xac\xc0\xf2\xd6\xd5\x3a\x20\x2f\x16\x42\xa9\xc2\xd0\
-\x7a\x6e\x1d\x62\x16\x18\x03\xf5\x8b\xc7\x29\x7a\xec\x75\x29\xce\
-\x07\xa0\x99\xf5\x3c\x13\x5a\x1f\xb3\xa8\xb7\x46\x2b\x6f\x2f\x1a\
-\x75\xe0\x57\x04\xda\xcc\x01\x10\x53\x73\x6c\x36\x62\x00\xe6\x01\
-\x30\x08\x98\xcd\x12\x73\x60\x7d\xc1\xd4\xdb\x5b\xa4\xd9\x48\xc4\
-\x86\xd6\x82\xc0\x17\xd0\xfc\xe0\x8f\x8f\x18\x80\xf4\x7c\x00\x5a\
-\x8c\x06\xb7\x6e\xf0\xf7\x04\x50\x24\x5a\x55\xad\x54\x66\xb8\xee\
-\x5d\x7d\xd5\x8f\x82\x8d\x26\xe4\x57\xca\x45\x84\xc2\x91\x05\xf5\
-\x5b\x5c\xdd\x7b\x03\xc4\x75\x08\x44\x84\x4a\x85\xa1\x2c\x85\xc6\
-\x38\xac\x65\xa1\x6e\x26\x8d\x0c\x7c\x52\x9e\x99\xd9\xe5\x38\xf6\
-\x72\x6d\x2f\xf1\x79\x7d\xc1\x44\x3d\x07\x15\x5f\xc3\x71\xab\xe9\
-\x5a\x24\x07\x26\x40\x3d\x00\xd6\xc8\xc0\x95\xe2\xcc\xcc\x57\xbd\
-\xb6\x16\x0e\xea\xcb\xea\x4b\xab\xab\x56\x93\x78\x5b\x08\xd9\x6c\
-\x00\x6d\xaa\xbe\xa0\x1e\x7f\xe0\xea\x04\x6e\x02\xc0\x8c\x0f\xca\
-\xc5\x12\xc4\xf8\xab\x59\xf8\x5b\x92\x05\x82\xf2\x0b\x96\x4b\xa5\
-\xc2\x48\x8f\xe7\xa1\x6b\xce\x4c\x66\x5d\x42\x65\x21\x00\x06\x57\
-\x4a\xc5\x32\x84\x97\x0b\xda\xae\xd1\x4c\x5a\xf0\x0d\xa9\x94\x0d\
-\x36\x40\x60\xe6\x0e\x34\x00\xf8\xd8\x5b\x52\xbe\x0b\x40\xae\x8c\
-\x8f\x60\xf9\x81\x18\x7f\x5e\xe0\x7f\xc5\xb3\x79\xdd\x81\xa7\xe2\
-\x16\x44\x50\x3d\x5a\x52\xdd\x84\x8a\x8d\x65\xea\x00\x9e\x7a\x4e\
-\x82\x13\x4f\xd3\xf5\xe2\x4c\xb1\x2f\x12\xb1\xd7\xa2\xe9\xea\x14\
-\x5f\xa0\x58\x38\x0c\x84\x42\x0a\x22\x0c\x22\xcc\xda\x5e\x53\x04\
-\xbb\x69\xc9\x31\x06\x6f\x4f\x4c\x14\xfb\xba\xb6\xb6\x78\x05\x76\
-\x8f\x36\x76\x00\x21\x95\xb4\x31\x91\xf5\x61\xa9\x2a\x03\x02\x14\
-\x89\x88\xa4\x16\x52\x6c\x06\xa0\xf1\xa7\xf1\x74\xe5\xc7\x9d\x1d\
-\x56\x8b\x3a\xdc\x3b\xb6\x52\x09\x42\x7a\xb2\x76\xd6\x20\x40\x84\
-\xfc\xfd\xfb\xf7\x25\xfb\xfa\xfa\x7c\x63\x4c\xd0\x04\xe0\xa9\x3f\
-\xca\xc5\xdf\x1d\xa5\xcb\x23\x63\x95\xbe\x54\x52\x61\xd9\x65\xb0\
-\x55\xeb\x58\x21\x53\x8d\xb9\xb1\xa8\x80\x35\x80\x50\x95\x01\x16\
-\xf2\x89\x68\x73\xb9\x5c\x2e\x38\x8e\x93\xbb\xcb\x6b\x55\x58\xfd\
-\x72\x70\x58\xbf\x14\x0e\xa9\x65\x14\xa4\x75\x06\xb3\x70\xc9\x48\
-\x18\x55\xf3\xe1\xea\x53\x34\x4e\xd6\x18\xd3\x63\x59\xd6\x6d\xa5\
-\x54\xb1\x09\x00\x11\x59\xbd\xbd\xbd\xff\xf8\xfe\xc1\xe1\x7f\x7a\
-\x77\x82\x43\x1b\x36\xac\x4c\xa9\xd5\x48\x2b\xc0\x3b\x36\x03\xa3\
-\xe3\xd5\xb2\xd9\x4a\xb4\x4c\x44\x9d\x8e\xe3\x8c\x17\x8b\x45\xd3\
-\xb4\xcf\x3b\x70\xe0\x40\x38\x1e\x8f\x77\xbf\x39\xd0\xf3\xd6\xad\
-\x11\x6b\xa6\x50\xb8\x77\x00\x66\x03\x96\xb5\x38\xc0\x92\xcf\xd6\
-\x2d\x40\x34\x5c\xdd\x4e\xa7\x4b\x9e\x0b\x60\xbb\x31\x66\x93\xd6\
-\xda\x6f\x62\x20\x93\xc9\x70\x32\x99\xcc\x4f\x69\x37\x77\x6e\xa0\
-\xe7\xe4\x4c\x65\xe8\x1b\x89\x90\xdf\xa1\x6a\x30\x45\x00\xa2\x6a\
-\xc7\x44\xcd\xa3\x48\xd2\x30\x9a\x8d\xe9\x45\xbe\x11\x01\x32\xef\
-\xdb\xec\x52\xd9\xf8\x6d\xb6\x3f\xdb\x06\xf2\x15\x77\x6c\x78\x26\
-\xf1\x36\x11\x7d\xe0\xfb\xfe\x8d\x81\x81\x01\xae\x5f\x70\x10\x11\
-\xed\xdd\xbb\xd7\x53\x4a\x75\x31\x73\xb7\x52\x6a\xa3\x31\xa6\xad\
-\x3d\x5c\xee\xb0\x2d\x71\x15\xc8\x66\x16\x9b\x88\x88\x14\x94\xb0\
-\x28\x10\x55\x71\x48\x55\x05\x52\x42\x22\xa2\x2c\x52\x24\x22\x8a\
-\x21\x6a\x76\x26\xd5\x40\x13\x11\x18\x00\x14\x20\x22\x22\x04\xc8\
-\xdc\x85\xbe\x40\x11\xb1\x54\xc7\x9e\x2d\x82\x11\x11\x86\x88\x51\
-\x4a\x38\x53\xf6\x6e\x4d\xf9\xee\x4d\x66\xfe\x24\x97\xcb\xdd\x1e\
-\x19\x19\x29\x35\x32\x40\xe1\x70\x98\x0b\x85\xc2\xb4\xe3\x38\x83\
-\x22\x32\x49\x44\xe1\x89\xa2\xfb\x1f\xa5\x94\xa5\x94\xb2\x98\xd9\
-\x52\x4a\x29\x54\x6f\x76\xea\x63\x6a\x59\x16\x6a\x69\x12\x11\x25\
-\x22\x64\x59\x16\x31\xf3\xec\x52\x26\x44\x24\xb5\x81\x12\x63\xcc\
-\x6c\xba\xfe\xcb\xcc\xf5\x34\x33\x1b\x22\x62\x66\x36\x4a\x29\x63\
-\x8c\x61\xc7\x71\x7c\xad\x75\xde\x98\x20\x5b\x28\x14\xb2\x23\x23\
-\x23\x65\x11\x91\xa6\x2b\xa6\xea\x80\x42\xf5\xf7\xf7\xab\x5c\x2e\
-\xa7\xca\xe5\xb2\x62\x66\xda\xb2\x65\x0b\x00\x20\x08\x02\x02\x00\
-\x63\x4c\xd3\xd4\xd3\x5a\xd7\xd3\xc6\x18\x62\xae\x1e\x8b\xe2\xf1\
-\x78\x3d\x7f\x7a\x7a\x5a\x00\x40\x29\x55\xef\xd0\xb2\xac\xfa\xbb\
-\x6d\xdb\x4d\xf9\x8e\xe3\x08\x00\x8c\x8d\x8d\x89\x6d\xdb\xe2\x79\
-\x1e\x5f\xbb\x76\xcd\x00\x60\x69\x50\xfa\xae\x3b\x32\x9a\x3b\xb8\
-\x36\x2a\xb9\x1a\x4f\xd5\x58\x67\xb5\xff\xe9\x69\xac\x27\xb2\xc0\
-\x85\xde\x7f\x01\x8b\xbf\xd2\xaa\x53\x46\x78\x75\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\
-\x32\x30\x31\x30\x2d\x30\x35\x2d\x32\x34\x54\x30\x37\x3a\x33\x38\
-\x3a\x31\x35\x2d\x30\x36\x3a\x30\x30\xde\x18\xbd\x60\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\
-\x00\x32\x30\x31\x30\x2d\x30\x35\x2d\x32\x34\x54\x30\x37\x3a\x33\
-\x38\x3a\x31\x35\x2d\x30\x36\x3a\x30\x30\xaf\x45\x05\xdc\x00\x00\
-\x00\x36\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\
-\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\
-\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\
-\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\x61\xec\xaf\x51\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\
-\x67\x9b\xee\x3c\x1a\x00\x00\x00\x16\x74\x45\x58\x74\x53\x6f\x75\
-\x72\x63\x65\x00\x65\x63\x68\x6f\x2d\x69\x63\x6f\x6e\x2d\x74\x68\
-\x65\x6d\x65\xa9\x4c\xb7\x53\x00\x00\x00\x34\x74\x45\x58\x74\x53\
-\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x73\x3a\
-\x2f\x2f\x66\x65\x64\x6f\x72\x61\x68\x6f\x73\x74\x65\x64\x2e\x6f\
-\x72\x67\x2f\x65\x63\x68\x6f\x2d\x69\x63\x6f\x6e\x2d\x74\x68\x65\
-\x6d\x65\x2f\x88\x32\x2e\x43\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x05\x5d\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x04\xef\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\x62\x18\x60\x00\x10\x40\
-\x03\xee\x00\x80\x00\x1a\x70\x07\x00\x04\xd0\x80\x3b\x00\x20\x80\
-\x06\xdc\x01\x00\x01\x34\xe0\x0e\x00\x08\xa0\x01\x77\x00\x40\x00\
-\x0d\xb8\x03\x00\x02\x88\x05\x44\x84\x31\x32\x32\xfc\x03\xd2\x7f\
-\x81\xf8\x17\x03\x03\xc7\x4f\x06\x06\x3d\x20\xdb\x99\x87\x95\xd7\
-\x8b\x47\x80\x5f\xe9\xd3\xdb\x0f\xd7\x7e\xfc\xfb\x72\x0a\xa8\xe6\
-\x0c\x50\xc3\x15\x36\x06\x86\x07\xec\x0c\x0c\xbf\xf9\x80\xea\x19\
-\xc9\xb0\xf4\x10\x10\xdf\x03\x62\x50\x21\x08\x10\x40\x2c\x50\x31\
-\xee\x1f\x0c\x0c\xfe\xac\x0c\x6c\xce\x52\x72\x92\xe6\xca\xba\x32\
-\x2a\x5a\x26\x52\xec\x5a\x86\x82\x0c\x82\xc2\xac\x0c\x6f\x5f\x7d\
-\x93\x7a\xfa\xe8\x8b\xcb\x93\x7b\x1f\x19\x9e\xdc\xff\xfa\xf1\xc1\
-\xa5\x47\x8f\x5e\x3d\x7a\x9c\x0e\xd4\x77\x9c\x1c\x5f\x3b\x00\x31\
-\x3b\x94\x0d\x10\x40\x60\x07\xb0\xb3\xb0\x2c\x08\xca\x70\x0b\x31\
-\x76\x90\x63\x90\x53\xe6\x60\x60\x17\x07\x4a\xf3\x70\x03\x25\x44\
-\x18\x18\x98\x79\x19\x84\xff\x7d\x62\x50\xfb\xf7\x8e\x81\xe1\xcf\
-\x27\xa0\xea\xe7\xfc\xe7\xe7\x7f\xd2\x6d\xcb\x7d\x6c\x4b\xae\x03\
-\x40\xa1\x6d\x0b\x65\x03\x04\x10\xd8\x01\xdc\xac\x8c\x1a\xde\x1e\
-\x7f\x19\x78\xdd\x78\x18\x18\x58\x85\x40\x22\x50\xa9\x3f\x40\x0c\
-\xb4\x98\x99\x19\x48\x03\x1d\xc3\x2e\x0d\x8c\xa7\xaf\x0c\x7c\x2c\
-\xb7\x41\xda\xac\xbf\x03\xa3\x89\x11\xa2\xe8\x0f\x8e\xd8\xf8\x05\
-\x0a\x69\x18\x07\x68\xca\x6f\x60\xf4\x5d\x80\x49\x80\x00\x40\x00\
-\x81\x1d\xc0\xcc\xc4\xc0\xf8\xeb\xd7\x17\xa0\xe1\xaf\x18\x18\x3e\
-\xdc\x67\x60\x60\x03\x9a\xc5\xcb\xcb\xc0\xc0\xc4\x06\xd5\x0f\x33\
-\x9b\x15\xa8\xf3\x21\x83\xa8\x22\x1f\x43\x70\x8a\xa6\xdf\xef\xdf\
-\x7f\xfd\xfe\xff\x81\x9a\x0f\xb3\xe6\x3f\x23\x28\x72\x19\xfe\xfc\
-\xfa\x0f\x8e\x63\x30\x1f\x64\x02\xd0\x92\x57\x8f\xbf\x32\x5c\x3c\
-\x75\x6f\x0e\x3b\xc3\xff\x4c\xa8\xc3\x19\x00\x02\x08\xec\x00\x26\
-\x16\x26\x26\x56\xb6\x3f\x0c\x77\x96\x1c\x62\xd8\xbd\xe6\x2d\x83\
-\x81\xb5\x0e\x83\x65\x22\xd0\x72\xe9\x7f\x20\x9d\xa8\x99\x86\xe3\
-\x1b\x03\x9f\x05\x37\x43\x84\xdb\x4f\xb0\x45\x0c\x7f\x19\x21\x61\
-\x0a\x72\x08\x2c\x25\xff\x03\x8a\xfd\x65\x82\xd0\xbf\xff\x43\xc5\
-\x80\x92\xcf\xd8\x19\xd6\xcd\xd3\x4d\x59\xb7\xf0\xa6\x38\xf3\xdf\
-\x9f\xf1\x40\xd1\xf7\x00\x01\x04\x76\x00\x2b\x1b\x23\xdb\x8f\x6f\
-\x9f\x19\x16\xf7\x3c\xfa\x7a\xe9\xe6\x3f\xef\x63\x3b\x2f\xe6\xca\
-\xea\xbb\x04\xcb\x48\x9e\x00\x06\x0f\xcc\xf7\x8c\x0c\xbf\x7f\xfe\
-\x67\xf8\x74\xf3\x3f\x38\x30\x19\x19\xbe\x43\xe2\xf3\xdf\x7f\x06\
-\x26\xa0\x9a\x7f\x7f\x81\x34\x30\x80\x80\x5c\x06\xc6\xbf\x10\xb7\
-\xfe\x63\x84\x8a\x01\x1d\xc1\x04\x12\x60\xfa\xc4\xe0\x1a\xc5\xc6\
-\x20\xa5\x28\xef\x3b\xb7\xf5\xde\x7e\xa0\x2a\x03\x80\x00\x82\x84\
-\x00\x33\x30\x96\x81\x21\xc0\xc6\xcc\x08\xb2\x0d\x68\xd4\xff\x9f\
-\xff\xff\x03\x4d\xf9\xfd\x16\xe8\xcb\xbf\xf0\x58\xf8\x07\xb4\x93\
-\xfd\x23\x28\xd1\x02\xb9\x4c\x90\x48\x05\x99\x0b\x0a\xa4\xff\xc0\
-\x00\x63\x7e\x07\x11\xff\x27\x0a\x11\x67\x7a\x03\xa4\xbf\x01\xb1\
-\x38\x50\x5e\x00\x28\x07\x32\xe7\xfd\x77\x86\x8f\x97\x3e\x31\xfc\
-\xf9\xc3\xf0\x18\x64\x37\x40\x00\xb1\x40\xa2\xef\x3f\x2b\xb7\x00\
-\x33\x43\x7c\x13\x2f\x97\xe4\xf2\xcf\x87\xd5\xf5\xe4\x18\x64\x75\
-\xaf\x33\x30\x7c\xf9\x8b\x92\xa2\xd8\x81\x86\xb2\x1b\xc0\x03\x84\
-\x01\x1a\x08\x10\x36\x30\x55\xfd\x03\x26\x9f\x4f\x40\x37\xf3\x8b\
-\x42\xe4\xbe\x5f\x61\x60\xb8\x71\x89\x81\x41\x55\x13\x98\xa9\xb4\
-\x80\x62\x4f\x18\x18\xd6\xcf\x67\x60\x58\xbd\xe7\xff\x12\x60\xc0\
-\x24\x81\xb4\x02\x04\x10\x24\x11\x02\x43\xe0\x3f\x50\x87\x8c\xc9\
-\x4f\x86\x24\x33\x2e\x60\x18\x3c\x05\xc6\x29\x30\x51\x7e\x44\xb2\
-\x1d\x16\x13\xff\xa1\xe5\x27\x08\xbf\x67\x60\x78\x7a\x8c\x81\xe1\
-\xf5\x73\xa0\x72\xa0\x03\x4e\x1f\x60\x60\xb8\x7c\x83\xe1\x69\x7c\
-\x3c\x83\x34\x27\xd0\x86\x95\x2b\x19\x3e\xde\x7d\xca\xb0\x52\x9c\
-\x8f\xc1\xc4\xd2\x98\xc1\xe8\x2f\x30\xd9\x6d\x3b\xcc\x30\x1f\x28\
-\x95\xcc\x08\x4d\xb6\x00\x01\x04\x49\x03\xac\x0c\xac\xcc\x2c\x7f\
-\xc0\xc1\xc3\xf0\x17\x87\xa5\x88\xa4\xc0\xf0\xfd\x05\x50\x29\xd0\
-\xd2\xef\x40\x07\xce\xeb\x64\x60\xb8\xfd\x92\xa1\x0b\x68\xd0\x6b\
-\xa0\xd4\x6d\xa0\xbb\x0e\x4d\x9d\xcc\x50\x07\x64\x4b\x00\x4d\xac\
-\xe7\x64\x60\xb8\xf5\xee\x13\x03\xf3\x86\xfd\x0c\x2e\x40\x39\x45\
-\x60\x4c\xcd\x40\x0e\x55\x80\x00\x82\x44\xc1\xff\xbf\xbc\x7f\xbf\
-\x03\x6d\x16\x12\x06\x5a\x00\x4c\xdd\xbf\x80\x18\xc4\xff\xf5\x0f\
-\x12\xcf\x6c\xd0\xf8\x66\x86\xe8\x58\xd9\xc5\xc0\xb0\xe7\x00\xc3\
-\x76\x20\x17\x18\xe8\x0c\xa7\x81\xa5\xc6\x02\x64\x43\x81\xee\x2d\
-\x64\x80\x6a\x83\x5a\xf2\x17\x88\x77\x22\xc9\x83\x32\x34\x18\x00\
-\x04\x10\x23\x28\xaf\x26\x31\x31\xb6\x89\x8a\x31\xf9\xca\xa9\xb1\
-\x28\x29\xe9\x32\x71\x29\xe8\x30\x30\x48\xa9\xfe\x61\xe0\x13\xfa\
-\xcb\xf0\xeb\xeb\x7f\x86\xcf\xaf\x20\x3e\x7e\x03\x8c\xc3\x97\x0f\
-\x19\x18\xf6\x6d\x61\xb8\xf7\xee\x0b\x83\x1a\x0b\x24\x13\x12\xac\
-\xed\xfe\x61\x11\xdb\x03\xc4\x0f\x81\x76\x03\x04\x10\xd8\x01\x89\
-\xc0\xc4\xff\x1b\xe8\x50\x60\x90\x29\x01\x5d\x67\x08\x74\xb9\x95\
-\x00\x0f\x83\x99\xa8\x24\x83\xda\xf7\x4f\x0c\x9f\x3e\xbc\x63\x78\
-\xf0\xed\x37\xc3\x5d\x60\x34\xdf\x02\x1a\x76\x9b\x83\x81\xe1\x22\
-\x13\xa4\x3e\x21\x08\x80\xc9\x84\x41\x10\x4d\x0c\x94\xff\x1e\x42\
-\x2b\x23\x80\x00\x62\x1c\xe8\x66\x39\x40\x00\x0d\x78\x7b\x00\x20\
-\x80\x06\xdc\x01\x00\x01\x34\xe0\x0e\x00\x08\xa0\x01\x77\x00\x40\
-\x00\x0d\xb8\x03\x00\x02\x68\xc0\x1d\x00\x10\x40\x03\xee\x00\x80\
-\x00\x1a\x70\x07\x00\x04\x18\x00\xab\x94\x83\xf9\x01\xe4\xcd\xd5\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x79\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x04\x40\x49\x44\x41\x54\x78\xda\x95\x54\x5f\x4c\x53\x67\
-\x14\xff\xdd\xdb\xaf\xff\x4b\x0b\x6b\x69\x29\x4c\xa5\x08\x28\xa4\
-\x89\x86\x69\x13\x43\xc4\xd0\x07\xc3\x83\x43\x1f\xc6\xab\xf1\xc5\
-\x38\xe3\xdb\x92\xbd\xec\x71\x3e\x2e\x59\x5c\xb2\x64\x09\x4f\x1a\
-\xb3\x30\x97\x85\x2c\xf1\x11\xb0\x61\x18\x48\x48\x5c\x85\xe8\x56\
-\x15\x03\x5d\xb5\xc0\x4c\x65\x4a\x69\x6f\x7b\x7b\xef\xdd\x39\xb7\
-\xac\xb5\xcc\x07\x39\xc9\x97\x93\xf3\x7d\xe7\xfe\xee\xef\xfc\xce\
-\xf9\x3e\xc9\x30\x0c\xec\xc7\xbe\x96\x24\xa9\x23\x16\xfb\x2e\xd0\
-\xd3\x73\xde\xe6\xf1\x04\x35\x5d\x47\x7e\x6b\x6b\x23\x9b\x4e\xff\
-\xf2\xc5\xe2\xe2\x97\xd8\xb5\x7d\x01\x8f\x47\xa3\x7d\xe1\x81\x81\
-\x99\x63\x97\x2e\x85\xfd\x7d\x7d\x0d\x67\xd9\x85\x05\xcc\xde\xbc\
-\xf9\xd7\x1f\x4f\x9f\xc6\xbf\x4d\xa5\x9e\x8b\xfd\x30\x3d\x32\x32\
-\x32\x3d\x70\xf5\x6a\xd8\xdb\xd5\x85\xfc\xe6\x26\x2a\x6f\xde\x80\
-\x4d\x6e\x6e\xc6\x47\x03\x03\x38\xe3\xf1\x1c\x7c\x7b\xfd\xfa\x14\
-\x80\x2e\x19\x1f\x68\x1f\x9f\x3c\xf9\xbd\xcb\x6e\x6f\x17\x5e\x2f\
-\x9a\x42\x21\xf8\x8f\x1e\x45\x7e\x7b\x1b\x79\x45\x41\xa8\xbf\x1f\
-\xfe\xce\x4e\x58\x03\x01\x84\x0d\x23\xf2\x55\x2c\xf6\x8d\x20\x22\
-\x0c\xde\xca\xb2\xe0\x3d\xe6\xf5\x7a\xe5\xee\xee\x6e\xdb\xe7\x86\
-\x31\xba\xf3\xe2\x05\xd6\x1f\x3e\x44\x2b\xc9\x20\x6c\x36\x44\x86\
-\x87\x61\xb1\x5a\x21\x5b\x2c\xd0\x2a\x15\x6c\x3c\x7a\x04\x75\x63\
-\x03\x4e\x9f\x6f\x54\x44\x22\x91\xe5\x58\x2c\xd6\xeb\x76\xbb\x0d\
-\x87\xc3\x01\xbb\xdd\x2e\x59\x2c\x16\xd6\x5e\xae\x54\x2a\x46\xa9\
-\x54\x42\xb9\x5c\x86\x92\x48\x58\xca\x04\xbc\x7a\xfb\x36\xb6\x5f\
-\xbf\xc6\xe0\xb5\x6b\xb0\x39\x9d\x60\xa3\x3c\xcc\xdd\xb8\x01\xed\
-\xee\x5d\xc8\xab\xab\xd0\x3a\x3b\x0f\x8b\x40\x20\x70\x64\x62\x62\
-\xe2\x7f\x5a\x73\x53\xa9\x9a\x5a\xfc\x03\xb1\xd4\x54\x15\x99\xe9\
-\x69\x28\x6d\x6d\xd0\x34\x0d\xb2\x5c\x55\x52\xd9\xd9\x41\x66\x66\
-\x06\xe1\xb9\x39\x34\xd3\x77\x82\x48\xc9\xc4\x0e\x1f\x62\x4d\xd4\
-\x30\x50\xae\xe7\xdc\x39\x7c\x36\x3e\x0e\x2b\x49\xa0\x52\x25\x4c\
-\xc0\xe3\xf3\xe1\xd3\x5b\xb7\x90\x3e\x71\x02\x3e\x92\x68\xc7\xe5\
-\x82\xcc\xac\xf6\xda\x36\x37\x25\x9f\x6f\x60\x1f\x3c\x75\xca\x6c\
-\x4e\xef\x85\x0b\xb0\xd2\xc7\xa5\x62\x11\x3f\x8e\x8e\x62\xf2\xf2\
-\x65\xf3\xbc\x25\x18\x44\xdb\xc8\x08\x1c\x54\x4d\xb2\x50\xd0\xcc\
-\xe6\xbd\xa5\xd1\x61\x2b\x6c\x6d\x21\xb3\xbc\x8c\x22\xfd\xcc\x20\
-\xdd\x24\x2a\x5d\xd7\x34\xb3\x6c\xdd\xef\x47\x89\x26\x21\x33\x3b\
-\x8b\x69\x2a\xfd\xf9\xe4\x24\x8e\xdd\xbb\x07\x0f\xe5\xfe\x4c\x79\
-\xad\xa7\x4f\xc3\xbb\xbe\x8e\x45\x9a\x8e\xc4\xc2\x82\x2e\xa0\xeb\
-\xd0\x08\x50\x22\xbd\x72\xf7\xef\x63\x27\x99\x44\x81\x18\x55\xa8\
-\x41\x5a\x26\x03\x95\x98\xab\x85\x02\x34\x62\x68\xc4\xe3\xd5\xa9\
-\xc8\x66\xf1\x09\xc9\xe2\x20\xdd\xbd\x24\xc7\xc8\x93\x27\x50\x69\
-\xef\xd7\x5c\x0e\xff\x3c\x7e\x0c\x09\x90\x04\xb3\xd9\x4a\xa5\xa0\
-\x10\x50\xe2\xca\x15\xae\x1b\xd6\x68\x14\x3a\xb1\x02\x75\x98\x3b\
-\x20\x03\x9c\x6c\x8e\x95\xeb\xc1\x03\xfc\x4e\xac\xbc\x24\x8b\xcb\
-\xe1\x30\x27\x43\x21\x52\x9b\xcf\x9e\xc1\x99\x4e\x83\xe7\x84\x1a\
-\x20\x09\x95\x4a\x56\x5e\xbd\x02\xc8\x47\xa8\x1c\x99\x80\x2b\xe1\
-\x30\x64\x2a\xcf\xd1\xd1\xc1\x80\xbc\xcc\x1f\xa6\xdc\x6e\x1c\x1e\
-\x1c\x84\x01\x40\xa7\x58\xa3\xa5\x93\x14\x7f\xd3\x85\xe9\x05\xa0\
-\xb5\xb7\x43\x21\xa2\x06\x55\xcd\xc0\x86\xfd\xf8\x71\x94\xa9\x5c\
-\xd7\xc5\x8b\xa6\x9e\x25\x5a\xfc\x43\x9d\x65\xfa\x4f\x63\xae\x8c\
-\x64\xc9\x9e\x3d\xcb\x73\x5b\xd5\x7e\xf7\x3c\x4b\x57\xdb\x38\x70\
-\xc0\x8c\x4b\xb4\x90\x4c\x6a\x12\xdd\x2a\x35\x95\x4a\x09\xee\x2c\
-\x03\xb1\x5f\xa7\x26\xb0\x0f\x06\x83\xec\xab\x8b\xce\x7e\xba\x73\
-\x07\x63\x63\x63\xb5\x58\xdf\x3d\x4b\x24\x12\x38\x33\x34\x64\xc6\
-\x45\xea\x45\x7f\x7f\x7f\x51\xd0\xcd\x32\xde\x01\xad\xb1\x24\xdf\
-\xf0\x31\x2d\x9e\xdb\x5a\x9e\x51\xf5\x7c\xce\x15\xd4\xf6\xd9\xe8\
-\x16\x43\xd0\xcc\x32\x50\x03\x33\x4e\x32\x93\xf7\x30\x2b\xab\x6a\
-\x3d\xae\x83\x9b\xb9\x0c\xc9\x93\x25\xa8\xc1\x2d\x2d\x2d\x92\x20\
-\xea\xf2\xd2\xd2\x12\x83\xd7\x56\x2e\x97\xe3\xf7\x81\x86\x62\xb5\
-\xba\x47\x1f\x56\xc8\xaf\xad\xad\x61\x6a\x6a\x8a\xf7\x38\xae\x9d\
-\xad\xd2\xbe\x10\x02\x36\x7e\x90\x08\xbc\xa9\xa9\x49\x98\xda\x46\
-\xa3\xd1\x06\x26\xd9\x97\x2f\xa1\x28\x0a\x0e\x1e\x3a\xd4\xc0\x8c\
-\x7a\x81\xe1\x78\xbc\x41\x06\x09\xc0\xfc\xfc\x3c\x86\x48\x63\x66\
-\xcc\x4d\xf5\xf9\x7c\x86\x00\xc0\xa5\xd7\x93\xeb\xba\xed\x2d\x9b\
-\xab\x68\xc8\x35\x8d\xc0\x2c\x42\xf0\x83\xc5\x6c\xd9\x33\x63\x49\
-\x50\x22\xdd\x5c\x95\x37\xeb\xe0\xe4\xd5\x7a\x43\x6a\x5a\x53\xf3\
-\xd8\xd7\x62\x06\x91\xaa\xaf\x60\xbd\xb2\xdd\xe6\x49\xa1\x50\xe8\
-\x4f\xd2\xb4\xe7\x3d\x8f\x91\x6c\x90\xed\x79\x4a\xa5\x77\x03\x3b\
-\xdd\x3c\x8f\xc7\xc3\x40\xbc\x0c\x97\xcb\x25\x39\xe9\x26\xae\xac\
-\xac\xfc\xf6\x2f\x24\x1d\xf7\xc4\xbc\x92\x33\x7d\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\x32\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x04\xaf\x49\x44\
-\x41\x54\x58\x85\xcd\x57\xdf\x6f\x53\x55\x1c\xff\x9c\x5f\xf7\xb6\
-\xa5\x5d\xbb\x6e\x5d\x9a\xb5\x64\x60\xdc\x9c\x9a\xb9\x61\x14\x5d\
-\x22\x99\xfa\x40\x8c\x89\x7b\xda\xc3\x5e\x20\x24\x06\x4d\x90\x27\
-\xe3\x9b\xff\x07\x0f\x2e\x98\x65\x24\x46\x13\x9e\xd0\x84\x38\x35\
-\x41\x47\xb2\x44\x10\x86\x9a\xa9\x80\x80\x30\xc1\x09\x6c\xc3\xf6\
-\x76\xbd\xe7\xde\x73\xbe\x3e\x0c\x96\xb5\xeb\x1d\xdb\x90\xcc\x93\
-\x7c\x1f\x9a\x7e\x7b\x3f\x9f\x73\x3e\x9f\xef\xe9\xe7\x32\x22\xc2\
-\x56\x2e\xbe\xa5\xe8\xff\x07\x02\x72\x23\xcd\x23\xa7\xfb\xba\x38\
-\x63\x83\x20\x0c\x31\x8e\xa2\x25\x64\x01\x80\x33\xcc\x91\xc5\x0c\
-\x18\x8e\x5b\xa2\x13\x07\x5f\x99\xba\xb8\xde\x67\xb2\xf5\x78\x60\
-\xf4\xcc\xee\xbc\xd1\xc1\x18\x01\xfd\x64\xad\x22\xc0\x05\x11\x1e\
-\xfc\x92\x01\x00\x63\x60\x80\xcf\x38\x0f\x18\x30\x29\x1c\xb5\xff\
-\xc0\x8b\xdf\xff\xf5\xc8\x04\x8e\x4e\xf4\x0e\x13\xe7\x47\xac\xb5\
-\x49\x63\xac\x5a\xc7\xa6\x20\x04\x0f\x38\xe7\x65\x66\xed\xa1\xb7\
-\xf7\x5c\xf8\x74\x53\x04\x46\x4f\xed\xca\x84\x92\x8e\x01\x34\xa0\
-\x03\x93\xda\xe8\xb4\x30\xc6\xe0\x28\x51\x02\xd8\xb7\x32\x64\xfb\
-\x0e\xbc\x7a\x7e\xa1\x51\x5f\xa4\x07\x42\x49\xc7\x42\x63\xf7\xea\
-\x20\x74\x36\x84\xbc\xbc\x08\xa1\xb1\x29\x47\xc9\xbd\x90\xfc\x18\
-\x80\xb7\x1a\x75\x35\x9c\x82\xa3\x13\xbd\xc3\x44\x34\x50\xd5\xda\
-\xb1\x64\xf1\x28\x55\xd5\xda\x21\xa2\x81\xa3\x13\xbd\xc3\x8d\xb0\
-\x56\x49\x30\x7a\x66\x77\x3e\xf4\xf5\xb4\xb7\xe8\x37\x1b\x6b\x37\
-\xb7\x79\x00\x97\x7e\x08\xb1\xa3\x47\x42\x39\x80\xe0\x1c\xdb\xe2\
-\xee\xbc\x74\x9d\x67\xea\x8d\xb9\xea\x04\x42\xad\xc7\xaa\x3a\x48\
-\xea\x30\x84\xb1\x76\x53\x75\xe9\x9c\xc1\xf9\x2f\xb2\xf8\xe6\x63\
-\x89\xd2\x82\x81\x0e\x43\x54\x75\x90\x0c\xb5\x1e\xab\xc7\xab\x21\
-\x30\x72\xba\xaf\x8b\x08\xfd\xde\x62\x55\x59\x6b\xb1\x99\x9a\xbd\
-\x46\x98\xfe\x3a\x0b\xc9\x5d\x54\x6e\x37\x63\xfa\x3b\x09\x6b\x2d\
-\xbc\xc5\xaa\x22\x42\xff\xc8\xe9\xbe\xae\x48\x02\x9c\xb1\x41\xdf\
-\x0f\x94\xb5\x84\xcd\x54\x69\x0e\xf8\xe9\x64\x2b\x98\x49\x40\x4a\
-\x89\x74\x5e\xe3\xd9\xd7\xf4\xf2\xf7\xbe\x1f\x28\xce\xd8\x60\x24\
-\x01\x6b\x69\xa8\xaa\xb5\x5b\x63\x22\x0f\x08\xcd\xc3\xcd\xa6\x7d\
-\xc2\xf4\x97\x6d\x08\xbd\x6d\x10\x42\xc0\x4d\x10\x7a\xde\x98\x87\
-\x70\x6a\x0c\xe9\x5a\x4b\x43\x2b\x31\x6b\xc7\x90\xa1\xa8\x43\x03\
-\x63\x97\x8c\xa9\xcb\x0a\xbf\x8d\x17\x20\x63\x06\x9d\xaf\xdf\x82\
-\x8c\x85\xab\xdd\x06\x80\x08\xb8\x7c\xaa\x00\xef\x76\x12\x52\x02\
-\x8c\x01\x9d\x03\x77\x90\x68\xd5\x30\x2b\x7c\xac\x43\x03\x30\x14\
-\x23\x09\x30\xb0\x6c\x10\x86\x78\x30\x19\x0b\xd7\xb2\xa8\xdc\x4d\
-\x02\x00\x2e\x9e\x4c\x60\xe7\xc0\x75\xb8\x19\x6f\x15\x81\xd9\xf3\
-\xdb\x31\x77\x35\x03\x79\xff\x69\x85\x9e\x7b\x68\xe9\x9c\x43\xfd\
-\x10\x05\x44\x60\x60\xd9\x48\x09\x08\xa8\xd1\xb4\xa5\xfb\x26\x8a\
-\x3d\x1e\x84\x10\xa8\xcc\xc7\xf0\xfb\x57\x4f\xc2\xbb\x99\xab\xd5\
-\xfd\x6a\x3b\x6e\xfd\x9c\x83\x10\x02\x42\x08\xe4\x3a\x2c\xf2\xcf\
-\xdf\x88\xf4\x49\xfd\x7d\x5a\x37\x86\x34\xc7\x19\x96\x1d\x6d\xac\
-\x45\x6e\xd7\x65\x14\x9e\xd6\x90\x52\x22\xf4\x1d\xfc\x31\xb1\x13\
-\xde\x95\x27\x60\xad\x85\xbe\xd3\x86\x3f\xcf\x16\xc1\x99\x80\x94\
-\x12\xc9\x8c\x40\xe1\xa5\x2b\xb0\x08\x1a\x4e\x08\x67\x4b\x18\x91\
-\x12\x10\xd1\x0c\xe7\xa2\x60\xec\x4a\xad\x0d\x9a\xfb\xa6\xc1\xd1\
-\x87\xdb\x57\x63\x00\x01\x37\xce\xe6\x51\x5c\xcc\x60\x7e\x26\x0e\
-\x6b\x08\x52\x02\x9c\x33\x74\xbc\x7c\x1d\xd6\xfd\x07\x88\xb8\xbf\
-\x5c\x2e\x40\x44\x33\x91\x27\xc0\x38\x8e\x27\x62\x8e\x5f\xef\x70\
-\x03\x1f\x4d\xcf\xfd\x88\xb6\x1d\x76\xf9\xa8\x6f\xfd\xba\x0d\xd5\
-\x32\x5f\xfe\xbc\xe3\x85\x32\x6c\xf3\x95\x35\x27\x25\x11\x73\x7c\
-\xc1\xf9\xf1\x48\x02\xa5\x7b\xfa\x84\xa3\x64\x40\x0d\xb4\x0b\x51\
-\x41\xba\x77\x0a\xb9\xed\x1c\x52\xca\x9a\x6a\xef\x64\xa0\xf6\xa9\
-\x35\xef\x08\xb2\x84\x64\x22\x1e\x58\xa2\x13\x91\x04\xde\x7f\xf3\
-\x97\x8b\x15\xdf\x9f\x4c\x25\xe2\x41\x23\x0d\xab\x76\x01\xa9\x9e\
-\x73\xc8\xe6\xc5\xf2\xce\xd3\x2d\x0a\xb1\xce\x29\x84\xc6\x5f\xf3\
-\x86\xcc\xa6\x93\x01\xe7\x6c\xb2\x3e\x2d\xad\xfa\x2f\xa8\x7a\x76\
-\x3f\x17\xac\xcc\x39\x87\xb1\xb4\xaa\x3c\xfb\x37\x52\x3d\x17\x90\
-\x69\x75\x10\x8b\x39\x68\xed\xbd\x06\xcf\xce\x36\xec\x7d\x50\x4a\
-\x4a\xb4\xa4\x53\x65\xe5\x3a\xfb\xeb\xf1\x1a\x06\x92\x0f\x3f\xcb\
-\x0f\x0b\x21\x3e\xba\x57\xaa\xa4\xa2\x62\x48\x13\xeb\x46\x3c\xd8\
-\x89\x59\x79\x32\xa2\xe3\x3e\x00\x63\x78\xaa\xa3\xbd\xa4\xa4\x78\
-\xe7\x60\x83\x74\x14\x99\x88\x3e\xf8\xa4\xed\x73\x01\xb6\xd7\xab\
-\x56\x37\x19\x48\x96\xc0\x0b\xb9\x16\xdd\x9c\x4e\x8e\xbf\xbb\xe7\
-\xc2\xfa\x03\x09\x00\xdc\xd5\xc1\xbe\x20\x34\xe3\x89\x58\xac\xc4\
-\x58\x63\x39\xd6\x2a\x47\x29\x74\x77\x14\x4a\xcd\xe9\xe4\xb8\x6b\
-\xf8\xbe\x48\x92\x0f\xcb\x7a\x87\x47\xd3\xc3\x71\xe5\x1c\x09\x8d\
-\x4d\x56\xaa\xfe\x43\x43\x29\x63\x0c\xed\x2d\xd9\x20\x9f\xcb\x94\
-\x19\x70\xa8\xd1\xb1\x6f\x88\x00\x00\xbc\x37\x9a\xcc\x2b\xe6\x8e\
-\xb9\x8e\xec\x37\x86\x94\x0e\x02\xd7\x58\x8b\xd0\x18\x00\x0c\x8e\
-\x92\x70\x95\x44\xb6\x29\xe9\x67\xd3\xa9\x40\x30\x4c\xaa\x78\xec\
-\xbf\x89\xe5\x2b\xd7\xe1\x91\xa6\xae\x44\xdc\x1d\x14\x52\x0e\xc5\
-\x1d\x55\x74\x5d\x95\x75\x1c\x05\x57\xca\x39\x26\xf8\x8c\x23\xc4\
-\xe3\x79\x31\x79\x9c\x6b\xcb\xdf\x0d\xb7\x9c\xc0\xbf\xbd\x57\xbd\
-\x04\xb5\x69\x5e\x47\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x0a\x45\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0a\x61\x00\x00\
-\x0a\x61\x01\xfc\xcc\x4a\x25\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x08\x47\
-\x49\x44\x41\x54\x68\xde\xed\x59\x4d\x8c\x1c\x47\x15\xfe\x5e\x55\
-\xcf\xec\x8f\x77\x17\xff\x44\x62\xc3\x22\x3b\x31\xc6\xc8\x09\x20\
-\x41\x90\x85\x91\x20\x82\x43\xc4\x01\x45\x82\x0b\x0a\x47\x5f\x48\
-\x0e\x9c\xf0\x95\x08\xc1\x19\x38\x07\x24\x24\x2e\xdc\x11\x07\x0e\
-\xe4\x90\x0b\x21\x8a\x10\x87\x20\x01\xb1\x1d\xdb\x1b\xbc\x11\x5e\
-\xec\x2c\xde\x9d\xdd\x99\xe9\xae\xf7\x1e\x87\xfa\x99\xea\x9e\xee\
-\xde\xf5\x0a\x29\x41\xa2\xb5\xa3\xed\xae\xa9\xae\xfa\xbe\xf7\x7d\
-\xaf\xfe\x06\xf8\xff\xf5\x21\xb9\x54\x15\xaa\xba\xa2\xaa\xe6\x83\
-\xc6\xf2\x28\x17\x65\x04\xec\xcf\x5f\x79\xe5\xb7\xd7\xdf\xbe\xfe\
-\xf5\xca\x55\x04\x10\x28\x7c\x7b\xee\x89\xf3\xf8\xfc\x95\xaf\x60\
-\x79\x61\x08\x43\x06\x86\x00\x10\x81\x42\x05\x43\xc6\xdf\x87\x32\
-\x32\x04\x63\x7c\x99\x31\x36\xb5\xa3\xaa\x80\xaa\xbf\x87\x00\xea\
-\xef\x7c\x99\x2f\x77\xcc\xd8\x1f\x97\xf8\xc3\x6b\xbf\xc7\xbb\x9b\
-\x77\xfc\x3b\xe1\xdd\x41\x31\x90\xa7\x3f\xf3\xe9\xdf\x5c\xbd\x7a\
-\xf5\x5b\x11\x77\x91\x98\x10\xf1\x4b\xdf\x7d\xf1\xb9\xbd\xbd\x3d\
-\x7a\xb8\xfb\x10\xd6\x58\xac\xaf\x3f\x0e\x00\x38\xb1\xb2\x82\x8d\
-\xb3\x4f\x60\x75\x69\x11\xd6\xf4\x0b\x44\xbe\x31\xc0\xff\x85\x08\
-\xf9\x60\x44\x22\x81\x3f\x40\x04\x13\x0a\x88\x08\x14\x08\xfc\x7b\
-\x7f\x82\x95\x13\x2b\x98\x8c\xa7\xb5\xb6\xcb\x69\x65\xfe\xfe\xd7\
-\xbf\x3d\xaf\xaa\x29\x78\x45\x5e\x41\x55\xec\xee\xde\x1e\xca\xb2\
-\x42\xe5\x0e\xb0\x8e\x8f\xd6\x80\x19\x43\x87\x12\x48\xf8\xa9\x51\
-\x06\x80\x02\xda\x44\xcc\x04\x02\xd9\x3b\x24\xf9\x8b\x32\xd7\xb6\
-\x88\x58\xca\x1a\x2f\xea\x5f\x02\xc3\xe1\x10\xeb\x8f\xaf\xe3\x60\
-\xb4\x0f\x89\xef\xab\x82\x08\x30\x44\x78\xed\x4f\x7f\x39\x8a\x23\
-\x5b\x4b\x72\x52\x33\x35\x66\xb2\x10\x80\xaf\x5e\x7e\x1a\x86\x08\
-\x0a\x9d\xf5\x5f\x0b\xb2\xd6\x9e\x8b\xfa\xd7\x02\xe7\x1c\xde\xbb\
-\xbb\x05\xc7\x8c\xb3\xcb\x4b\xb5\x0e\xad\x01\x9e\xfb\xe2\x67\x0f\
-\x09\xbf\xaf\x4c\xd9\xe3\xbc\x0a\x33\xf0\x14\xe4\x30\xa1\x66\xc9\
-\xce\x57\xd4\x76\x05\x54\xeb\x65\x0d\x05\x14\x8f\x9d\x39\x53\x7b\
-\x8e\xac\x7d\x42\x12\xac\x21\x28\xda\x2f\x4a\x28\xe7\xb5\xa0\x18\
-\x6b\xd3\x78\xa6\x94\x32\xbe\x9c\x03\x50\x68\xea\xbf\x89\xb1\x93\
-\x40\x53\x9e\x26\x38\x1b\x08\xf4\x47\x7f\x1e\x78\x4d\x89\x06\x60\
-\x84\x60\x8b\xfa\xfe\x59\x3c\xc8\x30\xac\xcf\x13\xd0\x5e\x02\x2d\
-\xa6\x0b\x5d\x18\x43\x30\x06\x30\x05\xf9\x1e\x9b\x6d\x67\xe0\xdb\
-\xec\x93\x83\x85\x7a\x73\xa8\x2a\x14\x9a\x46\x52\x05\xc0\x22\x10\
-\x55\xa8\x68\x2b\x1e\x95\x5e\x0b\x75\xc0\x57\x4d\x78\x73\xd9\x6b\
-\xa0\x1a\x28\x13\xc7\x00\x52\xb3\x8a\x11\x6c\x8d\x40\x28\x67\x16\
-\x40\x15\xa2\xc7\x4c\xe2\x76\x02\x9e\x39\xb3\xe0\xd7\xaf\xbe\xde\
-\x6b\xb5\x26\x2b\x89\x0d\x74\x54\x49\x5f\x85\x9b\x6f\x3c\xfb\x8c\
-\xb7\x50\x07\x9e\x5e\x0b\xf5\x29\x20\x0a\x38\x56\x7c\xf3\x6b\x97\
-\x67\xc9\xda\x12\xf5\xf9\x32\xaf\x85\xe6\x75\xb2\xba\xaa\x92\x29\
-\xe2\x27\x32\x81\xf7\x7f\xbb\x02\x3d\x16\xea\xca\x01\x09\xbe\x74\
-\x22\x20\xee\x49\xe2\x16\xe2\x68\xda\x67\x8e\x88\xd4\x56\x14\xcc\
-\x1e\xb8\x88\x74\xe4\xc0\x31\x46\x21\xef\x47\x05\xb3\x82\xd0\x95\
-\xe8\x6d\x6a\x64\x04\xb2\xf2\xbc\x9b\xa8\x40\xac\xed\x44\xbc\x85\
-\xa4\x63\x14\x92\x5e\x0b\x75\x10\x10\x09\x16\x3a\x02\x78\xcc\x92\
-\xb7\x35\xfa\x19\x01\x0d\x93\x55\xae\x0a\xb3\x40\xa0\x7e\x34\x6a\
-\xc1\xd3\x6b\xa1\xae\x24\x16\xf1\x23\x83\x63\x1f\xad\x2e\x13\x69\
-\xed\x4e\xeb\x65\x6d\xfe\x07\x00\x6d\x10\x10\x81\x8a\x42\x54\x70\
-\x8c\x99\xb8\x03\x58\xb4\x90\x08\x5e\x7d\xe3\xad\x23\xa9\xd0\xa7\
-\x8e\xd6\x19\xd4\xbe\xfd\xf2\x33\x4f\x05\x0b\x49\x2b\x9e\x66\x59\
-\x5d\x81\xbe\x24\x86\x82\x59\xf0\xec\x17\x9e\x42\xeb\x94\xdb\x16\
-\xf5\x66\xf4\xd1\xf0\x7f\x1e\xd1\xa4\x80\xa6\x9c\xc3\x23\x4f\x64\
-\x5d\x49\x2c\xbe\xc1\x0a\x32\xb7\x0c\x68\x52\x68\x7b\xd0\x66\x71\
-\x63\x14\xca\x09\xf8\xc4\x25\xdf\x67\x0b\x1e\x45\x5f\x0e\x74\x8e\
-\x42\x7e\x18\xed\xf4\x58\xcf\x55\x1f\x71\x9a\x44\xea\x33\x71\x2c\
-\x37\x08\xcb\x88\x47\x1e\x85\xba\x2c\xe4\x04\xaa\x0a\x27\xa1\xa7\
-\x23\x48\xa0\x5d\x5f\xd5\x46\xa0\xb4\xc8\xa8\x63\xb5\xc6\x4f\x68\
-\xda\xb6\xa1\xe9\x9b\x07\x3a\x02\xfc\xe6\x1b\xaf\xe3\xbd\x7b\xdb\
-\x28\x27\xe3\xa3\x45\xfd\x90\x52\xed\xae\x04\x10\x61\x61\x61\x01\
-\x5b\x77\xde\xc1\xa0\x18\xb4\x34\xd3\x37\x13\x77\x0c\xa3\x45\x61\
-\xf0\xcf\x7f\xdc\xca\x7b\x09\xfb\x16\x4a\xab\xbb\x7c\x73\x12\xeb\
-\x74\x92\x48\xab\xcf\x99\x1c\xb3\x67\x0d\x7d\xda\x56\x3c\xd2\x4b\
-\x40\xba\xc2\x32\x0f\xe4\xa8\x35\xff\xdb\xd7\xb1\x96\x12\x1f\xa6\
-\xab\x7f\x35\xfa\x3f\x40\xa0\x7f\x29\x71\x64\x0b\x7d\x80\x04\x7a\
-\x87\xd1\xa3\xac\x34\xc3\xe5\x93\xb6\xfd\x03\x20\xfd\x6f\x9d\xb0\
-\x31\xb3\x6b\xdc\xfb\xce\x7d\xd0\x35\xa9\xf6\x2a\x70\x38\xf0\x6f\
-\x7f\xe7\x05\x5c\xf9\xd2\x95\x88\xa2\x31\xfb\x3e\x5a\x72\xab\x2a\
-\xde\xdd\xdc\xc4\xb5\xef\x5f\x43\x61\x6d\x9a\xdc\x9c\x08\x0a\x6b\
-\xf1\xb1\x70\x32\xd8\x7c\xa7\x5b\x01\xe1\xde\x0e\x8b\xa2\xc0\xca\
-\xea\x0a\xb6\xb7\xb7\x6b\xd1\x9b\x53\x87\x08\xf9\xf1\x5f\x4d\x91\
-\xec\x3d\x22\xc2\x47\x4e\x9e\xc4\xd2\xd2\x22\x96\x97\x96\xd3\xac\
-\xcc\x8e\xb1\x77\x30\x6a\xc5\x23\xdc\xa3\x80\xeb\x21\x50\xd8\x02\
-\xa6\xb0\x35\x99\x8d\x31\xb0\xd6\x06\xf2\x92\x80\x47\x70\x91\x1c\
-\x35\xce\x19\x4d\x38\x9e\x14\x11\x30\x33\xac\xb1\x30\xd6\xf8\xd3\
-\x0a\x15\x98\xc2\xa2\xb0\x45\x2b\x1e\x23\xae\x4f\x81\x6e\x0f\x31\
-\x18\xd3\xc9\x14\xce\xb9\x04\xf0\x67\x3f\xf9\x29\xc6\xe3\x49\x8c\
-\x2b\xca\xaa\x02\x11\xf0\x83\x97\x5f\x0e\x07\x61\xfe\x84\xda\x6f\
-\x0f\xb3\x99\x58\x15\xcc\x0c\x66\x86\x31\x26\xd8\x8e\xa0\xa4\x80\
-\x12\xa0\x92\xde\x9b\x53\xa0\xff\x58\xa5\x9b\x00\x81\x60\x0b\x0b\
-\x6b\xad\xef\x54\x15\x5b\x5b\x77\x67\x15\x14\xa8\x9c\xc3\x74\x3a\
-\x4d\xc9\x9c\x2b\x20\x22\xe9\x13\x55\x72\xce\xa5\x53\xe9\xb4\xb3\
-\xc7\xcc\xe7\xad\x04\xfa\x2c\x24\x3d\x5b\x46\x13\x96\x0f\xb9\xef\
-\x6b\xf5\x15\x28\xcb\x12\x93\xc9\x24\x75\x4c\x44\x60\xe6\x64\x95\
-\x9c\x40\xbc\x9f\xd9\x4e\xa0\x12\x37\xf9\x7e\xad\xd1\x86\x47\xcc\
-\x31\x09\x38\x55\x60\xe2\xa5\x8f\x16\xaa\xad\x4b\xd4\x1f\xbf\x0f\
-\x86\x83\x1a\xd8\x08\x3e\xbe\x97\x07\x80\xd9\x7b\x5c\x34\x10\x83\
-\xdf\xb0\x68\x24\x19\xf0\x0c\x06\x05\x06\x83\x01\x9c\x73\x90\xe3\
-\xe6\x00\xc8\xf8\x79\x2e\x1b\x5d\x6a\xf5\x15\x29\xb2\x79\x84\xe3\
-\x73\x9e\xe0\x91\x94\x73\x2e\x10\x11\xb0\x08\x20\x33\x32\x12\xea\
-\x05\x29\xe1\x02\x59\xc7\xc7\xcc\x01\x18\xbf\xd4\x98\xed\x9a\xe6\
-\x09\x38\xe7\x41\x4d\xa7\xb3\x64\xcf\x41\x37\x3f\xb1\x8e\x30\x83\
-\x5d\x5d\x21\x0d\x75\xa2\x52\xa2\x02\x43\xe6\xb0\x24\xee\x1e\x46\
-\x8d\x10\x0a\x6b\xfd\x44\xe3\x9c\x07\xc1\x9c\xad\x90\x35\x59\xca\
-\x39\x37\xab\x93\xa9\x10\xad\x14\xed\xc4\x29\xaa\xbe\x7e\x9c\x07\
-\x44\x63\xce\x30\x40\x04\x6b\x2d\xca\x83\x29\x86\xc3\x85\x39\x5c\
-\x47\x26\xc0\x4c\x98\x8c\xc7\x98\x4c\xa6\x28\xcb\x12\x22\x82\xfd\
-\x83\x83\x00\xc6\x2f\xb2\xc8\xf8\x08\x8d\xc7\xe3\x39\xb0\x5d\x2a\
-\x24\x62\x8e\xfd\xfe\xac\xa6\x80\xc7\x33\x9d\x8c\xd3\x88\x75\x88\
-\x02\xfa\x26\xa0\x97\x5b\x15\x30\x8a\x62\x30\x80\x08\xa3\xaa\x2a\
-\x30\x33\xd6\x56\xd7\x70\xff\xfd\x07\xe9\x1c\xc7\x88\xe0\xf4\x99\
-\x33\xa8\xaa\x2a\x01\x8b\x7e\x6f\xcb\x8f\xa8\x12\x3b\x86\x33\x2e\
-\x28\xe9\xcf\x9e\x58\x38\x81\x9d\x4c\x26\x58\x5e\x3e\x81\x83\x83\
-\x31\xac\x35\xc1\xd0\x7e\xe1\x93\x13\x30\x0f\x76\x76\x9e\x3f\xb9\
-\xb6\xf6\x3b\x22\x7c\x6e\x5e\x01\x86\xb0\x83\x73\x9e\x80\x73\x0e\
-\x3f\xfc\xf1\x8f\x52\x72\x46\x70\xce\x39\xec\xee\xee\xd6\xa2\x1b\
-\xa3\xda\x1c\x9d\x72\x8f\x33\xbb\xd9\x3e\x59\x35\x25\x73\xbc\x46\
-\xa3\x3d\x7f\x43\x05\x00\x2c\x03\x18\x03\xe0\x9a\x02\xb7\x37\xef\
-\x4c\x56\x57\x56\xbe\x77\x76\xe3\xe3\xbf\x2a\x8a\xe2\x13\x75\x05\
-\x04\x00\x25\x7f\x3b\xe7\x50\x55\x55\x6d\xa8\xcc\x27\x2c\xe7\xdc\
-\x9c\x02\x9a\x8f\x2c\x31\xf7\x03\x31\xc7\xf5\xe1\xd1\x9f\xc5\xb6\
-\x0d\x2a\x0c\x00\xa7\x01\x6c\x03\x90\xa2\xf9\xf5\xde\x68\x34\xbe\
-\x71\xeb\xd6\x2f\x9f\x3c\x77\xee\xda\xc2\x70\x78\x2a\x96\x3b\xc7\
-\x18\x8d\xf6\x71\xff\xc1\x7d\xbf\x6e\x09\x91\x6b\x7a\x3b\xfa\x3e\
-\x1f\x65\x9a\x6b\x21\x0a\x89\x19\xeb\x02\xf3\xbf\xbb\xc5\x49\xb3\
-\xf9\x1e\x0b\x3f\x04\xb0\x0a\xe0\x7d\x00\x65\x4e\x40\x01\x4c\x01\
-\xdc\x2f\xab\xf2\xad\xdb\x9b\x77\x7e\x71\xea\xe4\xa9\x4f\x06\xbf\
-\x61\x79\x79\x19\xe7\xcf\x3f\xb9\x78\xfb\xd6\xad\x93\x5b\x77\xef\
-\x0e\x8c\x31\xd6\x18\x53\x84\xff\xb6\x28\x8a\x82\x88\x2c\x88\x6c\
-\xf8\x99\x9f\xc2\x50\x28\xea\xb7\x51\xc2\x22\x0c\x55\x16\x11\x27\
-\x22\x32\x99\x4c\xa7\xa3\xfd\x51\xb5\xba\xb6\xb2\x77\xef\xde\xbd\
-\x7d\x11\x69\x1e\xf9\xa5\x5d\x3e\x11\xa9\x31\x66\xa7\x2c\xab\x3f\
-\x46\xfb\x00\xd0\x26\x81\x12\xc0\x7d\x00\x7f\x2e\xab\xea\x9d\x7b\
-\xff\xda\x5e\x8c\x0d\x6e\x6c\x6c\x98\x4f\x5d\xba\xf4\xd8\xa5\x4b\
-\x97\xd6\xd6\xd6\xd6\x8a\x85\x85\x85\xc1\x60\x30\xb0\xd6\xda\x22\
-\x80\xa7\x60\x0f\xa3\xaa\x86\x88\x54\x55\xc9\x18\xa3\xaa\x2a\xe1\
-\x59\x55\xd5\x39\xe7\xb8\x2c\xcb\x6a\x34\x1a\x1d\xec\xec\xec\x4c\
-\x01\x3c\x7c\xfb\xc6\x8d\xdd\xf1\x78\xdc\xf7\x2b\xba\x02\xa8\x00\
-\xec\x01\xd8\x09\xf7\xda\x76\xf6\x61\x00\x58\xf8\x04\xcf\x1b\xd4\
-\x0b\x17\x2e\xe0\xe2\xc5\x8b\x38\x7d\xfa\x34\x16\x17\x17\x01\x20\
-\xfd\x1f\x0e\x87\xa9\xad\xfc\x9e\x99\x35\x8e\xf7\xc1\x32\x9a\xe7\
-\xd1\xf6\xf6\x36\xae\x5f\xbf\x8e\x9b\x37\x6f\x46\xe7\xf4\x5d\x1a\
-\x22\xef\x10\x7e\x27\xfc\x0f\x0c\x53\x60\x43\x5f\x29\xe7\x29\x00\
-\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\
-\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x37\
-\x3a\x30\x32\x3a\x33\x35\x2d\x30\x37\x3a\x30\x30\x10\x90\x85\xa6\
-\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\
-\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\
-\x33\x3a\x32\x36\x3a\x31\x35\x2d\x30\x37\x3a\x30\x30\x06\x3b\x5c\
-\x81\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\
-\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
-\x30\x39\x3a\x33\x31\x3a\x32\x35\x2d\x30\x37\x3a\x30\x30\x5f\x2e\
-\xc9\x50\x00\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\
-\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\
-\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\
-\x65\x6e\x73\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\
-\x20\x6f\x72\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\
-\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\
-\x69\x63\x65\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\
-\x2f\x5b\x8f\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\
-\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x30\x33\
-\x2d\x31\x39\x54\x31\x30\x3a\x35\x33\x3a\x30\x35\x2d\x30\x36\x3a\
-\x30\x30\x2c\x05\xbc\x4f\x00\x00\x00\x13\x74\x45\x58\x74\x53\x6f\
-\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\x6e\x20\x49\x63\x6f\x6e\
-\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\x45\x58\x74\x53\x6f\x75\
-\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\x69\x63\x6f\x6e\x73\x2e\
-\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x02\x02\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x04\x00\x00\x00\x6e\xbd\xa4\xb0\
-\x00\x00\x01\xc9\x49\x44\x41\x54\x78\x5e\x95\x93\x3f\x6b\x54\x51\
-\x10\xc5\x7f\x73\xdf\x7d\x9b\xfd\x93\x18\x48\x25\xfe\x0b\x18\x0b\
-\x0b\x0b\x41\x10\x4b\xb1\x09\x0a\x82\xa8\xc5\x82\x11\xfc\x08\x8a\
-\x85\xd8\x0a\x86\x14\x36\x96\x7e\x00\x11\x6c\x14\xb1\x90\x80\xa0\
-\x16\x42\x04\x09\x01\x0b\x49\x40\x11\x03\x6a\x8c\x31\x6c\x36\x59\
-\xd6\xf7\xee\x8c\xef\xb2\xc5\x63\x59\x17\xcc\x1c\xe6\x70\x86\x39\
-\x0c\x87\x0b\x57\x8c\xff\x2f\x31\x64\xbc\x31\x73\xe5\x62\x9b\x9d\
-\xd0\x55\x23\x58\xd9\x3d\x5e\xfb\xf3\xb9\xcd\x3b\x1e\xd9\x2f\x61\
-\xf2\xf6\xeb\xe6\xe4\x2b\x56\xd9\xa0\x43\x20\x90\xc7\x2e\xb0\xc3\
-\x36\x1d\x5a\x7c\xc7\x00\x16\x99\x91\x43\xf7\x5e\xdc\xbc\xb0\xb2\
-\xfc\x90\x4d\x86\xd7\x18\x97\xe4\xb8\xdd\xf7\xd7\x9b\x0f\x58\xbe\
-\xf1\xec\xcd\xf6\x6c\xe5\x00\xa8\x15\x50\xb3\x60\x66\x4a\xd0\x82\
-\x8d\xf5\xc9\xbb\xe7\xe6\xab\x6f\xc3\xb4\x1f\x6b\x2c\x64\xbc\xf7\
-\x4f\x9b\x67\x20\xeb\x45\xe8\x71\x09\xbe\x9d\x0a\xa7\xab\x5b\x36\
-\xe1\x73\x5b\x03\x26\xa6\x4a\x6b\xbf\x39\xea\xda\x41\xa8\x82\xb8\
-\x96\x6d\x03\x48\xd6\xb7\xce\xfb\xa0\x06\x35\xa9\x89\x6f\x6b\xc7\
-\x40\x2d\x1f\x7a\x37\x36\xd4\xc5\xc4\x6f\x69\x17\x08\x9a\x0f\xe6\
-\x2d\xcd\x06\x55\x41\x7c\x4b\x33\x40\x6d\xf8\xdd\xc8\x31\x86\x88\
-\xdf\x54\x05\xb4\xef\x6e\x46\x18\x34\x83\xf8\xf5\xa8\x50\x2b\xd7\
-\xd9\x40\x76\xa5\x17\xc3\x7d\xca\x13\x20\x58\x69\xcd\x07\x10\x84\
-\xde\x6b\xfc\x08\x09\x01\x2d\x57\x83\xd9\x09\x16\xcd\x38\x97\x59\
-\x02\x74\x56\x72\x86\xc3\xbe\xe2\x47\xa9\xe2\x5d\x2b\xa9\xa4\x27\
-\xdc\xd5\xa5\x3b\xb2\x57\x51\x33\x83\x60\x6a\x46\x6f\x52\xb1\x9f\
-\xfb\x66\xa7\xce\x1e\x1d\xf9\xf8\x5b\x92\xb9\xc6\x2d\xf9\xa0\x8f\
-\x2b\xad\xc4\x25\x92\x16\x1d\xd9\x89\x97\x24\x6a\x71\x91\xc7\x0f\
-\x5f\x9e\xde\x3f\xff\x52\x38\x52\x7f\xb2\xe7\x58\x9d\x5a\x81\xc8\
-\xff\x52\x11\x0b\x1b\xcf\xcf\x8b\x21\x13\xa3\xd7\x46\x4e\xa6\x95\
-\xd4\x55\x24\x75\xa9\xf3\x92\x26\xa9\xf8\xa8\x0a\x4e\x8a\xc9\x69\
-\x77\xe9\xcb\xdc\xe2\xea\xae\xfe\xa0\x63\x17\xf5\x17\x6a\xdd\x55\
-\x45\x82\x15\xb0\x27\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x02\xcd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x02\x94\x49\x44\x41\x54\x78\x5e\xed\x94\x0d\x48\x53\x51\
-\x14\x80\x17\x67\x9b\xf6\x48\xb2\x4c\x20\xa9\x0c\xb0\x32\x13\x97\
-\x7f\xcd\x7f\xf3\xe5\x26\x4e\xa9\x9c\x85\x49\x66\x7f\x50\x69\x59\
-\x4c\xe7\xcc\xd4\x06\x69\xcc\xac\x0c\x4b\x20\x8a\x24\xd1\x70\x88\
-\xa5\x11\x03\xa8\x16\x05\x8e\xca\xe1\x12\x61\xd3\x95\x85\x1a\x60\
-\x25\x10\x96\x5a\x6e\x7b\xe7\xb4\x74\x40\x50\x66\x56\x41\x80\x17\
-\x3e\xb8\x17\x2e\xdf\x05\xce\xe5\xe3\x11\xd1\x3f\xe1\xd7\x05\x73\
-\x62\x90\xb6\x07\x08\x65\x8f\xd5\x61\x47\x2d\x9d\x49\xa5\x7d\x3d\
-\x3b\x2a\x07\x5e\x89\x15\x2f\x3b\x20\xc5\x92\x03\xa9\x56\x9f\x59\
-\x8b\x81\xd5\x89\x45\x07\x0c\xfd\xd5\x2d\xfd\x8e\xa1\xf7\x36\xa4\
-\x6f\x16\x22\xd2\xe0\xb0\x8d\x2e\xeb\x86\x71\xe5\x5e\xeb\x33\x48\
-\x31\x2f\x9b\x51\x0c\x71\x37\x40\xc0\x36\x9f\xde\xad\x31\xda\xba\
-\x06\x3e\x93\x75\x18\xe9\xb9\x13\xab\x8b\xde\x77\x1c\xf5\xbc\xe5\
-\xa8\xd7\x75\x7e\x68\x19\xa7\x38\xa5\xf5\x13\x24\x9b\x36\xfd\x54\
-\xcc\x8f\xad\xab\x3c\x5c\xd3\x69\x6b\xe9\x9a\xa0\x56\x33\x52\x9b\
-\x8b\x46\xc3\x08\xed\x3b\xd7\xcd\x45\x1d\x31\x38\x64\xc5\x46\x7b\
-\xb6\xa6\x1b\x4b\x1a\x06\xb1\xc1\xf0\x81\xb4\xc6\x31\x62\x55\x66\
-\x4e\x98\xd2\x91\xf7\x43\x31\x44\x5c\x90\x88\xb2\xb5\x13\x27\x75\
-\xe3\x74\xea\x3e\x4e\xa1\x47\x52\xd4\x0f\x92\x8f\xbc\x75\x04\xe2\
-\x9a\x24\x10\xdf\x3c\x6f\xf2\x6e\x42\x9b\x17\xb0\x77\xb2\x96\xc8\
-\x1f\xbc\x48\x2e\xe9\xe2\x0a\x1a\x87\xc8\x7b\x5b\xbb\x03\x24\x8f\
-\x44\xdf\x89\x05\xd1\xd5\x96\x44\x4d\x1f\xa5\xd5\xe3\x24\xf2\x49\
-\x38\xf2\x4d\xd7\x3a\x20\xfa\x4a\xd4\xb4\xf3\x48\x68\xdd\xbc\x78\
-\xcb\xdd\x37\xbe\x19\x7a\x72\x97\xe9\x07\x20\xf1\x9e\x80\x07\xc1\
-\x05\x00\xc1\x2a\x3e\x84\x14\x7b\xf0\xc3\xd5\xdc\xd2\xb2\x31\x5a\
-\x5e\x8e\xb4\xa2\x02\xc9\xd7\x89\x8f\xf2\x35\x09\x62\x6a\x47\x21\
-\xb2\x86\x0f\x91\xb5\xc2\x69\xe5\xf1\xda\xf9\x42\xe9\xed\x9b\xb0\
-\xf1\x16\x09\xa5\xba\x33\x3c\x08\x53\xe9\x41\x94\x47\xb0\xfe\x18\
-\x09\xd8\x4b\xdc\xc2\x13\x48\x8b\x4a\x91\xbc\xca\x90\xbc\xd5\x48\
-\x9e\x07\xcd\x04\xe1\x15\x04\x1b\x34\x04\xe2\x2a\x82\x88\xf3\xb1\
-\xd3\xc9\x5d\xc3\xcf\x85\xf8\xa6\x8f\x3c\x08\xdc\xc3\x42\x50\x8e\
-\x5d\xb8\xf3\x09\xb9\x2b\xed\xc4\x14\x21\x2d\x38\x8e\xe4\x51\x8c\
-\xf4\xf5\x11\xcf\x12\x27\xaa\x51\x72\x4b\xba\x8e\xfc\xa8\xb3\x26\
-\x08\x2f\x67\x66\xfc\xfb\x31\x75\xfc\xa9\x4d\x40\xa6\x53\xbe\xdf\
-\x0e\x59\x9d\x24\x50\x22\xb9\x39\x71\x2f\x44\x62\x54\x4e\x0a\x6d\
-\x24\x90\x5c\x45\x10\xab\x4d\x10\x52\xc4\xcc\xba\x15\xe0\x9f\xce\
-\x42\xe0\x2e\x3b\x64\x1a\x09\x14\x48\x90\x8f\xc4\x57\xd8\x08\xd8\
-\x8b\x08\xa1\x05\x26\x08\xca\x65\x7e\xbb\x15\xb0\x3a\x95\x85\xb5\
-\x19\x76\xd8\xfe\x94\x20\xc7\x29\x8d\xad\x42\x10\x1d\x32\xc1\xba\
-\x6c\xe6\x8f\x5b\x01\xab\xa4\x2c\xac\xd9\x6a\x87\xd0\x7c\x84\xc0\
-\x2c\x13\xf8\xa7\x31\x7f\x2d\x42\xe0\xc7\x26\x80\xbf\xfc\x1a\xf8\
-\x49\x98\xff\x37\x9b\x73\xe2\x2f\xa2\x1b\x1e\x1b\xcd\x61\xd4\x10\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0c\x75\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
-\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x0a\x88\
-\x49\x44\x41\x54\x68\xde\xed\x99\x69\x6c\x5c\x57\x15\xc7\x7f\xf7\
-\xbe\x37\xf3\xc6\xe3\xf1\x78\xc6\xeb\x38\xa9\x1d\xdb\x49\xea\x38\
-\x01\xda\xa6\xa4\x4d\x4b\xdb\x20\xa0\x69\x4b\x69\xa8\x00\x81\x40\
-\xec\x4b\xa5\x7e\xa0\x80\x84\xc4\x22\xf8\x80\x58\xba\x7c\x43\x42\
-\x2d\xb4\x65\x29\x48\x2c\x55\x09\xa5\xa4\x2d\xab\x04\x69\xc3\x52\
-\x52\xc7\x71\x1c\x7b\xec\x7a\xbc\xc4\x76\xec\xb1\x3d\x63\x7b\xc6\
-\x9e\xf5\xbd\x77\xf9\x30\x8b\xc7\x13\x3b\x71\xdc\xd2\x14\xd1\x23\
-\x5d\xbf\xfb\xe6\x9d\x7b\xdf\xff\x7f\xee\x39\xe7\x9e\xfb\x0c\xaf\
-\xcb\xeb\xf2\xff\x2d\xe2\xbe\x07\xbe\x0d\x80\xa6\x69\x68\x9a\x76\
-\xa9\xf1\x6c\x48\x2c\xcb\xc2\xb2\x2c\x00\xf4\x96\x96\x16\x42\xa1\
-\x90\x27\x95\x4a\x35\x2a\x65\x3b\x2f\x35\xb8\x8d\x88\x10\x32\xa3\
-\x69\x5a\xb8\xbd\x7d\xfb\x92\x3e\x3c\x3c\x5c\xed\x76\xbb\xef\xae\
-\xae\xf6\xbd\xdf\x70\x1a\x15\x80\xba\xd4\x00\x2f\x84\x3f\x9d\x49\
-\x25\x17\x17\x17\x1f\x1f\x19\x19\x7e\x48\x37\x4d\xb3\xd9\xe7\xf3\
-\xdf\x79\xfd\xfe\xeb\xaf\xaa\xad\xad\xc7\x56\x36\xe2\x52\x43\x5c\
-\x47\x14\x20\x85\x60\x2e\x32\xc7\xdf\xff\x71\x2c\x13\x8f\xc7\x8f\
-\xe8\x4a\xd9\x4e\x97\xe1\x32\x6a\x6b\xeb\xf0\x78\x2a\x31\x4d\xf3\
-\x52\xe3\x3c\xaf\xe8\xba\x8e\x52\x0a\x97\x61\x18\x4a\x29\xa7\x5e\
-\xe0\x66\xdb\x36\xa6\x99\x7d\xcd\x13\x00\x85\xad\x56\xbc\x5c\xbf\
-\x98\xa1\x42\xac\x76\x2e\xa5\xd4\x05\xf5\xd6\xd3\xd9\xbc\xac\xc6\
-\xb0\x61\x02\xa6\x69\x12\x9e\x99\x25\x99\x4c\xe6\x06\xea\x3a\x81\
-\x40\x23\x15\x2e\x17\x05\x8c\x42\xe4\xf4\x16\x16\x63\x98\xa6\x89\
-\x43\xd7\xa9\xae\xae\x46\xd7\xcf\x4d\xcf\xb9\x31\x2f\x9f\xdc\x86\
-\x08\x48\x29\x19\x9f\x98\xe4\xa1\x87\x1f\xe5\xcc\xf8\x04\x42\x0a\
-\x2a\xdd\x6e\x3e\xf3\x89\x8f\x73\xdd\xfe\x6b\x4a\xf4\x04\x73\x91\
-\x28\x0f\xfe\xe0\x11\xa6\xa7\xc3\x5c\xb6\x75\x0b\x77\xdf\xf5\x69\
-\x1a\x1b\x1b\x50\x4a\xad\x22\xba\x9e\x5c\x2c\xb1\xf3\x10\x10\x80\
-\x42\x08\x81\x52\x8a\xbe\xfe\x20\xbd\xa7\xfb\x88\x2f\x2f\x23\x85\
-\x40\x08\xc1\xbf\xbb\xba\xb8\x7a\xef\x55\x18\x86\x81\x52\x39\xdd\
-\x4c\x26\x43\x68\x78\x84\xd1\xb1\x31\xd2\x99\x34\x99\x6c\x16\x21\
-\x24\x42\x28\x40\xe4\x5d\x4a\xe5\x1c\x41\x88\x22\x58\xa5\xc4\x1a\
-\xe4\x54\xd1\x05\xd7\x73\x45\x7d\x35\x64\x51\xe2\xbf\xb9\xbe\x10\
-\x82\x58\x7c\x89\x9e\xde\xd3\x2c\x27\x12\xe8\x9a\x86\x10\x02\xd3\
-\x34\x39\xdd\x17\x24\x3c\x33\x43\x5b\xeb\x36\x6c\xdb\x2e\xea\xaf\
-\x34\x89\xa6\x69\x64\xb3\x59\xa2\xf3\x51\xb2\x19\x93\x2a\xaf\x07\
-\x6f\x95\x17\x21\x59\x05\x5c\x4a\x41\x36\x9b\x25\x16\x8f\xb1\xbc\
-\x9c\x40\x29\x85\xbb\xa2\x02\x8f\xa7\x12\xa7\xd3\x59\xc4\x55\xbe\
-\x7a\x45\x02\x42\xe4\xfe\x94\x06\xa0\x10\x02\x29\x25\x93\x93\x67\
-\x09\x0e\x0c\x60\xdb\x36\x2d\xcd\xcd\x54\x55\x79\xe8\xeb\x0f\x32\
-\x3e\x31\x41\x70\x60\x90\xb6\x6d\xdb\x8a\xba\x39\xe0\x2b\x16\x1c\
-\x19\x1d\xe3\xc8\x33\xcf\x72\xbc\xeb\x04\xa9\x54\x8a\x96\xe6\x66\
-\x6e\xbf\xed\x16\xae\xdd\xb7\xaf\x18\x1b\x4a\x29\x46\xc6\xc6\xf8\
-\xeb\xdf\x8e\xd2\xdd\x73\x8a\x48\x34\x8a\x52\x0a\x6f\x55\x15\x7b\
-\xaf\xbc\x82\xf7\xbc\xfb\x10\x35\x35\xfe\xfc\x2a\x9c\x27\x88\x73\
-\x2f\x5e\x01\x20\x84\xc0\xb6\x6d\x4e\xf7\xf7\x33\x35\x1d\x46\xd3\
-\x34\xf6\x5d\xbd\x97\xad\x5b\xb7\x30\x3a\x3a\x46\x3c\x1e\xa7\xa7\
-\xb7\x97\x9b\x6e\xbc\x01\x4f\x65\x65\x71\x4c\xe1\x1a\x9d\x5f\xe0\
-\xc7\x8f\xfd\x8c\xc9\xa9\xb3\x64\xb3\x26\xa9\x54\x8a\xe1\x91\x51\
-\xce\x8c\x8f\xe3\x32\x0c\xde\x7c\xf5\x5e\x84\x10\x04\x07\x06\x79\
-\xf8\x87\x3f\xe2\x78\xd7\x09\x32\x99\x0c\x4e\xa7\x13\xc3\x30\x98\
-\x98\x98\x60\x79\x39\xc1\xdb\xde\x7a\x80\xba\xba\x5a\x2c\x2b\xbf\
-\xca\x6b\x13\x28\x5d\xfa\x95\xfb\x78\x3c\xc6\x89\xee\x93\xa4\x52\
-\x29\xbc\x5e\x2f\x6f\xbe\x7a\x2f\x5b\x9a\x02\x3c\xfd\xec\xef\x19\
-\x18\x1c\xa2\xaf\x3f\xc8\xd4\xf4\x34\x1d\x3b\x77\x16\xe3\x00\x04\
-\x08\x41\x2c\x16\x63\x4b\x53\x80\xbb\x3e\xf5\x49\xdc\x15\x15\xfc\
-\xe1\xcf\x7f\xe1\xc5\x17\xbb\x18\x1e\x19\xe5\xd9\x3f\xfe\x89\x5d\
-\xbb\x76\xa1\x69\x1a\xbf\x3d\x72\x84\x7f\xfd\xfb\x38\xb6\x6d\xd3\
-\x71\xf9\x4e\x6e\x3d\x78\x33\x5b\x9a\x9a\x98\x9d\x9b\x65\x76\x76\
-\x0e\x97\x61\xac\xc2\x77\x9e\x20\x16\xab\x56\x41\x08\xc1\xe8\xd8\
-\x19\x06\x06\x5f\x02\xa0\xb5\xa5\x85\xdd\x9d\xbb\xf0\xfb\x7c\xec\
-\xe9\xec\x24\x34\x3c\xc2\xc4\xe4\x24\x7d\x7d\x41\x2e\xdf\xb1\x23\
-\xef\x42\x45\xe7\xa6\xb2\xb2\x92\x0f\xbc\xef\xbd\xdc\x7a\xcb\x41\
-\xa4\x10\xf8\xfd\x7e\x46\x47\x47\x99\x9a\x0e\x13\x1c\x18\x24\x1c\
-\x0e\x23\xa5\x46\xd7\x89\x6e\x4c\xcb\xa2\xb6\xc6\xcf\x47\x3f\xfc\
-\x21\xde\x76\xe0\x00\x9a\x26\xb1\x2c\x8b\x44\x32\x89\xc3\xe1\x80\
-\xa2\x71\x0a\x09\x26\x27\xb2\x3c\xef\x94\x06\xa1\x65\x59\x74\xf7\
-\xf4\x10\x8d\x46\x91\x52\x52\x5f\x5f\xc7\xdc\x5c\x84\x33\xe3\xe3\
-\xf8\x6b\xfc\x38\x9d\x4e\x12\x89\x24\x5d\xdd\xdd\x2c\x27\x12\x79\
-\x02\x05\xfc\x8a\x6a\xaf\x97\x1d\x3b\xb6\xa3\x49\x89\x94\x92\x6d\
-\xcd\xcd\xd4\xd7\xd5\xa3\x94\x22\xbe\xb4\xc4\xc2\xc2\x22\x91\x68\
-\x94\xc5\x58\x1c\x14\x04\x1a\x1b\xd9\xd3\xd9\x89\xa6\x69\x28\x05\
-\x52\x6a\x54\xba\x2b\x71\x3a\x9c\xf9\xf8\xcc\xbb\xa8\x58\x6f\x05\
-\xf2\xcb\x9f\x0b\xc8\x5c\x4e\x3f\xd9\x73\x2a\x9f\x0a\x05\xdd\x27\
-\x7b\x18\x1d\x1d\x03\x01\x89\x44\xb2\x58\x93\xf7\x05\x83\x4c\x4c\
-\x4c\xe2\xdb\xe3\x5b\x95\x26\xa4\x94\xe8\x9a\x5e\x34\x88\xa6\x6b\
-\x48\x2d\x67\x33\x65\xe7\x52\xa4\xad\xf2\xa9\x52\xe4\x36\x47\x5d\
-\xd7\x8b\xa9\xbb\x10\x4b\x05\xd7\x5c\x2b\x93\xca\x72\xfc\x2b\x41\
-\x28\x19\x0a\x85\x08\x0d\x8f\xe4\x37\x21\x45\x24\x3a\xcf\xd0\xc8\
-\x08\x43\xa1\x11\xa6\xa6\xa7\xb1\x2c\x0b\x21\x04\x33\x33\x33\x74\
-\xf7\xf4\x60\xdb\x36\x52\xc8\xe2\x3c\xf1\xa5\x25\xa6\xa6\xa7\xf3\
-\x87\x25\x9d\xd9\xb9\x08\xd1\xf9\x79\x84\x10\xb8\xdd\x6e\xbc\x5e\
-\x2f\x35\x7e\x3f\x95\x6e\x37\x02\x98\x99\x9d\xe5\xcc\xf8\x78\x8e\
-\xb8\xae\xa3\x69\x1a\x96\x65\xa1\x94\x5d\x24\x73\xc1\x18\x28\xe4\
-\xe4\x74\x3a\x4d\xcf\xa9\x5e\xa2\xf3\xf3\x48\x4d\x63\xf7\xae\x0e\
-\x76\x75\x74\x20\x8b\x41\x0a\x67\xcf\x9e\x2d\xa6\xc7\xae\x13\x27\
-\xb9\xfd\xb6\xdb\x90\x72\xc5\x26\xb1\x58\x8c\x27\x9f\x3a\x82\xae\
-\xeb\xb8\x0c\x17\xbf\x7b\xfa\x19\x66\x66\x66\x91\x52\xd2\xd6\xba\
-\x8d\xa6\xa6\x26\x34\x4d\xa3\xb3\xa3\x83\xa9\xe9\x69\xe6\xe6\x22\
-\xfc\xf2\xf1\x27\x48\xa7\xd3\x34\x36\x34\x12\x89\x46\x09\x87\xc3\
-\x5c\xbb\x6f\x1f\x8d\x8d\x0d\xd8\xb6\x5d\x0e\x75\xed\x9d\x58\x08\
-\xc9\xcc\xec\x2c\xdd\x27\x7b\x48\x24\x93\xf8\x7d\x3e\xee\xbc\xe3\
-\x0e\x6e\xbb\xe5\xe6\xe2\x68\x4d\x4a\x4e\xf7\xf7\x33\x3e\x31\xc9\
-\x50\x28\x44\x70\x60\x80\x50\x68\x98\xfa\xfa\x3a\x6c\x3b\x57\xdd\
-\x3a\x1c\x0e\x06\x5e\x7a\x89\x6f\xde\x7b\x7f\xbe\x8e\x8f\x90\x4e\
-\xa7\xa9\xaf\xaf\xe3\xe0\x3b\xde\x4e\x8d\xdf\x8f\x10\xf0\xee\x43\
-\xef\x62\x6c\x7c\x9c\xa1\x50\x88\xe7\xff\xfe\x0f\xfa\x83\x03\x78\
-\xaa\x3c\xc4\xe3\x4b\xd4\xd7\xd5\xb2\xbb\xb3\x93\xa6\xa6\xc6\x35\
-\x5d\x48\x3f\x17\xbc\xc8\xbb\x4b\x14\xa9\x69\x74\xec\xdc\x41\x4b\
-\x73\x33\x57\xbc\xe9\x8d\xb8\xdd\x95\xf9\xe5\xcc\x11\xd8\xde\xde\
-\xce\x5b\xae\xdb\x9f\xb7\xb0\x41\x78\x66\x86\xa6\x40\x23\xed\x6d\
-\xad\x38\x1c\x0e\x9a\x2f\xbb\x8c\xb7\x1e\xb8\x89\xa3\xcf\x3d\xcf\
-\xe9\xbe\x3e\xaa\x3c\x1e\x76\x6c\x6f\xe7\x8e\xdb\xdf\xc9\x81\x9b\
-\x6e\xcc\xaf\x96\x62\xff\x35\xfb\xd0\x35\x9d\xa7\x9e\x79\x9a\x60\
-\x70\x90\x58\x3c\xc6\xc2\xc2\x02\x2e\x97\x8b\xf6\xb6\x36\x3c\x9e\
-\xca\x95\x3a\xea\x42\x04\x0a\x19\xa4\x6d\x5b\x2b\x5f\xfc\xfc\x3d\
-\x28\x5b\x51\x51\x51\x41\x20\xd0\x98\xf7\x79\x00\x85\x65\x2b\xaa\
-\xaa\xaa\xf8\xd8\x47\x3e\xcc\x9d\x87\x0e\x21\x04\xf8\x7d\x3e\xbc\
-\x5e\x2f\x5f\xb8\xe7\xb3\x64\x32\x19\x0c\xc3\xa0\x29\x10\xe0\x86\
-\xeb\xf6\x33\x32\x3a\x46\x32\x99\x24\x10\x68\xa4\xa5\xa5\x05\xc3\
-\xe9\x2c\x16\x78\xba\xae\x73\xed\x35\xfb\xd8\xd5\x71\x39\x13\x93\
-\x93\x44\xe7\xe7\xb1\x6d\x9b\x6a\xaf\x97\x40\xa0\x91\xda\x9a\x9a\
-\x62\x1c\x5c\x70\x05\x72\xc5\x95\xa0\xba\xda\x8b\xdf\xef\xa3\x50\
-\x6e\x15\x8a\xb0\x52\x1b\x08\x21\x68\x6c\x68\xa0\x29\x10\x28\x30\
-\x47\x01\x6d\xad\xad\xab\x8c\xd1\xd0\xd0\x40\x43\x43\x43\xf1\xde\
-\xb6\xed\x92\xf9\x56\xc4\xe7\xab\xc6\xef\xf7\xad\x2a\xdc\x6c\xdb\
-\x2e\xd1\xdf\x00\x01\xa5\x72\xd9\x48\x29\x1b\xcb\x5a\x49\x65\x2b\
-\xee\x55\x78\x0e\x42\xa8\xe2\x0b\x4a\x8b\xad\xc2\xb8\xc2\x7d\x69\
-\xec\x9d\x5b\x5d\xaa\x62\x09\x9d\xd3\xb3\x8b\xf7\xe5\xa0\x95\x3a\
-\xb7\xd0\xd6\x0b\x16\x15\x42\xa0\xc9\xc2\xc1\xa3\xb4\x20\x5b\x4d\
-\xe0\xdc\xe7\xab\xfb\x17\x92\xf2\xaa\x72\xc5\x20\xa2\xa4\xe4\x3e\
-\x97\x40\xa1\xaf\x49\x6d\x55\x2a\xd5\x85\x10\x99\x54\x3a\x9d\x89\
-\x44\x23\x20\x04\xca\x2e\xe1\x28\x56\x5d\xd6\x83\x74\x41\xd0\xe7\
-\x17\x75\xe1\x27\x25\x2a\x52\x0a\x22\xd1\x39\x52\xa9\x74\x46\x08\
-\x91\xd1\x75\x5d\x1f\x5f\x58\x98\x3f\x7c\xf4\xb9\xbf\x49\xa7\xc3\
-\x61\xa8\xd7\xf8\x77\x21\x01\x22\x93\xcd\xa6\x97\x96\xe2\x87\x75\
-\x5d\x1f\xd7\x53\xa9\xe4\xa2\x94\xf2\xa1\x64\x32\xf9\x94\x52\xca\
-\xf9\x9a\xfd\x28\x54\x10\x05\x42\x88\x8c\x94\x72\x32\x95\x4a\xc5\
-\x04\xc0\xbd\xf7\x7f\x6b\xf5\x2e\xf7\x3f\x20\x52\x4a\xbe\xf2\xa5\
-\xaf\x6d\xde\xde\x4b\x5f\x5e\xb1\x08\x9b\xe5\x2e\x29\x86\x90\xe7\
-\xbe\xcd\x4d\x71\x51\xdf\x85\xca\xc4\x01\xb4\x00\x9e\x97\x19\x35\
-\x4b\xc0\x19\x20\xfb\x6a\x13\xa8\x46\xf1\x45\x8c\xca\x1b\x64\x55\
-\x40\x21\xf5\x75\x36\xfb\x72\xc9\xab\xd9\x26\x76\x7c\x5a\x92\x5e\
-\x7e\x1e\xc1\xd7\x81\xb9\x57\x9b\xc0\xa2\x6d\x73\x0c\x87\xe7\xa0\
-\xbe\xeb\xd6\x76\xbd\xf5\x1a\xc8\xc6\xc1\x4a\x9f\x7f\x94\x66\x80\
-\xa3\x0a\x73\xf4\x05\xcc\xee\x27\x86\x49\x2e\x1f\x93\x1a\x8b\x9b\
-\x05\xb1\x69\x02\xc7\xcf\x92\xbd\xa2\x8e\x5f\x5b\x0b\x11\xc3\x1a\
-\x3c\xf6\xb5\x8a\xda\xf6\x56\x87\xc7\x01\x8b\xfd\xeb\x93\xd0\x0c\
-\xa8\x7d\x13\xd9\xf8\x1c\x89\xc1\x63\xa3\xf6\x42\xe4\x3b\x9a\xe2\
-\xd7\x93\x4b\x9b\x73\x1f\xd8\xfc\x2e\x54\x1c\x77\xf4\x83\x78\x5a\
-\xfc\xf2\xe3\xae\xd6\x2b\xbf\x5a\xbd\xff\x3d\x01\x67\x45\x16\xb5\
-\x30\x04\xca\x2c\x51\x53\x20\x74\x84\x6f\x07\x99\xa4\x83\xd8\x3f\
-\x0f\x4f\xa5\xcf\x74\x7f\x3b\x9b\xb1\x7f\xd2\xfe\x39\x96\xc5\x9e\
-\xcd\xc2\x87\x8d\xfe\x4f\x49\x90\xcb\x19\x5a\xbe\xe9\xf9\xe6\xfc\
-\x71\x2f\x4a\x98\x6a\xa8\x4d\x0b\x9b\x24\xe3\x6f\x30\xb6\x5e\x55\
-\xe9\xa8\xd9\x0a\x42\x43\x38\xaa\x10\x4e\x2f\xc2\xf0\x21\xfd\x97\
-\x93\x4a\x38\x98\x3b\xf6\x9b\x99\xb9\x60\xd7\x77\x0f\x9f\xb6\x7f\
-\x7a\xe8\x49\x92\xdf\x78\x10\x49\xd9\xc9\xf0\x95\x24\x50\x00\xad\
-\x97\x34\x27\xb9\x0c\x64\x14\xae\xff\x9c\x46\x2d\x25\xd5\x70\xbb\
-\x9c\x15\x32\x15\xdb\xed\xda\xba\xbb\xc2\x51\x55\x8b\x50\x36\x42\
-\x33\x10\x95\x4d\x24\x97\x2c\xc2\x47\x0f\x47\xc7\x7b\xbb\x1e\x79\
-\xf4\x84\xf9\xd3\x07\x8e\x93\xc8\xcf\xa7\x95\x34\xc1\x45\x7a\xc5\
-\xf9\x08\xac\x05\xde\x91\x6f\xa5\x7d\x27\xe0\x3c\x15\xc1\x8e\x2c\
-\x5b\x23\x6d\x4c\x3b\x8c\x6c\xbc\xb3\x22\xd0\xee\xd4\xdd\x1e\xd0\
-\x5d\xa4\xe2\x29\xa6\x8e\x3e\x19\x0f\x75\xbd\xf0\xb3\x87\xbb\xb2\
-\x8f\x3d\xd6\x4f\x2c\x3f\x87\x2c\x69\x82\x57\x90\x40\xb9\xcb\x94\
-\xf6\x4b\x5b\x81\x98\x06\x38\x06\x17\xc8\x46\x96\xed\xd0\x76\x31\
-\xed\x72\x99\x4b\x3b\xdd\x81\x76\xa7\x95\x31\x99\x7a\xee\x77\x4b\
-\xa1\xae\x17\x7e\xf5\xfd\x17\xb3\x3f\x7a\x62\x88\x79\x56\x5c\xe6\
-\x7c\x60\xcf\x3d\x30\x5c\xe4\x0a\x14\x48\x94\x5b\xa6\xf0\xfb\x9a\
-\x2f\x1d\x5a\x24\xa1\x2c\x6b\xb0\x4d\xce\xb8\xf5\x44\x64\x67\x7c\
-\xb4\x3f\x3b\x76\xaa\xfb\x89\x9f\xf7\xa4\x1f\xf9\xc5\x4b\x84\xf3\
-\xa0\x2c\x72\xfb\x77\x69\x53\xeb\xfc\xb6\x69\x02\x8a\xd5\x56\x50\
-\x65\xad\xfc\x65\x66\x1e\x98\xd9\x1b\x61\xa1\xc1\x69\x06\x03\x66\
-\xd8\x11\x0b\x4f\x9d\xfa\xfd\x50\xf6\xfb\xdf\xeb\x61\xbc\xf0\xbc\
-\xac\x59\x6b\x5c\x37\x4c\x60\xa3\xfe\x56\xb0\x7a\xa9\xbf\x96\xfb\
-\x6e\x49\x65\x93\x3b\x89\x7e\x7a\x0f\x55\x52\xc0\xc3\xbd\xc4\xca\
-\x8c\xb0\x9e\xd5\xcb\x8d\xb6\x21\x60\x17\x2b\xe5\xee\x54\xe8\xcb\
-\x32\x9d\x02\xe0\xb5\x56\x15\x56\x4a\xc0\x8b\x02\xfc\x4a\x10\xb8\
-\xd8\x79\xff\xab\x07\xa4\xff\x00\x98\x4f\xc9\x02\x32\xee\xf8\x5f\
-\x00\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\
-\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\
-\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\
-\xca\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
-\x65\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
-\x30\x39\x3a\x31\x31\x3a\x33\x39\x2d\x30\x37\x3a\x30\x30\x7d\x15\
-\xa2\xc7\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
-\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\
-\x54\x30\x39\x3a\x31\x31\x3a\x33\x39\x2d\x30\x37\x3a\x30\x30\x0c\
-\x48\x1a\x7b\x00\x00\x00\x34\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\
-\x73\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\
-\x63\x65\x6e\x73\x65\x73\x2f\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\
-\x6a\x06\xa8\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\
-\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\
-\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\
-\xdd\x31\x7c\xfe\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
-\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\
-\x74\x53\x6f\x75\x72\x63\x65\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\
-\x6f\x6e\x20\x54\x68\x65\x6d\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\
-\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\
-\x74\x74\x70\x3a\x2f\x2f\x61\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\
-\x6f\x72\x67\x2f\x32\xe4\x91\x79\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x12\xdd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
-\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
-\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x10\xf0\
-\x49\x44\x41\x54\x68\xde\xbd\x5a\x6b\x90\x5c\x47\x75\xfe\x4e\x77\
-\xdf\xc7\xdc\x79\xec\xcc\xec\xce\xec\x43\xab\xd5\x4a\xd6\xc3\x96\
-\x79\xc8\x2f\xa0\xf2\x2e\x62\x62\x1b\xd9\x18\x52\x84\xc0\x8f\xe4\
-\x6f\xaa\x28\xfe\x50\x95\x90\x4a\x48\xa8\x14\xf0\x23\xa9\x54\x25\
-\x24\x54\x41\xa5\x2a\x50\x21\x09\x50\x04\xbf\x28\xfc\x90\x1f\x38\
-\x38\xa1\xc0\x36\x36\xb2\x2c\x5b\x42\x92\x65\x4b\x5a\x69\x77\xf6\
-\x3d\x77\x1e\xf7\xd9\xdd\x27\x3f\x66\x47\x5a\x0b\xdb\x5a\x01\xe1\
-\xd6\x9e\x3d\x3d\x7d\x7b\x7a\xce\xd7\xe7\xeb\x73\x4e\xdf\x19\xc2\
-\x2f\x78\x3d\xfa\xc4\x43\x60\xe6\xb7\x1c\x43\x44\xb8\xed\xd6\x83\
-\xbf\xe8\x47\xbd\xf1\xdc\x57\xfb\x86\xc7\xbe\xf7\x30\xac\xb5\x00\
-\x00\xcf\xf3\xd0\xe9\x76\x84\xa3\x1c\x9f\x88\x2a\x00\x4a\x00\xbc\
-\x8d\xa1\x29\x80\x1e\x33\x77\xb4\xd6\x49\xb9\x54\xb6\x49\x9a\x5c\
-\x9c\xe7\x8e\xdf\xbb\xeb\x57\x0f\xe0\xd0\xe3\x0f\x01\xb0\x48\x92\
-\x54\x48\x25\xeb\x52\xc8\xfd\x52\xca\x1b\xa4\x94\xfb\xa5\x54\x33\
-\x52\x8a\xaa\x20\xe1\x01\x80\xb5\x36\x35\xc6\xb4\x8d\x35\xe7\x8c\
-\x31\xc7\xac\xb5\x87\x8d\xd1\xc7\x8c\xb1\x6b\x52\x4a\x4b\x44\x38\
-\x78\xfb\xdd\xbf\x3a\x00\x87\x1e\x7f\x10\x44\x42\x18\x93\xcf\x0a\
-\x21\xdf\xeb\xb9\xde\xc1\x42\x21\xb8\xa9\x18\x14\xc7\xfc\x42\xc1\
-\x73\x1d\x57\x48\x29\x41\x44\x00\x18\xd6\x5a\x68\x6d\x90\x65\xa9\
-\x8d\x93\x38\x8d\xa2\x68\x25\x4e\xa2\xe7\xb3\x2c\x7b\x48\x6b\xfd\
-\xa4\x94\xf2\x8c\xb5\xd6\xde\x79\xc7\x07\xff\x7f\x01\x1c\x7a\xfc\
-\x41\x08\x21\x60\x8c\xa9\x13\xd1\xed\xbe\xef\xff\xf1\x48\xa5\xfa\
-\xee\xea\x48\xad\x5a\x28\x14\xc0\x60\xa4\x59\x8a\x24\x8e\x90\xa4\
-\x29\xb4\xd6\x00\x00\xa5\x14\x3c\xcf\x83\xef\xf9\x70\x1c\x07\x6c\
-\x19\x51\x1c\x21\x0c\xc3\x76\xa7\x13\x3e\x93\xa4\xe9\xbf\x33\xdb\
-\x43\x00\xd6\x8c\x31\xf8\xe0\x5d\x1f\xfe\xe5\x03\x78\xe4\xb1\xef\
-\x42\x79\x2e\xf2\x24\xdd\xed\x38\xce\xc7\x47\x2a\xd5\x3f\x6c\x36\
-\xc7\xa7\x82\x20\x40\x92\xc4\x58\x5d\x5d\xc1\xd2\xf2\x32\xd6\xd6\
-\xdb\xb6\xd7\x8f\x75\x92\x19\x6d\x0c\x2c\x00\x28\x49\xc2\x73\xa5\
-\x2a\x17\x0b\x6a\x74\xb4\x2a\xc6\xc6\x1a\xa8\x55\xab\x50\xd2\x45\
-\xaf\xd7\xc5\xf2\xca\xf2\x7c\xa7\x1b\x7e\x2b\xcf\xf3\x2f\x65\x3a\
-\x7f\xc5\x51\x0a\x1f\xba\xeb\x0f\x7e\x79\x00\x1e\x7d\xe2\x21\x10\
-\x91\xd0\x5a\xdf\xe0\xfb\xfe\x5f\x37\x1b\x13\xb7\x35\x9b\xe3\x7e\
-\x96\xa7\x98\x9f\x3f\x8f\x73\xe7\xce\xf3\xfc\x62\x3b\x5a\x8f\x28\
-\xec\x9b\x20\x4c\x51\xec\x69\xf6\x52\x0b\x69\x00\x40\x40\x4b\x85\
-\xd4\xf3\x28\x2a\x95\x54\x34\x52\x2f\xd2\xc8\xb6\x89\x5a\xb0\x7d\
-\xfb\x34\x35\xc7\x9a\x60\x00\x4b\x4b\x8b\xc9\xca\xca\xf2\xa3\x49\
-\x9a\x7c\x4e\x4a\x79\x98\xb5\xb6\x77\xdf\xfd\x91\x5f\x1c\xc0\x03\
-\xdf\xbd\x07\x41\x10\x90\xd6\xfa\x66\xdf\x2f\x7c\x76\x7a\x6a\xfa\
-\xd6\x7a\x7d\x4c\xad\xb5\x57\x70\xf2\xd4\x49\x9c\x39\xb7\x14\xb5\
-\x3a\x6a\xb1\x8b\xb1\xc5\x5c\xd6\x7a\x90\x9e\x21\x12\x4c\x00\x31\
-\xc0\xcc\x0c\xcb\x60\x6b\x19\xcc\x16\x64\x33\xe5\x23\x2c\x57\xc5\
-\xea\xf8\x54\xd5\x8e\xef\xda\x31\x11\xec\x9c\xdd\x89\x82\x5f\xc0\
-\xf2\xf2\xb2\x5e\x68\xcd\x3f\x91\xa4\xc9\x67\x14\xe8\xb9\x7e\x9a\
-\xf0\xc7\x3e\xf2\x47\x5b\x06\xa0\xde\xa8\x53\x4a\x89\x34\x4d\x77\
-\x17\xfc\xc2\x5f\x4c\x4d\x4e\xdf\x3a\x3a\xda\x50\xf3\xad\xf3\x78\
-\xf9\xd8\x31\x7b\xfa\x7c\x77\x75\x45\x8f\x9f\xcd\x9d\xf1\xb6\x74\
-\x7c\x53\x90\x24\x04\x41\x02\x20\xe6\x41\x46\xb0\x96\xd9\x32\xb3\
-\xb5\xc4\xc6\x12\x1b\xeb\xeb\x98\x0b\x6b\x29\xd7\x3b\xbd\xf5\xe5\
-\xd5\x4e\xbc\xb0\x23\x8a\xe2\xd1\x7d\x7b\xf7\x8a\xe6\xf8\xb8\xb2\
-\x6c\x6f\xbd\x30\x7f\x21\x4e\x92\xe4\xcf\x05\x89\x53\x57\xe3\x01\
-\x79\x79\xc7\x77\x1e\xbc\x17\xcc\x3c\xe2\x38\xce\x9f\x4d\x4e\x4c\
-\x7d\x6c\x62\x7c\xc2\x9d\x6f\x9d\xc7\x0b\x47\x5e\x32\x27\x2f\x24\
-\x0b\x2b\xb8\xe6\x14\x05\x13\xbd\xc0\xf7\x84\xef\x90\x54\x8a\xa4\
-\x92\x24\xa4\x20\x48\x49\x24\x05\x91\x20\x22\x21\x04\x09\x02\x11\
-\x81\x06\x5d\x00\x20\x6d\x46\xe5\xa8\xa7\x0b\xed\xb8\xbb\xea\xd8\
-\xac\x53\xac\x8e\x94\xc5\x68\x7d\x54\x68\xad\x77\x46\x51\x9f\xb4\
-\xd6\x4f\x7f\xf8\xc3\xbf\x9f\xde\x7b\xcf\xfd\x3f\xb7\x07\x24\x11\
-\xdd\x51\x1d\xa9\x7e\x74\xbc\x39\xe1\xaf\xad\xaf\xe2\xe5\x63\x3f\
-\xb5\xaf\xb6\xf2\x85\xb6\xdc\x7d\xda\x2b\x54\x73\xcf\x15\x4a\x12\
-\x11\x11\x30\xf8\x3f\xb8\x98\x87\xf4\x61\xb6\x16\x6c\x2c\xb1\xb0\
-\xcc\xc6\x5a\x26\x03\x61\x89\xd9\x32\xb1\xb6\x95\xa8\x65\xe4\x2b\
-\x72\xfe\x02\x3c\xf7\xf4\xd4\xf5\xfb\xaf\x13\x93\x13\x93\x7e\xbf\
-\xdf\xff\xe8\x6a\xbe\xf2\x8c\x35\xf6\xdb\x00\xcc\x55\x7b\xe0\xde\
-\x07\xbe\x05\x22\x9a\xf5\xbd\xc2\xa7\x67\x66\x66\xdf\x29\x84\xa0\
-\xe3\xc7\x8f\xe1\xa7\x67\xd6\x56\x56\x69\xd7\x69\x37\xa8\x67\x81\
-\x2f\x95\x23\x85\x70\x94\x14\x4a\x0a\xe1\x48\x41\x4a\x0a\x92\x1b\
-\x5a\x88\xa1\xd0\x45\xd9\xb8\x40\x00\x68\xc3\x2b\x06\x6e\x9e\x58\
-\x37\xe2\x64\xa5\x58\xf4\x50\x1c\x1b\x6b\x40\x49\x59\x0c\x3b\xed\
-\x52\xae\xf3\x1f\xdc\xfd\xa1\x0f\xb4\xef\xbf\xef\x3b\x57\xe7\x01\
-\x22\x92\x00\xde\x57\xad\x56\xdf\x53\x2a\x95\xe8\xec\xb9\xd7\x70\
-\xe6\xfc\x52\xbc\x6e\x27\xcf\xaa\xa0\x9e\x04\xbe\x50\x8e\x94\x42\
-\x4a\x31\xa0\x8a\xd8\xf0\x02\x08\x8c\xc1\xee\xb5\x0c\xb6\x0c\xb2\
-\x96\xd9\x58\x66\x63\xac\x15\x52\x90\xd0\x16\x5a\x08\x6b\xac\x85\
-\xb5\x0c\x32\x56\xa4\xb6\xd2\x6f\x25\xe9\xd9\x33\xe7\x17\x4b\xa3\
-\xa3\xa3\x85\x5a\xad\x4e\xd5\x91\xda\x7b\xe2\x38\x79\x1f\x88\xbe\
-\xb2\x15\x2f\x88\x61\xe3\xab\x5f\xfb\x0a\x8c\xd1\x0d\xd7\x71\x6f\
-\x1b\x1d\x1d\xab\xc6\x71\x84\xf3\x17\xe6\x79\x25\xf2\x16\xad\x3f\
-\xde\x09\x7c\xa5\x5c\xa5\x84\xeb\xc8\xcb\x44\x09\x67\x53\x7b\xa3\
-\x9f\x5c\x47\x92\xe3\x48\xe1\x38\x4a\xb8\x4a\x92\xb3\x31\xce\x71\
-\x14\x29\x25\x07\x22\x25\xf5\xb8\xbe\xde\xea\xc8\xc5\x56\x6b\x91\
-\x41\xc0\xd8\xe8\x58\xd5\x75\x9c\xdb\xac\xd6\x8d\x2f\x7e\xe9\x0b\
-\x5b\xf7\x80\xd1\x12\xcc\xd8\x17\x04\xc5\x03\x41\x50\xc4\xe2\xd2\
-\x3c\x96\xd7\x7a\x71\x9f\x26\x96\x3d\xbf\xc0\xae\xab\x84\x23\x85\
-\x50\x4a\x90\x23\x05\x49\x49\x62\x83\x1e\x60\x00\x60\x0c\x22\x10\
-\x33\x0d\xf8\xcf\x4c\x96\x59\x08\x2b\x48\x90\x85\x60\x10\x11\x91\
-\xb1\x10\x43\x1e\x91\x45\x4e\x9e\x5d\xd7\xb5\xa5\xc5\xb5\xb0\x39\
-\xd3\xef\x05\x95\xca\x08\x82\x20\x38\xd0\xed\x75\xf7\x59\x50\x6b\
-\xcb\x1e\x50\x8e\x96\x42\x88\x03\xa5\x52\x69\x0a\x60\xac\xad\xad\
-\x21\x4c\x64\x87\xbd\x7a\xe4\xb9\x4a\x3a\x52\x90\x52\x02\x8e\x23\
-\xc9\x71\x25\xb9\x8e\x82\xe7\x28\x72\x1d\x49\x9e\x23\xc9\x75\x07\
-\xab\xee\x3a\x6a\xd0\x76\x37\xb4\xa3\xe0\x0e\xc6\xc1\x71\x24\x5c\
-\x57\xc1\x71\x06\x1e\x90\x4a\x92\x52\x02\x29\x55\x7a\x6b\x3d\x84\
-\x61\xa7\x03\xd7\x75\x51\x2a\x95\xa7\x84\x90\x07\x04\xac\xbc\x12\
-\x80\x8b\x1e\x20\x82\xa7\xa4\xda\x5f\x28\x04\x5e\x9e\x67\x08\x3b\
-\x3d\x93\x72\xb1\xa3\xdc\x82\x71\x94\x90\x52\x0a\x80\x48\x74\xa3\
-\xd4\x23\xb0\x94\x72\x18\x26\x07\x41\x88\x87\x81\xc8\x02\x96\x99\
-\xcd\x20\x91\x6d\xec\x03\x66\x6d\xac\xd5\xc6\xb2\xb1\xcc\x00\x19\
-\xd7\x75\x52\x05\x69\x00\x22\x03\x4f\xf7\x4d\xa1\xd3\xe9\xf6\x9a\
-\xd3\x80\x2c\x06\x25\x4f\x49\xb5\x9f\x88\x3c\x00\xd1\x16\x01\x50\
-\x51\x4a\x35\xe3\xba\x2e\xa5\x69\x82\x28\xc9\xb4\x91\xa3\x91\xe3\
-\x38\x90\x42\x90\x90\x92\x92\x34\x75\x4e\x9e\x59\x98\x2c\x78\xd2\
-\xf5\x94\x04\x68\xe3\x6f\x08\x62\xc0\x25\x66\x06\x86\x19\xf9\x52\
-\x68\x1d\xe8\x2c\x37\xe8\xa7\x36\x99\x99\x1a\x9f\xf3\x5c\x37\xc9\
-\x0d\x73\x9c\x53\xde\xb5\x6e\xb7\x17\xa5\xda\x58\x23\x0b\xbe\x4f\
-\x52\xca\x19\x22\x51\xdc\x32\x00\x00\x81\x10\xa2\x2e\xa5\x44\x14\
-\xc7\xc8\x35\x6b\x96\x41\x26\xc5\x20\x4b\x29\x29\x88\x19\xa2\xe4\
-\x2b\xf7\x03\xbf\xbe\xd3\x1f\xaf\x15\xd8\x32\xe8\x4d\x8a\xa9\xe1\
-\xb6\xd8\x00\x35\x38\xb4\x11\x11\x16\xd7\x23\xdc\xff\xbf\xaf\x22\
-\xce\x0c\xaf\x45\x59\x7c\xea\x42\xaf\x3f\xbf\x9a\x24\x7b\xea\x09\
-\xf6\x37\xcd\x5e\x6b\xad\xe7\xb8\x2e\xa4\x10\x75\x00\xc1\x96\x29\
-\xc4\xcc\x2e\x80\x02\x81\x60\x8c\x81\x65\x62\x21\x1d\x4b\x82\x90\
-\xe4\x56\x27\x1a\x9c\xe6\xac\x1c\x25\x31\x5e\x2b\xf0\x78\xd5\x83\
-\xb1\x16\x83\x20\xfa\x26\x08\x06\x00\x18\x00\x2c\x03\x52\x08\x6b\
-\x2c\x23\x33\xc8\x5e\x7c\xb5\xbb\xda\x0a\x79\xad\xdd\xcb\x74\x9a\
-\x59\xae\x28\x1b\x67\x1a\x39\x33\x43\x08\x01\x10\x15\x36\x6c\xda\
-\x1a\x00\x6b\x99\x2c\xdb\x8b\xe7\x5b\x21\x04\x48\x08\xac\x74\x75\
-\x7c\x6a\x21\xea\xc5\x39\x1b\x57\xe8\xca\xb6\x92\xde\x96\x1b\x28\
-\x0b\x22\xc6\xa0\x6c\x18\x30\xf0\x75\xd6\xd3\x60\x4d\x88\x19\x83\
-\xdc\x60\x0c\x5b\x6d\xd9\xc6\xb9\xe5\x76\xa4\xb3\xd7\x96\x74\x94\
-\xb3\x93\x0b\x29\x49\x2a\x82\x94\x02\x42\x30\x09\x31\xa4\x23\x83\
-\xad\xbd\xe2\x79\x65\x13\x00\x93\x1a\x6d\x62\x6b\x2d\xa4\x94\x70\
-\x94\x10\x79\xac\x71\xf4\x5c\x3f\x3c\xbf\x9a\x26\xca\x51\x90\x9c\
-\x3b\x05\x9b\xe5\x67\x16\x7b\x3a\xd5\x0c\x30\x0f\x32\x2c\x81\xc4\
-\x26\x47\x30\x83\x2d\xc0\x1b\x15\x29\x5b\x66\x66\x0b\x26\x01\xb4\
-\x56\x23\x4a\x33\x03\x29\x5d\x30\x14\xac\x35\x10\x16\x08\x3c\xa1\
-\x7c\x8f\xa4\x14\x12\xc6\x24\xd0\x5a\xc7\xc6\x98\x74\xcb\x00\xb4\
-\x36\x51\x9e\xe7\x6b\x79\x9e\xc1\x51\x0e\x7c\x57\xaa\x28\x8e\x78\
-\xbe\x2d\x92\x41\x10\x17\x44\x42\x9a\xc5\x8e\xee\x7d\xfd\xc9\x57\
-\x8d\xe7\xca\x01\x79\x08\x18\x56\xe5\xbc\x09\xc0\x60\x23\xf3\x70\
-\x23\x0f\x77\x38\xd2\x5c\xd3\x62\x47\x47\xd2\x29\x5a\x6b\x25\x01\
-\x0c\x29\x81\xd1\x12\x0a\xe5\xc0\x75\x94\x72\x90\xa5\x29\xf2\x3c\
-\x5f\xd3\xc6\x44\x5b\x07\x90\x67\xfd\x2c\x4b\xe7\xe2\x38\x46\xad\
-\x5e\x45\x50\x70\x15\xeb\xbe\x9b\xe4\x81\x15\x52\xc2\x82\x60\xa5\
-\x97\xc4\x72\xec\xf8\x6b\x3d\x16\x24\xc4\x90\xab\x18\x24\x33\x02\
-\x00\xb6\x00\x86\x89\xcc\x5a\x86\xb6\xcc\xd6\xda\xa1\x3b\x36\x28\
-\x5a\xb2\x50\x2a\x11\xc6\x82\x21\xe1\x12\xc4\xb6\x11\x1e\xa9\x55\
-\x8a\xae\x90\x12\xfd\xa8\x8f\x34\x4b\xe7\xf2\x3c\xef\x6f\x19\x80\
-\x31\x26\x4d\xd3\xf4\xa5\x6e\xb7\x93\x8c\x8e\x8d\xf9\x95\x72\x49\
-\xd4\xfd\x95\x6a\x41\xe5\x4e\xdf\x3a\xa9\x82\x10\x16\x52\x1b\xe5\
-\x77\x95\x12\x10\x52\x42\x0c\xaa\x35\x26\x1a\x00\xb1\x20\xa6\x8d\
-\x74\xcc\x16\xcc\xd6\xb2\xb4\x0c\x61\x2d\xac\xb5\xb0\xc6\xc2\x5a\
-\x03\x6b\x0c\xc8\x18\x12\x30\xb0\x16\x5c\x0b\xb4\xbf\xb3\x41\x8d\
-\x7a\x75\x44\x59\x6b\x11\x86\x61\x92\xa6\xe9\x4b\x46\xe7\x57\xa4\
-\xd0\xc5\x4c\x2c\xa5\x34\x59\x9e\x1f\x69\x87\xe1\xbc\xd6\x1a\x95\
-\x4a\x05\x33\xa3\xb2\x31\x3b\x92\xd6\x2c\x0b\x36\x4c\xd6\x32\xb1\
-\x05\xc1\xb0\x80\x65\x1a\x78\x05\xe2\xa2\x30\x09\x30\x09\x86\x90\
-\x80\x10\x10\x52\x92\x94\x92\x84\x1c\x84\xe2\x41\x11\x38\xac\x56\
-\xe5\x20\x50\x48\x81\xdd\x63\x79\x6d\xf7\x44\xa1\x51\xa9\x54\x10\
-\xf5\x23\xac\xb7\xd7\xe7\xb3\x2c\x3b\x42\xca\xd9\x7a\x31\xf7\x89\
-\x8f\x7f\x12\xd6\xda\x13\x61\x18\xbe\x10\xb6\x43\x94\x4a\x65\x4c\
-\x8e\x15\x4b\x37\x4c\xc6\xb3\x05\xc7\x2a\xcd\xc4\x06\xc4\x86\xc9\
-\x1a\x90\x35\x10\x6c\x20\xad\x85\x64\x4b\xd2\x5a\x21\x2d\x93\x64\
-\x16\x8a\x49\x2a\x96\x4a\x41\x2a\x05\xa1\x24\xa4\x92\x90\x52\x0d\
-\xbc\xb6\x21\x24\x05\x20\x04\x4a\x1e\x3b\xef\xda\x9e\xcf\xce\x4c\
-\xd4\x4a\x9e\x57\xc0\xf2\xca\x32\xda\xed\xf6\x0b\xc6\x98\x13\x9f\
-\xfe\xd4\x5f\x5d\xc9\xfe\x4b\x00\x00\x40\x90\x5c\x8e\xe3\xe8\xd0\
-\xc2\xc2\xfc\xba\x20\x89\xc6\xd8\xa8\x78\xfb\x36\xcc\x1e\x18\xef\
-\x4e\x12\x09\x58\x08\xb6\x20\x1e\x68\x61\x2d\x04\x5b\x22\x3b\x58\
-\xf5\x81\xe1\x42\x29\x88\x0d\xe3\xa5\x1c\x88\x10\x43\xc3\x07\xa1\
-\x59\x08\x01\x41\x03\x7d\xcb\xb6\x78\xf2\xa6\x9d\xfe\xec\x44\xa3\
-\x29\xd2\x24\xc1\xdc\xdc\xb9\xf5\x7e\xd4\x3f\xa4\x84\x58\xbe\xa2\
-\xf5\x97\x03\x30\xac\x8d\x36\xe6\x7b\xcb\x2b\xcb\xcf\xae\x2c\xaf\
-\x70\xb5\x52\xc3\xcc\x44\xb5\xf4\x5b\x3b\x7a\x6f\xdb\x55\x8d\xaa\
-\x4c\x97\xf8\x0e\x12\x80\x18\xd0\x85\xa4\x1c\x18\x39\x34\x7c\xd3\
-\xea\x5f\x14\x71\xc9\x78\x12\x02\x4c\xc4\x7b\xea\x69\xf5\xd6\x3d\
-\xf9\xdb\xf6\xce\x4c\x94\x7c\xbf\x80\xb9\xf3\x73\xdc\x5a\x6c\x3d\
-\x6b\xb4\xf9\x5e\xae\xed\xd5\x9f\xc8\x1e\x7e\xf0\x11\x1c\x3c\x78\
-\x7b\x27\xcb\xb2\x5c\x1b\xf3\x9b\x8d\xb1\x46\xa9\x54\x2e\x91\x8b\
-\xb8\x14\x50\xdf\x6d\x45\x85\xd5\xae\xf1\x53\x39\xa8\xa5\x21\xa4\
-\x84\x94\x12\x42\xaa\xd7\xd3\x64\xc3\xc8\xcd\xd7\xb0\x40\xb2\x60\
-\x18\x0b\x9e\x2e\xc5\xe5\xbb\xf7\xb5\x6f\xf8\xb5\x7d\xa3\x3b\xb6\
-\x4d\x4e\x89\xb5\xb5\x35\x1c\x39\x7a\x64\x69\x65\x65\xf9\x6f\x89\
-\xf8\x87\x9f\xfa\xd3\xbf\xe4\xab\x06\x00\x00\x07\xef\xbc\x83\xf3\
-\x3c\x9b\xcb\xb2\x74\x8c\x99\x0f\x34\x9b\xe3\x2a\x08\x0a\xa2\x2c\
-\xe3\x6a\x55\xf5\xfc\xb5\xd4\x6d\x77\x74\x21\x25\x21\xa1\xe4\x10\
-\x84\xd8\x00\x32\x04\x21\x70\xe9\x89\xcd\x20\x29\x6c\x3c\xad\x00\
-\x2c\x63\x67\xa5\x57\xfd\xe0\xde\xf5\x1b\x7f\x63\xef\xc8\x35\x3b\
-\x67\xb6\xab\x38\x8e\xf1\xe2\xd1\x23\xd1\xdc\xb9\x73\x5f\x35\xd6\
-\xfc\xeb\xc9\x93\xa7\x92\xd9\x9d\xb3\x38\x7e\xec\xa7\x57\x0f\xe0\
-\xe1\x87\x0e\xe1\xce\xbb\x0e\xa6\x79\x9e\xbf\x16\x45\xd1\x2c\x91\
-\xd8\x3d\xde\x1c\x97\x41\xe0\x8b\x8a\x93\xd4\x9a\x5e\x77\x84\xc0\
-\x59\x3b\xf7\xa3\x1c\x8e\x11\xe2\x92\x37\x2e\x6e\xd0\x8d\xe7\xa3\
-\xcc\x83\xe3\xe3\x86\x70\x20\x73\xf7\xe6\xc6\xda\xf4\xc1\x6b\xc2\
-\x1b\xdf\xbd\xbb\x36\x3b\x33\x3d\xad\xb2\x2c\xc7\x4f\x0e\xff\x04\
-\xcf\x3d\xff\xdc\x6b\xc7\x4f\x9c\xf8\xe6\xd1\xa3\x47\x5b\xfd\x7e\
-\x64\xb4\xd6\xfa\x6d\x6f\xbf\x1e\x37\xde\x74\x03\x8e\xbe\xf8\xd2\
-\xd6\x01\x00\xc0\x23\x0f\x1f\xc2\xc1\x83\x77\xae\x25\x69\x7c\xba\
-\xdb\xeb\xee\x22\x60\x67\xa3\xd1\xa0\x4a\xb9\x2c\xaa\x05\x53\x99\
-\x2a\x74\xc7\xc7\xbd\x5e\x11\x80\x4e\xd8\xc9\x34\x94\xb5\x24\x19\
-\x20\x30\x13\x2c\x0f\x56\xdb\x1a\x0b\x62\x23\x8a\x22\x71\xf7\x96\
-\xd7\x9b\xbf\xbb\x6d\xe9\xfa\xdf\xd9\x99\xbf\xfd\x1d\xbb\x9a\x8d\
-\xc9\x89\x09\x91\x26\x29\x0e\xbf\x70\x18\xcf\x3d\xff\x1c\x5a\xad\
-\x96\x1f\x27\xc9\x01\xbf\x50\x78\xaf\xa3\xd4\x2d\x42\x08\x58\x6b\
-\xcf\x58\x6b\xcd\x5b\x79\xe2\x4d\x8b\xa5\x7f\xfa\xe2\x3f\x22\x49\
-\x32\x12\x82\x0f\x04\x41\xf0\x99\x1d\x3b\x76\xdc\xbe\x77\xcf\x5e\
-\x3f\x28\x16\x11\xc5\x3d\xb4\xc3\x8e\x5d\x09\xd3\xfe\x42\x4f\x2d\
-\x5d\x88\x82\xa5\xa5\x34\x08\x7b\xc6\x8f\x73\x96\x06\x20\x38\x94\
-\xcb\xb2\x4c\x0b\x4d\x3f\x1a\xd9\x56\x4c\x9a\xd3\x23\xdc\x9c\xaa\
-\x97\x8a\x8d\xd1\x31\xe1\x79\x3e\x56\x57\x57\x71\xec\xf8\xcb\xd1\
-\x8f\x9f\x7b\xee\xdc\xd9\xb9\xb9\x1d\xd7\x5d\xbb\xaf\x50\x2e\x97\
-\xe1\x38\x0a\x51\x1c\xdb\x53\x27\x4e\xbe\xb2\xb0\xd0\xfa\x2c\x33\
-\xdf\x43\x44\xe9\x7d\xf7\x3c\x70\x75\x00\x00\xe0\x1f\xbe\xf0\xf7\
-\xa0\x9c\x90\x8b\x7c\x9f\xeb\xb8\x7f\xd2\x68\x34\x3e\x7a\xcd\xae\
-\xdd\x93\x93\x93\x13\x50\x8e\x42\x92\x26\x88\xa3\x08\x51\x92\x99\
-\x28\x35\x59\xa2\x39\xd3\x16\x1a\x00\x1c\x41\xaa\xe0\x0a\xb7\x5c\
-\x70\xdc\x52\x31\x90\xa5\x62\x09\x9e\xe7\x23\x89\x13\x9c\x9b\x3b\
-\x87\x53\xa7\x4e\x2e\x2c\x2d\x2f\x7d\xe3\x99\x67\x9f\x7f\x26\xec\
-\x74\x3f\xff\xee\x5b\x6e\xdc\x3b\x3a\x3a\x8a\x7a\xbd\x8e\xfa\x68\
-\x0d\xab\xab\xab\x78\xe6\x99\x67\x4f\xb4\x16\x5a\x9f\xb3\xd6\xde\
-\xcb\xcc\x49\x10\x28\x7c\xe3\x3f\xef\xbb\x32\x85\x86\xd7\xa3\x87\
-\x1e\xc7\xc1\x3b\xef\x40\x9a\xe7\xab\x46\xeb\x1f\x77\xba\xdd\xd3\
-\x2b\x2b\x2b\x95\x30\x6c\x8f\x81\xe1\x17\x83\x12\x2a\xe5\x0a\x46\
-\x2a\x15\x51\x1f\x29\x3b\x8d\x6a\xd1\x9f\xa8\x97\x82\xc9\x7a\x39\
-\x98\x18\x1d\xf1\x1b\xa3\x35\x67\xa4\x32\x22\x3c\xcf\x47\x92\x24\
-\x38\x77\xf6\x2c\x5e\x7a\xf9\x68\x78\xf2\xd4\x89\x1f\x2c\x2d\x2f\
-\xfd\x5d\x9e\xe7\xff\xf6\xc8\x63\xff\x7d\xbe\xe0\xfb\xb7\xd6\x6a\
-\x23\xbb\x84\x10\xe8\x74\xba\xe8\xf7\xfa\x18\x1f\x6f\xa2\xd1\x18\
-\x1b\x0b\xdb\xe1\xf5\xbd\x5e\x6f\x59\x6b\x7d\x82\x59\xfc\x0c\x9d\
-\xae\x78\x68\x7e\xe4\xd0\xa3\x78\xe2\xb1\x27\xb0\xba\xb6\x14\xbf\
-\x70\xf8\x85\x63\x42\x8a\xa7\xc2\x30\x3c\xbd\xb8\xb8\x68\x96\x16\
-\x17\xfd\x76\x3b\x74\xe3\x38\x71\x75\x9e\xc3\x18\x0b\x63\x2c\x74\
-\x6e\x10\xc7\x09\xda\x61\x88\x85\xd6\x02\x5e\x79\xe5\x54\x74\xec\
-\xf8\xb1\x0b\x27\x4f\x9d\x7c\x6a\x7e\x7e\xfe\xcb\xad\x85\xd6\x3f\
-\x7f\xf3\x1b\xff\xf5\xf4\xbd\xf7\xdc\x1f\x7b\x85\x00\x41\x31\xb8\
-\xb9\x54\x2a\xdd\x54\x2c\xf8\xb4\xb4\xb4\x88\x6e\xb7\x87\x3c\x37\
-\x98\x9a\x9a\x42\xb3\xd9\x18\x0b\xc3\xf0\x1d\x51\x14\x2d\x33\xf3\
-\xc9\xfd\xd7\x5f\xf7\x3a\x10\x5b\xfd\x86\xe6\x75\xe3\x6e\xbb\xed\
-\x7d\xf2\xe6\x5b\x6e\x6a\x38\xae\x73\xbd\xe3\x38\xef\x74\x5d\xf7\
-\x5a\xcf\xf3\xa6\x1d\xc7\xad\x2a\x29\x7d\x00\xd0\x46\xa7\x59\x9a\
-\x85\x49\x9a\x5c\x88\xa2\xe8\x64\xbf\xdf\x3f\x7a\xfe\xfc\x85\xe3\
-\x4f\x3c\xfe\xe4\xea\xca\xf2\x8a\x19\xce\xe9\x7a\x1e\xef\xbe\xf6\
-\xba\xf7\x37\x9b\xcd\xcf\x5f\xbb\xef\x9a\x3d\x81\xef\xa2\xd3\xe9\
-\xa0\x58\x2c\x63\xfb\xf6\x69\xec\xde\x73\x0d\xba\xdd\x2e\x9e\xfe\
-\xd1\xd3\x27\x5a\xad\xc5\xcf\x5b\x6b\xef\x61\xe6\xa4\x5c\x2e\xe3\
-\x3f\xbe\xf6\xf5\x2d\x01\xa0\x4d\x7a\xb3\x30\x00\xcc\xee\x9c\x75\
-\x6f\x79\xd7\x4d\xc5\x62\x10\x54\xa4\x52\x45\x29\x85\x67\x2d\x53\
-\x9a\xa6\x79\xd4\xef\xc7\x8b\x4b\xcb\xfd\xa3\x2f\xbe\x14\x87\xed\
-\xd0\x60\x90\xf9\xc5\xe5\x0b\x52\xaa\x54\xfc\xe9\x1d\x3b\xef\x9e\
-\x98\x68\x7e\x72\xff\xb5\x7b\x76\xfa\x9e\x8b\x30\x0c\x51\x2a\x95\
-\xb0\x7d\xfb\x76\xec\xdd\xb7\x07\x61\x18\xe2\xe9\x1f\x3d\x7d\x62\
-\x7e\x7e\xe1\x73\x5a\xeb\x6f\x3b\x8e\x93\xdd\x77\xcf\x03\x57\x04\
-\xf0\x66\xc6\x8b\xcb\x34\xde\xe2\xfe\x66\x79\xb3\x31\xf0\x0a\x85\
-\xc2\xf6\x1d\xb3\xef\x9f\x9e\xde\xf6\x89\xfd\xd7\xed\xdd\x51\xf0\
-\x5d\xb4\xdb\x21\x8a\xc5\x01\x88\x7d\xd7\x5e\x04\xf1\xca\xfc\x7c\
-\xeb\x6f\x88\x70\x2f\x80\xe4\x4a\x7b\x60\xb3\x71\xe2\x2d\xb4\xd8\
-\xd8\x4f\x12\x83\x33\xc6\x66\x2d\x37\xdd\xdf\x3c\x6e\x38\xc6\x01\
-\xe0\x1a\xad\x65\xaf\xdb\x9d\x87\x90\x9d\x2c\xd7\xbb\x6a\xd5\x5a\
-\xb5\x5c\x2a\xa2\xdb\xed\x20\x8e\x13\x68\xad\x31\x35\x35\x85\x46\
-\xb3\x51\x5f\x6f\xb7\xaf\x8f\xfa\xfd\xb3\x00\x5e\xb9\x1a\x00\x6f\
-\x64\x3c\xe1\xca\xe0\x36\x83\x7c\x33\x0f\x29\x00\x8e\x31\x86\xfa\
-\xdd\xce\x1c\x0b\xd9\xce\xb2\xfc\x9a\x7a\xbd\x3e\x52\x2e\x17\xd1\
-\xe9\x5c\x02\x31\xb3\x63\x06\x8e\xab\xc6\x16\xe6\xe7\x7b\x71\x9c\
-\x7c\xff\x6a\x01\xe0\xb2\xd7\x6f\x74\x9f\xde\xe4\xfd\x43\xcd\xb8\
-\x74\x7c\xfe\x19\xea\x19\x63\x4c\xaf\xdb\x39\x03\x21\x97\xb3\x3c\
-\xdf\x53\xab\x57\xab\xe5\x52\x09\x9d\x4e\x07\x00\x50\xaf\xd7\xb0\
-\xbe\xde\xd6\x73\xe7\xe6\xbe\x1f\x86\xe1\x55\x01\x78\xa3\xfe\xcd\
-\x6d\xbe\x4c\x03\x18\x7c\x63\xb9\xc9\x68\xbb\x49\x0f\xc5\x6c\xea\
-\x1f\x3c\x43\x32\x46\xf7\x7b\xbd\xd7\x48\xca\xf5\x2c\xd3\xbb\x6b\
-\xb5\x6a\xb5\x5e\xaf\x61\xa4\x3a\x82\xb0\xd3\xc1\x8b\x47\x8e\x1e\
-\x6d\x2d\x2e\xfe\xcb\x53\x4f\x3e\xf5\xda\x15\xf3\xc0\x65\xc6\xf2\
-\x65\x06\x6d\x96\xcb\x0d\x1d\x1a\x36\x6c\x1b\x00\xfa\x32\xc9\x37\
-\xb5\xcd\x26\x61\x63\xb4\xe9\x75\x7b\x67\x21\x44\x37\xcd\xf2\xdd\
-\xbe\xe7\x55\x3a\xdd\xae\x3d\x7e\xfc\xc4\xe9\x33\x67\xce\x7c\xf9\
-\xc8\xe1\x23\x3f\x4c\xd3\xec\xe7\xcb\x03\x78\x73\xea\xbc\x15\x8d\
-\xde\x6a\xee\xe1\xe6\x76\x36\x89\x02\xe0\xb8\xbe\x5f\x9c\x9e\xd9\
-\xf1\xdb\x95\x91\x91\xdf\x26\xf0\x7a\xa7\xdd\xfe\x9f\xb9\xb3\x67\
-\x0f\x67\x59\xd6\x05\x90\x5c\xed\x8f\x3d\x86\x1c\xde\x0a\xa5\xae\
-\x76\xde\xcd\xd1\x4c\xe1\x52\x84\x72\xa4\x94\x9e\x5f\x28\x94\x74\
-\x9e\xdb\x34\x4d\x87\x5e\x4b\x7f\x1e\x00\x6f\x65\xc0\x2f\x63\x8e\
-\xcd\x51\x6a\x18\x76\x87\x60\x86\xaf\x87\x8b\x98\x03\xc8\xff\x0f\
-\xa2\xa6\x1d\x4e\xc6\x2f\xed\x25\x00\x00\x00\x25\x74\x45\x58\x74\
-\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\
-\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\x2d\
-\x30\x37\x3a\x30\x30\x82\x80\x0a\xca\x00\x00\x00\x25\x74\x45\x58\
-\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\
-\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\x36\x3a\x31\x38\
-\x2d\x30\x37\x3a\x30\x30\x67\xec\x3d\x41\x00\x00\x00\x25\x74\x45\
-\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\
-\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\x31\x31\x3a\x34\
-\x30\x2d\x30\x37\x3a\x30\x30\x93\x15\x56\xb1\x00\x00\x00\x34\x74\
-\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\x74\x70\x3a\
-\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\
-\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\x73\x2f\x47\
-\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\x6a\x06\xa8\x00\x00\x00\x25\x74\
-\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\
-\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\x3a\
-\x32\x31\x2d\x30\x37\x3a\x30\x30\xdd\x31\x7c\xfe\x00\x00\x00\x19\
-\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\
-\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\
-\x1a\x00\x00\x00\x17\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x00\
-\x47\x4e\x4f\x4d\x45\x20\x49\x63\x6f\x6e\x20\x54\x68\x65\x6d\x65\
-\xc1\xf9\x26\x69\x00\x00\x00\x20\x74\x45\x58\x74\x53\x6f\x75\x72\
-\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x61\x72\
-\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\x6f\x72\x67\x2f\x32\xe4\x91\x79\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\x0e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
-\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\x8b\x49\x44\
-\x41\x54\x58\x85\xed\x97\xcb\x6b\x13\x51\x14\x87\xbf\x99\x49\x6d\
-\x4b\x1b\x8a\x2d\x2a\xa2\xa8\x1b\xa1\xa1\x8b\xd2\x9d\xd0\x4d\x40\
-\x70\x2d\x14\xdc\xb8\xb3\x0b\x57\x12\x5a\xff\x80\x6c\x5c\x08\x8a\
-\xa5\x2b\x57\x5d\xbb\x55\xdc\x37\x20\xa4\x08\x29\xd4\x62\x4b\x8a\
-\x0f\x50\x29\x28\x2d\x1a\x75\xa2\xe4\x31\xf7\x1e\x17\x9d\x4c\xa6\
-\xc9\x9d\x9a\xa6\x63\x40\xe8\x0f\xee\xbc\xef\x39\xdf\x9c\x73\xee\
-\x61\xc6\x12\x11\x4c\xb2\x2c\xcb\x36\xde\xe8\x52\x22\xa2\x8d\x7e\
-\x4c\x00\x8b\x8b\x8b\xe7\x53\xa9\xd4\x9c\x88\xc4\x02\x61\x59\x96\
-\x2e\x16\x8b\x0b\x99\x4c\x66\xdb\x44\xb6\x6f\xa4\xd3\xe9\x44\xa1\
-\x50\x58\xa9\xd5\x6a\x12\xe7\x28\x14\x0a\x2b\xe9\x74\x3a\xd1\xea\
-\xaf\xed\x0d\x5d\xd7\xb5\x1c\xc7\x19\x88\xe3\xcd\xc3\x72\x1c\x67\
-\xc0\x75\x5d\xab\xf5\x7a\xac\x79\xee\x46\xc7\x00\xc7\x00\xff\x04\
-\xa0\xf4\xfb\x1d\x60\x6e\x70\x3d\x01\x78\xbb\xfb\x94\xe5\x37\xf3\
-\xb8\x95\xf6\xbe\xd3\x13\x00\x80\xdd\xf2\x6b\x9e\x6f\xde\xa4\xf8\
-\xe5\x09\x82\xb1\x0b\x03\x90\x38\x8c\x51\x2d\x75\xaa\x9e\x8b\x88\
-\x87\x16\x15\xec\xb5\x78\x08\xfe\x5e\x14\x15\xef\x3b\x00\x4a\x55\
-\x29\x7c\x5a\xe0\xe3\xb7\x65\xc6\xf4\x4c\x7f\xc7\x00\x8d\x36\xd9\
-\xaa\x6a\xfd\x27\x3b\xe5\x75\x6a\xaa\x4c\x5d\x95\xa9\x79\x6e\xf3\
-\xd8\x3f\xaf\xab\x5f\xd4\x94\xbb\x6f\xde\x4e\x79\x9d\x5d\x36\xc7\
-\x6f\x3f\x52\xf3\x4b\xf9\xa9\x07\xb3\xd3\x6b\x41\x48\x22\x53\xd0\
-\xda\xb3\x9b\x03\x68\x1c\x07\xcf\x12\xaa\x39\x09\x6d\x43\xf6\xf0\
-\x6c\xdb\xe1\x3e\x90\x5f\xca\x4f\x8d\x77\x15\x01\xf1\x3d\x05\x0e\
-\x45\x7c\x4f\x4d\x82\x0e\x6a\xff\x0a\xf0\x6a\x29\x3f\x95\x05\x1e\
-\x1a\x01\xb4\xd6\x68\xdd\x5e\x38\x5a\x34\x5a\x0b\x22\xda\x18\x19\
-\x69\x00\x05\x60\x91\xaa\x03\x3f\x00\xdd\x5d\x04\xfc\x6d\xf3\x0c\
-\xc2\x1e\xff\x12\x85\x1c\x70\x6b\x76\x7a\xed\x03\x44\xd4\x40\x74\
-\xfe\x7d\xb0\x50\x2d\x20\xe1\x04\x44\xbb\xb7\xe9\xd3\xca\x23\x03\
-\x5c\x6d\x38\x87\x03\x6a\xc0\x94\x82\x84\x35\xc4\xe8\xe0\x04\x22\
-\x6a\x6f\x19\xd2\x58\x8e\xca\xbf\xb6\xb7\x1c\xdf\x7f\x7d\xc6\x67\
-\xf7\x65\x30\xef\xd4\xd0\x24\x23\x95\xeb\x5b\x77\x33\xf7\x1e\xaf\
-\xae\xae\xee\x23\x8c\xec\x03\xa6\x14\x58\x24\xe8\x77\x4e\x46\x4d\
-\x09\xb4\x9d\x78\x01\x80\x63\xf7\x33\x71\x66\x96\xcb\x63\x33\x14\
-\x8b\x5b\x55\xd3\xb3\x91\x45\x18\xf5\xb1\xda\xa9\x46\x07\x53\x4c\
-\x9e\xbd\xc3\xf0\x89\x73\x88\x60\x8c\x68\x24\x40\x54\x11\x76\xaa\
-\x0b\x23\xd7\x48\x9e\xbe\x84\x85\x15\xd8\x89\xb2\x77\xa8\x1a\xe8\
-\x54\xc3\x7d\x17\x11\x2d\xa1\x15\xd2\x05\xc0\x51\x53\x60\xb2\xd9\
-\x31\xc0\x41\x13\xe2\xd6\xa1\x3a\xe1\x51\xd4\xd3\x22\x8c\xb2\xf9\
-\x7f\x00\x24\x93\x49\x51\x4a\x55\xe2\x4e\x81\x52\xaa\x92\x4c\x26\
-\xdb\x28\xda\x00\x72\xb9\x9c\x97\xcd\x66\x6f\x94\x4a\xa5\x39\xad\
-\x75\x2c\x9f\x6c\xb6\x6d\xeb\x8d\x8d\x8d\x85\x5c\x2e\xe7\xb5\xde\
-\x33\xfe\x1d\x43\xef\x7e\xcf\xff\x00\x9e\xfb\x3e\x13\x97\xc1\x3f\
-\xbe\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x62\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x03\x00\x00\x00\xf3\x6a\x9c\x09\
-\x00\x00\x00\x75\x50\x4c\x54\x45\xff\xff\xff\xee\xee\xf2\xf5\xf5\
-\xf7\xd4\xd4\xdc\xfe\xfe\xfe\xa3\xa3\xaf\xe9\xe9\xed\xf0\xf0\xf4\
-\xe8\xe8\xec\xfb\xfb\xfd\xf1\xf1\xf5\xed\xed\xf1\xff\xff\xff\xf2\
-\xf2\xf6\xf7\xf7\xfb\xf3\xf3\xf7\xe3\xe3\xe9\xe4\xe4\xea\xea\xea\
-\xee\xf4\xf4\xf8\xe0\xe0\xe6\xce\xce\xd6\xd0\xd0\xd8\xdb\xdb\xe1\
-\xf9\xf9\xfb\xec\xec\xf0\xd7\xd7\xdd\xfa\xfa\xfc\xeb\xeb\xef\xf6\
-\xf6\xf8\xfc\xfc\xfe\xd2\xd2\xda\xde\xde\xe4\xd6\xd6\xdc\xdf\xdf\
-\xe5\xd9\xd9\xe1\xe2\xe2\xe8\xdb\xdb\xe3\xe6\xe6\xec\x7f\xfb\x8f\
-\x57\x00\x00\x00\x01\x74\x52\x4e\x53\x00\x40\xe6\xd8\x66\x00\x00\
-\x00\x9b\x49\x44\x41\x54\x78\x5e\x65\xce\x45\x0e\xc4\x30\x10\x44\
-\x51\xb7\x31\xcc\xc3\x8c\xf7\x3f\xe2\x24\x3d\x29\xa9\x2d\xd7\xf2\
-\x2d\x4a\x5f\x29\xb3\xce\xa9\x68\xa6\xaa\xaa\xbc\x39\x10\x5c\xb0\
-\x3d\x11\x99\xa3\x4b\x38\x2f\xc8\xcd\x4b\xb8\x25\xbf\xdb\xc4\xbc\
-\xf8\x18\xee\xb7\x6d\xca\x9a\xa2\x22\x94\x0c\x5d\x54\xc4\x6c\xf7\
-\xc1\x67\x51\x11\x73\x5e\x87\xf2\x2c\x8b\x98\xed\xa5\x2d\xa8\x94\
-\x45\xcc\x57\x0d\x46\x11\x73\xa3\xdb\xf9\x05\x45\xaf\x87\xf9\xb3\
-\x1e\xeb\xf9\x04\x45\xd3\xf3\xc3\x6c\x35\x9f\xa0\xa8\x7b\x4f\x0b\
-\xbb\x75\x28\xca\xfa\x6e\x61\x0c\x45\xfe\x1b\x31\x8a\x86\xac\x97\
-\x8c\x22\xc9\xa2\xc8\x0b\x46\x51\x7a\xe2\xc4\xd4\x0f\x03\x81\x0c\
-\xa5\xab\x5d\xa7\x60\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x04\x8c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x04\x53\x49\x44\x41\x54\x78\xda\xa5\x54\x5b\x6b\x5c\x55\
-\x14\xfe\xf6\x3e\x67\x6e\x49\x3c\x33\xe9\x68\x92\x4e\x4d\x9a\xea\
-\x18\xad\xa6\x52\x43\xa3\x62\xa5\x41\x2a\xa9\x4f\x15\xd2\xc7\x0a\
-\x02\x82\xbe\x28\x46\x10\x81\xbc\xf6\x45\xa4\x82\x50\x7d\xf1\x17\
-\xa8\x16\x4a\x23\xa9\x48\x14\xd5\x68\x42\x42\x42\x85\xe6\x56\x2c\
-\xb9\xb4\x13\x3b\xd3\xc9\x65\x32\x97\x73\x99\x73\xd9\xee\xb5\x73\
-\x18\x02\x05\xc1\xba\x0e\x8b\x75\x66\xf6\xb7\xbf\xb5\xd6\xb7\xd7\
-\x3e\x4c\x08\x81\x07\xb1\xd3\x3f\xbf\xf2\xe9\xf9\xec\x1b\xef\x78\
-\xf0\x61\x79\xa6\x7f\xe9\xb7\xcf\xce\xde\x7a\x73\xed\x57\x84\xa6\
-\xe3\x01\xed\x48\xcb\x91\x27\x7a\x93\xbd\xcd\x26\x2c\x98\xa2\x86\
-\x54\x22\xf5\x0c\x80\xff\x4f\x5c\xaf\xbb\x41\xb9\x5e\x86\x49\x8f\
-\x30\x01\x9f\x81\xec\x3f\x13\x37\x7d\x1e\x6f\x7e\xf1\xd0\x0b\x9f\
-\x18\xf1\x64\xcc\x63\xbe\xe8\x32\xba\xb2\x15\x67\x8f\xb8\x2a\xaa\
-\x28\x9a\xc5\x33\xc6\x97\x4d\x9d\x3c\x60\x94\x64\x5d\x69\xcc\x18\
-\x6b\x07\xc0\xf0\x2f\xd6\xf1\xf1\xc3\xef\x7d\x75\xfe\xdb\x11\x2f\
-\x70\xa5\xa6\x16\x2c\x61\xa1\x16\x3e\x97\x37\xbf\xc1\x6c\x7d\x0e\
-\x41\x22\x90\x2e\xc0\xd7\xd8\x86\x9e\xcd\x66\x7f\x1f\x1e\x1e\x7e\
-\x5e\xd7\xf5\x40\x9a\x6c\xb1\x0e\xc7\x71\x28\xea\xb6\x63\x0b\xa7\
-\xee\xc0\xb6\x6c\x6c\xac\xe5\xb8\x2d\x09\x4d\xcf\x54\xc4\x3b\xce\
-\x36\x26\x37\xff\xc0\xe4\xee\x24\x76\xf4\x1d\xb0\x04\x03\x67\x1c\
-\x40\x00\xb6\xcd\xda\x58\x7f\x7f\xbf\x3d\x3d\x3d\x1d\xc3\x3e\xa3\
-\x04\xb7\x8a\x7f\x21\x92\x88\x60\xbd\xbc\x8e\xeb\xc5\x39\x8c\x2e\
-\x5e\x85\x17\x75\x91\x8c\x26\xb1\x5e\x59\x43\xc1\x2c\x80\x4c\xc4\
-\x85\xaa\x32\x08\xa3\x90\x8e\x65\x21\x74\x4d\xd3\xee\x6b\x9b\xe4\
-\xe1\x5c\x43\xae\x96\xc3\x2f\xb9\x9f\x70\xa7\x72\x07\x81\x1e\xc0\
-\x29\xb8\x68\xef\xec\x40\xdb\x43\xed\x58\x0d\x56\xb1\x60\xdf\x00\
-\xb3\x19\x78\x00\xbc\xe4\x9c\x44\x5a\xa4\x11\xd8\x02\x57\xbe\xbf\
-\x22\xd4\xe1\x85\x3a\x23\x34\x25\xc7\x77\xf3\xa3\x18\x73\x47\xf1\
-\xe7\xbd\xeb\xe0\x16\x03\x04\x70\x36\x32\x84\x4b\x83\x5f\x28\xfc\
-\xc8\x8f\x1f\x61\x21\x7f\x03\x31\x2d\x86\xc3\xf1\x6e\x0c\x75\x9e\
-\xc3\xeb\x47\x87\xd4\xda\xd7\xe7\x2e\xfb\x44\xcc\x6d\xdb\x56\xc4\
-\x14\xf3\xf9\x3c\x4c\xd3\x44\x7d\xab\x0e\xc3\x4d\xe1\x59\xe7\x38\
-\x44\x3d\x90\x95\x04\x88\xd4\x23\x98\x9a\x9a\x82\xef\xfb\xb8\xfb\
-\x77\x1e\xd4\xed\xf1\x47\x9e\xc3\x53\xa9\xa7\xb1\xb4\xb0\x84\xf8\
-\xed\x1f\x68\x8d\xc8\xb9\x4e\x19\x62\xb1\x18\x38\xe7\x2a\x1a\x86\
-\x81\x72\xb9\x8c\xad\xad\x2d\xcc\xea\x33\xa8\x98\x15\x70\x93\x41\
-\x2b\x73\x74\x55\xbb\xd1\x7f\xe2\x04\x15\x8f\xb1\xea\x55\x64\xac\
-\x43\x78\x2c\xf9\x38\x8e\xa5\x8f\x81\xf5\x72\xbc\x9a\x3d\xad\x2a\
-\x26\xd3\xc3\x0c\xe4\xea\xd0\x54\xf4\x7d\x35\x9b\x56\xcc\x46\x40\
-\x40\x1f\xe0\x51\x01\xcf\xf3\x40\x78\xea\xee\xdd\xfe\xf7\x71\x70\
-\x31\x03\xad\xae\x61\x61\x76\x01\x1f\xbc\xf6\xa1\xc2\x8a\x90\x43\
-\x27\x30\x11\x12\xb8\x41\x2c\xdd\x12\x26\x6c\x49\x4c\xc6\x5c\x8e\
-\x20\x2a\x24\xa9\x24\x96\x18\x2e\xb1\x07\x12\x07\xf0\x56\xdf\xdb\
-\x0a\x3f\x51\x99\x00\x13\x90\xfb\x02\x45\x4c\xa6\x88\x73\xb9\x9c\
-\x02\x14\x0a\x05\x55\x51\xad\x56\x03\x6e\x33\x3c\x59\x3a\x8a\xc0\
-\xf1\x21\xaa\x42\xb9\x77\x37\xc0\xf8\xf8\x38\x61\x09\xd7\xf0\x9b\
-\x37\x6f\xe2\x9e\xdc\x4b\x85\x79\x7b\x1d\x09\x5d\x5e\x06\xbf\xa3\
-\xa3\x23\x42\x07\x91\xc9\x64\xd4\xe2\xee\xee\x2e\x2e\xb2\x8b\x98\
-\xef\x99\x07\xaf\x31\xe8\x25\x0d\xfa\x96\xd4\xb8\xde\x85\x81\x81\
-\x01\xc8\xcb\x04\xb1\xaf\xbb\x78\x3c\x8e\x81\x53\xa7\x1a\xa3\x3a\
-\x32\x32\x22\x74\x1a\x2d\xca\xda\x90\x42\x3a\xc5\x1a\xaa\x6a\xe0\
-\x99\xcb\x20\x74\x01\xa1\x01\x5e\xe0\x29\xfd\x03\xce\x15\x81\x08\
-\x25\x24\x62\x4e\xf7\x21\x3c\xb8\x74\x3a\x0d\xbd\x5a\xad\x0a\xcf\
-\x75\x09\x40\xe0\xc6\x06\x8b\xdb\xea\x56\x09\x6b\x8f\x54\x70\xd5\
-\xbe\x3a\x40\xea\x8e\x28\x18\xe7\x6a\x5f\x53\x22\xa1\xfe\x0b\x4b\
-\x26\x62\xa6\x4b\x3d\xf5\xe9\x99\x19\x68\x12\xe4\x85\x9a\xc9\x64\
-\xe8\xdc\x78\x14\x46\xc9\x80\xa8\x09\xa0\x2a\xbb\xa8\x04\x70\x57\
-\x3d\x8c\x5d\xbb\x86\x84\x24\x8a\x45\xa3\x88\xca\xf1\x8c\xca\xb8\
-\x59\x2c\x92\x3c\x54\xb5\x4a\xd4\xda\xda\xca\x75\xca\xd1\xd7\xd7\
-\x47\xc0\x86\x66\xa5\x52\x09\x17\x96\x2f\x60\xf9\xe5\x65\xe8\xdb\
-\x52\xdf\xa2\x86\x83\xa5\x76\x64\xab\x3d\x18\x1c\x1c\x44\x4b\x73\
-\x33\xcd\x3d\xb9\xaa\x7a\x65\x65\x05\x3d\x3d\x3d\x8a\xb4\x21\x45\
-\x38\xbf\xfb\x67\x50\xfd\xc6\x26\x10\x5b\x8f\xa8\x6f\x41\xb2\x6a\
-\xe0\x30\xeb\x46\x4c\xc4\x14\x06\x21\x01\x11\x51\xa7\x89\x50\x0a\
-\x7a\xc7\x5e\xc5\xd0\x09\xe0\xd8\x36\x22\x91\x48\x43\x5f\xf2\x54\
-\xde\x40\x6a\xc9\x00\x3c\x20\xc3\x33\xc8\x24\x32\x70\x03\x5f\x61\
-\x20\xdd\x27\xa7\x99\xf6\x7d\x92\x41\x55\xaf\x85\x31\x99\x4c\x32\
-\xd6\xd6\xd6\x36\x51\x2c\x16\x4f\xd2\xec\xed\xfb\xba\x31\xdc\x6f\
-\x6a\x53\xb3\x94\xa1\xa5\xa5\x85\x9c\xde\xc9\xa9\x62\x8a\x34\x1d\
-\x2a\xc9\xdc\xdc\xdc\xe2\x3f\x90\x6c\xae\x58\x53\x15\x54\x13\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x03\xd0\x00\x00\x02\xb3\x08\x06\x00\x00\x00\xf6\xb9\xe5\xa8\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\x00\x2e\x23\
+\x01\x78\xa5\x3f\x76\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\
+\x65\x52\x65\x61\x64\x79\x71\xc9\x65\x3c\x00\x00\x12\x80\x49\x44\
+\x41\x54\x78\xda\xec\xda\x5f\x68\x9d\xe5\x1d\xc0\xf1\xe7\x34\xe7\
+\x5f\xad\x5b\x73\x62\xa9\x54\x5b\xc9\x08\x14\xc5\xb6\x68\xb2\x48\
+\x6f\xc6\x32\xc7\x60\xbb\xf4\xaa\xe9\x81\x46\x48\xa1\xd4\x3f\x30\
+\x1c\x65\x82\x57\x2d\x54\x61\x17\xb5\xca\xaa\x48\x20\x71\x84\x99\
+\x16\x77\xe1\xa0\x1b\xae\x17\xc3\xe6\x6e\x38\x76\x5a\xd2\x5e\x59\
+\xea\x9c\xad\x96\x7a\x31\x54\x3c\x39\x6f\x4e\x4c\xde\x25\xcc\x0b\
+\x31\x1d\xf4\xbc\xbc\x8e\x27\xc7\xcf\x07\x4e\x73\xf5\x83\x97\xdf\
+\xfb\xf0\xf6\x7c\x39\x6f\xa1\x54\xa9\xa6\x01\x00\x00\x00\xfe\x6b\
+\xb6\x9d\xb4\x46\xac\x61\xad\x0d\x56\x00\x00\x00\x00\x02\x1a\x00\
+\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
+\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
+\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
+\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x40\x37\x28\x66\x1d\x6c\
+\x27\x2d\xdb\x23\x1a\xb5\xbe\x5a\x68\xce\x27\x1d\xcf\x4d\x4f\x4d\
+\x86\xd1\x7a\xdd\x02\x89\xc2\xb3\x47\x8e\x84\x93\xa7\x5e\xe9\x78\
+\x6e\x70\xcf\xae\xf0\xb7\x77\xff\x6e\x81\x44\xa3\x5c\xdd\xe8\xbb\
+\x05\xeb\xde\xde\x47\x86\x43\x63\xee\x72\xc7\x73\xe3\x63\x07\xc2\
+\x6b\x13\x13\x16\x48\x14\xce\xcc\xcc\x84\xb1\xf1\x83\x16\x91\x23\
+\xbf\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\
+\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
+\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
+\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\x02\x1a\
+\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
+\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
+\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
+\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
+\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\x00\x00\
+\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
+\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x20\
+\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
+\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
+\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
+\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
+\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\
+\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
+\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
+\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
+\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\
+\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
+\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
+\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
+\x00\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
+\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
+\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\
+\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
+\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\
+\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
+\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\
+\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
+\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
+\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\
+\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
+\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x70\x5b\x8a\x56\x00\x90\xaf\xe5\x9b\xef\
+\x85\xa5\x77\xcf\x76\x3c\x37\xb4\x74\x3d\xec\xdf\xbd\xbd\xe3\xb9\
+\xfb\xee\x2e\x86\xc5\xb3\x27\x3a\x9e\x2b\xf4\x6e\x0d\x85\xcd\x5b\
+\xdd\x30\x72\x37\xbc\x63\x4b\xa6\xb9\xa5\xb9\x73\x96\x47\x34\x76\
+\x6e\x2e\x85\x9e\x0c\x67\xb9\xbf\xd8\x74\x96\x89\x46\xdf\x67\xef\
+\x67\x7a\x26\xdf\x51\xee\xe9\xfd\x7c\x74\x60\xc4\x06\x6f\xf1\xfd\
+\xa9\x54\xa9\xa6\x59\x06\xdb\x49\xcb\xf6\x88\x46\xad\xaf\x16\x9a\
+\xf3\x49\xc7\x73\xd3\x53\x93\x61\xb4\x5e\xb7\x40\x72\xb5\x1a\xb3\
+\xad\x37\x5e\xb5\x08\x00\x80\x2e\xe3\x15\x6e\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
+\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
+\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
+\x00\x00\x01\x0d\x00\x00\x00\xf1\x2b\x66\x1d\x7c\xf6\xc8\x11\xdb\
+\x23\x1a\x0b\xc9\x42\xa6\xb9\x3f\xbc\xf9\x66\xb8\xd0\x68\x58\x20\
+\xb9\x1a\x5a\xba\x1e\x7e\x6e\x0d\x00\x00\x5d\xa7\x50\xaa\x54\x53\
+\x6b\x00\xc8\xcf\xfe\xdd\xdb\xc3\x6f\x07\x96\x2d\x02\x00\xa0\xcb\
+\x78\x85\x1b\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
+\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
+\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\
+\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x40\xfc\
+\x8a\x59\x07\x07\xf7\xec\xb2\x3d\xa2\x71\xf1\xd2\xe5\xb0\x9c\x76\
+\x3e\xb7\x73\xe0\x07\xe1\xce\x4d\x9b\x2c\x90\x5c\xdd\x77\xf7\xea\
+\xa3\xf5\x13\x8b\x00\x00\xe8\x32\x85\x52\xa5\x9a\x66\x19\x6c\x27\
+\x2d\xdb\x23\x1a\xb5\xbe\x5a\x68\xce\x27\x1d\xcf\x4d\x4f\x4d\x86\
+\xd1\x7a\xdd\x02\xc9\xd5\xe2\xd9\x13\xa1\xf5\xc6\xab\x16\x01\x00\
+\xd0\x65\xbc\xc2\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
+\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
+\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\
+\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\
+\x20\x7e\x45\x2b\x00\xc8\x57\xa1\x77\xeb\xba\xb8\xce\x9e\x07\x1e\
+\x0c\xa5\xfb\x07\xdd\x30\x72\xf7\xab\x97\x67\x32\xcd\xbd\xf8\xcb\
+\xba\xe5\x11\x8d\x17\x4f\xff\x25\x5c\xff\xe4\xdf\x1d\xcf\xfd\xe8\
+\xa1\xfb\xc3\x63\x3f\xf6\x6c\x25\x0e\x97\xae\x7e\x14\x5e\xff\xd3\
+\x6c\xc7\x73\xbd\xa5\x0d\xff\xfa\xf5\xb6\xc5\xdf\xd9\xa0\x80\x06\
+\xf8\xf6\x03\x7a\xf3\xfa\x08\xe8\xd5\x78\x2e\xef\x3b\xea\x86\x91\
+\xbb\x89\xc7\x7f\x93\x69\xee\x94\xf3\x48\x44\xfe\x78\xe2\xcf\xa1\
+\x31\x77\xad\xe3\xb9\x2f\x77\x8d\x84\x7d\xce\x32\x91\xb8\x32\x33\
+\x13\x26\x1a\xbf\xcf\x32\xfa\xc1\xf1\xa4\xe5\x20\xdf\x82\x57\xb8\
+\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
+\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
+\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
+\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\
+\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
+\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
+\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
+\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
+\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
+\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\
+\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
+\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
+\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
+\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
+\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\
+\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
+\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\
+\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
+\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
+\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
+\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
+\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
+\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\
+\x04\x34\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
+\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\
+\x34\x00\x00\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\
+\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\
+\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\
+\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
+\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
+\x00\x40\x40\x03\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
+\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\
+\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\
+\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\
+\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\
+\x68\x00\x00\x00\xb8\x2d\x85\x52\xa5\x9a\x66\x19\xdc\x74\x47\xd5\
+\xf6\x88\x46\x73\x3e\xc9\x34\x57\x2a\xf6\x84\x72\xb9\x64\x81\xe4\
+\x6a\xf0\xde\xbb\xc2\x5b\x0f\xa6\xd1\x5f\xe7\xb1\x1b\xd5\x30\x75\
+\xe9\x63\x37\x8c\x68\x9e\xc9\xbe\x5b\x10\x93\xf9\x56\x12\xd2\x0c\
+\x8f\xf2\x0d\x1b\x0a\x61\x63\xb5\x62\x81\x44\x61\xe9\xcb\xa5\x90\
+\xb4\x17\xb3\x8c\x7e\xd4\x4e\x5a\xdb\x6d\x70\xad\xe2\xff\xfb\x3f\
+\x47\x88\xc9\xe2\xca\x43\x65\xf5\x03\x79\x4a\x92\x85\x95\x7f\xcb\
+\xd1\x5f\xe7\xc2\xe2\xa2\x67\x39\x5d\x11\xde\x10\x93\xe5\xe5\xd4\
+\x59\xa6\x1b\x6c\xb2\x82\x5b\xf3\x0a\x37\x00\x00\x00\x08\x68\x00\
+\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
+\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
+\x80\x80\x06\x00\x00\x80\xf8\x15\x4a\x95\x6a\x9a\x65\x70\x7a\x6a\
+\xd2\xf6\x88\xc6\xa1\xc3\x87\x43\xd2\x5e\xec\x78\xee\x99\xa7\x9f\
+\x0a\x0f\x0f\x0e\x5a\x20\xb9\xea\xfb\xec\xfd\xb0\x77\xf6\xf5\xe8\
+\xaf\xf3\xca\x9e\x47\xc3\x95\xfe\x9f\xb8\x61\xe4\x6e\x6c\xfc\x60\
+\xa6\x39\xdf\x2d\x88\xc9\xf1\xe7\x8f\x87\xf7\xae\xfe\xb3\xe3\xb9\
+\x5f\xfc\xec\xa7\x61\xff\xfe\xba\x05\x12\x85\x0b\x8d\x46\x38\x79\
+\xea\x95\x2c\xa3\xff\x68\x27\xad\x1f\xda\xe0\x5a\xc5\xac\x83\xa3\
+\x75\x0f\x06\xe2\xf1\xc4\x4a\x08\x87\x0c\x01\xbd\x1a\xcf\xce\x32\
+\x79\x5b\x9a\x3b\x17\x9a\xeb\x20\xa0\x77\x0f\xdc\x1b\x86\xf6\x39\
+\xff\xc4\x13\xd0\x9e\xc7\xc4\xe4\xa5\x97\x4e\x66\x9a\xdb\xb6\xed\
+\x1e\x67\x99\x6e\xf0\x85\x15\xdc\x9a\x57\xb8\x01\x00\x00\x40\x40\
+\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
+\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
+\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
+\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
+\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
+\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
+\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
+\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\
+\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
+\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\
+\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
+\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\
+\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
+\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
+\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\
+\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
+\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\
+\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
+\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
+\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
+\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
+\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
+\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
+\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
+\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
+\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
+\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
+\x68\x00\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
+\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
+\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
+\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
+\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
+\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
+\x80\x80\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
+\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
+\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\x00\x10\
+\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
+\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\
+\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
+\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
+\x00\x00\x08\x68\x00\x00\x00\xe0\x6b\x0a\xa5\x4a\x35\xb5\x06\x80\
+\xfc\x0c\xef\xd8\x12\xde\x1e\x2a\x47\x7f\x9d\xcf\x7d\xd8\x13\x26\
+\x1a\xd7\xdc\x30\x00\xe0\x9b\x3e\x6d\x27\xad\x9a\x35\xac\xe5\x17\
+\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\
+\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
+\x00\x00\x00\x04\x34\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
+\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
+\x00\x00\xba\x42\xa1\x54\xa9\xa6\x59\x06\xdb\x49\xcb\xf6\x88\x46\
+\xad\xaf\x16\x9a\xf3\x49\xc7\x73\xd3\x53\x93\x61\xb4\x5e\xb7\x40\
+\x72\xb5\x34\x77\x2e\x34\x5f\x78\x32\xfa\xeb\xac\x3e\x76\x20\x94\
+\xf7\x1d\x75\xc3\xc8\x5d\xb9\xba\x31\xd3\x9c\xef\x16\xc4\x64\xef\
+\x23\xc3\xa1\x31\x77\xb9\xe3\xb9\xf1\xb1\x03\xe1\xb5\x89\x09\x0b\
+\x24\x0a\x67\x66\x66\xc2\xd8\xf8\xc1\x2c\xa3\xb3\x2b\xcf\xe4\x11\
+\x1b\x5c\xcb\x2f\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
+\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
+\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x40\x40\x03\x00\
+\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\
+\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
+\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\
+\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\
+\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\x02\x1a\x00\x00\x00\x04\
+\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\
+\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x04\x34\
+\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\
+\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
+\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
+\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\
+\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x20\xa0\x01\x00\x00\
+\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\
+\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x40\
+\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
+\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
+\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\
+\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\x02\x1a\x00\
+\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\
+\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\
+\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\
+\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\
+\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\x00\x00\x20\
+\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\
+\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x20\xa0\
+\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\
+\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
+\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\
+\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\x0d\x00\x00\
+\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\
+\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x00\
+\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\
+\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
+\x06\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\
+\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x10\xd0\x00\
+\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\x06\x00\
+\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
+\x00\xf0\x35\xc5\xac\x83\x87\x0f\x1d\xb2\x3d\xa2\xb1\xb0\xd0\xce\
+\x34\x77\xfa\xf4\x4c\x38\x7f\xfe\xbc\x05\x92\xab\xfe\x62\x33\x3c\
+\xb9\x0e\xae\xf3\xad\xd9\x46\x78\xe7\xaf\x9e\xe5\xc4\xc3\x77\x0b\
+\x62\x72\xe3\xe6\xcd\x4c\x73\x17\x2f\x5e\x70\x96\x89\xe7\x1c\xdf\
+\xf8\xd8\x12\x72\x56\x28\x55\xaa\xa9\x35\x00\xe4\x67\x78\xc7\x96\
+\xf0\xf6\x50\x39\xfa\xeb\x7c\xee\xc3\x9e\x30\xd1\xb8\xe6\x86\x01\
+\x00\xdf\x34\xdb\x4e\x5a\x23\xd6\xb0\x96\x57\xb8\x01\x00\x00\x40\
+\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\
+\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\
+\x00\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
+\x00\x00\x00\x04\x34\x00\x00\x00\xc4\xaf\xb8\xf2\x39\x66\x0d\x74\
+\x81\x87\x56\x3e\xbd\x19\xe6\x2e\xae\x7c\x3e\xb5\x3e\xf2\xb4\xfd\
+\x7b\x95\xfe\x10\xd2\xc7\x63\xbf\xce\x9d\x77\xf6\xcc\xae\xfc\x39\
+\xef\x8e\xf1\x2d\x18\xc9\x38\xe7\x3c\x12\x93\xfe\xaf\x3e\x9d\xfa\
+\xe0\xab\x0f\xac\x67\xce\xf0\xff\x50\x48\xd3\xd4\x16\x00\x72\xf4\
+\xf9\xe8\xc0\x6a\x3c\xbc\xb3\x0e\x2e\xf5\xd8\xf7\xcf\x5c\x3d\xea\
+\x8e\x01\x00\xdc\x1e\xaf\x70\x03\x00\x00\x80\x80\x06\x00\x00\x00\
+\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\
+\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x00\x01\
+\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\
+\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
+\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\x08\x68\x00\
+\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\
+\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\x68\x00\x00\
+\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\
+\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\
+\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\
+\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\
+\x34\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\x00\x00\x80\x80\
+\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\
+\x00\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x80\x80\x06\
+\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\
+\x00\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\
+\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\
+\x00\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\
+\x40\x40\x03\x00\x00\x00\x02\x1a\x00\x00\x00\x04\x34\x00\x00\x00\
+\x08\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\
+\x40\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x08\
+\x68\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\
+\x03\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\
+\x00\x00\x00\x10\xd0\x00\x00\x00\x20\xa0\x01\x00\x00\x40\x40\x03\
+\x00\x00\x80\x80\x06\x00\x00\x00\x01\x0d\x00\x00\x00\x02\x1a\x00\
+\x00\x00\x04\x34\x00\x00\x00\x7c\xc7\xfd\x47\x80\x01\x00\xf7\x97\
+\x58\xc2\x71\xe4\x3e\xe5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x02\xd4\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
+\x00\x00\x02\x9b\x49\x44\x41\x54\x78\x5e\xed\xd4\x01\x48\x93\x61\
+\x10\x06\x60\xe1\xe6\xbf\xe1\x92\x24\x13\xd1\x32\x8c\xb0\x96\x65\
+\x53\x44\xd3\x52\xdd\x66\xd5\xb0\x0d\x20\x47\x5a\x11\x26\x61\x53\
+\x75\x45\xaa\x2b\xcd\xb2\xe1\x54\x02\xcb\x11\x40\x41\x09\xe8\x14\
+\x62\xa5\x96\x26\x05\x60\x22\x2d\x93\x14\x2c\x43\xdd\x44\x4a\x43\
+\xca\x54\x29\x0a\xd4\x6d\xff\x7f\xd7\x50\x12\x22\x45\xad\x02\x90\
+\x3e\x78\xe1\xe0\x83\x87\x83\x83\xd7\x85\x88\xfe\x49\x56\x11\x0c\
+\xca\x41\x21\x28\xac\x47\xfc\x92\x07\x1a\x0f\x15\x0d\xbd\x8a\xc9\
+\x1b\xec\x14\x67\xf4\x9b\x05\xca\x4e\x1d\x1c\x7c\x21\x5a\x31\x0c\
+\x0a\x8b\x70\xfd\x31\x8b\xa9\xc8\x38\xca\x75\x0d\x4e\xa1\x83\x45\
+\x42\x44\xfa\xf1\x46\x3f\xdb\xa9\xdc\x34\xcc\x86\xa8\x3b\x86\x21\
+\xee\x71\xf4\xb2\x60\x88\x7f\x2d\x0a\x4a\xef\xff\xd4\xf0\xf2\x2b\
+\x59\xc6\x38\x1a\x98\x40\xb2\x8c\x73\x64\x1d\x9f\x9b\xe7\x33\x8e\
+\xf4\x66\xc4\x46\xea\xeb\xdd\x76\xfe\xbe\xfa\x0a\x88\xbd\xcb\x2c\
+\x0a\x83\xbc\x53\x21\x4e\xef\x71\xd4\xb4\x7f\x23\x53\xd7\x14\x95\
+\xd4\x8d\x62\x9a\xc1\xc2\x25\x5c\xee\x26\x59\x76\x07\x9d\x36\xf4\
+\x72\x46\xf3\x17\x6a\xec\x47\x7a\xd0\x37\x97\xfa\x1e\x3b\xe5\x57\
+\xf6\x3a\xf8\xd2\x6a\xe3\x82\x30\x1c\x30\xfb\xba\x2b\xcd\x33\x67\
+\xaa\x3e\x52\xe2\x55\x2b\x6e\x48\x6a\x9b\x04\x59\x73\x2e\xc8\x9a\
+\x44\xb3\xff\x92\x3a\x80\x58\x93\xdc\xe7\x70\xd3\x58\xd6\x9d\xb7\
+\xa4\x7f\x8a\xa4\x6f\x41\x2a\x76\x46\xf7\xc4\x46\x7b\xd3\x1b\x6d\
+\x10\x79\xe3\xe8\x2f\x30\x3f\xbe\xb5\xcd\x2f\xb1\x95\xbc\x13\x5a\
+\xa6\x79\xb2\xa6\x4c\x90\x36\xf0\x16\x3c\x68\x54\xe5\x46\x6f\x45\
+\x0d\xaa\xaa\x6c\xa4\x32\xe2\x6c\x12\xaa\x91\x14\x86\x0f\xe4\x16\
+\x53\x31\xf9\x13\x0c\xb2\x47\x27\x40\xfa\x90\x04\xf2\xe6\x6e\x90\
+\xdc\xf3\x5a\xea\xda\x8c\xf4\xf6\x3b\xdf\xb3\x56\xda\x52\x86\xb4\
+\xb9\x14\xc9\xbf\x04\x69\x53\x31\x47\xae\x11\x7a\x16\x42\x0b\x03\
+\xe6\x61\x9e\xe4\xfe\x08\xb3\xbf\xce\x00\x31\xb5\xb0\x18\x06\x11\
+\x06\x7f\x88\xac\xb0\x43\x44\x39\x07\xe1\x65\xe8\x71\xb2\x83\x7c\
+\x74\x48\xde\x57\x90\xbc\x8a\x90\x3c\x2f\x21\xf1\xe3\x8d\x08\x21\
+\x39\x1c\x84\x9c\xe3\x20\x2c\xbf\xcf\x05\xa2\xab\x84\x4b\x6d\x09\
+\xe1\xa5\x7c\xde\x9e\xf2\x76\x46\x76\x0b\x3d\x73\x27\x9c\x10\x4b\
+\xeb\x0a\x91\x3c\x2e\x22\xad\x2d\x40\x72\xcf\x47\x12\x6a\x1d\x24\
+\x38\xd5\x4b\x10\x9c\xc5\xc1\xae\x34\xcd\xb2\x3b\x00\x42\x0b\xf8\
+\xbc\xdd\xba\xe7\x4c\xdc\x4d\x74\xd7\xce\xd0\x9a\x0b\x4e\xec\x3c\
+\x92\x9b\x16\x49\x90\x87\xc4\xa8\xdf\x3b\xd1\x4c\x16\x82\x52\x34\
+\x2b\xee\x0a\x10\x6b\xf8\x10\x9a\x67\xe6\x49\xae\x21\x93\x3d\x4d\
+\x4c\x2e\x92\x6b\x0e\x12\xa4\x0e\x13\x88\x53\x59\xd8\x71\x5c\xf3\
+\xdb\x5d\x01\x3b\x53\x18\x08\xce\x30\x43\x94\x1e\x21\x6b\x9a\x20\
+\x65\x88\x20\x28\x99\x85\xed\x2a\xcd\x1f\x97\x10\x88\x54\x8c\x13\
+\x7b\x06\x61\x5a\x84\xc0\x24\x16\xb6\x29\x35\x7f\xad\xdd\x20\x40\
+\xce\x40\x60\x62\x2d\x6c\x95\xab\x57\x59\x1f\xff\x87\xbf\x03\xea\
+\x01\x27\x6b\xe4\x0e\xa9\xe9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x05\xf7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x05\x74\x49\x44\
+\x41\x54\x58\x85\xcd\x97\xcf\x6f\x1b\x45\x14\xc7\xdf\x9b\xd9\x1f\
+\xde\xb5\xd7\x89\xd3\x24\x35\x89\xc3\x8f\x42\x53\x08\x87\x22\x37\
+\x97\x56\x42\xa9\xc4\xc1\x7f\x40\x2b\x11\x11\x89\x14\xba\x51\xc4\
+\x81\x63\x11\x3d\x35\x39\x15\xc1\x91\x03\x8a\xb2\x15\xcd\xa1\x10\
+\x89\xe6\x0f\xc8\x01\xa9\xbd\xa4\x17\x17\x29\xa8\x0a\xa1\xa0\x40\
+\x89\x95\x5a\x69\xf3\xc3\xbb\xf6\xae\xf7\xd7\x0c\x07\x77\x93\x3a\
+\xb1\x13\x03\xaa\xc2\x93\x56\x5a\xcd\xce\xcc\xe7\xbb\x6f\xde\x9b\
+\x79\x83\xba\xae\xc3\x51\x1a\x39\x52\xfa\xff\x41\x80\xf0\x4f\x3a\
+\x8f\x18\x86\x20\x0b\x30\x24\x0a\x64\x14\x00\xfb\x08\x42\x1c\x00\
+\x80\x71\xa8\x00\xf0\x55\x3f\x60\x33\x6e\x00\x77\x6f\xe9\x7a\xd0\
+\xea\x9c\xd8\x4a\x0c\x4c\x1b\x06\xc9\x4b\xe4\xba\x20\xe1\x45\x29\
+\x2e\xa4\xe5\xb8\xa8\x12\x8a\x75\x7d\x58\xc8\xc1\xad\xf8\xb6\x57\
+\x09\x8a\x81\xc7\x6f\x0f\x7a\xec\xea\x98\xae\xb3\xff\x2c\x60\xcc\
+\x30\xfa\xa9\x42\x66\xe3\xc7\xe4\x01\x39\x2e\xc8\x87\xaa\x05\x00\
+\xb7\x12\xb8\x95\x0d\x77\x29\x74\xd8\xf0\xb4\xae\x3f\xfc\x57\x02\
+\xa6\x0d\x03\xf3\x12\xb9\x26\xa9\xe4\x72\x22\xad\x64\x90\xd4\xff\
+\x31\x70\x00\xdf\x0d\x01\x38\x00\x95\x08\xec\xf5\x08\x67\x1c\xca\
+\x45\xa7\xe0\xd9\xec\xc6\xa0\xc7\x26\xc7\x74\x9d\x37\xe2\x34\x8d\
+\x81\xbc\x44\xae\xc5\xbb\xe5\x2b\xb1\x76\x49\x8d\xda\x58\xc8\xa1\
+\xbc\xee\xae\x31\x37\x2c\x32\xc6\xd7\xc0\xe3\x77\x38\xa2\x85\x94\
+\x9f\x45\xc4\x7e\x51\x15\x4e\x28\x5d\x52\x9a\x0a\x04\x90\x20\x68\
+\x99\x78\xa6\xba\xed\x5d\xc9\xaf\xbb\x00\x00\x13\x2d\x7b\x60\xcc\
+\x30\xfa\x63\x1d\xd2\x8f\xc9\x8c\x9a\x89\xda\xaa\x25\xcf\xb6\xd7\
+\xdd\x45\xcf\x09\x3f\xb8\xa1\xeb\x7f\x36\x9a\x6c\xdc\x30\x4e\x31\
+\x01\x17\x3a\x4f\x6a\x1d\x44\xdc\x4d\x30\xb3\x60\x17\xaa\x9b\xde\
+\x7b\x8d\x96\x63\x5f\x1a\x4e\x1b\x06\xa1\x2a\x99\xd5\x7a\x95\x0c\
+\x90\x5a\x0f\x6b\xcd\x29\x94\x1f\x57\x27\xbf\x19\xf9\xe8\x5c\x33\
+\xf8\xb4\x61\x10\x50\xe8\x17\xed\x2f\xab\x0a\x91\x09\x44\x63\x81\
+\x00\x68\xbd\x4a\x86\xaa\x64\x76\xda\x30\xf6\xf1\xf6\x35\xe4\x65\
+\x72\x3d\xd1\xab\x0e\xa0\x44\x00\x28\x42\xd5\xf4\x6d\xd7\xf4\xbf\
+\x9e\xfa\xf0\xe3\x2f\x1b\x81\x23\x78\x5e\xa1\x73\xc9\xde\x58\x4e\
+\x4a\x49\x0a\x50\x04\xa0\x08\x2c\xe4\x00\x14\x01\x25\x02\x89\x5e\
+\x75\x20\x2f\x93\xeb\x07\x0a\x18\x31\x0c\x41\x50\xe8\x45\xb9\x5d\
+\x92\x81\x20\x30\x06\x60\x17\xdd\xc5\x96\xe0\x7d\x4a\x4e\x4a\xc9\
+\x0a\x10\x04\x20\x08\x9e\xe5\x3b\x4f\x97\xcd\xcd\x30\xe4\x00\x04\
+\x41\x6e\x97\x64\x41\xa1\x17\x47\x0c\xa3\x2e\xee\xea\x04\xc8\x02\
+\x0c\x49\x29\x29\x1d\x4d\x62\xad\x39\x6b\x9e\x1d\x7c\x70\x38\x5c\
+\xad\x87\x97\x7c\xc7\x5c\x75\xe6\x89\xcf\xcf\xd9\xc5\x6a\x31\x6a\
+\x97\x52\x52\x5a\x16\x60\xa8\xa9\x00\x51\xa6\xa3\x4a\xa7\xac\x22\
+\x45\x40\x8a\xc0\xdc\xb0\x78\xd0\x9a\xdf\x57\xe9\x5c\xf2\x95\x44\
+\x4e\xee\x94\x95\x68\x8c\x57\x0a\x1c\xab\x60\xcf\x0f\x3a\xe1\x85\
+\x29\x5d\xff\xd5\x2f\x07\x2b\xd1\x37\xa5\x53\x56\x45\x99\x8e\x36\
+\x15\x80\x88\x7d\x3b\x01\x84\x00\x3c\xe4\x6b\x07\xc1\xb5\xd7\x12\
+\x39\xb9\x53\x54\xa2\x60\x73\x4b\xbe\x63\xfd\x55\x9e\x3f\x63\x87\
+\x17\xa2\x5d\x90\x73\xfe\x90\x31\x0e\x40\x00\x88\x4c\x00\x11\xfb\
+\x9a\x0b\xa0\x10\x8f\xdc\xe5\x3b\x21\xf0\x80\xdd\x69\x0a\x3f\x91\
+\xc8\xc9\xc7\xa4\x1d\xb7\xbb\xdb\xbe\x63\xfd\x51\x0f\x07\x00\xe0\
+\x21\xdc\x0b\x5d\x06\x51\x3f\xa4\xb5\xf3\x23\xb2\x3d\x1b\x51\x2d\
+\x7a\xa3\x57\xce\xd1\x6a\x08\x7f\x43\xab\xc1\x9f\x99\xbb\xe1\x39\
+\xd6\xca\x7e\x78\xcd\xab\x5c\x8b\xb2\x62\x67\xe2\x66\x1e\xe0\x8c\
+\x57\x22\xa5\x34\x21\x00\x8a\x70\xb6\x0e\x9e\xa0\x73\x5a\x7f\x32\
+\x27\x77\xed\x06\x9c\xbb\xe5\x3b\xd6\x8a\xd5\x10\x0e\x00\x80\x22\
+\x39\x2f\x6a\xc2\x8e\x07\x38\xe3\x95\xe6\x02\x90\xaf\xb2\x80\xd5\
+\xd6\x4b\x22\x80\x88\xfd\x75\xf0\x93\xc9\x9c\xdc\x25\xed\xae\xf9\
+\xa6\xe7\x58\xbf\x9b\xf3\x67\xca\x8d\xe1\xcf\x04\xf4\x80\x80\x00\
+\x04\x80\x05\x0c\x38\xf2\xd5\xe6\x02\xec\x70\xc6\xdd\xf0\xec\x28\
+\x6a\xa5\x94\x74\x62\xdc\x30\x4e\xdd\x4f\xd0\xb9\xe4\x9b\x6d\xb9\
+\xd8\xf1\xe7\xa2\x7d\xcb\x77\xac\xdf\x0e\x86\x5f\x36\x8c\x57\x69\
+\x5c\x48\x47\x63\xdc\x0d\xcf\xe6\x76\x38\xd3\x54\x40\x25\x80\xbb\
+\xd5\xf5\xdd\xbc\x8d\xbf\x9e\x48\x33\x89\x2c\x24\xdf\x6a\xcb\xc9\
+\xdd\xcf\xb9\x7d\xc3\x73\xcc\xe5\xd2\x81\x70\x00\x00\x29\x29\x7e\
+\x97\x3c\xa5\xf5\x44\xe3\xaa\xeb\xd5\x62\x25\x80\xbb\x4d\x05\xdc\
+\xd2\xf5\x80\x55\xc2\xdb\xd5\x4d\xcf\x05\x82\x40\x55\x01\xba\xdf\
+\xed\xea\x90\x8f\xc7\x76\xe1\x4f\x3d\xc7\xfc\xe5\x70\xf8\xf8\xf7\
+\x37\x3f\x8b\xf7\x6b\xa7\x89\x4c\x6b\xf0\x4d\xcf\x65\x95\xf0\xf6\
+\xde\x6a\x69\xdf\x59\x90\xad\x04\x57\xad\x65\x73\x89\x47\xb9\x1b\
+\xa7\x3b\x87\x8a\xfb\xc4\x75\xcc\xa5\xed\x96\xe0\xb1\x6e\xe9\x53\
+\xa5\x27\xa6\x02\xa9\xd5\x06\xd6\xb2\xb9\x94\xad\x04\x57\xf7\xf6\
+\xdd\x27\x60\x4c\xd7\x59\xb8\xed\x0f\x9b\x0f\x4a\x85\x9d\xf4\xa1\
+\x08\xcc\x65\xb0\xb5\xb8\xe5\xf0\x72\xf8\xf9\x41\x6b\xfe\xc9\x0f\
+\x33\x0b\xda\xdb\xc9\x6b\xc9\x77\x52\x99\x68\xac\xf9\xa0\x54\x08\
+\xb7\xfd\xe1\x86\x59\xd2\xac\x22\x1a\x9f\xbd\x39\xa1\x0d\x24\xaf\
+\xa8\x7d\xea\x4e\x41\x12\x56\x43\x28\x2f\x9b\x45\x6f\xd3\x5b\x01\
+\x0e\x0f\x99\xc7\xee\x21\xa2\x86\x12\x39\x8f\x22\xf6\x50\x4d\x48\
+\xb7\x0d\xb4\xf5\x10\x69\xf7\xbf\xec\x55\xdb\xb6\x96\xcc\xaf\xa6\
+\x86\x2f\x4d\x34\xe2\x34\xad\x88\x06\xcb\xc1\x64\x7e\xc9\x04\xef\
+\x49\xf5\x72\xdb\xe9\x54\x06\x45\x02\x54\x15\xa0\x2d\xdb\x91\x06\
+\x80\x34\xf3\xd8\xb9\xa0\x1c\x5c\x42\x04\x10\xdb\xc4\x5a\x9e\x3f\
+\x67\xdc\x67\x50\x5a\xdc\x2a\xb8\x4f\xbc\x1b\x83\xe5\x60\x72\xaa\
+\x09\xa7\xb5\xa2\x34\x25\xce\x26\x4f\xa7\x06\x62\xe9\x58\x4b\x45\
+\x69\xb5\x58\x75\xcd\xc5\xad\xa5\x70\xcb\x3f\xb4\x28\xa5\xd9\x6c\
+\xf6\xc0\xc9\x7e\xca\x66\x37\xc6\x17\xf2\xd3\x8f\x36\xdc\x44\xf5\
+\xb1\xf3\x12\x67\x5c\x16\xe2\x54\x44\x91\xd4\x76\xd5\x67\x0f\x73\
+\x43\xb0\x1f\xd9\xb6\xf5\xf3\xf6\xaa\xfb\xa8\xf2\xed\x99\x52\xf0\
+\xfe\x84\xae\x3f\x3d\x4c\x6c\x4b\xf7\x82\xc8\x46\x0c\x43\x88\x0b\
+\x30\x84\x9a\x38\x8a\x00\x7d\x44\xc0\xda\xc5\x24\xe0\x15\x0e\xb0\
+\xca\x2d\x7f\xa6\xf2\x22\x2e\x26\x2f\xd2\x8e\xfc\x6e\x78\xe4\x02\
+\xfe\x06\x88\x39\xad\x57\x92\xe3\xa1\x6d\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x90\xe2\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -8458,235 +2939,3484 @@ qt_resource_data = b"\
 \x43\x43\xe7\x44\xfb\x0e\xae\x01\x99\xa1\x48\xff\x1f\xe1\x02\x16\
 \xef\x12\xb7\x4a\x4b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
 \x82\
-\x00\x00\x02\xa6\
+\x00\x00\x13\x85\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
+\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x11\x98\
+\x49\x44\x41\x54\x68\xde\xbd\x9a\x69\x8c\x64\x57\x75\xc7\xff\xe7\
+\xdc\xfb\x96\x7a\xb5\x57\x75\x55\x2f\xd3\xd3\xd3\xe3\xd9\xec\x19\
+\xc0\xe3\x8d\x25\x0a\x21\x21\x06\xdb\x8c\x1d\x03\x22\x2c\x1f\x92\
+\xaf\x91\x10\x5f\x90\x12\xa2\x84\x04\x45\xc0\x87\x44\x91\x12\x12\
+\x24\x50\xa4\x80\x42\x16\x10\xc1\x36\x46\x78\x19\x2f\x2c\x8e\x10\
+\xd8\xc6\x66\x3c\x1e\x7b\x86\xd9\xf0\x4c\x4f\x4f\x75\x75\x57\x77\
+\x75\xbd\x5a\xde\x7e\xef\xcd\x87\x9a\x1e\xb7\x27\xf6\x2c\x40\x78\
+\xd2\xd1\xbd\xef\xbd\x5b\xb7\xcf\xef\x9e\xff\x3d\xf7\xde\xaa\x26\
+\xfc\x8a\xd7\x63\x4f\x3e\x0c\x63\xcc\x65\xdb\x10\x11\xee\xb8\xfd\
+\xc0\xaf\xfa\xa7\x5e\xbf\xef\x6b\xfd\xc0\xe3\xdf\x7b\x04\x5a\x6b\
+\x00\x80\xe3\x38\xe8\x0f\xfa\x6c\x49\xcb\x25\xa2\x12\x80\x02\x00\
+\xe7\x42\xd3\x18\xc0\xd0\x18\xd3\xcf\xb2\x2c\x2a\x16\x8a\x3a\x8a\
+\xa3\x8b\xfd\xdc\xf5\xde\x7b\x7e\xf3\x00\x07\x9f\x78\x18\x80\x46\
+\x14\xc5\x2c\xa4\xa8\x09\x16\x7b\x85\x10\x37\x09\x21\xf6\x0a\x21\
+\xe7\x84\xe0\x0a\x13\x3b\x00\xa0\xb5\x8e\x95\x52\x3d\xa5\xd5\x82\
+\x52\xea\xa8\xd6\xfa\x90\x52\xd9\x51\xa5\x74\x57\x08\xa1\x89\x08\
+\x07\xee\xbc\xf7\x37\x07\x70\xf0\x89\x87\x40\xc4\xac\x54\x3a\xcf\
+\x2c\xde\xed\xd8\xce\x81\x5c\xce\xbb\x25\xef\xe5\x27\xdc\x5c\xce\
+\xb1\x2d\x9b\x85\x10\x20\x22\x00\x06\x5a\x6b\x64\x99\x42\x92\xc4\
+\x3a\x8c\xc2\x38\x08\x82\xd5\x30\x0a\x9e\x4f\x92\xe4\xe1\x2c\xcb\
+\xbe\x2f\x84\x38\xa3\xb5\xd6\x77\xdf\xf5\xfe\xff\x5f\x80\x83\x4f\
+\x3c\x04\x66\x86\x52\xaa\x46\x44\x77\xba\xae\xfb\xc7\xe5\x52\xe5\
+\x6d\x95\x72\xb5\x92\xcb\xe5\x60\x60\x10\x27\x31\xa2\x30\x40\x14\
+\xc7\xc8\xb2\x0c\x00\x20\xa5\x84\xe3\x38\x70\x1d\x17\x96\x65\xc1\
+\x68\x83\x20\x0c\xe0\xfb\x7e\xaf\xdf\xf7\x9f\x89\xe2\xf8\xdf\x8d\
+\xd1\x07\x01\x74\x95\x52\x78\xff\x3d\x1f\xfa\xf5\x03\x3c\xfa\xf8\
+\x77\x21\x1d\x1b\x69\x14\xef\xb4\x2c\xeb\xe3\xe5\x52\xe5\x23\xcd\
+\xe6\xe4\x8c\xe7\x79\x88\xa2\x10\x6b\x6b\xab\x58\xe9\x74\xd0\x5d\
+\xef\xe9\xe1\x28\xcc\xa2\x44\x65\x4a\x41\x03\x80\x14\xc4\x8e\x2d\
+\x64\x31\x9f\x93\xf5\x7a\x85\x27\x26\x1a\xa8\x56\x2a\x90\xc2\xc6\
+\x70\x38\x40\x67\xb5\xd3\xea\x0f\xfc\x6f\xa6\x69\xfa\xa5\x24\x4b\
+\x4f\x59\x52\xe2\x03\xf7\xfc\xe1\xaf\x0f\xe0\xb1\x27\x1f\x06\x11\
+\x71\x96\x65\x37\xb9\xae\xfb\xd7\xcd\xc6\xd4\x1d\xcd\xe6\xa4\x9b\
+\xa4\x31\x5a\xad\x45\x2c\x2c\x2c\x9a\xd6\x72\x2f\x58\x0f\xc8\x1f\
+\x29\xcf\x8f\x91\x1f\x66\xc6\x89\x35\x84\x02\x00\x46\x26\x24\x62\
+\xc7\xa1\xa0\x50\x90\x41\xb9\x96\xa7\xf2\x96\xa9\xaa\xb7\x75\xeb\
+\x2c\x35\x27\x9a\x30\x00\x56\x56\x96\xa3\xd5\xd5\xce\x63\x51\x1c\
+\x7d\x4e\x08\x71\xc8\x64\x99\xbe\xf7\xde\x0f\xff\xea\x00\x0f\x7e\
+\xf7\x3e\x78\x9e\x47\x59\x96\xdd\xea\xba\xb9\xcf\xce\xce\xcc\xde\
+\x5e\xab\x4d\xc8\x6e\x6f\x15\x27\x4e\x9e\xc0\x99\x85\x95\xa0\xdd\
+\x97\xcb\x03\x4c\x2c\xa7\xa2\x3a\x84\x70\x14\x11\x63\xac\x7e\x18\
+\x63\x0c\xb4\x01\xb4\x36\xc6\x18\x0d\xd2\x89\x74\xe1\x17\x2b\xbc\
+\x36\x39\x53\xd1\x93\xd7\x6d\x9b\xf2\xb6\xcf\x6f\x47\xce\xcd\xa1\
+\xd3\xe9\x64\x4b\xed\xd6\x93\x51\x1c\x7d\x46\x82\x9e\x1b\xc5\x91\
+\xf9\xd8\x87\xff\xe8\xaa\x01\xe4\xeb\x3d\x14\x42\x20\x8e\xe3\x9d\
+\x39\x37\xf7\x17\x33\xd3\xb3\xb7\xd7\xeb\x0d\xd9\x6a\x2f\xe2\xe5\
+\xa3\x47\xf5\xe9\xc5\xc1\xda\x6a\x36\x79\x36\xb5\x26\x7b\xd2\x72\
+\x55\x4e\x80\x99\x48\x02\x63\xcf\x8d\x01\xb4\x31\x46\x1b\x63\xb4\
+\x26\x28\x4d\x5a\x69\x37\x0b\x4d\xae\x1b\xeb\x5a\x7f\xb8\xde\x59\
+\xeb\x87\x4b\xdb\x82\x20\xac\xef\xd9\xbd\x9b\x9b\x93\x93\x52\x1b\
+\x7d\xfb\xf9\xd6\xf9\x30\x8a\xa2\x3f\x67\xe2\x93\xd7\x12\x01\x71\
+\xe9\x83\xef\x3c\x74\x3f\x8c\x31\x65\xcb\xb2\xfe\x6c\x7a\x6a\xe6\
+\x63\x53\x93\x53\x76\xab\xbd\x88\x17\x0e\xbf\xa4\x4e\x9c\x8f\x96\
+\x56\xb1\xe3\x24\x79\x53\x43\xcf\x75\xd8\xb1\x48\x48\x49\x42\x0a\
+\x22\xc9\x0c\x21\x98\x84\x60\x48\x41\x24\x98\x88\x99\x40\x44\xc4\
+\x44\x44\x64\x08\x2c\x75\x82\x62\x30\xcc\x72\xbd\x70\xb0\x66\xe9\
+\xa4\x9f\xaf\x94\x8b\x5c\xaf\xd5\x39\xcb\xb2\xed\x41\x30\xa2\x2c\
+\xcb\x9e\xfe\xd0\x87\x3e\x18\xdf\x7f\xdf\xb7\x7f\xe9\x08\x08\x22\
+\xba\xab\x52\xae\x7c\x74\xb2\x39\xe5\x76\xd7\xd7\xf0\xf2\xd1\x9f\
+\xeb\x5f\xb4\xd3\xa5\x9e\xd8\x79\xda\xc9\x55\x52\xc7\x62\x29\x98\
+\x88\xc6\xfe\x81\x00\x68\x6d\x30\x08\x42\x2b\x8e\x53\xa1\xc7\x91\
+\x30\x44\xac\x73\x39\x37\x66\x66\x45\x0a\x46\x6b\x63\x34\x91\xc9\
+\x74\x29\x68\x2b\x71\x4a\xb4\xce\xc3\xb1\x4f\xcf\xec\xdb\x7b\x03\
+\x4f\x4f\x4d\xbb\xa3\xd1\xe8\xa3\x6b\xe9\xea\x33\x5a\xe9\x6f\x01\
+\x50\xd7\x1c\x81\xfb\x1f\xfc\x26\x88\x68\xde\x75\x72\x9f\x9e\x9b\
+\x9b\xbf\x91\x99\xe9\xd8\xb1\xa3\xf8\xf9\x99\xee\xea\x1a\x6d\x3f\
+\x6d\x7b\xf5\xd4\x73\x84\xb4\x24\xb3\x25\x99\xa5\x60\xb6\x04\x93\
+\x94\x02\x61\x14\xb9\xa7\x7e\xb1\x30\x13\x05\x83\x89\x2c\x09\x2b\
+\x83\xfe\xa0\xda\xe9\xae\xe7\x2b\x95\xd2\xc8\x75\x6c\x0d\x10\x68\
+\xbc\xab\x20\x22\x90\x82\x9d\x46\xda\x0e\x4c\xb4\x9a\xcf\x3b\xc8\
+\x4f\x4c\x34\x20\x85\xc8\xfb\xfd\x5e\x21\xcd\xd2\x1f\xdd\xfb\x81\
+\x3f\xe8\x7d\xfb\x81\xef\x5c\x5b\x04\x88\x48\x00\x78\x4f\xa5\x52\
+\x79\x7b\xa1\x50\xa0\xb3\x0b\xaf\xe0\xcc\xe2\x4a\xb8\xae\xa7\xcf\
+\x4a\xaf\x1e\x79\xae\xb0\xac\xb1\x4c\x58\x32\x81\x05\x83\x89\x00\
+\x02\xf9\xad\x91\x37\x55\xcb\x15\x3f\xf8\xee\xbd\xb2\x52\x70\x71\
+\x7e\xa5\x8f\x6f\x3e\xf1\x12\x33\x20\x6c\x4b\x10\x11\x71\xc6\x6c\
+\x94\xd6\xd0\xda\x80\x94\xe6\x58\x97\x46\xed\x28\x3e\x7b\x66\x71\
+\xb9\x50\xaf\xd7\x73\xd5\x6a\x8d\x2a\xe5\xea\xdb\xc3\x30\x7a\x0f\
+\x88\xbe\x72\x35\x51\xe0\x8d\xca\x57\xbf\xf6\x15\x28\x95\x35\x6c\
+\xcb\xbe\xa3\x5e\x9f\xa8\x84\x61\x80\xc5\xf3\x2d\xb3\x1a\x38\xcb\
+\xca\x9d\xec\x7b\xae\x94\xb6\x14\x64\x5b\x82\x6d\x4b\x90\x10\x24\
+\xa2\x28\x72\x7b\xfd\x81\xb7\xd8\x5a\x29\x77\xbb\xdd\xea\xcd\x7b\
+\xa6\xe5\xae\xd9\x2a\x26\x6b\x2e\xa6\x1b\x45\xb8\x8e\x05\x69\x09\
+\xb2\x2c\x49\x96\x25\xd8\xba\x50\x97\x52\x8c\x4d\x08\x1a\x9a\xda\
+\x7a\xbb\x2f\x96\xdb\xed\x65\x03\x02\x26\xea\x13\x15\xdb\xb2\xee\
+\xd0\x59\xd6\xf8\xe2\x97\xbe\x70\xf5\x11\x50\x99\x80\x31\xd8\xe3\
+\x79\xf9\xfd\x9e\x97\xc7\xf2\x4a\x0b\x9d\xee\x30\x1c\xd1\x54\xc7\
+\x75\x73\xb0\x6d\x49\x63\xb9\x30\x59\x92\x69\x34\x0a\xed\x23\xc7\
+\x4e\x4f\x39\x92\xec\x52\xde\x11\xef\xdc\x3f\x2b\xdf\x71\xe3\x56\
+\xd2\x3a\x33\x66\x9c\x4b\x41\x4c\x90\x42\xb0\x35\x9e\x31\x9a\x48\
+\x13\x29\x0d\xde\xd0\x11\x69\xa4\xe4\xe8\xf5\xac\xba\xb2\xdc\xf5\
+\x9b\x73\xa3\xa1\x57\x2a\x95\xe1\x79\xde\xfe\xc1\x70\xb0\x47\x83\
+\xda\x57\x0d\x20\xad\x4c\x30\xbb\xfb\x0b\x85\xc2\x0c\x60\xd0\xed\
+\x76\xe1\x47\xa2\x0f\xa7\x16\x38\xb6\x64\x29\x98\xa5\xdc\x00\x10\
+\xa4\x8d\x16\x9e\x23\xdc\x8f\xdc\xbe\xcf\xd9\xb1\xb5\x6e\x72\x8e\
+\x84\xd6\x19\xd2\x34\x21\x66\x69\x88\x08\x4c\x74\xb1\x3d\x08\x6c\
+\x00\x4d\x4c\x50\xca\x00\x44\x00\x11\x0c\x69\x13\xab\xd2\xb0\x3b\
+\xf4\x7d\xbf\xdf\xf7\xb6\xcc\x94\x50\x28\x14\x67\x3a\xab\xab\xfb\
+\x19\xfa\x47\x57\x92\xd1\x45\x09\x11\xc1\x91\x42\xee\xcd\xe5\x3c\
+\x27\x4d\x13\xf8\xfd\xa1\x8a\x4d\xbe\x2f\x6d\x4f\x59\x82\x49\x0a\
+\x06\x8f\xf5\x4f\x2c\x98\x98\x19\x44\x80\x36\x06\xa3\x30\xa1\x6e\
+\x3f\x04\xc0\x10\x42\x82\xc7\x79\x93\x08\x04\x79\x21\x6a\x52\x8c\
+\x65\x23\x84\x20\x31\x9e\xf8\xe3\x67\x42\x10\x84\x93\x8d\x54\xae\
+\xdf\x1f\x0c\x15\x01\xc8\x7b\x05\x47\x0a\xb9\x97\x88\x1c\x5c\xe1\
+\x92\xaf\x02\x50\x5e\x08\x39\x67\xdb\x36\xc5\x71\x84\x20\x4a\x32\
+\x25\xea\x81\xb4\x24\xc4\xd8\x61\x12\x3c\x76\x9c\x99\xc9\xb1\x2d\
+\x13\x26\x3a\xbd\xff\x07\xc7\x48\x30\x51\xbd\xe4\xca\x8f\xdd\x75\
+\x23\xaa\x05\x1b\x84\x0b\x03\xcc\x44\x42\x32\x09\x29\x48\x83\xa0\
+\xc7\xc8\xe3\x97\x4a\x03\x80\x49\x95\x41\x98\x52\x3a\xd0\xf6\x60\
+\x18\xc4\x99\xd2\x4a\xe4\x5c\x97\x84\x10\x73\x44\x9c\x07\x10\x5c\
+\x6d\x16\xf2\x98\xb9\x26\x84\x40\x10\x86\x48\x33\x93\x19\xe1\x25\
+\x82\xc7\xa3\xbe\xb1\x48\x09\xc1\xc4\x44\x28\x97\xf2\xd9\x3b\x6e\
+\xdd\xb7\xac\xb4\xa6\x6e\x6f\x60\xaf\x2c\xb5\x27\xd3\x54\x59\x82\
+\xc9\x18\x8c\x93\x26\x11\x20\x98\x21\x05\x93\x36\x30\x06\xe3\x75\
+\x03\x4a\x9b\x28\xd1\xaa\xbd\x9e\x44\xa7\x5a\xa3\x51\x6b\x2d\x8a\
+\x76\xd5\x22\xec\x6d\xaa\xdd\x5a\x6b\xc7\xb2\x6d\x08\xe6\x1a\x00\
+\xef\xaa\x23\x60\x8c\xb1\x01\xe4\x08\x04\xa5\x14\xb4\x21\xcd\xc2\
+\xd2\xc4\x8c\x30\x35\x59\x90\x2a\x93\x77\x49\xe6\x05\x59\xc4\x44\
+\x52\x08\xd4\x6b\xa5\x54\x30\x43\x30\xd3\xfa\xea\xaa\x21\x22\x10\
+\x33\x11\x60\x36\x12\xfe\x86\xec\x84\x06\x25\x99\x51\xfd\x48\xa5\
+\x4b\xdd\x28\x3c\xdd\x0e\x46\x67\x96\x83\xb0\x37\x4c\xb2\x38\xd1\
+\xa6\x24\x75\x98\x64\x48\x8d\x31\x60\x66\x80\x28\x77\xc1\xa7\xab\
+\x03\xd0\xda\x90\x36\xfa\xe2\xf9\x96\x99\x89\x98\xb1\x3a\xc8\xc2\
+\x93\x4b\xc1\x30\x4c\x8d\xaa\xe4\x6d\x39\x59\x75\xdc\x66\xd9\x76\
+\x2a\x79\xe9\x14\x72\xd2\x72\x2d\x23\x94\x86\x36\x20\x03\x02\x98\
+\x08\x66\x1c\x00\xa3\x35\xcc\x30\x32\x49\xe2\xab\xd1\x8a\x1f\x47\
+\xe7\xd7\xe2\xf0\x7c\x37\x8e\x3a\x7e\x9c\x8e\xc2\x54\x29\x65\xc0\
+\x42\x40\x48\x82\x10\x0c\x66\x43\xcc\xb4\x31\xa0\x30\x5a\x5f\xf1\
+\xbc\xb2\x09\x40\xc5\x2a\x53\xa1\xd6\x1a\x42\x08\x58\x92\x39\x0d\
+\x33\x1c\x59\x18\xf9\x8b\x6b\x71\x24\x2d\x41\xdd\x00\xf1\x62\x2f\
+\x0b\x5d\x3b\x66\xcf\x95\x5c\xc8\x09\x59\x70\xa5\x48\x82\x51\x11\
+\xc3\xb4\x1e\x25\x86\xa2\x0c\x30\x06\x26\x48\x0c\x56\xfc\x64\xf4\
+\xb3\x75\xff\x7c\x2a\xb4\x3f\x08\x33\x9d\x24\x4a\x67\x4a\xc1\x18\
+\x82\x90\x12\x44\x0a\x5a\x13\x58\x03\x9e\xc3\xd2\x75\x48\x08\x16\
+\x50\x2a\x42\x96\x65\xa1\x52\x2a\xbe\x6a\x80\x2c\x53\x41\x9a\xa6\
+\xdd\x34\x4d\x60\x49\x0b\xae\x2d\x64\x10\x06\xa6\xd5\xe3\x48\x83\
+\x0d\x48\xc0\x10\x91\x32\xac\xa3\x8c\x74\x12\x1a\xf2\x63\x95\x12\
+\x19\x13\x0d\x63\xb3\x85\xb3\x24\xca\x8c\x9d\xa8\x71\x10\x93\xcc\
+\x20\x4c\x75\xb6\x1a\xea\x84\x5c\x64\x1a\x0c\x96\x80\x64\x82\x51\
+\x0a\x9a\x5e\x1d\x5c\x21\x80\x7a\x01\xb9\xa2\x67\x5b\x52\x5a\x48\
+\xe2\x18\x69\x9a\x76\x33\xa5\x82\xab\x07\x48\x93\x51\x92\xc4\xe7\
+\xc2\x30\x44\xb5\x56\x81\x97\xb3\xa5\xc9\x46\x76\x94\x7a\x9a\x85\
+\xc0\x38\x8b\x30\x34\x31\x88\x98\x40\x6c\x98\x18\x60\x06\x58\x8c\
+\x55\x43\x04\x22\x36\xe3\x14\x4f\x04\x22\x10\x0b\x23\xa4\x34\xac\
+\x35\x69\xad\x41\x1b\xce\xab\x71\x7a\x37\x00\x6c\x02\x6f\x29\x9b\
+\x72\xb5\x94\xb7\x59\x08\x8c\x82\x11\xe2\x24\x3e\x97\xa6\xe9\xe8\
+\x4a\x00\x17\xd7\x01\xa5\x54\x1c\xc7\xf1\x4b\x83\x41\x3f\x62\x96\
+\x28\x15\x0b\x5c\x73\x93\x4a\x4e\xa6\x56\x66\x58\x6b\xb0\xd1\x60\
+\xa3\xc0\x46\x83\x2e\xde\x6b\x12\x5a\x83\x8d\x01\x19\x80\x0c\x31\
+\x83\x88\x31\x3e\x2b\xd1\x05\x8d\x4b\xb0\x10\xaf\x6b\x44\xc2\xd4\
+\x3c\xe3\x6c\x6f\x50\xa3\x56\x29\x4b\xad\x35\x7c\xdf\x8f\xe2\x38\
+\x7e\x49\x65\xe9\x15\x25\x74\x11\x40\x08\xa1\x92\x34\x3d\xdc\xf3\
+\xfd\x56\x96\x65\x28\x95\x4a\x98\xab\x8b\xc6\x7c\x39\xae\x6a\xc3\
+\x46\x19\xd2\xda\x8c\x1d\x57\x10\x46\x83\xb5\x26\x36\x1a\xc2\x18\
+\x62\x0d\x82\x21\x26\x08\x66\xb0\x60\x10\x6f\x64\xa1\x0b\x00\x52\
+\x40\x88\xb1\x8d\xd7\x92\x71\x49\x82\xb1\x73\x22\xad\xee\x9c\xca\
+\x35\x4a\xa5\x12\x82\x51\x80\xf5\xde\x7a\x2b\x49\x92\xc3\x24\xad\
+\xab\xdf\xcc\x7d\xe2\xe3\x9f\x84\xd6\xfa\xb8\xef\xfb\x2f\xf8\x3d\
+\x1f\x85\x42\x11\xd3\x13\xf9\xc2\x4d\xd3\xe1\x7c\xce\xd2\x32\x33\
+\x64\x14\xc8\x28\x43\x5a\x81\xb4\x1a\x83\x68\x4d\xac\x0d\x31\xe2\
+\x44\x51\x6b\xa5\x8f\xb3\x4b\x3d\x3a\xbb\xd4\xa3\x56\xa7\x8f\x24\
+\x53\x24\xe4\x78\xa4\x85\x78\x6d\x14\x48\x8c\xe5\x57\x70\x8c\xf5\
+\xd6\xad\xe9\xfc\xdc\x54\xb5\xe0\x38\x39\x74\x56\x3b\xe8\xf5\x7a\
+\x2f\x28\xa5\x8e\x7f\xfa\x53\x7f\x75\x25\xff\x5f\xbb\x9d\x66\x12\
+\x9d\x30\x0c\x0e\x2e\x2d\xb5\x7e\xaf\x56\xaf\x55\x1b\x13\x75\x7e\
+\xf3\x96\xf3\xf3\x27\xfd\xc1\xe2\x4f\x57\x1a\xe7\x34\xd8\x10\x08\
+\x04\xbe\xb0\xb5\x61\x02\xd8\xb0\x74\x54\xbb\xa3\x86\x5f\xfe\xce\
+\x8b\xda\xb2\xa4\x01\x80\x34\xcd\xa8\x3b\xd2\x81\x35\xed\x68\x12\
+\x1b\xc7\x0e\x03\x63\x0c\xd8\x18\x18\x6d\x60\x98\x71\xdb\x4c\x38\
+\x7d\xcb\x76\x77\x7e\xaa\xd1\xe4\x38\x8a\x70\xee\xdc\xc2\xfa\x28\
+\x18\x1d\x94\xcc\x9d\x2b\x7a\x7f\x29\x80\x32\x99\x82\xc6\xf7\x3a\
+\xab\x9d\x67\x57\x3b\xab\xef\x6d\x34\x26\x68\x6e\x6a\x54\xf8\x9d\
+\x91\xff\xa6\xb5\x24\x3f\x38\x33\x2a\xaf\x8f\x27\x30\x01\xe3\x09\
+\x6c\x88\x19\xec\x95\x43\x9e\xbd\xf1\xe5\xbe\xd1\x8c\x0b\x27\x34\
+\x63\x00\xab\xc6\x9a\x9c\x42\x64\x40\x04\x63\x60\x0c\x83\x79\x0c\
+\x61\x48\x9b\x5d\xb5\xb8\x7a\xfb\xae\xf4\x4d\xbb\xe7\x66\x0b\xae\
+\x9b\xc3\x89\x93\x27\x4c\x7b\xb9\xfd\xac\xca\xd4\xf7\xb4\x36\xd7\
+\x7e\x22\x7b\xe4\xa1\x47\x71\xe0\xc0\x9d\xfd\x24\x49\xd2\x4c\xa9\
+\x77\x36\x26\x1a\x85\x42\xb1\x40\x36\xc2\x82\x47\x23\xbb\x1d\xe4\
+\xd6\x06\xca\x8d\x85\x10\xe3\x3d\xd1\x05\x39\x08\x69\x19\x99\x2f\
+\xc5\x4e\xa1\x12\xdb\xf9\x4a\x6c\xe5\xcb\xb1\xf4\x4a\xb1\x70\xbc\
+\x04\xc4\x17\x47\x1e\x06\xd0\x30\x50\x1a\x66\xb6\x10\x16\xef\xdd\
+\xd3\xbb\xe9\xb7\xf6\xd4\xb7\x6d\x99\x9e\xe1\x6e\xb7\x8b\xc3\x47\
+\x0e\xaf\xac\xae\x76\xfe\x96\xc8\xfc\xf8\x53\x7f\xfa\x97\xe6\x9a\
+\x01\x00\xe0\xc0\xdd\x77\x99\x34\x4d\xce\x25\x49\x3c\x61\x8c\xd9\
+\xdf\x6c\x4e\x4a\xcf\xcb\x71\x51\x84\x95\x8a\x1c\xba\xdd\xd8\xee\
+\xf5\xb3\x5c\x4c\x2c\x30\xde\xa1\x0a\xb0\x60\x5c\x80\x22\x66\x41\
+\x34\x5e\x8e\x09\xc6\xd0\x86\xf3\x06\xe3\x73\x33\xb4\xc1\xf6\xd2\
+\xb0\xf2\xfe\xdd\xeb\x37\xff\xf6\xee\xf2\x8e\xed\x73\x5b\x65\x18\
+\x86\x78\xf1\xc8\xe1\xe0\xdc\xc2\xc2\x57\x95\x56\xff\x7a\xe2\xc4\
+\xc9\x68\x7e\xfb\x3c\x8e\x1d\xfd\xf9\xb5\x03\x3c\xf2\xf0\x41\xdc\
+\x7d\xcf\x81\x38\x4d\xd3\x57\x82\x20\x98\x27\xe2\x9d\x93\xcd\x49\
+\xe1\x79\x2e\x97\xac\xa8\xda\x74\x06\x65\x82\x49\x7a\xa9\x1b\xa4\
+\xb0\x14\xf3\x6b\xa3\xc1\x9b\xbe\x1f\x35\x66\x7c\x7c\xbc\x60\xc6\
+\x13\xa9\x7d\x6b\xa3\x3b\x7b\x60\x87\x7f\xf3\xdb\x76\x56\xe7\xe7\
+\x66\x67\x65\x92\xa4\xf8\xd9\xa1\x9f\xe1\xb9\xe7\x9f\x7b\xe5\xd8\
+\xf1\xe3\xdf\x38\x72\xe4\x48\x7b\x34\x0a\x54\x96\x65\xd9\x9b\xde\
+\xbc\x0f\x37\xdf\x72\x13\x8e\xbc\xf8\xd2\xd5\x03\x00\xc0\xa3\x8f\
+\x1c\xc4\x81\x03\x77\x77\xa3\x38\x3c\x3d\x18\x0e\xae\x23\x60\x7b\
+\xa3\xd1\xa0\x52\xb1\xc8\x95\x9c\x2a\xcd\xe4\x06\x93\x93\xce\x30\
+\x0f\x20\x8b\x8c\x95\x64\x90\x5a\xd3\x78\x31\x33\x86\x36\xbe\xd4\
+\x82\x56\x1a\x64\x14\xe7\x39\xb2\x77\x17\xd7\x9b\xbf\xbf\x65\x65\
+\xdf\xef\x6e\x4f\xdf\xfc\x96\xeb\x9a\x8d\xe9\xa9\x29\x8e\xa3\x18\
+\x87\x5e\x38\x84\xe7\x9e\x7f\x0e\xed\x76\xdb\x0d\xa3\x68\xbf\x9b\
+\xcb\xbd\xdb\x92\xf2\x36\x66\x86\xd6\xfa\x8c\xd6\x5a\x5d\x2e\x12\
+\x6f\xb8\x59\xfa\xa7\x2f\xfe\x23\xa2\x28\x21\x66\xb3\xdf\xf3\xbc\
+\xcf\x6c\xdb\xb6\xed\xce\xdd\xbb\x76\xbb\x5e\x3e\x8f\x20\x1c\xa2\
+\xe7\xf7\xf5\xaa\x1f\x8f\x96\x86\x72\xe5\x7c\xe0\xad\xac\xc4\x9e\
+\x3f\x54\x6e\x98\x1a\xa1\x00\x82\x45\xa9\x28\x8a\x38\xd7\x74\x83\
+\xf2\x96\x7c\xd4\x9c\x2d\x9b\xe6\x4c\xad\x90\x6f\xd4\x27\xd8\x71\
+\x5c\xac\xad\xad\xe1\xe8\xb1\x97\x83\x9f\x3e\xf7\xdc\xc2\xd9\x73\
+\xe7\xb6\xdd\x70\xfd\x9e\x5c\xb1\x58\x84\x65\x49\x04\x61\xa8\x4f\
+\x1e\x3f\x71\x6a\x69\xa9\xfd\x59\x63\xcc\x7d\x44\x14\x3f\x70\xdf\
+\x83\xd7\x06\x00\x00\xff\xf0\x85\xbf\x07\xa5\x84\x94\xd3\x3d\xb6\
+\x65\xff\x49\xa3\xd1\xf8\xe8\x8e\xeb\x76\x4e\x4f\x4f\x4f\x41\x5a\
+\x12\x51\x1c\x21\x0c\x02\x04\x51\xa2\x82\x58\x25\x51\x66\x92\x4c\
+\x23\x03\x00\x8b\x49\xe6\x6c\xb6\x8b\x39\xcb\x2e\xe4\x3d\x51\xc8\
+\x17\xe0\x38\x2e\xa2\x30\xc2\xc2\xb9\x05\x9c\x3c\x79\x62\x69\xa5\
+\xb3\xf2\xf5\x67\x9e\x7d\xfe\x19\xbf\x3f\xf8\xfc\xdb\x6e\xbb\x79\
+\x77\xbd\x5e\x47\xad\x56\x43\xad\x5e\xc5\xda\xda\x1a\x9e\x79\xe6\
+\xd9\xe3\xed\xa5\xf6\xe7\xb4\xd6\xf7\x1b\x63\x22\xcf\x93\xf8\xfa\
+\x7f\x3e\x70\x65\x09\x6d\x5c\x8f\x1d\x7c\x02\x07\xee\xbe\x0b\x71\
+\x9a\xae\xa9\x2c\xfb\x69\x7f\x30\x38\xbd\xba\xba\x5a\xf2\xfd\xde\
+\x04\x0c\xdc\xbc\x57\x40\xa9\x58\x42\xb9\x54\xe2\x5a\xb9\x68\x35\
+\x2a\x79\x77\xaa\x56\xf0\xa6\x6b\x45\x6f\xaa\x5e\x76\x1b\xf5\xaa\
+\x55\x2e\x95\xd9\x71\x5c\x44\x51\x84\x85\xb3\x67\xf1\xd2\xcb\x47\
+\xfc\x13\x27\x8f\xff\x68\xa5\xb3\xf2\x77\x69\x9a\xfe\xdb\xa3\x8f\
+\xff\x60\x31\xe7\xba\xb7\x57\xab\xe5\xeb\x98\x19\xfd\xfe\x00\xa3\
+\xe1\x08\x93\x93\x4d\x34\x1a\x13\x13\x7e\xcf\xdf\x37\x1c\x0e\x3b\
+\x59\x96\x1d\x37\x86\xff\x8f\x9c\x2e\x0b\x00\x00\x8f\x1e\x7c\x0c\
+\x4f\x3e\xfe\x24\xd6\xba\x2b\xe1\x0b\x87\x5e\x38\xca\x82\x9f\xf2\
+\x7d\xff\xf4\xf2\xf2\xb2\x5a\x59\x5e\x76\x7b\x3d\xdf\x0e\xc3\xc8\
+\xce\xd2\x14\x4a\x69\x28\xa5\x91\xa5\x0a\x61\x18\xa1\xe7\xfb\x58\
+\x6a\x2f\xe1\xd4\xa9\x93\xc1\xd1\x63\x47\xcf\x9f\x38\x79\xe2\xa9\
+\x56\xab\xf5\xe5\xf6\x52\xfb\x9f\xbf\xf1\xf5\xff\x7e\xfa\xfe\xfb\
+\xbe\x1d\x3a\x39\x0f\x5e\xde\xbb\xb5\x50\x28\xdc\x92\xcf\xb9\xb4\
+\xb2\xb2\x8c\xc1\x60\x88\x34\x55\x98\x99\x99\x41\xb3\xd9\x98\xf0\
+\x7d\xff\x2d\x41\x10\x74\x8c\x31\x27\xf6\xee\xbb\xe1\x35\x10\x57\
+\xfb\x0b\xcd\x6b\xda\xdd\x71\xc7\x7b\xc4\xad\xb7\xdd\xd2\xb0\x6c\
+\x6b\x9f\x65\x59\x37\xda\xb6\x7d\xbd\xe3\x38\xb3\x96\x65\x57\xa4\
+\x10\x2e\x00\x64\x2a\x8b\x93\x38\xf1\xa3\x38\x3a\x1f\x04\xc1\x89\
+\xd1\x68\x74\x64\x71\xf1\xfc\xb1\x27\x9f\xf8\xfe\xda\x6a\x67\x55\
+\x6d\xf4\x69\x3b\x8e\xd9\x79\xfd\x0d\xef\x6b\x36\x9b\x9f\xbf\x7e\
+\xcf\x8e\x5d\x9e\x6b\xa3\xdf\xef\x23\x9f\x2f\x62\xeb\xd6\x59\xec\
+\xdc\xb5\x03\x83\xc1\x00\x4f\xff\xe4\xe9\xe3\xed\xf6\xf2\xe7\xb5\
+\xd6\xf7\x19\x63\xa2\x62\xb1\x88\xff\xf8\xda\x7f\x5d\x15\x00\x6d\
+\x2a\x37\x9b\x01\x80\xf9\xed\xf3\xf6\x6d\x6f\xbd\x25\x9f\xf7\xbc\
+\x92\x90\x32\x2f\x04\x3b\x5a\x1b\x8a\xe3\x38\x0d\x46\xa3\x70\x79\
+\xa5\x33\x3a\xf2\xe2\x4b\xa1\xdf\xf3\x15\xc6\x7b\x2f\xbe\x74\x40\
+\x0a\xa5\x92\x3b\xbb\x6d\xfb\xbd\x53\x53\xcd\x4f\xee\xbd\x7e\xd7\
+\x76\xd7\xb1\xe1\xfb\x3e\x0a\x85\x02\xb6\x6e\xdd\x8a\xdd\x7b\x76\
+\xc1\xf7\x7d\x3c\xfd\x93\xa7\x8f\xb7\x5a\x4b\x9f\xcb\xb2\xec\x5b\
+\x96\x65\x25\x0f\xdc\xf7\xe0\x15\x01\xde\xc8\x79\xbe\xa4\xc4\x65\
+\xde\x6f\xb6\x37\x6a\x03\x27\x97\xcb\x6d\xdd\x36\xff\xbe\xd9\xd9\
+\x2d\x9f\xd8\x7b\xc3\xee\x6d\x39\xd7\x46\xaf\xe7\x23\x9f\x1f\x43\
+\xec\xb9\xfe\x22\xc4\xa9\x56\xab\xfd\x37\x44\xb8\x1f\x40\x74\xa5\
+\x39\xb0\xd9\x39\xbe\x4c\xc9\x17\xe6\x93\xc0\x78\x7f\xb5\xb9\x14\
+\x9b\xde\x6f\x6e\xb7\xd1\xc6\x02\x60\xab\x2c\x13\xc3\xc1\xa0\x05\
+\x16\xfd\x24\xcd\xae\xab\x56\xaa\x95\x62\x21\x8f\xc1\xa0\x8f\x30\
+\x8c\x90\x65\x19\x66\x66\x66\xd0\x68\x36\x6a\xeb\xbd\xde\xbe\x60\
+\x34\x3a\x0b\xe0\xd4\xb5\x00\xbc\x9e\xf3\x84\x2b\xc3\x6d\x86\x7c\
+\xa3\x08\x49\x00\x96\x52\x8a\x46\x83\xfe\x39\xc3\xa2\x97\x24\xe9\
+\x8e\x5a\xad\x56\x2e\x16\xf3\xe8\xf7\x5f\x85\x98\xdb\x36\x07\xcb\
+\x96\x13\x4b\xad\xd6\x30\x0c\xa3\x1f\x5e\x2b\x00\x2e\xb9\x7f\xbd\
+\xf7\xf4\x06\x9f\xdf\x28\xcd\x05\x7b\xbd\xbe\x58\x29\xa5\x86\x83\
+\xfe\x19\xb0\xe8\x24\x69\xba\xab\x5a\xab\x54\x8a\x85\x02\xfa\xfd\
+\x3e\x00\xa0\x56\xab\x62\x7d\xbd\x97\x9d\x5b\x38\xf7\x43\xdf\xf7\
+\xaf\x09\xe0\xf5\x9e\x6f\xae\x9b\x4b\x4a\x00\xe3\x5f\x2c\x37\x39\
+\xad\x37\x95\x1b\xa6\x36\x3d\x37\x00\xa0\x95\xca\x46\xc3\xe1\x2b\
+\x24\xc4\x7a\x92\x64\x3b\xab\xd5\x4a\xa5\x56\xab\xa2\x5c\x29\xc3\
+\xef\xf7\xf1\xe2\xe1\x23\x47\xda\xcb\xcb\xff\xf2\xd4\xf7\x9f\x7a\
+\xe5\x8a\xeb\xc0\x25\xce\x9a\x4b\x1c\xda\x6c\x97\x3a\xba\xe1\xd8\
+\x46\x5d\x01\xc8\x2e\xb1\x74\x53\x5d\x6d\x32\xa3\x54\xa6\x86\x83\
+\xe1\x59\x30\x0f\xe2\x24\xdd\xe9\x3a\x4e\xa9\x3f\x18\xe8\x63\xc7\
+\x8e\x9f\x3e\x73\xe6\xcc\x97\x0f\x1f\x3a\xfc\xe3\x38\x4e\x7e\xb9\
+\x75\x00\x6f\x2c\x9d\xcb\xc9\xe8\x72\x7d\x6f\x4c\x6e\x6b\x93\x49\
+\x00\x96\xed\xba\xf9\xd9\xb9\x6d\xef\x2a\x95\xcb\xef\x22\x98\xf5\
+\x7e\xaf\xf7\x3f\xe7\xce\x9e\x3d\x94\x24\xc9\x00\x40\x74\xad\xff\
+\xec\xb1\xa1\xe1\xab\x91\xd4\xb5\xf6\xbb\x39\x9b\x49\xbc\x9a\xa1\
+\x2c\x21\x84\xe3\xe6\x72\x85\x2c\x4d\x75\x1c\xc7\x1b\x51\x8b\x7f\
+\x19\x80\xcb\x39\xf0\xeb\xe8\x63\x73\x96\xda\x48\xbb\x1b\x30\x1b\
+\xf7\x1b\x83\x98\x02\x48\xff\x17\x2a\x28\x31\xec\xe8\x9a\x9b\xdf\
+\x00\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\
+\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\
+\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\
+\xca\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
+\x65\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\
+\x32\x33\x3a\x32\x36\x3a\x31\x38\x2d\x30\x37\x3a\x30\x30\x67\xec\
+\x3d\x41\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
+\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\
+\x54\x30\x39\x3a\x31\x31\x3a\x33\x39\x2d\x30\x37\x3a\x30\x30\x0c\
+\x48\x1a\x7b\x00\x00\x00\x34\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\
+\x73\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
+\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\
+\x63\x65\x6e\x73\x65\x73\x2f\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\
+\x6a\x06\xa8\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\
+\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\
+\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\
+\xdd\x31\x7c\xfe\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\
+\x74\x53\x6f\x75\x72\x63\x65\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\
+\x6f\x6e\x20\x54\x68\x65\x6d\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\
+\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\
+\x74\x74\x70\x3a\x2f\x2f\x61\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\
+\x6f\x72\x67\x2f\x32\xe4\x91\x79\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x04\x42\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
+\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\xbf\x49\x44\
+\x41\x54\x58\x85\xc5\x97\xcf\x4f\x22\x67\x18\xc7\xbf\xcc\x0f\x7e\
+\x65\x58\x4a\x56\x60\x41\x70\x91\xd6\x6d\x4c\x34\x2a\x49\x25\xde\
+\x09\x89\x37\x13\x23\xc9\x9e\xd6\x26\x5c\x76\xbd\x35\xfd\x13\x3c\
+\xf6\xb4\x47\x9b\x18\xec\xc1\x34\xc1\x18\x2e\xbd\xd4\xcb\x96\x78\
+\xa9\xf4\x60\x6b\xb2\x6e\x4d\x4a\x24\xc8\x10\xc8\xa4\x40\x18\xf0\
+\x1d\x66\x06\x7a\xa8\x4e\x19\x14\xdd\x1d\xdc\xee\x37\x99\xc3\xbc\
+\xcf\xf7\x7d\xde\xcf\xcc\x33\xef\x8f\x31\xf5\x7a\x3d\x7c\x4a\x31\
+\xf7\x19\x8e\x8f\x8f\x73\x1e\x8f\xe7\x73\x23\xc9\xab\xd5\xea\x5f\
+\xf3\xf3\xf3\x5f\x8d\x04\xe0\x74\x3a\xfd\x7e\xbf\xdf\x65\x04\x40\
+\x92\x24\xff\x7d\x1e\xca\x48\xe2\x87\xd4\x50\x80\x44\x22\x41\x27\
+\x93\xc9\x17\x92\x24\x71\x46\x93\x4b\x92\xc4\x25\x93\xc9\x17\x89\
+\x44\x82\x1e\xe6\x19\x5a\x02\x97\xcb\xe5\x51\x55\xf5\x35\x21\xe4\
+\x91\xaa\xaa\x86\x00\x08\x21\x8f\x00\xbc\x76\xb9\x5c\x3f\x03\x28\
+\x7f\x10\xc0\xb5\x14\x45\x81\x2c\xcb\x86\x00\x14\x45\xb9\xd7\x73\
+\x27\x80\xa2\x28\x23\x03\x28\x8a\x02\x9a\x1e\x5a\x81\xbb\x01\x3a\
+\x9d\x0e\x64\x59\x36\x0c\x20\xcb\x32\x3a\x9d\x0e\x2c\x16\xcb\x68\
+\x00\x9d\x4e\x67\x24\x80\xbb\xa4\x01\xa4\x52\xa9\xe7\x00\xbc\xd7\
+\xf7\x81\x40\x60\xbc\x5a\xad\xd2\xa3\x96\x40\x55\x55\x3a\x10\x08\
+\x7c\x93\x4a\xa5\x4a\x7d\xa1\xea\xfa\xfa\xfa\xae\x06\x90\x4e\xa7\
+\x6d\x66\xb3\x79\xb7\xdb\xed\x6a\x0e\x9e\xe7\x41\x08\x91\x47\x2d\
+\x41\xbb\xdd\x36\xf3\x3c\xff\xed\xe4\xe4\xa4\xd6\x4e\x51\x14\xd2\
+\xe9\xf4\x4f\x6b\x6b\x6b\x0d\x06\x00\x38\x8e\x9b\x6c\xb5\x5a\xe8\
+\x9f\x6e\x34\x4d\x83\xe7\x79\xe6\xf0\xf0\x10\xf9\x7c\xde\x10\x00\
+\xcf\xf3\x28\x97\xcb\xcc\xd4\xd4\x14\x58\x96\xd5\xe5\x76\x38\x1c\
+\x21\x00\xbf\x33\x00\xe0\x70\x38\xc2\x92\x24\x81\xa2\x28\x9d\x89\
+\x65\x59\xd3\xc1\xc1\x81\xa1\xc1\xaf\x65\x36\x9b\x4d\x57\xb9\xb4\
+\x36\x8a\xa2\xc0\x71\xdc\x53\x0d\xc0\x6e\xb7\x3f\xa3\x69\x5a\x37\
+\x5d\xee\x9a\x3a\x1f\xaa\x41\x00\x00\xb0\xd9\x6c\x5f\x00\x57\xdf\
+\x80\xd3\xe9\x7c\x1a\x0a\x85\x74\x06\xbb\xdd\x8e\x8d\x8d\x8d\x07\
+\x01\x38\x3f\x3f\xc7\xc2\xc2\x82\xae\xad\x5e\xaf\x87\x34\x00\x51\
+\x14\xdd\x26\x93\xe9\x46\xa7\x6c\x36\xfb\x20\x00\x13\x13\x13\xe8\
+\xff\x08\x01\xa0\xd9\x6c\x7a\x34\x00\x42\xc8\x63\x8e\xbb\xb9\xe7\
+\x9c\x9c\x9c\x3c\x18\xc0\xe0\xc1\x87\x10\xf2\x58\x03\xc8\xe5\x72\
+\x5f\x0a\x82\xa0\x33\x88\xa2\x78\xa3\x93\x51\x9d\x9e\x9e\xa2\x58\
+\x2c\xea\xda\xdc\x6e\xf7\xb3\x68\x34\xfa\x2f\xc0\xf4\xf4\xb4\x3c\
+\xf8\x8a\x3e\xb6\x0a\x85\x82\x0c\xfc\x57\x02\xdb\xff\x71\x36\x6c\
+\xb7\xdb\x68\x36\x9b\xf0\x7a\xbd\x20\x84\xd8\x80\xab\x03\x49\xb7\
+\xdb\x6d\x7f\xf4\xd1\x01\xb0\x2c\x0b\xab\xd5\x8a\xfe\x31\x19\x00\
+\xf0\x78\x3c\xf5\x5a\xad\xa6\x33\xb7\x5a\xad\x5e\x26\x93\x31\xb9\
+\xdd\x6e\xd8\xed\x76\x43\x03\xd6\xeb\x75\x10\x42\xb0\xb2\xb2\xd2\
+\x63\x18\xc6\x74\xbd\xd4\xd7\x6a\x35\x8c\x8d\x8d\x35\x34\x80\x4a\
+\xa5\x52\x1b\xdc\x32\x37\x37\x37\x1b\x56\xab\xe5\xb3\x37\x6f\x7e\
+\x81\xcf\xe7\x33\x04\x20\x08\x02\x16\x17\x17\x61\xb5\x5a\xab\x4b\
+\x4b\x4b\xde\xfe\x98\x24\x49\x7f\x6b\x00\xc5\x62\x51\xb0\xd9\x6c\
+\xba\xce\x7e\xbf\x8f\x79\xf2\xc4\x8b\x77\xef\xfe\xc4\xea\xea\xaa\
+\x21\x80\xbd\xbd\x3d\xc4\xe3\x31\xd4\xeb\x0d\xba\x54\x2a\xe9\x62\
+\x97\x97\x97\x82\x06\x50\x2e\x97\xab\x83\x4b\x6f\x3c\x1e\x37\x67\
+\x32\x19\xc4\x62\x31\xc4\xe3\x71\x43\x00\x8d\x46\x03\xc5\xe2\x05\
+\x22\x91\x88\xa5\x50\x28\xe8\x62\xaa\xaa\x56\x34\x00\x9e\xe7\xbf\
+\x67\x18\xe6\xd7\x7e\x43\x2c\x16\xfb\xe1\xe2\xa2\x84\x97\x2f\x5f\
+\x21\x1a\x8d\x1a\x02\xe8\xf5\x7a\xd8\xd9\xd9\xc1\xf8\xf8\x78\x27\
+\x97\xfb\xed\x79\x7f\x4c\x51\x94\x3f\x34\x80\xed\xed\xed\xb7\x00\
+\xde\xf6\x1b\xb2\xd9\xec\xee\xcc\xcc\x0c\xc2\xe1\x30\x18\xe6\xde\
+\xb3\xeb\xad\x0a\x87\xc3\xf0\xf9\x7c\x10\xc5\x16\xbb\xb5\xb5\xf5\
+\xe3\x6d\x9e\xa1\x99\x45\x51\xc4\xf2\xf2\x32\x82\xc1\x20\x06\xf7\
+\x89\xf7\x55\x30\x18\xc4\xec\xec\x2c\x06\x57\xd9\x7e\x0d\xfd\x31\
+\xd9\xdf\xdf\xef\x9e\x9d\x9d\x75\x59\x96\x05\xc3\x30\x86\x2e\x96\
+\x65\x91\xcf\xe7\x7b\x47\x47\x47\x43\xcf\xe7\x43\xdf\x00\x45\x51\
+\xd3\x73\x73\x73\xaf\x2a\x95\xca\xd7\xef\xfd\xc8\xb7\x28\x12\x89\
+\xec\x08\x82\xf0\xdd\xb0\xb8\xe9\x53\xff\x9e\xff\x03\xea\x33\x99\
+\x79\xb2\xbf\xb1\x29\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x04\xbb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
+\x00\x00\x04\x82\x49\x44\x41\x54\x78\x5e\x95\x54\x5d\x68\x54\x47\
+\x18\x3d\x73\xef\x64\xff\xf3\x5b\x4d\xba\x69\xe2\x86\x6a\x52\xba\
+\xda\xb0\x94\xb0\x58\x35\x21\x60\x50\x20\x0a\x6a\xc9\x53\xe8\x53\
+\x81\xd6\x97\x58\x28\x02\x05\x03\xd2\x97\xbe\xd9\x00\x2d\x22\x16\
+\xc1\x50\x28\x56\x51\xa8\x88\x5a\x05\xb5\xd0\xa8\x11\xc4\xaa\x52\
+\x89\xec\xa6\x36\x92\xe8\x6e\x8c\xc9\x26\xee\xde\xbd\xb9\x77\x6f\
+\xcf\x0c\x4b\x34\x52\x4a\xf3\xc1\xe1\x63\x98\xef\x9e\xef\xcc\x99\
+\xf9\xae\xf4\x3c\x0f\x2b\x8d\x1f\x92\xc9\xcf\x6b\x9a\x9b\xbf\x08\
+\xad\x5a\xd5\xe4\x01\x32\x9f\xcb\x65\x27\xd2\xe9\x8b\x37\x46\x47\
+\x3f\xfb\xd9\xf3\x5c\x30\x24\x56\x10\x5f\x0b\x61\xb6\x6e\xdf\x7e\
+\x6d\xd3\xc0\xc0\xe6\xd8\xd6\xad\x78\x2d\x9a\xa6\xef\xdd\xfb\xb4\
+\xee\xc8\x91\x9d\x5f\x25\x12\xdb\xbe\xb9\x73\xe7\x8f\x15\x11\x37\
+\x25\x93\x3f\xb6\xf7\xf7\x6f\x7e\xa7\xbb\x1b\x2f\xe7\xe6\xb0\x98\
+\xcd\x42\x85\xa8\xac\x44\xa4\xad\x0d\x5d\x03\x03\xf5\xb3\x83\x83\
+\xe7\x3b\x85\x68\xfa\xdf\xc4\xdf\xc7\xe3\x89\xb0\xcf\xd7\x17\x69\
+\x69\x41\x75\x53\x13\x94\x85\xa9\xa7\x4f\x61\xe7\x72\x58\xd7\xd1\
+\x01\x5f\x30\x88\xfc\xfc\x3c\x1a\x4d\x33\xda\x95\x4c\x7e\x27\x85\
+\x10\x06\x80\xd5\x84\xc0\x7f\xc4\xb7\x89\xc4\x97\x56\x2a\x65\x66\
+\xee\xde\x45\x7d\x22\x81\x20\x55\xbe\xdb\xd9\x09\xdb\xb2\x34\x69\
+\xa9\x54\xc2\xe4\x83\x07\xb0\xa7\xa6\x10\x08\x85\xb6\xc9\x78\x3c\
+\x7e\xaf\xa7\xa7\xa7\x4d\x4a\xe9\x39\x8e\xe3\xd9\xb6\x0d\x42\xd8\
+\xc5\xa2\x51\x2c\x16\x61\x15\x0a\xb0\x98\xa9\xc6\x30\xa9\x28\x75\
+\xec\x18\x66\xa8\xb4\x6b\xff\x7e\x04\xab\xaa\x10\x08\x87\x35\xe9\
+\x6f\x87\x0f\xc3\x39\x73\x06\xe2\xd1\x23\x38\x2d\x2d\x2d\x32\x16\
+\x8b\xb5\x0d\x0d\x0d\x2d\xb3\xa4\x48\x15\xb9\x74\x1a\x15\x15\x15\
+\x98\x4b\xa5\xf0\xec\xe6\x4d\xfc\x79\xe5\x0a\xe6\x01\x64\x6f\xdf\
+\xc6\x02\x09\xad\xbd\x7b\x35\xb1\x0a\x67\x71\x11\x8f\xaf\x5d\x43\
+\x94\x35\xd5\x6c\x22\x4b\x25\x53\x59\x81\x37\xa3\xe4\xba\x30\xa4\
+\x44\x8e\xa4\x7f\x5f\xb8\x80\x85\x27\x4f\x50\x5c\x58\x80\xc1\x46\
+\x88\xc7\xb1\xf3\xe8\x51\xd4\x36\x36\x42\x05\x4f\x06\x9f\xdf\x8f\
+\x3e\x9e\x64\x98\x36\x6c\x18\x1d\x85\x15\x0e\x7b\xff\xfa\x8e\x67\
+\x67\x66\xf0\xf8\xf4\x69\x3c\x1b\x1e\xc6\xf3\x87\x0f\x91\x07\xb0\
+\xc8\x8f\x83\xbc\xb8\xb7\x36\x6d\x42\xc3\xba\x75\x50\x71\x92\xaa\
+\x55\xf3\x4f\xce\x9e\x45\x28\x12\x41\xf3\x8e\x1d\x08\x4f\x4c\xe0\
+\xae\x65\xb9\xd2\x75\x5d\xed\xa5\x6a\x90\xcf\xe7\x91\xc9\x64\x90\
+\x61\xe7\x17\x54\x9d\xa3\x2a\x87\x3e\xba\xf4\xd0\xe6\xda\xae\xaf\
+\x47\x25\xf7\xce\x1f\x3a\x84\xe7\xf7\xef\xe3\xed\xe3\xc7\xb1\x9e\
+\x7b\x27\xfb\xfa\xd0\xb8\x67\x0f\xfc\xe3\xe3\xb8\x15\x8b\xe1\xd7\
+\xeb\xd7\x4b\x8a\x18\x7e\xaa\x61\xe8\x5c\x53\x53\x03\x76\x83\xc9\
+\x0b\xf2\x8f\x8c\xc0\xa2\xdf\x2f\xd5\x29\x08\xbb\xbf\x1f\xb6\x94\
+\xb0\xcf\x9d\xc3\x7b\x7c\x09\xfe\xf6\x76\x04\x67\x67\xd1\xcb\x66\
+\xe2\xc4\x09\x5c\xa4\xb8\x0f\x0e\x1c\x80\xd7\xdb\x0b\xb9\x48\xe3\
+\x19\x5a\x31\x6f\x57\x67\x0d\xbe\xcf\x80\x6d\x43\x00\x70\x08\x3f\
+\x61\x71\xff\xe3\xa1\x21\xdc\x3a\x75\x0a\x0f\x2f\x5d\x82\xc1\xc1\
+\x50\x62\xdc\xba\x3a\x78\xf4\x7e\xf3\xbe\x7d\x70\xca\x7c\x9a\x98\
+\x44\xcb\x88\x4b\x84\xe0\x64\x85\xb8\x36\x94\x52\xc2\x47\x38\xae\
+\xab\xf7\x3e\xdc\xbd\x1b\xde\xae\x5d\x28\x95\xc5\x8c\xf0\x64\x1f\
+\x6d\xdc\xa8\xd7\x76\xd9\x56\xa9\xde\xed\xe4\xe4\x24\x54\x9e\xce\
+\x66\xf5\xc7\x19\xae\x73\xa6\x09\xdf\xfa\xf5\x28\x72\x3d\x4f\xe4\
+\x48\x90\xa1\x88\xcb\x97\x2f\x43\xd9\xe7\x3a\x8e\xce\x0e\x31\x36\
+\x36\x86\x67\xb4\x4e\xad\x0b\xb4\x4e\x08\xe1\xc9\x42\xa1\x50\x6a\
+\x68\x68\x30\x54\xe7\x68\x34\x0a\x95\xc7\x03\x01\xfd\x7e\x1b\x38\
+\x49\x0b\x00\x66\x88\x69\x62\x91\x8d\xba\xf9\x9f\xd0\x56\xbd\x76\
+\xba\x20\xfd\xee\xdc\xb2\x05\x2a\xc8\x87\x83\x07\x0f\x96\x24\x2f\
+\x47\x93\xb1\xdb\xd2\x07\xaa\xd8\xa4\xc7\x41\x45\x46\x54\x10\xb2\
+\x3c\x08\xe5\xfd\xa5\x5a\xaa\x43\x80\x42\x0c\x9e\x90\x04\x7a\xa8\
+\x6a\x6b\x6b\x85\x9c\x9b\x9b\xf3\x78\xac\x57\xc5\x65\x72\x76\xd4\
+\xc4\x79\xc2\x24\x0c\x82\xcd\x5f\x5d\x30\xa0\xc9\x04\xa0\x15\x9b\
+\x24\x56\x21\xb9\x47\x62\xc8\x79\xfe\x03\x6e\x70\x64\x49\xae\xfd\
+\x72\xcb\x1e\x5b\x1b\x36\x20\xc5\x41\xc8\x97\x3d\x5e\xa0\xb2\xc7\
+\x54\xfc\x0b\x87\x41\xa9\xf2\xfb\x7c\x7a\xe2\x7c\xcc\xd3\xd3\xd3\
+\x9a\xd8\x30\x0c\xdd\xb8\xaa\xaa\x4a\xea\xc9\xeb\xe8\xe8\x58\xe6\
+\xd9\x5f\xbc\x8c\xe2\xe0\x20\xde\xcf\x64\xb4\xb7\x59\x92\xbc\x5c\
+\xbb\x16\xb3\x7c\x56\xbd\x7c\xa3\x86\x10\x9a\x44\x83\x84\xe9\x74\
+\x1a\xad\xad\xad\xca\x16\x2d\x4c\xcf\x02\x80\x57\xc7\x2b\x67\x97\
+\x79\x8a\x39\x54\xb6\xa2\xb0\x7a\x35\xc4\x9a\x35\xf0\xa4\x84\x0e\
+\x21\x34\x84\x22\x66\x56\x56\xc8\xb2\x62\xa5\x5c\x13\x93\x48\xf0\
+\x52\x54\xd1\x12\x39\x2b\x30\xc1\xc7\x5f\xe4\x88\x5b\x4a\x85\xf2\
+\xd0\xb6\x91\xa7\x72\x16\x69\x78\x84\xbe\x1b\xd6\x56\x48\xa9\x95\
+\x9b\x84\x64\x7d\x25\xbf\x95\xd5\xd5\xd5\x63\xd1\xc6\xc6\x56\xbc\
+\x11\xaa\xe1\xd2\x62\x7c\x5c\x41\x2b\xfa\xa9\xbd\x5d\x44\x22\x11\
+\x8f\x40\x28\x14\x42\x38\x1c\x56\x59\x10\x9e\x9a\x42\x29\xa5\xb8\
+\x7a\xf5\xea\xef\xff\x00\x1e\xa4\xa9\x5c\x40\x6e\xf1\x36\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\x45\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0a\x61\x00\x00\
+\x0a\x61\x01\xfc\xcc\x4a\x25\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x08\x47\
+\x49\x44\x41\x54\x68\xde\xed\x59\x4d\x8c\x1c\x47\x15\xfe\x5e\x55\
+\xcf\xec\x8f\x77\x17\xff\x44\x62\xc3\x22\x3b\x31\xc6\xc8\x09\x20\
+\x41\x90\x85\x91\x20\x82\x43\xc4\x01\x45\x82\x0b\x0a\x47\x5f\x48\
+\x0e\x9c\xf0\x95\x08\xc1\x19\x38\x07\x24\x24\x2e\xdc\x11\x07\x0e\
+\xe4\x90\x0b\x21\x8a\x10\x87\x20\x01\xb1\x1d\xdb\x1b\xbc\x11\x5e\
+\xec\x2c\xde\x9d\xdd\x99\xe9\xae\xf7\x1e\x87\xfa\x99\xea\x9e\xee\
+\xde\xf5\x0a\x29\x41\xa2\xb5\xa3\xed\xae\xa9\xae\xfa\xbe\xf7\x7d\
+\xaf\xfe\x06\xf8\xff\xf5\x21\xb9\x54\x15\xaa\xba\xa2\xaa\xe6\x83\
+\xc6\xf2\x28\x17\x65\x04\xec\xcf\x5f\x79\xe5\xb7\xd7\xdf\xbe\xfe\
+\xf5\xca\x55\x04\x10\x28\x7c\x7b\xee\x89\xf3\xf8\xfc\x95\xaf\x60\
+\x79\x61\x08\x43\x06\x86\x00\x10\x81\x42\x05\x43\xc6\xdf\x87\x32\
+\x32\x04\x63\x7c\x99\x31\x36\xb5\xa3\xaa\x80\xaa\xbf\x87\x00\xea\
+\xef\x7c\x99\x2f\x77\xcc\xd8\x1f\x97\xf8\xc3\x6b\xbf\xc7\xbb\x9b\
+\x77\xfc\x3b\xe1\xdd\x41\x31\x90\xa7\x3f\xf3\xe9\xdf\x5c\xbd\x7a\
+\xf5\x5b\x11\x77\x91\x98\x10\xf1\x4b\xdf\x7d\xf1\xb9\xbd\xbd\x3d\
+\x7a\xb8\xfb\x10\xd6\x58\xac\xaf\x3f\x0e\x00\x38\xb1\xb2\x82\x8d\
+\xb3\x4f\x60\x75\x69\x11\xd6\xf4\x0b\x44\xbe\x31\xc0\xff\x85\x08\
+\xf9\x60\x44\x22\x81\x3f\x40\x04\x13\x0a\x88\x08\x14\x08\xfc\x7b\
+\x7f\x82\x95\x13\x2b\x98\x8c\xa7\xb5\xb6\xcb\x69\x65\xfe\xfe\xd7\
+\xbf\x3d\xaf\xaa\x29\x78\x45\x5e\x41\x55\xec\xee\xde\x1e\xca\xb2\
+\x42\xe5\x0e\xb0\x8e\x8f\xd6\x80\x19\x43\x87\x12\x48\xf8\xa9\x51\
+\x06\x80\x02\xda\x44\xcc\x04\x02\xd9\x3b\x24\xf9\x8b\x32\xd7\xb6\
+\x88\x58\xca\x1a\x2f\xea\x5f\x02\xc3\xe1\x10\xeb\x8f\xaf\xe3\x60\
+\xb4\x0f\x89\xef\xab\x82\x08\x30\x44\x78\xed\x4f\x7f\x39\x8a\x23\
+\x5b\x4b\x72\x52\x33\x35\x66\xb2\x10\x80\xaf\x5e\x7e\x1a\x86\x08\
+\x0a\x9d\xf5\x5f\x0b\xb2\xd6\x9e\x8b\xfa\xd7\x02\xe7\x1c\xde\xbb\
+\xbb\x05\xc7\x8c\xb3\xcb\x4b\xb5\x0e\xad\x01\x9e\xfb\xe2\x67\x0f\
+\x09\xbf\xaf\x4c\xd9\xe3\xbc\x0a\x33\xf0\x14\xe4\x30\xa1\x66\xc9\
+\xce\x57\xd4\x76\x05\x54\xeb\x65\x0d\x05\x14\x8f\x9d\x39\x53\x7b\
+\x8e\xac\x7d\x42\x12\xac\x21\x28\xda\x2f\x4a\x28\xe7\xb5\xa0\x18\
+\x6b\xd3\x78\xa6\x94\x32\xbe\x9c\x03\x50\x68\xea\xbf\x89\xb1\x93\
+\x40\x53\x9e\x26\x38\x1b\x08\xf4\x47\x7f\x1e\x78\x4d\x89\x06\x60\
+\x84\x60\x8b\xfa\xfe\x59\x3c\xc8\x30\xac\xcf\x13\xd0\x5e\x02\x2d\
+\xa6\x0b\x5d\x18\x43\x30\x06\x30\x05\xf9\x1e\x9b\x6d\x67\xe0\xdb\
+\xec\x93\x83\x85\x7a\x73\xa8\x2a\x14\x9a\x46\x52\x05\xc0\x22\x10\
+\x55\xa8\x68\x2b\x1e\x95\x5e\x0b\x75\xc0\x57\x4d\x78\x73\xd9\x6b\
+\xa0\x1a\x28\x13\xc7\x00\x52\xb3\x8a\x11\x6c\x8d\x40\x28\x67\x16\
+\x40\x15\xa2\xc7\x4c\xe2\x76\x02\x9e\x39\xb3\xe0\xd7\xaf\xbe\xde\
+\x6b\xb5\x26\x2b\x89\x0d\x74\x54\x49\x5f\x85\x9b\x6f\x3c\xfb\x8c\
+\xb7\x50\x07\x9e\x5e\x0b\xf5\x29\x20\x0a\x38\x56\x7c\xf3\x6b\x97\
+\x67\xc9\xda\x12\xf5\xf9\x32\xaf\x85\xe6\x75\xb2\xba\xaa\x92\x29\
+\xe2\x27\x32\x81\xf7\x7f\xbb\x02\x3d\x16\xea\xca\x01\x09\xbe\x74\
+\x22\x20\xee\x49\xe2\x16\xe2\x68\xda\x67\x8e\x88\xd4\x56\x14\xcc\
+\x1e\xb8\x88\x74\xe4\xc0\x31\x46\x21\xef\x47\x05\xb3\x82\xd0\x95\
+\xe8\x6d\x6a\x64\x04\xb2\xf2\xbc\x9b\xa8\x40\xac\xed\x44\xbc\x85\
+\xa4\x63\x14\x92\x5e\x0b\x75\x10\x10\x09\x16\x3a\x02\x78\xcc\x92\
+\xb7\x35\xfa\x19\x01\x0d\x93\x55\xae\x0a\xb3\x40\xa0\x7e\x34\x6a\
+\xc1\xd3\x6b\xa1\xae\x24\x16\xf1\x23\x83\x63\x1f\xad\x2e\x13\x69\
+\xed\x4e\xeb\x65\x6d\xfe\x07\x00\x6d\x10\x10\x81\x8a\x42\x54\x70\
+\x8c\x99\xb8\x03\x58\xb4\x90\x08\x5e\x7d\xe3\xad\x23\xa9\xd0\xa7\
+\x8e\xd6\x19\xd4\xbe\xfd\xf2\x33\x4f\x05\x0b\x49\x2b\x9e\x66\x59\
+\x5d\x81\xbe\x24\x86\x82\x59\xf0\xec\x17\x9e\x42\xeb\x94\xdb\x16\
+\xf5\x66\xf4\xd1\xf0\x7f\x1e\xd1\xa4\x80\xa6\x9c\xc3\x23\x4f\x64\
+\x5d\x49\x2c\xbe\xc1\x0a\x32\xb7\x0c\x68\x52\x68\x7b\xd0\x66\x71\
+\x63\x14\xca\x09\xf8\xc4\x25\xdf\x67\x0b\x1e\x45\x5f\x0e\x74\x8e\
+\x42\x7e\x18\xed\xf4\x58\xcf\x55\x1f\x71\x9a\x44\xea\x33\x71\x2c\
+\x37\x08\xcb\x88\x47\x1e\x85\xba\x2c\xe4\x04\xaa\x0a\x27\xa1\xa7\
+\x23\x48\xa0\x5d\x5f\xd5\x46\xa0\xb4\xc8\xa8\x63\xb5\xc6\x4f\x68\
+\xda\xb6\xa1\xe9\x9b\x07\x3a\x02\xfc\xe6\x1b\xaf\xe3\xbd\x7b\xdb\
+\x28\x27\xe3\xa3\x45\xfd\x90\x52\xed\xae\x04\x10\x61\x61\x61\x01\
+\x5b\x77\xde\xc1\xa0\x18\xb4\x34\xd3\x37\x13\x77\x0c\xa3\x45\x61\
+\xf0\xcf\x7f\xdc\xca\x7b\x09\xfb\x16\x4a\xab\xbb\x7c\x73\x12\xeb\
+\x74\x92\x48\xab\xcf\x99\x1c\xb3\x67\x0d\x7d\xda\x56\x3c\xd2\x4b\
+\x40\xba\xc2\x32\x0f\xe4\xa8\x35\xff\xdb\xd7\xb1\x96\x12\x1f\xa6\
+\xab\x7f\x35\xfa\x3f\x40\xa0\x7f\x29\x71\x64\x0b\x7d\x80\x04\x7a\
+\x87\xd1\xa3\xac\x34\xc3\xe5\x93\xb6\xfd\x03\x20\xfd\x6f\x9d\xb0\
+\x31\xb3\x6b\xdc\xfb\xce\x7d\xd0\x35\xa9\xf6\x2a\x70\x38\xf0\x6f\
+\x7f\xe7\x05\x5c\xf9\xd2\x95\x88\xa2\x31\xfb\x3e\x5a\x72\xab\x2a\
+\xde\xdd\xdc\xc4\xb5\xef\x5f\x43\x61\x6d\x9a\xdc\x9c\x08\x0a\x6b\
+\xf1\xb1\x70\x32\xd8\x7c\xa7\x5b\x01\xe1\xde\x0e\x8b\xa2\xc0\xca\
+\xea\x0a\xb6\xb7\xb7\x6b\xd1\x9b\x53\x87\x08\xf9\xf1\x5f\x4d\x91\
+\xec\x3d\x22\xc2\x47\x4e\x9e\xc4\xd2\xd2\x22\x96\x97\x96\xd3\xac\
+\xcc\x8e\xb1\x77\x30\x6a\xc5\x23\xdc\xa3\x80\xeb\x21\x50\xd8\x02\
+\xa6\xb0\x35\x99\x8d\x31\xb0\xd6\x06\xf2\x92\x80\x47\x70\x91\x1c\
+\x35\xce\x19\x4d\x38\x9e\x14\x11\x30\x33\xac\xb1\x30\xd6\xf8\xd3\
+\x0a\x15\x98\xc2\xa2\xb0\x45\x2b\x1e\x23\xae\x4f\x81\x6e\x0f\x31\
+\x18\xd3\xc9\x14\xce\xb9\x04\xf0\x67\x3f\xf9\x29\xc6\xe3\x49\x8c\
+\x2b\xca\xaa\x02\x11\xf0\x83\x97\x5f\x0e\x07\x61\xfe\x84\xda\x6f\
+\x0f\xb3\x99\x58\x15\xcc\x0c\x66\x86\x31\x26\xd8\x8e\xa0\xa4\x80\
+\x12\xa0\x92\xde\x9b\x53\xa0\xff\x58\xa5\x9b\x00\x81\x60\x0b\x0b\
+\x6b\xad\xef\x54\x15\x5b\x5b\x77\x67\x15\x14\xa8\x9c\xc3\x74\x3a\
+\x4d\xc9\x9c\x2b\x20\x22\xe9\x13\x55\x72\xce\xa5\x53\xe9\xb4\xb3\
+\xc7\xcc\xe7\xad\x04\xfa\x2c\x24\x3d\x5b\x46\x13\x96\x0f\xb9\xef\
+\x6b\xf5\x15\x28\xcb\x12\x93\xc9\x24\x75\x4c\x44\x60\xe6\x64\x95\
+\x9c\x40\xbc\x9f\xd9\x4e\xa0\x12\x37\xf9\x7e\xad\xd1\x86\x47\xcc\
+\x31\x09\x38\x55\x60\xe2\xa5\x8f\x16\xaa\xad\x4b\xd4\x1f\xbf\x0f\
+\x86\x83\x1a\xd8\x08\x3e\xbe\x97\x07\x80\xd9\x7b\x5c\x34\x10\x83\
+\xdf\xb0\x68\x24\x19\xf0\x0c\x06\x05\x06\x83\x01\x9c\x73\x90\xe3\
+\xe6\x00\xc8\xf8\x79\x2e\x1b\x5d\x6a\xf5\x15\x29\xb2\x79\x84\xe3\
+\x73\x9e\xe0\x91\x94\x73\x2e\x10\x11\xb0\x08\x20\x33\x32\x12\xea\
+\x05\x29\xe1\x02\x59\xc7\xc7\xcc\x01\x18\xbf\xd4\x98\xed\x9a\xe6\
+\x09\x38\xe7\x41\x4d\xa7\xb3\x64\xcf\x41\x37\x3f\xb1\x8e\x30\x83\
+\x5d\x5d\x21\x0d\x75\xa2\x52\xa2\x02\x43\xe6\xb0\x24\xee\x1e\x46\
+\x8d\x10\x0a\x6b\xfd\x44\xe3\x9c\x07\xc1\x9c\xad\x90\x35\x59\xca\
+\x39\x37\xab\x93\xa9\x10\xad\x14\xed\xc4\x29\xaa\xbe\x7e\x9c\x07\
+\x44\x63\xce\x30\x40\x04\x6b\x2d\xca\x83\x29\x86\xc3\x85\x39\x5c\
+\x47\x26\xc0\x4c\x98\x8c\xc7\x98\x4c\xa6\x28\xcb\x12\x22\x82\xfd\
+\x83\x83\x00\xc6\x2f\xb2\xc8\xf8\x08\x8d\xc7\xe3\x39\xb0\x5d\x2a\
+\x24\x62\x8e\xfd\xfe\xac\xa6\x80\xc7\x33\x9d\x8c\xd3\x88\x75\x88\
+\x02\xfa\x26\xa0\x97\x5b\x15\x30\x8a\x62\x30\x80\x08\xa3\xaa\x2a\
+\x30\x33\xd6\x56\xd7\x70\xff\xfd\x07\xe9\x1c\xc7\x88\xe0\xf4\x99\
+\x33\xa8\xaa\x2a\x01\x8b\x7e\x6f\xcb\x8f\xa8\x12\x3b\x86\x33\x2e\
+\x28\xe9\xcf\x9e\x58\x38\x81\x9d\x4c\x26\x58\x5e\x3e\x81\x83\x83\
+\x31\xac\x35\xc1\xd0\x7e\xe1\x93\x13\x30\x0f\x76\x76\x9e\x3f\xb9\
+\xb6\xf6\x3b\x22\x7c\x6e\x5e\x01\x86\xb0\x83\x73\x9e\x80\x73\x0e\
+\x3f\xfc\xf1\x8f\x52\x72\x46\x70\xce\x39\xec\xee\xee\xd6\xa2\x1b\
+\xa3\xda\x1c\x9d\x72\x8f\x33\xbb\xd9\x3e\x59\x35\x25\x73\xbc\x46\
+\xa3\x3d\x7f\x43\x05\x00\x2c\x03\x18\x03\xe0\x9a\x02\xb7\x37\xef\
+\x4c\x56\x57\x56\xbe\x77\x76\xe3\xe3\xbf\x2a\x8a\xe2\x13\x75\x05\
+\x04\x00\x25\x7f\x3b\xe7\x50\x55\x55\x6d\xa8\xcc\x27\x2c\xe7\xdc\
+\x9c\x02\x9a\x8f\x2c\x31\xf7\x03\x31\xc7\xf5\xe1\xd1\x9f\xc5\xb6\
+\x0d\x2a\x0c\x00\xa7\x01\x6c\x03\x90\xa2\xf9\xf5\xde\x68\x34\xbe\
+\x71\xeb\xd6\x2f\x9f\x3c\x77\xee\xda\xc2\x70\x78\x2a\x96\x3b\xc7\
+\x18\x8d\xf6\x71\xff\xc1\x7d\xbf\x6e\x09\x91\x6b\x7a\x3b\xfa\x3e\
+\x1f\x65\x9a\x6b\x21\x0a\x89\x19\xeb\x02\xf3\xbf\xbb\xc5\x49\xb3\
+\xf9\x1e\x0b\x3f\x04\xb0\x0a\xe0\x7d\x00\x65\x4e\x40\x01\x4c\x01\
+\xdc\x2f\xab\xf2\xad\xdb\x9b\x77\x7e\x71\xea\xe4\xa9\x4f\x06\xbf\
+\x61\x79\x79\x19\xe7\xcf\x3f\xb9\x78\xfb\xd6\xad\x93\x5b\x77\xef\
+\x0e\x8c\x31\xd6\x18\x53\x84\xff\xb6\x28\x8a\x82\x88\x2c\x88\x6c\
+\xf8\x99\x9f\xc2\x50\x28\xea\xb7\x51\xc2\x22\x0c\x55\x16\x11\x27\
+\x22\x32\x99\x4c\xa7\xa3\xfd\x51\xb5\xba\xb6\xb2\x77\xef\xde\xbd\
+\x7d\x11\x69\x1e\xf9\xa5\x5d\x3e\x11\xa9\x31\x66\xa7\x2c\xab\x3f\
+\x46\xfb\x00\xd0\x26\x81\x12\xc0\x7d\x00\x7f\x2e\xab\xea\x9d\x7b\
+\xff\xda\x5e\x8c\x0d\x6e\x6c\x6c\x98\x4f\x5d\xba\xf4\xd8\xa5\x4b\
+\x97\xd6\xd6\xd6\xd6\x8a\x85\x85\x85\xc1\x60\x30\xb0\xd6\xda\x22\
+\x80\xa7\x60\x0f\xa3\xaa\x86\x88\x54\x55\xc9\x18\xa3\xaa\x2a\xe1\
+\x59\x55\xd5\x39\xe7\xb8\x2c\xcb\x6a\x34\x1a\x1d\xec\xec\xec\x4c\
+\x01\x3c\x7c\xfb\xc6\x8d\xdd\xf1\x78\xdc\xf7\x2b\xba\x02\xa8\x00\
+\xec\x01\xd8\x09\xf7\xda\x76\xf6\x61\x00\x58\xf8\x04\xcf\x1b\xd4\
+\x0b\x17\x2e\xe0\xe2\xc5\x8b\x38\x7d\xfa\x34\x16\x17\x17\x01\x20\
+\xfd\x1f\x0e\x87\xa9\xad\xfc\x9e\x99\x35\x8e\xf7\xc1\x32\x9a\xe7\
+\xd1\xf6\xf6\x36\xae\x5f\xbf\x8e\x9b\x37\x6f\x46\xe7\xf4\x5d\x1a\
+\x22\xef\x10\x7e\x27\xfc\x0f\x0c\x53\x60\x43\x5f\x29\xe7\x29\x00\
+\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\
+\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x37\
+\x3a\x30\x32\x3a\x33\x35\x2d\x30\x37\x3a\x30\x30\x10\x90\x85\xa6\
+\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\
+\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\
+\x33\x3a\x32\x36\x3a\x31\x35\x2d\x30\x37\x3a\x30\x30\x06\x3b\x5c\
+\x81\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\
+\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
+\x30\x39\x3a\x33\x31\x3a\x32\x35\x2d\x30\x37\x3a\x30\x30\x5f\x2e\
+\xc9\x50\x00\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\
+\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\
+\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\
+\x65\x6e\x73\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\
+\x20\x6f\x72\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\
+\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\
+\x69\x63\x65\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\
+\x2f\x5b\x8f\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\
+\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x30\x33\
+\x2d\x31\x39\x54\x31\x30\x3a\x35\x33\x3a\x30\x35\x2d\x30\x36\x3a\
+\x30\x30\x2c\x05\xbc\x4f\x00\x00\x00\x13\x74\x45\x58\x74\x53\x6f\
+\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\x6e\x20\x49\x63\x6f\x6e\
+\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\x45\x58\x74\x53\x6f\x75\
+\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x77\
+\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\x69\x63\x6f\x6e\x73\x2e\
+\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x14\x21\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
+\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x12\x34\
+\x49\x44\x41\x54\x68\xde\xbd\x9a\x69\x8c\x65\x47\x75\xc7\xff\xa7\
+\xea\xee\xef\xbe\xb5\xfb\xbd\x5e\x66\xba\xa7\x67\x1f\xcf\xe0\x0d\
+\xdb\x80\x50\x14\x08\x18\x8c\xb1\x1d\x93\x08\x88\x51\x04\x28\x9f\
+\x22\x21\x22\x81\x22\x12\x65\x43\x11\xf0\x25\x8a\x94\x40\x50\x40\
+\x91\xb2\x01\x01\x44\xb0\xc1\x01\x6c\x8f\xd7\xe0\x84\xc4\x1e\x63\
+\x33\xb6\xc7\x1e\x33\x3d\x63\xcf\x4c\x77\x4f\xf7\xeb\xfd\xdd\xb7\
+\xdc\xb5\xaa\x4e\x3e\xf4\x8c\x69\x06\xdb\xd3\x03\x84\xf7\x74\x74\
+\xee\xad\x5b\xb7\xde\xf9\xdd\x73\xaa\x4e\x55\xdd\x47\xf8\x05\x3f\
+\xf7\x3f\x74\x0f\x98\xf9\x35\xeb\x10\x11\x6e\xba\xf1\x96\x5f\xf4\
+\xa7\x5e\xb9\xed\xcb\xbd\xe1\x81\x87\xef\x85\x31\x06\x00\xe0\xba\
+\x2e\xba\xbd\xae\xb0\x2d\xdb\x23\xa2\x0a\x80\x10\x80\x7b\xbe\x6a\
+\x06\xa0\xcf\xcc\x5d\xa5\x54\x5a\x0e\xcb\x26\xcd\xd2\x97\xdb\xb9\
+\xf9\x9d\xb7\xfd\xea\x01\x0e\x3f\x78\x0f\x00\x83\x34\xcd\x84\xb4\
+\x64\x43\x0a\x79\x50\x4a\x79\xad\x94\xf2\xa0\x94\xd6\xa4\x94\xa2\
+\x26\x48\xb8\x00\x60\x8c\xc9\xb4\xd6\x1d\x6d\xf4\x8c\xd6\xfa\xb8\
+\x31\xe6\xa8\xd6\xea\xb8\xd6\x66\x4d\x4a\x69\x88\x08\xb7\xbc\xeb\
+\xf6\x5f\x1d\xc0\xe1\x07\xbf\x07\x22\x21\xb4\x2e\xa6\x84\x90\x6f\
+\x73\x1d\xf7\x16\xdf\x0f\xae\x2b\x05\xa5\x61\xcf\xf7\x5d\xc7\x76\
+\x84\x94\x12\x44\x04\x80\x61\x8c\x81\x52\x1a\x79\x9e\x99\x24\x4d\
+\xb2\x38\x8e\x57\x92\x34\x7e\x2a\xcf\xf3\x7b\x94\x52\x8f\x48\x29\
+\xcf\x18\x63\xcc\xad\x37\xbf\xe7\xff\x17\xe0\xf0\x83\xdf\x83\x10\
+\x02\x5a\xeb\x06\x11\xbd\xcb\xf3\xbc\x0f\x55\x2b\xb5\x37\xd6\xaa\
+\xf5\x9a\xef\xfb\x60\x30\xb2\x3c\x43\x9a\xc4\x48\xb3\x0c\x4a\x29\
+\x00\x80\x65\x59\x70\x5d\x17\x9e\xeb\xc1\xb6\x6d\xb0\x61\xc4\x49\
+\x8c\x28\x8a\x3a\xdd\x6e\x74\x24\xcd\xb2\x2f\x33\x9b\xc3\x00\xd6\
+\xb4\xd6\x78\xcf\x6d\xef\xfd\xe5\x03\xdc\xf7\xc0\x77\x61\xb9\x0e\
+\x8a\x34\xdb\x63\xdb\xf6\x47\xaa\x95\xda\xef\xb4\x5a\x23\xe3\x41\
+\x10\x20\x4d\x13\xac\xae\xae\x60\x69\x79\x19\x6b\xeb\x1d\xd3\x1f\
+\x24\x2a\xcd\xb5\xd2\x1a\x06\x00\x2c\x49\xc2\x75\xa4\x55\x2e\xf9\
+\xd6\xd0\x50\x4d\x0c\x0f\x37\x51\xaf\xd5\x60\x49\x07\xfd\x7e\x0f\
+\xcb\x2b\xcb\xf3\xdd\x5e\xf4\x8d\xa2\x28\xbe\x90\xab\xe2\x94\x6d\
+\x59\xf8\xad\xdb\xde\xf7\xcb\x03\xb8\xff\xa1\x7b\x40\x44\x42\x29\
+\x75\xad\xe7\x79\x7f\xd1\x6a\x8e\xde\xd4\x6a\x8d\x78\x79\x91\x61\
+\x7e\x7e\x0e\x33\x33\x73\x3c\xbf\xd8\x89\xd7\x63\x8a\x06\x3a\x88\
+\x32\x94\xfa\x8a\xdd\xcc\x40\x6a\x00\x10\x50\xd2\x42\xe6\xba\x14\
+\x87\xa1\x15\x57\x1b\x25\xaa\x6e\x1b\xad\x07\x13\x13\xdb\xa9\x35\
+\xdc\x02\x03\x58\x5a\x5a\x4c\x57\x56\x96\xef\x4f\xb3\xf4\xd3\x52\
+\xca\xa3\xac\x94\xb9\xfd\xf6\xf7\xff\xe2\x00\x77\x7f\xf7\x4e\x04\
+\x41\x40\x4a\xa9\xeb\x3d\xcf\xff\xd4\xf6\xf1\xed\x37\x36\x1a\xc3\
+\xd6\x5a\x67\x05\xd3\x27\xa7\x71\x66\x66\x29\x6e\x77\xad\xc5\x1e\
+\x86\x17\x0b\x59\xef\x43\xba\x9a\x48\x30\x01\xc4\x00\x33\x33\x0c\
+\x83\x8d\x61\x30\x1b\x90\xc9\x2d\x0f\x51\xb9\x26\x56\x47\xc6\x6b\
+\x66\x64\xd7\x8e\xd1\x60\xe7\xd4\x4e\xf8\x9e\x8f\xe5\xe5\x65\xb5\
+\xd0\x9e\x7f\x28\xcd\xd2\x4f\x5a\xa0\x27\x07\x59\xca\x1f\x78\xff\
+\x07\xb7\x0c\x60\xbd\x52\xa1\x94\x12\x59\x96\xed\xf1\x3d\xff\x4f\
+\xc6\xc7\xb6\xdf\x38\x34\xd4\xb4\xe6\xdb\x73\x78\xfe\xf8\x71\xf3\
+\xd2\x5c\x6f\x65\x45\x8f\xcc\x14\xce\xc8\xba\xb4\x7d\x13\x48\x90\
+\x20\x08\x00\x64\x98\xc1\x0c\x18\xc3\xcc\xcc\x6c\x0c\xb1\x66\x62\
+\xad\xfd\x22\x65\x7f\x6d\x89\x1b\xdd\x41\x67\x65\xa5\x97\x2e\xec\
+\x88\xe3\x64\x78\xff\xbe\x7d\xa2\x35\x32\x62\x19\x36\x37\x9e\x9b\
+\x3f\x97\xa4\x69\xfa\xc7\x82\xc4\xc9\xcb\xf1\x80\xbc\xb8\xe0\x3f\
+\xbe\x77\x17\x98\xb9\x6a\xdb\xf6\x27\xc6\x46\xc7\x3f\x30\x3a\x32\
+\xea\xcc\xb7\xe7\xf0\xf4\x33\xcf\xe9\xe3\x67\xe3\x95\x99\x6c\x62\
+\x26\x95\x43\xa9\x10\xd2\x01\x6b\x57\x6b\xed\x28\xad\x1d\x30\x5b\
+\x8e\x25\xd9\x92\x82\x84\x20\x02\x43\x66\x85\x72\xb3\x5c\x39\x85\
+\x52\x4e\xa1\x94\x9d\x29\x96\x7d\xe5\x15\xeb\xa9\x3b\x48\xfb\x6b\
+\x36\x54\xd7\xaf\x55\x2b\x62\xa8\x31\x24\x94\x52\x3b\xe3\x78\x40\
+\x4a\xa9\xc7\xdf\xfb\xde\xdf\xce\xee\xba\xf3\xdb\x3f\xb7\x07\x24\
+\x11\xdd\x5c\xab\xd6\xee\x18\x69\x8d\x7a\x6b\xeb\xab\x38\x7e\xfc\
+\xc7\x7a\xfa\x5c\xb6\xf2\x52\x7f\x64\x50\x2a\xfb\x23\xbe\xad\x04\
+\x09\x45\x00\x81\x00\xe4\x85\xa1\xb5\x41\x91\x6d\x6b\xd5\xdb\x81\
+\xe7\xa6\x86\x99\xf2\xa2\x70\xd6\xa2\x68\xb4\xe2\x5b\xae\x6b\x4b\
+\x63\x36\x62\x0b\x00\x90\x15\x2e\xff\x78\xbd\x3e\x10\xa2\xcb\xae\
+\xf3\x62\xf3\xd0\xc1\x2b\xe4\xd8\xe8\x98\x37\x18\x0c\xee\x58\x2d\
+\x56\x8e\x18\x6d\xbe\x09\x40\x5f\x36\xc0\x5d\x77\x7f\x03\xcc\x3c\
+\xe9\xb9\xfe\x87\x47\x46\xc6\x46\x94\x56\x38\x75\xea\x24\x4e\x2f\
+\xf4\xd7\x96\xf4\xc4\xac\xe3\xdb\x23\xbf\xf9\xe6\xa9\x52\xb3\xe6\
+\x83\x68\xa3\x03\x11\x11\x96\x3a\x31\x7d\xe7\x7f\xce\x90\x10\x24\
+\x1d\x5b\x0a\xc3\x60\x21\x84\x2c\x79\xd2\xbf\xf5\xcd\x53\x6e\xb3\
+\x16\x80\x0d\x33\x63\x23\xc4\x96\xd6\x63\xdc\xf5\xdf\x2f\xc5\x73\
+\x89\x37\x5b\x99\x5f\x16\xd5\xca\x5c\x6b\xf7\xae\x3d\x18\x1d\x19\
+\x1d\xe9\xf5\xbb\x1f\x4e\x92\xe4\xc8\x97\xbf\xfa\x2f\xa7\x3f\xf4\
+\xbb\xbf\x77\x49\x00\xb1\xf9\x84\x88\x24\x80\x77\xd4\x6a\xb5\x37\
+\x85\x61\x48\xf3\x0b\x73\x38\x33\xb7\x94\xac\x9b\xb1\xb3\xe4\xd6\
+\x52\xcf\x95\x62\xa4\xee\xa3\x56\x92\xd0\x2a\x47\x92\xa6\x94\x64\
+\x29\x65\x59\x0e\x00\x70\x6c\x4b\x38\x8e\x25\x1c\x5b\x0a\xc7\x96\
+\x82\x40\xc8\xf3\x9c\xb2\x34\x43\x9a\x65\xc4\x46\xa3\x1e\x5a\xdc\
+\x08\x6d\xb6\xa5\x40\x8a\x30\x5e\x48\x86\xce\x9e\x99\x5b\x4c\x3a\
+\xd1\x3a\xea\xf5\x06\xd5\xaa\xf5\x37\x01\xf4\x0e\x6c\xd8\xb2\x75\
+\x0f\xfc\xf3\x97\xfe\x09\x5a\xab\xa6\xe7\x86\x37\x0d\x0d\x0d\xd7\
+\x92\x24\xc6\xdc\xb9\x79\x5e\x89\xdd\x45\xe3\x8e\x46\x3e\x23\x48\
+\x53\x22\x10\x61\xad\x9b\xe2\x9e\xc7\x67\xd0\x4b\x75\x6e\x49\xc1\
+\x85\x32\x30\xa0\xc2\x73\x2d\x6c\x78\x80\xd9\x73\x6d\x68\xa6\xfc\
+\xa1\x1f\xb5\x61\x49\xe2\x42\x19\x6a\x54\x1c\xfb\x3d\xbf\xb6\x9b\
+\x68\xa3\x19\x12\x52\xd0\x00\x43\x9d\x76\xb7\xbf\xd8\x6e\x2f\xee\
+\xa8\xd5\xea\x34\x3c\x34\x5c\x5b\x5d\x5d\xb9\x29\xcf\xb2\xef\x7c\
+\xfe\x0b\x9f\x6d\xff\xc1\x47\x3e\xb6\x35\x00\xad\x24\x98\xb1\x3f\
+\x08\x4a\xd7\x04\x41\x09\x8b\x4b\xf3\x58\x5e\xeb\x27\x03\x1a\x5d\
+\xf6\x7c\x1f\x79\x9e\x8b\x9c\x08\x44\x44\xca\x30\xba\xb1\x2a\x6a\
+\xb5\xea\x4a\xb9\xe4\x17\x00\x43\x0a\x61\x7c\xcf\x51\x82\x48\x68\
+\x03\xae\x94\x7c\xb5\x7b\x72\x74\x29\xcb\x15\x94\x61\xee\xf5\x53\
+\x3b\x8a\xd3\x51\xc3\x70\x84\x10\x20\x22\x58\x52\x10\x49\x47\xaf\
+\xab\xfa\xd2\xe2\x5a\xd4\x9a\x1c\xf4\x83\x4a\xa5\x8a\x20\x08\xae\
+\xe9\xf5\x7b\xfb\x0d\xa8\xbd\x65\x0f\x58\xb6\x92\x42\x78\xd7\x84\
+\x61\x38\x0e\x30\xd6\xd6\xd6\x10\xa5\xb2\xcb\x6e\x23\x76\x1d\x4b\
+\x68\xa3\x48\x08\x22\x29\x08\x96\x20\x72\x6c\x0b\x43\xd5\x52\x51\
+\xaf\x94\xf2\xf3\xb1\xcd\x86\x99\x98\x01\x61\x18\x52\x0a\xd8\xb6\
+\x2c\xb4\x61\x56\x9a\x8d\x14\x82\x7b\xbd\x02\x52\x08\x62\x29\x58\
+\x08\x01\x69\x09\x58\x96\xa4\x4c\x57\xfa\x6b\xfd\x28\x8a\xba\xdd\
+\x60\xdb\x78\x05\x61\x58\x1e\x5f\x5e\x59\xb9\x46\xc0\xfc\xe0\x52\
+\x9d\xf9\x65\x00\x22\xb8\x96\xb4\x0e\xfa\x7e\xe0\x16\x45\x8e\xa8\
+\xdb\xd7\x19\x97\xba\x96\xe3\x6b\x4b\x0a\x29\x85\x20\x65\x18\x4b\
+\x9d\x84\xd2\x34\x43\x61\x0c\x48\x9c\x1f\x32\x41\x60\x80\xc4\x06\
+\x07\x19\x03\x63\x0c\x03\xc4\x02\xc4\x86\xc1\x24\xa5\x20\xa5\x0d\
+\x96\x3a\x09\x8a\xa2\x20\xad\x37\xca\x2c\x4b\x90\x82\xab\x06\xda\
+\xef\x76\x7b\xfd\xd6\x76\x40\x96\x82\xd0\xb5\xa4\x75\x90\x88\x5c\
+\x00\xf1\x16\x01\xa8\x24\xa5\x35\xe9\x38\x0e\x65\x59\x8a\x38\xcd\
+\x95\x96\x43\xb1\x6d\xdb\x90\x52\x90\x6d\x4b\xce\x15\x17\x87\x9f\
+\x98\x11\xcc\x4c\x85\xa6\xc2\xb1\x25\x4b\x29\x80\x8d\x0c\x0c\x00\
+\x1b\x89\x8c\x58\x68\x01\x03\xc3\x44\xda\x10\x88\xc9\x71\x2c\xc4\
+\xa9\xc9\xef\x3d\x32\x03\x6d\x0c\x72\x8d\xdc\xb1\x2d\x30\x88\x93\
+\x82\x54\xcf\x38\xbd\x7e\x9c\x29\x6d\xb4\xf4\x3d\x8f\xa4\x94\x93\
+\x44\xa2\xb4\x65\x00\x00\x81\x10\xa2\x21\xa5\x44\x9c\x24\x28\x14\
+\x2b\x96\x41\x2e\x85\x24\x21\x88\x2a\xa1\xaf\x0e\xec\x1c\x5f\x02\
+\x20\xa4\x24\x72\x1d\x89\x30\xf0\x34\x09\x22\x02\x5d\x98\x94\x10\
+\x33\x40\xc4\x00\x43\x10\xb1\x39\x0f\x47\x61\xe0\x15\xbb\xa7\xc6\
+\xdb\xb9\x52\xd0\x8a\x39\x2c\x4c\xbe\x1e\x9b\xde\xe9\x76\xb7\x7f\
+\x6e\x25\x4d\xf7\x36\x52\x1c\x6c\xe9\x7d\xc6\x18\xd7\x76\x1c\x48\
+\x21\x1a\x00\x82\x2d\xf7\x01\x66\x76\x00\xf8\x04\x82\xd6\x1a\x86\
+\x89\x85\xb4\x0d\x09\x42\x52\x18\xc5\x05\x15\xa1\xe7\xaa\x92\x2f\
+\x2d\xc7\x96\xd2\x12\xb4\x11\x41\x62\x63\x44\xd9\x58\x07\x6c\x78\
+\x80\x04\x83\x0c\xa0\xc1\xc4\x20\x66\x30\xd9\x6c\x71\xe0\x8b\x34\
+\x8f\x8b\x7c\xa9\x9b\x25\x2f\x2e\xa4\x83\x33\x8b\x83\xb4\xd3\xcf\
+\x55\x96\x1b\xae\x58\x26\xc9\x15\x0a\x66\x86\x10\x02\x20\xf2\xcf\
+\xdb\xb4\x35\x00\x63\x98\x0c\x9b\x97\xb3\xa5\x10\x02\x24\x04\x56\
+\x7a\x2a\x39\xb9\x10\xf7\x93\x82\x75\xb5\xe4\x58\xa3\x75\xd7\x6d\
+\x55\x1d\xaf\x1e\xda\x6e\xc9\x93\xb6\x6b\x91\xb4\x2d\x12\x72\xc3\
+\x11\x44\x00\x83\x89\x35\xb3\xce\x34\x9b\x41\xc6\x45\x14\xab\x7c\
+\xb9\x9b\x27\xe7\x56\xf3\xe4\xdc\x5a\x9a\x2e\x47\x79\xde\x4f\x0a\
+\x63\x34\x93\x90\x12\xd2\x22\x48\x29\x20\x04\x93\x10\x17\x1e\x04\
+\x83\x8d\xb9\xe4\x7a\x65\x13\x80\xce\xb4\xd2\x89\x31\x06\x52\x4a\
+\xd8\x96\x10\x45\xa2\x70\x6c\x66\x10\xcd\xad\x66\xa9\x65\x09\xb9\
+\xd6\x4b\xe5\xcc\x32\x29\xd7\x96\x83\xd0\x77\xe2\x4a\x39\x50\x25\
+\xdf\x12\x25\x57\x4a\x5b\x0a\x21\x25\x11\x33\x38\x55\xac\x93\xcc\
+\xe8\x6e\xa2\xd5\x5a\xbf\xc8\x3b\xb1\x52\x83\xa4\x30\x45\x96\xb8\
+\xaa\x50\x36\x98\x6d\x57\x82\x15\x89\x44\x1b\x32\xc2\x00\x81\x2b\
+\x2c\xcf\x25\x29\x85\x84\xd6\x29\x94\x52\x89\xd6\x3a\xdb\x32\x80\
+\x52\x3a\x2e\x8a\x62\xad\x28\x72\xd8\x96\x0d\xcf\x91\x56\x9c\xc4\
+\x3c\xdf\x11\xa9\x81\x30\xc4\x3a\x70\x4d\x77\xf7\x78\xcd\x2d\x01\
+\x84\xe5\x28\x4a\xba\x79\x6b\x5a\xd8\x7e\x1f\xa4\x01\x10\x0c\xc0\
+\x86\x01\x65\xc0\x5a\x33\x2b\xcd\xac\xb4\x61\xa5\xc9\xc0\xe8\x60\
+\x48\x76\x0f\x8c\x34\xec\x40\x6b\x83\x85\x4e\x36\x58\x2f\xca\xd3\
+\x06\x56\x5f\x4a\x60\x28\x84\x5f\x0e\x1c\xdb\xb2\x6c\xe4\x59\x86\
+\xa2\x28\xd6\x94\xd6\xf1\xd6\x01\x8a\x7c\x90\xe7\xd9\x6c\x92\x24\
+\xa8\x37\x6a\x08\x7c\xc7\x62\x35\x70\xd2\x22\x30\x42\x5a\x6c\x58\
+\x51\x3d\x94\xa5\xf7\xbf\x65\x57\x99\x19\xf8\xc6\xa3\x2f\x89\x85\
+\x02\x82\x84\x64\x10\x01\x20\x80\x01\x26\x30\x6d\x28\x26\x30\x0b\
+\x10\x4b\x62\xb0\x26\x31\x5a\xb3\xc3\x3b\xde\xba\x2b\x34\xc6\xe0\
+\x4b\x0f\x9e\x42\xd4\x21\x21\x48\xc2\x21\x16\xdb\xaa\x5c\xad\x57\
+\x4a\x8e\x90\x12\x83\x78\x80\x2c\xcf\x66\x8b\xa2\x18\x6c\x19\x40\
+\x6b\x9d\x65\x59\xf6\x5c\xaf\xd7\x4d\x87\x86\x87\xbd\x4a\x39\x14\
+\x0d\x6f\xa5\xe6\x5b\x85\x3d\x30\x4e\x6a\x43\xb0\x25\xa5\x69\xd5\
+\x4b\xa6\x50\x1a\x52\x0a\xa3\x0b\xa9\x89\x2c\x43\xe7\x01\xcc\xc6\
+\x7a\x1e\x2c\x98\x19\x60\x00\x86\xc8\x40\x1a\x66\xa3\x24\x3b\x8e\
+\xc5\x63\x43\x21\x33\x1b\x38\xb6\x64\x12\x02\x60\xc9\x0d\xaf\x70\
+\x77\x36\xa9\xd9\xa8\x55\x2d\x63\x0c\xa2\x28\x4a\xb3\x2c\x7b\x4e\
+\xab\xe2\x92\x21\xf4\xf2\x64\x4e\x4a\xa9\xf3\xa2\x78\xa6\x13\x45\
+\xf3\x4a\x29\x54\x2a\x15\x4c\x0e\xc9\xe6\x54\x35\xab\x1b\x26\xd6\
+\x1b\x03\x0c\x33\x33\xb4\x31\xac\x35\x93\x2e\xd2\x40\x67\x83\x50\
+\x65\x83\xd0\x14\x69\xc0\x20\x62\x61\x19\x08\xcb\x10\x91\x10\x3a\
+\x0d\x85\x8a\x2b\x42\x0f\x2a\xc2\x64\x21\x33\x84\x01\x98\x41\x1b\
+\x5f\x21\x20\x84\xc0\x9e\xe1\xa2\xbe\x67\xd4\x6f\x56\x2a\x15\xc4\
+\x83\x18\xeb\x9d\xf5\xf9\x3c\xcf\x9f\x21\xcb\xbe\xe4\x94\xfa\x65\
+\x80\x8f\x7e\xe4\xe3\x30\xc6\x9c\x88\xa2\xe8\xe9\xa8\x13\x21\x0c\
+\xcb\x18\x1b\x2e\x85\xd7\x8e\x25\x53\xbe\x6d\x2c\x03\xc1\xbc\x91\
+\x71\xe1\x58\x16\x86\x2b\x8e\xbb\x3d\x18\xec\xdb\x66\xaf\x5d\xd9\
+\xa2\xe5\xab\xe4\x60\x7e\x2f\xeb\xdc\x65\x69\x31\x49\x8b\x05\x17\
+\x9e\x9f\x2e\xec\x9b\xb0\x57\xae\xde\xe5\xaf\x5f\xbd\xb3\x9c\x1c\
+\x68\x56\x1d\xd7\xb6\xe4\xf9\x79\x38\x40\x24\x10\xba\x6c\xbf\x61\
+\xa2\x98\x9a\x1c\xad\x87\xae\xeb\x63\x79\x65\x19\x9d\x4e\xe7\x69\
+\xad\xf5\x89\x3f\xfb\xa3\x3f\xbf\x94\xfd\x3f\xbd\x1e\x10\x24\x97\
+\x93\x24\x3e\xbc\xb0\x30\xff\x1b\x8d\xa1\x46\xbd\x39\x3c\x24\xae\
+\xdc\x76\x6e\xea\x64\xd4\x9f\x7d\x6a\xc1\x8f\x00\x00\x44\x68\xd5\
+\x03\x7c\xe8\xa6\x83\x42\x69\x53\x22\x21\xb0\xb4\x3e\xc0\x57\x1e\
+\x3e\xcd\x6d\x40\x08\x69\x31\x00\x70\x01\x31\x1c\xca\xd2\x07\xdf\
+\xbe\xab\xdc\xaa\x07\x60\xc3\xb0\x2d\xc1\xf5\xd0\x45\x7b\xbd\x0f\
+\x22\x02\x09\xc2\x0d\xdb\x92\xb1\xeb\x76\x7a\x53\xa3\xcd\x96\xc8\
+\xd2\x14\xb3\xb3\x33\xeb\x83\x78\x70\xd8\x12\x62\xf9\x92\xd6\x5f\
+\x0c\xa0\x59\x69\x18\x3c\xbc\xbc\xb2\xfc\xc4\xca\xf2\xca\x3b\x9b\
+\xcd\x61\x9a\x1c\x1d\x84\x6f\x19\x74\x5f\xb7\x1a\x8b\xe7\x0b\xcd\
+\x68\xaf\xc5\x50\x9a\x69\x83\x85\x40\xcc\x50\x9a\xc1\x04\x08\x69\
+\x41\x5a\x16\x40\x80\xc9\x2d\xc0\x10\x94\x66\x28\x6d\x60\x0c\x23\
+\xd7\x9a\x06\x69\x8e\xc5\xb5\x01\x72\xc5\xd8\x5d\xcf\x6b\x37\xee\
+\x2d\x0e\xed\x9b\xdc\x16\x7a\x9e\x8f\xe9\x93\xd3\xdc\x5e\x6c\x3f\
+\xa1\x95\x7e\xd8\x18\xde\xd2\x8a\xec\x67\x12\xc5\xdf\x7f\xf1\x73\
+\x92\x19\xef\x1b\x1d\x1d\xfb\xec\xd5\x57\x5d\x3d\x42\x12\x98\x99\
+\x9d\xd3\x4f\xbc\x94\xce\x3c\x32\x6d\x75\x2d\xdb\xb3\x1d\xeb\xe5\
+\xf4\x0b\x12\x84\x42\x19\x5a\x4b\xd0\x37\x8d\xdd\x27\x84\x5f\xeb\
+\x83\x00\x13\x77\x42\xb1\xf6\xe2\xfe\x86\x4f\xa1\x6d\x11\xb3\xe1\
+\x8d\xe4\xc4\x8c\x2c\xd7\xcc\x26\x2f\x6e\xbe\x52\x56\xde\x76\x65\
+\x73\x72\x6a\x62\x52\xae\xae\xae\xe2\xb1\x23\x8f\x2d\xce\xcd\xcd\
+\x7e\x8c\x88\xbf\xf9\x89\x3f\xfc\xd3\x2d\x01\xfc\xcc\xaa\xe7\x96\
+\x5b\x6f\xe6\xa2\xc8\x67\xf3\x3c\x1b\x66\xe6\x6b\x5a\xad\x11\x2b\
+\x08\x7c\x51\xb6\xb2\x72\xc9\xd6\xd9\xc9\x6e\x65\xfa\x74\x5c\x3b\
+\xb3\x6e\xca\x0b\x11\xca\x0b\x5d\x54\x16\x06\xb2\xbe\x40\x61\x6b\
+\xd9\xf2\xc3\x54\x5a\x36\x84\x10\x44\xd2\xd6\xc6\x2e\xaf\x77\x11\
+\xb6\xd7\x55\xb8\xb0\xae\x4a\x0b\xab\x45\xb0\xb0\x9a\xfb\x0b\xd5\
+\x00\xc9\xad\x07\xf5\xc4\xaf\x5f\xd1\x98\xd8\x39\x39\x61\x25\x49\
+\x82\x67\x8f\x3d\x13\xcf\xce\xcc\xfc\xb3\x36\xfa\x1f\xa7\xa7\x4f\
+\xa6\x53\x3b\xa7\xf0\xc2\xf1\x1f\x5f\x3e\xc0\xbd\xf7\x1c\xc6\xad\
+\xb7\xdd\x92\x15\x45\x71\x3a\x8e\xe3\x29\x22\xb1\x67\xa4\x35\x22\
+\x4b\x81\x27\xaa\x5e\x51\x19\xf5\xe3\x80\x2c\x7b\xd0\xe1\x6a\x47\
+\xcb\x30\x95\xae\x9f\x4b\xd7\xcf\xa5\xe3\x15\xc2\xb2\x21\x5e\xde\
+\x1f\x25\x66\x61\x17\x90\x4e\x0e\xe9\xe4\x46\xd8\x79\xc9\x25\xbe\
+\x7e\xac\x3f\x72\xeb\xfe\xc1\xeb\xde\xb4\xaf\x31\x31\xb9\x6d\xbb\
+\x95\xe7\x05\x7e\x74\xf4\x47\x78\xf2\xa9\x27\x4f\xbf\x70\xe2\xc4\
+\xd7\x8f\x1d\x3b\xd6\x1e\x0c\x62\xad\x94\x52\xaf\xbb\xf2\x10\x5e\
+\x7f\xdd\xb5\x38\xf6\xec\x73\x5b\x07\x00\x80\xfb\xee\x3d\x8c\x5b\
+\x6e\xb9\x75\x2d\xcd\x92\x17\x7b\xfd\xde\x2e\x02\x76\x36\x9b\x4d\
+\xaa\x94\x43\x51\xf3\x75\x65\xdc\xef\x8d\x8c\xb8\xfd\x12\xc0\x2a\
+\x35\x76\xa1\xd8\x62\x43\x92\x81\x8d\xf4\x65\x36\xf6\x86\x60\xb4\
+\x01\xb1\x16\x25\x91\x3a\xfb\xcb\xeb\xad\xb7\x6f\x5b\x3a\xf4\xd6\
+\xa9\xfc\xca\xab\x76\xb5\x9a\x63\x23\xa3\x22\x4b\x33\x1c\x7d\xfa\
+\x28\x9e\x7c\xea\x49\xb4\xdb\x6d\x2f\x49\xd3\x6b\x3c\xdf\x7f\x9b\
+\x6d\x59\x37\x08\x21\x60\x8c\x39\x63\x8c\xd1\xaf\xe5\x89\x57\x9d\
+\x2c\x7d\xee\xf3\x7f\x8b\x34\xcd\x49\x08\xbe\x26\x08\x82\x4f\xee\
+\xd8\xb1\xe3\x5d\xfb\xf6\xee\xf3\x82\x52\x09\x71\xd2\x47\x27\xea\
+\x9a\x95\x28\x1b\x2c\xf4\xad\xa5\x73\x71\xb0\xb4\x94\x05\x51\x5f\
+\x7b\x49\xc1\x52\x03\x04\x9b\x0a\x59\x96\x99\xdf\xf2\xe2\xea\xb6\
+\x52\xda\xda\x5e\xe5\xd6\x78\x23\x2c\x35\x87\x86\x85\xeb\x7a\x58\
+\x5d\x5d\xc5\xf1\x17\x9e\x8f\x7f\xf8\xe4\x93\x33\x67\x67\x67\x77\
+\x5c\x71\x60\xbf\x5f\x2e\x97\x61\xdb\x16\xe2\x24\x31\x27\x4f\x4c\
+\x9f\x5a\x58\x68\x7f\x8a\x99\xef\x24\xa2\xec\x5b\x77\xde\x7d\x79\
+\x00\x00\xf0\x37\x9f\xfd\x6b\x50\x41\x28\x44\xb1\xdf\xb1\x9d\xdf\
+\x6f\x36\x9b\x77\xec\xde\xb5\x67\x6c\x6c\x6c\x14\x96\x6d\x21\xcd\
+\x52\x24\x71\x8c\x38\xcd\x75\x9c\xe9\x3c\x55\x9c\x2b\x03\x05\x00\
+\xb6\x20\xcb\x77\x84\x53\xf6\x6d\x27\x2c\x05\x32\x2c\x85\x70\x5d\
+\x0f\x69\x92\x62\x66\x76\x06\x27\x4f\x4e\x2f\x2c\x2d\x2f\x7d\xed\
+\xc8\x13\x4f\x1d\x89\xba\xbd\xcf\xbc\xf1\x86\xd7\xef\x1b\x1a\x1a\
+\x42\xa3\xd1\x40\x63\xa8\x8e\xd5\xd5\x55\x1c\x39\xf2\xc4\x89\xf6\
+\x42\xfb\xd3\xc6\x98\xbb\x98\x39\x0d\x02\x0b\x5f\xfb\xb7\x6f\x5d\
+\x3a\x84\x2e\x7c\xee\x3f\xfc\x20\x6e\xb9\xf5\x66\x64\x45\xb1\xaa\
+\x95\xfa\x61\xb7\xd7\x7b\x71\x65\x65\xa5\x12\x45\x9d\x61\x30\xbc\
+\x52\x10\xa2\x52\xae\xa0\x5a\xa9\x88\x46\xb5\x6c\x37\x6b\x25\x6f\
+\xb4\x11\x06\x63\x8d\x72\x30\x3a\x54\xf5\x9a\x43\x75\xbb\x5a\xa9\
+\x0a\xd7\xf5\x90\xa6\x29\x66\xce\x9e\xc5\x73\xcf\x1f\x8b\xa6\x4f\
+\x9e\xf8\xc1\xd2\xf2\xd2\x5f\x15\x45\xf1\xaf\xf7\x3d\xf0\x9f\x73\
+\xbe\xe7\xdd\x58\xaf\x57\x77\x09\x21\xd0\xed\xf6\x30\xe8\x0f\x30\
+\x32\xd2\x42\xb3\x39\x3c\x1c\x75\xa2\x43\xfd\x7e\x7f\x59\x29\x75\
+\x82\x59\xfc\x4c\x38\x5d\x72\xef\xe5\xbe\xc3\xf7\xe3\xa1\x07\x1e\
+\xc2\xea\xda\x52\xf2\xf4\xd1\xa7\x8f\x0b\x29\x1e\x8d\xa2\xe8\xc5\
+\xc5\xc5\x45\xbd\xb4\xb8\xe8\x75\x3a\x91\x93\x24\xa9\xa3\x8a\x02\
+\x5a\x1b\x68\x6d\xa0\x0a\x8d\x24\x49\xd1\x89\x22\x2c\xb4\x17\x70\
+\xea\xd4\xc9\xf8\xf8\x0b\xc7\xcf\x4d\x9f\x9c\x7e\x74\x7e\x7e\xfe\
+\x8b\xed\x85\xf6\xdf\x7d\xfd\x6b\xff\xfe\xf8\x5d\x77\x7e\x3b\x71\
+\xfd\x00\x41\x29\xb8\x3e\x0c\xc3\xeb\x4a\xbe\x47\x4b\x4b\x8b\xe8\
+\xf5\xfa\x28\x0a\x8d\xf1\xf1\x71\xb4\x5a\xcd\xe1\x28\x8a\xae\x8a\
+\xe3\x78\x99\x99\xa7\x0f\x1e\xba\xe2\xa7\x20\xb6\xfa\x86\xe6\xa7\
+\xea\xdd\x74\xd3\x3b\xe4\xf5\x37\x5c\xd7\xb4\x1d\xfb\x90\x6d\xdb\
+\x57\x3b\x8e\x73\xc0\x75\xdd\xed\xb6\xed\xd4\x2c\x29\x3d\x00\x50\
+\x5a\x65\x79\x96\x47\x69\x96\x9e\x8b\xe3\x78\x7a\x30\x18\x1c\x9b\
+\x9b\x3b\xf7\xc2\x43\x0f\x3e\xb2\xba\xb2\xbc\xa2\x2f\xb4\xe9\xb8\
+\x2e\xef\x39\x70\xc5\xbb\x5b\xad\xd6\x67\x0e\xec\xdf\xbd\x37\xf0\
+\x1c\x74\xbb\x5d\x94\x4a\x65\x4c\x4c\x6c\xc7\x9e\xbd\xbb\xd1\xeb\
+\xf5\xf0\xf8\x63\x8f\x9f\x68\xb7\x17\x3f\x63\x8c\xb9\x93\x99\xd3\
+\x72\xb9\x8c\xaf\x7c\xe9\xab\x5b\x02\xa0\x4d\x7a\xb3\x30\x00\x4c\
+\xed\x9c\x72\x6e\x78\xc3\x75\xa5\x52\x10\x54\xa4\x65\x95\xa4\x14\
+\xae\x31\x4c\x59\x96\x15\xf1\x60\x90\x2c\x2e\x2d\x0f\x8e\x3d\xfb\
+\x5c\x12\x75\x22\x8d\x8d\xb9\x97\xb8\xf8\x81\x84\x95\x8a\xb7\x7d\
+\xc7\xce\xdb\x47\x47\x5b\x1f\x3f\x78\x60\xef\x4e\xcf\x75\x10\x45\
+\x11\xc2\x30\xc4\xc4\xc4\x04\xf6\xed\xdf\x8b\x28\x8a\xf0\xf8\x63\
+\x8f\x9f\x98\x9f\x5f\xf8\xb4\x52\xea\x9b\xb6\x6d\xe7\xdf\xba\xf3\
+\xee\x4b\x02\xbc\x9a\xf1\xe2\x22\x8d\xd7\xb8\xbe\x59\x5e\xad\x0e\
+\x5c\xdf\xf7\x27\x76\x4c\xbd\x7b\xfb\xf6\x6d\x1f\x3d\x78\xc5\xbe\
+\x1d\xbe\xe7\xa0\xd3\x89\x50\x2a\x6d\x40\xec\x3f\xf0\x32\xc4\xa9\
+\xf9\xf9\xf6\x5f\x12\xe1\x2e\x00\xe9\xa5\xfa\xc0\x66\xe3\xc4\x6b\
+\x68\x71\xbe\x3f\x49\x6c\xcc\xaf\x36\x6b\xb9\xe9\xfa\xe6\x7a\x17\
+\xea\xd8\x00\x1c\xad\x94\xec\xf7\x7a\xf3\x10\xb2\x9b\x17\x6a\x57\
+\xbd\x56\xaf\x95\xc3\x12\x7a\xbd\x2e\x92\x24\x85\x52\x0a\xe3\xe3\
+\xe3\x68\xb6\x9a\x8d\xf5\x4e\xe7\x50\x3c\x18\x9c\x05\x70\xea\x72\
+\x00\x5e\xc9\x78\xc2\xa5\xe1\x36\x43\xbe\x9a\x87\x2c\x00\xb6\xd6\
+\x9a\x06\xbd\xee\x2c\x0b\xd9\xc9\xf3\x62\x77\xa3\xd1\xa8\x96\xcb\
+\x25\x74\xbb\x3f\x81\x98\xdc\x31\x09\xdb\xb1\x86\x17\xe6\xe7\xfb\
+\x49\x92\x7e\xff\x72\x01\x70\xd1\xf9\x2b\x5d\xa7\x57\xb9\xff\x82\
+\xe6\xf3\xf2\x4a\x6d\x09\xad\xb5\xee\xf7\xba\x67\x20\xe4\x72\x5e\
+\x14\x7b\xeb\x8d\x5a\xad\x1c\x86\xe8\x76\xbb\x00\x80\x46\xa3\x8e\
+\xf5\xf5\x8e\x9a\x9d\x99\xfd\x7e\x14\x45\x97\x05\xf0\x4a\xe5\x9b\
+\x8f\xf9\x22\x0d\x60\xe3\x8d\xe5\x26\xa3\xcd\x26\x7d\x41\xf4\xa6\
+\x72\x06\x00\xa3\xb5\x1a\xf4\xfb\xa7\x49\xca\xf5\x3c\x57\x7b\xea\
+\xf5\x5a\xad\xd1\xa8\xa3\x5a\xab\x22\xea\x76\xf1\xec\x33\xc7\x8e\
+\xb5\x17\x17\xff\xe1\xd1\x47\x1e\x3d\xbd\x95\x3d\xf8\xcd\xc6\xf2\
+\x45\x06\x6d\x96\x8b\x0d\xbd\x60\xd8\x85\x63\x0d\x40\x5d\x24\xc5\
+\xa6\x63\xbd\x49\x58\x6b\xa5\xfb\xbd\xfe\x59\x08\xd1\xcb\xf2\x62\
+\x8f\xe7\xba\x95\x6e\xaf\x67\x5e\x78\xe1\xc4\x8b\x67\xce\x9c\xf9\
+\xe2\x33\x47\x9f\xf9\xdf\x2c\xcb\x7f\xbe\x3c\x80\x57\x0f\x9d\xd7\
+\x0a\xa3\xd7\x6a\xfb\x42\xe7\xb6\x37\x89\x05\xc0\x76\x3c\xaf\xb4\
+\x7d\x72\xc7\x5b\x2a\xd5\xea\x5b\x08\xbc\xde\xed\x74\xfe\x6b\xf6\
+\xec\xd9\xa3\x79\x9e\xf7\x00\xa4\x97\xfb\x67\x8f\x0b\x31\xbc\x95\
+\x90\xba\xdc\x76\x37\x8f\x66\x16\x7e\x32\x42\xd9\x52\x4a\xd7\xf3\
+\xfd\x50\x15\x85\xc9\xb2\xec\x82\xd7\xb2\x9f\x07\xe0\xb5\x0c\xf8\
+\x65\xb4\xb1\x79\x94\xba\x30\xec\x5e\x80\xb9\x70\x7e\xe1\x21\x16\
+\x00\x8a\xff\x03\x34\x60\x05\x5e\xc6\x0b\x52\x9c\x00\x00\x00\x25\
+\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\
+\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\
+\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\xca\x00\x00\x00\
+\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
+\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\
+\x36\x3a\x31\x38\x2d\x30\x37\x3a\x30\x30\x67\xec\x3d\x41\x00\x00\
+\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
+\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\
+\x31\x31\x3a\x34\x31\x2d\x30\x37\x3a\x30\x30\x35\x62\x5d\x05\x00\
+\x00\x00\x34\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\
+\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\
+\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\
+\x65\x73\x2f\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\x6a\x06\xa8\x00\
+\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\
+\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\
+\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\xdd\x31\x7c\xfe\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\
+\x67\x9b\xee\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\x74\x53\x6f\x75\
+\x72\x63\x65\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\x6f\x6e\x20\x54\
+\x68\x65\x6d\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\x74\x45\x58\x74\
+\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\
+\x2f\x2f\x61\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\x6f\x72\x67\x2f\
+\x32\xe4\x91\x79\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x09\x2e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
+\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x08\xab\x49\x44\
+\x41\x54\x58\x85\x9d\x96\x7f\x50\x93\xf7\x1d\xc7\xdf\xdf\x3c\x4f\
+\x1e\x12\xe0\x49\x48\x94\x90\x88\x41\x08\x04\x70\x80\x08\x45\xa6\
+\xb4\xa0\x52\x7b\xae\x3a\x9d\xba\xea\xec\xd4\x93\x43\xab\x67\x67\
+\xdd\xe9\x79\xb5\xf6\xd4\xbb\xc2\xd9\x96\x9e\xd6\xcd\x9e\xd5\xae\
+\x76\x70\x95\xc1\xb9\xd3\x93\xde\xa0\xca\xbc\x95\xcd\x75\xd6\x41\
+\xaa\xa2\x41\x6a\x02\x92\x75\x44\x12\x13\x92\x10\x7e\xc4\xe4\x79\
+\xf2\x3c\xfb\xc7\x78\xc8\x8f\x41\xfb\xbd\xfb\xde\xe5\xc7\xe7\xfb\
+\xbc\x5e\xdf\xcf\xe7\xfb\xc9\x37\x10\x45\x11\xa2\x28\x02\x80\x34\
+\x23\x23\x83\x8d\xbc\xff\xb1\x13\x80\x14\x00\x35\x6f\xde\x3c\x0d\
+\x00\x7a\xaa\x78\x22\x8a\x22\xb4\x5a\x6d\x4c\x73\x73\xb3\x89\xa2\
+\xa8\x99\xf5\xf5\xf5\x05\x47\x8f\x1e\xfd\x0f\x7e\xc4\xd8\xb4\x69\
+\x93\xca\x68\x34\x1e\xd7\xeb\xf5\x6b\x04\x41\x88\x1e\x1c\x1c\xb4\
+\x9b\x4c\xa6\x43\x75\x75\x75\xf5\x93\xad\x21\x00\xa8\xf6\xf6\xf6\
+\x8e\x39\x73\xe6\x64\x00\xc0\xe0\xe0\x60\xb8\xb1\xb1\x71\xd7\xae\
+\x5d\xbb\xaa\x45\x51\xe4\xa7\x0b\xdf\xb6\x6d\x5b\x5e\x69\x69\x69\
+\xa3\x4a\xa5\x9a\xc5\x71\x1c\x78\x9e\x07\xc7\x71\x70\xbb\xdd\xdf\
+\x9d\x39\x73\xe6\x79\xb3\xd9\xec\x99\x68\x1d\x9d\x95\x95\xa5\xa4\
+\x69\x5a\x15\xf9\x80\x65\x59\x6a\xf9\xf2\xe5\x7f\xf8\xe4\x93\x4f\
+\xb2\x01\xfc\x76\x3a\xf0\x13\x27\x4e\x2c\xd8\xb8\x71\xe3\xd5\xe8\
+\xe8\x68\x25\xc7\x71\x88\x08\x38\x1c\x0e\x7b\x67\x67\xe7\x8b\x1d\
+\x1d\x1d\xde\xc9\xd6\x4a\xcc\x66\xb3\xe7\xf8\xf1\xe3\x2b\x86\x86\
+\x86\x78\x00\x18\x18\x18\xc0\xc0\xc0\x00\x52\x52\x52\xde\xd8\xb1\
+\x63\x47\xc1\x54\x70\xa3\xd1\xa8\x30\x18\x0c\xf5\x6a\xb5\x5a\xc9\
+\x30\x0c\xe4\x72\x39\x62\x62\x62\x30\x32\x32\xd2\xdb\xd2\xd2\x52\
+\x7a\xea\xd4\xa9\x87\xe2\x93\xc3\x31\xa1\x00\x00\x7c\xf6\xd9\x67\
+\xdf\xd6\xd7\xd7\x1f\xf4\x78\x3c\xf0\x78\x3c\xe8\xef\xef\x87\xd7\
+\xeb\x25\x0b\x17\x2e\xfc\xaa\xac\xac\x6c\xd1\x64\x8b\x09\x21\x64\
+\xcf\x9e\x3d\x9b\x0c\x06\x43\x2a\x4d\xd3\x88\x4c\x9f\xcf\xf7\xdf\
+\xb6\xb6\xb6\x82\xcf\x3f\xff\xdc\x32\xd5\x06\x24\x91\x17\xfb\xf7\
+\xef\x3f\xd6\xd4\xd4\x74\xd6\xed\x76\x8b\x1e\x8f\x07\x6a\xb5\x1a\
+\x3a\x9d\x8e\x2d\x2e\x2e\x6e\xde\xb3\x67\xcf\xbc\x89\x16\xa7\xa5\
+\xa5\x31\xb3\x67\xcf\x5e\x3b\x1a\xde\xdf\xdf\xff\xb0\xb1\xb1\xb1\
+\xf4\xfd\xf7\xdf\x77\x4e\x06\xcd\xcd\xcd\xd5\x8c\x13\x00\x80\xdd\
+\xbb\x77\xbf\x76\xfa\xf4\xe9\x15\x84\x10\xb7\x46\xa3\x81\x46\xa3\
+\x41\x7c\x7c\x3c\x9b\x9b\x9b\xfb\xaf\x49\x32\x11\xa5\x50\x28\x12\
+\xc7\xec\xde\x7c\xf9\xf2\xe5\xde\xc9\xe0\x85\x85\x85\xfa\xb7\xde\
+\x7a\xab\x7e\xdf\xbe\x7d\x3f\x1f\x27\x00\x00\x17\x2f\x5e\xbc\x52\
+\x5b\x5b\xfb\x6b\xab\xd5\xfa\x48\x2a\x95\x42\xaf\xd7\x63\xd6\xac\
+\x59\xb1\xc5\xc5\xc5\xcd\xaf\xbf\xfe\xfa\xfc\xd1\xb1\x14\x45\x89\
+\xb1\xb1\xb1\x33\x22\x70\xa9\x54\x8a\xc4\xc4\xc4\xbc\xb8\xb8\x38\
+\xd9\x44\xf0\xa5\x4b\x97\x26\x1f\x38\x70\xa0\xc1\x60\x30\x94\x16\
+\x15\x15\xfd\xce\x68\x34\x2a\xc6\x09\x00\x40\x43\x43\xc3\xd5\xda\
+\xda\xda\x57\xac\x56\xab\x8b\xa2\x28\xe8\x74\x3a\x68\x34\x1a\x36\
+\x3f\x3f\xff\xda\xce\x9d\x3b\x0b\x23\x71\x1c\xc7\x49\xe4\x72\xb9\
+\x2c\x02\xa7\x69\x1a\x5a\xad\x36\x7e\xf1\xe2\xc5\x99\x63\x9f\x59\
+\x52\x52\xa2\xdb\xbb\x77\xef\x05\x83\xc1\x90\x4f\xd3\x34\xd4\x6a\
+\xb5\x56\x22\x91\x30\x13\x0a\x00\xc0\xa5\x4b\x97\xfe\x59\x53\x53\
+\xb3\xc5\x62\xb1\xb8\x24\x12\x09\x74\x3a\x1d\x74\x3a\x1d\xbb\x60\
+\xc1\x82\xbf\x6d\xdf\xbe\x7d\x01\x00\xcc\x98\x31\x43\xce\xb2\xac\
+\x2c\x02\x8f\x88\x2c\x59\xb2\x64\xef\xd6\xad\x5b\x73\x08\x21\x14\
+\x21\x84\xbc\xf4\xd2\x4b\x49\x6f\xbf\xfd\xf6\x17\xa9\xa9\xa9\xcf\
+\x45\xe2\x44\x51\x0c\x08\x82\x30\x48\xfe\x4f\x87\x00\x00\xd6\xac\
+\x59\x53\xb2\x65\xcb\x96\x3f\x1b\x8d\xc6\x04\x00\xe8\xed\xed\x85\
+\xdd\x6e\x1f\x34\x99\x4c\xc5\xc5\xc5\xc5\xf9\x2b\x56\xac\xf8\xa3\
+\x20\x08\x18\x3b\x39\x8e\x13\x1c\x0e\xc7\x43\xbb\xdd\x7e\x53\xa9\
+\x54\xa6\x24\x27\x27\xe7\x8c\xfe\xbe\xad\xad\xed\xe3\xa3\x47\x8f\
+\xee\x9b\x52\x00\x00\x56\xad\x5a\xb5\x6c\xeb\xd6\xad\x75\xe9\xe9\
+\xe9\xf1\xc1\x60\x10\x0e\x87\x03\x7d\x7d\x7d\x23\x49\x49\x49\x43\
+\x1c\xc7\x69\x16\x2d\x5a\x04\xbb\xdd\x0e\x96\x65\x11\x1b\x1b\xfb\
+\x14\x22\x8a\xe2\x38\x31\x41\x10\xe0\x72\xb9\xfa\xdf\x79\xe7\x9d\
+\x82\xe6\xe6\x66\xdb\xb4\x04\x00\x60\xe5\xca\x95\xa5\xe5\xe5\xe5\
+\x75\x46\xa3\x31\x41\x10\x04\x38\x1c\x0e\xf4\xf6\xf6\x82\xe3\x38\
+\xb4\xb6\xb6\xc2\x66\xb3\x81\xe7\x79\x9c\x3c\x79\x12\x49\x49\x49\
+\x13\x82\x05\x41\xc0\xd0\xd0\x50\xa0\xba\xba\x7a\xfd\xb1\x63\xc7\
+\x9a\x80\x09\xba\x60\xb2\xd1\xd4\xd4\xf4\x55\x4d\x4d\xcd\x86\xfb\
+\xf7\xef\xfb\x24\x12\x49\xa4\x45\x61\xfa\xe6\x1a\xf2\x5c\x4d\x58\
+\x0d\x2b\xe4\x81\x00\xce\x9d\x3b\x07\x9e\xe7\x31\xba\x35\x23\xd3\
+\xe9\x74\xda\xaf\x5e\xbd\x5a\x16\x81\x03\x00\x3d\x5d\x01\x00\xc8\
+\xc9\xc9\x91\x07\x02\x01\x99\xd5\x6a\x85\xd1\x68\xc4\xed\xdb\xb7\
+\xd1\xd3\x7a\x05\x9f\xbe\x4a\x70\xcf\x1e\xc6\xc3\xae\x61\x58\x1f\
+\x3c\xc0\xd9\xb3\x67\xb9\xc2\xc2\xc2\xc1\x99\x33\x67\x7a\x87\x87\
+\x87\x5d\x7e\xbf\xbf\x77\x70\x70\xf0\x72\x65\x65\xe5\x97\x66\xb3\
+\xd9\x31\xfa\x99\xd3\x2e\xc1\xe1\xc3\x87\xd7\x96\x96\x96\xd6\xfa\
+\xfd\xfe\x68\xbf\xdf\x8f\xbb\x77\xef\xa2\xba\xba\x1a\x00\x50\x9e\
+\xcd\xa1\x50\x47\x70\xd6\x32\x03\xac\x21\x1f\x1e\x8f\x07\x1d\x1d\
+\x1d\xfd\x2c\xcb\xae\x0b\x04\x02\x6d\x32\x99\x4c\xe8\xea\xea\x0a\
+\x4d\x74\x27\x4c\x4b\xe0\xd0\xa1\x43\xaf\x95\x94\x94\x9c\x0a\x87\
+\xc3\xd2\xe8\xe8\x68\xd4\xd5\xd5\xc1\xeb\xf5\xa2\xbb\xbb\x1b\xdf\
+\x7f\xff\xfd\x33\xb1\xeb\x32\xe5\x98\x4d\x11\x7c\xed\x8d\x43\xbb\
+\xd3\xe9\x8e\x89\x89\x59\xd5\xdd\xdd\x7d\x63\xb2\x67\x4f\x59\x82\
+\x8a\x8a\x8a\xdf\x14\x15\x15\xfd\x9e\xa6\x69\x8a\x65\x59\xd8\x6c\
+\x36\xb4\xb4\xb4\x20\x3e\x3e\x1e\xa9\xa9\xa9\x00\xf0\x8c\xc4\x1b\
+\xf3\xfd\x40\x90\x82\xde\x16\x02\x90\x30\xb3\xdd\xe9\x6c\x34\x1a\
+\x8d\x2f\x5b\xad\xd6\xb6\x1f\x24\x40\x08\xa1\x0e\x1f\x3e\x7c\xa4\
+\xa0\xa0\xe0\x50\x5c\x5c\x9c\x84\x61\x18\x08\x82\x00\xbd\x5e\x0f\
+\x95\x4a\x05\x97\xcb\x05\x00\xe3\x24\xbe\xb0\x00\x07\x8b\x44\x00\
+\x21\x00\x8f\x00\x24\xcc\x68\x77\x3a\x9b\xd2\xd2\xd2\x56\x75\x75\
+\x75\xfd\x7b\x1c\x67\xa2\x12\xa4\xa4\xa4\xc8\xca\xca\xca\x2a\xb2\
+\xb3\xb3\xf7\xcf\x99\x33\x87\x44\xe0\x82\x20\x80\xe7\x79\x38\x9d\
+\x4e\x9c\x3f\x7f\x1e\x9d\x9d\x9d\x90\xc9\x64\x48\x4c\x4c\x7c\x5a\
+\x0e\x02\x60\x5f\x01\x8f\x37\x17\x12\xdc\xb3\x13\x98\x6c\x0c\xea\
+\x9d\x1a\xdc\x79\xf4\xc8\xab\x50\x28\x56\xde\xbf\x7f\xff\x9b\xd1\
+\xac\x71\x6d\xa8\xd5\x6a\x63\x36\x6f\xde\xfc\x51\x66\x66\xe6\x7e\
+\xbd\x5e\x4f\xa2\xa2\xa2\x40\x08\x01\x45\x51\xa0\x28\x0a\x52\xa9\
+\x14\x2a\x95\x0a\x1b\x36\x6c\x08\x33\x0c\xf3\xa5\xcb\xe5\x82\xdd\
+\x6e\x47\x6a\x6a\x2a\x92\x92\x92\x20\x02\xf8\xd0\x44\xe3\x83\x1b\
+\x22\x7e\x92\x28\xa2\x20\x39\x84\x57\x13\x1e\x61\x9e\x46\xa3\x1a\
+\x18\x18\xf8\xcb\xdc\xb9\x73\x0b\x47\xf3\x9e\x29\x41\x76\x76\xb6\
+\x7a\xc7\x8e\x1d\x1f\x1b\x0c\x86\x5f\xa9\xd5\x6a\x84\x42\x21\x10\
+\x42\x10\x91\x90\x48\x24\x08\x85\x42\x70\xbb\xdd\xc2\xf5\xeb\xd7\
+\x2b\xfb\xfb\xfb\xcf\xf9\xfd\xfe\xe7\x00\x24\x8c\x2d\xc7\x87\x26\
+\x1a\x00\x8f\x37\x17\x62\x6c\x39\x2e\xcf\x9d\x3b\xf7\x17\x9d\x9d\
+\x9d\x5f\x3f\x53\x82\x9c\x9c\x9c\x84\xb5\x6b\xd7\xd6\x24\x26\x26\
+\xfe\x4c\xa5\x52\x41\x2e\x97\x83\x61\x18\x44\x45\x45\x21\x2a\x2a\
+\x0a\x0c\xc3\x00\x00\x7a\x7a\x7a\xc4\x9b\x37\x6f\x56\xbd\xfb\xee\
+\xbb\x07\x09\x21\x92\xe4\xe4\xe4\xac\x40\x20\xf0\x57\x85\x42\xa1\
+\x8d\x8f\x8f\x9f\x56\x39\xda\x9d\x4e\xaf\x5a\xad\x5e\x7e\xef\xde\
+\xbd\x36\xfa\x09\x5c\xbf\x7e\xfd\xfa\x3a\x95\x4a\xf5\x02\x00\x04\
+\x02\x81\xc8\x85\x02\x9e\xe7\xc1\xf3\x3c\x82\xc1\x20\xec\x76\x3b\
+\xee\xdc\xb9\xf3\x69\x55\x55\xd5\x41\x00\x10\x45\x51\x20\x84\x98\
+\x8d\x46\xe3\x2f\xfd\x7e\xff\x25\x00\x9a\xe9\x64\x82\x10\xad\xaa\
+\xdd\xe9\xbc\x98\x91\x91\x91\x4f\x13\x42\xe8\x23\x47\x8e\x9c\x8b\
+\x8d\x8d\x7d\x61\x78\x78\x18\xe1\x70\x18\xe1\x70\xf8\x29\x38\xf2\
+\xf7\xda\xeb\xf5\xc2\x62\xb1\xfc\xa9\xaa\xaa\x6a\xe7\xe8\xb2\x89\
+\xa2\x28\x12\x42\x6e\xe8\xf5\xfa\x97\xfd\x7e\x7f\x13\x00\xed\x54\
+\x12\x66\x3e\x88\xa0\x2a\xb3\xaf\xa5\xa5\xc5\x4d\x67\x65\x65\x29\
+\x94\x4a\x65\xbe\xd7\xeb\x8d\xd4\xf9\xae\x44\x22\x49\xe7\x79\x3e\
+\x8a\xe7\x79\x84\x42\x21\x70\x1c\x07\x9b\xcd\xd6\x74\xe1\xc2\x85\
+\x6d\xef\xbd\xf7\xde\xb8\xae\x79\x92\x89\x5b\x69\x69\x69\xab\x9f\
+\x48\xc4\x4f\x24\xf1\x98\xe7\xa0\x57\x10\xfc\xdd\x8d\x07\x4c\x6c\
+\x70\xdd\xd3\x33\x50\x51\x51\x71\x93\x65\xd9\x3c\x87\xc3\x01\x93\
+\xc9\x94\xba\x6c\xd9\xb2\xb3\x00\x96\x32\x0c\x03\xa9\x54\x0a\xb7\
+\xdb\xfd\x8f\xca\xca\xca\x17\x45\x51\x0c\x8f\xa3\x8f\x1a\x84\x10\
+\x49\x7a\x7a\xfa\x4f\x7d\x3e\xdf\x25\xa5\x52\x99\x30\xf6\x4c\x00\
+\x80\x54\x2a\xed\x1c\x19\x19\x79\xde\xe7\xf3\x79\x9f\x76\x81\xcd\
+\x66\xdb\x3f\x7f\xfe\xfc\x46\xa5\x52\x29\x2f\x28\x28\xe8\x1e\x18\
+\x18\x00\x4d\xd3\xa0\x28\x0a\x43\x43\x43\xdf\x36\x37\x37\xaf\x9e\
+\x0a\x3e\x2a\x13\x37\x0c\x06\xc3\x0a\xbf\xdf\x7f\x65\x6c\x26\xfa\
+\xfa\xfa\x2c\xa2\x28\x2e\x8e\xc0\x9f\x0a\xf4\xf4\xf4\x5c\x93\xcb\
+\xe5\x6b\x32\x33\x33\x1b\x18\x86\x91\xfb\x7c\x3e\xb0\x2c\x0b\x9e\
+\xe7\x3b\x1a\x1a\x1a\x96\xdd\xba\x75\xcb\x3f\x15\x7c\x94\x84\x48\
+\x08\xb9\x9d\x9e\x9e\xfe\x8a\xcf\xe7\xbb\x10\x91\xd0\xeb\xf5\xdf\
+\x05\x83\xc1\xa5\x66\xb3\xd9\xf5\x4c\xd6\x22\x6d\x48\x08\x91\x94\
+\x97\x97\x97\x26\x27\x27\x7f\xa4\x54\x2a\x93\x7d\x3e\x9f\xa5\xb5\
+\xb5\x75\x79\x63\x63\xa3\x63\x3c\x66\xea\x41\x08\x91\x18\x0c\x86\
+\xdc\x91\x91\x91\x8b\x71\x71\x71\x9e\x70\x38\x5c\x6a\xb1\x58\xc6\
+\x6d\xe4\x99\x9f\x62\x42\x08\x49\x4b\x4b\x63\x64\x32\x99\xe6\xf1\
+\xe3\xc7\x8f\x26\xbb\x42\x7f\x80\x04\xc9\xcb\xcb\x9b\x19\x0e\x87\
+\x47\xda\xdb\xdb\x87\x27\x8a\xf9\x1f\x27\xb8\x88\xcb\x85\x50\xc5\
+\x5d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0e\x4a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\x48\x00\x00\
+\x00\x48\x00\x46\xc9\x6b\x3e\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x0c\x42\
+\x49\x44\x41\x54\x68\xde\xed\x9a\x7d\x6c\xd5\xd7\x79\xc7\x3f\xe7\
+\x9c\xdf\xef\xfe\xee\xbd\xf8\xda\x5c\x5e\x6c\x0f\xfc\x32\x1a\xd7\
+\xd0\x80\x33\x12\x2a\xb2\x41\x18\x21\xca\xdc\x04\x10\xa3\x0d\xac\
+\x62\x49\x34\x16\xa9\x89\xa2\x54\x50\xb5\x51\x44\x93\x4a\x49\x15\
+\xb5\xcb\x3a\x4d\x61\x68\xd9\x1a\x2d\x51\xa5\xa6\x6a\x57\x2d\x59\
+\x32\x5e\x1a\xda\x94\xaa\xb0\x40\x82\xb3\x18\xec\x05\xf3\x62\xe3\
+\x60\xb0\xb1\x31\x06\x5f\xfb\xbe\xfd\xde\xcf\xfe\x30\xf7\xca\x76\
+\x8c\x71\x42\x48\x34\xa9\x8f\xf4\x48\x57\xbf\xf3\x7b\x79\xbe\xe7\
+\xfb\x3c\xcf\x79\xce\x73\xae\xd0\x5a\xf3\xff\x59\xe4\xe7\x6d\xc0\
+\x1f\x00\x7c\xde\x06\x5c\xaf\x18\x00\xa1\x10\x88\x71\x03\x21\xa0\
+\x80\x63\xd3\xa7\xf3\xf4\xca\x95\x78\x52\x22\xb5\x66\x74\xcc\x4c\
+\xf4\x7b\x82\x6b\x7f\xa9\xb5\x7e\x5c\x6b\x5d\x2a\xa5\xdc\x01\xbc\
+\x3c\x99\x41\x5a\x6b\x0c\xc3\x60\xe9\xd2\xa5\x98\xa6\x89\xd6\x9a\
+\x30\x0c\x8b\x1a\x04\x01\xbe\xef\xe3\xba\x2e\x61\x18\x8e\x00\xb8\
+\x81\xf2\xb0\xef\xfb\xff\x6c\x9a\xa6\x69\x59\x16\x99\x4c\xe6\x25\
+\xc3\x30\x84\x10\xe2\xa5\x49\x67\xd5\x30\x10\x42\x4c\xe9\x03\x37\
+\xca\x85\x4c\xe0\x87\xae\xeb\xbe\x98\x48\x24\xcc\xc7\x1f\x7f\x9c\
+\xed\xdb\xb7\x53\x55\x55\x85\xeb\xba\xdb\x81\xc6\xab\x3d\xa8\xb5\
+\x26\x1a\x8d\xa2\x94\xfa\xdc\x00\x24\x80\x5f\xe6\xf3\xf9\xef\xd6\
+\xd4\xd4\xf0\xdc\x73\xcf\xb1\x6c\xd9\x32\x66\xcf\x9e\xcd\xd6\xad\
+\x5b\x29\x29\x29\x99\xe6\xfb\xfe\x2f\x80\x3b\xae\x06\xc0\xb2\x2c\
+\xa4\x94\x4c\x25\xc5\x7f\xda\x00\xe6\x01\xbf\xce\xe5\x72\x5f\x5d\
+\xbc\x78\x31\xcf\x3e\xfb\x2c\xb5\xb5\xb5\x64\x32\x19\xd2\xe9\x34\
+\xf5\xf5\xf5\x3c\xf6\xd8\x63\x00\x33\xc2\x30\x7c\x59\x08\xf1\x47\
+\x42\x08\x46\x2b\x50\x04\xf0\x59\x33\x70\x4f\x18\x86\xfb\x6c\xdb\
+\xfe\xb3\x35\x6b\xd6\xf0\xf4\xd3\x4f\x53\x5e\x5e\x4e\x36\x9b\xc5\
+\xf7\x7d\xf2\xf9\x3c\xe7\xce\x9d\x63\xc9\x92\x25\x3c\xf4\xd0\x43\
+\x04\x41\x50\xaf\xb5\x7e\x19\x98\x3e\xc6\x20\x29\x99\x36\x6d\xda\
+\x94\x66\xff\xd3\x04\x70\xbf\xe7\x79\xaf\x87\x61\x38\xef\x81\x07\
+\x1e\x60\xeb\xd6\xad\xc4\x62\x31\x32\x99\x0c\xf9\x7c\x1e\xc7\x71\
+\x00\x88\x46\xa3\x64\xb3\x59\xd6\xae\x5d\xcb\xfa\xf5\xeb\xb1\x6d\
+\xfb\x5e\x60\x87\x10\x42\x09\x21\xd0\x5a\xa3\x94\x22\x1e\x8f\x4f\
+\x19\xc0\xf5\x66\x21\x01\x7c\xd7\x75\xdd\x1f\xc4\xe3\x71\x1e\x79\
+\xe4\x11\x1a\x1b\x1b\x8b\x33\x1e\x86\x21\x96\x65\x61\x59\xd6\x98\
+\x87\x7c\xdf\xe7\xfe\xfb\xef\xa7\xa3\xa3\x83\xd6\xd6\xd6\x07\x63\
+\xb1\xd8\x59\xe0\x7b\x42\x08\x4c\xd3\x24\x1a\x8d\x7e\x26\x0c\x4c\
+\x03\x7e\xec\x38\xce\x0f\x66\xcd\x9a\xc5\xb6\x6d\xdb\x68\x6c\x6c\
+\x44\x6b\x4d\x10\x04\x44\x22\x11\x4a\x4a\x4a\x8a\x3a\x6d\xda\xb4\
+\xa2\x5a\x96\x45\x22\x91\x60\xcb\x96\x2d\x54\x57\x57\xe3\x38\xce\
+\x53\xc0\xe6\x02\x4b\x53\xf5\xff\xeb\x01\x50\xa9\xb5\xde\x6d\xdb\
+\xf6\xc3\x8b\x16\x2d\xe2\xc9\x27\x9f\x64\xe1\xc2\x85\xf8\xbe\x8f\
+\xd6\x1a\xd3\x34\xb1\x2c\x0b\xd3\x34\x51\x4a\x61\x9a\x26\x91\x48\
+\x64\x8c\x02\xd4\xd4\xd4\xb0\x6d\xdb\x36\x2a\x2b\x2b\xf1\x3c\x6f\
+\x47\x18\x86\x8d\x91\x48\x64\xca\x19\x08\x3e\x99\x0b\x2d\x0e\xc3\
+\xf0\xe7\xae\xeb\x7e\x69\xd5\xaa\x55\x6c\xdc\xb8\x91\x44\x22\x51\
+\xfc\xa8\xef\xfb\x28\xa5\xb8\x78\xf1\x22\x2d\x2d\x2d\x9c\x3f\x7f\
+\x9e\x59\xb3\x66\x91\x4c\x26\x8b\xb1\x00\x23\x8b\x55\x81\x89\xbb\
+\xef\xbe\x9b\x3d\x7b\xf6\x24\x3c\xcf\xfb\xb7\x58\x2c\xb6\x5e\x29\
+\xf5\xbf\x41\x10\x08\xc0\xd3\xe3\x56\xff\xeb\x05\xb0\x29\x08\x82\
+\xed\x52\xca\xf2\x0d\x1b\x36\xb0\x7c\xf9\x72\xa4\x94\xc5\xa0\xf3\
+\x3c\x0f\x29\x25\x43\x43\x43\x1c\x38\x70\x80\xbd\x7b\xf7\x32\x7b\
+\xf6\x6c\xca\xca\xca\x30\x4d\x13\x80\x30\x0c\x01\x08\x82\xa0\x68\
+\x98\x69\x9a\x34\x34\x34\xe0\xba\x6e\x4d\x18\x86\x07\x86\x86\x86\
+\xfa\x85\x10\x83\x52\xca\xcb\xc0\x80\x10\xa2\x0f\xe8\x01\xce\x02\
+\xa7\x84\x10\x27\x00\x67\x3c\x00\x09\xcc\x05\x92\x40\x0a\xe8\x03\
+\xdc\x51\x0b\xfa\x16\xd7\x75\x9f\x4f\x24\x12\x72\xd3\xa6\x4d\xcc\
+\x9d\x3b\x17\xc7\x71\xa8\xaa\xaa\x42\x6b\x8d\xeb\xba\x00\x28\xa5\
+\x18\x1c\x1c\xa4\xab\xab\x8b\x77\xdf\x7d\x97\xd5\xab\x57\x53\x53\
+\x53\x43\x43\x43\x03\xa5\xa5\xa5\x58\x96\x85\x61\x18\x28\xa5\xf0\
+\x3c\x8f\x7c\x3e\x8f\x6d\xdb\xe4\xf3\x79\xb2\xd9\x2c\x99\x4c\xa6\
+\x24\x97\xcb\x95\xe4\xf3\x79\x0a\x9a\xcd\x66\xc9\xe5\x72\xb8\xae\
+\x8b\xe7\x79\x81\x94\xb2\x4d\x6b\xbd\x4d\x6b\xfd\xab\x02\x80\x99\
+\x18\xc6\x76\xea\xea\x36\x52\x52\x22\xc2\x0b\x17\x82\xb0\xb7\xb7\
+\x43\xf9\xfe\x6e\x29\xc4\xaf\x34\xac\x77\x5d\xf7\x3b\x55\x73\xe6\
+\xb0\x69\xd3\x26\x3c\xcf\x23\x95\x4a\xb1\x64\xc9\x92\xa2\xdf\x17\
+\x44\x6b\x8d\x94\x92\x8a\x8a\x0a\x32\x99\x0c\x9d\x9d\x9d\xa4\x52\
+\x29\xf6\xef\xdf\x8f\x61\x18\xcc\x98\x31\x83\x64\x32\x49\x22\x91\
+\x20\x16\x8b\x11\x8b\xc5\xb0\x2c\x8b\x48\x24\x82\x65\x59\x94\x96\
+\x96\x92\x4c\x26\xc7\xb0\x14\x86\x21\x8e\xe3\x30\x38\x38\x48\x7f\
+\x7f\xbf\xea\xec\xec\x6c\xc8\x64\x32\x2f\x0a\x21\x16\x09\xad\x35\
+\x9e\x10\x7f\xaf\xbe\xf5\xad\x27\xe4\xa3\x8f\x82\x6d\x43\x36\x0b\
+\x1d\x1d\xa4\x5e\x7b\x8d\x17\xba\xbb\xc3\xfd\x95\x95\x62\xc1\x17\
+\xbe\x20\xee\xbb\xef\x3e\xba\xbb\xbb\xf1\x7d\x9f\xbb\xee\xba\x8b\
+\x58\x2c\x46\x10\x04\x63\x7c\x4c\x4a\x49\x3a\x9d\x26\x95\x4a\xb1\
+\x77\xef\x5e\xde\x7f\xff\x7d\xaa\xab\xab\x49\x26\x93\x48\x29\x19\
+\x18\x18\x60\x78\x78\x18\xcf\xf3\xc6\x00\x1f\x5d\xbc\x15\xea\x21\
+\xcb\xb2\x50\x4a\x15\xb3\x92\x52\x8a\x30\x0c\x49\xa5\x52\xf8\xbe\
+\x7f\x5c\x4a\xb9\x54\x68\xad\xc9\x97\x94\xb4\x46\x5f\x7d\xb5\x41\
+\x94\x96\x8e\x18\x1f\x04\xf4\x0e\x0f\xf3\xa3\x03\x07\x38\xfa\xe1\
+\x87\xfc\xc5\xf2\xe5\xfc\xf9\x8a\x15\x1c\x6d\x69\x21\x97\xcb\xb1\
+\x66\xcd\x1a\x66\xcd\x9a\x85\xef\xfb\x13\x06\x8a\xd6\x9a\x74\x3a\
+\x8d\xe3\x38\x5c\xbe\x7c\x99\x5c\x2e\x47\x79\x79\x39\x55\x55\x55\
+\xa4\x52\x29\xba\xba\xba\xe8\xed\xed\x25\x97\xcb\x15\xcb\x63\xcf\
+\xf3\xf0\x7d\x9f\x30\x0c\x49\x24\x12\xb4\xb4\xb4\x70\xf9\xf2\x65\
+\x0c\xc3\x38\x29\x84\x78\x0b\x88\x5d\x79\x7d\x4a\x4a\xd9\x2e\xa5\
+\xdc\x23\xa5\xec\x36\x00\xbc\x20\x10\xd6\x99\x33\x88\x64\x12\x6c\
+\x9b\x6c\x36\xcb\xdf\xbd\xf3\x0e\xa7\x86\x86\xf8\xab\xb5\x6b\x69\
+\x68\x68\xa0\xad\xad\x8d\x74\x3a\xcd\x6d\xb7\xdd\x46\x32\x99\xc4\
+\xb6\xed\x49\xa3\x3d\x1e\x8f\x63\x9a\x26\xb1\x58\x0c\x21\x44\x91\
+\xad\xb2\xb2\x32\x6e\xb9\xe5\x16\x6a\x6b\x6b\xe9\xed\xed\xa5\xaf\
+\xaf\x0f\xdb\xb6\x11\x42\xa0\x94\x42\x08\x81\x65\x59\x04\x41\xc0\
+\xa1\x43\x87\xd0\x5a\x57\x4a\x29\x7f\x29\xa5\x7c\x7b\xa2\xef\x48\
+\x00\xc7\xb6\x8f\x79\xef\xbc\x03\xfd\xfd\xd0\xdb\xcb\xff\xb4\xb7\
+\x73\x6c\x60\x80\xaf\xac\x5a\xc5\x9d\x77\xde\x49\x67\x67\x27\xf9\
+\x7c\x9e\xb9\x73\xe7\x72\xd3\x4d\x37\x61\xdb\x36\xbe\xef\x4f\xaa\
+\x41\x10\xa0\x94\x22\x12\x89\x60\x9a\x26\x9e\xe7\xe1\xba\x2e\xb6\
+\x6d\xe3\x38\x0e\xf1\x78\x9c\xba\xba\x3a\x6e\xbd\xf5\x56\xea\xeb\
+\xeb\x29\x2b\x2b\xc3\xf3\x3c\xb2\xd9\x2c\xa9\x54\x8a\x64\x32\xc9\
+\xa2\x45\x8b\x10\x42\x94\x85\x61\xf8\x52\x10\x04\xf3\xc3\x30\xfc\
+\x48\x4a\x35\x18\xc9\x47\xfb\x73\xcd\xcd\x5f\xb7\x2a\x2b\x21\x9f\
+\x67\x5a\x26\x83\x15\x8b\x71\xfa\xcc\x19\x8e\x1c\x39\x42\x45\x45\
+\x05\xb3\x67\xcf\xa6\xa2\xa2\x02\xa5\xd4\x55\x5d\xe7\xe3\x48\x21\
+\x76\xa2\xd1\x28\xd5\xd5\xd5\xcc\x99\x33\x87\xe1\xe1\x61\xce\x9f\
+\x3f\xcf\xa5\x4b\x97\xc8\x66\xb3\x54\x55\x55\x61\xdb\x36\xed\xed\
+\xed\xf3\xa5\x94\x3f\x03\x56\x6b\xad\x2f\x6a\xad\x29\xd4\x4e\x42\
+\x6b\xcd\x19\x21\x1a\x8c\x92\x92\xf7\xe6\xdc\x73\x8f\x25\xa5\x44\
+\xdb\x36\xff\x68\xdb\xfc\x36\x1e\x47\x09\x41\x59\x34\xca\xbc\x79\
+\xf3\xb8\xf7\xde\x7b\x99\x3b\x77\x2e\x9e\xe7\x5d\x37\x80\x09\xdd\
+\x41\x4a\x84\x10\xb8\xae\xcb\x85\x0b\x17\x8a\x01\xdf\xd4\xd4\x44\
+\x4f\x4f\x0f\x96\x65\xed\x02\x36\x00\x6e\x31\xf8\xb5\xd6\x74\x08\
+\x41\x08\xbb\x2a\xe6\xcf\x5f\x5b\x56\x51\x01\x8e\xc3\xe5\xee\x6e\
+\x7e\xa3\x75\xee\x77\x0d\x0d\xbf\x39\x5f\x56\xb6\x48\x67\xb3\x75\
+\x35\xd5\xd5\x6c\xde\xbc\x99\x99\x33\x67\xde\x30\x10\x85\x6c\x54\
+\xc8\x38\xae\xeb\x72\xee\xdc\x39\x76\xef\xde\x4d\x4f\x4f\x0f\x91\
+\x48\xe4\x05\xe0\x9b\x85\xfb\xd5\x33\xcf\x3c\x43\xdf\xf7\xbf\x8f\
+\x0f\x8e\x9f\xcb\x7d\x3d\x19\x86\x90\x4a\x11\x73\x5d\x92\xfd\xfd\
+\xe6\x1f\x77\x75\xbd\xee\x44\xa3\xeb\xfb\x2b\x2b\x23\xc3\x97\x2e\
+\xad\xe8\xe9\xe9\xa1\xbe\xbe\x1e\xcb\xb2\x28\xf8\xe4\x8d\xd0\x20\
+\x08\x08\xc3\x10\xa5\x14\xe5\xe5\xe5\xcc\x9b\x37\x8f\x8e\x8e\x0e\
+\xd2\xe9\xf4\x52\xa5\xd4\x65\xa0\xa9\xc8\xc0\x51\x21\xd0\x30\x5d\
+\x08\xd1\x54\x1f\x89\x7c\x31\x1e\x86\x10\x04\x0c\x6b\x4d\x87\xd6\
+\x29\x47\xa9\x65\xbf\x58\xb9\xf2\xf8\xd9\xf2\xf2\x5f\x87\xd9\x6c\
+\xe3\xe2\xc5\x8b\xd9\xb0\x61\x43\x71\x96\x3e\x0b\x89\x44\x22\x9c\
+\x3e\x7d\x9a\x57\x5e\x79\x05\xc7\x71\x3c\xc3\x30\x36\x02\xff\x25\
+\xb9\xe2\x50\x1e\xa4\xf2\x5a\xff\xf8\xa2\xe3\x80\xe7\x41\x18\x52\
+\xaa\x35\x71\x98\x1e\x06\xc1\xb7\x57\x35\x37\x13\x73\xdd\xbf\x89\
+\xc4\x62\x4d\x2d\x2d\x2d\xec\xdb\xb7\xaf\xb8\x4a\x06\x41\x70\xc3\
+\x35\x9f\xcf\x53\x5b\x5b\xcb\xba\x75\xeb\x50\x4a\x99\x61\x18\xbe\
+\x0c\xdc\x51\x04\xe0\x02\x3e\xbc\x76\x1e\x2e\x8f\xce\xf0\x15\x80\
+\x0d\x6b\x67\xa6\x52\x95\xf5\x67\xcf\xf6\x79\xa6\xb9\x29\x62\x9a\
+\xa7\x0f\x1e\x3c\x48\x53\x53\x13\x42\x88\x31\x7d\x9b\x1b\xa9\xae\
+\xeb\xb2\x70\xe1\x42\x56\xac\x58\x01\x30\x53\x6b\xfd\x94\x64\x64\
+\xf6\xf1\x46\x00\x74\x65\x60\x6f\xdf\x28\x00\xa5\x40\x04\x2a\x73\
+\xb0\xfa\x4f\xda\xda\x98\x3e\x3c\xdc\xa9\x4d\xf3\x6f\x81\xc1\xb7\
+\xde\x7a\x8b\x93\x27\x4f\x22\xa5\xfc\x4c\x58\x28\xac\x2f\xb7\xdf\
+\x7e\x3b\xe5\xe5\xe5\x68\xad\x6f\x1a\xc3\xc0\x15\x16\xfe\xa5\x13\
+\xdc\x02\x0b\x0a\x98\x01\xe4\xe0\x4f\xe3\xb9\x1c\xf3\x3b\x3b\x09\
+\xa5\xfc\x6f\xa5\xd4\x13\xae\xeb\xf2\xe6\x9b\x6f\xd2\xdd\xdd\x8d\
+\x10\xe2\x86\x03\x00\x70\x1c\x87\xb7\xdf\x7e\x9b\x4b\x97\x2e\x21\
+\xa5\x3c\x31\x11\x80\x83\x29\x78\xfd\xec\x28\x16\xa6\x8d\x30\x54\
+\x97\x05\x51\x77\xf2\x24\xc9\xe1\x61\x42\xc3\x78\xc9\x34\xcd\xa7\
+\x86\x86\x86\xd8\xbd\x7b\x37\xa9\x54\xea\x86\xba\x53\xa1\x48\xdc\
+\xb5\x6b\x17\x07\x0f\x1e\x04\x68\x96\x52\x7e\x7b\x8c\x0b\x15\x34\
+\x80\xe7\x4f\x82\x93\x2b\x64\x00\x20\x84\x19\x0e\x98\xd2\xf7\xa9\
+\x3b\x75\x0a\x46\xf2\xf5\x0f\x4d\xd3\x7c\xb1\xbf\xbf\x9f\x7d\xfb\
+\xf6\x61\xdb\x76\x31\x05\x7e\x9a\x2a\x84\xa0\xaf\xaf\x8f\x37\xde\
+\x78\x83\xe3\xc7\x8f\x63\x9a\xe6\x4e\x21\xc4\x3d\x40\xc7\x48\x2d\
+\x34\x4e\x7d\x38\x3c\x08\xaf\x76\x8e\x62\xc1\x03\xc3\x03\x91\x07\
+\x2a\xba\xba\x48\xa4\x52\x84\x23\x65\xee\x77\x22\x91\xc8\x7f\x9e\
+\x3a\x75\x8a\x03\x07\x0e\xe0\x79\xde\xa7\x96\x99\xc2\x30\x44\x08\
+\x41\x7b\x7b\x3b\x3b\x77\xee\x2c\x2c\x64\xff\x2a\x84\xd8\x04\x5c\
+\x84\x2b\xb5\x90\xcb\x47\x25\x80\xe7\x3b\xe0\xab\x8b\x20\xee\x8f\
+\x00\xf3\x04\x68\x01\x18\x8e\xc3\xec\xbe\x3e\xd2\x33\x66\x20\x3c\
+\x2f\x0b\x3c\x6c\x9a\xe6\x17\x5b\x5a\x5a\x1a\xe2\xf1\x38\x4b\x96\
+\x2c\x61\xa2\xc2\xeb\xe3\x48\xa1\x53\x77\xec\xd8\x31\x0e\x1d\x3a\
+\x84\xe3\x38\x4e\x24\x12\xd9\x06\x6c\x1f\xfd\x5e\xa3\xe0\x42\x13\
+\xc8\xfb\x7d\xb0\xb7\x0b\xbe\xe6\x8e\x00\xb8\x60\x5c\xc1\x1a\x02\
+\xa5\x17\x2e\xa0\xe6\xcf\x1f\x71\x25\xad\x2f\x09\x21\x36\x1b\x86\
+\xb1\xa7\xa9\xa9\xa9\xb2\xa4\xa4\x84\xba\xba\xba\x4f\x5c\x6e\x28\
+\xa5\x08\x82\x80\xa3\x47\x8f\xd2\xdc\xdc\x8c\x10\xe2\x92\x61\x18\
+\xdf\x00\x5e\x1f\x7f\xef\x55\x19\xb8\x72\x7d\x4f\x3b\x7c\x2d\x02\
+\xd8\x70\x3a\x52\x98\x1d\x20\x36\x30\x80\x95\xcf\xe3\xc6\xe3\x88\
+\x91\xd5\xb8\x59\x08\xf1\x48\x10\x04\xff\xde\xd4\xd4\x14\x2b\x29\
+\x29\x61\xfa\xf4\xe9\x1f\xbb\x72\x35\x0c\x03\xc7\x71\x38\x7c\xf8\
+\x30\xed\xed\xed\x18\x86\xd1\x23\x84\x78\x40\x6b\xfd\xfb\x09\x99\
+\xd2\x5a\xb3\xfd\xea\xbd\xf8\x05\x0a\x5a\x80\x88\x03\xeb\x04\xec\
+\x2a\xce\x12\xf0\xe1\x97\xbf\x4c\xdf\xcd\x37\xa3\xc6\xce\xf4\x5f\
+\xfb\xbe\xff\xd3\x64\x32\xa9\x56\xae\x5c\x59\xdc\x9c\x4c\x45\x22\
+\x91\x08\xd9\x6c\x96\xc3\x87\x0f\xd3\xd7\xd7\x87\x52\x6a\x9f\x10\
+\x62\x33\xd0\x7d\xb5\x83\x95\x49\x19\x00\x7a\x35\x84\x1a\xda\x05\
+\xfc\x6e\xf4\x80\x06\xa2\xa9\x14\xe2\xa3\x7e\xfe\x73\xd3\x34\xbf\
+\x34\x38\x38\xf8\xbd\xa6\xa6\x26\x96\x2d\x5b\x56\xdc\x2a\x5e\x4d\
+\xb4\xd6\xc4\x62\x31\xfa\xfb\xfb\x79\xef\xbd\xf7\x18\x1e\x1e\xc6\
+\x34\xcd\x9f\x68\xad\xb7\x00\x99\x49\x19\xbb\x06\x80\x04\x23\x87\
+\x15\x3f\x05\xb2\xa3\x07\x7c\xc0\x1c\x1c\xc4\xf0\x3c\xb4\x52\x30\
+\x16\xc8\xb3\xa6\x69\xd6\xf6\xf6\xf6\x3e\xf8\xc1\x07\x1f\xb0\x60\
+\xc1\x82\x62\xdb\x65\xbc\xe1\x85\xed\xe6\x99\x33\x67\x68\x6d\x6d\
+\xc5\x75\x5d\xdf\x30\x8c\x1f\x01\xcf\x70\xd5\xf0\x1c\x07\x60\x92\
+\xbb\x6e\x06\x9a\x81\x1d\xe3\x07\x04\x20\xd2\x69\x44\x10\x10\x1a\
+\xc6\x78\x26\x5c\xe0\x51\xc3\x30\x2a\x4e\x9d\x3a\xd5\x68\x59\x16\
+\xd5\xd5\xd5\x64\xb3\xd9\x62\xbd\x5f\xe8\x44\x47\xa3\x51\x3a\x3a\
+\x3a\x68\x6b\x6b\x43\x08\x31\x6c\x18\xc6\x37\xb5\xd6\xaf\x5c\xcb\
+\xf0\x31\x00\x26\x49\x76\x87\x34\xdc\x07\x0c\x4f\x04\x20\x9c\x3c\
+\x4d\x66\x85\x10\xdf\x50\x4a\xfd\xbe\xad\xad\x6d\x5e\x34\x1a\xa5\
+\xb4\xb4\x94\x5c\x2e\x87\x10\xa2\xd8\xdc\x3a\x76\xec\x18\x5d\x5d\
+\x5d\x28\xa5\xce\x09\x21\x1e\x04\xf6\x4f\xd5\x78\xb8\x76\x73\x37\
+\x03\x9c\xbb\xea\xe8\x95\xd3\xcd\xf1\xa7\x2c\xa3\x4e\x5b\xce\x0a\
+\x21\x1e\xd6\x5a\x0f\xb7\xb6\xb6\x92\xcd\x66\x8b\x3d\x1e\x21\x04\
+\x2d\x2d\x2d\x05\xe3\x8f\x0b\x21\xd6\x7d\x5c\xe3\xa7\x02\xe0\x9a\
+\x22\xae\xec\x63\x27\xd1\xdf\x2a\xa5\x1e\xf4\x3c\xcf\x39\x71\xe2\
+\x44\xb1\x29\x70\xe4\xc8\x11\x06\x06\x06\x30\x4d\xf3\x3f\xa4\x94\
+\x77\x00\x47\x3f\xc9\xf7\xaf\xeb\x80\x23\x88\xc7\xd1\x4a\x4d\x94\
+\x89\xc6\xcb\x4e\xa5\xd4\x13\xe9\x74\xfa\x9f\x9a\x9b\x9b\x09\x82\
+\x00\xd7\x75\x51\x4a\xfd\x03\xf0\x14\x53\x08\xd6\x1b\x02\x20\x34\
+\x0c\xf4\x14\xcf\x73\x81\x1d\x4a\x29\x1c\xc7\xd9\x0c\xb8\x4a\xa9\
+\x9f\x69\xad\x5f\x60\xd2\x10\xbc\xb6\x88\x3f\xfc\x5b\xe5\x73\x96\
+\xff\x03\x78\xa9\x39\x37\xc6\x78\x8a\x32\x00\x00\x00\x25\x74\x45\
+\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\x32\x30\
+\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x36\x3a\x30\x38\x3a\x34\
+\x34\x2d\x30\x37\x3a\x30\x30\x76\x96\xce\x47\x00\x00\x00\x25\x74\
+\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\
+\x30\x31\x30\x2d\x30\x32\x2d\x32\x32\x54\x31\x33\x3a\x34\x38\x3a\
+\x33\x38\x2d\x30\x37\x3a\x30\x30\x28\x74\xc0\x74\x00\x00\x00\x25\
+\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\
+\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\x32\x32\
+\x3a\x31\x33\x2d\x30\x37\x3a\x30\x30\x98\xc8\x9f\x4a\x00\x00\x00\
+\x35\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\x74\
+\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\
+\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\x73\
+\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\x2f\x3b\xc1\xb4\x18\x00\x00\
+\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\x74\
+\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x36\x3a\
+\x30\x38\x3a\x34\x34\x2d\x30\x37\x3a\x30\x30\x29\x27\xb8\x73\x00\
+\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\
+\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\x79\
+\x71\xc9\x65\x3c\x00\x00\x00\x0d\x74\x45\x58\x74\x53\x6f\x75\x72\
+\x63\x65\x00\x4e\x75\x76\x6f\x6c\x61\xac\x4f\x35\xf1\x00\x00\x00\
+\x34\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\
+\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x63\x6f\x6e\x2d\
+\x6b\x69\x6e\x67\x2e\x63\x6f\x6d\x2f\x70\x72\x6f\x6a\x65\x63\x74\
+\x73\x2f\x6e\x75\x76\x6f\x6c\x61\x2f\x76\x3d\xb4\x52\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0c\x75\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
+\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x0a\x88\
+\x49\x44\x41\x54\x68\xde\xed\x99\x69\x6c\x5c\x57\x15\xc7\x7f\xf7\
+\xbe\x37\xf3\xc6\xe3\xf1\x78\xc6\xeb\x38\xa9\x1d\xdb\x49\xea\x38\
+\x01\xda\xa6\xa4\x4d\x4b\xdb\x20\xa0\x69\x4b\x69\xa8\x00\x81\x40\
+\xec\x4b\xa5\x7e\xa0\x80\x84\xc4\x22\xf8\x80\x58\xba\x7c\x43\x42\
+\x2d\xb4\x65\x29\x48\x2c\x55\x09\xa5\xa4\x2d\xab\x04\x69\xc3\x52\
+\x52\xc7\x71\x1c\x7b\xec\x7a\xbc\xc4\x76\xec\xb1\x3d\x63\x7b\xc6\
+\x9e\xf5\xbd\x77\xf9\x30\x8b\xc7\x13\x3b\x71\xdc\xd2\x14\xd1\x23\
+\x5d\xbf\xfb\xe6\x9d\x7b\xdf\xff\x7f\xee\x39\xe7\x9e\xfb\x0c\xaf\
+\xcb\xeb\xf2\xff\x2d\xe2\xbe\x07\xbe\x0d\x80\xa6\x69\x68\x9a\x76\
+\xa9\xf1\x6c\x48\x2c\xcb\xc2\xb2\x2c\x00\xf4\x96\x96\x16\x42\xa1\
+\x90\x27\x95\x4a\x35\x2a\x65\x3b\x2f\x35\xb8\x8d\x88\x10\x32\xa3\
+\x69\x5a\xb8\xbd\x7d\xfb\x92\x3e\x3c\x3c\x5c\xed\x76\xbb\xef\xae\
+\xae\xf6\xbd\xdf\x70\x1a\x15\x80\xba\xd4\x00\x2f\x84\x3f\x9d\x49\
+\x25\x17\x17\x17\x1f\x1f\x19\x19\x7e\x48\x37\x4d\xb3\xd9\xe7\xf3\
+\xdf\x79\xfd\xfe\xeb\xaf\xaa\xad\xad\xc7\x56\x36\xe2\x52\x43\x5c\
+\x47\x14\x20\x85\x60\x2e\x32\xc7\xdf\xff\x71\x2c\x13\x8f\xc7\x8f\
+\xe8\x4a\xd9\x4e\x97\xe1\x32\x6a\x6b\xeb\xf0\x78\x2a\x31\x4d\xf3\
+\x52\xe3\x3c\xaf\xe8\xba\x8e\x52\x0a\x97\x61\x18\x4a\x29\xa7\x5e\
+\xe0\x66\xdb\x36\xa6\x99\x7d\xcd\x13\x00\x85\xad\x56\xbc\x5c\xbf\
+\x98\xa1\x42\xac\x76\x2e\xa5\xd4\x05\xf5\xd6\xd3\xd9\xbc\xac\xc6\
+\xb0\x61\x02\xa6\x69\x12\x9e\x99\x25\x99\x4c\xe6\x06\xea\x3a\x81\
+\x40\x23\x15\x2e\x17\x05\x8c\x42\xe4\xf4\x16\x16\x63\x98\xa6\x89\
+\x43\xd7\xa9\xae\xae\x46\xd7\xcf\x4d\xcf\xb9\x31\x2f\x9f\xdc\x86\
+\x08\x48\x29\x19\x9f\x98\xe4\xa1\x87\x1f\xe5\xcc\xf8\x04\x42\x0a\
+\x2a\xdd\x6e\x3e\xf3\x89\x8f\x73\xdd\xfe\x6b\x4a\xf4\x04\x73\x91\
+\x28\x0f\xfe\xe0\x11\xa6\xa7\xc3\x5c\xb6\x75\x0b\x77\xdf\xf5\x69\
+\x1a\x1b\x1b\x50\x4a\xad\x22\xba\x9e\x5c\x2c\xb1\xf3\x10\x10\x80\
+\x42\x08\x81\x52\x8a\xbe\xfe\x20\xbd\xa7\xfb\x88\x2f\x2f\x23\x85\
+\x40\x08\xc1\xbf\xbb\xba\xb8\x7a\xef\x55\x18\x86\x81\x52\x39\xdd\
+\x4c\x26\x43\x68\x78\x84\xd1\xb1\x31\xd2\x99\x34\x99\x6c\x16\x21\
+\x24\x42\x28\x40\xe4\x5d\x4a\xe5\x1c\x41\x88\x22\x58\xa5\xc4\x1a\
+\xe4\x54\xd1\x05\xd7\x73\x45\x7d\x35\x64\x51\xe2\xbf\xb9\xbe\x10\
+\x82\x58\x7c\x89\x9e\xde\xd3\x2c\x27\x12\xe8\x9a\x86\x10\x02\xd3\
+\x34\x39\xdd\x17\x24\x3c\x33\x43\x5b\xeb\x36\x6c\xdb\x2e\xea\xaf\
+\x34\x89\xa6\x69\x64\xb3\x59\xa2\xf3\x51\xb2\x19\x93\x2a\xaf\x07\
+\x6f\x95\x17\x21\x59\x05\x5c\x4a\x41\x36\x9b\x25\x16\x8f\xb1\xbc\
+\x9c\x40\x29\x85\xbb\xa2\x02\x8f\xa7\x12\xa7\xd3\x59\xc4\x55\xbe\
+\x7a\x45\x02\x42\xe4\xfe\x94\x06\xa0\x10\x02\x29\x25\x93\x93\x67\
+\x09\x0e\x0c\x60\xdb\x36\x2d\xcd\xcd\x54\x55\x79\xe8\xeb\x0f\x32\
+\x3e\x31\x41\x70\x60\x90\xb6\x6d\xdb\x8a\xba\x39\xe0\x2b\x16\x1c\
+\x19\x1d\xe3\xc8\x33\xcf\x72\xbc\xeb\x04\xa9\x54\x8a\x96\xe6\x66\
+\x6e\xbf\xed\x16\xae\xdd\xb7\xaf\x18\x1b\x4a\x29\x46\xc6\xc6\xf8\
+\xeb\xdf\x8e\xd2\xdd\x73\x8a\x48\x34\x8a\x52\x0a\x6f\x55\x15\x7b\
+\xaf\xbc\x82\xf7\xbc\xfb\x10\x35\x35\xfe\xfc\x2a\x9c\x27\x88\x73\
+\x2f\x5e\x01\x20\x84\xc0\xb6\x6d\x4e\xf7\xf7\x33\x35\x1d\x46\xd3\
+\x34\xf6\x5d\xbd\x97\xad\x5b\xb7\x30\x3a\x3a\x46\x3c\x1e\xa7\xa7\
+\xb7\x97\x9b\x6e\xbc\x01\x4f\x65\x65\x71\x4c\xe1\x1a\x9d\x5f\xe0\
+\xc7\x8f\xfd\x8c\xc9\xa9\xb3\x64\xb3\x26\xa9\x54\x8a\xe1\x91\x51\
+\xce\x8c\x8f\xe3\x32\x0c\xde\x7c\xf5\x5e\x84\x10\x04\x07\x06\x79\
+\xf8\x87\x3f\xe2\x78\xd7\x09\x32\x99\x0c\x4e\xa7\x13\xc3\x30\x98\
+\x98\x98\x60\x79\x39\xc1\xdb\xde\x7a\x80\xba\xba\x5a\x2c\x2b\xbf\
+\xca\x6b\x13\x28\x5d\xfa\x95\xfb\x78\x3c\xc6\x89\xee\x93\xa4\x52\
+\x29\xbc\x5e\x2f\x6f\xbe\x7a\x2f\x5b\x9a\x02\x3c\xfd\xec\xef\x19\
+\x18\x1c\xa2\xaf\x3f\xc8\xd4\xf4\x34\x1d\x3b\x77\x16\xe3\x00\x04\
+\x08\x41\x2c\x16\x63\x4b\x53\x80\xbb\x3e\xf5\x49\xdc\x15\x15\xfc\
+\xe1\xcf\x7f\xe1\xc5\x17\xbb\x18\x1e\x19\xe5\xd9\x3f\xfe\x89\x5d\
+\xbb\x76\xa1\x69\x1a\xbf\x3d\x72\x84\x7f\xfd\xfb\x38\xb6\x6d\xd3\
+\x71\xf9\x4e\x6e\x3d\x78\x33\x5b\x9a\x9a\x98\x9d\x9b\x65\x76\x76\
+\x0e\x97\x61\xac\xc2\x77\x9e\x20\x16\xab\x56\x41\x08\xc1\xe8\xd8\
+\x19\x06\x06\x5f\x02\xa0\xb5\xa5\x85\xdd\x9d\xbb\xf0\xfb\x7c\xec\
+\xe9\xec\x24\x34\x3c\xc2\xc4\xe4\x24\x7d\x7d\x41\x2e\xdf\xb1\x23\
+\xef\x42\x45\xe7\xa6\xb2\xb2\x92\x0f\xbc\xef\xbd\xdc\x7a\xcb\x41\
+\xa4\x10\xf8\xfd\x7e\x46\x47\x47\x99\x9a\x0e\x13\x1c\x18\x24\x1c\
+\x0e\x23\xa5\x46\xd7\x89\x6e\x4c\xcb\xa2\xb6\xc6\xcf\x47\x3f\xfc\
+\x21\xde\x76\xe0\x00\x9a\x26\xb1\x2c\x8b\x44\x32\x89\xc3\xe1\x80\
+\xa2\x71\x0a\x09\x26\x27\xb2\x3c\xef\x94\x06\xa1\x65\x59\x74\xf7\
+\xf4\x10\x8d\x46\x91\x52\x52\x5f\x5f\xc7\xdc\x5c\x84\x33\xe3\xe3\
+\xf8\x6b\xfc\x38\x9d\x4e\x12\x89\x24\x5d\xdd\xdd\x2c\x27\x12\x79\
+\x02\x05\xfc\x8a\x6a\xaf\x97\x1d\x3b\xb6\xa3\x49\x89\x94\x92\x6d\
+\xcd\xcd\xd4\xd7\xd5\xa3\x94\x22\xbe\xb4\xc4\xc2\xc2\x22\x91\x68\
+\x94\xc5\x58\x1c\x14\x04\x1a\x1b\xd9\xd3\xd9\x89\xa6\x69\x28\x05\
+\x52\x6a\x54\xba\x2b\x71\x3a\x9c\xf9\xf8\xcc\xbb\xa8\x58\x6f\x05\
+\xf2\xcb\x9f\x0b\xc8\x5c\x4e\x3f\xd9\x73\x2a\x9f\x0a\x05\xdd\x27\
+\x7b\x18\x1d\x1d\x03\x01\x89\x44\xb2\x58\x93\xf7\x05\x83\x4c\x4c\
+\x4c\xe2\xdb\xe3\x5b\x95\x26\xa4\x94\xe8\x9a\x5e\x34\x88\xa6\x6b\
+\x48\x2d\x67\x33\x65\xe7\x52\xa4\xad\xf2\xa9\x52\xe4\x36\x47\x5d\
+\xd7\x8b\xa9\xbb\x10\x4b\x05\xd7\x5c\x2b\x93\xca\x72\xfc\x2b\x41\
+\x28\x19\x0a\x85\x08\x0d\x8f\xe4\x37\x21\x45\x24\x3a\xcf\xd0\xc8\
+\x08\x43\xa1\x11\xa6\xa6\xa7\xb1\x2c\x0b\x21\x04\x33\x33\x33\x74\
+\xf7\xf4\x60\xdb\x36\x52\xc8\xe2\x3c\xf1\xa5\x25\xa6\xa6\xa7\xf3\
+\x87\x25\x9d\xd9\xb9\x08\xd1\xf9\x79\x84\x10\xb8\xdd\x6e\xbc\x5e\
+\x2f\x35\x7e\x3f\x95\x6e\x37\x02\x98\x99\x9d\xe5\xcc\xf8\x78\x8e\
+\xb8\xae\xa3\x69\x1a\x96\x65\xa1\x94\x5d\x24\x73\xc1\x18\x28\xe4\
+\xe4\x74\x3a\x4d\xcf\xa9\x5e\xa2\xf3\xf3\x48\x4d\x63\xf7\xae\x0e\
+\x76\x75\x74\x20\x8b\x41\x0a\x67\xcf\x9e\x2d\xa6\xc7\xae\x13\x27\
+\xb9\xfd\xb6\xdb\x90\x72\xc5\x26\xb1\x58\x8c\x27\x9f\x3a\x82\xae\
+\xeb\xb8\x0c\x17\xbf\x7b\xfa\x19\x66\x66\x66\x91\x52\xd2\xd6\xba\
+\x8d\xa6\xa6\x26\x34\x4d\xa3\xb3\xa3\x83\xa9\xe9\x69\xe6\xe6\x22\
+\xfc\xf2\xf1\x27\x48\xa7\xd3\x34\x36\x34\x12\x89\x46\x09\x87\xc3\
+\x5c\xbb\x6f\x1f\x8d\x8d\x0d\xd8\xb6\x5d\x0e\x75\xed\x9d\x58\x08\
+\xc9\xcc\xec\x2c\xdd\x27\x7b\x48\x24\x93\xf8\x7d\x3e\xee\xbc\xe3\
+\x0e\x6e\xbb\xe5\xe6\xe2\x68\x4d\x4a\x4e\xf7\xf7\x33\x3e\x31\xc9\
+\x50\x28\x44\x70\x60\x80\x50\x68\x98\xfa\xfa\x3a\x6c\x3b\x57\xdd\
+\x3a\x1c\x0e\x06\x5e\x7a\x89\x6f\xde\x7b\x7f\xbe\x8e\x8f\x90\x4e\
+\xa7\xa9\xaf\xaf\xe3\xe0\x3b\xde\x4e\x8d\xdf\x8f\x10\xf0\xee\x43\
+\xef\x62\x6c\x7c\x9c\xa1\x50\x88\xe7\xff\xfe\x0f\xfa\x83\x03\x78\
+\xaa\x3c\xc4\xe3\x4b\xd4\xd7\xd5\xb2\xbb\xb3\x93\xa6\xa6\xc6\x35\
+\x5d\x48\x3f\x17\xbc\xc8\xbb\x4b\x14\xa9\x69\x74\xec\xdc\x41\x4b\
+\x73\x33\x57\xbc\xe9\x8d\xb8\xdd\x95\xf9\xe5\xcc\x11\xd8\xde\xde\
+\xce\x5b\xae\xdb\x9f\xb7\xb0\x41\x78\x66\x86\xa6\x40\x23\xed\x6d\
+\xad\x38\x1c\x0e\x9a\x2f\xbb\x8c\xb7\x1e\xb8\x89\xa3\xcf\x3d\xcf\
+\xe9\xbe\x3e\xaa\x3c\x1e\x76\x6c\x6f\xe7\x8e\xdb\xdf\xc9\x81\x9b\
+\x6e\xcc\xaf\x96\x62\xff\x35\xfb\xd0\x35\x9d\xa7\x9e\x79\x9a\x60\
+\x70\x90\x58\x3c\xc6\xc2\xc2\x02\x2e\x97\x8b\xf6\xb6\x36\x3c\x9e\
+\xca\x95\x3a\xea\x42\x04\x0a\x19\xa4\x6d\x5b\x2b\x5f\xfc\xfc\x3d\
+\x28\x5b\x51\x51\x51\x41\x20\xd0\x98\xf7\x79\x00\x85\x65\x2b\xaa\
+\xaa\xaa\xf8\xd8\x47\x3e\xcc\x9d\x87\x0e\x21\x04\xf8\x7d\x3e\xbc\
+\x5e\x2f\x5f\xb8\xe7\xb3\x64\x32\x19\x0c\xc3\xa0\x29\x10\xe0\x86\
+\xeb\xf6\x33\x32\x3a\x46\x32\x99\x24\x10\x68\xa4\xa5\xa5\x05\xc3\
+\xe9\x2c\x16\x78\xba\xae\x73\xed\x35\xfb\xd8\xd5\x71\x39\x13\x93\
+\x93\x44\xe7\xe7\xb1\x6d\x9b\x6a\xaf\x97\x40\xa0\x91\xda\x9a\x9a\
+\x62\x1c\x5c\x70\x05\x72\xc5\x95\xa0\xba\xda\x8b\xdf\xef\xa3\x50\
+\x6e\x15\x8a\xb0\x52\x1b\x08\x21\x68\x6c\x68\xa0\x29\x10\x28\x30\
+\x47\x01\x6d\xad\xad\xab\x8c\xd1\xd0\xd0\x40\x43\x43\x43\xf1\xde\
+\xb6\xed\x92\xf9\x56\xc4\xe7\xab\xc6\xef\xf7\xad\x2a\xdc\x6c\xdb\
+\x2e\xd1\xdf\x00\x01\xa5\x72\xd9\x48\x29\x1b\xcb\x5a\x49\x65\x2b\
+\xee\x55\x78\x0e\x42\xa8\xe2\x0b\x4a\x8b\xad\xc2\xb8\xc2\x7d\x69\
+\xec\x9d\x5b\x5d\xaa\x62\x09\x9d\xd3\xb3\x8b\xf7\xe5\xa0\x95\x3a\
+\xb7\xd0\xd6\x0b\x16\x15\x42\xa0\xc9\xc2\xc1\xa3\xb4\x20\x5b\x4d\
+\xe0\xdc\xe7\xab\xfb\x17\x92\xf2\xaa\x72\xc5\x20\xa2\xa4\xe4\x3e\
+\x97\x40\xa1\xaf\x49\x6d\x55\x2a\xd5\x85\x10\x99\x54\x3a\x9d\x89\
+\x44\x23\x20\x04\xca\x2e\xe1\x28\x56\x5d\xd6\x83\x74\x41\xd0\xe7\
+\x17\x75\xe1\x27\x25\x2a\x52\x0a\x22\xd1\x39\x52\xa9\x74\x46\x08\
+\x91\xd1\x75\x5d\x1f\x5f\x58\x98\x3f\x7c\xf4\xb9\xbf\x49\xa7\xc3\
+\x61\xa8\xd7\xf8\x77\x21\x01\x22\x93\xcd\xa6\x97\x96\xe2\x87\x75\
+\x5d\x1f\xd7\x53\xa9\xe4\xa2\x94\xf2\xa1\x64\x32\xf9\x94\x52\xca\
+\xf9\x9a\xfd\x28\x54\x10\x05\x42\x88\x8c\x94\x72\x32\x95\x4a\xc5\
+\x04\xc0\xbd\xf7\x7f\x6b\xf5\x2e\xf7\x3f\x20\x52\x4a\xbe\xf2\xa5\
+\xaf\x6d\xde\xde\x4b\x5f\x5e\xb1\x08\x9b\xe5\x2e\x29\x86\x90\xe7\
+\xbe\xcd\x4d\x71\x51\xdf\x85\xca\xc4\x01\xb4\x00\x9e\x97\x19\x35\
+\x4b\xc0\x19\x20\xfb\x6a\x13\xa8\x46\xf1\x45\x8c\xca\x1b\x64\x55\
+\x40\x21\xf5\x75\x36\xfb\x72\xc9\xab\xd9\x26\x76\x7c\x5a\x92\x5e\
+\x7e\x1e\xc1\xd7\x81\xb9\x57\x9b\xc0\xa2\x6d\x73\x0c\x87\xe7\xa0\
+\xbe\xeb\xd6\x76\xbd\xf5\x1a\xc8\xc6\xc1\x4a\x9f\x7f\x94\x66\x80\
+\xa3\x0a\x73\xf4\x05\xcc\xee\x27\x86\x49\x2e\x1f\x93\x1a\x8b\x9b\
+\x05\xb1\x69\x02\xc7\xcf\x92\xbd\xa2\x8e\x5f\x5b\x0b\x11\xc3\x1a\
+\x3c\xf6\xb5\x8a\xda\xf6\x56\x87\xc7\x01\x8b\xfd\xeb\x93\xd0\x0c\
+\xa8\x7d\x13\xd9\xf8\x1c\x89\xc1\x63\xa3\xf6\x42\xe4\x3b\x9a\xe2\
+\xd7\x93\x4b\x9b\x73\x1f\xd8\xfc\x2e\x54\x1c\x77\xf4\x83\x78\x5a\
+\xfc\xf2\xe3\xae\xd6\x2b\xbf\x5a\xbd\xff\x3d\x01\x67\x45\x16\xb5\
+\x30\x04\xca\x2c\x51\x53\x20\x74\x84\x6f\x07\x99\xa4\x83\xd8\x3f\
+\x0f\x4f\xa5\xcf\x74\x7f\x3b\x9b\xb1\x7f\xd2\xfe\x39\x96\xc5\x9e\
+\xcd\xc2\x87\x8d\xfe\x4f\x49\x90\xcb\x19\x5a\xbe\xe9\xf9\xe6\xfc\
+\x71\x2f\x4a\x98\x6a\xa8\x4d\x0b\x9b\x24\xe3\x6f\x30\xb6\x5e\x55\
+\xe9\xa8\xd9\x0a\x42\x43\x38\xaa\x10\x4e\x2f\xc2\xf0\x21\xfd\x97\
+\x93\x4a\x38\x98\x3b\xf6\x9b\x99\xb9\x60\xd7\x77\x0f\x9f\xb6\x7f\
+\x7a\xe8\x49\x92\xdf\x78\x10\x49\xd9\xc9\xf0\x95\x24\x50\x00\xad\
+\x97\x34\x27\xb9\x0c\x64\x14\xae\xff\x9c\x46\x2d\x25\xd5\x70\xbb\
+\x9c\x15\x32\x15\xdb\xed\xda\xba\xbb\xc2\x51\x55\x8b\x50\x36\x42\
+\x33\x10\x95\x4d\x24\x97\x2c\xc2\x47\x0f\x47\xc7\x7b\xbb\x1e\x79\
+\xf4\x84\xf9\xd3\x07\x8e\x93\xc8\xcf\xa7\x95\x34\xc1\x45\x7a\xc5\
+\xf9\x08\xac\x05\xde\x91\x6f\xa5\x7d\x27\xe0\x3c\x15\xc1\x8e\x2c\
+\x5b\x23\x6d\x4c\x3b\x8c\x6c\xbc\xb3\x22\xd0\xee\xd4\xdd\x1e\xd0\
+\x5d\xa4\xe2\x29\xa6\x8e\x3e\x19\x0f\x75\xbd\xf0\xb3\x87\xbb\xb2\
+\x8f\x3d\xd6\x4f\x2c\x3f\x87\x2c\x69\x82\x57\x90\x40\xb9\xcb\x94\
+\xf6\x4b\x5b\x81\x98\x06\x38\x06\x17\xc8\x46\x96\xed\xd0\x76\x31\
+\xed\x72\x99\x4b\x3b\xdd\x81\x76\xa7\x95\x31\x99\x7a\xee\x77\x4b\
+\xa1\xae\x17\x7e\xf5\xfd\x17\xb3\x3f\x7a\x62\x88\x79\x56\x5c\xe6\
+\x7c\x60\xcf\x3d\x30\x5c\xe4\x0a\x14\x48\x94\x5b\xa6\xf0\xfb\x9a\
+\x2f\x1d\x5a\x24\xa1\x2c\x6b\xb0\x4d\xce\xb8\xf5\x44\x64\x67\x7c\
+\xb4\x3f\x3b\x76\xaa\xfb\x89\x9f\xf7\xa4\x1f\xf9\xc5\x4b\x84\xf3\
+\xa0\x2c\x72\xfb\x77\x69\x53\xeb\xfc\xb6\x69\x02\x8a\xd5\x56\x50\
+\x65\xad\xfc\x65\x66\x1e\x98\xd9\x1b\x61\xa1\xc1\x69\x06\x03\x66\
+\xd8\x11\x0b\x4f\x9d\xfa\xfd\x50\xf6\xfb\xdf\xeb\x61\xbc\xf0\xbc\
+\xac\x59\x6b\x5c\x37\x4c\x60\xa3\xfe\x56\xb0\x7a\xa9\xbf\x96\xfb\
+\x6e\x49\x65\x93\x3b\x89\x7e\x7a\x0f\x55\x52\xc0\xc3\xbd\xc4\xca\
+\x8c\xb0\x9e\xd5\xcb\x8d\xb6\x21\x60\x17\x2b\xe5\xee\x54\xe8\xcb\
+\x32\x9d\x02\xe0\xb5\x56\x15\x56\x4a\xc0\x8b\x02\xfc\x4a\x10\xb8\
+\xd8\x79\xff\xab\x07\xa4\xff\x00\x98\x4f\xc9\x02\x32\xee\xf8\x5f\
+\x00\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\
+\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\
+\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\
+\xca\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
+\x65\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
+\x30\x39\x3a\x31\x31\x3a\x33\x39\x2d\x30\x37\x3a\x30\x30\x7d\x15\
+\xa2\xc7\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
+\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\
+\x54\x30\x39\x3a\x31\x31\x3a\x33\x39\x2d\x30\x37\x3a\x30\x30\x0c\
+\x48\x1a\x7b\x00\x00\x00\x34\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\
+\x73\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
+\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\
+\x63\x65\x6e\x73\x65\x73\x2f\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\
+\x6a\x06\xa8\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\
+\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\
+\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\
+\xdd\x31\x7c\xfe\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\
+\x74\x53\x6f\x75\x72\x63\x65\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\
+\x6f\x6e\x20\x54\x68\x65\x6d\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\
+\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\
+\x74\x74\x70\x3a\x2f\x2f\x61\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\
+\x6f\x72\x67\x2f\x32\xe4\x91\x79\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x02\xa6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
+\x00\x00\x02\x6d\x49\x44\x41\x54\x78\x5e\x95\xd4\x4d\x48\x54\x51\
+\x14\x07\xf0\xff\x7d\x73\x07\xc1\x2c\x24\x50\x68\xe7\x26\x82\x04\
+\x9c\x55\x42\x50\x0e\xe4\x26\x97\x01\x6e\x8b\x06\x30\x68\xe5\x4e\
+\x20\xa7\x8d\x64\x53\x44\xb4\xd2\x00\x95\xf6\x05\x14\x60\x40\x04\
+\x45\xe2\x4a\x4a\x91\x2a\x2a\x40\x31\xc8\x22\x53\x07\xe7\xbd\x79\
+\x5f\xe7\xd4\xb9\xd3\x85\xe7\x34\x9f\x3f\xb8\xdc\x07\xf3\xde\xff\
+\x9d\x73\xee\x63\x14\x6a\x28\x14\x1e\xdd\x07\x90\x41\x02\x33\x56\
+\x27\x26\x2e\x8f\xa3\x0a\x33\xa3\x25\xf9\xfc\xec\xc2\xec\xec\x13\
+\xae\x36\x33\xf3\x98\x27\x27\x67\x16\xaa\x42\xeb\x2e\xfd\xe1\x41\
+\x7f\xb7\xa3\x70\x53\x29\x64\x5e\xff\x3a\xdf\xbd\xdf\xd5\x95\x19\
+\x1b\xbb\x04\xd7\x2d\x23\x69\x74\x74\x18\xf3\xf3\xcf\xae\x3c\xcc\
+\x5f\xcb\x64\x7b\xde\xec\x49\x07\x00\xc6\x51\xcf\x4a\xe1\xf4\xbb\
+\xed\xe5\xeb\x7c\xb0\x55\xe0\xbb\xd3\xb7\x79\x69\x69\x95\xb7\xb6\
+\x7e\xd4\x5c\xf2\xdb\x9d\x5b\xd3\xe6\xde\xed\xe5\xab\x2c\xcf\xd6\
+\xad\x18\xc7\x8e\x67\x7a\xcf\xf4\x41\x04\xb1\x0b\xb1\xb9\xf9\x1d\
+\xf5\x04\xb1\x8f\xce\x13\x47\xd0\xd9\x7b\x0a\xdf\xde\x7e\xca\xa0\
+\x0e\x1d\xb0\x06\x07\x65\x88\x0b\x43\x84\x97\xaf\x9e\xa2\x91\xe1\
+\x2c\x57\xee\xf7\x43\x04\x91\x83\x7a\xd4\x8b\x7b\xe7\x38\x9b\x1b\
+\x42\x23\xef\x37\x72\x68\x64\x65\xe5\x23\x72\xb9\x8b\x0a\x09\xda\
+\x75\x09\x14\x96\xd1\xcc\xc0\x40\x1f\xac\x20\x60\x44\x11\xe1\xe0\
+\xc0\x85\xe3\x38\x10\x73\x73\xcf\x39\x19\xae\x5d\x2f\x36\xad\xb5\
+\x23\x95\x52\x60\x76\xfe\xee\x0e\x98\x61\x0c\x0e\xf6\x27\xc3\x25\
+\x98\x40\x12\xdc\x26\xa5\x20\xc1\x52\xb9\x19\x85\x65\xc3\x75\xd9\
+\x37\xa3\x68\x3b\x54\x54\xc6\x40\x18\x19\x39\x8b\xfd\xfd\x12\x8a\
+\xc5\x12\xd6\xd7\xbf\x42\x68\x26\x3a\x34\x0a\xf6\x42\xc0\x0d\x81\
+\x28\x06\x88\x61\xf4\xd4\xaa\x56\x41\x29\x65\xf6\xdd\x5d\x0f\x9e\
+\x57\x36\xd7\x96\x66\x96\x51\xf8\x26\x84\x7f\x97\x80\x90\x5a\xae\
+\x58\xf6\x38\x66\x84\x61\x0c\xad\x53\x20\x72\x60\x69\x10\x81\x7c\
+\x0f\xbc\xe3\x02\x61\x8c\x66\x98\x81\x30\xb4\x5f\x85\x07\xdf\x8f\
+\xd0\xd1\x91\x06\xb3\x46\x1c\x53\x55\xc5\xbb\x45\x70\xc9\x6f\x29\
+\x54\x96\x54\xe9\xfb\xbe\xb9\x4e\xa7\x53\x10\x44\x6c\x46\x63\xc9\
+\x6b\x40\x3b\xc5\x96\x0f\x4d\xaa\x0d\x82\x00\xa2\xd2\x3e\x41\x48\
+\x07\x8e\x93\x9c\xb1\x1f\x81\x82\x10\xad\x20\x92\xe0\x48\x2a\xb3\
+\xcb\x7c\x19\x44\x6c\x0e\x2e\x8a\x18\x96\x86\x3d\xbc\xe6\xa4\x39\
+\x30\x73\xcd\x4e\xec\x8b\x2c\xfd\x73\xcf\x81\x57\x0a\xd0\x91\x26\
+\x34\x23\xa7\x6f\x49\x88\xad\xb2\x16\x3d\xb5\xf8\x59\xdd\x18\x39\
+\xc9\x3d\x47\x23\xd4\x93\x1d\xb2\xa3\x88\xff\x1d\x20\x9b\x45\xc4\
+\xf6\x50\xff\xa3\x65\x9b\x5a\xfc\xa2\xd0\xc0\xda\xda\x06\xc7\xf1\
+\xe1\xb6\x2b\xe1\xb6\xfa\xff\xc3\x35\x9a\x93\xff\x02\xb3\xda\xf1\
+\x07\xdd\xb7\xb7\x8c\xe3\x21\x45\x3c\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x0b\x54\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd6\x00\x00\
+\x0d\xd6\x01\x90\x6f\x79\x9c\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x09\xb4\
+\x49\x44\x41\x54\x68\xde\xd5\x5a\x5b\x6c\x9c\x47\x15\xfe\xce\xfc\
+\x97\xbd\xfc\xeb\xbd\x38\x17\x93\xd8\x8d\xed\x26\x0d\xb9\xbb\x8d\
+\x1f\x0a\x0f\x8d\xfa\x00\xe5\x22\x52\x10\x02\x81\x1a\x55\x11\x08\
+\x15\x15\xc1\x2b\xb4\x4f\x81\x27\xc4\x03\x52\x24\x10\x52\x05\x85\
+\x88\x46\x55\x69\xda\x50\x1a\xa9\x34\x79\x29\xa2\xaa\x54\x52\x92\
+\x26\x69\x92\x52\x25\x6d\x5c\xdb\x71\xec\xb5\xbd\xeb\xf5\xae\xf7\
+\xf2\xff\x33\xe7\xf0\xb0\xeb\xf5\xae\xe3\xdb\xda\x0e\x12\x47\xfa\
+\xb5\xff\xcc\x3f\x97\xf3\xcd\x77\x66\xce\xcc\x99\x25\x11\xc1\xff\
+\xb3\xd8\xad\x14\x3e\xf1\xda\x6b\x49\xd1\xf4\x1d\x81\x44\xd6\xda\
+\x31\x09\x9d\xfb\xde\xb7\xbf\x7e\x7d\xed\xed\xac\x90\x81\x3f\x9c\
+\x3a\xd3\xbb\xbd\x73\xd3\x87\x7b\xb6\xf7\x86\x62\xb1\x18\xaa\xd5\
+\xee\xae\x4b\x44\x8d\x09\xcc\xa6\x0c\x33\x0a\x85\x22\x32\xd9\x0c\
+\x06\x47\x46\x30\x3e\x99\xc9\x5a\x81\xd7\x73\xe4\xc8\x57\xa6\xd7\
+\x02\x60\xc5\x0c\xdc\xbe\x7e\xf1\xd3\x4d\x89\x43\xc5\x58\xac\x2d\
+\xe4\x38\x36\x1c\xc7\x69\xbd\x33\xdb\x06\x0b\xa3\x54\xa9\xa0\xcd\
+\xf3\x52\x37\x06\x86\x5e\x05\xf0\xc5\xb5\x00\x50\x2b\x2d\x78\xec\
+\xd8\x31\xce\xe4\xf3\xa7\x82\xc0\x47\xbe\x30\xb3\xaa\xce\x42\xae\
+\x0b\xcf\x8b\xa2\x3d\x99\x84\x65\xd9\x38\xb8\xf7\xb3\x5f\xf8\xfd\
+\x8b\x2f\xff\xe4\x7f\x02\x00\x00\x44\xf8\xd5\xd1\xf1\x09\x28\x45\
+\xf0\x7d\xbf\xe5\xce\x88\x08\x91\x70\x18\x5e\x34\x0a\xdb\xb2\xb0\
+\x73\xc7\x0e\x24\xbd\xf0\xf1\x13\xa7\xfe\xb6\x7f\xb5\x00\x5a\x9a\
+\xc4\x3a\x93\x7e\x6b\x60\x78\xa4\xb8\xad\x73\x6b\xb4\xe2\xfb\xb0\
+\x2c\x0b\x27\x4f\x9e\x6c\xb9\x53\x6d\x0c\x76\xef\xdb\x8f\x50\x28\
+\x84\x47\x3e\xf7\xb0\x7a\xed\xcd\x73\x67\x5f\x78\xe1\xdc\x03\x4f\
+\x3e\xf9\x58\xeb\xd4\x8a\x48\x4b\xcf\x4b\xaf\xff\xfd\x46\xb1\x58\
+\x94\xec\xd4\x94\x30\xf3\xaa\x9e\xc9\x6c\x56\x2e\x5c\xba\x22\x22\
+\x22\xbe\xef\xcb\xbb\xe7\xcf\xcb\xf3\x7f\x39\x7d\xb2\x55\x5d\x44\
+\xa4\x35\x06\x6a\x90\xcb\x20\x82\x70\x75\x05\x3a\x73\xe6\x0c\x32\
+\x99\x4c\x4b\x2d\x54\x02\x83\xbe\x87\x1e\xac\x9a\x80\x6d\x63\xcf\
+\xae\x5d\xb8\xfa\xd1\xcd\x23\xcf\xbd\xf8\xca\xe9\x1f\x3e\xf1\xad\
+\xd3\xf7\x94\x81\x17\x4e\x9f\x39\x5f\x2a\x95\x65\x72\x32\xb3\x6a\
+\x06\x6e\x0d\x0e\xcb\xfb\x57\x3e\x90\x59\xd1\x5a\xcb\x8d\x9b\x37\
+\xe5\xf8\xf3\x27\x06\x7e\xfe\xf2\xcb\xee\x3d\x65\x80\x45\x0a\x00\
+\x60\x59\x56\xeb\xe4\xd5\xa4\x58\x2a\xe1\xdd\x4b\x57\x31\x34\x9a\
+\x46\x67\xc7\x66\xdc\xd7\xb9\x15\xf7\x75\x75\x61\x53\x3c\xd6\x1d\
+\x4c\xe5\x7f\x04\xe0\xf8\x4a\xdb\x5a\xd2\x91\x0d\xff\x99\x8e\x31\
+\x59\xfb\x60\xe0\x31\xd8\x13\x03\xef\x62\xe2\xb7\xbb\x0f\x3f\xfe\
+\x83\xa8\xef\x07\xf0\xbc\xe8\xaa\x00\x30\x33\x86\x47\xc7\x70\x6b\
+\x70\x08\x1f\x7d\x7c\x0b\xc3\x23\xa3\xb0\x2c\x85\x9d\x3d\xdd\x18\
+\xbc\x7d\xbb\x08\x87\xba\x9e\x79\xfa\xe9\xec\x4a\xda\x5a\x94\x81\
+\xeb\xa7\xc8\x8d\xc1\x7a\x36\xd9\xde\x19\x6a\xcc\x0f\xbb\xdb\x01\
+\x10\x94\x65\x61\x7c\x7c\x1c\x6f\xbc\xf1\xc6\xaa\x99\x00\x00\x57\
+\x04\x5f\x3e\xf4\x79\x7c\xfc\xe9\x30\xce\x5f\xba\x82\xa8\x6b\x47\
+\x43\xb1\xf8\x4f\x01\x3c\xbb\x26\x00\xd1\x02\x1e\x82\xe5\x84\x02\
+\xcd\xd5\x0c\x01\x2a\xd2\x86\xe4\xe6\x8d\x00\x00\x45\x84\x4d\x9b\
+\x36\xe1\xe8\xd1\xa3\x6b\x02\x00\x00\xe5\x4a\x05\xdd\xdb\xb6\x61\
+\xd7\x03\xf7\xe3\xd2\xfb\x97\x31\x34\x91\xe9\x5b\x69\xdd\x45\x01\
+\x68\x8d\x7e\xdb\xb2\x11\x04\x73\x26\x36\x85\x0e\xb4\x27\x12\xd5\
+\x8a\xb6\x85\x0b\x17\x2e\xe0\xea\xd5\xab\x6b\x06\xf0\xc4\x91\x23\
+\xf0\xa2\x55\x0f\xdd\xde\x9e\xc2\xf0\xc0\x7b\x8f\xfe\xf5\x67\xf6\
+\x59\xd6\xe6\xb6\x36\x18\x13\x20\xcd\x8c\x34\x31\xd2\x44\xb8\xf6\
+\xdd\xdf\xc8\xc8\xb2\x00\x98\xb1\xd1\x30\x21\xd0\x82\xd9\x4d\xdb\
+\xa4\x6c\xc1\xce\x64\x02\x80\x40\x29\x0b\xfd\xfd\xfd\xe8\xef\xef\
+\x5f\x33\x00\x00\x88\x46\xc2\xa8\x78\x1e\xc2\xae\x8b\x89\xcc\x54\
+\xa4\xe7\xc0\x86\xc7\x12\x31\x05\x13\x30\x8c\x11\x04\x01\x63\x34\
+\x5d\xc2\x9d\xd1\xe2\xaf\x00\x3c\xb3\x3c\x03\x06\x71\x18\xa0\x6e\
+\x42\x00\x46\x4c\x2f\x1e\x4e\x26\x6a\x00\x79\x55\x5e\x78\xbe\xec\
+\xdb\xb7\x0f\xfd\xfd\xfd\x70\x6b\xfb\xa4\x40\x07\xa0\x20\x87\x20\
+\x10\xe8\x40\x50\x9d\x6f\x84\x90\xa5\xe0\x86\x2c\xb0\x41\xac\xb1\
+\xfe\xe2\x0c\x18\x24\xb4\x01\x44\x0b\x20\x80\xc0\x82\x49\x1c\x84\
+\x6d\xdb\x10\x11\x28\xa5\xd6\xc5\xfe\x1b\x25\x1c\x0a\x21\x3f\x9d\
+\x83\xcd\x53\x08\xb4\xd4\xd8\x07\x66\x2d\x40\x18\x30\x06\xde\x8a\
+\x00\x68\x83\xb8\xa5\x05\x42\x0c\x01\x90\x95\x6d\xd8\xd1\xbb\x63\
+\x5d\x15\x9e\x2f\xb6\x6d\x63\x60\x78\x18\x11\xe4\xa1\x35\x43\xeb\
+\x86\x13\x87\x00\x86\x01\xcd\x2b\x64\xc0\x30\x12\x6c\x00\x45\x02\
+\x41\xd5\x7c\x1e\xed\xda\x0a\x80\x40\x04\x9c\x3d\x7b\x16\xa3\xa3\
+\xa3\x6b\x52\xb8\xbd\xbd\x1d\x87\x0f\x1f\xae\xa7\x0b\x85\x02\x86\
+\x86\xef\x60\x87\x33\x09\x5f\x0b\xfc\xa0\xd9\x47\x31\x03\xa6\x05\
+\x00\x71\x18\x80\x84\x41\x2c\xc8\x07\x36\xec\xf4\x3b\x98\x18\x98\
+\x80\x9f\x4f\x63\x67\x30\x8e\x6e\x27\x8d\x4a\x21\x8d\xf2\x74\x1a\
+\x95\xfc\x38\xb4\x31\x50\x6e\x0c\xca\x89\x81\xdc\x18\xc8\xf1\x60\
+\x85\x62\x50\x6e\x0c\x96\xeb\xc1\x72\x63\x50\xae\x87\x50\x5b\x07\
+\x92\x9d\x7b\x90\xec\xdc\xdb\xd4\x67\x7a\x7c\x1c\x53\xb9\x0c\x62\
+\xc9\x3c\x74\xa0\xa0\x35\x37\x9d\xf9\x8c\x08\xcc\x52\x73\xe0\xdf\
+\xc7\xe9\x7e\x36\x78\x4c\x18\x5f\x62\xc1\xc1\xc8\x74\x09\x0a\x01\
+\x9c\xc4\x66\x1c\x4a\xbe\x8f\xdc\xc5\x1b\xb0\x23\x31\xd8\xd1\x18\
+\xda\x62\x31\xa4\x36\x84\x21\xd2\x05\xe1\x4e\x88\x30\x58\x04\x10\
+\x81\x98\xea\xbb\x08\x43\x58\xc0\x5c\x82\x36\x79\x14\x73\xd3\x98\
+\x4e\xe7\x30\x36\x95\xc3\xd5\x4c\x0e\xb9\xa9\x1c\x94\x9b\x42\xb2\
+\x73\x2f\x52\x9d\x7b\x30\x59\x72\xe1\x95\xae\xc2\xb4\x31\x44\x08\
+\x81\x6e\x1e\x54\x36\x4b\x30\xf0\xde\xaf\xe9\x9b\xcc\x78\x45\xb9\
+\x1e\x45\xe3\x1d\x88\x26\x3e\x03\x2f\xde\x01\xd7\x4b\x01\xd4\x58\
+\xa5\x29\x01\x02\x40\xb5\x6d\xd1\x52\xbb\x23\x02\x90\xda\xb8\x01\
+\x9d\xf3\xf2\x4b\xc5\x32\xa6\x33\x39\x4c\x4d\x5d\xc6\xc4\xf0\x10\
+\xf6\xaa\x41\x14\x27\x80\x6c\x38\x8c\x90\xe3\xd4\x7b\x93\x59\x13\
+\x5a\x8c\x01\x63\xf0\x35\x6f\x63\x0f\x6d\xdd\xf9\xc8\x3c\xd4\xc1\
+\x42\x7a\x2f\x0a\xa8\x55\x71\x43\x16\x36\x6e\x69\xc7\xc6\x2d\xed\
+\xd8\xb1\xbb\x17\x95\xb2\x8f\x9b\x1f\x0e\xe0\x5f\xef\x5c\x86\x45\
+\x3e\xda\xdb\x9d\x3a\x00\x23\x4b\x30\x60\x18\x0f\x7a\xc9\xce\x39\
+\x85\x97\x13\x5a\x36\x63\x55\xe2\x38\x84\xdd\x07\x7a\x31\x34\x78\
+\x07\x33\xf9\x51\xc4\xb5\xcc\x2e\xa2\x60\x61\xf0\x62\xcb\xa8\x31\
+\xe8\x76\x22\x71\x98\x05\x00\xac\x58\x35\x6a\xb9\xc6\xa2\xe2\x79\
+\x21\x64\xd3\x06\x81\x99\x73\xa4\xb5\x39\xb0\x08\x00\x86\x11\xd6\
+\x60\xe3\xb7\xac\xc0\xf2\xd6\xd5\x3a\x20\x2f\x16\x42\xa9\xc2\xd0\
+\x7a\x6e\x1d\x62\x16\x18\x03\xf5\x8b\xc7\x29\x7a\xec\x75\x29\xce\
+\x07\xa0\x99\xf5\x3c\x13\x5a\x1f\xb3\xa8\xb7\x46\x2b\x6f\x2f\x1a\
+\x75\xe0\x57\x04\xda\xcc\x01\x10\x53\x73\x6c\x36\x62\x00\xe6\x01\
+\x30\x08\x98\xcd\x12\x73\x60\x7d\xc1\xd4\xdb\x5b\xa4\xd9\x48\xc4\
+\x86\xd6\x82\xc0\x17\xd0\xfc\xe0\x8f\x8f\x18\x80\xf4\x7c\x00\x5a\
+\x8c\x06\xb7\x6e\xf0\xf7\x04\x50\x24\x5a\x55\xad\x54\x66\xb8\xee\
+\x5d\x7d\xd5\x8f\x82\x8d\x26\xe4\x57\xca\x45\x84\xc2\x91\x05\xf5\
+\x5b\x5c\xdd\x7b\x03\xc4\x75\x08\x44\x84\x4a\x85\xa1\x2c\x85\xc6\
+\x38\xac\x65\xa1\x6e\x26\x8d\x0c\x7c\x52\x9e\x99\xd9\xe5\x38\xf6\
+\x72\x6d\x2f\xf1\x79\x7d\xc1\x44\x3d\x07\x15\x5f\xc3\x71\xab\xe9\
+\x5a\x24\x07\x26\x40\x3d\x00\xd6\xc8\xc0\x95\xe2\xcc\xcc\x57\xbd\
+\xb6\x16\x0e\xea\xcb\xea\x4b\xab\xab\x56\x93\x78\x5b\x08\xd9\x6c\
+\x00\x6d\xaa\xbe\xa0\x1e\x7f\xe0\xea\x04\x6e\x02\xc0\x8c\x0f\xca\
+\xc5\x12\xc4\xf8\xab\x59\xf8\x5b\x92\x05\x82\xf2\x0b\x96\x4b\xa5\
+\xc2\x48\x8f\xe7\xa1\x6b\xce\x4c\x66\x5d\x42\x65\x21\x00\x06\x57\
+\x4a\xc5\x32\x84\x97\x0b\xda\xae\xd1\x4c\x5a\xf0\x0d\xa9\x94\x0d\
+\x36\x40\x60\xe6\x0e\x34\x00\xf8\xd8\x5b\x52\xbe\x0b\x40\xae\x8c\
+\x8f\x60\xf9\x81\x18\x7f\x5e\xe0\x7f\xc5\xb3\x79\xdd\x81\xa7\xe2\
+\x16\x44\x50\x3d\x5a\x52\xdd\x84\x8a\x8d\x65\xea\x00\x9e\x7a\x4e\
+\x82\x13\x4f\xd3\xf5\xe2\x4c\xb1\x2f\x12\xb1\xd7\xa2\xe9\xea\x14\
+\x5f\xa0\x58\x38\x0c\x84\x42\x0a\x22\x0c\x22\xcc\xda\x5e\x53\x04\
+\xbb\x69\xc9\x31\x06\x6f\x4f\x4c\x14\xfb\xba\xb6\xb6\x78\x05\x76\
+\x8f\x36\x76\x00\x21\x95\xb4\x31\x91\xf5\x61\xa9\x2a\x03\x02\x14\
+\x89\x88\xa4\x16\x52\x6c\x06\xa0\xf1\xa7\xf1\x74\xe5\xc7\x9d\x1d\
+\x56\x8b\x3a\xdc\x3b\xb6\x52\x09\x42\x7a\xb2\x76\xd6\x20\x40\x84\
+\xfc\xfd\xfb\xf7\x25\xfb\xfa\xfa\x7c\x63\x4c\xd0\x04\xe0\xa9\x3f\
+\xca\xc5\xdf\x1d\xa5\xcb\x23\x63\x95\xbe\x54\x52\x61\xd9\x65\xb0\
+\x55\xeb\x58\x21\x53\x8d\xb9\xb1\xa8\x80\x35\x80\x50\x95\x01\x16\
+\xf2\x89\x68\x73\xb9\x5c\x2e\x38\x8e\x93\xbb\xcb\x6b\x55\x58\xfd\
+\x72\x70\x58\xbf\x14\x0e\xa9\x65\x14\xa4\x75\x06\xb3\x70\xc9\x48\
+\x18\x55\xf3\xe1\xea\x53\x34\x4e\xd6\x18\xd3\x63\x59\xd6\x6d\xa5\
+\x54\xb1\x09\x00\x11\x59\xbd\xbd\xbd\xff\xf8\xfe\xc1\xe1\x7f\x7a\
+\x77\x82\x43\x1b\x36\xac\x4c\xa9\xd5\x48\x2b\xc0\x3b\x36\x03\xa3\
+\xe3\xd5\xb2\xd9\x4a\xb4\x4c\x44\x9d\x8e\xe3\x8c\x17\x8b\x45\xd3\
+\xb4\xcf\x3b\x70\xe0\x40\x38\x1e\x8f\x77\xbf\x39\xd0\xf3\xd6\xad\
+\x11\x6b\xa6\x50\xb8\x77\x00\x66\x03\x96\xb5\x38\xc0\x92\xcf\xd6\
+\x2d\x40\x34\x5c\xdd\x4e\xa7\x4b\x9e\x0b\x60\xbb\x31\x66\x93\xd6\
+\xda\x6f\x62\x20\x93\xc9\x70\x32\x99\xcc\x4f\x69\x37\x77\x6e\xa0\
+\xe7\xe4\x4c\x65\xe8\x1b\x89\x90\xdf\xa1\x6a\x30\x45\x00\xa2\x6a\
+\xc7\x44\xcd\xa3\x48\xd2\x30\x9a\x8d\xe9\x45\xbe\x11\x01\x32\xef\
+\xdb\xec\x52\xd9\xf8\x6d\xb6\x3f\xdb\x06\xf2\x15\x77\x6c\x78\x26\
+\xf1\x36\x11\x7d\xe0\xfb\xfe\x8d\x81\x81\x01\xae\x5f\x70\x10\x11\
+\xed\xdd\xbb\xd7\x53\x4a\x75\x31\x73\xb7\x52\x6a\xa3\x31\xa6\xad\
+\x3d\x5c\xee\xb0\x2d\x71\x15\xc8\x66\x16\x9b\x88\x88\x14\x94\xb0\
+\x28\x10\x55\x71\x48\x55\x05\x52\x42\x22\xa2\x2c\x52\x24\x22\x8a\
+\x21\x6a\x76\x26\xd5\x40\x13\x11\x18\x00\x14\x20\x22\x22\x04\xc8\
+\xdc\x85\xbe\x40\x11\xb1\x54\xc7\x9e\x2d\x82\x11\x11\x86\x88\x51\
+\x4a\x38\x53\xf6\x6e\x4d\xf9\xee\x4d\x66\xfe\x24\x97\xcb\xdd\x1e\
+\x19\x19\x29\x35\x32\x40\xe1\x70\x98\x0b\x85\xc2\xb4\xe3\x38\x83\
+\x22\x32\x49\x44\xe1\x89\xa2\xfb\x1f\xa5\x94\xa5\x94\xb2\x98\xd9\
+\x52\x4a\x29\x54\x6f\x76\xea\x63\x6a\x59\x16\x6a\x69\x12\x11\x25\
+\x22\x64\x59\x16\x31\xf3\xec\x52\x26\x44\x24\xb5\x81\x12\x63\xcc\
+\x6c\xba\xfe\xcb\xcc\xf5\x34\x33\x1b\x22\x62\x66\x36\x4a\x29\x63\
+\x8c\x61\xc7\x71\x7c\xad\x75\xde\x98\x20\x5b\x28\x14\xb2\x23\x23\
+\x23\x65\x11\x91\xa6\x2b\xa6\xea\x80\x42\xf5\xf7\xf7\xab\x5c\x2e\
+\xa7\xca\xe5\xb2\x62\x66\xda\xb2\x65\x0b\x00\x20\x08\x02\x02\x00\
+\x63\x4c\xd3\xd4\xd3\x5a\xd7\xd3\xc6\x18\x62\xae\x1e\x8b\xe2\xf1\
+\x78\x3d\x7f\x7a\x7a\x5a\x00\x40\x29\x55\xef\xd0\xb2\xac\xfa\xbb\
+\x6d\xdb\x4d\xf9\x8e\xe3\x08\x00\x8c\x8d\x8d\x89\x6d\xdb\xe2\x79\
+\x1e\x5f\xbb\x76\xcd\x00\x60\x69\x50\xfa\xae\x3b\x32\x9a\x3b\xb8\
+\x36\x2a\xb9\x1a\x4f\xd5\x58\x67\xb5\xff\xe9\x69\xac\x27\xb2\xc0\
+\x85\xde\x7f\x01\x8b\xbf\xd2\xaa\x53\x46\x78\x75\x00\x00\x00\x25\
+\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\
+\x32\x30\x31\x30\x2d\x30\x35\x2d\x32\x34\x54\x30\x37\x3a\x33\x38\
+\x3a\x31\x35\x2d\x30\x36\x3a\x30\x30\xde\x18\xbd\x60\x00\x00\x00\
+\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\
+\x00\x32\x30\x31\x30\x2d\x30\x35\x2d\x32\x34\x54\x30\x37\x3a\x33\
+\x38\x3a\x31\x35\x2d\x30\x36\x3a\x30\x30\xaf\x45\x05\xdc\x00\x00\
+\x00\x36\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\
+\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\
+\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\
+\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\x61\xec\xaf\x51\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\
+\x67\x9b\xee\x3c\x1a\x00\x00\x00\x16\x74\x45\x58\x74\x53\x6f\x75\
+\x72\x63\x65\x00\x65\x63\x68\x6f\x2d\x69\x63\x6f\x6e\x2d\x74\x68\
+\x65\x6d\x65\xa9\x4c\xb7\x53\x00\x00\x00\x34\x74\x45\x58\x74\x53\
+\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x73\x3a\
+\x2f\x2f\x66\x65\x64\x6f\x72\x61\x68\x6f\x73\x74\x65\x64\x2e\x6f\
+\x72\x67\x2f\x65\x63\x68\x6f\x2d\x69\x63\x6f\x6e\x2d\x74\x68\x65\
+\x6d\x65\x2f\x88\x32\x2e\x43\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x03\x0e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
+\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\x8b\x49\x44\
+\x41\x54\x58\x85\xed\x97\xcb\x6b\x13\x51\x14\x87\xbf\x99\x49\x6d\
+\x4b\x1b\x8a\x2d\x2a\xa2\xa8\x1b\xa1\xa1\x8b\xd2\x9d\xd0\x4d\x40\
+\x70\x2d\x14\xdc\xb8\xb3\x0b\x57\x12\x5a\xff\x80\x6c\x5c\x08\x8a\
+\xa5\x2b\x57\x5d\xbb\x55\xdc\x37\x20\xa4\x08\x29\xd4\x62\x4b\x8a\
+\x0f\x50\x29\x28\x2d\x1a\x75\xa2\xe4\x31\xf7\x1e\x17\x9d\x4c\xa6\
+\xc9\x9d\x9a\xa6\x63\x40\xe8\x0f\xee\xbc\xef\x39\xdf\x9c\x73\xee\
+\x61\xc6\x12\x11\x4c\xb2\x2c\xcb\x36\xde\xe8\x52\x22\xa2\x8d\x7e\
+\x4c\x00\x8b\x8b\x8b\xe7\x53\xa9\xd4\x9c\x88\xc4\x02\x61\x59\x96\
+\x2e\x16\x8b\x0b\x99\x4c\x66\xdb\x44\xb6\x6f\xa4\xd3\xe9\x44\xa1\
+\x50\x58\xa9\xd5\x6a\x12\xe7\x28\x14\x0a\x2b\xe9\x74\x3a\xd1\xea\
+\xaf\xed\x0d\x5d\xd7\xb5\x1c\xc7\x19\x88\xe3\xcd\xc3\x72\x1c\x67\
+\xc0\x75\x5d\xab\xf5\x7a\xac\x79\xee\x46\xc7\x00\xc7\x00\xff\x04\
+\xa0\xf4\xfb\x1d\x60\x6e\x70\x3d\x01\x78\xbb\xfb\x94\xe5\x37\xf3\
+\xb8\x95\xf6\xbe\xd3\x13\x00\x80\xdd\xf2\x6b\x9e\x6f\xde\xa4\xf8\
+\xe5\x09\x82\xb1\x0b\x03\x90\x38\x8c\x51\x2d\x75\xaa\x9e\x8b\x88\
+\x87\x16\x15\xec\xb5\x78\x08\xfe\x5e\x14\x15\xef\x3b\x00\x4a\x55\
+\x29\x7c\x5a\xe0\xe3\xb7\x65\xc6\xf4\x4c\x7f\xc7\x00\x8d\x36\xd9\
+\xaa\x6a\xfd\x27\x3b\xe5\x75\x6a\xaa\x4c\x5d\x95\xa9\x79\x6e\xf3\
+\xd8\x3f\xaf\xab\x5f\xd4\x94\xbb\x6f\xde\x4e\x79\x9d\x5d\x36\xc7\
+\x6f\x3f\x52\xf3\x4b\xf9\xa9\x07\xb3\xd3\x6b\x41\x48\x22\x53\xd0\
+\xda\xb3\x9b\x03\x68\x1c\x07\xcf\x12\xaa\x39\x09\x6d\x43\xf6\xf0\
+\x6c\xdb\xe1\x3e\x90\x5f\xca\x4f\x8d\x77\x15\x01\xf1\x3d\x05\x0e\
+\x45\x7c\x4f\x4d\x82\x0e\x6a\xff\x0a\xf0\x6a\x29\x3f\x95\x05\x1e\
+\x1a\x01\xb4\xd6\x68\xdd\x5e\x38\x5a\x34\x5a\x0b\x22\xda\x18\x19\
+\x69\x00\x05\x60\x91\xaa\x03\x3f\x00\xdd\x5d\x04\xfc\x6d\xf3\x0c\
+\xc2\x1e\xff\x12\x85\x1c\x70\x6b\x76\x7a\xed\x03\x44\xd4\x40\x74\
+\xfe\x7d\xb0\x50\x2d\x20\xe1\x04\x44\xbb\xb7\xe9\xd3\xca\x23\x03\
+\x5c\x6d\x38\x87\x03\x6a\xc0\x94\x82\x84\x35\xc4\xe8\xe0\x04\x22\
+\x6a\x6f\x19\xd2\x58\x8e\xca\xbf\xb6\xb7\x1c\xdf\x7f\x7d\xc6\x67\
+\xf7\x65\x30\xef\xd4\xd0\x24\x23\x95\xeb\x5b\x77\x33\xf7\x1e\xaf\
+\xae\xae\xee\x23\x8c\xec\x03\xa6\x14\x58\x24\xe8\x77\x4e\x46\x4d\
+\x09\xb4\x9d\x78\x01\x80\x63\xf7\x33\x71\x66\x96\xcb\x63\x33\x14\
+\x8b\x5b\x55\xd3\xb3\x91\x45\x18\xf5\xb1\xda\xa9\x46\x07\x53\x4c\
+\x9e\xbd\xc3\xf0\x89\x73\x88\x60\x8c\x68\x24\x40\x54\x11\x76\xaa\
+\x0b\x23\xd7\x48\x9e\xbe\x84\x85\x15\xd8\x89\xb2\x77\xa8\x1a\xe8\
+\x54\xc3\x7d\x17\x11\x2d\xa1\x15\xd2\x05\xc0\x51\x53\x60\xb2\xd9\
+\x31\xc0\x41\x13\xe2\xd6\xa1\x3a\xe1\x51\xd4\xd3\x22\x8c\xb2\xf9\
+\x7f\x00\x24\x93\x49\x51\x4a\x55\xe2\x4e\x81\x52\xaa\x92\x4c\x26\
+\xdb\x28\xda\x00\x72\xb9\x9c\x97\xcd\x66\x6f\x94\x4a\xa5\x39\xad\
+\x75\x2c\x9f\x6c\xb6\x6d\xeb\x8d\x8d\x8d\x85\x5c\x2e\xe7\xb5\xde\
+\x33\xfe\x1d\x43\xef\x7e\xcf\xff\x00\x9e\xfb\x3e\x13\x97\xc1\x3f\
+\xbe\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x79\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
+\x00\x00\x04\x40\x49\x44\x41\x54\x78\xda\x95\x54\x5f\x4c\x53\x67\
+\x14\xff\xdd\xdb\xaf\xff\x4b\x0b\x6b\x69\x29\x4c\xa5\x08\x28\xa4\
+\x89\x86\x69\x13\x43\xc4\xd0\x07\xc3\x83\x43\x1f\xc6\xab\xf1\xc5\
+\x38\xe3\xdb\x92\xbd\xec\x71\x3e\x2e\x59\x5c\xb2\x64\x09\x4f\x1a\
+\xb3\x30\x97\x85\x2c\xf1\x11\xb0\x61\x18\x48\x48\x5c\x85\xe8\x56\
+\x15\x03\x5d\xb5\xc0\x4c\x65\x4a\x69\x6f\x7b\x7b\xef\xdd\x39\xb7\
+\xac\xb5\xcc\x07\x39\xc9\x97\x93\xf3\x7d\xe7\xfe\xee\xef\xfc\xce\
+\xf9\x3e\xc9\x30\x0c\xec\xc7\xbe\x96\x24\xa9\x23\x16\xfb\x2e\xd0\
+\xd3\x73\xde\xe6\xf1\x04\x35\x5d\x47\x7e\x6b\x6b\x23\x9b\x4e\xff\
+\xf2\xc5\xe2\xe2\x97\xd8\xb5\x7d\x01\x8f\x47\xa3\x7d\xe1\x81\x81\
+\x99\x63\x97\x2e\x85\xfd\x7d\x7d\x0d\x67\xd9\x85\x05\xcc\xde\xbc\
+\xf9\xd7\x1f\x4f\x9f\xc6\xbf\x4d\xa5\x9e\x8b\xfd\x30\x3d\x32\x32\
+\x32\x3d\x70\xf5\x6a\xd8\xdb\xd5\x85\xfc\xe6\x26\x2a\x6f\xde\x80\
+\x4d\x6e\x6e\xc6\x47\x03\x03\x38\xe3\xf1\x1c\x7c\x7b\xfd\xfa\x14\
+\x80\x2e\x19\x1f\x68\x1f\x9f\x3c\xf9\xbd\xcb\x6e\x6f\x17\x5e\x2f\
+\x9a\x42\x21\xf8\x8f\x1e\x45\x7e\x7b\x1b\x79\x45\x41\xa8\xbf\x1f\
+\xfe\xce\x4e\x58\x03\x01\x84\x0d\x23\xf2\x55\x2c\xf6\x8d\x20\x22\
+\x0c\xde\xca\xb2\xe0\x3d\xe6\xf5\x7a\xe5\xee\xee\x6e\xdb\xe7\x86\
+\x31\xba\xf3\xe2\x05\xd6\x1f\x3e\x44\x2b\xc9\x20\x6c\x36\x44\x86\
+\x87\x61\xb1\x5a\x21\x5b\x2c\xd0\x2a\x15\x6c\x3c\x7a\x04\x75\x63\
+\x03\x4e\x9f\x6f\x54\x44\x22\x91\xe5\x58\x2c\xd6\xeb\x76\xbb\x0d\
+\x87\xc3\x01\xbb\xdd\x2e\x59\x2c\x16\xd6\x5e\xae\x54\x2a\x46\xa9\
+\x54\x42\xb9\x5c\x86\x92\x48\x58\xca\x04\xbc\x7a\xfb\x36\xb6\x5f\
+\xbf\xc6\xe0\xb5\x6b\xb0\x39\x9d\x60\xa3\x3c\xcc\xdd\xb8\x01\xed\
+\xee\x5d\xc8\xab\xab\xd0\x3a\x3b\x0f\x8b\x40\x20\x70\x64\x62\x62\
+\xe2\x7f\x5a\x73\x53\xa9\x9a\x5a\xfc\x03\xb1\xd4\x54\x15\x99\xe9\
+\x69\x28\x6d\x6d\xd0\x34\x0d\xb2\x5c\x55\x52\xd9\xd9\x41\x66\x66\
+\x06\xe1\xb9\x39\x34\xd3\x77\x82\x48\xc9\xc4\x0e\x1f\x62\x4d\xd4\
+\x30\x50\xae\xe7\xdc\x39\x7c\x36\x3e\x0e\x2b\x49\xa0\x52\x25\x4c\
+\xc0\xe3\xf3\xe1\xd3\x5b\xb7\x90\x3e\x71\x02\x3e\x92\x68\xc7\xe5\
+\x82\xcc\xac\xf6\xda\x36\x37\x25\x9f\x6f\x60\x1f\x3c\x75\xca\x6c\
+\x4e\xef\x85\x0b\xb0\xd2\xc7\xa5\x62\x11\x3f\x8e\x8e\x62\xf2\xf2\
+\x65\xf3\xbc\x25\x18\x44\xdb\xc8\x08\x1c\x54\x4d\xb2\x50\xd0\xcc\
+\xe6\xbd\xa5\xd1\x61\x2b\x6c\x6d\x21\xb3\xbc\x8c\x22\xfd\xcc\x20\
+\xdd\x24\x2a\x5d\xd7\x34\xb3\x6c\xdd\xef\x47\x89\x26\x21\x33\x3b\
+\x8b\x69\x2a\xfd\xf9\xe4\x24\x8e\xdd\xbb\x07\x0f\xe5\xfe\x4c\x79\
+\xad\xa7\x4f\xc3\xbb\xbe\x8e\x45\x9a\x8e\xc4\xc2\x82\x2e\xa0\xeb\
+\xd0\x08\x50\x22\xbd\x72\xf7\xef\x63\x27\x99\x44\x81\x18\x55\xa8\
+\x41\x5a\x26\x03\x95\x98\xab\x85\x02\x34\x62\x68\xc4\xe3\xd5\xa9\
+\xc8\x66\xf1\x09\xc9\xe2\x20\xdd\xbd\x24\xc7\xc8\x93\x27\x50\x69\
+\xef\xd7\x5c\x0e\xff\x3c\x7e\x0c\x09\x90\x04\xb3\xd9\x4a\xa5\xa0\
+\x10\x50\xe2\xca\x15\xae\x1b\xd6\x68\x14\x3a\xb1\x02\x75\x98\x3b\
+\x20\x03\x9c\x6c\x8e\x95\xeb\xc1\x03\xfc\x4e\xac\xbc\x24\x8b\xcb\
+\xe1\x30\x27\x43\x21\x52\x9b\xcf\x9e\xc1\x99\x4e\x83\xe7\x84\x1a\
+\x20\x09\x95\x4a\x56\x5e\xbd\x02\xc8\x47\xa8\x1c\x99\x80\x2b\xe1\
+\x30\x64\x2a\xcf\xd1\xd1\xc1\x80\xbc\xcc\x1f\xa6\xdc\x6e\x1c\x1e\
+\x1c\x84\x01\x40\xa7\x58\xa3\xa5\x93\x14\x7f\xd3\x85\xe9\x05\xa0\
+\xb5\xb7\x43\x21\xa2\x06\x55\xcd\xc0\x86\xfd\xf8\x71\x94\xa9\x5c\
+\xd7\xc5\x8b\xa6\x9e\x25\x5a\xfc\x43\x9d\x65\xfa\x4f\x63\xae\x8c\
+\x64\xc9\x9e\x3d\xcb\x73\x5b\xd5\x7e\xf7\x3c\x4b\x57\xdb\x38\x70\
+\xc0\x8c\x4b\xb4\x90\x4c\x6a\x12\xdd\x2a\x35\x95\x4a\x09\xee\x2c\
+\x03\xb1\x5f\xa7\x26\xb0\x0f\x06\x83\xec\xab\x8b\xce\x7e\xba\x73\
+\x07\x63\x63\x63\xb5\x58\xdf\x3d\x4b\x24\x12\x38\x33\x34\x64\xc6\
+\x45\xea\x45\x7f\x7f\x7f\x51\xd0\xcd\x32\xde\x01\xad\xb1\x24\xdf\
+\xf0\x31\x2d\x9e\xdb\x5a\x9e\x51\xf5\x7c\xce\x15\xd4\xf6\xd9\xe8\
+\x16\x43\xd0\xcc\x32\x50\x03\x33\x4e\x32\x93\xf7\x30\x2b\xab\x6a\
+\x3d\xae\x83\x9b\xb9\x0c\xc9\x93\x25\xa8\xc1\x2d\x2d\x2d\x92\x20\
+\xea\xf2\xd2\xd2\x12\x83\xd7\x56\x2e\x97\xe3\xf7\x81\x86\x62\xb5\
+\xba\x47\x1f\x56\xc8\xaf\xad\xad\x61\x6a\x6a\x8a\xf7\x38\xae\x9d\
+\xad\xd2\xbe\x10\x02\x36\x7e\x90\x08\xbc\xa9\xa9\x49\x98\xda\x46\
+\xa3\xd1\x06\x26\xd9\x97\x2f\xa1\x28\x0a\x0e\x1e\x3a\xd4\xc0\x8c\
+\x7a\x81\xe1\x78\xbc\x41\x06\x09\xc0\xfc\xfc\x3c\x86\x48\x63\x66\
+\xcc\x4d\xf5\xf9\x7c\x86\x00\xc0\xa5\xd7\x93\xeb\xba\xed\x2d\x9b\
+\xab\x68\xc8\x35\x8d\xc0\x2c\x42\xf0\x83\xc5\x6c\xd9\x33\x63\x49\
+\x50\x22\xdd\x5c\x95\x37\xeb\xe0\xe4\xd5\x7a\x43\x6a\x5a\x53\xf3\
+\xd8\xd7\x62\x06\x91\xaa\xaf\x60\xbd\xb2\xdd\xe6\x49\xa1\x50\xe8\
+\x4f\xd2\xb4\xe7\x3d\x8f\x91\x6c\x90\xed\x79\x4a\xa5\x77\x03\x3b\
+\xdd\x3c\x8f\xc7\xc3\x40\xbc\x0c\x97\xcb\x25\x39\xe9\x26\xae\xac\
+\xac\xfc\xf6\x2f\x24\x1d\xf7\xc4\xbc\x92\x33\x7d\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xcd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
+\x00\x00\x02\x94\x49\x44\x41\x54\x78\x5e\xed\x94\x0d\x48\x53\x51\
+\x14\x80\x17\x67\x9b\xf6\x48\xb2\x4c\x20\xa9\x0c\xb0\x32\x13\x97\
+\x7f\xcd\x7f\xf3\xe5\x26\x4e\xa9\x9c\x85\x49\x66\x7f\x50\x69\x59\
+\x4c\xe7\xcc\xd4\x06\x69\xcc\xac\x0c\x4b\x20\x8a\x24\xd1\x70\x88\
+\xa5\x11\x03\xa8\x16\x05\x8e\xca\xe1\x12\x61\xd3\x95\x85\x1a\x60\
+\x25\x10\x96\x5a\x6e\x7b\xe7\xb4\x74\x40\x50\x66\x56\x41\x80\x17\
+\x3e\xb8\x17\x2e\xdf\x05\xce\xe5\xe3\x11\xd1\x3f\xe1\xd7\x05\x73\
+\x62\x90\xb6\x07\x08\x65\x8f\xd5\x61\x47\x2d\x9d\x49\xa5\x7d\x3d\
+\x3b\x2a\x07\x5e\x89\x15\x2f\x3b\x20\xc5\x92\x03\xa9\x56\x9f\x59\
+\x8b\x81\xd5\x89\x45\x07\x0c\xfd\xd5\x2d\xfd\x8e\xa1\xf7\x36\xa4\
+\x6f\x16\x22\xd2\xe0\xb0\x8d\x2e\xeb\x86\x71\xe5\x5e\xeb\x33\x48\
+\x31\x2f\x9b\x51\x0c\x71\x37\x40\xc0\x36\x9f\xde\xad\x31\xda\xba\
+\x06\x3e\x93\x75\x18\xe9\xb9\x13\xab\x8b\xde\x77\x1c\xf5\xbc\xe5\
+\xa8\xd7\x75\x7e\x68\x19\xa7\x38\xa5\xf5\x13\x24\x9b\x36\xfd\x54\
+\xcc\x8f\xad\xab\x3c\x5c\xd3\x69\x6b\xe9\x9a\xa0\x56\x33\x52\x9b\
+\x8b\x46\xc3\x08\xed\x3b\xd7\xcd\x45\x1d\x31\x38\x64\xc5\x46\x7b\
+\xb6\xa6\x1b\x4b\x1a\x06\xb1\xc1\xf0\x81\xb4\xc6\x31\x62\x55\x66\
+\x4e\x98\xd2\x91\xf7\x43\x31\x44\x5c\x90\x88\xb2\xb5\x13\x27\x75\
+\xe3\x74\xea\x3e\x4e\xa1\x47\x52\xd4\x0f\x92\x8f\xbc\x75\x04\xe2\
+\x9a\x24\x10\xdf\x3c\x6f\xf2\x6e\x42\x9b\x17\xb0\x77\xb2\x96\xc8\
+\x1f\xbc\x48\x2e\xe9\xe2\x0a\x1a\x87\xc8\x7b\x5b\xbb\x03\x24\x8f\
+\x44\xdf\x89\x05\xd1\xd5\x96\x44\x4d\x1f\xa5\xd5\xe3\x24\xf2\x49\
+\x38\xf2\x4d\xd7\x3a\x20\xfa\x4a\xd4\xb4\xf3\x48\x68\xdd\xbc\x78\
+\xcb\xdd\x37\xbe\x19\x7a\x72\x97\xe9\x07\x20\xf1\x9e\x80\x07\xc1\
+\x05\x00\xc1\x2a\x3e\x84\x14\x7b\xf0\xc3\xd5\xdc\xd2\xb2\x31\x5a\
+\x5e\x8e\xb4\xa2\x02\xc9\xd7\x89\x8f\xf2\x35\x09\x62\x6a\x47\x21\
+\xb2\x86\x0f\x91\xb5\xc2\x69\xe5\xf1\xda\xf9\x42\xe9\xed\x9b\xb0\
+\xf1\x16\x09\xa5\xba\x33\x3c\x08\x53\xe9\x41\x94\x47\xb0\xfe\x18\
+\x09\xd8\x4b\xdc\xc2\x13\x48\x8b\x4a\x91\xbc\xca\x90\xbc\xd5\x48\
+\x9e\x07\xcd\x04\xe1\x15\x04\x1b\x34\x04\xe2\x2a\x82\x88\xf3\xb1\
+\xd3\xc9\x5d\xc3\xcf\x85\xf8\xa6\x8f\x3c\x08\xdc\xc3\x42\x50\x8e\
+\x5d\xb8\xf3\x09\xb9\x2b\xed\xc4\x14\x21\x2d\x38\x8e\xe4\x51\x8c\
+\xf4\xf5\x11\xcf\x12\x27\xaa\x51\x72\x4b\xba\x8e\xfc\xa8\xb3\x26\
+\x08\x2f\x67\x66\xfc\xfb\x31\x75\xfc\xa9\x4d\x40\xa6\x53\xbe\xdf\
+\x0e\x59\x9d\x24\x50\x22\xb9\x39\x71\x2f\x44\x62\x54\x4e\x0a\x6d\
+\x24\x90\x5c\x45\x10\xab\x4d\x10\x52\xc4\xcc\xba\x15\xe0\x9f\xce\
+\x42\xe0\x2e\x3b\x64\x1a\x09\x14\x48\x90\x8f\xc4\x57\xd8\x08\xd8\
+\x8b\x08\xa1\x05\x26\x08\xca\x65\x7e\xbb\x15\xb0\x3a\x95\x85\xb5\
+\x19\x76\xd8\xfe\x94\x20\xc7\x29\x8d\xad\x42\x10\x1d\x32\xc1\xba\
+\x6c\xe6\x8f\x5b\x01\xab\xa4\x2c\xac\xd9\x6a\x87\xd0\x7c\x84\xc0\
+\x2c\x13\xf8\xa7\x31\x7f\x2d\x42\xe0\xc7\x26\x80\xbf\xfc\x1a\xf8\
+\x49\x98\xff\x37\x9b\x73\xe2\x2f\xa2\x1b\x1e\x1b\xcd\x61\xd4\x10\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x62\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x16\x00\x00\x00\x16\x08\x03\x00\x00\x00\xf3\x6a\x9c\x09\
+\x00\x00\x00\x75\x50\x4c\x54\x45\xff\xff\xff\xee\xee\xf2\xf5\xf5\
+\xf7\xd4\xd4\xdc\xfe\xfe\xfe\xa3\xa3\xaf\xe9\xe9\xed\xf0\xf0\xf4\
+\xe8\xe8\xec\xfb\xfb\xfd\xf1\xf1\xf5\xed\xed\xf1\xff\xff\xff\xf2\
+\xf2\xf6\xf7\xf7\xfb\xf3\xf3\xf7\xe3\xe3\xe9\xe4\xe4\xea\xea\xea\
+\xee\xf4\xf4\xf8\xe0\xe0\xe6\xce\xce\xd6\xd0\xd0\xd8\xdb\xdb\xe1\
+\xf9\xf9\xfb\xec\xec\xf0\xd7\xd7\xdd\xfa\xfa\xfc\xeb\xeb\xef\xf6\
+\xf6\xf8\xfc\xfc\xfe\xd2\xd2\xda\xde\xde\xe4\xd6\xd6\xdc\xdf\xdf\
+\xe5\xd9\xd9\xe1\xe2\xe2\xe8\xdb\xdb\xe3\xe6\xe6\xec\x7f\xfb\x8f\
+\x57\x00\x00\x00\x01\x74\x52\x4e\x53\x00\x40\xe6\xd8\x66\x00\x00\
+\x00\x9b\x49\x44\x41\x54\x78\x5e\x65\xce\x45\x0e\xc4\x30\x10\x44\
+\x51\xb7\x31\xcc\xc3\x8c\xf7\x3f\xe2\x24\x3d\x29\xa9\x2d\xd7\xf2\
+\x2d\x4a\x5f\x29\xb3\xce\xa9\x68\xa6\xaa\xaa\xbc\x39\x10\x5c\xb0\
+\x3d\x11\x99\xa3\x4b\x38\x2f\xc8\xcd\x4b\xb8\x25\xbf\xdb\xc4\xbc\
+\xf8\x18\xee\xb7\x6d\xca\x9a\xa2\x22\x94\x0c\x5d\x54\xc4\x6c\xf7\
+\xc1\x67\x51\x11\x73\x5e\x87\xf2\x2c\x8b\x98\xed\xa5\x2d\xa8\x94\
+\x45\xcc\x57\x0d\x46\x11\x73\xa3\xdb\xf9\x05\x45\xaf\x87\xf9\xb3\
+\x1e\xeb\xf9\x04\x45\xd3\xf3\xc3\x6c\x35\x9f\xa0\xa8\x7b\x4f\x0b\
+\xbb\x75\x28\xca\xfa\x6e\x61\x0c\x45\xfe\x1b\x31\x8a\x86\xac\x97\
+\x8c\x22\xc9\xa2\xc8\x0b\x46\x51\x7a\xe2\xc4\xd4\x0f\x03\x81\x0c\
+\xa5\xab\x5d\xa7\x60\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x12\x17\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1b\xaf\x00\x00\
+\x1b\xaf\x01\x5e\x1a\x91\x1c\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x40\x00\x00\x00\x40\x00\xea\xf3\xf8\x60\x00\x00\x0f\xf4\
+\x49\x44\x41\x54\x78\xda\xed\x9b\x59\x90\x5c\xd5\x79\xc7\x7f\xe7\
+\x6e\xbd\xcd\xf4\x6c\x2d\x89\x11\x8b\x85\x62\x20\xc8\x82\x8a\x5d\
+\x85\x52\x94\x13\x9c\xe0\xe2\xc1\x7e\x81\x0a\x89\xed\xe4\x89\xaa\
+\xe4\x25\x7e\xc8\x43\x2a\x09\x95\xed\x21\x15\xdb\xe5\x8a\x1d\x3f\
+\x04\x17\x4b\x05\x84\x02\x18\x83\x59\x44\x28\xa5\x02\xa9\x12\x65\
+\x09\x04\x48\x01\x44\x0d\xa0\x20\x66\x46\xa3\x85\xd1\x8c\x46\x9a\
+\xad\xa7\xbb\xef\x72\xee\x39\x27\x0f\xf7\xf6\x4c\x6b\xd4\x33\x7d\
+\x7b\x24\x95\xf3\x90\xaf\xea\x56\xdf\xe5\xdc\x73\xcf\xff\xff\x7d\
+\xe7\x5b\xce\xbd\x2d\xf8\xbf\x2c\x4f\x01\x53\x40\x9e\x3c\x82\x5f\
+\xc7\xe1\x2e\x1c\xee\xc2\x66\x27\x16\xd7\x20\x28\xa5\x2d\x1b\x28\
+\xa6\xd0\x7c\x42\xcc\x01\x14\x07\x51\x7c\xca\x3c\x01\x3b\x80\x6f\
+\xad\xfd\x08\xd1\x61\x08\x9d\xae\x5f\x3d\x31\x18\x7e\x40\x9e\x1c\
+\xbf\x89\xe0\xdb\x38\x7c\x1d\x87\xeb\x71\x29\x38\x9e\x43\xce\xcb\
+\x91\xb3\x73\x00\x84\x2a\x24\x8c\x42\x62\x19\x83\xc4\x47\x72\x86\
+\x98\xfd\x28\x9e\x43\x72\x04\x8b\x80\xbf\x6e\xff\x18\x67\x9d\x21\
+\xe4\x80\x7e\xc0\xfd\x95\x10\xf0\x6d\xb6\xf2\x1b\xfc\x11\x82\x3f\
+\xc0\x65\xab\x9d\xb7\xb9\xb6\xff\x5a\x76\x56\x76\xb2\x63\x60\x07\
+\xc3\xc5\x61\x7a\xdc\x1e\x00\x6a\xb2\xc6\x54\x63\x8a\x63\xf3\xc7\
+\xf8\x78\xf6\xe3\xc2\xe4\xc2\xe4\xcd\xca\x57\x37\x03\xf7\xa2\x79\
+\x1e\x9f\x47\x80\x51\xfe\x1c\xf8\xc9\xc5\x8f\x59\x4b\xc3\x02\xd8\
+\xdc\xdf\xdf\xbf\x6b\xd7\xae\x5d\xbf\x56\x28\x14\xec\xab\x8d\xd7\
+\x18\x83\x10\x02\xa5\x94\x79\xdb\x7d\x7b\xd3\xdc\xed\x73\xdf\xa0\
+\x9f\x9d\x14\xb0\x87\x07\x87\xf9\xfa\xf5\x5f\xe7\xab\x5b\xbe\xca\
+\xd6\xe2\x56\x3c\xdb\x43\x20\x30\x98\x74\xb0\xc9\x7e\xa4\x22\xce\
+\x36\xce\x72\xe8\xdc\x21\xf6\x9f\xd9\xcf\xd4\xdc\x14\xf8\x28\x24\
+\x87\x30\xfc\x3d\x1e\x6f\x22\x31\xfc\x55\x36\x02\xae\xbb\xe7\x9e\
+\x7b\xee\x7f\xf8\xe1\x87\xff\xac\xbf\xbf\xbf\x5f\x6b\x6d\x56\xae\
+\x8a\x75\x6f\x6e\xdf\xa3\xb8\xa8\xf3\xb5\x64\xdf\xf8\x3e\x1e\x7c\
+\xf7\xc1\xfc\x8c\x98\x29\x5a\xbd\x16\xb7\x0f\xdf\xce\x7d\xdb\xee\
+\xe3\xa6\xbe\x9b\xb0\x84\x85\x46\xa3\x54\x8c\xd2\x0a\x4c\x4a\x80\
+\x10\x58\x96\x8d\x6d\x3b\x49\x1b\xad\x19\x5d\x1c\xe5\x95\x93\xaf\
+\x30\x32\x35\x82\xae\x69\x08\x39\x86\xe6\x2f\xd0\xbc\x86\x85\xe1\
+\xc1\xe4\x79\xeb\x4d\x01\x8a\xc5\xa2\xdd\xdf\xdf\xdf\x67\x3b\xce\
+\x80\x96\x12\x81\x00\x91\x3c\xb0\xc9\x7c\x13\xcd\xf2\xb9\x56\x72\
+\x5a\x41\xb7\x23\xa0\xa5\xad\x40\xf0\xd6\xd4\x21\x7e\x74\xec\x47\
+\xcc\xd8\x33\x58\x65\x8b\x2f\x6f\xfd\x32\xf7\x6d\xbb\x8f\x4a\xbe\
+\xc2\xa2\x5e\xc0\x12\xa0\xe3\x18\xbf\xde\x20\x6f\xf2\x58\x22\x31\
+\x4c\x6d\x14\xa1\x08\xc8\x97\x8a\x58\x8e\x83\x31\xb0\xa5\x67\x0b\
+\xf7\x7f\xf1\x7e\x6c\xc7\xe6\xe8\xd9\xa3\xe8\xaa\xde\x41\xc0\x8f\
+\x31\x34\x18\xe0\x00\xdf\x03\xfe\xae\x03\x01\x00\x5a\x6b\xb4\x94\
+\xc4\x71\x9c\x0c\x53\x24\x03\x17\xed\x40\xaf\xfa\x5d\x97\x90\x96\
+\x63\x0b\xc1\x89\xc5\x13\x7c\xef\xf0\x3f\x72\x6c\xe9\x18\xf4\xc1\
+\xf6\x2d\xdb\xb9\xfb\xba\xbb\x71\x1d\x87\x45\x3d\x8f\x23\xc0\x16\
+\x10\x85\x3e\x26\x80\x7b\x6f\xfc\x3d\x06\x0b\x43\x00\xcc\xf9\xb3\
+\xbc\x38\xf1\x0c\xd2\x6d\x90\xb3\x0a\x28\x03\xb1\x01\xd7\x71\xb8\
+\xfb\xba\xbb\x59\x54\x8b\x8c\x99\x31\x30\xec\x20\xe0\x1f\x98\xe1\
+\x8f\xa9\x30\x8e\x9b\x81\x80\x15\x10\x02\x21\x32\x12\xb0\x86\xf6\
+\xd7\x22\xc1\x97\x01\x4f\x1c\x7b\x82\x77\xe6\xde\x81\x5e\x28\x0f\
+\x94\xb9\x63\xcb\x1d\xd8\x8e\x45\x55\xcf\xe3\x01\xae\x00\x47\x40\
+\x10\xd7\x31\x81\x43\xd9\x2d\x33\x90\x4b\x08\x88\x63\x49\x10\x54\
+\x11\xf9\x18\xe1\x95\x88\x01\xa9\x21\xd2\x60\xbb\x16\x77\x5c\x73\
+\x07\x33\xe1\x0c\x55\x55\x05\xc5\x6f\x63\xf8\x2e\xc7\xf9\x5b\xbe\
+\x4f\xb0\x1e\x01\xcd\x09\x76\x11\xf8\x15\x32\x56\xc0\x75\xd2\x78\
+\x27\xed\x1f\x99\x3e\xc2\x4b\x13\x2f\xa1\xf3\x1a\xd1\x23\xb8\x71\
+\xe0\x46\x7a\x72\x3d\x2c\xa5\xe0\x35\x60\xac\x64\x40\x91\xaa\x11\
+\x87\x2e\xda\xa8\x15\x2b\x35\x0a\x3f\x5c\xc0\x55\x12\x17\x49\xa4\
+\x21\x32\x10\x1a\x08\x35\xf4\xe6\x7a\xb8\x71\xe0\x46\x46\x82\x11\
+\x8c\x34\x16\x8a\xef\x30\xc8\x7f\xf0\x97\xbc\xd1\xd1\x02\x52\x85\
+\x5f\x02\x3e\xab\xb9\x37\xf7\xdb\x92\x80\xa0\x1e\x35\x78\x69\xfc\
+\x45\xa6\xe3\x69\xe8\x81\x42\xa9\xc0\xe6\xd2\x66\x1a\xba\x8a\x12\
+\x06\x23\x40\x18\xb0\x00\x0b\x43\xac\xea\x84\x61\x1e\xad\xf5\x0a\
+\x01\x5a\x13\x86\x4b\x08\x1d\xa0\x8c\x44\x21\x90\x29\xf8\x40\x43\
+\xa0\x05\x9b\x4b\x9b\x29\x94\x0a\x34\x82\x06\x84\x6c\x45\xf2\x87\
+\x7c\x87\x23\x99\xa7\x40\xab\xa6\xb3\x98\xfe\x45\xfb\x6b\x68\x5f\
+\x18\xc1\xe8\xfc\x28\x07\xcf\x1d\x4c\xb2\x8e\x02\xf4\xe6\x7b\x41\
+\x18\xea\x66\x01\x63\xc0\x32\xe0\x18\xd0\x06\x8c\x30\x28\x5d\x27\
+\x0a\x63\x8c\x59\x21\xc0\x18\x4d\x14\xd6\xf0\x74\x1d\x23\x62\x94\
+\x11\xc4\x86\x65\x12\x7c\x0d\x96\x65\xe8\x2d\xf4\xd2\x28\x34\xc0\
+\x07\x24\xbf\xcb\x76\x6e\xcb\x44\x40\x3b\x32\x2e\xd1\x7a\x17\xd3\
+\xa0\xd9\x52\x6b\xc5\x91\x99\x23\x4c\x46\x93\xd0\x0b\x78\x10\xdb\
+\x31\x4b\x6a\x1e\xcb\x72\xb0\x01\x07\x83\x27\x52\x02\x00\xa3\x7c\
+\xa2\x10\x4c\x4b\x54\x36\xda\x20\xc3\x3a\x46\x55\xc1\x48\x74\xea\
+\x04\x23\x0d\xa1\x16\xf8\x1a\x96\x54\x8c\xb2\x62\xf0\x48\xc8\x0e\
+\xb9\x96\x22\xbf\xd3\xb5\x05\xac\x07\xbe\x9d\xd6\xdb\x01\x6f\x1e\
+\x37\x22\x9f\xa3\x73\x1f\x20\x2d\x99\xe4\x9b\x0e\x2c\xc8\x39\x26\
+\x66\x23\x36\xeb\x5e\xfa\x6c\x87\x92\x0d\x35\x1b\x4a\x36\x14\x6d\
+\x68\xcc\x45\x44\x55\x0b\xdd\x62\x01\xda\x68\x96\xaa\x35\xa2\xe9\
+\xf3\xd4\x43\x8f\x86\x86\xba\x4a\xb6\x5a\x0c\x55\x1d\x73\xce\x5a\
+\x62\x41\xd4\x12\xb7\x9f\x03\x5c\xf2\xe4\xf9\xad\xcc\x16\x70\xd1\
+\x14\x68\x07\x34\xe3\x34\x68\x92\x60\x0c\x2c\x06\x8b\x4c\xd4\x4f\
+\x26\x83\x72\x00\x0b\x8c\x6f\xa8\x9f\x0e\xd0\x72\x88\xd8\x29\x10\
+\x58\x02\x6d\x09\x02\x21\xa8\x0a\xd0\x52\x31\xe8\x6e\xc6\x16\x2b\
+\x43\xb7\x85\x43\x4e\x6d\x66\x7e\x22\x62\x71\xd2\x46\x6a\x90\xc6\
+\x10\x69\x83\xd4\x86\x58\xf9\x34\x9c\x00\x6e\x30\xcb\x44\xa7\x44\
+\xdc\x9a\x3d\x0c\xae\x4e\x78\xd6\xd1\xf6\x9a\x4e\xb0\x65\xdf\x68\
+\xcd\x62\xb0\xc8\xac\xba\x70\x31\x01\x0d\xd8\x52\x1f\xe6\xa7\xf7\
+\xee\x66\x5b\xe5\x0b\x18\xb3\x92\xee\x26\x37\x1a\x5c\xdb\x65\x73\
+\x79\x78\x79\x7c\x9b\xcb\xc3\x7c\xff\xf7\x1f\x47\x2a\xb9\xfc\x5c\
+\xd3\x92\x25\x9e\xba\x70\x8a\x3f\xf9\xf7\x07\xa8\xf9\xa7\x13\xed\
+\xdb\xcb\x24\x6c\xce\x46\x40\x3a\x80\xae\x2d\x60\x9d\x69\x60\x8c\
+\x21\x90\x3e\x81\x09\x96\xc1\x03\xa0\xc0\x89\x5d\x6e\x18\xf8\x02\
+\xdb\x2a\xdb\x33\x59\xa7\x63\xbb\x5c\x3b\x78\xc3\x9a\xd7\x75\xda\
+\xa7\x50\xe9\x00\xac\x94\x04\x97\x7c\x67\x02\x56\x62\x60\x5b\x2d\
+\x77\xb4\x84\x35\xac\xc2\x18\x43\xac\x14\xc6\x32\xad\x2c\x5f\xbd\
+\xfa\xbb\xb5\xe3\x26\x01\x76\xe7\x4c\xd0\xb4\xde\xbf\x16\xf8\x4e\
+\x71\xff\x12\x42\xd2\x8e\x6d\x2c\x3c\xdb\x4b\x0e\x9a\x16\x60\x43\
+\xec\x48\xce\xcc\x9f\xc2\xb2\xc5\x72\xb8\x13\xcb\xcc\x81\x6b\xbb\
+\x6c\xe9\x1b\xc6\xb1\x93\x4a\x3d\x56\x92\x73\x8b\x53\xe9\x14\x48\
+\xda\x34\x07\x2e\x84\xc5\x99\xf9\x53\xc4\xb6\x4c\x40\x37\x81\xd8\
+\x80\x45\x98\x3d\x0a\x64\x01\x9f\xc1\x02\x5a\x49\xc8\x8b\x02\xfd\
+\x4e\x3f\xa8\x96\x67\x15\x61\xa6\x38\xc5\x77\xff\xf3\x01\x8a\xb6\
+\x8b\x2b\xc0\xb3\xd2\x4d\x80\x96\x9a\x8a\xb7\x8d\x1f\x7e\x6b\x0f\
+\x5b\x07\x12\xb3\x9f\xa9\x4e\xf1\x37\x2f\x3c\xc0\x6c\x74\x12\xe1\
+\x59\x44\x3a\x4d\x85\xd3\x50\xd8\x50\x92\x0b\xa5\x29\x28\xb6\xa8\
+\xd4\x02\x34\x73\x99\x32\xc1\xb6\x20\xb2\x80\x6f\x01\xbc\x1c\x3e\
+\x5b\xda\xf7\xd8\x25\x86\x9d\xe1\x24\xd7\x4d\x37\x93\x03\xbd\x4d\
+\x72\x41\x9e\xa6\xc7\x86\xb2\x03\x8e\x03\xae\x93\x84\x42\xb9\x08\
+\xb5\x19\x41\xac\xe5\xf2\x18\x95\x96\xd4\xad\x53\xe4\x6f\x98\xc0\
+\xeb\x87\x9a\x82\x28\x86\x20\x86\xa5\x18\x96\x34\x68\x07\x8c\xbb\
+\xf2\x1c\x04\xe0\x73\x32\xb3\x13\xec\x44\x42\xc7\x36\xab\xf6\x2d\
+\xcb\xa2\xe0\x15\xb8\xc5\xbd\x85\xd7\xe4\x6b\xc4\x3a\x86\x18\xb4\
+\x0d\xca\x03\x51\x02\xc7\x05\xd7\x85\x9c\x0b\x05\x07\x8a\x0e\x48\
+\x07\x54\x43\x20\xac\x96\x01\x5a\x90\xeb\x11\x38\x15\xf0\x06\x40\
+\x29\x90\x12\x42\x09\xb6\x04\x11\x83\x92\xa0\x63\x12\x6b\x33\x80\
+\x21\x62\x9a\x91\x6c\x79\x40\x6b\x02\xd4\xa5\x0f\x68\x67\x01\x02\
+\xb0\x6d\x8b\x9c\x97\xe3\x4b\xde\x97\xa8\x04\x15\xa6\xc5\x74\x5a\
+\xf5\x80\xb4\x20\x20\x89\x58\x9e\x01\xd7\x80\x9d\x0c\x1a\xa5\xc0\
+\x6b\xce\xe5\x95\xe1\xa1\x6c\x08\x14\x38\x32\x49\x7e\xea\x12\x1a\
+\x31\x04\x29\x11\x91\x04\xa3\x5b\xa6\x80\xe4\x02\xc7\x38\xda\x55\
+\x2a\x2c\x56\x81\xcd\x04\x7e\x0d\x12\x2c\xcb\xc2\xcb\x7b\x6c\x2f\
+\x6e\xe7\xb6\xa5\xdb\x98\xb6\xa6\x93\x6b\x1a\x54\x5a\xc4\xb8\x1a\
+\x6c\x9d\xd4\x03\xe8\x24\x9c\x99\x18\xca\xab\x08\x30\x02\x62\x3b\
+\x01\x6e\x05\x2b\x19\x60\x5d\x42\x43\x82\x1f\x43\xac\x5a\xee\xb1\
+\x80\x59\x46\x38\xc8\x67\x16\x19\x44\xd0\x7e\x0e\xaf\x06\xbf\xae\
+\xb3\x5c\x45\x9a\x65\x59\xe4\x72\x39\x2a\xe5\x0a\x5f\xb3\xbf\x46\
+\xbf\xe8\x5f\xf1\xd2\x3a\xd1\x58\x23\x84\x7a\x08\xb5\x00\x96\x42\
+\xa8\x06\xb0\x24\x21\x6a\x13\x2b\x23\x91\x5c\x5b\x6c\xb6\x4b\xef\
+\xad\x87\x10\x46\xa9\xf6\x21\x79\x46\xcc\x02\xef\xf1\x4b\xce\x73\
+\x3e\x13\x01\xab\x93\x98\xd6\x7a\xa0\x55\xf3\xab\x89\x69\x67\x01\
+\xcb\x44\x09\x81\xe7\x79\xf4\xf6\xf5\xf2\x95\xe2\x57\xb8\x53\xde\
+\x89\x70\x44\x12\x98\x45\x32\xe0\x40\xa6\xe0\x03\xa8\xfa\xb0\xe8\
+\x43\x35\x82\xb0\xd5\x0a\xd3\xfd\x00\xa8\x86\x69\x9b\x00\x96\xfc\
+\xe4\xbe\x20\x4a\x2c\x0a\x41\x33\xfb\x33\x9c\xe4\x6d\xf6\xf1\x01\
+\x50\xcd\x5e\x0b\xac\x06\xd3\x06\x64\x47\x3f\xd1\xd2\x46\x08\x81\
+\x6d\xdb\xf4\xf4\xf4\x30\x3c\x34\xcc\x37\x17\xbe\xc9\x98\x1c\x63\
+\xb4\x30\x9a\xda\x35\xe8\x28\xf1\xe4\x5a\x82\xb4\x21\x72\xc0\x8e\
+\xa1\x8a\xe4\x4c\xed\x14\x26\xed\xeb\xf3\xda\x29\x96\xb4\xa4\x1a\
+\x26\x3e\x22\x54\xe0\xab\x64\x41\x44\x09\x92\xfc\xbf\x59\x05\xce\
+\x30\xca\xcb\xec\x63\x9e\xb3\x40\x2d\x7b\x14\xc8\x98\x0b\x64\x05\
+\x4f\x3a\x0d\xf2\xf9\x3c\x83\x95\x41\x76\xcc\xef\xe0\xfe\x73\xf7\
+\xb3\xc7\xdb\xc3\x74\x71\x7a\xd9\xdc\x74\x98\x00\x8a\xe3\x64\x5a\
+\xb8\x06\x26\xd4\x14\x7f\x7a\xf0\x01\xbc\x34\x11\x92\x5a\x32\x1d\
+\x4e\x11\x3a\x89\xf7\x8f\x0c\xc4\x80\x71\x52\xe0\x79\xa0\x00\x2c\
+\x31\xcd\xab\xbc\xc0\x21\x3e\x01\xe6\x00\x3f\x73\x14\x58\x17\x5c\
+\x86\xf0\xd8\x6e\xdd\x00\xc0\x71\x1c\xca\xe5\x32\xc3\x5b\x87\xb9\
+\xb3\x7e\x27\x8d\xf3\x0d\x9e\xbf\xe6\x79\xce\xf5\x9c\x4b\x4c\xd6\
+\x06\x13\x40\x2c\x41\xc5\x89\x56\x1b\x5a\xb2\xd0\x38\xbd\x52\x57\
+\x90\x38\x42\x6d\x40\x0b\x30\x76\xaa\xf5\x26\xf0\x26\xf8\xbd\x3c\
+\xcf\x2f\x78\x87\xe4\x85\x5b\x95\x24\xaa\x66\xb3\x80\x2c\xa9\x70\
+\xb7\xe0\x9b\xe7\x0a\x85\x02\x9b\x36\x6d\x22\x0c\x42\xee\x1a\xbf\
+\x0b\xfb\x73\x9b\x57\x87\x5f\x65\xa2\x3c\x81\xf6\x74\xa2\xc5\x00\
+\x4c\x98\x90\xa0\x14\x49\xc8\x6c\xa2\x6f\x2d\x70\x9a\xf5\x7e\x9e\
+\x24\xf3\xf3\x30\x4c\x71\x92\xe7\x78\x99\x17\x39\x84\xe6\x34\x70\
+\x3e\xe9\x31\x31\x92\x6c\xd2\xce\xf1\x75\x22\x25\x03\x78\x00\xdb\
+\xb6\x29\x95\x4a\x0c\x6f\x1d\x4e\x5e\x78\x4c\xc0\xc0\xe9\x01\xf6\
+\x0f\xed\xe7\xe8\x96\xa3\x54\xf3\xd5\xc4\xf3\x05\x24\xbf\x92\x24\
+\xa1\x69\x92\xb0\x52\xdd\x25\x64\x15\x40\xe4\x05\xf9\x30\xaf\xe5\
+\x01\x79\x3c\x7e\x2e\x7e\x95\x0f\x39\x0c\x4c\x00\x67\x81\x7a\xda\
+\x43\xb6\x65\xf1\x4c\xe9\x2f\x6c\x08\x7c\x53\x5c\xd7\xa5\x5c\x2e\
+\x73\xdd\x75\xd7\x61\xdb\x36\xb9\xd3\x39\x2a\x33\x15\x76\xce\xed\
+\xe4\xbd\x4d\xef\x31\x3a\x30\xca\x62\xef\x22\xaa\xa8\xd6\x25\xc0\
+\xb6\x6d\xfa\xe2\x3e\x6e\x9e\xb9\x99\x9b\xc6\x6f\x0a\xde\xf8\xd7\
+\x37\x3e\x9a\x1c\x9f\x3c\x06\x8c\x03\x93\xa4\xa6\xdf\x7c\x6e\x57\
+\x16\xb0\x2e\x09\x6b\x84\xca\x2c\xe0\x9b\xe7\x5c\xd7\xa5\xaf\xaf\
+\x0f\xc7\x71\x28\x14\x0a\x94\x7a\x4b\x0c\x4c\x0d\x70\xcb\xe4\x2d\
+\x9c\x39\x7b\x86\x89\xe2\x04\xa7\x8b\xa7\x99\xf5\x66\xa9\xdb\x75\
+\xa4\x48\xaa\x3f\x37\x76\x29\xa9\x12\x95\xb0\xc2\xf5\x8d\xeb\xd9\
+\xde\xd8\xce\x0d\xd6\x0d\x38\x9e\xa3\xde\xf7\xde\x9f\x99\x64\x72\
+\x02\x38\x03\x2c\x91\xf8\xc7\x65\xe9\xae\x16\x80\x35\x3d\x7f\x5b\
+\x32\xba\x00\xdf\x4a\x42\x6f\x6f\x2f\x9e\xe7\x51\x2a\x95\x18\x1c\
+\x1c\x64\xd3\xf9\x4d\x0c\xcf\x0d\x73\xeb\xd2\xad\xd4\xce\xd5\xa8\
+\xa9\x1a\x3e\x3e\x71\x8a\xc5\xc1\xa1\x20\x0a\xf4\x58\x3d\xf4\xe4\
+\x7b\xe8\x1d\xec\x65\xb0\x32\x88\x65\x59\x6a\x70\x68\xf0\x02\x70\
+\xae\x1d\xf8\xae\x2c\xe0\x22\xc0\x5d\x58\x44\x56\xf0\xad\x62\xdb\
+\x36\xc5\x62\x31\x49\x94\x7a\x7b\xa9\x54\x2a\x54\xab\x55\xaa\xd5\
+\x2a\xb5\xa5\x1a\xbe\xef\x23\x23\x89\x52\x6a\xb9\xbd\x9b\x73\x29\
+\x14\x0a\xf4\xf4\xf4\x50\x2e\x97\xe9\xeb\xeb\x23\x8a\x22\x5d\x2e\
+\x97\x1b\x24\xde\x43\xd1\x46\xb2\xaf\x08\x71\xe9\x1c\x5f\x7d\xee\
+\x4a\x80\x6f\x3d\xef\xba\x2e\x8e\xe3\x90\xcf\xe7\x9b\x80\x08\xc3\
+\x90\x28\x8a\x90\x52\x2e\xbf\x1c\xb1\x2c\x0b\xd7\x75\xf1\x3c\x8f\
+\x5c\x2e\x47\x2e\x97\xc3\xf3\x3c\x16\x17\x17\x71\x1c\xa7\xb5\x04\
+\xda\x00\x01\xab\xb4\x2f\xd6\x39\xb7\x36\x87\x1b\x27\xa4\x39\x2d\
+\x5c\x37\xd1\xb0\xd6\x1a\x63\xcc\xf2\x6f\xb3\x8d\x65\x59\x58\x96\
+\xb5\x9c\x66\x37\x8f\x3b\x49\xe6\x05\x91\xb5\xbc\x7f\xa7\x79\x7f\
+\xa5\xac\xa1\x15\xe8\x95\x94\xae\x32\x41\xd1\xe6\xdc\x45\xd7\x45\
+\x27\x5b\xb8\x7c\x42\xae\xb4\x74\x9d\x08\xb5\xd5\x7e\x46\xb0\x57\
+\x0a\x7c\xd3\xf4\x57\xef\xb7\x8a\x65\x59\x68\x63\xd6\x9e\xfc\xdd\
+\x10\xd0\xba\xa4\x75\xc9\x00\x33\x9a\xfe\x95\x00\x6f\x8c\x59\x06\
+\xdc\xba\xdf\xb6\x2d\xa0\xb5\x59\xfe\x8c\xe6\xb2\x08\xb8\x88\x84\
+\xd5\xc0\xb3\x76\x70\x19\xe0\x9b\x60\x57\x6f\xad\x8e\x70\x75\x3f\
+\x96\x65\x11\x2b\x8d\xee\x60\x02\xdd\x2d\x89\xad\x01\x7c\x23\xda\
+\xef\x06\x7c\x13\xa8\x31\x06\xa5\x54\xf2\xd9\x4e\x9b\x68\xd0\xec\
+\xa7\xf9\xd1\x94\x8c\xe3\x75\xad\xa4\x6b\x02\x3a\x01\xcf\xdc\x47\
+\x06\x82\x56\x6b\x5a\x6b\x8d\x52\xaa\xcd\xa6\xd3\x7c\xa0\x19\x12\
+\x2d\x6c\xdb\xc2\x76\x3d\x1a\x61\x14\x07\x41\x18\xb3\x52\x35\x6c\
+\x90\x80\x96\x64\x68\xf9\x78\x83\xe0\xba\x05\xdf\x04\x1a\xc7\x31\
+\x4a\x29\xa4\x94\x48\x29\xd3\x64\x28\x4e\x2d\x42\xa5\x9a\x4e\xb4\
+\xef\xe6\xf3\x58\xae\x52\x47\x0e\xbf\xfb\xe1\xc8\xc8\x87\x13\x24\
+\x9f\x44\xb4\x35\x85\x0d\xa5\xc2\x57\xc2\x0a\xd6\x93\x56\xf0\x71\
+\x1c\x13\xc7\x31\x32\x8e\x09\x83\x90\x30\x0c\x08\x82\x24\x1b\x8c\
+\xa4\x44\xa5\xc4\x18\x4c\xba\xb6\x50\x44\xdb\xb6\xf9\xe8\xfd\xf7\
+\xfe\xfb\xc7\x3f\xfc\xc1\x33\x17\xce\x9f\x1f\x21\xa9\x03\xda\x4a\
+\xe6\x28\xb0\x9a\xbe\x8d\xcc\xeb\x6e\xb4\xdf\x0a\x3e\x8a\x22\x7c\
+\xdf\xa7\xe1\xfb\xf8\xbe\x4f\xe0\x07\x49\x4a\x2c\x25\xb1\x94\x68\
+\x63\xc8\x79\x1e\xfd\xfd\x7d\xe4\x72\x1e\x9f\xfd\xcf\x27\x9f\x3c\
+\xf2\xd0\xbf\x3c\xfe\xf1\x47\x1f\xbd\x49\x52\x02\xcb\xb5\xc6\xb8\
+\x61\x27\x98\x05\x70\xb7\xb2\x7a\xbe\x37\xc1\x37\x1a\x0d\x6a\xb5\
+\x3a\x8b\xd5\x45\xea\xb5\x3a\x41\x10\x10\x45\x11\xda\x18\x0a\xf9\
+\x3c\x95\x4a\x85\xca\xa6\x0a\x02\xc3\xf1\xcf\x8e\x4f\xfc\xec\x67\
+\xcf\x3c\xf6\xd6\x5b\x87\xf6\x77\x02\xdf\x35\x01\x97\x03\x78\x23\
+\xda\x97\x52\xe2\xfb\x3e\xf5\x7a\x9d\x85\x85\x05\x2e\xcc\x5e\xc0\
+\xb6\x6c\xbc\x9c\xc7\xe0\xe0\x00\x43\x43\x43\x0c\x0e\x0e\xe2\xba\
+\x2e\xd5\x6a\x95\xe3\xc7\x3f\x9d\xde\xbb\x77\xef\xa3\x2f\xbf\xb4\
+\x77\x5f\x16\xf0\x1b\x22\xa0\x93\x15\x6c\x84\x9c\x56\xf0\xad\x16\
+\x10\x86\x21\x8d\x86\x4f\xbd\xde\x60\x69\x69\x09\x21\x04\xbb\x76\
+\xdd\x41\xb9\x5c\xc6\xb6\x93\xcf\x64\x83\x20\x60\x76\x6e\x96\xb1\
+\xb1\xd1\xb9\xd7\x5e\x7f\xed\xb1\x3d\x4f\xee\xf9\x45\x56\xf0\xb0\
+\xf2\x56\x3e\x03\xf2\xd6\x77\x51\xed\x93\x8f\xec\x5d\xad\xad\xfd\
+\x26\x78\x29\x25\x41\x10\xa6\x73\xbf\x41\xc3\x6f\xe0\x3a\xc9\x62\
+\x49\x2e\x97\x03\x0c\xbe\xef\x33\x3b\x3b\xcb\xf8\xf8\xd8\xd2\x81\
+\x03\xbf\xdc\xbd\xfb\x89\xdd\x4f\xc5\xb1\xca\x0c\xbe\x3b\x02\x36\
+\x08\x36\x4b\xfb\xd6\xf4\xb6\x49\x40\x14\x45\x04\x61\x40\x10\x04\
+\x89\xe3\x0b\x42\x4a\xa5\x12\x8e\xe3\x10\xc7\x12\xdf\x0f\x98\x9b\
+\x9b\x63\xfc\xc4\x58\xfd\xd0\xa1\xb7\xf6\x3c\xb9\x7b\xcf\xa3\x8b\
+\x8b\xd5\xd3\xdd\x80\xef\x8a\x80\xab\x5d\x9b\xb5\xb3\x80\x28\x4c\
+\x16\x40\x82\x20\x44\x2b\xcd\xd0\xd0\x20\x40\x2b\x78\xff\xf0\xe1\
+\x77\x9f\x79\xfa\xa9\x67\x1e\x9a\x9c\x3c\x7b\x8a\x36\x4b\x5e\x9d\
+\xa4\x3b\x1f\xb0\xaa\x36\xbf\xd2\x04\x34\xe7\x7f\x1c\xc7\x44\xcd\
+\x84\x27\x4d\x7a\xf2\xf9\x1c\x43\x43\x43\x04\xc1\x8a\xe6\x0f\x1f\
+\x7e\xf7\x99\x9f\x3f\xfb\xdc\x4f\xc6\xc6\xc6\x27\x36\x02\xbe\x7b\
+\x02\x8c\xc9\xe4\x00\x37\x02\xbe\xf9\xbb\x6c\x05\x71\x9a\x07\xa4\
+\xd9\xde\x96\xe1\x61\x72\xb9\x1c\xb3\x73\xb3\x8c\x9f\x18\x5b\x3a\
+\xf4\xf6\xa1\x27\x9f\x7e\xea\xe9\x87\xc6\x46\xc7\x4f\x6e\x14\x7c\
+\xd7\x04\x64\x85\x7e\x39\xd6\xb1\x62\x09\x69\xae\xaf\x15\x39\xcf\
+\x63\xcb\x35\x5b\xa8\x56\xab\x8c\x8d\x8d\xce\x1d\x38\x78\xe0\x89\
+\x3d\x4f\xfe\xdb\xa3\x9f\x9f\xf9\xfc\xf4\xe5\x80\xef\x9a\x00\xb3\
+\x6a\x41\x74\x23\xb2\x9a\x9c\x76\xf5\x7d\x42\x42\x7a\x6c\x60\x70\
+\x68\x08\xc7\xb6\x38\xfe\xd9\xa7\x53\xff\xf5\xfa\xeb\x8f\xee\x7e\
+\x72\xcf\x53\xf3\x73\xf3\x9f\x5f\x2e\xf8\x4e\x04\xa4\x1f\xa5\xb4\
+\x0c\xfe\x72\x9f\xb6\x06\x21\xed\x6b\xfa\xe4\xb7\x50\x2a\xd1\xd7\
+\xdf\xc7\xe8\xe8\xe8\x89\xbd\xaf\xec\x7d\xf8\xc9\xdd\x7b\x5e\x88\
+\xe3\xf8\xec\x95\x00\xdf\x89\x80\x4b\x19\x49\xff\xd9\xb5\x7a\x7f\
+\xbd\x76\x59\xaf\xad\xfe\x1c\x3f\xa9\xea\x0a\xe4\x5c\xd7\x4c\x4c\
+\x9c\xf8\xf8\xe7\xcf\x3e\xfb\xc8\x8b\x2f\xbc\xb8\x8f\xe4\xcd\xee\
+\x15\x01\xdf\x91\x00\x91\x08\xb6\x6d\x27\x35\x77\x86\xf5\xff\x76\
+\xe7\xb3\x1c\x0b\x21\x10\x96\x85\x65\xdb\xd8\x8e\x8b\x9b\x2f\x92\
+\xb3\x3c\x75\x6c\xe4\xe8\x91\xc7\x1f\x7d\xf8\xb1\x03\x07\x0e\xbe\
+\x71\xa5\xc1\x77\x24\xa0\xd1\x68\xc4\x73\x73\x73\x0b\x80\x30\x9d\
+\x96\x56\xd6\x27\x72\xcd\x6b\xc6\x18\xb4\x01\xa5\x35\xb1\x52\x44\
+\x52\x11\x4a\x49\x2d\x88\xe2\xa3\x1f\xbc\xff\xc1\x4f\xff\xf9\x9f\
+\x9e\xfa\x68\x64\xe4\x4d\x60\xfa\x4a\x83\x87\x75\x16\x74\x81\x4d\
+\xe9\x1f\x27\xbf\x58\x28\x14\xec\xcb\xc0\xdf\x51\x4c\xba\x7a\xab\
+\x97\xc3\x20\x04\x61\x20\x3f\x3d\x76\x6c\xec\xdc\xf4\xd4\xc8\xd5\
+\x02\xbf\x1e\x01\x90\x7c\x66\xd0\x47\xf2\xc6\xfd\x57\x21\x1a\x68\
+\x00\xb5\xab\x05\xbe\x13\x01\x59\xae\x5f\x6d\xb9\x7a\x66\xf7\xff\
+\x92\xc8\xff\x02\x85\xd4\x27\x29\xf9\x96\x51\xb8\x00\x00\x00\x25\
+\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\
+\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x33\x3a\x30\x32\
+\x3a\x31\x31\x2d\x30\x37\x3a\x30\x30\x4b\xf9\xc3\xed\x00\x00\x00\
+\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
+\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\
+\x36\x3a\x31\x35\x2d\x30\x37\x3a\x30\x30\x06\x3b\x5c\x81\x00\x00\
+\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
+\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\
+\x33\x32\x3a\x31\x31\x2d\x30\x37\x3a\x30\x30\xce\xd9\x51\xa3\x00\
+\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\
+\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\
+\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\
+\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\x20\x6f\x72\
+\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\
+\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\
+\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\x2f\x5b\x8f\
+\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\
+\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\
+\x54\x31\x33\x3a\x30\x32\x3a\x31\x31\x2d\x30\x37\x3a\x30\x30\x14\
+\x48\xb5\xd9\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\
+\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\
+\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x13\x74\x45\x58\x74\
+\x53\x6f\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\x6e\x20\x49\x63\
+\x6f\x6e\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\x45\x58\x74\x53\
+\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\
+\x2f\x77\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\x69\x63\x6f\x6e\
+\x73\x2e\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xc6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x04\x43\x49\x44\
+\x41\x54\x58\x85\xcd\x57\x4b\x6f\x1c\x45\x10\xfe\xaa\xab\x7b\x66\
+\x76\x67\xbc\x99\xc5\x96\xd7\xeb\x68\x51\x14\x10\x0e\x48\xe1\x21\
+\x21\xf9\x10\x59\x1c\x82\x20\x42\x42\xf2\xc1\xe2\x60\x9f\x80\x28\
+\xc6\x37\x9f\xf2\x1f\xb8\x71\x5b\x62\x41\x38\xd9\x07\xe4\x83\x4f\
+\x48\x20\xe5\x80\xac\x1c\x2c\x21\x11\x40\x09\x09\x20\x04\x58\x89\
+\x6d\xc0\xec\x26\x59\x3f\x76\x5e\xcd\xc1\x8f\x9d\xd9\x99\xb1\xf3\
+\x42\xa6\xa4\x3a\x4c\x75\x4d\xd7\x37\x5f\x57\x57\xd5\x90\xd6\x1a\
+\x47\x29\xe2\x48\xa3\xff\x1f\x00\xc8\x87\x71\x7e\xbf\x6e\x0d\x11\
+\xc4\x28\x0b\x31\x16\x41\xd7\xa2\x48\x97\x01\x40\x08\x6a\x08\xd0\
+\x72\x18\x45\xf3\x1a\xd1\xc2\xa7\x53\xdb\xb7\x1e\x74\x4f\x7a\x90\
+\x1c\x98\x9c\xb1\xab\x5a\xd3\x2c\xa0\x87\x9f\x72\x4b\x5c\xee\xb1\
+\x4d\x4b\x49\x18\x6a\x07\xbf\xe7\x07\xd8\xf6\x03\x34\xee\x6f\xb4\
+\xff\x69\xde\x0b\x01\x5a\x22\xd2\x13\x97\x2e\x6c\xac\x3c\x36\x80\
+\xf3\xf5\xe2\x38\x88\xea\x03\xbd\x6e\x61\xb0\xaf\xac\x88\xe8\x40\
+\x7f\xad\x35\xee\xfc\xdd\xf0\x57\xd7\x9b\x5b\xd0\x7a\xea\x93\xa9\
+\xcd\xb9\x47\x02\xf0\xee\x47\x65\x57\x59\xde\x9c\x94\x72\xe4\xe4\
+\xf1\x8a\x53\xb0\x8c\xee\x50\x07\x02\xd9\xda\xf6\xf0\xeb\xed\xb5\
+\x56\x10\x84\x8b\xfe\xb6\x31\xfe\xd9\x74\xa3\x99\xe5\x97\x9b\x84\
+\x6c\x79\x73\x6e\xc9\x39\x7b\xea\xc4\xa0\x63\x1a\x12\x51\x14\x75\
+\xa9\x3e\x50\x4d\x43\xe1\xd4\x89\xe3\x8e\x5b\x72\xce\xb2\xe5\xe5\
+\xb2\x90\xc9\xc0\xf9\x7a\x71\xdc\x50\xf2\xd2\x73\x4f\x0f\x3a\x59\
+\x94\xff\x79\xed\x59\x7c\xf5\xf9\x6a\xc2\xf6\xc6\x3b\x03\xe8\x7f\
+\xf9\x97\x94\xaf\xd6\x1a\x3f\xfd\x71\xa7\xe5\xf9\xc1\x64\xd6\x71\
+\xa4\x18\x98\x9c\xb1\xab\x92\xb9\x5e\x1b\xe8\x73\x34\x34\x22\x1d\
+\xa5\xd4\xe0\x02\x98\x39\xa1\x06\x17\x92\x7e\xbb\x4c\x69\xad\x51\
+\xab\xf4\x39\x92\xb9\x3e\x39\x63\x57\x0f\x05\xa0\xa4\x9a\xed\x75\
+\x4b\x05\x43\xca\x5c\x7a\x41\x94\x02\x00\xa2\xa4\x9f\xee\xa8\xa1\
+\x24\x7a\xdd\x52\x41\x49\x35\x7b\x20\x80\xe9\xcb\xa5\x21\x16\x3c\
+\xec\x3a\x45\x95\x3e\xf3\x8e\x12\x89\x14\x00\x22\x91\xf2\x0b\x63\
+\x7a\xcc\x29\x28\x16\x3c\x3c\x7d\xb9\x34\x94\xcf\x80\x34\x46\xed\
+\xa2\xc9\x3b\x34\xea\x5c\x25\x42\x06\x00\x20\xd4\xba\xa3\x19\xcc\
+\xd9\x45\x93\x21\x8d\xd1\x44\xc8\xf8\x83\x21\xc5\x98\xa5\xa4\x19\
+\x45\x9d\xc4\x6c\xfe\xf8\x4c\x02\xa3\x06\xb0\xb9\x1a\xed\xd0\x1e\
+\x93\xb5\xdf\x23\x14\xdb\x27\xbb\x19\x86\xfb\x7c\x27\x31\x4d\x25\
+\xcd\x20\x08\xc6\x00\x7c\x98\x09\x80\x49\xd4\x88\x08\x51\x14\xed\
+\xdb\xae\x5d\xc9\xba\xa9\xcd\x14\x80\x9f\xaf\x37\x81\xeb\x69\xdf\
+\x91\xa1\xce\xc7\x10\x11\x98\x44\x2d\xbe\x9e\x00\x20\x98\xcb\x1a\
+\x3b\x54\xee\x83\xea\x0a\xf4\xb0\x12\x67\x73\x2f\x46\x2e\x00\xc9\
+\xc9\xaf\x07\x00\x29\x1f\xaa\x5f\xa5\x01\xe8\xae\xfd\x38\x59\x57\
+\x92\x47\xc0\xdc\x08\xc3\xb0\x12\xaf\x4d\x4f\x92\x81\xdd\xe4\x6d\
+\xe4\x03\x10\xb4\x1c\x86\x54\x89\xa3\x7e\xfd\xed\x64\x12\x02\xc0\
+\xda\xb2\x87\x1b\x3f\xdc\x49\xd8\x5e\x38\x3d\x88\x4a\xad\xbb\x5f\
+\x00\x2b\xd1\x52\x67\x7f\x16\x60\x41\xcb\xf9\x00\x98\xe7\x65\xa4\
+\x4f\xfb\x41\x60\xee\xd9\x6e\xdb\xa9\xda\x81\x52\xff\x9b\x29\x66\
+\x8a\xfd\xf7\x70\xdb\xfe\x32\xe5\x1b\xef\x59\x26\x73\x9b\x99\xe7\
+\xe3\xcb\x89\xb4\x15\xac\x16\x2c\xd3\x08\x0f\x6b\x34\x40\x46\x25\
+\x44\xbc\x12\x66\x17\x30\xcb\x54\xa1\x60\xb5\x90\x0b\xe0\xe2\xb9\
+\x9b\xb7\x98\xc5\x92\x5d\x30\xfd\xac\x1e\xb0\xa7\x99\x85\x08\x48\
+\x75\xca\x30\xa6\x76\xc1\xf2\x99\x79\xe9\xe2\xb9\x9b\x89\x69\x29\
+\x95\xe2\xa2\xc0\x13\x2e\xdb\x37\xb7\xda\x9e\xf2\xfc\x20\x4d\x29\
+\xb0\x5f\x8a\x13\x36\x21\x12\xd7\x37\x2e\x86\x92\x70\x7b\xec\xad\
+\xd0\xc0\x44\x2a\x5e\xb7\x61\x7a\xe4\xc6\x0a\x29\x31\x35\xd0\xe7\
+\xb6\xb4\x4e\xd3\x19\xee\x5e\xd3\xf4\x11\x20\x93\x76\xad\x35\xaa\
+\x7d\x6e\x8b\x94\x98\x9a\x1e\xb9\x91\x1a\xd1\x72\x27\xa2\x8f\xbf\
+\x7e\xf1\x8b\xbb\xad\xcd\xb3\x2b\xeb\x0d\xa3\xdb\xa7\xc7\x2a\xc3\
+\x2d\x56\x76\x1e\x76\x97\x9a\x9b\x6b\xb8\xbf\x9d\xb8\x61\x20\x22\
+\x54\xfb\xca\xde\x31\xa7\x78\xe5\x83\xd7\xbe\x7f\x2b\x2b\x4e\x6e\
+\x95\xb1\x34\x8f\xf3\x31\x7b\xae\xa7\x68\x8d\xfc\xb6\xf2\x97\xb3\
+\xd5\xf6\xb0\x17\xf1\xee\xe6\x3a\xee\x6e\xae\xe7\xbd\x0a\x00\x28\
+\x98\x06\x4e\x54\xfb\x5b\x4a\xf1\xa2\x0a\xc4\x78\x9e\xdf\xa1\x43\
+\xe9\xcc\xd5\x57\xc6\x49\xeb\xfa\xda\x7a\xb3\xb0\xba\xde\x54\x87\
+\xf9\x13\x11\x06\x7a\x5d\xbf\xd2\xeb\x6e\x69\xa2\xa9\x0b\x67\xbe\
+\x7d\xb4\xa1\x34\x01\x62\xf1\xd5\x2a\xb4\x3f\xab\x81\xe1\xc6\xbd\
+\x16\x37\x5b\x1b\x66\xdb\xf3\xe1\xf9\x21\x00\xc0\x90\x0c\xd3\x50\
+\x70\x7b\xec\x76\xb9\xe4\x84\x04\x2c\x81\xd4\xc4\x85\x91\x6f\x1e\
+\x7f\x2c\x8f\xcb\xe5\xab\x2f\x0d\x69\x4d\xa3\x41\x14\x8d\x11\xa8\
+\x26\x98\xca\x00\x10\x85\xba\xa1\xa1\x97\xa5\x10\xf3\x44\x7a\xe1\
+\xbd\x33\xdf\x3d\xd9\x1f\x93\xff\x52\x8e\xfc\xdf\xf0\xc8\x01\xfc\
+\x0b\x5d\x94\xad\x35\x93\x65\x15\xa5\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x10\xe5\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0a\x61\x00\x00\
+\x0a\x61\x01\xfc\xcc\x4a\x25\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x0e\xe7\
+\x49\x44\x41\x54\x68\xde\xed\x9a\x6b\x90\x5d\x55\x95\xc7\x7f\xfb\
+\x71\xce\xbd\xe7\xdc\xdb\xb7\x3b\xdd\x9d\x90\x74\xa0\x09\x2f\x0d\
+\x82\x56\x90\x97\x52\x8c\x58\x0a\xc5\xa4\x8a\x42\x60\x54\x90\xb2\
+\x9c\x94\x02\x2a\xe0\x0b\x10\x07\x9c\x1a\x47\x1e\x23\x50\x28\x01\
+\x81\x91\xf0\x18\x29\x40\xb0\xd0\x11\x70\x24\x08\x54\x80\xd1\xe1\
+\x11\x03\x81\xe8\x20\x01\x92\xce\xd3\x74\x42\x77\xfa\x71\xfb\x9e\
+\x7b\xef\x79\xec\x3d\x1f\xce\xb9\x27\xdd\x9d\xdb\x1d\xc5\x0f\x33\
+\x1f\xe6\x54\xef\xba\x8f\x3e\xfb\xec\xff\x7f\xad\xff\x5a\x6b\xaf\
+\xdd\x0d\xff\x7f\xfd\x1f\xbc\xac\xb5\x58\x6b\xcb\xd6\x5a\xf9\xbf\
+\x8d\x65\x5f\x97\x98\x81\x80\x5a\x71\xc7\x8a\xc7\xde\x5c\xbf\x7e\
+\x69\x14\x47\x02\x04\x22\xbb\xb3\x7f\xd1\xc1\x1c\xfd\xe1\x8f\xe0\
+\x17\x5c\x94\x4c\xf9\x09\x21\xd2\x81\x00\x91\xde\x2b\x84\x44\x0a\
+\x81\x90\x22\x7d\x2f\x65\x7a\x8f\x14\xd8\x74\x11\xc0\x66\x3f\xa6\
+\xb5\x70\xfe\x1d\xd6\x10\x1b\xcb\x44\xbd\xc9\xf3\xcf\x3e\xc5\x96\
+\x4d\x9b\xb0\xe9\x4c\xac\x05\xad\xb5\x39\xf2\xc8\x23\x1e\xd5\x6d\
+\x59\x09\x91\x7c\xf9\x8b\x5f\x3a\xb5\x5a\xad\x8a\xb1\xf1\x31\x94\
+\x54\xcc\x9f\xbf\x00\x80\x72\xb9\xcc\xc2\xfe\x45\x74\x78\xc5\x9c\
+\xc0\xac\xd6\x11\x02\xd2\x9f\xcc\x5a\x02\x33\xfc\x0e\xc3\x2b\x6e\
+\xa7\x70\xf0\xc1\xf8\x4b\x8e\xa6\x78\xc4\x11\x20\x04\x32\x9b\x94\
+\x1a\x03\xe2\x24\x61\xb4\xd6\xa0\x5c\x2a\xd3\x68\x34\xa7\x3c\x3b\
+\x6c\x86\xf2\x8d\x3f\xbe\xf1\x09\x3d\xd3\xe2\xd6\x1a\x35\x5e\xad\
+\x12\x86\x11\x51\x1c\x30\x9f\xfd\xa6\x00\x93\x52\xec\x93\x40\x8e\
+\x7f\xb2\x9f\x93\x98\xd1\x3b\x6f\xc7\x6e\xdd\xcc\xd8\xab\xaf\x30\
+\xf1\xe4\x13\x54\x3e\xfa\x31\x3a\xcf\x38\x0b\xd9\xdb\x3b\x65\x8e\
+\x30\x93\x27\x9a\xbd\x9e\x6d\x8c\x91\x33\x12\x30\x06\x5c\xd7\x65\
+\xfe\x82\xf9\x04\x13\x35\x4c\x6b\xbe\xb5\x08\x01\x52\x08\x5e\x7d\
+\xfb\x4f\xfb\x24\x30\xcd\x2c\x14\xd6\x7d\x93\x79\x83\x96\x28\x30\
+\x38\xe5\x32\x8d\x17\x5e\x60\xd3\xe3\x8f\x53\x5a\xf9\x38\xe3\xe7\
+\x5f\x82\x3a\xf8\x90\xdc\x5b\x4b\x0e\x5b\x80\x14\x02\x8b\xdd\xb3\
+\xfe\x64\x8c\xd6\xa2\x67\x5e\xcc\x10\xc7\x31\x7f\xda\xb6\x9d\x38\
+\x49\xe8\xf7\xbd\x29\x56\x55\x12\x8e\x5b\xbc\x70\x1f\xe6\x4f\x6f\
+\x6e\xd9\x71\xfb\xea\x2b\xe9\xed\x5b\x45\xe1\xd3\x0b\x18\xf8\xf1\
+\x5c\x2a\x03\x75\x8a\xa5\x12\xfe\xb1\xc7\xb2\xe3\x91\x47\xe8\x18\
+\xdc\xc1\xe2\x87\x7f\x4e\xb1\xbf\x3f\x95\x49\x12\xa7\xcf\xb0\xed\
+\x3d\x80\x35\xcc\xa8\x01\x63\x2c\xbd\x3d\x3d\xcc\x9f\x3f\x9f\xfd\
+\x17\x2e\xc4\x18\x8b\x31\x16\x6b\x2d\x42\x88\x4c\x42\xe9\x6b\xbb\
+\xa1\xf2\x91\x92\x1d\x59\xbf\x82\xee\xda\x8f\x28\x77\x74\xd3\x94\
+\x3b\xb9\x3f\xda\xc8\xa6\x89\x09\x1a\x41\xc0\xc4\xd3\x4f\x33\xef\
+\x9c\x73\x18\x7d\xf9\x65\xde\xfa\xfc\x32\x84\xb0\x48\xb9\x27\xc3\
+\xa4\x1e\x68\x3f\x66\x24\x90\xa5\xd2\xbd\x46\xcb\xb0\x2d\x80\x7a\
+\x86\xa1\x54\x36\xa4\x60\x7c\xdb\x4a\x9c\x6d\x57\x50\xee\xec\xa5\
+\x1e\x8c\x73\xe3\x43\x92\x9f\xaf\x2b\x70\xc1\xf8\x38\xaf\x05\x01\
+\x61\x10\x30\xf2\xd0\x43\x34\x7d\x9f\xe1\x67\x9f\x65\xf8\xf1\x95\
+\x24\xc6\x92\x18\x72\xa3\xcd\x34\x66\x21\x60\xda\x0e\xb0\x99\x95\
+\x41\x6a\x81\x54\x6d\x3c\xa0\xf6\x7c\x5f\x7b\x67\x2d\xcd\x3f\x7c\
+\x9e\xce\xae\x6e\xa2\xb0\xc1\x03\x4f\xc6\x3c\xfc\x9b\x4e\xc2\x30\
+\x64\xc7\xc4\x04\xe7\x8d\x8f\xb3\x5a\x0a\x02\xa5\xd8\x11\x45\xec\
+\xaa\x54\xa8\x6d\x78\x3b\x23\x60\x30\xd6\x62\x8d\x6d\x8b\xc5\x18\
+\xc3\xac\x41\x3c\xa3\x67\x26\x49\x9c\x69\x59\xc6\x4e\xba\xb7\x36\
+\xba\x85\xea\xcb\x9f\xa4\xb7\xdb\x27\x49\x62\x56\xfd\x2e\xe4\x96\
+\x47\x7a\x48\x92\x84\x5a\xad\x46\xad\x56\x23\x4a\x62\xf8\xaa\x47\
+\xb4\x3e\x21\x7e\x22\x24\x90\x12\x7d\xec\x71\xc4\x89\x21\x49\x0c\
+\x58\x8b\xb1\xed\x83\xd8\xee\x2b\x88\xdb\x13\x00\x6b\xd2\x87\x3f\
+\xf6\xbb\xf5\xd8\x29\x90\x27\xdd\x17\x4d\x70\xf8\xe8\x32\x0e\xec\
+\x31\x08\x24\xaf\xbe\xd9\xe4\x3b\xf7\xcf\x25\x4e\x22\x82\x20\x20\
+\x08\x02\xc2\x30\xe4\xb2\x73\x5d\x3e\xf6\xc1\x88\xe2\x87\x24\xde\
+\x3c\x9f\x0d\x47\x7c\x9f\xdf\xd4\x7d\xf4\x4b\x6f\xf2\xd1\x25\x8b\
+\x52\x09\xcd\x80\xc7\x18\xfb\xee\x3c\x60\x2c\xc4\x89\xe5\x94\xa3\
+\x0f\xc9\xbd\x30\x65\x6e\x1c\x32\xb2\xfa\x4c\xe6\x74\x07\x28\xa7\
+\xc4\x86\xcd\x23\x5c\x7e\xd7\x5c\x26\x6a\x4d\x1a\x8d\x06\xb5\x5a\
+\x8d\x7a\xbd\xce\x39\x27\x6b\xfe\xfe\x54\x43\xc1\x55\xf8\x9e\xc3\
+\xc2\xaf\xde\xc4\xfe\xdd\xa7\x52\xa9\x54\xd0\x8e\x4b\x9c\x24\x18\
+\x52\xad\xb7\xc7\x33\x8b\x84\x52\xbd\xb7\x23\x96\xea\x32\x36\x06\
+\x91\xb4\xdb\x89\x58\x86\xd7\x5c\xcc\x5c\x35\x80\xeb\xf7\x32\xb8\
+\x63\x90\xcb\xef\xea\x61\xe7\x70\x48\x14\x45\x39\xf8\x93\x96\x48\
+\xae\xfc\xac\xa0\xe0\x0a\x7c\x4f\x31\xd1\x7b\x29\x4d\xff\x24\x3c\
+\x21\x49\x0c\x88\xc4\x90\x24\x29\x70\x63\x4c\x5b\x3c\xb3\x7a\xa0\
+\x95\x71\xf6\x9a\x64\xd3\xf4\x95\x24\x16\xd1\xc6\xad\x23\xaf\xdf\
+\xc0\x5c\xfb\x5b\x8a\x95\x05\x8c\x0e\x6f\xe7\xda\x07\x7b\x79\x73\
+\x73\x8d\x38\x8e\x73\xdd\x2f\xee\x87\x1b\x2f\x52\x14\x0a\xe0\x7b\
+\x9a\x89\xca\x67\x18\xf3\x3f\x89\x27\x24\x42\xaa\xd4\xc3\xc6\x10\
+\x1b\x93\x4a\xc8\xd8\xb6\x78\xf6\x21\xa1\x19\x08\x18\x93\x49\x68\
+\x6f\xf0\xc1\x96\x9f\xd2\x53\xff\x09\x7e\xcf\x7b\x08\xc6\x07\x59\
+\xf1\xeb\x45\x3c\xb3\x66\x2b\xd6\x5a\xea\xf5\x3a\x41\x10\x30\xb7\
+\x2b\xe1\xd6\x4b\x14\x1d\x3e\x94\x3c\x4d\xdd\x3f\x89\x9d\xc5\x2f\
+\x52\x94\x0a\xa4\x02\x21\x31\x16\x4c\x16\xc4\x86\x2c\x1b\xb5\xc1\
+\x63\xac\xf9\xcb\x83\xd8\x98\x34\x33\xc4\x89\xc1\xda\x3d\xf2\x0f\
+\x87\x9e\xa3\x73\x64\x39\xe5\xb9\x1f\xa0\x19\xec\xe6\xe7\x2f\xf4\
+\x71\xdf\x2f\xdf\xca\xc1\xd7\x6a\x35\xb4\x68\x70\xdb\x37\x24\x0b\
+\xba\xa1\xe4\x6b\xa2\xe2\xfb\x18\xd0\x97\x53\x90\x1a\x21\x24\x42\
+\x28\xac\x10\xc4\x99\xe0\x13\x63\xb0\xc6\x62\xac\x61\xa6\x4a\xfc\
+\xee\x82\x38\xcb\xd1\xab\xdf\xd8\x0e\x80\x6a\x6c\xe4\x38\xf9\x5d\
+\x3a\x16\x1c\x41\x14\x05\x3c\xf7\xfb\x32\xcb\xef\xdb\x88\x31\x86\
+\x30\x0c\xd3\x74\xd9\x0c\xb8\xfd\x52\xc5\xe2\x03\xc1\xf3\x14\xa1\
+\x5e\xc0\x63\xdb\x2e\x24\xd1\x55\x0a\xc5\x08\xb7\xe8\x51\x2c\x78\
+\x68\xc7\x05\x29\xc1\x5a\x8e\x3a\x74\xbf\x4c\x42\xa6\xfd\x5e\xc8\
+\x30\x8b\x07\x66\x0b\x62\x2c\x49\x62\x38\xea\xd0\xfd\x88\x1b\x43\
+\x94\x07\xbe\xc7\xbc\xbe\xf7\x63\x8c\xe1\xad\xed\x31\xff\x72\xcf\
+\x36\x1a\x8d\x26\x71\x1c\xe7\x29\xf3\xea\xf3\x34\x27\xbc\xdf\xe2\
+\x7b\x1a\xa7\xd0\xc5\x6b\xf1\x3f\xb2\xe8\x80\x83\xf0\x3c\x1f\xcf\
+\xf3\x29\x7a\x1e\x9e\xef\xa3\x94\xca\x5b\x82\xc4\xd8\x3c\xe6\xda\
+\xe1\xb1\xb3\x16\xb2\x99\x82\x38\xdb\x83\x44\x18\x6c\x1c\xd0\x35\
+\x78\x0d\xbd\x0b\x8f\x04\xe9\xb2\x73\xb8\xca\x15\xb7\x8d\x32\x34\
+\xb4\x1b\x6b\x2d\x41\x10\x50\xab\xd5\xf8\xd2\xe9\x96\x4f\x9c\x68\
+\xf1\x3d\x45\xb1\x58\xe4\xa5\xfa\x25\xd4\x54\x5f\x1a\xb4\x42\x82\
+\x90\x48\xe5\x60\x11\x69\x6c\xb5\x7a\x1a\x6b\x01\x91\xae\xd9\x06\
+\x8f\x9d\x2d\x8d\x32\x63\x16\x4a\xd3\x28\x49\x4c\xe7\xe0\x35\xf4\
+\x74\x77\x21\xdd\x0a\xbb\x87\x77\xf3\xed\x1f\x55\xd9\xb0\x71\x0b\
+\xc6\x98\x5c\xf7\x4b\x8f\x8b\xb8\xf0\xcc\x34\x55\xfa\x9e\xcb\xea\
+\xea\xf9\x0c\xdb\xf7\x50\xd4\xad\xa0\x55\x48\xed\x22\x94\x9a\x02\
+\x3e\x05\x08\x92\x74\x1b\xc1\x5f\x9c\x85\x66\x92\x50\x6c\xb0\xd6\
+\xe2\x0c\xfe\x90\xb9\x3d\x1d\xe8\x62\x37\xe3\xc3\x5b\xb8\xfe\xbe\
+\x1a\x6b\x5e\x79\x1d\x6b\x6d\xae\xfb\x25\x87\x84\x5c\x7d\x9e\xc4\
+\xf7\x24\x25\xcf\xe1\xb5\xea\xdf\xb1\xa5\x7e\x2c\x45\x4f\x22\xa4\
+\x04\x14\xd2\x71\xd0\x8e\x8b\x31\x7b\x5a\xcb\x29\x58\x95\x4c\x0b\
+\x5a\x5b\x09\xcd\x56\x07\x66\x08\xe2\x35\xab\x5f\xe0\xb0\xb9\x6f\
+\x70\xda\x89\x1d\xb8\xa5\x45\x04\xe3\x3b\x78\x60\x95\xcf\xaf\x9e\
+\x7c\x0e\x6b\x6d\xae\xfb\xbe\xee\x80\x9b\xbe\x62\x29\xfb\x12\xbf\
+\xa8\x58\xf9\x72\x0f\xf7\xfd\xe6\x1d\x1c\x7d\x3f\xda\xd1\x68\xad\
+\xd1\x8e\x4b\xb1\x58\x44\xce\xd4\xd9\x09\x41\xa1\x50\x60\xfb\xa6\
+\x0d\x38\xda\x69\x23\x92\xd9\x2a\x71\xdb\x34\x2a\x38\x61\x49\x99\
+\xa5\xc7\xc6\x14\x3b\x17\xd3\x6c\x8c\xf1\x1f\x2f\x3a\xdc\x71\xef\
+\xca\x2c\x3b\x19\x82\x20\xc0\x77\x6b\xdc\xfa\x75\xc3\xbc\x39\x8a\
+\x92\xe7\xf0\xea\xa6\x4e\x56\xac\xec\x43\xca\x2a\x89\x56\x28\x95\
+\x12\x28\x14\x0a\x24\xcd\x20\x93\x8d\xcd\xa5\x6b\xf3\xcf\xe9\x77\
+\x5a\xab\xb6\x78\x66\xed\xc8\x6c\x9b\xc2\xb1\xb8\x3f\xe4\x0b\xa7\
+\x77\x52\xea\xfb\x38\x51\x30\xc8\xaa\xd5\x35\x7e\x78\xf7\xb3\x84\
+\x61\x98\xe7\x7b\x9b\xd4\xb8\xf9\x6b\x11\x07\x2f\x4c\xc1\x6f\x19\
+\xf2\xb9\xfa\xfe\x05\xc4\xc6\xa0\x55\x42\x02\x08\x04\x42\x6b\x6c\
+\x56\x6d\xdf\xed\x35\x6b\x16\x9a\x5e\xba\xf7\x9b\x63\xf8\xf2\x27\
+\x8b\x74\x2e\x3c\x99\x38\x9c\x60\xcd\xeb\x55\xae\xbe\xf9\x29\x76\
+\xef\x1e\x01\x20\x0c\x43\x9a\x8d\x80\xeb\x2f\x68\x72\xd4\x7b\x15\
+\x65\x4f\x33\x56\x2f\xf0\x0f\xf7\xf4\xd1\x88\x24\x4a\x89\xbc\xc5\
+\x54\x5a\x23\x95\x9a\x71\xbb\xf2\xe7\x5e\xb3\x7a\x60\x72\xda\xaa\
+\xf8\x82\xaf\x9c\xb1\x9b\xbe\xf7\x5e\x88\x15\x2e\x6f\xae\x7f\x9d\
+\x2b\xaf\x5f\xc3\xc8\xc8\x28\x40\xbe\x49\xbb\xf4\xd3\x75\x4e\x3e\
+\x46\x52\xf2\x14\x09\x2e\xdf\xbc\x73\x01\xbb\xab\x1a\xad\xd2\xa3\
+\x12\x90\x68\xad\x73\x3d\x9b\xbf\x92\xc0\xac\x31\x40\x26\x21\xd7\
+\x81\x6f\x9c\x5b\xe0\x3d\xc7\x2c\x03\x3d\x87\xed\x03\x6b\xb9\xec\
+\x86\x75\x0c\xee\x1c\x9a\xa2\xfb\x73\x3f\x56\xe3\xdc\x93\xa1\xe4\
+\x2b\x0a\xae\xcb\xd7\xff\x75\x2e\x9b\x06\x35\x4a\x41\x2a\x1a\x50\
+\x4a\xe2\x3a\x4e\xba\xfd\x30\x7f\x1d\x78\x60\x1f\x1d\x19\x06\x29\
+\x04\xe7\x2d\x1d\xe4\xfd\x1f\xbc\x00\x55\x7a\x1f\xef\x6c\x7d\x91\
+\x7f\xba\x79\x0d\x03\x9b\xff\x94\xf7\xa4\xf5\x7a\x9d\x93\x3e\x50\
+\xe3\x92\xb3\x2d\xbe\x9f\xea\xfe\xaa\x07\x7a\x79\x6d\x63\x19\xc7\
+\xd1\xe8\x2c\x68\x5d\xd7\xa5\x5c\x2a\xa1\xb5\x9e\xdc\xad\x67\x96\
+\xb4\xf9\x6b\xdb\x31\x43\xd3\xc4\xec\x5b\x09\x38\xe3\x84\x1d\x9c\
+\xf4\xf1\xd3\xd1\x5d\x47\x33\xba\xfd\x19\xbe\xbb\xfc\x39\x5e\x5a\
+\xf3\x56\xbe\x60\x18\x86\x1c\x7e\x40\x8d\xef\x9d\x9f\x50\xf6\x35\
+\x65\x5f\xf3\xdc\x86\x0f\x51\x3a\xf0\x44\x3e\xb3\xd8\xa3\x58\x2c\
+\xe2\xfb\x3e\xe5\x72\x99\xfe\x03\x0e\x60\x4e\x77\x77\x26\xa5\x76\
+\x72\xb0\x6c\xd9\xbc\x99\xcb\x2e\xbd\x0c\xad\x54\x7e\xfc\x98\x06\
+\xbf\xa2\x2f\x3b\x19\x9c\x2a\x92\x59\x3c\xf0\x37\x47\x8e\x72\xf6\
+\x19\x27\xe2\xf6\x7c\x84\x60\xe8\x45\x6e\xb9\xf7\x0f\x3c\xf3\xfc\
+\xdb\xe9\x6e\x94\x54\xf7\xf3\x2a\x35\x96\x5f\x14\xd2\xd9\xa1\x28\
+\xf9\x9a\x35\x9b\x0f\xe3\x89\xdf\x1f\x8e\xe7\x05\x18\x63\x48\x92\
+\x04\x80\xae\xae\x2e\xa2\x38\x66\x68\x68\x08\x60\x0a\x89\x96\x95\
+\x85\x10\x74\x76\x75\xe1\x79\x45\x7c\xcf\x4f\xad\x6e\x21\x89\x13\
+\xaa\xc1\x04\xc6\x24\x7b\x13\x48\x66\x20\xf0\xdf\x0f\xf5\x9c\xd1\
+\x77\x60\x19\x6f\xff\x4f\x11\x4e\x6c\xe1\xb6\xbb\x56\xf2\xe0\x2f\
+\xf6\x80\x37\xc6\x50\x54\x35\x6e\xb9\x38\x60\x7e\xaf\xa4\xe4\x6b\
+\x36\xec\xea\xe3\xdf\xd7\x7e\x18\xd7\x75\x71\x1c\x07\xc7\x71\x70\
+\x5d\x97\x9e\x9e\x1e\x7a\x7a\x7a\x10\x42\xe4\x40\x27\x5f\xad\x22\
+\xd6\x22\xac\xa4\x42\x2a\x09\x36\xb5\xb0\xd4\x0a\xad\x34\x71\x1b\
+\x02\xd2\xc4\x7b\x13\x78\x69\x45\xe1\x84\xf9\xf3\xba\x1f\xe8\x38\
+\xf8\x3c\x9a\x63\x7f\xe4\xee\xbb\xef\xe6\xde\x47\xaa\x39\x78\x6b\
+\x2d\x36\x09\xf8\xc1\xc5\x35\x0e\xeb\x4f\xc1\xef\xaa\xce\xe1\x0b\
+\xd7\x09\x6a\x8d\x55\xa9\xe6\xa5\xc2\x62\x29\x14\x8a\x5c\x73\xed\
+\x35\x68\xad\xf3\x13\xec\xb4\x3d\xdc\xa3\x69\x6b\x2d\x49\x92\x90\
+\x24\x09\x52\x4a\x5a\x27\x4f\x56\x58\xb0\x02\xac\xc9\xe7\xed\xe5\
+\x81\xb6\x41\x3c\xef\xeb\xdf\xf2\x3a\xd7\xf9\xe1\xee\x97\x78\xf4\
+\x97\xbf\xe6\xb6\x87\x63\xe2\x78\x0f\xfb\x28\x6c\x72\xd5\xb2\x71\
+\x8e\x39\x1c\x4a\x45\x45\xad\x59\xe2\xd6\xa7\x4e\x60\xd7\xd0\x6f\
+\x91\x52\x23\x95\x44\xc9\xf4\x38\x3d\x0a\x23\x3c\xcf\xcb\xad\xdf\
+\x92\x8f\x31\x26\x1f\x2d\x09\xc5\x71\x9c\x9f\x4a\x67\xa5\x38\x27\
+\xd8\x02\xbb\x4f\x09\x3d\xba\xfc\x73\xe5\xce\xbe\xe3\xff\x76\x5b\
+\x72\x28\x6f\x3c\x7d\x2b\xd7\xfe\xb8\x41\x1c\xef\x71\x79\x14\x45\
+\x5c\x74\xfa\x18\x4b\x8f\xb7\x94\x3c\x4d\x42\x81\xe5\x4f\x1c\x4f\
+\xb5\xd9\xb1\x27\xf2\xad\x45\x8a\xf4\xf4\x3a\x0c\xc3\x7c\x61\x21\
+\x04\x49\x92\xe4\x52\x99\x4c\xa0\xf5\xbe\x45\xd4\x5a\x83\xcd\x36\
+\x77\x36\x7b\xa6\x69\xd3\xc2\x1a\x39\x8d\x40\x79\xce\xbc\xd3\xfc\
+\xca\x5c\x37\x6c\x6a\xf6\x5b\x7c\x3e\xe5\xf2\x5d\x34\x47\x6a\xb9\
+\x05\xce\x3c\x61\x8c\x65\x4b\x63\x4a\x9e\x46\x69\xc5\x8d\xbf\x38\
+\x92\x1d\x63\x73\x28\x16\x55\x4e\x40\x4a\x81\xeb\x16\x52\x6d\x4f\
+\x02\xdd\x1a\x2d\xb9\x4c\x3f\xae\x6c\x05\xbc\xc9\x4e\xdc\xd2\xbf\
+\x71\x98\x74\x4c\x22\xe0\x38\x1a\xc7\x71\x88\xe3\x18\x63\xe2\xa9\
+\x47\x8b\x5d\xf3\x0f\x3c\x3d\x6c\x0c\x13\xd6\x06\x71\xc5\x28\x5f\
+\x5b\xb6\x84\x39\x15\x07\x6b\x2d\x1f\x7a\xef\x38\xdf\xfa\x4c\x93\
+\x92\xa7\x29\xb8\x8a\x2b\xef\x2c\xb0\x76\xa0\x33\xdd\x55\xea\x96\
+\x1d\x04\xae\xe3\xa2\xb5\xce\x0e\x64\xa7\x5a\xb8\xf5\xb9\x15\xc8\
+\xad\xdf\x45\x51\x44\x18\x86\x84\x61\x48\x92\x98\xb4\x89\x8f\xd3\
+\xa6\x3e\x49\x4c\xd6\x95\xa5\xf3\x11\x82\x38\x23\x1b\x4f\x96\xd0\
+\x2f\x7f\xf0\xb9\x82\xd4\xe2\xf4\x66\x30\x48\x33\xd8\x45\x18\xec\
+\xa2\xaf\x3b\xe0\xdb\x5f\x98\xcb\x13\xff\xb9\x95\xcb\x3f\x55\xa3\
+\xa3\x94\x82\xbf\xe5\x67\x9a\x87\x9f\xd1\x1c\x77\xbc\x42\xa9\x74\
+\xa4\xe0\xd3\xec\x93\x6a\x3a\x21\x8e\x63\x9a\xcd\xb4\xb5\x9c\x6c\
+\xf1\xc9\x84\x5a\xa3\x75\x8f\x49\x12\x92\x78\xaa\x87\x6c\x0b\x7c\
+\xe6\x29\x63\x0d\x52\xc8\xa9\x41\xac\x7c\xe7\x14\xed\x8a\x52\x0b\
+\x7c\xfa\xfa\x0e\x8e\xac\x71\xe6\x29\xfd\x34\xac\xa1\xe0\x8e\xf1\
+\xb3\xe7\x04\x37\xfe\x54\x51\x2c\x38\x94\x4a\x25\x7a\x7b\x7b\xe9\
+\xee\xee\xa6\x58\x2c\xe0\x3a\x4e\xba\x18\x36\x6f\x40\xe2\x38\xce\
+\xdc\x3d\xd5\x0b\x2d\x29\xb5\xe4\x94\xe4\x56\x4d\xef\x6f\xd5\x01\
+\x63\x5b\x31\x93\xa4\x1b\x41\xa5\x08\x83\x26\xae\x5b\x00\x98\x4c\
+\xa0\xeb\x9c\xb8\x39\x42\x18\x0c\x11\xd6\x87\x89\x9a\xa3\x58\x13\
+\xe3\x16\xbb\x71\xbd\x1e\xd6\x8f\xf4\xf3\x93\x27\xff\x8b\x07\x9f\
+\x0a\xa9\x94\xd3\x2a\x7b\xcc\xd1\x47\xb3\xe8\xa0\x83\x50\x4a\x91\
+\x24\x09\x13\x61\x98\x26\x10\x6b\x10\x52\xe6\xad\xe5\x74\xb0\x33\
+\x79\x21\x27\x16\x27\x58\xa6\x7b\x20\x25\xd8\x6c\xd4\xf3\x8c\x95\
+\x7b\xe0\xba\x6f\x9e\xe3\xde\xf3\xd8\xfa\x4f\x9f\xbd\x74\x21\xf3\
+\x3a\xeb\x24\x51\x0d\x90\xe8\xe2\x1c\xaa\x41\x91\xc7\x9e\xdd\xc9\
+\x8b\xaf\xee\xa2\x19\x7b\x54\x3a\xca\xb8\xae\x43\xd1\x4b\xb7\x08\
+\x2d\xf0\x95\x8e\x0a\x43\xbb\x87\xf3\x73\x1c\x69\x0c\xdd\x3d\x3d\
+\x44\x51\x94\x03\x6b\x05\x71\x8b\xc0\x64\x22\x2d\x2f\x25\x71\x42\
+\x2c\xe3\x2c\x25\xa4\x67\x4f\x89\x49\x72\x09\x35\x1a\x0d\x7c\xbf\
+\x44\x10\xd4\x51\x4a\xa6\x04\xde\xde\x3e\x76\xf6\xe6\x6d\x23\xce\
+\x0d\x77\x6c\xe7\xb3\xa7\xed\xc7\x91\x87\xfa\xd8\xb8\x38\xbe\xea\
+\xf9\xd1\x77\x56\xad\xde\x7a\x48\xbd\x99\x20\x84\x44\xc9\xf4\xb1\
+\x49\x62\x30\x49\x5a\x1f\xa2\x28\x22\x8e\x63\xfe\xf9\xea\xab\xf2\
+\x34\xd8\x02\x17\xc7\x31\xe3\xe3\xe3\x53\xac\xdb\xb2\xea\xf4\xec\
+\x34\x59\xe3\x49\x12\x67\x7d\x71\xe6\x2d\x6b\xa6\xd4\x81\x89\x89\
+\x6a\xf6\x4e\xa7\x04\x06\xb6\x8f\x9e\x5a\xad\x56\xa9\xd5\x6a\x7c\
+\xff\xee\x5d\xc1\x05\x67\x1d\x71\xdd\xf3\xaf\x6c\xbd\xfb\xd9\x97\
+\xb7\x1e\xd4\xbf\x70\xff\x7b\xb5\xd6\x87\x4c\x29\xe1\xd2\x00\x22\
+\xd7\x77\x1c\xc7\x44\x51\x34\x25\x55\x4e\x2e\x58\x71\x1c\xef\xe5\
+\x81\x16\xd1\xc9\x57\x8b\x58\x9c\xc4\xd3\x2a\x6e\x6a\xb4\xbd\xaf\
+\x04\xfd\x9d\x65\x1f\x95\xbf\x7a\x6d\xf8\x2c\x49\x38\xd4\x5b\xd1\
+\x37\x2e\x9c\xe3\xdf\x7a\xc5\x4d\x4f\x36\x80\x0e\xa0\xf9\xd6\xc6\
+\x8d\xff\x76\x50\x7f\xff\xa5\x85\x82\x3b\x67\x4f\x41\x8b\x99\x98\
+\xa8\xb2\x6b\xd7\xce\x5c\xab\xd3\x0b\xd3\x74\xd9\xb4\x7e\x3f\xbd\
+\x81\x17\x59\x60\xb6\x62\x04\xc4\x5e\x9b\x67\xc1\xde\x1d\x62\x56\
+\x18\xc7\xf4\xc0\x58\xb4\xd8\x73\x92\x2b\xd6\xaf\xdf\x72\x7f\x35\
+\x68\xaa\x35\xd0\x09\xf4\x00\x45\xa0\x10\x46\xe1\xe0\xc6\xcd\x9b\
+\x7e\x56\xa9\x74\x2e\x02\x2b\x01\xeb\x15\x8b\x62\xff\xfd\x0f\x70\
+\xd7\xad\x5b\x57\x71\x5d\x57\x4b\xa5\xa4\x92\x52\x49\x29\x95\x52\
+\x4a\x6a\xad\x95\x10\x52\x49\x29\xa5\x10\x48\x21\x64\xaa\xe8\x34\
+\x91\x9b\xd4\x39\x26\x01\x91\x58\x6b\x63\x6b\x4d\xd2\x6c\x36\xc3\
+\x5a\x2d\x88\xca\x1d\xe5\xf1\x5d\xbb\x76\xd6\x32\xef\x4c\xde\xf9\
+\xe5\x5d\xbe\x10\xc2\x4a\x29\x47\xc2\x30\x7a\x41\x64\x40\x7b\x33\
+\x8b\xbb\x80\xcc\x26\xca\xec\x73\x09\x28\x03\xad\x73\x0d\x5b\xa9\
+\x54\xc4\x51\x47\x1d\xd5\xb9\x68\xd1\xa2\x52\x47\x47\x87\x2c\x16\
+\x8b\xda\x75\x5d\xd9\x1a\xad\x7f\x2b\x90\xe9\x9e\x48\x48\x29\xad\
+\x94\x12\xad\x75\x22\x84\x30\x52\x4a\x23\x53\x1d\xc6\xd6\xda\x28\
+\x8e\xe3\xb8\x5e\xaf\xd7\xc6\xc7\xc7\x1b\x6b\xd7\xae\x1d\x7b\xfa\
+\xe9\xa7\x47\xeb\xf5\xfa\x6c\xdd\xbe\x05\x22\xa0\xda\x62\x98\x9e\
+\x32\xa5\x43\x4e\x1b\x4e\x36\xd4\x24\x8b\xd8\x52\xa9\x44\xb9\x5c\
+\xc6\x71\x1c\x9b\xed\x36\xad\xe3\x38\xf9\x6b\x46\xc2\xb8\xae\x8b\
+\x52\xca\x2a\xa5\x6c\x06\xde\x6a\xad\xad\x94\xd2\x2a\xa5\x6c\x46\
+\x04\x29\xa5\xa9\x56\xab\x6c\xdd\xba\xd5\x0e\x0c\x0c\x58\x68\xff\
+\x7f\x1c\xd3\x48\x24\xff\x03\x59\x56\xe3\x0b\xd4\x6d\xfb\x67\x00\
+\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\
+\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\x37\
+\x3a\x30\x32\x3a\x33\x35\x2d\x30\x37\x3a\x30\x30\x10\x90\x85\xa6\
+\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\
+\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\
+\x33\x3a\x32\x36\x3a\x31\x35\x2d\x30\x37\x3a\x30\x30\x06\x3b\x5c\
+\x81\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\
+\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
+\x30\x39\x3a\x33\x31\x3a\x32\x34\x2d\x30\x37\x3a\x30\x30\xf9\x59\
+\xc2\xe4\x00\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\
+\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\
+\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\
+\x65\x6e\x73\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\x2f\
+\x20\x6f\x72\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\
+\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\
+\x69\x63\x65\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\x31\
+\x2f\x5b\x8f\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\
+\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x30\x33\
+\x2d\x31\x39\x54\x31\x30\x3a\x35\x33\x3a\x30\x35\x2d\x30\x36\x3a\
+\x30\x30\x2c\x05\xbc\x4f\x00\x00\x00\x13\x74\x45\x58\x74\x53\x6f\
+\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\x6e\x20\x49\x63\x6f\x6e\
+\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\x45\x58\x74\x53\x6f\x75\
+\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x77\
+\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\x69\x63\x6f\x6e\x73\x2e\
+\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x01\x3d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\xba\x49\x44\
+\x41\x54\x58\x85\xed\xd6\x31\x0a\x02\x41\x0c\x05\xd0\xff\x67\xa6\
+\x58\x11\x05\x4b\x4b\x4f\xa3\xb5\x85\x62\x9f\x63\xcd\x05\xb4\xd8\
+\x5a\x3d\x84\x57\xf0\x02\x82\xb0\x32\xa0\x88\x3b\x1e\x40\x17\x76\
+\x25\xb0\x85\x49\x9b\x22\x2f\x09\x81\x50\x44\xd0\x67\xb8\x5e\xab\
+\x1b\xc0\x00\x06\x30\x80\x01\x00\x84\xa6\xc4\xbc\xdc\x6d\x0b\x97\
+\x87\x1a\x45\xee\x35\xd3\x61\xb9\x5a\xb7\x06\xc4\x18\xb9\x99\x8e\
+\x16\xb3\x09\xc7\x1a\x80\xf3\x35\x57\x31\x46\x8a\x48\x6e\x05\x00\
+\x00\x06\x07\x16\x3a\x1b\x62\xa8\x1b\x73\x8d\x00\x04\x82\x03\xaf\
+\x02\x40\xf8\x68\xbc\x05\xc0\x13\xd0\x02\xf8\xd7\x0f\x00\xd5\x09\
+\xb0\x3b\xc0\x79\x82\x85\x0e\xc0\xf9\x8e\x00\x11\xc9\x97\x63\xb9\
+\xbf\x9d\x92\xca\x19\x3e\x9e\x48\xdf\x2e\x00\x00\x68\x3f\xa1\x01\
+\x0c\x60\x00\x03\xfc\x3d\xe0\x0d\x62\x08\x25\xb8\x8c\xc0\x27\xd8\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x12\xdd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
+\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x10\xf0\
+\x49\x44\x41\x54\x68\xde\xbd\x5a\x6b\x90\x5c\x47\x75\xfe\x4e\x77\
+\xdf\xc7\xdc\x79\xec\xcc\xec\xce\xec\x43\xab\xd5\x4a\xd6\xc3\x96\
+\x79\xc8\x2f\xa0\xf2\x2e\x62\x62\x1b\xd9\x18\x52\x84\xc0\x8f\xe4\
+\x6f\xaa\x28\xfe\x50\x95\x90\x4a\x48\xa8\x14\xf0\x23\xa9\x54\x25\
+\x24\x54\x41\xa5\x2a\x50\x21\x09\x50\x04\xbf\x28\xfc\x90\x1f\x38\
+\x38\xa1\xc0\x36\x36\xb2\x2c\x5b\x42\x92\x65\x4b\x5a\x69\x77\xf6\
+\x3d\x77\x1e\xf7\xd9\xdd\x27\x3f\x66\x47\x5a\x0b\xdb\x5a\x01\xe1\
+\xd6\x9e\x3d\x3d\x7d\x7b\x7a\xce\xd7\xe7\xeb\x73\x4e\xdf\x19\xc2\
+\x2f\x78\x3d\xfa\xc4\x43\x60\xe6\xb7\x1c\x43\x44\xb8\xed\xd6\x83\
+\xbf\xe8\x47\xbd\xf1\xdc\x57\xfb\x86\xc7\xbe\xf7\x30\xac\xb5\x00\
+\x00\xcf\xf3\xd0\xe9\x76\x84\xa3\x1c\x9f\x88\x2a\x00\x4a\x00\xbc\
+\x8d\xa1\x29\x80\x1e\x33\x77\xb4\xd6\x49\xb9\x54\xb6\x49\x9a\x5c\
+\x9c\xe7\x8e\xdf\xbb\xeb\x57\x0f\xe0\xd0\xe3\x0f\x01\xb0\x48\x92\
+\x54\x48\x25\xeb\x52\xc8\xfd\x52\xca\x1b\xa4\x94\xfb\xa5\x54\x33\
+\x52\x8a\xaa\x20\xe1\x01\x80\xb5\x36\x35\xc6\xb4\x8d\x35\xe7\x8c\
+\x31\xc7\xac\xb5\x87\x8d\xd1\xc7\x8c\xb1\x6b\x52\x4a\x4b\x44\x38\
+\x78\xfb\xdd\xbf\x3a\x00\x87\x1e\x7f\x10\x44\x42\x18\x93\xcf\x0a\
+\x21\xdf\xeb\xb9\xde\xc1\x42\x21\xb8\xa9\x18\x14\xc7\xfc\x42\xc1\
+\x73\x1d\x57\x48\x29\x41\x44\x00\x18\xd6\x5a\x68\x6d\x90\x65\xa9\
+\x8d\x93\x38\x8d\xa2\x68\x25\x4e\xa2\xe7\xb3\x2c\x7b\x48\x6b\xfd\
+\xa4\x94\xf2\x8c\xb5\xd6\xde\x79\xc7\x07\xff\x7f\x01\x1c\x7a\xfc\
+\x41\x08\x21\x60\x8c\xa9\x13\xd1\xed\xbe\xef\xff\xf1\x48\xa5\xfa\
+\xee\xea\x48\xad\x5a\x28\x14\xc0\x60\xa4\x59\x8a\x24\x8e\x90\xa4\
+\x29\xb4\xd6\x00\x00\xa5\x14\x3c\xcf\x83\xef\xf9\x70\x1c\x07\x6c\
+\x19\x51\x1c\x21\x0c\xc3\x76\xa7\x13\x3e\x93\xa4\xe9\xbf\x33\xdb\
+\x43\x00\xd6\x8c\x31\xf8\xe0\x5d\x1f\xfe\xe5\x03\x78\xe4\xb1\xef\
+\x42\x79\x2e\xf2\x24\xdd\xed\x38\xce\xc7\x47\x2a\xd5\x3f\x6c\x36\
+\xc7\xa7\x82\x20\x40\x92\xc4\x58\x5d\x5d\xc1\xd2\xf2\x32\xd6\xd6\
+\xdb\xb6\xd7\x8f\x75\x92\x19\x6d\x0c\x2c\x00\x28\x49\xc2\x73\xa5\
+\x2a\x17\x0b\x6a\x74\xb4\x2a\xc6\xc6\x1a\xa8\x55\xab\x50\xd2\x45\
+\xaf\xd7\xc5\xf2\xca\xf2\x7c\xa7\x1b\x7e\x2b\xcf\xf3\x2f\x65\x3a\
+\x7f\xc5\x51\x0a\x1f\xba\xeb\x0f\x7e\x79\x00\x1e\x7d\xe2\x21\x10\
+\x91\xd0\x5a\xdf\xe0\xfb\xfe\x5f\x37\x1b\x13\xb7\x35\x9b\xe3\x7e\
+\x96\xa7\x98\x9f\x3f\x8f\x73\xe7\xce\xf3\xfc\x62\x3b\x5a\x8f\x28\
+\xec\x9b\x20\x4c\x51\xec\x69\xf6\x52\x0b\x69\x00\x40\x40\x4b\x85\
+\xd4\xf3\x28\x2a\x95\x54\x34\x52\x2f\xd2\xc8\xb6\x89\x5a\xb0\x7d\
+\xfb\x34\x35\xc7\x9a\x60\x00\x4b\x4b\x8b\xc9\xca\xca\xf2\xa3\x49\
+\x9a\x7c\x4e\x4a\x79\x98\xb5\xb6\x77\xdf\xfd\x91\x5f\x1c\xc0\x03\
+\xdf\xbd\x07\x41\x10\x90\xd6\xfa\x66\xdf\x2f\x7c\x76\x7a\x6a\xfa\
+\xd6\x7a\x7d\x4c\xad\xb5\x57\x70\xf2\xd4\x49\x9c\x39\xb7\x14\xb5\
+\x3a\x6a\xb1\x8b\xb1\xc5\x5c\xd6\x7a\x90\x9e\x21\x12\x4c\x00\x31\
+\xc0\xcc\x0c\xcb\x60\x6b\x19\xcc\x16\x64\x33\xe5\x23\x2c\x57\xc5\
+\xea\xf8\x54\xd5\x8e\xef\xda\x31\x11\xec\x9c\xdd\x89\x82\x5f\xc0\
+\xf2\xf2\xb2\x5e\x68\xcd\x3f\x91\xa4\xc9\x67\x14\xe8\xb9\x7e\x9a\
+\xf0\xc7\x3e\xf2\x47\x5b\x06\xa0\xde\xa8\x53\x4a\x89\x34\x4d\x77\
+\x17\xfc\xc2\x5f\x4c\x4d\x4e\xdf\x3a\x3a\xda\x50\xf3\xad\xf3\x78\
+\xf9\xd8\x31\x7b\xfa\x7c\x77\x75\x45\x8f\x9f\xcd\x9d\xf1\xb6\x74\
+\x7c\x53\x90\x24\x04\x41\x02\x20\xe6\x41\x46\xb0\x96\xd9\x32\xb3\
+\xb5\xc4\xc6\x12\x1b\xeb\xeb\x98\x0b\x6b\x29\xd7\x3b\xbd\xf5\xe5\
+\xd5\x4e\xbc\xb0\x23\x8a\xe2\xd1\x7d\x7b\xf7\x8a\xe6\xf8\xb8\xb2\
+\x6c\x6f\xbd\x30\x7f\x21\x4e\x92\xe4\xcf\x05\x89\x53\x57\xe3\x01\
+\x79\x79\xc7\x77\x1e\xbc\x17\xcc\x3c\xe2\x38\xce\x9f\x4d\x4e\x4c\
+\x7d\x6c\x62\x7c\xc2\x9d\x6f\x9d\xc7\x0b\x47\x5e\x32\x27\x2f\x24\
+\x0b\x2b\xb8\xe6\x14\x05\x13\xbd\xc0\xf7\x84\xef\x90\x54\x8a\xa4\
+\x92\x24\xa4\x20\x48\x49\x24\x05\x91\x20\x22\x21\x04\x09\x02\x11\
+\x81\x06\x5d\x00\x20\x6d\x46\xe5\xa8\xa7\x0b\xed\xb8\xbb\xea\xd8\
+\xac\x53\xac\x8e\x94\xc5\x68\x7d\x54\x68\xad\x77\x46\x51\x9f\xb4\
+\xd6\x4f\x7f\xf8\xc3\xbf\x9f\xde\x7b\xcf\xfd\x3f\xb7\x07\x24\x11\
+\xdd\x51\x1d\xa9\x7e\x74\xbc\x39\xe1\xaf\xad\xaf\xe2\xe5\x63\x3f\
+\xb5\xaf\xb6\xf2\x85\xb6\xdc\x7d\xda\x2b\x54\x73\xcf\x15\x4a\x12\
+\x11\x11\x30\xf8\x3f\xb8\x98\x87\xf4\x61\xb6\x16\x6c\x2c\xb1\xb0\
+\xcc\xc6\x5a\x26\x03\x61\x89\xd9\x32\xb1\xb6\x95\xa8\x65\xe4\x2b\
+\x72\xfe\x02\x3c\xf7\xf4\xd4\xf5\xfb\xaf\x13\x93\x13\x93\x7e\xbf\
+\xdf\xff\xe8\x6a\xbe\xf2\x8c\x35\xf6\xdb\x00\xcc\x55\x7b\xe0\xde\
+\x07\xbe\x05\x22\x9a\xf5\xbd\xc2\xa7\x67\x66\x66\xdf\x29\x84\xa0\
+\xe3\xc7\x8f\xe1\xa7\x67\xd6\x56\x56\x69\xd7\x69\x37\xa8\x67\x81\
+\x2f\x95\x23\x85\x70\x94\x14\x4a\x0a\xe1\x48\x41\x4a\x0a\x92\x1b\
+\x5a\x88\xa1\xd0\x45\xd9\xb8\x40\x00\x68\xc3\x2b\x06\x6e\x9e\x58\
+\x37\xe2\x64\xa5\x58\xf4\x50\x1c\x1b\x6b\x40\x49\x59\x0c\x3b\xed\
+\x52\xae\xf3\x1f\xdc\xfd\xa1\x0f\xb4\xef\xbf\xef\x3b\x57\xe7\x01\
+\x22\x92\x00\xde\x57\xad\x56\xdf\x53\x2a\x95\xe8\xec\xb9\xd7\x70\
+\xe6\xfc\x52\xbc\x6e\x27\xcf\xaa\xa0\x9e\x04\xbe\x50\x8e\x94\x42\
+\x4a\x31\xa0\x8a\xd8\xf0\x02\x08\x8c\xc1\xee\xb5\x0c\xb6\x0c\xb2\
+\x96\xd9\x58\x66\x63\xac\x15\x52\x90\xd0\x16\x5a\x08\x6b\xac\x85\
+\xb5\x0c\x32\x56\xa4\xb6\xd2\x6f\x25\xe9\xd9\x33\xe7\x17\x4b\xa3\
+\xa3\xa3\x85\x5a\xad\x4e\xd5\x91\xda\x7b\xe2\x38\x79\x1f\x88\xbe\
+\xb2\x15\x2f\x88\x61\xe3\xab\x5f\xfb\x0a\x8c\xd1\x0d\xd7\x71\x6f\
+\x1b\x1d\x1d\xab\xc6\x71\x84\xf3\x17\xe6\x79\x25\xf2\x16\xad\x3f\
+\xde\x09\x7c\xa5\x5c\xa5\x84\xeb\xc8\xcb\x44\x09\x67\x53\x7b\xa3\
+\x9f\x5c\x47\x92\xe3\x48\xe1\x38\x4a\xb8\x4a\x92\xb3\x31\xce\x71\
+\x14\x29\x25\x07\x22\x25\xf5\xb8\xbe\xde\xea\xc8\xc5\x56\x6b\x91\
+\x41\xc0\xd8\xe8\x58\xd5\x75\x9c\xdb\xac\xd6\x8d\x2f\x7e\xe9\x0b\
+\x5b\xf7\x80\xd1\x12\xcc\xd8\x17\x04\xc5\x03\x41\x50\xc4\xe2\xd2\
+\x3c\x96\xd7\x7a\x71\x9f\x26\x96\x3d\xbf\xc0\xae\xab\x84\x23\x85\
+\x50\x4a\x90\x23\x05\x49\x49\x62\x83\x1e\x60\x00\x60\x0c\x22\x10\
+\x33\x0d\xf8\xcf\x4c\x96\x59\x08\x2b\x48\x90\x85\x60\x10\x11\x91\
+\xb1\x10\x43\x1e\x91\x45\x4e\x9e\x5d\xd7\xb5\xa5\xc5\xb5\xb0\x39\
+\xd3\xef\x05\x95\xca\x08\x82\x20\x38\xd0\xed\x75\xf7\x59\x50\x6b\
+\xcb\x1e\x50\x8e\x96\x42\x88\x03\xa5\x52\x69\x0a\x60\xac\xad\xad\
+\x21\x4c\x64\x87\xbd\x7a\xe4\xb9\x4a\x3a\x52\x90\x52\x02\x8e\x23\
+\xc9\x71\x25\xb9\x8e\x82\xe7\x28\x72\x1d\x49\x9e\x23\xc9\x75\x07\
+\xab\xee\x3a\x6a\xd0\x76\x37\xb4\xa3\xe0\x0e\xc6\xc1\x71\x24\x5c\
+\x57\xc1\x71\x06\x1e\x90\x4a\x92\x52\x02\x29\x55\x7a\x6b\x3d\x84\
+\x61\xa7\x03\xd7\x75\x51\x2a\x95\xa7\x84\x90\x07\x04\xac\xbc\x12\
+\x80\x8b\x1e\x20\x82\xa7\xa4\xda\x5f\x28\x04\x5e\x9e\x67\x08\x3b\
+\x3d\x93\x72\xb1\xa3\xdc\x82\x71\x94\x90\x52\x0a\x80\x48\x74\xa3\
+\xd4\x23\xb0\x94\x72\x18\x26\x07\x41\x88\x87\x81\xc8\x02\x96\x99\
+\xcd\x20\x91\x6d\xec\x03\x66\x6d\xac\xd5\xc6\xb2\xb1\xcc\x00\x19\
+\xd7\x75\x52\x05\x69\x00\x22\x03\x4f\xf7\x4d\xa1\xd3\xe9\xf6\x9a\
+\xd3\x80\x2c\x06\x25\x4f\x49\xb5\x9f\x88\x3c\x00\xd1\x16\x01\x50\
+\x51\x4a\x35\xe3\xba\x2e\xa5\x69\x82\x28\xc9\xb4\x91\xa3\x91\xe3\
+\x38\x90\x42\x90\x90\x92\x92\x34\x75\x4e\x9e\x59\x98\x2c\x78\xd2\
+\xf5\x94\x04\x68\xe3\x6f\x08\x62\xc0\x25\x66\x06\x86\x19\xf9\x52\
+\x68\x1d\xe8\x2c\x37\xe8\xa7\x36\x99\x99\x1a\x9f\xf3\x5c\x37\xc9\
+\x0d\x73\x9c\x53\xde\xb5\x6e\xb7\x17\xa5\xda\x58\x23\x0b\xbe\x4f\
+\x52\xca\x19\x22\x51\xdc\x32\x00\x00\x81\x10\xa2\x2e\xa5\x44\x14\
+\xc7\xc8\x35\x6b\x96\x41\x26\xc5\x20\x4b\x29\x29\x88\x19\xa2\xe4\
+\x2b\xf7\x03\xbf\xbe\xd3\x1f\xaf\x15\xd8\x32\xe8\x4d\x8a\xa9\xe1\
+\xb6\xd8\x00\x35\x38\xb4\x11\x11\x16\xd7\x23\xdc\xff\xbf\xaf\x22\
+\xce\x0c\xaf\x45\x59\x7c\xea\x42\xaf\x3f\xbf\x9a\x24\x7b\xea\x09\
+\xf6\x37\xcd\x5e\x6b\xad\xe7\xb8\x2e\xa4\x10\x75\x00\xc1\x96\x29\
+\xc4\xcc\x2e\x80\x02\x81\x60\x8c\x81\x65\x62\x21\x1d\x4b\x82\x90\
+\xe4\x56\x27\x1a\x9c\xe6\xac\x1c\x25\x31\x5e\x2b\xf0\x78\xd5\x83\
+\xb1\x16\x83\x20\xfa\x26\x08\x06\x00\x18\x00\x2c\x03\x52\x08\x6b\
+\x2c\x23\x33\xc8\x5e\x7c\xb5\xbb\xda\x0a\x79\xad\xdd\xcb\x74\x9a\
+\x59\xae\x28\x1b\x67\x1a\x39\x33\x43\x08\x01\x10\x15\x36\x6c\xda\
+\x1a\x00\x6b\x99\x2c\xdb\x8b\xe7\x5b\x21\x04\x48\x08\xac\x74\x75\
+\x7c\x6a\x21\xea\xc5\x39\x1b\x57\xe8\xca\xb6\x92\xde\x96\x1b\x28\
+\x0b\x22\xc6\xa0\x6c\x18\x30\xf0\x75\xd6\xd3\x60\x4d\x88\x19\x83\
+\xdc\x60\x0c\x5b\x6d\xd9\xc6\xb9\xe5\x76\xa4\xb3\xd7\x96\x74\x94\
+\xb3\x93\x0b\x29\x49\x2a\x82\x94\x02\x42\x30\x09\x31\xa4\x23\x83\
+\xad\xbd\xe2\x79\x65\x13\x00\x93\x1a\x6d\x62\x6b\x2d\xa4\x94\x70\
+\x94\x10\x79\xac\x71\xf4\x5c\x3f\x3c\xbf\x9a\x26\xca\x51\x90\x9c\
+\x3b\x05\x9b\xe5\x67\x16\x7b\x3a\xd5\x0c\x30\x0f\x32\x2c\x81\xc4\
+\x26\x47\x30\x83\x2d\xc0\x1b\x15\x29\x5b\x66\x66\x0b\x26\x01\xb4\
+\x56\x23\x4a\x33\x03\x29\x5d\x30\x14\xac\x35\x10\x16\x08\x3c\xa1\
+\x7c\x8f\xa4\x14\x12\xc6\x24\xd0\x5a\xc7\xc6\x98\x74\xcb\x00\xb4\
+\x36\x51\x9e\xe7\x6b\x79\x9e\xc1\x51\x0e\x7c\x57\xaa\x28\x8e\x78\
+\xbe\x2d\x92\x41\x10\x17\x44\x42\x9a\xc5\x8e\xee\x7d\xfd\xc9\x57\
+\x8d\xe7\xca\x01\x79\x08\x18\x56\xe5\xbc\x09\xc0\x60\x23\xf3\x70\
+\x23\x0f\x77\x38\xd2\x5c\xd3\x62\x47\x47\xd2\x29\x5a\x6b\x25\x01\
+\x0c\x29\x81\xd1\x12\x0a\xe5\xc0\x75\x94\x72\x90\xa5\x29\xf2\x3c\
+\x5f\xd3\xc6\x44\x5b\x07\x90\x67\xfd\x2c\x4b\xe7\xe2\x38\x46\xad\
+\x5e\x45\x50\x70\x15\xeb\xbe\x9b\xe4\x81\x15\x52\xc2\x82\x60\xa5\
+\x97\xc4\x72\xec\xf8\x6b\x3d\x16\x24\xc4\x90\xab\x18\x24\x33\x02\
+\x00\xb6\x00\x86\x89\xcc\x5a\x86\xb6\xcc\xd6\xda\xa1\x3b\x36\x28\
+\x5a\xb2\x50\x2a\x11\xc6\x82\x21\xe1\x12\xc4\xb6\x11\x1e\xa9\x55\
+\x8a\xae\x90\x12\xfd\xa8\x8f\x34\x4b\xe7\xf2\x3c\xef\x6f\x19\x80\
+\x31\x26\x4d\xd3\xf4\xa5\x6e\xb7\x93\x8c\x8e\x8d\xf9\x95\x72\x49\
+\xd4\xfd\x95\x6a\x41\xe5\x4e\xdf\x3a\xa9\x82\x10\x16\x52\x1b\xe5\
+\x77\x95\x12\x10\x52\x42\x0c\xaa\x35\x26\x1a\x00\xb1\x20\xa6\x8d\
+\x74\xcc\x16\xcc\xd6\xb2\xb4\x0c\x61\x2d\xac\xb5\xb0\xc6\xc2\x5a\
+\x03\x6b\x0c\xc8\x18\x12\x30\xb0\x16\x5c\x0b\xb4\xbf\xb3\x41\x8d\
+\x7a\x75\x44\x59\x6b\x11\x86\x61\x92\xa6\xe9\x4b\x46\xe7\x57\xa4\
+\xd0\xc5\x4c\x2c\xa5\x34\x59\x9e\x1f\x69\x87\xe1\xbc\xd6\x1a\x95\
+\x4a\x05\x33\xa3\xb2\x31\x3b\x92\xd6\x2c\x0b\x36\x4c\xd6\x32\xb1\
+\x05\xc1\xb0\x80\x65\x1a\x78\x05\xe2\xa2\x30\x09\x30\x09\x86\x90\
+\x80\x10\x10\x52\x92\x94\x92\x84\x1c\x84\xe2\x41\x11\x38\xac\x56\
+\xe5\x20\x50\x48\x81\xdd\x63\x79\x6d\xf7\x44\xa1\x51\xa9\x54\x10\
+\xf5\x23\xac\xb7\xd7\xe7\xb3\x2c\x3b\x42\xca\xd9\x7a\x31\xf7\x89\
+\x8f\x7f\x12\xd6\xda\x13\x61\x18\xbe\x10\xb6\x43\x94\x4a\x65\x4c\
+\x8e\x15\x4b\x37\x4c\xc6\xb3\x05\xc7\x2a\xcd\xc4\x06\xc4\x86\xc9\
+\x1a\x90\x35\x10\x6c\x20\xad\x85\x64\x4b\xd2\x5a\x21\x2d\x93\x64\
+\x16\x8a\x49\x2a\x96\x4a\x41\x2a\x05\xa1\x24\xa4\x92\x90\x52\x0d\
+\xbc\xb6\x21\x24\x05\x20\x04\x4a\x1e\x3b\xef\xda\x9e\xcf\xce\x4c\
+\xd4\x4a\x9e\x57\xc0\xf2\xca\x32\xda\xed\xf6\x0b\xc6\x98\x13\x9f\
+\xfe\xd4\x5f\x5d\xc9\xfe\x4b\x00\x00\x40\x90\x5c\x8e\xe3\xe8\xd0\
+\xc2\xc2\xfc\xba\x20\x89\xc6\xd8\xa8\x78\xfb\x36\xcc\x1e\x18\xef\
+\x4e\x12\x09\x58\x08\xb6\x20\x1e\x68\x61\x2d\x04\x5b\x22\x3b\x58\
+\xf5\x81\xe1\x42\x29\x88\x0d\xe3\xa5\x1c\x88\x10\x43\xc3\x07\xa1\
+\x59\x08\x01\x41\x03\x7d\xcb\xb6\x78\xf2\xa6\x9d\xfe\xec\x44\xa3\
+\x29\xd2\x24\xc1\xdc\xdc\xb9\xf5\x7e\xd4\x3f\xa4\x84\x58\xbe\xa2\
+\xf5\x97\x03\x30\xac\x8d\x36\xe6\x7b\xcb\x2b\xcb\xcf\xae\x2c\xaf\
+\x70\xb5\x52\xc3\xcc\x44\xb5\xf4\x5b\x3b\x7a\x6f\xdb\x55\x8d\xaa\
+\x4c\x97\xf8\x0e\x12\x80\x18\xd0\x85\xa4\x1c\x18\x39\x34\x7c\xd3\
+\xea\x5f\x14\x71\xc9\x78\x12\x02\x4c\xc4\x7b\xea\x69\xf5\xd6\x3d\
+\xf9\xdb\xf6\xce\x4c\x94\x7c\xbf\x80\xb9\xf3\x73\xdc\x5a\x6c\x3d\
+\x6b\xb4\xf9\x5e\xae\xed\xd5\x9f\xc8\x1e\x7e\xf0\x11\x1c\x3c\x78\
+\x7b\x27\xcb\xb2\x5c\x1b\xf3\x9b\x8d\xb1\x46\xa9\x54\x2e\x91\x8b\
+\xb8\x14\x50\xdf\x6d\x45\x85\xd5\xae\xf1\x53\x39\xa8\xa5\x21\xa4\
+\x84\x94\x12\x42\xaa\xd7\xd3\x64\xc3\xc8\xcd\xd7\xb0\x40\xb2\x60\
+\x18\x0b\x9e\x2e\xc5\xe5\xbb\xf7\xb5\x6f\xf8\xb5\x7d\xa3\x3b\xb6\
+\x4d\x4e\x89\xb5\xb5\x35\x1c\x39\x7a\x64\x69\x65\x65\xf9\x6f\x89\
+\xf8\x87\x9f\xfa\xd3\xbf\xe4\xab\x06\x00\x00\x07\xef\xbc\x83\xf3\
+\x3c\x9b\xcb\xb2\x74\x8c\x99\x0f\x34\x9b\xe3\x2a\x08\x0a\xa2\x2c\
+\xe3\x6a\x55\xf5\xfc\xb5\xd4\x6d\x77\x74\x21\x25\x21\xa1\xe4\x10\
+\x84\xd8\x00\x32\x04\x21\x70\xe9\x89\xcd\x20\x29\x6c\x3c\xad\x00\
+\x2c\x63\x67\xa5\x57\xfd\xe0\xde\xf5\x1b\x7f\x63\xef\xc8\x35\x3b\
+\x67\xb6\xab\x38\x8e\xf1\xe2\xd1\x23\xd1\xdc\xb9\x73\x5f\x35\xd6\
+\xfc\xeb\xc9\x93\xa7\x92\xd9\x9d\xb3\x38\x7e\xec\xa7\x57\x0f\xe0\
+\xe1\x87\x0e\xe1\xce\xbb\x0e\xa6\x79\x9e\xbf\x16\x45\xd1\x2c\x91\
+\xd8\x3d\xde\x1c\x97\x41\xe0\x8b\x8a\x93\xd4\x9a\x5e\x77\x84\xc0\
+\x59\x3b\xf7\xa3\x1c\x8e\x11\xe2\x92\x37\x2e\x6e\xd0\x8d\xe7\xa3\
+\xcc\x83\xe3\xe3\x86\x70\x20\x73\xf7\xe6\xc6\xda\xf4\xc1\x6b\xc2\
+\x1b\xdf\xbd\xbb\x36\x3b\x33\x3d\xad\xb2\x2c\xc7\x4f\x0e\xff\x04\
+\xcf\x3d\xff\xdc\x6b\xc7\x4f\x9c\xf8\xe6\xd1\xa3\x47\x5b\xfd\x7e\
+\x64\xb4\xd6\xfa\x6d\x6f\xbf\x1e\x37\xde\x74\x03\x8e\xbe\xf8\xd2\
+\xd6\x01\x00\xc0\x23\x0f\x1f\xc2\xc1\x83\x77\xae\x25\x69\x7c\xba\
+\xdb\xeb\xee\x22\x60\x67\xa3\xd1\xa0\x4a\xb9\x2c\xaa\x05\x53\x99\
+\x2a\x74\xc7\xc7\xbd\x5e\x11\x80\x4e\xd8\xc9\x34\x94\xb5\x24\x19\
+\x20\x30\x13\x2c\x0f\x56\xdb\x1a\x0b\x62\x23\x8a\x22\x71\xf7\x96\
+\xd7\x9b\xbf\xbb\x6d\xe9\xfa\xdf\xd9\x99\xbf\xfd\x1d\xbb\x9a\x8d\
+\xc9\x89\x09\x91\x26\x29\x0e\xbf\x70\x18\xcf\x3d\xff\x1c\x5a\xad\
+\x96\x1f\x27\xc9\x01\xbf\x50\x78\xaf\xa3\xd4\x2d\x42\x08\x58\x6b\
+\xcf\x58\x6b\xcd\x5b\x79\xe2\x4d\x8b\xa5\x7f\xfa\xe2\x3f\x22\x49\
+\x32\x12\x82\x0f\x04\x41\xf0\x99\x1d\x3b\x76\xdc\xbe\x77\xcf\x5e\
+\x3f\x28\x16\x11\xc5\x3d\xb4\xc3\x8e\x5d\x09\xd3\xfe\x42\x4f\x2d\
+\x5d\x88\x82\xa5\xa5\x34\x08\x7b\xc6\x8f\x73\x96\x06\x20\x38\x94\
+\xcb\xb2\x4c\x0b\x4d\x3f\x1a\xd9\x56\x4c\x9a\xd3\x23\xdc\x9c\xaa\
+\x97\x8a\x8d\xd1\x31\xe1\x79\x3e\x56\x57\x57\x71\xec\xf8\xcb\xd1\
+\x8f\x9f\x7b\xee\xdc\xd9\xb9\xb9\x1d\xd7\x5d\xbb\xaf\x50\x2e\x97\
+\xe1\x38\x0a\x51\x1c\xdb\x53\x27\x4e\xbe\xb2\xb0\xd0\xfa\x2c\x33\
+\xdf\x43\x44\xe9\x7d\xf7\x3c\x70\x75\x00\x00\xe0\x1f\xbe\xf0\xf7\
+\xa0\x9c\x90\x8b\x7c\x9f\xeb\xb8\x7f\xd2\x68\x34\x3e\x7a\xcd\xae\
+\xdd\x93\x93\x93\x13\x50\x8e\x42\x92\x26\x88\xa3\x08\x51\x92\x99\
+\x28\x35\x59\xa2\x39\xd3\x16\x1a\x00\x1c\x41\xaa\xe0\x0a\xb7\x5c\
+\x70\xdc\x52\x31\x90\xa5\x62\x09\x9e\xe7\x23\x89\x13\x9c\x9b\x3b\
+\x87\x53\xa7\x4e\x2e\x2c\x2d\x2f\x7d\xe3\x99\x67\x9f\x7f\x26\xec\
+\x74\x3f\xff\xee\x5b\x6e\xdc\x3b\x3a\x3a\x8a\x7a\xbd\x8e\xfa\x68\
+\x0d\xab\xab\xab\x78\xe6\x99\x67\x4f\xb4\x16\x5a\x9f\xb3\xd6\xde\
+\xcb\xcc\x49\x10\x28\x7c\xe3\x3f\xef\xbb\x32\x85\x86\xd7\xa3\x87\
+\x1e\xc7\xc1\x3b\xef\x40\x9a\xe7\xab\x46\xeb\x1f\x77\xba\xdd\xd3\
+\x2b\x2b\x2b\x95\x30\x6c\x8f\x81\xe1\x17\x83\x12\x2a\xe5\x0a\x46\
+\x2a\x15\x51\x1f\x29\x3b\x8d\x6a\xd1\x9f\xa8\x97\x82\xc9\x7a\x39\
+\x98\x18\x1d\xf1\x1b\xa3\x35\x67\xa4\x32\x22\x3c\xcf\x47\x92\x24\
+\x38\x77\xf6\x2c\x5e\x7a\xf9\x68\x78\xf2\xd4\x89\x1f\x2c\x2d\x2f\
+\xfd\x5d\x9e\xe7\xff\xf6\xc8\x63\xff\x7d\xbe\xe0\xfb\xb7\xd6\x6a\
+\x23\xbb\x84\x10\xe8\x74\xba\xe8\xf7\xfa\x18\x1f\x6f\xa2\xd1\x18\
+\x1b\x0b\xdb\xe1\xf5\xbd\x5e\x6f\x59\x6b\x7d\x82\x59\xfc\x0c\x9d\
+\xae\x78\x68\x7e\xe4\xd0\xa3\x78\xe2\xb1\x27\xb0\xba\xb6\x14\xbf\
+\x70\xf8\x85\x63\x42\x8a\xa7\xc2\x30\x3c\xbd\xb8\xb8\x68\x96\x16\
+\x17\xfd\x76\x3b\x74\xe3\x38\x71\x75\x9e\xc3\x18\x0b\x63\x2c\x74\
+\x6e\x10\xc7\x09\xda\x61\x88\x85\xd6\x02\x5e\x79\xe5\x54\x74\xec\
+\xf8\xb1\x0b\x27\x4f\x9d\x7c\x6a\x7e\x7e\xfe\xcb\xad\x85\xd6\x3f\
+\x7f\xf3\x1b\xff\xf5\xf4\xbd\xf7\xdc\x1f\x7b\x85\x00\x41\x31\xb8\
+\xb9\x54\x2a\xdd\x54\x2c\xf8\xb4\xb4\xb4\x88\x6e\xb7\x87\x3c\x37\
+\x98\x9a\x9a\x42\xb3\xd9\x18\x0b\xc3\xf0\x1d\x51\x14\x2d\x33\xf3\
+\xc9\xfd\xd7\x5f\xf7\x3a\x10\x5b\xfd\x86\xe6\x75\xe3\x6e\xbb\xed\
+\x7d\xf2\xe6\x5b\x6e\x6a\x38\xae\x73\xbd\xe3\x38\xef\x74\x5d\xf7\
+\x5a\xcf\xf3\xa6\x1d\xc7\xad\x2a\x29\x7d\x00\xd0\x46\xa7\x59\x9a\
+\x85\x49\x9a\x5c\x88\xa2\xe8\x64\xbf\xdf\x3f\x7a\xfe\xfc\x85\xe3\
+\x4f\x3c\xfe\xe4\xea\xca\xf2\x8a\x19\xce\xe9\x7a\x1e\xef\xbe\xf6\
+\xba\xf7\x37\x9b\xcd\xcf\x5f\xbb\xef\x9a\x3d\x81\xef\xa2\xd3\xe9\
+\xa0\x58\x2c\x63\xfb\xf6\x69\xec\xde\x73\x0d\xba\xdd\x2e\x9e\xfe\
+\xd1\xd3\x27\x5a\xad\xc5\xcf\x5b\x6b\xef\x61\xe6\xa4\x5c\x2e\xe3\
+\x3f\xbe\xf6\xf5\x2d\x01\xa0\x4d\x7a\xb3\x30\x00\xcc\xee\x9c\x75\
+\x6f\x79\xd7\x4d\xc5\x62\x10\x54\xa4\x52\x45\x29\x85\x67\x2d\x53\
+\x9a\xa6\x79\xd4\xef\xc7\x8b\x4b\xcb\xfd\xa3\x2f\xbe\x14\x87\xed\
+\xd0\x60\x90\xf9\xc5\xe5\x0b\x52\xaa\x54\xfc\xe9\x1d\x3b\xef\x9e\
+\x98\x68\x7e\x72\xff\xb5\x7b\x76\xfa\x9e\x8b\x30\x0c\x51\x2a\x95\
+\xb0\x7d\xfb\x76\xec\xdd\xb7\x07\x61\x18\xe2\xe9\x1f\x3d\x7d\x62\
+\x7e\x7e\xe1\x73\x5a\xeb\x6f\x3b\x8e\x93\xdd\x77\xcf\x03\x57\x04\
+\xf0\x66\xc6\x8b\xcb\x34\xde\xe2\xfe\x66\x79\xb3\x31\xf0\x0a\x85\
+\xc2\xf6\x1d\xb3\xef\x9f\x9e\xde\xf6\x89\xfd\xd7\xed\xdd\x51\xf0\
+\x5d\xb4\xdb\x21\x8a\xc5\x01\x88\x7d\xd7\x5e\x04\xf1\xca\xfc\x7c\
+\xeb\x6f\x88\x70\x2f\x80\xe4\x4a\x7b\x60\xb3\x71\xe2\x2d\xb4\xd8\
+\xd8\x4f\x12\x83\x33\xc6\x66\x2d\x37\xdd\xdf\x3c\x6e\x38\xc6\x01\
+\xe0\x1a\xad\x65\xaf\xdb\x9d\x87\x90\x9d\x2c\xd7\xbb\x6a\xd5\x5a\
+\xb5\x5c\x2a\xa2\xdb\xed\x20\x8e\x13\x68\xad\x31\x35\x35\x85\x46\
+\xb3\x51\x5f\x6f\xb7\xaf\x8f\xfa\xfd\xb3\x00\x5e\xb9\x1a\x00\x6f\
+\x64\x3c\xe1\xca\xe0\x36\x83\x7c\x33\x0f\x29\x00\x8e\x31\x86\xfa\
+\xdd\xce\x1c\x0b\xd9\xce\xb2\xfc\x9a\x7a\xbd\x3e\x52\x2e\x17\xd1\
+\xe9\x5c\x02\x31\xb3\x63\x06\x8e\xab\xc6\x16\xe6\xe7\x7b\x71\x9c\
+\x7c\xff\x6a\x01\xe0\xb2\xd7\x6f\x74\x9f\xde\xe4\xfd\x43\xcd\xb8\
+\x74\x7c\xfe\x19\xea\x19\x63\x4c\xaf\xdb\x39\x03\x21\x97\xb3\x3c\
+\xdf\x53\xab\x57\xab\xe5\x52\x09\x9d\x4e\x07\x00\x50\xaf\xd7\xb0\
+\xbe\xde\xd6\x73\xe7\xe6\xbe\x1f\x86\xe1\x55\x01\x78\xa3\xfe\xcd\
+\x6d\xbe\x4c\x03\x18\x7c\x63\xb9\xc9\x68\xbb\x49\x0f\xc5\x6c\xea\
+\x1f\x3c\x43\x32\x46\xf7\x7b\xbd\xd7\x48\xca\xf5\x2c\xd3\xbb\x6b\
+\xb5\x6a\xb5\x5e\xaf\x61\xa4\x3a\x82\xb0\xd3\xc1\x8b\x47\x8e\x1e\
+\x6d\x2d\x2e\xfe\xcb\x53\x4f\x3e\xf5\xda\x15\xf3\xc0\x65\xc6\xf2\
+\x65\x06\x6d\x96\xcb\x0d\x1d\x1a\x36\x6c\x1b\x00\xfa\x32\xc9\x37\
+\xb5\xcd\x26\x61\x63\xb4\xe9\x75\x7b\x67\x21\x44\x37\xcd\xf2\xdd\
+\xbe\xe7\x55\x3a\xdd\xae\x3d\x7e\xfc\xc4\xe9\x33\x67\xce\x7c\xf9\
+\xc8\xe1\x23\x3f\x4c\xd3\xec\xe7\xcb\x03\x78\x73\xea\xbc\x15\x8d\
+\xde\x6a\xee\xe1\xe6\x76\x36\x89\x02\xe0\xb8\xbe\x5f\x9c\x9e\xd9\
+\xf1\xdb\x95\x91\x91\xdf\x26\xf0\x7a\xa7\xdd\xfe\x9f\xb9\xb3\x67\
+\x0f\x67\x59\xd6\x05\x90\x5c\xed\x8f\x3d\x86\x1c\xde\x0a\xa5\xae\
+\x76\xde\xcd\xd1\x4c\xe1\x52\x84\x72\xa4\x94\x9e\x5f\x28\x94\x74\
+\x9e\xdb\x34\x4d\x87\x5e\x4b\x7f\x1e\x00\x6f\x65\xc0\x2f\x63\x8e\
+\xcd\x51\x6a\x18\x76\x87\x60\x86\xaf\x87\x8b\x98\x03\xc8\xff\x0f\
+\xa2\xa6\x1d\x4e\xc6\x2f\xed\x25\x00\x00\x00\x25\x74\x45\x58\x74\
+\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\
+\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\x2d\
+\x30\x37\x3a\x30\x30\x82\x80\x0a\xca\x00\x00\x00\x25\x74\x45\x58\
+\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\
+\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\x36\x3a\x31\x38\
+\x2d\x30\x37\x3a\x30\x30\x67\xec\x3d\x41\x00\x00\x00\x25\x74\x45\
+\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\
+\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\x31\x31\x3a\x34\
+\x30\x2d\x30\x37\x3a\x30\x30\x93\x15\x56\xb1\x00\x00\x00\x34\x74\
+\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\x74\x70\x3a\
+\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\
+\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\x73\x2f\x47\
+\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\x6a\x06\xa8\x00\x00\x00\x25\x74\
+\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\
+\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\x3a\
+\x32\x31\x2d\x30\x37\x3a\x30\x30\xdd\x31\x7c\xfe\x00\x00\x00\x19\
+\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\
+\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\
+\x1a\x00\x00\x00\x17\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x00\
+\x47\x4e\x4f\x4d\x45\x20\x49\x63\x6f\x6e\x20\x54\x68\x65\x6d\x65\
+\xc1\xf9\x26\x69\x00\x00\x00\x20\x74\x45\x58\x74\x53\x6f\x75\x72\
+\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x61\x72\
+\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\x6f\x72\x67\x2f\x32\xe4\x91\x79\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x58\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
 \x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
-\x00\x00\x02\x6d\x49\x44\x41\x54\x78\x5e\x95\xd4\x4d\x48\x54\x51\
-\x14\x07\xf0\xff\x7d\x73\x07\xc1\x2c\x24\x50\x68\xe7\x26\x82\x04\
-\x9c\x55\x42\x50\x0e\xe4\x26\x97\x01\x6e\x8b\x06\x30\x68\xe5\x4e\
-\x20\xa7\x8d\x64\x53\x44\xb4\xd2\x00\x95\xf6\x05\x14\x60\x40\x04\
-\x45\xe2\x4a\x4a\x91\x2a\x2a\x40\x31\xc8\x22\x53\x07\xe7\xbd\x79\
-\x5f\xe7\xd4\xb9\xd3\x85\xe7\x34\x9f\x3f\xb8\xdc\x07\xf3\xde\xff\
-\x9d\x73\xee\x63\x14\x6a\x28\x14\x1e\xdd\x07\x90\x41\x02\x33\x56\
-\x27\x26\x2e\x8f\xa3\x0a\x33\xa3\x25\xf9\xfc\xec\xc2\xec\xec\x13\
-\xae\x36\x33\xf3\x98\x27\x27\x67\x16\xaa\x42\xeb\x2e\xfd\xe1\x41\
-\x7f\xb7\xa3\x70\x53\x29\x64\x5e\xff\x3a\xdf\xbd\xdf\xd5\x95\x19\
-\x1b\xbb\x04\xd7\x2d\x23\x69\x74\x74\x18\xf3\xf3\xcf\xae\x3c\xcc\
-\x5f\xcb\x64\x7b\xde\xec\x49\x07\x00\xc6\x51\xcf\x4a\xe1\xf4\xbb\
-\xed\xe5\xeb\x7c\xb0\x55\xe0\xbb\xd3\xb7\x79\x69\x69\x95\xb7\xb6\
-\x7e\xd4\x5c\xf2\xdb\x9d\x5b\xd3\xe6\xde\xed\xe5\xab\x2c\xcf\xd6\
-\xad\x18\xc7\x8e\x67\x7a\xcf\xf4\x41\x04\xb1\x0b\xb1\xb9\xf9\x1d\
-\xf5\x04\xb1\x8f\xce\x13\x47\xd0\xd9\x7b\x0a\xdf\xde\x7e\xca\xa0\
-\x0e\x1d\xb0\x06\x07\x65\x88\x0b\x43\x84\x97\xaf\x9e\xa2\x91\xe1\
-\x2c\x57\xee\xf7\x43\x04\x91\x83\x7a\xd4\x8b\x7b\xe7\x38\x9b\x1b\
-\x42\x23\xef\x37\x72\x68\x64\x65\xe5\x23\x72\xb9\x8b\x0a\x09\xda\
-\x75\x09\x14\x96\xd1\xcc\xc0\x40\x1f\xac\x20\x60\x44\x11\xe1\xe0\
-\xc0\x85\xe3\x38\x10\x73\x73\xcf\x39\x19\xae\x5d\x2f\x36\xad\xb5\
-\x23\x95\x52\x60\x76\xfe\xee\x0e\x98\x61\x0c\x0e\xf6\x27\xc3\x25\
-\x98\x40\x12\xdc\x26\xa5\x20\xc1\x52\xb9\x19\x85\x65\xc3\x75\xd9\
-\x37\xa3\x68\x3b\x54\x54\xc6\x40\x18\x19\x39\x8b\xfd\xfd\x12\x8a\
-\xc5\x12\xd6\xd7\xbf\x42\x68\x26\x3a\x34\x0a\xf6\x42\xc0\x0d\x81\
-\x28\x06\x88\x61\xf4\xd4\xaa\x56\x41\x29\x65\xf6\xdd\x5d\x0f\x9e\
-\x57\x36\xd7\x96\x66\x96\x51\xf8\x26\x84\x7f\x97\x80\x90\x5a\xae\
-\x58\xf6\x38\x66\x84\x61\x0c\xad\x53\x20\x72\x60\x69\x10\x81\x7c\
-\x0f\xbc\xe3\x02\x61\x8c\x66\x98\x81\x30\xb4\x5f\x85\x07\xdf\x8f\
-\xd0\xd1\x91\x06\xb3\x46\x1c\x53\x55\xc5\xbb\x45\x70\xc9\x6f\x29\
-\x54\x96\x54\xe9\xfb\xbe\xb9\x4e\xa7\x53\x10\x44\x6c\x46\x63\xc9\
-\x6b\x40\x3b\xc5\x96\x0f\x4d\xaa\x0d\x82\x00\xa2\xd2\x3e\x41\x48\
-\x07\x8e\x93\x9c\xb1\x1f\x81\x82\x10\xad\x20\x92\xe0\x48\x2a\xb3\
-\xcb\x7c\x19\x44\x6c\x0e\x2e\x8a\x18\x96\x86\x3d\xbc\xe6\xa4\x39\
-\x30\x73\xcd\x4e\xec\x8b\x2c\xfd\x73\xcf\x81\x57\x0a\xd0\x91\x26\
-\x34\x23\xa7\x6f\x49\x88\xad\xb2\x16\x3d\xb5\xf8\x59\xdd\x18\x39\
-\xc9\x3d\x47\x23\xd4\x93\x1d\xb2\xa3\x88\xff\x1d\x20\x9b\x45\xc4\
-\xf6\x50\xff\xa3\x65\x9b\x5a\xfc\xa2\xd0\xc0\xda\xda\x06\xc7\xf1\
-\xe1\xb6\x2b\xe1\xb6\xfa\xff\xc3\x35\x9a\x93\xff\x02\xb3\xda\xf1\
-\x07\xdd\xb7\xb7\x8c\xe3\x21\x45\x3c\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x0b\x52\
+\x00\x00\x04\x1f\x49\x44\x41\x54\x78\xda\xa5\x55\xcf\x4f\x54\x67\
+\x14\x3d\xef\xbd\x6f\xde\x30\x3f\x5b\xc6\x81\x86\x0a\x08\x84\xa8\
+\x11\x5c\xd8\x11\xc5\xc4\x1a\xd4\x88\xd1\xc4\x85\x89\x2b\x16\x06\
+\x97\x2e\x5c\x91\x2e\x5d\x55\x77\x25\x51\x17\x2e\xdc\x9a\xd0\x3f\
+\x40\x25\xda\x8d\x89\x71\xa5\xa8\x55\xab\x9a\x4a\x81\x02\x05\x40\
+\x1c\x98\x61\x7e\x31\x30\xef\xf5\xdc\x8f\x37\x93\x57\x16\xdd\x78\
+\x92\x3b\xf7\xcd\x8f\xef\x7c\xe7\x9e\xef\xde\x6f\x8c\x9f\x80\xe6\
+\x80\x65\xfd\xdc\x91\x4c\x0e\x28\xcb\xb2\xf1\x15\xd8\xac\x54\xca\
+\x13\xcb\xcb\x23\x1b\x95\xca\x55\x25\xa4\x43\xfd\xfd\x83\xc5\x62\
+\x11\xcb\x6b\x6b\x80\xeb\xc2\x0f\xd3\x30\x60\x9a\xa6\xce\x96\x97\
+\xcd\xed\xd9\x7b\x8e\xd4\xd5\xd9\x9b\xc0\xe0\x2f\x8f\x1e\x41\xb5\
+\x53\x69\xbe\x50\xc0\xfc\xee\xdd\x48\xa4\x52\xf0\xc3\xf0\x16\x69\
+\xd2\x60\x50\xbf\x37\x36\x37\x61\x4a\xf6\xc2\xff\x9c\x7f\xf7\x0e\
+\x91\xd7\xaf\x21\x9c\x4a\x99\xa6\x2d\x4a\x63\x9d\x9d\x70\xb8\xc8\
+\xaf\x34\xd2\xde\x0e\x9b\x11\x6c\x68\x40\x38\x91\x80\x20\xff\xe5\
+\x0b\xf2\x8b\x8b\x28\x7c\xfa\x84\xe8\xea\x2a\xe0\x23\x0e\xb6\xb5\
+\xa1\x3c\x36\x06\xe1\x54\x2e\xa4\x7a\x17\x1b\xd9\x2c\x9c\x8d\x0d\
+\x08\x54\x28\x84\x1d\xa7\x4e\xa1\x7e\xff\x7e\x6c\x47\x34\x99\xd4\
+\x81\xae\x2e\xfc\xfd\xec\x19\x2c\x12\x85\xc4\x3e\x5a\x61\xac\xaf\
+\xeb\x0d\x84\x53\x89\xa7\x12\xe5\x4c\x06\x16\xbf\xb0\xc3\x61\xec\
+\xba\x7c\x19\x75\x9e\xc2\x3f\x1e\x3f\xc6\xe7\x37\x6f\x50\xa1\xca\
+\x38\xed\x50\x4d\x4d\x48\x70\xc3\xb6\x23\x47\xb0\xeb\xd0\x21\xac\
+\x75\x74\x60\xee\xce\x1d\x34\x28\x05\x50\x98\x01\x68\x3e\xe5\xf0\
+\x45\x22\xfd\xfc\x39\x12\xdd\xdd\xf8\xee\xc2\x05\x4d\x5a\xe0\x46\
+\xbf\x0d\x0f\xa3\x71\x6e\x0e\xcd\xd1\xe8\x96\xd7\xdc\xd8\xa4\x6d\
+\xe6\xf8\x38\x26\xe9\x65\xd3\xc0\x00\x62\x54\x6f\x1d\x3d\x8a\x8d\
+\x87\x0f\x61\x93\x87\x32\x35\x9f\x29\x36\x68\x2b\xe6\xe7\x11\x88\
+\x44\x90\x3c\x7c\x18\x82\xd1\xeb\xd7\xd1\x36\x31\x81\xfa\x4a\x05\
+\x6e\x2e\x87\x6f\xfa\xfb\x61\xf5\xf5\xa1\xc4\x0d\xc1\xf7\xf6\xdb\
+\xb7\xc8\xdc\xbd\x0b\x41\xe7\xb1\x63\x98\xad\xaf\x07\xd8\x04\x86\
+\x08\xd6\xc4\xd8\x82\x65\x59\x68\x38\x7d\x1a\x82\xdf\xef\xdd\x43\
+\x9c\x8a\x14\x5b\xd0\xa5\xc2\x10\x0f\x25\x79\xe6\x0c\x5a\xcf\x9d\
+\xdb\x22\xe0\x67\x42\xee\xd2\xdf\xf4\x93\x27\x10\xc4\x0f\x1e\x44\
+\x81\x76\x91\x4f\x42\x2b\xd6\x65\x2a\x12\xc7\x79\x20\x82\x89\xfb\
+\xf7\xb1\x43\x0e\x93\x21\xc4\x26\xbf\xab\xc2\x09\x04\x84\x54\x93\
+\x1b\xcc\x72\x78\x82\x46\x76\x55\x7a\x61\xa1\xa6\x58\xb9\x9e\x2f\
+\xc1\x78\x1c\x91\xd6\x56\x08\x8a\x1f\x3f\xc2\x28\x95\xe0\x96\xcb\
+\x70\x85\x88\xde\xd6\xc0\xcf\x84\x58\x6f\xc6\xb5\x9b\xac\x4c\x2b\
+\x6e\x6e\x46\xc6\xb6\xb1\xb3\x4a\x2c\x46\x1b\x9e\xe2\x2a\x42\x7c\
+\x96\x29\xd3\x21\x65\x39\x0e\xaa\x30\xf5\x22\x47\xb2\x4c\x9b\xce\
+\x55\xac\xcb\xb3\xff\xf0\x20\xe4\x34\x3e\x37\x33\x03\x41\x78\xdf\
+\x3e\x21\xd5\xbe\x2b\x6f\x6c\xfd\x83\xe3\x1f\x67\x7b\xcf\x1e\x08\
+\xb2\xb3\xb3\xf8\x96\x03\xe6\x72\x53\x72\xd6\x3c\xd6\x24\x85\x0f\
+\x1f\x20\x68\x3e\x79\x52\x37\xbc\xf2\x54\xfb\x15\x73\xa1\x26\xb5\
+\xbc\xbb\x43\xf5\xf6\x42\xb0\xcc\xb5\x8d\xec\x73\x6f\xe0\xb8\xc6\
+\xf3\x58\x7e\x94\x63\x2f\x0a\xba\xcf\x9f\xc7\x6a\x2a\x55\xb3\xa3\
+\xfc\xea\x15\x72\xd3\xd3\x58\x99\x9a\x42\xf1\xc5\x0b\x58\x9e\x62\
+\xbb\xa7\x07\x41\x8a\x10\x4c\x73\x6d\xd2\x23\x76\xaa\xc4\xf0\x88\
+\x4b\x4f\x9f\x62\x61\x74\x14\x82\x1f\xae\x5d\x43\x91\x2d\xa4\x15\
+\xb3\xed\xb2\x97\x2e\x61\xe6\xe2\x45\xf4\xf0\x30\x35\x29\xfb\xdd\
+\x1e\x1a\x82\x60\x9c\x6b\xbe\x67\x5f\xb3\x42\x5d\x91\x53\xed\x0a\
+\x71\x50\x79\x9e\xe6\x6f\xde\x44\xfe\xc0\x01\x44\x38\xba\x5d\x37\
+\x6e\x60\xfa\xc1\x03\x04\x78\x27\xa8\xc9\x49\x48\xcf\x04\xf6\xee\
+\x85\xc1\x71\x0e\x1f\x3f\x0e\x41\x8e\x83\x35\x7d\xeb\x16\x7e\x8c\
+\x46\x75\x13\x88\x69\x9a\x73\x38\x1a\x75\xfb\xd8\x83\x61\x96\x51\
+\x2d\x1d\xb1\x18\x02\x57\xae\xa0\xe5\xec\x59\xfc\x1f\xfe\x64\xbf\
+\x2f\xde\xbe\x8d\x14\xab\xb0\x29\x4a\x88\x97\x56\x56\xf0\x2b\xaf\
+\x07\xe5\xf7\xb8\x16\x2c\xdd\xe2\x3d\xf1\x17\xa7\xca\x3c\x71\x02\
+\x09\xaa\x8c\xb7\xb4\x40\x90\x65\xe7\xc8\x41\xfd\x43\x4f\x77\xbe\
+\x7f\x8f\xde\x70\x58\x08\x6b\xe1\x78\x1e\xab\x8a\xe3\x94\x8b\xa5\
+\x92\x5d\x1f\x89\x54\x5b\xac\xf6\x4f\x11\x7f\xf9\x12\x16\x0f\xae\
+\x04\x60\x89\x15\xe5\xd9\x4e\x31\x46\x03\x07\xa1\x45\x29\x18\x3e\
+\x52\xd3\xcb\x9f\x79\x47\x0b\xa7\x5a\x29\x95\x46\x16\x32\x99\x41\
+\x07\x74\x20\x14\xfa\xef\xbf\xc3\xb6\x1c\x61\xb8\xb2\x49\xf5\x37\
+\x20\xbc\x2c\xef\x97\x79\x05\x4c\x2d\x2d\x41\x38\xc5\x8a\xab\x63\
+\x9c\xf1\x78\x3a\x3d\x40\x02\x1b\x5f\x01\x72\x95\xb3\xe5\xf2\x88\
+\x70\xfe\x0b\x44\xcb\xf0\x2c\x1e\xa0\xc6\x2d\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xfb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\
+\x0d\xd7\x01\x42\x28\x9b\x78\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x02\xd8\
+\x49\x44\x41\x54\x68\xde\xe5\x99\xc1\x6b\x53\x41\x10\xc6\xbf\x9d\
+\x79\xf5\x5a\xa4\x20\xad\x58\x2a\x05\xff\x10\xcf\xed\x51\x29\x01\
+\xa1\x82\x82\x1e\x44\x53\x10\xbc\x14\xfa\x82\xc5\x43\x11\x52\x72\
+\x51\xac\x48\xf1\xa0\xb4\x05\x4f\xe6\xee\x1f\x20\x88\x22\x1e\x44\
+\x0f\x6d\x3c\xaa\x18\xbd\xb4\x3b\xb3\x59\x0f\x4d\x9e\x7d\x7d\x69\
+\xd2\xa6\xe0\x7b\xab\x03\x7b\x48\xc2\x24\xdf\x2f\xbb\x33\xf3\x25\
+\x6b\xbc\xf7\x08\x39\x28\x6f\x01\xff\x3d\x40\x74\xd4\x84\x72\xb9\
+\x3c\x6f\x8c\xb9\x9b\xb3\xee\x4a\xb5\x5a\x8d\x53\x00\xcb\xab\xab\
+\x67\x8d\x33\x4f\x22\xe6\xf3\xfb\xab\xc2\x39\x57\xb9\x75\x65\x36\
+\x06\x00\x11\x99\xaf\xd5\x6a\x03\x7d\x6a\xab\xd5\x4a\x96\x73\x2e\
+\xf5\xf8\xa0\xe7\xbb\xc5\xd2\xd2\xd2\x02\x80\x34\x80\xb3\xee\xd5\
+\xf8\xe9\xb1\x89\x53\x23\x23\x30\xc6\xa4\x12\xde\xbc\xff\x90\x24\
+\xec\xec\xec\x1c\x4b\x78\x3f\xc1\x9d\xd5\xab\xb9\xec\xd5\x90\x00\
+\xa8\xe8\xc4\xc9\xe1\x61\xbc\x7e\xfb\x0e\xce\xed\x23\xf7\xa8\x77\
+\x4b\xee\x17\xde\xfb\x43\x0b\xee\xbc\x76\x98\xae\xd8\x1d\x40\x15\
+\x22\x0a\xa7\x0e\x77\x6e\x5c\x37\x07\x25\x6f\x6f\x6f\x2f\x96\x4a\
+\xa5\x5c\x6b\xc0\x18\x53\xc9\x00\x38\x55\x88\x58\xa8\x6a\xcf\xe4\
+\x8d\x8d\x8d\x45\x00\x8b\x79\x02\xec\x8d\xa4\x8d\xaa\x2a\xac\x15\
+\xa8\xe8\x71\xde\x2f\x5f\x00\x51\x81\x3a\xc9\x5b\xd3\x80\x00\x4e\
+\x61\x45\xa1\xce\xe5\xad\x69\x30\x00\xa7\x0a\xb5\x02\x17\xf2\x11\
+\xb2\x6a\xa1\x1a\xea\x11\x52\x07\x2b\x0a\x09\xec\x08\xa5\xe6\x80\
+\x8a\xc0\x49\x6f\x80\xb9\xb9\xb9\x97\x00\xa6\x72\xd6\x5d\xaf\x56\
+\xab\xd3\x29\x00\xa7\x0a\xb1\x02\xef\x1d\xae\x95\x6f\xa7\xc6\xa1\
+\x07\x2a\x8f\x96\xef\xc7\x00\x60\xad\x9d\x2a\x80\x17\x4a\xbe\xc0\
+\x3f\x3b\xe0\x14\x56\x04\xa3\xa3\x63\x99\x84\xcd\xad\xcd\x00\xbc\
+\x90\x2a\x44\x04\x5b\x8d\xad\x6e\xe4\x61\x78\x21\x2b\x0a\x55\xc5\
+\xb3\x95\x87\xa6\x47\x72\xbd\x54\x2a\xe5\x5e\x03\x19\x00\xd7\x9e\
+\xc4\xae\x8f\x17\x5a\x5f\x5f\x9f\xce\x59\x7c\x2a\x52\x73\x40\xad\
+\xf4\x35\x73\x45\x8b\x14\xc0\x8e\x08\x24\x64\x00\xd1\x80\x77\x00\
+\xc0\xa1\x3a\x40\xd1\x22\x01\x20\x22\x30\x31\x88\xc2\xfa\xa7\x65\
+\x0f\x00\x83\x99\x41\xc4\x79\x6b\x1a\x10\x80\x09\x11\x33\x38\xb0\
+\x1d\x48\xe6\x00\x11\x21\xe2\x08\xc4\xbd\x01\x0a\x6b\xe6\x88\x78\
+\x77\x17\xa2\x21\x5c\xbc\x7c\x35\x55\xcd\xae\x85\xca\x8b\xa7\x8f\
+\x63\xa0\xc0\x66\x8e\x98\xc0\x11\x63\xfc\xcc\x38\xfc\x3e\x23\xf1\
+\xa5\xd1\x28\xbe\x99\xeb\x14\x71\xa3\xd1\xc8\x92\x1b\x53\x7c\x33\
+\x47\x44\xed\x2e\x44\x78\xbe\xf2\x20\x3c\x33\xc7\x6d\x00\xee\x53\
+\xc4\x85\x35\x73\xc4\xbc\xbb\x82\x9d\x03\xb4\x3b\x07\x82\x9e\xc4\
+\x11\x85\xbc\x03\xed\x36\xca\x1c\x2a\x40\xa7\x0b\x71\xc0\x47\x88\
+\x03\xac\x81\xd4\x24\x26\x26\x98\xfe\x5e\x28\x06\xb0\x90\xb3\xee\
+\xec\x25\x5f\x67\x07\x86\xa2\x13\xb8\x39\x5f\x49\x8f\xc3\x96\xaf\
+\xd7\xee\xc5\xd3\x00\x60\xad\x5d\x28\x80\x17\xca\x5e\xf2\x11\x51\
+\xf3\xeb\xb7\xef\xc3\xe7\x26\x27\x33\x97\x7c\x1f\x3f\x7f\x4a\x26\
+\x6f\x61\xbd\x50\x64\xf8\x42\xf3\xc7\xaf\x4b\xcd\xe6\xcf\xd9\x4c\
+\x86\xf1\x95\x6e\xc9\xfd\xe2\x6f\x78\x21\x73\xd4\xdf\xc1\x33\x33\
+\x33\xb1\xf7\x3e\xd7\x1a\x30\xc6\x54\xd6\xd6\xd6\xe2\x81\x00\x8a\
+\x16\x61\xf5\xcc\x7f\x11\xe0\x37\xca\x49\x61\x45\xc1\x6f\xd2\xbb\
+\x00\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\
+\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x31\x35\x54\x31\
+\x37\x3a\x30\x32\x3a\x33\x35\x2d\x30\x37\x3a\x30\x30\x10\x90\x85\
+\xa6\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
+\x65\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\
+\x30\x39\x3a\x33\x31\x3a\x30\x39\x2d\x30\x37\x3a\x30\x30\xab\xf6\
+\x1c\xe5\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
+\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\
+\x54\x30\x39\x3a\x33\x31\x3a\x30\x39\x2d\x30\x37\x3a\x30\x30\xda\
+\xab\xa4\x59\x00\x00\x00\x67\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\
+\x73\x65\x00\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
+\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\
+\x63\x65\x6e\x73\x65\x73\x2f\x62\x79\x2d\x73\x61\x2f\x33\x2e\x30\
+\x2f\x20\x6f\x72\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\
+\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\
+\x6c\x69\x63\x65\x6e\x73\x65\x73\x2f\x4c\x47\x50\x4c\x2f\x32\x2e\
+\x31\x2f\x5b\x8f\x3c\x63\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\
+\x64\x69\x66\x79\x2d\x64\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x30\
+\x36\x2d\x30\x33\x54\x30\x39\x3a\x35\x38\x3a\x31\x37\x2d\x30\x36\
+\x3a\x30\x30\xd8\xd5\x41\x44\x00\x00\x00\x19\x74\x45\x58\x74\x53\
+\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\
+\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x13\
+\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x00\x4f\x78\x79\x67\x65\
+\x6e\x20\x49\x63\x6f\x6e\x73\xec\x18\xae\xe8\x00\x00\x00\x27\x74\
+\x45\x58\x74\x53\x6f\x75\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\
+\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x6f\x78\x79\x67\x65\x6e\x2d\
+\x69\x63\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\xef\x37\xaa\xcb\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x13\x8e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\x00\x00\x00\x00\x00\xf9\x43\
+\xbb\x7f\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x49\xd2\x00\x00\
+\x49\xd2\x01\xa8\x45\x8a\xf8\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x30\x00\x00\x00\x30\x00\xce\xee\x8c\x57\x00\x00\x11\xa1\
+\x49\x44\x41\x54\x68\xde\xbd\x9a\x69\x8c\x64\x57\x75\xc7\xff\xe7\
+\xde\xfb\xd6\xda\xab\xbb\x7a\x9b\x9e\x99\x1e\x7b\x16\x7b\xcc\xe2\
+\x15\x50\xc8\x82\x88\xc1\x36\x63\x63\x88\x08\x31\x1f\x92\xaf\x91\
+\x10\x5f\x90\x12\xa2\x84\x04\x45\xc0\x87\x44\x91\x12\x12\x24\x50\
+\xa4\x80\x42\x12\x40\x04\x6f\x08\x2f\xe3\x05\x07\x27\x08\x6c\x63\
+\x33\x1e\x8f\x3d\xc3\xcc\x78\xec\x59\xbb\xab\xbb\xab\xbb\xeb\xd5\
+\xf2\xd6\x7b\xef\xc9\x87\xea\x1e\xb7\x27\xb6\x67\x06\x08\xa5\x3a\
+\x3a\x6f\xb9\x75\xfb\xfc\xee\x39\xf7\x9c\xf3\xaa\x9a\xf0\x4b\xbe\
+\x1e\x79\xfc\x41\x30\xf3\x5b\x8e\x21\x22\xdc\x72\xf3\xbe\x5f\xf6\
+\x4f\xbd\xf1\xdc\x97\xfb\x81\x47\x7f\xf0\x10\xac\xb5\x00\x00\xcf\
+\xf3\xd0\xeb\xf7\x84\xa3\x1c\x9f\x88\xaa\x00\xca\x00\xbc\xf5\xa1\
+\x19\x80\x01\x33\xf7\xb4\xd6\x69\xa5\x5c\xb1\x69\x96\x9e\x9f\xe7\
+\xb6\x0f\xde\xf1\xeb\x07\xd8\xff\xd8\x83\x00\x2c\xd2\x34\x13\x52\
+\xc9\xa6\x14\x72\xaf\x94\xf2\x3a\x29\xe5\x5e\x29\xd5\x36\x29\x45\
+\x5d\x90\xf0\x00\xc0\x5a\x9b\x19\x63\xba\xc6\x9a\xd3\xc6\x98\xc3\
+\xd6\xda\x03\xc6\xe8\xc3\xc6\xd8\x55\x29\xa5\x25\x22\xec\xbb\xf5\
+\xce\x5f\x1f\xc0\xfe\xc7\x1e\x00\x91\x10\xc6\x14\x73\x42\xc8\xf7\
+\x7b\xae\xb7\x2f\x08\xc2\x1b\x4a\x61\x69\xdc\x0f\x02\xcf\x75\x5c\
+\x21\xa5\x04\x11\x01\x60\x58\x6b\xa1\xb5\x41\x9e\x67\x36\x49\x93\
+\x2c\x8e\xe3\x4e\x92\xc6\xcf\xe5\x79\xfe\xa0\xd6\xfa\x09\x29\xe5\
+\x49\x6b\xad\xbd\xfd\xb6\x8f\xfc\xff\x02\xec\x7f\xec\x01\x08\x21\
+\x60\x8c\x69\x12\xd1\xad\xbe\xef\xff\x51\xad\x5a\x7f\x77\xbd\xd6\
+\xa8\x07\x41\x00\x06\x23\xcb\x33\xa4\x49\x8c\x34\xcb\xa0\xb5\x06\
+\x00\x28\xa5\xe0\x79\x1e\x7c\xcf\x87\xe3\x38\x60\xcb\x88\x93\x18\
+\x51\x14\x75\x7b\xbd\xe8\xe9\x34\xcb\xfe\x8d\xd9\xee\x07\xb0\x6a\
+\x8c\xc1\x47\xee\xf8\xd8\xaf\x1e\xe0\xe1\x47\xbf\x0f\xe5\xb9\x28\
+\xd2\x6c\xa7\xe3\x38\x9f\xac\x55\xeb\x7f\x30\x31\x31\x39\x13\x86\
+\x21\xd2\x34\xc1\xca\x4a\x07\x4b\xcb\xcb\x58\x5d\xeb\xda\xc1\x30\
+\xd1\x69\x6e\xb4\x31\xb0\x00\xa0\x24\x09\xcf\x95\xaa\x52\x0a\xd4\
+\xd8\x58\x5d\x8c\x8f\xb7\xd0\xa8\xd7\xa1\xa4\x8b\xc1\xa0\x8f\xe5\
+\xce\xf2\x7c\xaf\x1f\x7d\xa7\x28\x8a\xaf\xe4\xba\x78\xd9\x51\x0a\
+\x1f\xbd\xe3\xf7\x7f\x75\x00\x8f\x3c\xfe\x20\x88\x48\x68\xad\xaf\
+\xf3\x7d\xff\xaf\x26\x5a\x53\xb7\x4c\x4c\x4c\xfa\x79\x91\x61\x7e\
+\xfe\x2c\x4e\x9f\x3e\xcb\xf3\x8b\xdd\x78\x2d\xa6\x68\x68\xc2\x28\
+\x43\x69\xa0\xd9\xcb\x2c\xa4\x01\x00\x01\x2d\x15\x32\xcf\xa3\xb8\
+\x5c\x56\x71\xad\x59\xa2\xda\x96\xa9\x46\xb8\x75\xeb\x2c\x4d\x8c\
+\x4f\x80\x01\x2c\x2d\x2d\xa6\x9d\xce\xf2\x23\x69\x96\x7e\x41\x4a\
+\x79\x80\xb5\xb6\x77\xde\xf9\xf1\x5f\x1e\xe0\xfe\xef\xdf\x8d\x30\
+\x0c\x49\x6b\x7d\xa3\xef\x07\x9f\x9f\x9d\x99\xbd\xb9\xd9\x1c\x57\
+\xab\xdd\x0e\x8e\x1d\x3f\x86\x93\xa7\x97\xe2\x76\x4f\x2d\xf6\x31\
+\xbe\x58\xc8\xc6\x00\xd2\x33\x44\x82\x09\x20\x06\x98\x99\x61\x19\
+\x6c\x2d\x83\xd9\x82\x6c\xae\x7c\x44\x95\xba\x58\x99\x9c\xa9\xdb\
+\xc9\x2b\xb6\x4f\x85\x3b\xe6\x76\x20\xf0\x03\x2c\x2f\x2f\xeb\x85\
+\xf6\xfc\xe3\x69\x96\x7e\x4e\x81\x9e\x1d\x66\x29\x7f\xe2\xe3\x7f\
+\x78\xc9\x00\xea\x8d\x2e\x4a\x29\x91\x65\xd9\xce\xc0\x0f\xfe\x7c\
+\x66\x7a\xf6\xe6\xb1\xb1\x96\x9a\x6f\x9f\xc5\x4b\x87\x0f\xdb\x13\
+\x67\xfb\x2b\x1d\x3d\x79\xaa\x70\x26\xbb\xd2\xf1\x4d\x20\x49\x08\
+\x82\x04\x40\xcc\xa3\x8a\x60\x2d\xb3\x65\x66\x6b\x89\x8d\x25\x36\
+\xd6\xd7\x09\x07\xab\x19\x37\x7b\x83\xb5\xe5\x95\x5e\xb2\xb0\x3d\
+\x8e\x93\xb1\x3d\xbb\x77\x8b\x89\xc9\x49\x65\xd9\xde\x7c\x6e\xfe\
+\x5c\x92\xa6\xe9\x9f\x09\x12\xc7\x2f\xc7\x03\xf2\xc2\x0b\xdf\x7b\
+\xe0\x1e\x30\x73\xcd\x71\x9c\x3f\x9d\x9e\x9a\xf9\xc4\xd4\xe4\x94\
+\x3b\xdf\x3e\x8b\xe7\x0f\xbe\x68\x8e\x9d\x4b\x17\x3a\xb8\xf2\x38\
+\x85\x53\x83\xd0\xf7\x84\xef\x90\x54\x8a\xa4\x92\x42\x28\x49\x90\
+\x42\x90\x1c\x69\x48\x41\x24\x05\x11\x11\x48\x10\x09\x22\x00\x90\
+\x36\xa7\x4a\x3c\xd0\x41\x37\xe9\xaf\x38\x36\xef\x95\xea\xb5\x8a\
+\x18\x6b\x8e\x09\xad\xf5\x8e\x38\x1e\x92\xd6\xfa\xa9\x8f\x7d\xec\
+\xf7\xb2\x7b\xee\xbe\xef\x17\xf6\x80\x24\xa2\xdb\xea\xb5\xfa\x5d\
+\x93\x13\x53\xfe\xea\xda\x0a\x5e\x3a\xfc\x73\xfb\x4a\xbb\x58\xe8\
+\xca\x9d\x27\xbc\xa0\x5e\x78\xae\x50\x92\x88\x88\x46\x55\xd6\x5a\
+\x16\x71\x9a\x39\xda\x58\xc1\x0c\x58\x66\xb6\x0c\x26\x90\x75\x1d\
+\x27\x13\x02\x86\x8c\x15\x96\x98\x2d\x13\x6b\x5b\x8d\xdb\x46\xbe\
+\x2c\xe7\xcf\xc1\x73\x4f\xcc\x5c\xb3\xf7\x6a\x31\x3d\x35\xed\x0f\
+\x87\xc3\xbb\x56\x8a\xce\xd3\xd6\xd8\xef\x02\x30\x97\xed\x81\x7b\
+\xee\xff\x0e\x88\x68\xce\xf7\x82\xcf\x6e\xdb\x36\xf7\x4e\x21\x04\
+\x1d\x39\x72\x18\x3f\x3f\xb9\xda\x59\xa1\x2b\x4e\xb8\x61\x33\x0f\
+\x7d\xa9\x1c\x29\x84\xa3\xa4\x50\x52\x08\x47\x09\x91\x17\xda\x3b\
+\xd5\x5e\xd9\x62\x4d\x31\x66\xad\xa9\x1b\xad\xeb\x69\x96\x35\xd6\
+\xfa\x71\xa9\x52\x0a\x86\x9e\xa3\x2c\x88\x40\x00\x88\x40\x44\x20\
+\x03\xb7\x48\xad\x1b\x73\xda\x29\x95\x3c\x94\xc6\xc7\x5b\x50\x52\
+\x96\xa2\x5e\xb7\x5c\xe8\xe2\x47\x77\x7e\xf4\xc3\xdd\xfb\xee\xfd\
+\xde\xe5\x79\x80\x88\x24\x80\x0f\xd4\xeb\xf5\xf7\x94\xcb\x65\x3a\
+\x75\xfa\x55\x9c\x3c\xbb\x94\xac\xd9\xe9\x53\x2a\x6c\xa6\xa1\x2f\
+\x94\x23\xa5\x90\x52\x90\x14\x44\x62\x3d\x36\x92\x2c\x97\xf5\x92\
+\xe3\x7f\xf8\xbd\x3b\xfc\x89\x7a\xc8\x00\xb0\xb8\x16\xe3\xbe\xff\
+\x79\x45\x08\x01\xe9\xba\x92\x48\x93\xd0\x42\x58\x63\x2d\xac\x65\
+\x90\xb1\x22\xb3\xd5\x61\x3b\xcd\x4e\x9d\x3c\xbb\x58\x1e\x1b\x1b\
+\x0b\x1a\x8d\x26\xd5\x6b\x8d\xf7\x24\x49\xfa\x01\x10\x7d\xed\x52\
+\xbc\x20\x36\x0e\xbe\xfe\x8d\xaf\xc1\x18\xdd\x72\x1d\xf7\x96\xb1\
+\xb1\xf1\x7a\x92\xc4\x38\x7b\x6e\x9e\x3b\xb1\xb7\x68\xfd\xc9\x5e\
+\xe8\x2b\xe5\x2a\x25\x5c\x47\xbe\x5e\x5c\x29\x1c\x25\xc9\x73\x15\
+\x26\x1b\x21\xb7\x6a\x0a\xad\xaa\xc2\x64\x23\x84\xef\x2a\x28\x25\
+\xc9\x71\x24\x39\x8e\x12\x8e\x23\x85\xe3\x28\x52\x4a\x8e\x44\x4a\
+\x1a\x70\x73\xad\xdd\x93\x8b\xed\xf6\x22\x83\x80\xf1\xb1\xf1\xba\
+\xeb\x38\xb7\x58\xad\x5b\x5f\xfe\xca\x97\x2e\xea\x81\xf3\x00\x46\
+\x4b\x30\x63\x4f\x18\x96\xae\x0d\xc3\x12\x56\xd7\x56\xb0\xbc\x3a\
+\x48\x86\xd4\x5a\xf6\xfc\x80\x5d\x57\x8d\xc2\x46\x49\x72\x95\xa4\
+\xf3\x00\x4a\x0a\x47\x49\x21\x88\x88\x19\x64\x8d\x85\xb1\x16\x0c\
+\x06\x09\x82\x92\x92\x1c\xa5\x84\xe3\x48\x72\x94\x24\x25\xc5\x48\
+\x2b\x49\x8e\x12\x44\xca\xb3\x6b\xba\xb1\xb4\xb8\xda\x4b\xe2\xe1\
+\x00\xd5\x6a\x0d\x61\x18\x5e\xcb\xe0\x3d\xf6\x12\x3a\x9d\xf3\x00\
+\xca\xd1\x52\x08\x71\x6d\xb9\x5c\x9e\x01\x18\xab\xab\xab\x88\x52\
+\xd9\x63\xaf\x19\x7b\xae\x92\x8e\x14\xa4\x94\x80\xe3\x48\x72\x5c\
+\x49\xae\xa3\xe0\x39\x8a\x5c\x47\x91\xa3\x46\xb9\x94\x08\xa3\x94\
+\x23\x46\x81\x2e\x88\xc8\x75\x24\xb9\x8e\x84\xeb\x48\x38\x8e\x84\
+\xeb\x2a\x38\xce\x08\x40\x2a\x49\x4a\x09\x64\x54\x1d\xac\x0e\x10\
+\x45\xbd\x1e\x5c\xd7\x45\xb9\x5c\x99\x11\x42\x5e\x2b\x60\xe5\xc5\
+\x00\xce\xef\x01\x22\x78\x4a\xaa\xbd\x41\x10\x7a\x45\x91\x23\xea\
+\x0d\x4c\xc6\xa5\x9e\x72\x03\xe3\x28\x21\xa5\x14\x00\x91\xe8\xc7\
+\x99\x47\x60\x29\xa5\x20\x31\x4a\x91\x88\x86\xa9\x6b\x2c\x0b\x5a\
+\xdf\xa1\xeb\x7b\x15\x96\x99\x06\x49\x1a\x58\x06\x69\x63\x59\x1b\
+\xcb\xc6\x32\x03\x64\x5c\xd7\xc9\x14\xa4\x01\x88\x0c\x3c\x3d\x34\
+\x41\xaf\xd7\x1f\x4c\xcc\x02\xb2\x14\x96\x3d\x25\xd5\x5e\x22\xf2\
+\x00\xc4\x97\x08\x40\x25\x29\xd5\x36\xd7\x75\x29\xcb\x52\xc4\x69\
+\xae\x8d\x1c\x8b\x1d\xc7\x81\x14\x82\x84\x94\x94\x66\x99\x73\xec\
+\xe4\xc2\x74\xe0\x49\xd7\x53\x12\xa0\xd1\x5b\x1b\x4b\xcd\xaa\xe7\
+\x38\x6a\xa3\x1b\x05\x1c\x47\xa0\x56\x72\x9d\x4e\x34\x98\x4a\xe2\
+\x21\x5b\x1e\x55\xe8\xbc\x30\x18\x66\x36\xdd\x36\x33\x79\xc6\x73\
+\xdd\xb4\x30\xcc\x49\x41\x45\xdf\xba\xfd\x41\x9c\x69\x63\x8d\x0c\
+\x7c\x9f\xa4\x94\xdb\x88\x44\xe9\x92\x01\x00\x84\x42\x88\xa6\x94\
+\x12\x71\x92\xa0\xd0\xac\x59\x86\xb9\x14\x92\x84\x14\xa4\xa4\x20\
+\x66\x88\xb2\xaf\xdc\x0f\xbf\x77\x87\x3f\xd9\x08\xd8\x32\x68\x23\
+\x4a\x5d\x47\xa2\x56\x72\xc1\xa6\x00\x03\xdc\x28\x7b\xb8\xeb\xfd\
+\xbb\x44\x56\x18\x0f\x00\x98\x47\x35\x63\x3d\x3b\x21\xc9\x0d\xaf\
+\xc6\x79\x72\xfc\xdc\x60\x38\xbf\x92\xa6\xbb\x9a\x29\xf6\x4e\x98\
+\xdd\xd6\x5a\xcf\x71\x5d\x48\x21\x9a\x00\xc2\x4b\x0e\x21\x66\x76\
+\x01\x04\x04\x82\x31\x06\x96\x89\x85\x74\x2c\x09\x42\x5a\x58\x9d\
+\x6a\x70\x56\xb0\x72\x94\xc4\x64\x23\xe0\xc9\xba\x07\x63\x2d\x00\
+\x3a\xbf\xd5\xd8\x6a\xf0\xf9\x13\x83\x5a\x28\xb1\x51\x6a\x2c\x03\
+\x52\x08\x6b\x2c\x23\x37\xc8\x5f\x78\xa5\xbf\xd2\x8e\x78\xb5\x3b\
+\xc8\x75\x96\x5b\xae\x2a\x9b\xe4\x1a\x05\x33\x43\x08\x01\x10\x05\
+\xeb\x36\x5d\x1a\x80\xb5\x4c\x96\xed\xf9\xe7\x5b\x21\x04\x48\x08\
+\x74\xfa\x3a\x39\xbe\x10\x0f\x92\x82\x8d\x2b\x74\x75\x4b\x59\x6f\
+\x29\x0c\x94\x05\x11\x83\x48\x8c\x62\x86\x00\x7e\x0d\x86\x41\x20\
+\x62\x02\xd8\xf2\x48\x8c\x61\xab\x2d\xdb\xa4\xb0\xdc\x8d\x75\xfe\
+\xea\x92\x8e\x0b\x76\x0a\x21\x25\x49\x45\x90\x52\x40\x08\x26\x21\
+\x68\x63\x41\xc1\xd6\x5e\x34\x0d\x6d\x02\x30\x99\xd1\x26\xb1\xd6\
+\x42\x4a\x09\x47\x09\x51\x24\x1a\x87\x4e\x0f\xa3\xb3\x2b\x59\xaa\
+\x1c\x05\xc9\x85\x13\xd8\xbc\x38\xb9\x38\xd0\x99\x66\x80\x79\xd4\
+\xec\x10\xc8\x73\x24\xea\x15\x0f\xb0\x06\x0c\x30\x43\xf0\x6a\x3f\
+\xe3\x34\x37\xb0\xcc\xcc\x16\x4c\x02\x68\xaf\xc4\x94\xe5\x06\x52\
+\xba\x60\x28\x58\x6b\x20\x2c\x10\x7a\x42\xf9\x1e\x49\x29\x24\x8c\
+\x49\xa1\xb5\x4e\x8c\x31\xd9\x25\x03\x68\x6d\xe2\xa2\x28\x56\x8b\
+\x22\x87\xa3\x1c\xf8\xae\x54\x71\x12\xf3\x7c\x57\xa4\x16\x82\x47\
+\xf9\x51\x9a\xc5\x9e\x1e\x7c\xf3\x89\x57\x8c\xe7\xca\xd1\x7a\x13\
+\x60\x8c\x15\x5b\xc6\xfc\xe0\xe3\xef\xdb\x25\x9a\x15\x07\x00\xb0\
+\xd2\xcf\xf8\x3b\x4f\x1c\xb7\x67\x3a\x49\x4c\x42\x58\xac\x7b\x36\
+\x2b\x34\x2d\xf6\x74\x2c\x9d\x92\xb5\x56\x12\xc0\x90\x12\x18\x2b\
+\x23\xa8\x84\xae\xa3\x94\x83\x3c\xcb\x50\x14\xc5\xaa\x36\x26\xbe\
+\x74\x80\x22\x1f\xe6\x79\x76\x26\x49\x12\x34\x9a\x75\x84\x81\xab\
+\x58\x0f\xdd\xb4\x08\xad\x90\x12\x16\x04\x2b\xbd\x34\x91\xe3\x47\
+\x5e\x1d\xb0\x20\x21\x36\x62\x15\xb6\xc8\x42\xcb\xe9\xd5\x85\xb6\
+\xa1\x20\xc1\x0c\x20\xd7\x96\x4e\x77\x92\xf4\xc5\x8e\xfb\x12\x4b\
+\x3f\x66\x6b\x89\xed\x46\x88\x96\x2d\x94\x4a\x85\xb1\x60\x48\xb8\
+\x04\xb1\xa5\xc6\xb5\x46\xb5\xe4\x0a\x29\x31\x8c\x87\xc8\xf2\xec\
+\x4c\x51\x14\xc3\x4b\x06\x30\xc6\x64\x59\x96\xbd\xd8\xef\xf7\xd2\
+\xb1\xf1\x71\xbf\x5a\x29\x8b\xa6\xdf\xa9\x07\xaa\x70\x86\xd6\xc9\
+\x14\x84\xb0\x90\xda\x28\xbf\xaf\x94\x80\x90\x12\x42\x08\x22\x21\
+\x18\xd9\xd0\x08\x91\x5b\x10\x01\x42\xac\x37\x6d\x04\x29\xa5\x95\
+\x7e\x65\x00\xa7\x34\xb0\xd6\xc2\x1a\x0b\x6b\x0d\xac\x31\x20\x63\
+\x48\xc0\xc0\x5a\x70\x23\xd4\xfe\x8e\x16\xb5\x9a\xf5\x9a\xb2\xd6\
+\x22\x8a\xa2\x34\xcb\xb2\x17\x8d\x2e\x2e\x1a\x42\xe7\x2b\xb1\x94\
+\xd2\xe4\x45\x71\xb0\x1b\x45\xf3\x5a\x6b\x54\xab\x55\x6c\x1b\x93\
+\xad\xb9\x5a\xd6\xb0\x2c\xd8\x30\x59\xcb\xc4\x16\x04\xc3\x02\x96\
+\x69\xe4\x15\x08\x8c\x42\x8c\xf8\x7c\xab\xb9\xb1\xaf\x09\x10\xa3\
+\x1a\x02\x21\x05\x8d\x9a\x40\x41\x42\x08\x12\x42\x8e\x12\x85\x14\
+\xd8\x39\x5e\x34\x76\x4e\x05\xad\x6a\xb5\x8a\x78\x18\x63\xad\xbb\
+\x36\x9f\xe7\xf9\x41\x52\xce\xa5\x37\x73\x9f\xfa\xe4\xa7\x61\xad\
+\x3d\x1a\x45\xd1\xf3\x51\x37\x42\xb9\x5c\xc1\xf4\x78\xa9\x7c\xdd\
+\x74\x32\x17\x38\x56\x69\x26\x36\x20\x36\x4c\xd6\x80\xac\x81\x60\
+\x03\x69\x2d\x49\xcb\x34\x0a\x25\x31\x5a\xf5\x91\x6c\xb4\x13\x4a\
+\x42\x2a\x05\x29\xd5\xc8\x6b\xeb\x42\x52\x00\x42\xa0\xec\xb1\xf3\
+\xae\xad\xc5\xdc\xb6\xa9\x46\xd9\xf3\x02\x2c\x77\x96\xd1\xed\x76\
+\x9f\x37\xc6\x1c\xfd\xec\x67\xfe\xf2\x62\xf6\xbf\x06\x00\x00\x82\
+\xe4\x72\x92\xc4\xfb\x17\x16\xe6\xd7\x04\x49\xb4\xc6\xc7\xc4\xdb\
+\xb7\x60\xee\xda\xc9\xfe\x34\xd1\x68\xa5\x2d\x88\x47\x5a\xd8\x75\
+\xcd\x4c\x82\xf3\xc2\x50\x7b\x2d\xa6\x73\x9d\x21\xcd\x77\x86\xd4\
+\x5e\x8b\xa9\xd0\x96\xc4\xeb\x0c\x1f\xa5\x66\x21\x04\x04\x8d\xf4\
+\x4d\x5b\x92\xe9\x1b\x76\xf8\x73\x53\xad\x09\x91\xa5\x29\xce\x9c\
+\x39\xbd\x36\x8c\x87\xfb\x95\x10\xcb\x17\xb5\x1e\x17\x3c\x0f\x18\
+\xd6\x06\x16\x3f\x58\xee\x2c\x3f\xd3\x59\xee\x7c\xb0\xd5\x1a\xa7\
+\x6d\x53\xc3\xf2\x6f\x0f\xa3\xb7\xad\xe4\xa5\xfe\xc9\x61\x6d\x8d\
+\xe8\x7c\xd7\x06\x08\xc1\x10\x12\x52\xb9\x66\x79\x88\xc1\xb7\x9f\
+\x3c\x65\x3d\x47\xf1\x46\xb6\x59\x1e\x22\x56\x65\xd7\xb2\x94\x04\
+\x66\x30\x0b\x08\xc1\xa3\x1c\x4f\x96\x77\x35\xb3\xc6\xcd\xbb\x8a\
+\xb7\xed\xde\x36\x5b\xf6\xfd\x00\xc7\x8e\x1f\xe3\xf6\x62\xfb\x19\
+\xa3\xcd\x0f\xac\xe5\xcb\x7f\x22\x7b\xe8\x81\x87\xb1\x6f\xdf\xad\
+\xbd\x3c\xcf\x0b\x6d\xcc\x6f\xb5\xc6\x5b\xe5\x72\xa5\x4c\x2e\x92\
+\x72\x48\x43\xb7\x1d\x07\x2b\x7d\xe3\x67\x52\x4a\x12\x62\xb4\x91\
+\xa5\x14\x90\x8e\x6b\xac\x57\xe9\x46\xa8\xb6\x57\xb9\xba\xb0\x66\
+\xab\x0b\x11\xaa\x0b\x36\x68\x2e\x91\x1b\x26\x58\xff\xa6\x02\x0c\
+\x58\x30\x8c\x05\xcf\x96\x93\xca\x9d\x7b\xba\xd7\xfd\xc6\x9e\xb1\
+\xed\x5b\xa6\x67\xc4\xea\xea\x2a\x0e\x1e\x3a\xb8\xd4\xe9\x2c\xff\
+\x0d\x11\xff\xf8\x33\x7f\xf2\x17\x7c\xd9\x00\x00\xb0\xef\xf6\xdb\
+\xb8\x28\xf2\x33\x79\x9e\x8d\x33\xf3\xb5\x13\x13\x93\x2a\x0c\x03\
+\x51\x91\x49\xbd\xae\x06\xfe\x6a\xe6\x76\x7b\x3a\xc8\x48\x48\x28\
+\xb9\x9e\x8d\x94\xc3\xd2\x2b\x65\x2a\x2c\x67\x4e\x50\xc9\x54\x50\
+\xca\xa4\x1b\x66\x50\x7e\x0e\xac\x57\x55\x00\xd6\x32\x60\x19\x3b\
+\xaa\x83\xfa\x47\x76\xaf\x5d\xff\x9b\xbb\x6b\x57\xee\xd8\xb6\x55\
+\x25\x49\x82\x17\x0e\x1d\x8c\xcf\x9c\x3e\xfd\x75\x63\xcd\xbf\x1c\
+\x3b\x76\x3c\x9d\xdb\x31\x87\x23\x87\x7f\x7e\xf9\x00\x0f\x3d\xb8\
+\x1f\xb7\xdf\xb1\x2f\x2b\x8a\xe2\xd5\x38\x8e\xe7\x88\xc4\xce\xc9\
+\x89\x49\x19\x86\xbe\xa8\x3a\x69\x63\xc2\xeb\xd7\x08\x9c\x77\x0b\
+\x3f\x2e\xe0\x18\x21\x36\xbc\x31\xea\x58\xc5\xe8\xab\x08\x62\x66\
+\x62\x6b\xc9\x5a\xc6\xba\x70\x28\x0b\xf7\xc6\xd6\xea\xec\xbe\x2b\
+\xa3\xeb\xdf\xbd\xb3\x31\xb7\x6d\x76\x56\xe5\x79\x81\x9f\x1d\xf8\
+\x19\x9e\x7d\xee\xd9\x57\x8f\x1c\x3d\xfa\xed\x43\x87\x0e\xb5\x87\
+\xc3\xd8\x68\xad\xf5\xdb\xde\x7e\x0d\xae\xbf\xe1\x3a\x1c\x7a\xe1\
+\xc5\x4b\x07\x00\x80\x87\x1f\xda\x8f\x7d\xfb\x6e\x5f\x4d\xb3\xe4\
+\x44\x7f\xd0\xbf\x82\x80\x1d\xad\x56\x8b\xaa\x95\x8a\xa8\x07\xa6\
+\x3a\x13\xf4\x27\x27\xbd\x41\x09\x80\x4e\xd9\xc9\x35\x94\xb5\x24\
+\x19\x20\x30\x13\x2c\x8f\x56\xdb\x1a\x0b\x62\x23\x4a\x22\x75\x77\
+\x57\xd6\x26\x7e\x77\xcb\xd2\x35\xef\xdb\x51\xbc\xfd\x1d\x57\x4c\
+\xb4\xa6\xa7\xa6\x44\x96\x66\x38\xf0\xfc\x01\x3c\xfb\xdc\xb3\x68\
+\xb7\xdb\x7e\x92\xa6\xd7\xfa\x41\xf0\x7e\x47\xa9\x9b\x84\x10\xb0\
+\xd6\x9e\xb4\xd6\x9a\xb7\xf2\xc4\x9b\x36\x4b\xff\xf8\xe5\x7f\x40\
+\x9a\xe6\x24\x04\x5f\x1b\x86\xe1\xe7\xb6\x6f\xdf\x7e\xeb\xee\x5d\
+\xbb\xfd\xb0\x54\x42\x9c\x0c\xd0\x8d\x7a\xb6\x13\x65\xc3\x85\x81\
+\x5a\x3a\x17\x87\x4b\x4b\x59\x18\x0d\x8c\x9f\x14\x2c\x0d\x40\x70\
+\xa8\x90\x15\x99\x05\x13\x7e\x5c\xdb\x52\x4a\x27\x66\x6b\x3c\x31\
+\xd3\x2c\x97\x5a\x63\xe3\xc2\xf3\x7c\xac\xac\xac\xe0\xf0\x91\x97\
+\xe2\x9f\x3e\xfb\xec\xe9\x53\x67\xce\x6c\xbf\xfa\xaa\x3d\x41\xa5\
+\x52\x81\xe3\x28\xc4\x49\x62\x8f\x1f\x3d\xf6\xf2\xc2\x42\xfb\xf3\
+\xcc\x7c\x37\x11\x65\xf7\xde\x7d\xff\xe5\x01\x00\xc0\xdf\x7f\xe9\
+\xef\x40\x05\xa1\x10\xc5\x1e\xd7\x71\xff\xb8\xd5\x6a\xdd\x75\xe5\
+\x15\x3b\xa7\xa7\xa7\xa7\xa0\x1c\x85\x34\x4b\x91\xc4\x31\xe2\x34\
+\x37\x71\x66\xf2\x54\x73\xae\x2d\x34\x00\x38\x82\x54\xe0\x0a\xb7\
+\x12\x38\x6e\xb9\x14\xca\x72\xa9\x0c\xcf\xf3\x91\x26\x29\x4e\x9f\
+\x39\x8d\xe3\xc7\x8f\x2d\x2c\x2d\x2f\x7d\xeb\xe9\x67\x9e\x7b\x3a\
+\xea\xf5\xbf\xf8\xee\x9b\xae\xdf\x3d\x36\x36\x86\x66\xb3\x89\xe6\
+\x58\x03\x2b\x2b\x2b\x78\xfa\xe9\x67\x8e\xb6\x17\xda\x5f\xb0\xd6\
+\xde\xc3\xcc\x69\x18\x2a\x7c\xeb\x3f\xee\xbd\x78\x08\x6d\xbc\x1e\
+\xd9\xff\x18\xf6\xdd\x7e\x1b\xb2\xa2\x58\x31\x5a\xff\xb4\xd7\xef\
+\x9f\xe8\x74\x3a\xd5\x28\xea\x8e\x83\xe1\x97\xc2\x32\xaa\x95\x2a\
+\x6a\xd5\xaa\x68\xd6\x2a\x4e\xab\x5e\xf2\xa7\x9a\xe5\x70\xba\x59\
+\x09\xa7\xc6\x6a\x7e\x6b\xac\xe1\xd4\xaa\x35\xe1\x79\x3e\xd2\x34\
+\xc5\xe9\x53\xa7\xf0\xe2\x4b\x87\xa2\x63\xc7\x8f\xfe\x68\x69\x79\
+\xe9\x6f\x8b\xa2\xf8\xd7\x87\x1f\xfd\xaf\xb3\x81\xef\xdf\xdc\x68\
+\xd4\xae\x10\x42\xa0\xd7\xeb\x63\x38\x18\x62\x72\x72\x02\xad\xd6\
+\xf8\x78\xd4\x8d\xae\x19\x0c\x06\xcb\x5a\xeb\xa3\xcc\xe2\xff\x84\
+\xd3\x45\x1f\x9a\x1f\xde\xff\x08\x1e\x7f\xf4\x71\xac\xac\x2e\x25\
+\xcf\x1f\x78\xfe\xb0\x90\xe2\xc9\x28\x8a\x4e\x2c\x2e\x2e\x9a\xa5\
+\xc5\x45\xbf\xdb\x8d\xdc\x24\x49\x5d\x5d\x14\x30\xc6\xc2\x18\x0b\
+\x5d\x18\x24\x49\x8a\x6e\x14\x61\xa1\xbd\x80\x97\x5f\x3e\x1e\x1f\
+\x3e\x72\xf8\xdc\xb1\xe3\xc7\x9e\x9c\x9f\x9f\xff\x6a\x7b\xa1\xfd\
+\x4f\xdf\xfe\xd6\x7f\x3e\x75\xcf\xdd\xf7\x25\x5e\x10\x22\x2c\x85\
+\x37\x96\xcb\xe5\x1b\x4a\x81\x4f\x4b\x4b\x8b\xe8\xf7\x07\x28\x0a\
+\x83\x99\x99\x19\x4c\x4c\xb4\xc6\xa3\x28\x7a\x47\x1c\xc7\xcb\xcc\
+\x7c\x6c\xef\x35\x57\xbf\x0e\xe2\x52\x7f\xa1\x79\xdd\xb8\x5b\x6e\
+\xf9\x80\xbc\xf1\xa6\x1b\x5a\x8e\xeb\x5c\xe3\x38\xce\x3b\x5d\xd7\
+\xbd\xca\xf3\xbc\x59\xc7\x71\xeb\x4a\x4a\x1f\x00\xb4\xd1\x59\x9e\
+\xe5\x51\x9a\xa5\xe7\xe2\x38\x3e\x36\x1c\x0e\x0f\x9d\x3d\x7b\xee\
+\xc8\xe3\x8f\x3d\xb1\xd2\x59\xee\x98\x8d\x39\x5d\xcf\xe3\x9d\x57\
+\x5d\xfd\xa1\x89\x89\x89\x2f\x5e\xb5\xe7\xca\x5d\xa1\xef\xa2\xd7\
+\xeb\xa1\x54\xaa\x60\xeb\xd6\x59\xec\xdc\x75\x25\xfa\xfd\x3e\x9e\
+\xfa\xc9\x53\x47\xdb\xed\xc5\x2f\x5a\x6b\xef\x66\xe6\xb4\x52\xa9\
+\xe0\xdf\xbf\xf1\xcd\x4b\x02\xa0\x4d\x7a\xb3\x30\x00\xcc\xed\x98\
+\x73\x6f\x7a\xd7\x0d\xa5\x52\x18\x56\xa5\x52\x25\x29\x85\x67\x2d\
+\x53\x96\x65\x45\x3c\x1c\x26\x8b\x4b\xcb\xc3\x43\x2f\xbc\x98\x44\
+\xdd\xc8\x60\xd4\xba\x88\x0b\x17\xa4\x5c\xad\xfa\xb3\xdb\x77\xdc\
+\x39\x35\x35\xf1\xe9\xbd\x57\xed\xda\xe1\x7b\x2e\xa2\x28\x42\xb9\
+\x5c\xc6\xd6\xad\x5b\xb1\x7b\xcf\x2e\x44\x51\x84\xa7\x7e\xf2\xd4\
+\xd1\xf9\xf9\x85\x2f\x68\xad\xbf\xeb\x38\x4e\x7e\xef\xdd\xf7\x5f\
+\x14\xe0\xcd\x8c\x17\x17\x68\xbc\xc5\xfd\xcd\xf2\x66\x63\xe0\x05\
+\x41\xb0\x75\xfb\xdc\x87\x66\x67\xb7\x7c\x6a\xef\xd5\xbb\xb7\x07\
+\xbe\x8b\x6e\x37\x42\xa9\x34\x82\xd8\x73\xd5\x79\x88\x97\xe7\xe7\
+\xdb\x7f\x4d\x84\x7b\x00\xa4\x17\xdb\x03\x9b\x8d\x13\x6f\xa1\xc5\
+\xfa\x7e\x92\x18\xf5\x57\x9b\xb5\xdc\x74\x7f\xf3\xb8\x8d\x31\x0e\
+\x00\xd7\x68\x2d\x07\xfd\xfe\x3c\x84\xec\xe5\x85\xbe\xa2\x51\x6f\
+\xd4\x2b\xe5\x12\xfa\xfd\x1e\x92\x24\x85\xd6\x1a\x33\x33\x33\x68\
+\x4d\xb4\x9a\x6b\xdd\xee\x35\xf1\x70\x78\x0a\xc0\xcb\x97\x03\xf0\
+\x46\xc6\x13\x2e\x0e\xb7\x19\xf2\xcd\x3c\xa4\x00\x38\xc6\x18\x1a\
+\xf6\x7b\x67\x58\xc8\x6e\x9e\x17\x57\x36\x9b\xcd\x5a\xa5\x52\x42\
+\xaf\xf7\x1a\xc4\xb6\xed\xdb\xe0\xb8\x6a\x7c\x61\x7e\x7e\x90\x24\
+\xe9\x0f\x2f\x17\x00\x17\x9c\xbf\xd1\x7d\x7a\x93\xcf\x6f\x68\x5e\
+\x97\x37\x9a\x4b\x18\x63\xcc\xa0\xdf\x3b\x09\x21\x97\xf3\xa2\xd8\
+\xd5\x68\xd6\xeb\x95\x72\x19\xbd\x5e\x0f\x00\xd0\x6c\x36\xb0\xb6\
+\xd6\xd5\x67\x4e\x9f\xf9\x61\x14\x45\x97\x05\xf0\x46\xd7\x37\x1f\
+\xf3\x05\x1a\xc0\xe8\x17\xcb\x4d\x46\xdb\x4d\x7a\x43\xcc\xa6\xeb\
+\x0c\x00\xd6\x18\x3d\x1c\x0c\x5e\x25\x29\xd7\xf2\x5c\xef\x6c\x34\
+\xea\xf5\x66\xb3\x81\x5a\xbd\x86\xa8\xd7\xc3\x0b\x07\x0f\x1d\x6a\
+\x2f\x2e\xfe\xf3\x93\x4f\x3c\xf9\xea\x45\xeb\xc0\x05\xc6\xf2\x05\
+\x06\x6d\x96\x0b\x0d\xdd\x30\x6c\xe3\xd8\x00\xd0\x17\x48\xb1\xe9\
+\xd8\x6c\x12\x36\x46\x9b\x41\x7f\x70\x0a\x42\xf4\xb3\xbc\xd8\xe9\
+\x7b\x5e\xb5\xd7\xef\xdb\x23\x47\x8e\x9e\x38\x79\xf2\xe4\x57\x0f\
+\x1e\x38\xf8\xe3\x2c\xcb\x7f\xb1\x3a\x80\x37\x0f\x9d\xb7\x0a\xa3\
+\xb7\x9a\x7b\x63\x73\x3b\x9b\x44\x01\x70\x5c\xdf\x2f\xcd\x6e\xdb\
+\xfe\x3b\xd5\x5a\xed\x77\x08\xbc\xd6\xeb\x76\xff\xfb\xcc\xa9\x53\
+\x07\xf2\x3c\xef\x03\x48\x2f\xf7\x9f\x3d\x36\x62\xf8\x52\x42\xea\
+\x72\xe7\xdd\x9c\xcd\x14\x5e\xcb\x50\x8e\x94\xd2\xf3\x83\xa0\xac\
+\x8b\xc2\x66\x59\xb6\xe1\xb5\xec\x17\x01\x78\x2b\x03\x7e\x15\x73\
+\x6c\xce\x52\x1b\x69\x77\x03\x66\xe3\x7c\x63\x11\x0b\x00\xc5\xff\
+\x02\x12\xd2\x41\x9a\x06\x51\x80\xd4\x00\x00\x00\x25\x74\x45\x58\
+\x74\x63\x72\x65\x61\x74\x65\x2d\x64\x61\x74\x65\x00\x32\x30\x30\
+\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\x3a\x32\x31\
+\x2d\x30\x37\x3a\x30\x30\x82\x80\x0a\xca\x00\x00\x00\x25\x74\x45\
+\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\
+\x31\x30\x2d\x30\x32\x2d\x32\x30\x54\x32\x33\x3a\x32\x36\x3a\x31\
+\x38\x2d\x30\x37\x3a\x30\x30\x67\xec\x3d\x41\x00\x00\x00\x25\x74\
+\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\
+\x30\x31\x30\x2d\x30\x31\x2d\x31\x31\x54\x30\x39\x3a\x31\x31\x3a\
+\x34\x30\x2d\x30\x37\x3a\x30\x30\x93\x15\x56\xb1\x00\x00\x00\x34\
+\x74\x45\x58\x74\x4c\x69\x63\x65\x6e\x73\x65\x00\x68\x74\x74\x70\
+\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\
+\x6e\x73\x2e\x6f\x72\x67\x2f\x6c\x69\x63\x65\x6e\x73\x65\x73\x2f\
+\x47\x50\x4c\x2f\x32\x2e\x30\x2f\x6c\x6a\x06\xa8\x00\x00\x00\x25\
+\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\x64\x61\x74\x65\x00\
+\x32\x30\x30\x39\x2d\x31\x32\x2d\x30\x38\x54\x31\x32\x3a\x35\x31\
+\x3a\x32\x31\x2d\x30\x37\x3a\x30\x30\xdd\x31\x7c\xfe\x00\x00\x00\
+\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\
+\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\
+\x3c\x1a\x00\x00\x00\x17\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\
+\x00\x47\x4e\x4f\x4d\x45\x20\x49\x63\x6f\x6e\x20\x54\x68\x65\x6d\
+\x65\xc1\xf9\x26\x69\x00\x00\x00\x20\x74\x45\x58\x74\x53\x6f\x75\
+\x72\x63\x65\x5f\x55\x52\x4c\x00\x68\x74\x74\x70\x3a\x2f\x2f\x61\
+\x72\x74\x2e\x67\x6e\x6f\x6d\x65\x2e\x6f\x72\x67\x2f\x32\xe4\x91\
+\x79\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x8c\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x10\x06\x00\x00\x00\x23\xea\xa6\xb7\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\x62\x4b\x47\
-\x44\xff\xff\xff\xff\xff\xff\x09\x58\xf7\xdc\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x00\x00\x48\x00\x00\x00\x48\x00\x46\xc9\x6b\x3e\
-\x00\x00\x09\xdb\x49\x44\x41\x54\x68\xde\xe5\x59\x5b\x6c\x1b\x55\
-\x1a\xfe\xe6\x16\x7b\xc6\x63\x3b\x1e\x27\x8e\x93\x26\x69\xeb\xe6\
-\x02\x34\x8d\x4b\xa3\xb6\x5b\x4a\x59\x78\x28\x6d\xa4\x56\x48\x6d\
-\xc4\x52\x8a\x40\xa2\x0f\x20\x21\x21\x95\x07\x76\x91\x76\x91\x10\
-\x02\x96\x65\x21\x4f\xec\xf2\x82\x8a\x2a\xe0\xa1\xb4\xa5\x69\xcb\
-\x6d\xdb\x82\xe8\x06\x52\xea\x26\xa5\xc1\x69\x5a\xd7\x31\x24\x34\
-\x76\x62\x3b\x8e\xed\x24\xf6\xd8\x73\xdb\x87\x89\xe3\x5c\xdb\x24\
-\x4a\xca\x4a\x1c\x69\x74\x34\x33\xe7\x9c\x39\xdf\x77\xbe\xff\x72\
-\xce\x10\xda\x78\xc1\xef\xb4\xd0\x8b\xed\x18\x8f\xc7\xe3\xf1\x38\
-\xe0\xf7\xfb\xfd\x7e\x3f\x10\x89\x44\x22\x91\x08\x30\x3a\x3a\x3a\
-\x3a\x3a\x0a\x48\x59\x29\x2b\x65\x81\x1c\xbd\x14\x4d\xd1\x14\x0d\
-\xf0\x3c\xcf\xf3\x3c\xe0\x74\x3a\x9d\x4e\x27\x50\x5b\x5b\x5b\x5b\
-\x5b\x0b\x98\xcd\x66\xb3\xd9\x7c\xe7\x09\x20\xe6\xab\x80\x4c\x26\
-\x93\xc9\x64\x00\xaf\xd7\xeb\xf5\x7a\x81\x60\x30\x18\x0c\x06\x01\
-\x49\x92\x24\x49\x02\x0a\x0a\x0c\x05\x2c\x0b\xb0\x2c\x6f\x36\x99\
-\x00\x8e\x65\x59\x8e\x03\x48\x0a\xd0\x34\x40\x14\xd3\xe9\x54\x0a\
-\x48\xc4\x13\xf1\x44\x1c\x48\x8e\x24\x47\x92\x23\x00\x49\x90\x04\
-\x49\x00\x55\xd5\x55\xd5\x55\xd5\x40\x43\x43\x43\x43\x43\x03\x40\
-\x51\x14\x45\x51\xff\x07\x04\x0c\x0f\x0f\x0f\x0f\x0f\x03\x9e\x8b\
-\x9e\x8b\x9e\x8b\x80\x98\x11\x33\x62\x06\x30\x1a\xad\x16\x9b\x0d\
-\x28\x2d\x5d\xb5\x6a\xcd\x1a\x80\xe7\x59\x8e\xe3\x00\xa3\x91\xa6\
-\x49\x12\x30\x18\xf4\xda\x68\x64\x68\x8a\x04\xe8\x71\x05\x90\x24\
-\x49\x92\x24\x20\xa6\xc5\xb4\x98\x06\xda\x3b\xda\x3b\xda\x3b\x80\
-\x9f\x03\x3f\x07\x7e\x0e\x00\xbc\x99\x37\xf3\x66\x60\xe7\xce\x9d\
-\x3b\x77\xee\xcc\x2b\xe6\x8e\x13\x10\x8b\xc5\x62\xb1\x18\xd0\xd6\
-\xd6\xd6\xd6\xd6\x06\xa8\x2a\x40\x10\x40\x51\xd1\xca\x95\xb5\xb5\
-\x40\x61\xa1\xcd\x56\x68\x05\x8c\x46\x86\xa1\xe8\xf9\x03\xcf\xad\
-\xac\xa2\xe8\x5f\x95\xb2\x8a\xa2\xaa\x40\x7f\x7f\x28\x38\x30\x00\
-\xb4\x5d\xf8\xf6\xfc\x37\xdf\x00\x8a\xac\xc8\x8a\x0c\xec\xd9\xbb\
-\x67\xef\x9e\xbd\x80\xc5\x62\xb1\x58\x2c\x4b\x4f\x00\x39\xfd\x81\
-\x28\x8a\xa2\x28\x02\x1e\x8f\xc7\xe3\xf1\x00\x24\xa9\x4f\xd8\xe9\
-\xac\xad\x75\xbb\x97\x1e\xb8\x24\x2b\x8a\xa6\x01\x82\xdd\x5e\x54\
-\x54\x04\x6c\xdb\xb6\x7d\x7b\x63\x23\xa0\xaa\x7a\xbb\x96\x96\x96\
-\x96\x96\x16\x40\x51\x14\x45\x51\xee\x00\x01\x9d\x9d\x9d\x9d\x9d\
-\x9d\x80\x2c\xcb\xb2\xa2\x00\x76\xfb\xaa\x55\x35\x35\x00\xcf\xb3\
-\xac\xd1\xb0\xf4\xc0\x65\x59\x07\x26\x49\x8a\xa2\xa9\x00\x4d\x1b\
-\x0c\x2c\x0b\x6c\x68\xb8\x6f\xeb\x1f\x1f\xcc\x9b\x60\x6b\x6b\x6b\
-\x6b\x6b\xeb\x32\x12\x90\x48\x24\x12\x89\x04\x10\x0a\x85\x42\xa1\
-\x10\x60\x34\x5a\x2c\x85\x56\xdd\x3b\x5b\x2d\xcb\x0f\x5c\x92\x14\
-\x45\xd5\x00\x59\x56\x15\x55\x05\x4c\x26\x9b\xcd\x6e\x07\xca\xcb\
-\x57\xaf\x76\xb9\x80\x1f\x2f\xff\x78\xf9\xc7\xcb\x40\x36\x9b\xcd\
-\x66\xb3\xcb\x40\x40\x20\x10\x08\x04\x02\x80\xaa\xaa\xaa\xaa\x02\
-\x0e\x47\x65\xe5\x9a\xaa\x3b\x0f\x5c\x92\x14\x75\xbc\x56\x34\x0d\
-\x28\x2b\xab\xa9\x59\xb7\x0e\x48\xa5\x53\xe9\x54\x3a\xaf\xd0\x25\
-\x27\x60\x68\x68\x68\x68\x68\x08\xe0\x79\xab\xb5\xb0\x50\x97\xbc\
-\xc1\xf0\xdb\x01\x97\x65\xbd\x3f\x4d\x1b\x8d\x1c\x07\x08\x42\x51\
-\x91\xc3\x01\xf4\xf5\xf5\xf5\xf5\xf5\x2d\x03\x01\xb9\xb0\xc4\x71\
-\x1c\xc7\xf3\xbf\x3d\xf0\x6c\x56\xef\x27\x8f\x8f\xc3\x9b\x6c\x36\
-\x41\x00\xa2\x91\x68\x24\x1a\x59\x3a\x02\x26\x32\xc1\x5c\xa2\x43\
-\xd3\x34\x4d\x2d\x02\x78\x22\x91\x4a\x25\x12\xc0\xcd\x9b\xd1\x48\
-\x20\x00\x58\x2c\x2c\x57\x5c\x0c\x70\x1c\xcb\x16\x17\x2d\x1e\xb8\
-\x24\xe9\x26\x49\xd1\x34\x65\x30\xe4\x13\xa8\x25\x27\x00\x04\x08\
-\x10\x00\x49\x12\x04\x71\x0b\xe0\x1e\x8f\xcf\xf7\xd9\x69\xe0\xd2\
-\xa5\x1e\xff\x89\x16\xa0\xa7\x27\x1c\xbe\x70\x01\x48\x26\xd3\xe9\
-\x60\x10\x00\x08\x52\x92\x00\x92\x24\x40\x51\x00\x6f\x2a\x30\x38\
-\x4b\x00\x67\xa9\xcd\xb6\x61\x03\x50\x5e\x2e\x08\xdb\x1e\x00\x36\
-\x6c\xb8\xeb\xae\xfd\xfb\xf3\x40\xe7\x02\x2e\x49\x8a\xac\xaa\x80\
-\xaa\x68\x9a\xa2\x4c\x4c\x73\xe9\x09\xa0\x69\x9a\xa6\x69\x40\x91\
-\xa5\x6c\x46\xcc\x03\x8f\x46\x13\xf1\x5f\x7f\x05\x0e\x1d\x3a\xf7\
-\xf5\xc1\x83\x80\xdf\x1f\x8d\x9c\x3b\x07\x90\x24\x49\xe9\xc9\x91\
-\x4e\x0c\x4d\x33\x05\x04\xa1\x13\x45\x51\xe3\x44\x12\x80\xac\x90\
-\x64\x24\x0a\x04\x83\xc9\xe4\x7f\xce\x00\xa1\xd0\xc8\xc8\x99\xb3\
-\x40\x57\x57\x5f\xef\x91\x23\xc0\x96\x2d\x6b\xeb\xfe\xf6\x57\xc0\
-\xe1\x10\x04\xf7\xfa\x99\xc0\x27\x14\x9a\x4d\xa7\x53\x63\x00\x67\
-\xe2\x4c\x9c\x69\xe9\x08\x98\xf0\x01\xb9\x94\x33\x9e\x88\x27\xe2\
-\x09\xa0\xb7\x77\x70\xb0\xab\x0b\x68\x6e\x3e\x75\x7a\xef\x1e\xa0\
-\xa7\x27\x16\x3b\x73\x06\xa0\x28\x8a\xd6\x34\xdd\x04\x74\x53\xc8\
-\x9b\xc4\x7c\xee\x69\x5a\xaf\x25\x89\x66\xba\xbb\x81\xef\x5a\xbb\
-\xbb\x9f\x7f\x1e\xf0\xfb\xfb\xfb\xbf\xfe\x7a\x26\xf0\x5c\x49\x26\
-\x87\x62\x91\x28\xe0\x70\x38\x1c\x0e\xc7\x32\x10\x60\xb7\xdb\xed\
-\x76\x3b\xd0\xfb\x4b\xff\xcd\x6b\xdd\xc0\xbf\xff\xf5\xd5\x57\x4f\
-\x3d\x09\xc4\x62\x99\x8c\xef\xc6\xed\x81\x91\xa4\x2c\xb3\x2c\x30\
-\x3c\xec\xf5\x0a\x02\x10\x89\xf4\xf7\x33\x8c\x9e\x49\x4e\x6d\x3f\
-\xb5\x26\x29\x86\x89\x27\x00\xaf\xb7\xaf\xef\x95\x57\x80\x81\x81\
-\xe8\x50\x7b\x7b\x7e\x82\xe9\x74\x72\x24\x1e\x07\x06\x07\x43\xa1\
-\x60\x10\x70\xb9\x5c\x2e\x97\x6b\x19\x08\xa8\xaa\xaa\xaa\xaa\xaa\
-\x02\x7c\x37\x46\x47\x4f\x9d\x06\x92\x23\xb2\xec\xef\x99\x0f\x70\
-\x45\x31\x18\x80\x58\xec\xc2\x85\xa2\x22\x20\x14\xba\x71\x83\xe7\
-\x81\x58\x6c\x70\x50\x27\x60\x3a\xf0\xd9\xc7\x29\x28\x30\x18\x46\
-\x46\x00\x9f\xef\xd7\xbe\x77\xdf\xcd\x4f\x30\x1c\xbe\x7e\xed\xca\
-\x15\x40\x10\x04\x41\x10\x80\xba\xba\xba\xba\xba\xba\xa5\x23\x60\
-\xc2\x07\x0c\x0c\x24\x12\x3e\x1f\x30\x32\xc2\x14\x5c\xee\x98\xb4\
-\x42\x64\xae\xd6\x6d\x5a\x97\x31\x30\x36\xd6\xd3\x63\xb1\x00\xe1\
-\xf0\xd5\xab\x3c\x0f\x8c\x8d\x49\x12\xa0\x6f\x98\xf4\x9a\x24\x09\
-\x62\xea\x8a\x13\x44\x7e\x9c\xdc\x7b\x92\x24\x88\xdc\x77\xf4\xbe\
-\x24\x79\xf5\x2a\xe0\xf5\x7a\xbb\x0e\x1d\x02\x22\x91\xeb\x3e\x51\
-\xcc\xef\x0e\x19\x86\x61\x18\x66\x19\x14\xf0\xc3\x0f\x3e\xdf\xf1\
-\xe3\x00\x49\x32\x8c\x24\xcf\x2d\x59\x8a\x52\x55\x83\x01\x88\x46\
-\xaf\x5c\xe1\x79\x20\x95\xca\x03\xd7\x01\xe8\x00\x75\x88\x0b\xf7\
-\x15\x0c\xc3\x30\x14\x05\xf4\xdf\x1c\x1c\xfc\xf2\x4b\xc0\x6e\x37\
-\x99\x00\x40\x96\xaf\x5f\x3f\x75\x0a\xf0\x78\x8e\x1d\x7b\xfb\x6d\
-\xfd\xa0\x65\x36\x5f\xb1\x68\x05\xf4\xfe\x12\x8d\x5e\xba\x34\x75\
-\xe5\x67\x5b\x21\x92\xa4\xe9\x6c\x16\xa8\xad\xdd\xb7\x6f\x60\x00\
-\xd0\xb4\xd1\x51\x9e\x07\xae\x5d\x3b\x7d\xda\x6c\x06\xd2\xe9\xf9\
-\x2a\x20\xa7\xa8\xe9\x0a\xd3\xdb\xd1\x34\xc7\x0e\x0e\x02\x06\x43\
-\x6b\x6b\x73\x33\xd0\xd9\x99\x4e\x8b\x22\x90\x4e\x8b\xa2\xa2\x00\
-\xa1\x90\xcf\x77\xf1\x22\xb0\x6b\xd7\x8b\x2f\x7e\xf4\x91\xee\x6b\
-\xe8\x45\x9c\x6f\x4d\x74\x49\x8e\xa4\x52\x03\xa1\xc9\xb6\x3d\xd7\
-\x04\xa7\x4b\x98\xe3\x34\x0d\xc8\xc9\x52\x14\xf3\x00\xf5\x70\x48\
-\x92\xc0\xec\x26\x30\x1b\xf0\xdc\xbd\x89\xb7\x16\xaa\x2a\xc0\x30\
-\x26\x93\x5e\xeb\xe3\xe5\xca\xb5\x6b\xe7\xcf\x1f\x39\xa2\xef\x1e\
-\x39\x0e\x68\x6c\x3c\x78\xf0\xfd\xf7\xf5\xef\x92\xe4\x22\x08\xc8\
-\x66\x55\x65\x2c\xa5\x87\xb9\x5b\x13\xa0\x4f\x74\xf2\x0a\x4e\xbe\
-\xcf\x95\xdc\x44\x28\x8a\xa2\xf4\xb0\x39\xb3\xfd\x74\xa5\x4d\x7e\
-\x6f\x34\xb2\xac\xde\xce\x6a\xe5\x79\x80\x65\x35\x6d\x6c\x6c\x26\
-\x00\xaf\xf7\xcc\x99\x0f\x3e\x00\x24\x49\x4c\x8f\x8d\x01\xbb\x77\
-\xff\xf9\x2f\x1f\x7f\x3c\x7f\x45\x4c\xca\x03\x0c\x46\x41\x58\x78\
-\x5c\x9f\xbc\xb2\x39\xe0\x93\xeb\xbc\x49\x2d\xcc\x17\xc8\x72\x36\
-\xab\x69\xc0\x8a\x15\x56\xab\x20\x00\x82\x50\x5a\x5a\x51\xa1\xa7\
-\xd6\x34\x0d\xb0\x2c\xc7\x51\x14\xc0\xb2\x46\x23\x45\x01\xd7\xaf\
-\xff\xb7\xf5\x93\x4f\x80\x2f\xbe\x68\x6e\x3e\x70\x00\xd0\x34\x55\
-\x9d\xcf\x01\xca\x04\x01\x82\xcd\xc4\x95\xaf\x58\x7c\x82\x93\x73\
-\x82\xf9\x2b\xa7\x80\x69\x71\x9f\x9c\xea\x13\xe6\x72\xb6\x0c\x9d\
-\xcd\xe8\x07\x30\x92\x14\x8b\x01\x85\x85\x25\x25\x15\x15\x80\xd3\
-\xb9\x66\x4d\x7d\xfd\xdc\x44\x74\x75\x9d\x3b\x77\xf8\x30\x70\xf2\
-\xe4\x1b\xaf\x3f\xf6\x18\xa0\xaa\xb2\xac\xbb\xe9\xdb\x10\xb0\xda\
-\x55\xec\xd8\xfc\x87\x85\x00\x9f\x0a\x24\x2f\xff\xc9\x81\x70\xf1\
-\x84\x56\x54\x96\x96\x6e\x7f\x18\x28\x2b\xdb\xb8\xf1\xa9\x27\x81\
-\x4c\x26\x12\xf9\xe9\x27\x40\x10\x56\xac\xa8\xae\x06\x2a\x2a\xd6\
-\xad\x7b\xe0\x81\x5b\x29\xa2\xf5\xbb\xa3\x47\x81\x93\x27\xdf\xfc\
-\xfb\xbe\x7d\x73\x13\x31\x41\xc0\xc6\x8d\x35\x35\x4d\x4d\x00\x4d\
-\x69\x5a\xce\x14\x28\xea\x56\xe1\x50\xdf\x0d\xe6\xee\x73\x3e\x20\
-\x7f\xdd\x3e\x01\x9a\x3a\xbe\xfe\x5e\x55\x15\x99\x22\x81\xea\xea\
-\xd2\xb2\x1d\x3b\x80\x9a\x9a\x5d\xbb\xfe\xf1\x16\x50\x5a\xda\xd0\
-\xf0\xc4\x13\x40\x32\x19\x08\x9c\x3d\x0b\x14\x17\xaf\x5e\xed\x76\
-\x03\x95\x95\xf5\xf5\x0f\x3d\x34\x37\x11\x3e\x5f\xeb\x77\xc7\x8e\
-\xcd\x4d\xc4\x04\x01\x65\x65\x45\x45\x2e\x17\xb0\xae\xbe\xac\xac\
-\xa9\x29\x1f\xfe\xe6\xa3\x84\x5c\x82\x34\xdd\x07\x2c\x54\x49\x24\
-\x09\x58\xad\x14\x7d\xdf\x56\xc0\xed\x76\xb9\xb6\x6f\xcf\x8f\x58\
-\x5d\xbd\x6b\xd7\x9b\x6f\x02\xc5\xc5\x6b\xd7\xee\xde\x0d\x84\xc3\
-\x1d\x1d\x87\x0f\x03\x66\xb3\xdd\x5e\x52\x02\x38\x9d\x55\x55\x6e\
-\xf7\xed\x89\xf8\xe2\xf3\xe6\xe6\xa7\x9f\x9e\x25\x0a\xe4\xca\xde\
-\xbd\xf7\xdf\xff\xf2\xcb\x40\x7c\xf8\xec\xd9\xbe\x5e\x20\x3a\x94\
-\xc9\x7c\x7b\x7e\xa6\xb7\xce\x87\x31\x9a\xd6\x34\x60\xf3\xe6\xe7\
-\x9e\x4b\xa7\x67\x8f\x1e\x93\x15\x32\x57\x7e\x41\x91\x92\xb4\xc6\
-\x05\x3c\xf2\xc8\xe6\xcd\xaf\xbd\x36\x53\xaa\x04\xa1\x2b\xf2\xee\
-\xbb\x9b\x9a\xde\x7b\x0f\xa0\x28\x83\xc1\x6c\x06\x42\xa1\xf6\xf6\
-\x0f\x3f\x04\x4c\xa6\x92\x92\xf5\xeb\x01\xbb\xbd\xac\x6c\xe5\x4a\
-\x00\x08\x06\x7b\x7b\x67\x8e\x53\x51\x59\x5f\xff\xe0\x83\xb3\x28\
-\x60\xe2\xc1\xf8\x76\xf6\x4f\x8f\x6d\xdd\xfa\xd6\x3f\x81\xc2\x42\
-\x8a\xdc\xb4\x69\x61\x8a\x98\xcb\x64\xa6\x3b\x43\x82\x00\x34\x2d\
-\x9d\xae\xac\x00\x1e\xde\x51\x57\xf7\xfa\x1b\xfa\x51\x9c\xcd\x76\
-\x2b\xbf\xad\x13\x59\x53\xb3\x7b\xf7\x5b\xe3\xa6\xb1\x7f\x3f\x20\
-\x8a\x03\x03\x1d\x1d\x00\xcb\xb2\x2c\xc3\x00\x16\x4b\x61\xa1\xc5\
-\x92\x57\xc4\xa6\x4d\x4d\x4d\x2f\xbc\x00\xd4\xd7\xef\xd8\x71\xe0\
-\xc0\xa4\xd1\x6e\xf7\x67\x48\x96\x15\x25\x9b\x05\x3e\xfd\xf4\xfb\
-\xef\x5f\x7d\x15\xe8\xfd\x65\x78\xf8\xf3\xcf\x81\x02\x03\xc7\xe9\
-\x2b\x3e\x7b\x1c\x9f\xbe\xc2\x39\x05\x64\x32\x19\x91\xa6\x00\x41\
-\x60\x0a\xee\xdf\x06\x34\x36\xde\x7b\xef\x4b\x2f\x01\x56\x2b\xcf\
-\x2f\x66\x9b\x9b\x0b\x77\xdd\xdd\x47\x8f\x3e\xfb\x2c\x10\x0e\x7b\
-\xbd\x27\x4e\xe8\xa7\xc7\x00\xe0\x70\xac\x5f\xff\xf8\xe3\x80\xdb\
-\xfd\xe8\xa3\xef\xbc\x93\x57\xd2\xbc\x09\x98\x5e\xc2\xe1\x78\xbc\
-\xb7\x17\xe8\xe8\xf0\xfb\x8f\x1f\x07\xc2\xe1\xd1\xd1\x2b\x57\x80\
-\x74\x4a\x92\x22\x11\x20\x93\x95\xe5\x64\x12\x28\x28\xa0\x69\x13\
-\x07\x98\x4c\x0c\x53\x5c\x0c\x08\x02\xcf\xaf\xad\x03\xd6\xae\xad\
-\xa8\x68\x6c\x04\x56\xad\x2a\x29\x71\xbb\x17\x0e\x78\x6e\x22\xf4\
-\xbd\x81\xcf\x77\xe2\xd3\x83\x07\x01\x93\xc9\x59\x7a\xcf\x3d\x40\
-\x79\xf9\x96\x2d\xcf\x3c\x73\x0b\x3d\xfd\xde\x7f\x8f\xff\x0f\x07\
-\x67\x68\xeb\x03\xf5\xc0\x64\x00\x00\x00\x25\x74\x45\x58\x74\x64\
-\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x31\x2d\
-\x31\x30\x2d\x30\x36\x54\x30\x30\x3a\x35\x32\x3a\x34\x32\x2d\x30\
-\x34\x3a\x30\x30\x64\xeb\x7e\x4b\x00\x00\x00\x25\x74\x45\x58\x74\
-\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x31\
-\x2d\x30\x31\x2d\x31\x35\x54\x31\x36\x3a\x33\x39\x3a\x35\x30\x2d\
-\x30\x35\x3a\x30\x30\xc7\x6b\x7b\x95\x00\x00\x00\x60\x74\x45\x58\
-\x74\x73\x76\x67\x3a\x62\x61\x73\x65\x2d\x75\x72\x69\x00\x66\x69\
-\x6c\x65\x3a\x2f\x2f\x2f\x68\x6f\x6d\x65\x2f\x6d\x61\x72\x6b\x75\
-\x73\x2f\x70\x72\x6f\x67\x72\x61\x6d\x6d\x69\x6e\x67\x2f\x70\x79\
-\x74\x68\x6f\x6e\x2f\x73\x63\x6f\x6e\x63\x68\x6f\x2f\x74\x72\x75\
-\x6e\x6b\x2f\x73\x63\x6f\x6e\x63\x68\x6f\x2f\x67\x75\x69\x2f\x69\
-\x63\x6f\x6e\x73\x2f\x7a\x6f\x6f\x6d\x2d\x31\x30\x30\x2e\x73\x76\
-\x67\x6c\x33\x76\x0a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
+\x00\x00\x16\x00\x00\x00\x16\x08\x06\x00\x00\x00\xc4\xb4\x6c\x3b\
+\x00\x00\x04\x53\x49\x44\x41\x54\x78\xda\xa5\x54\x5b\x6b\x5c\x55\
+\x14\xfe\xf6\x3e\x67\x6e\x49\x3c\x33\xe9\x68\x92\x4e\x4d\x9a\xea\
+\x18\xad\xa6\x52\x43\xa3\x62\xa5\x41\x2a\xa9\x4f\x15\xd2\xc7\x0a\
+\x02\x82\xbe\x28\x46\x10\x81\xbc\xf6\x45\xa4\x82\x50\x7d\xf1\x17\
+\xa8\x16\x4a\x23\xa9\x48\x14\xd5\x68\x42\x42\x42\x85\xe6\x56\x2c\
+\xb9\xb4\x13\x3b\xd3\xc9\x65\x32\x97\x73\x99\x73\xd9\xee\xb5\x73\
+\x18\x02\x05\xc1\xba\x0e\x8b\x75\x66\xf6\xb7\xbf\xb5\xd6\xb7\xd7\
+\x3e\x4c\x08\x81\x07\xb1\xd3\x3f\xbf\xf2\xe9\xf9\xec\x1b\xef\x78\
+\xf0\x61\x79\xa6\x7f\xe9\xb7\xcf\xce\xde\x7a\x73\xed\x57\x84\xa6\
+\xe3\x01\xed\x48\xcb\x91\x27\x7a\x93\xbd\xcd\x26\x2c\x98\xa2\x86\
+\x54\x22\xf5\x0c\x80\xff\x4f\x5c\xaf\xbb\x41\xb9\x5e\x86\x49\x8f\
+\x30\x01\x9f\x81\xec\x3f\x13\x37\x7d\x1e\x6f\x7e\xf1\xd0\x0b\x9f\
+\x18\xf1\x64\xcc\x63\xbe\xe8\x32\xba\xb2\x15\x67\x8f\xb8\x2a\xaa\
+\x28\x9a\xc5\x33\xc6\x97\x4d\x9d\x3c\x60\x94\x64\x5d\x69\xcc\x18\
+\x6b\x07\xc0\xf0\x2f\xd6\xf1\xf1\xc3\xef\x7d\x75\xfe\xdb\x11\x2f\
+\x70\xa5\xa6\x16\x2c\x61\xa1\x16\x3e\x97\x37\xbf\xc1\x6c\x7d\x0e\
+\x41\x22\x90\x2e\xc0\xd7\xd8\x86\x9e\xcd\x66\x7f\x1f\x1e\x1e\x7e\
+\x5e\xd7\xf5\x40\x9a\x6c\xb1\x0e\xc7\x71\x28\xea\xb6\x63\x0b\xa7\
+\xee\xc0\xb6\x6c\x6c\xac\xe5\xb8\x2d\x09\x4d\xcf\x54\xc4\x3b\xce\
+\x36\x26\x37\xff\xc0\xe4\xee\x24\x76\xf4\x1d\xb0\x04\x03\x67\x1c\
+\x40\x00\xb6\xcd\xda\x58\x7f\x7f\xbf\x3d\x3d\x3d\x1d\xc3\x3e\xa3\
+\x04\xb7\x8a\x7f\x21\x92\x88\x60\xbd\xbc\x8e\xeb\xc5\x39\x8c\x2e\
+\x5e\x85\x17\x75\x91\x8c\x26\xb1\x5e\x59\x43\xc1\x2c\x80\x4c\xc4\
+\x85\xaa\x32\x08\xa3\x90\x8e\x65\x21\x74\x4d\xd3\xee\x6b\x9b\xe4\
+\xe1\x5c\x43\xae\x96\xc3\x2f\xb9\x9f\x70\xa7\x72\x07\x81\x1e\xc0\
+\x29\xb8\x68\xef\xec\x40\xdb\x43\xed\x58\x0d\x56\xb1\x60\xdf\x00\
+\xb3\x19\x78\x00\xbc\xe4\x9c\x44\x5a\xa4\x11\xd8\x02\x57\xbe\xbf\
+\x22\xd4\xe1\x85\x3a\x23\x34\x25\xc7\x77\xf3\xa3\x18\x73\x47\xf1\
+\xe7\xbd\xeb\xe0\x16\x03\x04\x70\x36\x32\x84\x4b\x83\x5f\x28\xfc\
+\xc8\x8f\x1f\x61\x21\x7f\x03\x31\x2d\x86\xc3\xf1\x6e\x0c\x75\x9e\
+\xc3\xeb\x47\x87\xd4\xda\xd7\xe7\x2e\xfb\x44\xcc\x6d\xdb\x56\xc4\
+\x14\xf3\xf9\x3c\x4c\xd3\x44\x7d\xab\x0e\xc3\x4d\xe1\x59\xe7\x38\
+\x44\x3d\x90\x95\x04\x88\xd4\x23\x98\x9a\x9a\x82\xef\xfb\xb8\xfb\
+\x77\x1e\xd4\xed\xf1\x47\x9e\xc3\x53\xa9\xa7\xb1\xb4\xb0\x84\xf8\
+\xed\x1f\x68\x8d\xc8\xb9\x4e\x19\x62\xb1\x18\x38\xe7\x2a\x1a\x86\
+\x81\x72\xb9\x8c\xad\xad\x2d\xcc\xea\x33\xa8\x98\x15\x70\x93\x41\
+\x2b\x73\x74\x55\xbb\xd1\x7f\xe2\x04\x15\x8f\xb1\xea\x55\x64\xac\
+\x43\x78\x2c\xf9\x38\x8e\xa5\x8f\x81\xf5\x72\xbc\x9a\x3d\xad\x2a\
+\x26\xd3\xc3\x0c\xe4\xea\xd0\x54\xf4\x7d\x35\x9b\x56\xcc\x46\x40\
+\x40\x1f\xe0\x51\x01\xcf\xf3\x40\x78\xea\xee\xdd\xfe\xf7\x71\x70\
+\x31\x03\xad\xae\x61\x61\x76\x01\x1f\xbc\xf6\xa1\xc2\x8a\x90\x43\
+\x27\x30\x11\x12\xb8\x41\x2c\xdd\x12\x26\x6c\x49\x4c\xc6\x5c\x8e\
+\x20\x2a\x24\xa9\x24\x96\x18\x2e\xb1\x07\x12\x07\xf0\x56\xdf\xdb\
+\x0a\x3f\x51\x99\x00\x13\x90\xfb\x02\x45\x4c\xa6\x88\x73\xb9\x9c\
+\x02\x14\x0a\x05\x55\x51\xad\x56\x03\x6e\x33\x3c\x59\x3a\x8a\xc0\
+\xf1\x21\xaa\x42\xb9\x77\x37\xc0\xf8\xf8\x38\x61\x09\xd7\xf0\x9b\
+\x37\x6f\xe2\x9e\xdc\x4b\x85\x79\x7b\x1d\x09\x5d\x5e\x06\xbf\xa3\
+\xa3\x23\x42\x07\x91\xc9\x64\xd4\xe2\xee\xee\x2e\x2e\xb2\x8b\x98\
+\xef\x99\x07\xaf\x31\xe8\x25\x0d\xfa\x96\xd4\xb8\xde\x85\x81\x81\
+\x01\xc8\xcb\x04\xb1\xaf\xbb\x78\x3c\x8e\x81\x53\xa7\x1a\xa3\x3a\
+\x32\x32\x22\x74\x1a\x2d\xca\xda\x90\x42\x3a\xc5\x1a\xaa\x6a\xe0\
+\x99\xcb\x20\x74\x01\xa1\x01\x5e\xe0\x29\xfd\x03\xce\x15\x81\x08\
+\x25\x24\x62\x4e\xf7\x21\x3c\xb8\x74\x3a\x0d\xbd\x5a\xad\x0a\xcf\
+\x75\x09\x40\xe0\xc6\x06\x8b\xdb\xea\x56\x09\x6b\x8f\x54\x70\xd5\
+\xbe\x3a\x40\xea\x8e\x28\x18\xe7\x6a\x5f\x53\x22\xa1\xfe\x0b\x4b\
+\x26\x62\xa6\x4b\x3d\xf5\xe9\x99\x19\x68\x12\xe4\x85\x9a\xc9\x64\
+\xe8\xdc\x78\x14\x46\xc9\x80\xa8\x09\xa0\x2a\xbb\xa8\x04\x70\x57\
+\x3d\x8c\x5d\xbb\x86\x84\x24\x8a\x45\xa3\x88\xca\xf1\x8c\xca\xb8\
+\x59\x2c\x92\x3c\x54\xb5\x4a\xd4\xda\xda\xca\x75\xca\xd1\xd7\xd7\
+\x47\xc0\x86\x66\xa5\x52\x09\x17\x96\x2f\x60\xf9\xe5\x65\xe8\xdb\
+\x52\xdf\xa2\x86\x83\xa5\x76\x64\xab\x3d\x18\x1c\x1c\x44\x4b\x73\
+\x33\xcd\x3d\xb9\xaa\x7a\x65\x65\x05\x3d\x3d\x3d\x8a\xb4\x21\x45\
+\x38\xbf\xfb\x67\x50\xfd\xc6\x26\x10\x5b\x8f\xa8\x6f\x41\xb2\x6a\
+\xe0\x30\xeb\x46\x4c\xc4\x14\x06\x21\x01\x11\x51\xa7\x89\x50\x0a\
+\x7a\xc7\x5e\xc5\xd0\x09\xe0\xd8\x36\x22\x91\x48\x43\x5f\xf2\x54\
+\xde\x40\x6a\xc9\x00\x3c\x20\xc3\x33\xc8\x24\x32\x70\x03\x5f\x61\
+\x20\xdd\x27\xa7\x99\xf6\x7d\x92\x41\x55\xaf\x85\x31\x99\x4c\x32\
+\xd6\xd6\xd6\x36\x51\x2c\x16\x4f\xd2\xec\xed\xfb\xba\x31\xdc\x6f\
+\x6a\x53\xb3\x94\xa1\xa5\xa5\x85\x9c\xde\xc9\xa9\x62\x8a\x34\x1d\
+\x2a\xc9\xdc\xdc\xdc\xe2\x3f\x90\x6c\xae\x58\x53\x15\x54\x13\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 "
 
 qt_resource_name = b"\
@@ -8694,27 +6424,36 @@ qt_resource_name = b"\
 \x00\x6f\xa6\x53\
 \x00\x69\
 \x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0e\
+\x02\x53\x67\x87\
+\x00\x69\
+\x00\x6e\x00\x73\x00\x65\x00\x72\x00\x74\x00\x5f\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x02\x7a\x46\xa7\
+\x00\x63\
+\x00\x72\x00\x65\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x63\x00\x65\x00\x6c\x00\x6c\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x12\
+\x0b\xa8\xa4\xa7\
+\x00\x70\
+\x00\x61\x00\x74\x00\x74\x00\x65\x00\x72\x00\x6e\x00\x5f\x00\x72\x00\x65\x00\x70\x00\x65\x00\x61\x00\x74\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
 \x00\x08\
-\x0f\x07\x5a\xc7\
-\x00\x65\
-\x00\x78\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x0b\xb2\x58\x47\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0d\
 \x06\xd9\x22\xa7\
 \x00\x67\
 \x00\x74\x00\x6b\x00\x2d\x00\x63\x00\x6c\x00\x65\x00\x61\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x0d\x6b\x8f\xc7\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x62\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x06\
-\x07\xc3\x57\x47\
-\x00\x75\
-\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x04\xe6\x5a\x87\
-\x00\x67\
-\x00\x74\x00\x6b\x00\x2d\x00\x70\x00\x72\x00\x65\x00\x66\x00\x65\x00\x72\x00\x65\x00\x6e\x00\x63\x00\x65\x00\x73\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
+\x00\x10\
+\x03\x81\x95\x27\
+\x00\x73\
+\x00\x63\x00\x6f\x00\x6e\x00\x63\x00\x68\x00\x6f\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x0e\xab\x33\x47\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x6f\x00\x72\x00\x69\x00\x67\x00\x69\x00\x6e\x00\x61\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
 \x00\x0d\
 \x06\x52\xd9\xe7\
 \x00\x66\
@@ -8725,221 +6464,122 @@ qt_resource_name = b"\
 \x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x5f\x00\x63\x00\x6f\x00\x6c\x00\x75\x00\x6d\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \
 \x00\x0c\
-\x07\x6b\x9c\x27\
-\x00\x6b\
-\x00\x63\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x04\x14\x52\xc7\
+\x05\x68\x0e\x67\
 \x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x6e\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0b\xb2\x58\x47\
-\x00\x72\
-\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x06\x6d\x3d\x27\
-\x00\x68\
-\x00\x69\x00\x73\x00\x74\x00\x6f\x00\x67\x00\x72\x00\x61\x00\x6d\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x69\x00\x6c\x00\x65\x00\x73\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x11\
 \x08\x1b\x81\x27\
 \x00\x7a\
 \x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x62\x00\x65\x00\x73\x00\x74\x00\x2d\x00\x66\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \
-\x00\x0e\
-\x0b\xdf\x7d\x87\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x73\x00\x61\x00\x76\x00\x65\x00\x61\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x0a\xc7\x57\x87\
-\x00\x63\
-\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x0c\x3c\x18\x47\
-\x00\x6c\
-\x00\x61\x00\x62\x00\x65\x00\x6c\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\xe1\x5a\x27\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0f\x55\x06\x27\
-\x00\x72\
-\x00\x65\x00\x63\x00\x74\x00\x61\x00\x6e\x00\x67\x00\x6c\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x04\xe6\x5a\x87\
+\x00\x67\
+\x00\x74\x00\x6b\x00\x2d\x00\x70\x00\x72\x00\x65\x00\x66\x00\x65\x00\x72\x00\x65\x00\x6e\x00\x63\x00\x65\x00\x73\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
 \x00\x08\
 \x00\x2f\x5a\xe7\
 \x00\x66\
 \x00\x69\x00\x6c\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x0d\xf7\xa6\xa7\
-\x00\x72\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x0d\xf0\xfa\x27\
-\x00\x73\
-\x00\x68\x00\x6f\x00\x77\x00\x5f\x00\x63\x00\x65\x00\x6c\x00\x6c\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x02\x53\x67\x87\
-\x00\x69\
-\x00\x6e\x00\x73\x00\x65\x00\x72\x00\x74\x00\x5f\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x02\x66\x3f\x87\
-\x00\x72\
-\x00\x6f\x00\x77\x00\x5f\x00\x72\x00\x65\x00\x70\x00\x65\x00\x61\x00\x74\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x03\x03\x9b\x47\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x11\
-\x0e\xab\x33\x47\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x6f\x00\x72\x00\x69\x00\x67\x00\x69\x00\x6e\x00\x61\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\
-\x00\x0a\
-\x05\x78\x4f\x27\
-\x00\x72\
-\x00\x65\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
-\x0b\x63\x58\x07\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x0a\x1e\x22\xc7\
-\x00\x6c\
-\x00\x65\x00\x74\x00\x74\x00\x65\x00\x72\x00\x5f\x00\x54\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x0c\x64\xfe\x67\
-\x00\x68\
-\x00\x69\x00\x64\x00\x65\x00\x5f\x00\x63\x00\x65\x00\x6c\x00\x6c\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x12\
-\x0b\xa8\xa4\xa7\
+\x0c\xf7\x58\x07\
+\x00\x74\
+\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0a\xa8\xba\x47\
 \x00\x70\
-\x00\x61\x00\x74\x00\x74\x00\x65\x00\x72\x00\x6e\x00\x5f\x00\x72\x00\x65\x00\x70\x00\x65\x00\x61\x00\x74\x00\x2e\x00\x70\x00\x6e\
-\x00\x67\
-\x00\x0e\
-\x00\x78\x05\xa7\
-\x00\x73\
-\x00\x65\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x5f\x00\x61\x00\x6c\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x04\xb0\x1a\x47\
-\x00\x72\
-\x00\x65\x00\x64\x00\x5f\x00\x72\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0b\xd7\x59\x07\
-\x00\x6c\
-\x00\x65\x00\x66\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x61\x00\x73\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0c\
 \x0b\x21\x0f\x87\
 \x00\x66\
 \x00\x69\x00\x6c\x00\x65\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x01\xcc\x57\xa7\
-\x00\x6b\
-\x00\x65\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x06\xc0\xd2\xe7\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x65\x00\x65\x00\x78\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0e\
 \x01\x33\x1b\x27\
 \x00\x64\
 \x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x5f\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x02\x7a\x46\xa7\
-\x00\x63\
-\x00\x72\x00\x65\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x63\x00\x65\x00\x6c\x00\x6c\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x05\x68\x0e\x67\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x73\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x01\x08\xfa\xc7\
-\x00\x69\
-\x00\x6e\x00\x73\x00\x65\x00\x72\x00\x74\x00\x5f\x00\x66\x00\x72\x00\x61\x00\x6d\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
 \x04\xb2\x58\xc7\
 \x00\x75\
 \x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
-\x0c\xf7\x58\x07\
-\x00\x74\
-\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x06\x7c\x5a\x07\
+\x00\x63\
+\x00\x6f\x00\x70\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x04\x14\x52\xc7\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x65\x00\x6e\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0d\xf0\xfa\x27\
+\x00\x73\
+\x00\x68\x00\x6f\x00\x77\x00\x5f\x00\x63\x00\x65\x00\x6c\x00\x6c\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0b\xdf\x7d\x87\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x65\x00\x73\x00\x61\x00\x76\x00\x65\x00\x61\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0c\x64\xfe\x67\
+\x00\x68\
+\x00\x69\x00\x64\x00\x65\x00\x5f\x00\x63\x00\x65\x00\x6c\x00\x6c\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0c\
 \x06\xeb\x97\xe7\
 \x00\x7a\
 \x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x06\xc0\xd2\xe7\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x65\x00\x78\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
-\x06\x7c\x5a\x07\
-\x00\x63\
-\x00\x6f\x00\x70\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x0f\x07\x5a\xc7\
+\x00\x65\
+\x00\x78\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x02\x66\x3f\x87\
+\x00\x72\
+\x00\x6f\x00\x77\x00\x5f\x00\x72\x00\x65\x00\x70\x00\x65\x00\x61\x00\x74\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x03\x03\x9b\x47\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x11\
 \x0b\x4b\xe4\x07\
 \x00\x69\
 \x00\x6e\x00\x73\x00\x65\x00\x72\x00\x74\x00\x5f\x00\x63\x00\x6f\x00\x6c\x00\x75\x00\x6d\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \
-\x00\x10\
-\x03\x81\x95\x27\
-\x00\x73\
-\x00\x63\x00\x6f\x00\x6e\x00\x63\x00\x68\x00\x6f\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x0a\xa8\xba\x47\
-\x00\x70\
-\x00\x61\x00\x73\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x04\x1f\x97\x67\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x31\x00\x30\x00\x30\x00\x2e\x00\x70\x00\x6e\x00\x67\
 "
 
 qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x2f\x00\x00\x00\x02\
-\x00\x00\x02\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x87\x58\
-\x00\x00\x03\x82\x00\x00\x00\x00\x00\x01\x00\x01\x01\xd7\
-\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x23\x76\
-\x00\x00\x04\x70\x00\x00\x00\x00\x00\x01\x00\x01\x4b\x78\
-\x00\x00\x04\x0a\x00\x00\x00\x00\x00\x01\x00\x01\x37\x7c\
-\x00\x00\x03\xf6\x00\x00\x00\x00\x00\x01\x00\x01\x32\x1b\
-\x00\x00\x02\x5e\x00\x00\x00\x00\x00\x01\x00\x00\xa1\xb8\
-\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x00\xa5\xf5\
-\x00\x00\x04\x2c\x00\x00\x00\x00\x00\x01\x00\x01\x3b\xf9\
-\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x00\xaa\xf4\
-\x00\x00\x05\x40\x00\x00\x00\x00\x00\x01\x00\x01\x78\xb1\
-\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x33\x62\
-\x00\x00\x05\x7e\x00\x00\x00\x00\x00\x01\x00\x02\x0c\x41\
-\x00\x00\x03\xa4\x00\x01\x00\x00\x00\x01\x00\x01\x06\x29\
-\x00\x00\x04\x96\x00\x00\x00\x00\x00\x01\x00\x01\x4d\x7e\
-\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x15\xfe\
-\x00\x00\x04\x52\x00\x00\x00\x00\x00\x01\x00\x01\x41\x2f\
-\x00\x00\x02\xe8\x00\x00\x00\x00\x00\x01\x00\x00\xd2\x0f\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x30\
-\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x00\x48\x55\
-\x00\x00\x05\x02\x00\x00\x00\x00\x00\x01\x00\x01\x72\xbb\
-\x00\x00\x04\xe0\x00\x00\x00\x00\x00\x01\x00\x01\x6f\xa9\
-\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x04\x5c\
-\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x7a\xfe\
-\x00\x00\x04\xc2\x00\x00\x00\x00\x00\x01\x00\x01\x5c\xc8\
-\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x28\x35\
-\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xc1\
-\x00\x00\x01\x60\x00\x00\x00\x00\x00\x01\x00\x00\x4b\x0f\
-\x00\x00\x03\x18\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x84\
-\x00\x00\x05\x66\x00\x00\x00\x00\x00\x01\x00\x02\x09\x97\
-\x00\x00\x01\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x70\x1d\
-\x00\x00\x03\xd8\x00\x00\x00\x00\x00\x01\x00\x01\x26\xc3\
-\x00\x00\x05\x18\x00\x00\x00\x00\x00\x01\x00\x01\x74\x21\
-\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\xdb\xfb\
-\x00\x00\x03\x58\x00\x00\x00\x00\x00\x01\x00\x00\xee\xe0\
-\x00\x00\x01\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x45\x7d\
-\x00\x00\x03\xc2\x00\x00\x00\x00\x00\x01\x00\x01\x1f\xa2\
-\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x00\x5f\x34\
-\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x73\x99\
-\x00\x00\x03\x36\x00\x00\x00\x00\x00\x01\x00\x00\xed\x9f\
-\x00\x00\x04\xac\x00\x00\x00\x00\x00\x01\x00\x01\x50\x4f\
-\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x57\
-\x00\x00\x02\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x9c\xee\
-\x00\x00\x02\x24\x00\x00\x00\x00\x00\x01\x00\x00\x95\xa6\
-\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xbe\x86\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x1d\x00\x00\x00\x02\
+\x00\x00\x01\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xfa\x51\
+\x00\x00\x01\x26\x00\x00\x00\x00\x00\x01\x00\x00\xcd\xf2\
+\x00\x00\x02\x44\x00\x00\x00\x00\x00\x01\x00\x01\x26\x2c\
 \x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\xee\x00\x00\x00\x00\x00\x01\x00\x00\x81\xd6\
+\x00\x00\x03\x48\x00\x00\x00\x00\x00\x01\x00\x01\x6f\x2c\
+\x00\x00\x00\x32\x00\x00\x00\x00\x00\x01\x00\x00\x04\x3d\
+\x00\x00\x03\x6c\x00\x00\x00\x00\x00\x01\x00\x01\x74\x2b\
+\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x25\x3d\
+\x00\x00\x02\x92\x00\x00\x00\x00\x00\x01\x00\x01\x2e\xe0\
+\x00\x00\x02\x66\x00\x00\x00\x00\x00\x01\x00\x01\x2a\xa9\
+\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\xf1\x1f\
+\x00\x00\x01\x4e\x00\x00\x00\x00\x00\x01\x00\x00\xd2\xb1\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\xc9\xac\
+\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x01\x2d\x7a\
+\x00\x00\x02\x22\x00\x00\x00\x00\x00\x01\x00\x01\x23\x1a\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x42\
+\x00\x00\x03\x14\x00\x00\x00\x00\x00\x01\x00\x01\x57\xef\
+\x00\x00\x01\x6c\x00\x00\x00\x00\x00\x01\x00\x00\xdc\xfa\
+\x00\x00\x01\xec\x00\x00\x00\x00\x00\x01\x00\x01\x15\x18\
+\x00\x00\x02\x04\x00\x00\x00\x00\x00\x01\x00\x01\x17\xc2\
+\x00\x00\x03\x88\x00\x00\x00\x00\x00\x01\x00\x01\x87\xbd\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x09\x73\
+\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x6a\
+\x00\x00\x02\xd0\x00\x00\x00\x00\x00\x01\x00\x01\x45\xc5\
+\x00\x00\x02\xf2\x00\x00\x00\x00\x00\x01\x00\x01\x56\xae\
+\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x01\x08\x9f\
+\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x01\x40\xfb\
+\x00\x00\x00\xde\x00\x00\x00\x00\x00\x01\x00\x00\xb6\x23\
+\x00\x00\x03\x32\x00\x00\x00\x00\x00\x01\x00\x01\x6a\xd0\
 "
 
 def qInitResources():
@@ -53,12 +53,16 @@ from PyQt4.QtGui import (QAction,
                          QFrame,
                          QGridLayout,
                          QHBoxLayout,
+                         QIcon,
                          QLabel,
+                         QListWidgetItem,
                          QPrinter,
                          QPrintDialog,
                          QPrintPreviewDialog,
                          QMainWindow,
                          QMessageBox,
+                         QProgressBar,
+                         QPushButton,
                          QWidget)
 
 from PyQt4.QtSvg import QSvgWidget
@@ -71,10 +75,7 @@ import sconcho.util.io as io
 import sconcho.util.symbol_parser as parser
 import sconcho.util.canvas as canvas
 
-from sconcho.gui.symbol_widget import (add_to_category_widget,
-                                       generate_category_widget,
-                                       generate_symbolWidgets,
-                                       remove_from_category_widget,
+from sconcho.gui.symbol_widget import (generate_symbolWidgets,
                                        SymbolSynchronizer,
                                        symbols_by_category)
 
@@ -88,11 +89,27 @@ from sconcho.gui.preferences_dialog import PreferencesDialog
 from sconcho.gui.sconcho_manual import SconchoManual
 from sconcho.gui.update_dialog import UpdateDialog
 from sconcho.gui.manage_symbol_dialog import ManageSymbolDialog
+from sconcho.gui.project_loader import ProjectLoader
+from sconcho.gui.command_profiler import (CommandProfiler,
+                                          CommandProfilerDock)
+from sconcho.gui.memory_report import MemoryReportDialog
+from sconcho.gui.icon_resources import register_icon_resources
 from sconcho.util.exceptions import PatternReadError
+from sconcho.util.symbol_index import SymbolIndex
+from sconcho.util.symbol_watcher import (SymbolLibraryWatcher,
+                                         SymbolParseThread)
+from sconcho.util.symbol_svg import (forget_symbol_svg,
+                                     set_icon_cache_path,
+                                     symbol_pixmap)
+from sconcho.util.startup_timer import mark_phase
 
 # module lever logger:
 logger = logging.getLogger(__name__)
 
+# refresh interval of the row/column counter in ms (about
+# the refresh rate of common displays)
+COUNTER_UPDATE_INTERVAL = 16
+
 
 #######################################################################
 #
@@ -106,28 +123,39 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """ Initialize the main window. """
 
         super(MainWindow, self).__init__(parent)
+        register_icon_resources()
         self.setupUi(self)
+        mark_phase("main window ui")
 
         self.settings = settings
-        self.preferencesDialog = PreferencesDialog(self.settings, self)
         self.manualDialog = None
 
+        # the preferences, export and symbol management dialogs are
+        # expensive to set up and are only created on first use
+        self.preferencesDialog = None
+        self.exportBitmapDialog = None
+        self.manageSymbolsDialog = None
+        self._allowAllLabelOptions = True
+
+        # debugging aids, also only created on first use
+        self.commandProfiler = None
+        self.commandProfilerDock = None
+        self.memoryReportDialog = None
+
         self.clear_project_save_file()
 
         self._topLevelPath = topLevelPath
         self._knittingSymbols = knittingSymbols
         self.canvas = PatternCanvas(self.settings,
                                     knittingSymbols["knit"], self)
-
-        self.exportBitmapDialog = None
-        self.create_export_bitmap_dialog()
-
-        self.manageSymbolsDialog = None
-        self.create_manage_knitting_symbols_dialog()
+        mark_phase("pattern canvas")
 
         self.initialize_symbol_widget(knittingSymbols)
+        self.initialize_symbol_watcher()
+        mark_phase("symbol widgets")
         self.initialize_color_widget()
         self.initialize_row_col_widget()
+        self.initialize_loading_progress()
 
         self._restore_window_settings()
 
@@ -142,6 +170,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         # set up all the connections
         self._set_up_connections()
+        mark_phase("main window connections")
 
         # nothing happened so far
         self._projectIsDirty = False
@@ -150,12 +179,10 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # if we have a recovery file.
         if fileName:
             (was_recovered, readFileName) = check_for_recovery_file(fileName)
-            if self._read_project(readFileName):
-                self.set_project_save_file(fileName)
-                self.update_recently_used_files(fileName)
-                self.canvas.clear_undo_stack()
-                if not was_recovered:
-                    self.mark_project_clean()
+            self._read_project(readFileName,
+                               partial(self._project_opened, fileName,
+                                       True, not was_recovered))
+            mark_phase("start reading project")
 
         # set up timers
         # NOTE: Needs to be last, otherwise some signals may not
@@ -187,6 +214,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.settings.symbol_selector_state = \
             self.SymbolSelectorSplitter.saveState()
 
+        self.settings.write_pending_settings()
+
 
 
     def _set_up_recently_used_files_menu(self):
@@ -286,10 +315,10 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                      self.canvas.toggle_pattern_grid_visibility)
 
         self.connect(self.actionShow_legend, SIGNAL("toggled(bool)"),
-                     self.exportBitmapDialog.update_dimensions)
+                     self.update_export_dimensions)
 
         self.connect(self.actionShow_pattern_grid, SIGNAL("toggled(bool)"),
-                     self.exportBitmapDialog.update_dimensions)
+                     self.update_export_dimensions)
 
         self.connect(self.actionZoom_In, SIGNAL("triggered()"),
                      self.graphicsView.zoom_in)
@@ -345,6 +374,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                      SIGNAL("triggered()"),
                      self.canvas.show_hidden_legend_items)
 
+        # diagnostic tools
+        self.menuTools.addSeparator()
+        commandProfilerAction = self.menuTools.addAction("Command Profiler")
+        self.connect(commandProfilerAction, SIGNAL("triggered()"),
+                     self.show_command_profiler)
+
+        paintProfilerAction = self.menuTools.addAction("Paint Profiler")
+        paintProfilerAction.setCheckable(True)
+        self.connect(paintProfilerAction, SIGNAL("toggled(bool)"),
+                     self.graphicsView.set_paint_profiling)
+
+        paintTraceAction = self.menuTools.addAction("Export Paint Trace...")
+        self.connect(paintTraceAction, SIGNAL("triggered()"),
+                     self.export_paint_trace)
+
+        memoryReportAction = self.menuTools.addAction("Memory Report...")
+        self.connect(memoryReportAction, SIGNAL("triggered()"),
+                     self.show_memory_report)
+
 
 
     def _set_up_resize_grid_connections(self):
@@ -369,7 +417,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
 
     def _set_up_preferences_connections(self):
-        """ Set up all connections for preferences dialog. """
+        """ Set up all connections for preferences dialog.
+
+        NOTE: This is called once the dialog is created on first use.
+
+        """
 
         self.connect(self.preferencesDialog,
                      SIGNAL("label_font_changed"),
@@ -476,15 +528,51 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                      self.set_project_dirty)
 
         self.connect(self.canvas, SIGNAL("row_repeat_added"),
-                     partial(self.preferencesDialog.allow_all_label_options,
-                             False))
+                     partial(self.allow_all_label_options, False))
 
         self.connect(self.canvas, SIGNAL("no_more_row_labels"),
-                     partial(self.preferencesDialog.allow_all_label_options,
-                             True))
+                     partial(self.allow_all_label_options, True))
 
         self.connect(self.canvas, SIGNAL("canvas_dimensions_changed"),
-                     self.exportBitmapDialog.update_dimensions)
+                     self.update_export_dimensions)
+
+        self.connect(self.settings, SIGNAL("setting_changed"),
+                     self.setting_changed)
+
+
+
+    def setting_changed(self, name, value):
+        """ React to changed settings the canvas does not pick
+        up by itself.
+
+        """
+
+        if name in ("renderCachePath", "renderCacheSize"):
+            set_icon_cache_path(self.settings.icon_cache_path)
+
+
+
+    def allow_all_label_options(self, status):
+        """ Keep track of whether all row label options are available
+        and forward the state to the preferences dialog if it exists.
+
+        """
+
+        self._allowAllLabelOptions = status
+        if self.preferencesDialog:
+            self.preferencesDialog.allow_all_label_options(status)
+
+
+
+    def update_export_dimensions(self, *args):
+        """ Update the export dialog with the current canvas
+        dimensions. If the dialog has not been created yet there is
+        nothing to do since it picks them up on creation.
+
+        """
+
+        if self.exportBitmapDialog:
+            self.exportBitmapDialog.update_dimensions()
 
 
 
@@ -500,7 +588,6 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self._set_up_help_connections()
 
         # internal connections
-        self._set_up_preferences_connections()
         self._set_up_misc_connections()
 
 
@@ -562,7 +649,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def _save_timed_recovery_file(self):
         """ Simple function that calls the saving routine. """
 
-        if self._recoveryFilePath:
+        # don't save partially loaded projects
+        if self._recoveryFilePath and not self.is_loading_project():
             self._save_pattern(self._recoveryFilePath, False)
 
 
@@ -595,9 +683,17 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         """
 
+        self.cancel_project_loading()
         if not self._ok_to_continue_without_saving():
             event.ignore()
         else:
+            # threads still parsing a canceled project must be
+            # done before they are destroyed with us
+            for readThread in self.findChildren(io.ReadThread):
+                readThread.wait()
+            for parseThread in self.findChildren(SymbolParseThread):
+                parseThread.wait()
+
             # before we exit save our settings
             self._save_settings()
 
@@ -684,6 +780,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                      SIGNAL("currentIndexChanged(QString)"),
                      self.update_symbol_widget)
 
+        # symbol search; the index is only built once the user
+        # starts searching
+        self._symbolTracker = symbolTracker
+        self.symbolIndex = None
+        self._symbolSearchResults = []
+        self.symbolSearchResults.hide()
+
+        self.connect(self.symbolSearchEdit,
+                     SIGNAL("textChanged(QString)"),
+                     self.search_symbols)
+
+        self.connect(self.symbolSearchEdit,
+                     SIGNAL("returnPressed()"),
+                     self.select_first_search_result)
+
+        self.connect(self.symbolSearchResults,
+                     SIGNAL("itemClicked(QListWidgetItem*)"),
+                     self.select_search_result)
+
 
         # this makes sure that the currently active symbol is unselected
         # when the users chooses a new category
@@ -691,25 +806,6 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                      SIGNAL("currentIndexChanged(QString)"),
                      partial(self.canvas.set_active_symbol, None))
 
-        # catch signals from custom symbol dialog in case a symbol
-        # changed
-        self.connect(self.manageSymbolsDialog,
-                     SIGNAL("symbol_added"),
-                     partial(self.refresh_symbol_widget_after_addition,
-                             symbolTracker))
-
-
-        self.connect(self.manageSymbolsDialog,
-                     SIGNAL("symbol_updated"),
-                     partial(self.refresh_symbol_widget_after_update,
-                             symbolTracker))
-
-
-        self.connect(self.manageSymbolsDialog,
-                     SIGNAL("symbol_deleted"),
-                     partial(self.refresh_symbol_widget_after_deletion,
-                             symbolTracker))
-
 
 
     def refresh_symbol_widget_after_update(self, synchronizer, newName,
@@ -746,24 +842,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """
 
         synchronizer.unselect()
-
-        widget = self.symbolSelector[categoryName]
-        numRowsLeft = remove_from_category_widget(widget, symbolName)
-
-        wListEntry = (symbolName, categoryName)
-        if wListEntry in self.symbolSelectorWidgets:
-            del self.symbolSelectorWidgets[wListEntry]
-
-            # check if we just deleted the last entry on the widget
-            # if so delete it
-            if numRowsLeft == 0:
-                del self.symbolSelector[categoryName]
-                chooserEntry = self.symbolCategoryChooser.findText(categoryName)
-                self.symbolCategoryChooser.removeItem(chooserEntry)
-        else:
-            message = ("Could not update symbolSelectorWidgets after "
-                       "deleting symbol.")
-            logger.error(message)
+        self._remove_from_symbol_library(symbolName, categoryName)
 
         # NOTE: We have no choice but to clear the undo cache
         # otherwise we're bound to have dangling pointers
@@ -784,26 +863,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         symbolPaths = misc.set_up_symbol_paths(self._topLevelPath,
                                                self.settings)
-        knittingSymbols = parser.parse_all_symbols(symbolPaths)
+        knittingSymbols = parser.parse_all_symbols(symbolPaths,
+                                    self.settings.symbol_cache_file)
         symbolsByCategory = symbols_by_category(knittingSymbols)
 
         if categoryName in symbolsByCategory:
             symbol = knittingSymbols[symbolName]
             synchronizer.unselect()
-
-            if categoryName in self.symbolSelector:
-                widget = self.symbolSelector[categoryName]
-                wList = add_to_category_widget(widget, symbol, synchronizer)
-            else:
-                symbols = symbolsByCategory[categoryName]
-                (widget, wList) = \
-                    generate_category_widget(categoryName, symbols, synchronizer)
-                self.symbolCategoryChooser.addItem(categoryName)
-                self.symbolSelector[categoryName] = widget
-
-            self.symbolSelectorWidgets = \
-                dict(list(self.symbolSelectorWidgets.items()) +
-                     list(wList.items()))
+            self._add_to_symbol_library(symbol)
 
         else:
             message = ("MainWindow: Problem updating symbol dialog\n"
@@ -814,6 +881,147 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
 
 
+    def _remove_from_symbol_library(self, symbolName, categoryName):
+        """ Remove a symbol from the symbol selector, the search
+        index and our symbol database.
+
+        """
+
+        wListEntry = (symbolName, categoryName)
+        if wListEntry in self.symbolSelectorWidgets:
+            numRowsLeft = self.symbolSelector.remove_symbol(symbolName,
+                                                            categoryName)
+
+            # check if we just deleted the last entry on the widget
+            # if so delete it
+            if numRowsLeft == 0:
+                del self.symbolSelector[categoryName]
+                chooserEntry = self.symbolCategoryChooser.findText(categoryName)
+                self.symbolCategoryChooser.removeItem(chooserEntry)
+        else:
+            message = ("Could not update symbolSelectorWidgets after "
+                       "deleting symbol.")
+            logger.error(message)
+
+        self._knittingSymbols.pop(symbolName, None)
+        if self.symbolIndex:
+            self.symbolIndex.remove(symbolName)
+
+
+
+    def _add_to_symbol_library(self, symbol):
+        """ Add a symbol to the symbol selector, the search index
+        and our symbol database.
+
+        """
+
+        # the svg may have changed under the same path
+        forget_symbol_svg(symbol["svgPath"])
+
+        # categories which were not built yet simply pick up
+        # the new symbol once they are
+        categoryName = symbol["category"]
+        isNewCategory = categoryName not in self.symbolSelector
+        self.symbolSelector.add_symbol(symbol)
+        if isNewCategory:
+            self.symbolCategoryChooser.addItem(categoryName)
+
+        self._knittingSymbols[symbol["name"]] = symbol
+        if self.symbolIndex:
+            self.symbolIndex.add(symbol)
+
+
+
+    def initialize_symbol_watcher(self):
+        """ Watch the symbol paths so symbols added, changed or
+        removed behind our back (e.g. in a shared library on a
+        network drive) are picked up without a restart.
+
+        """
+
+        symbolPaths = misc.set_up_symbol_paths(self._topLevelPath,
+                                               self.settings)
+        self.symbolWatcher = SymbolLibraryWatcher(symbolPaths, self)
+        self.connect(self.symbolWatcher, SIGNAL("symbols_changed"),
+                     self.update_symbol_library)
+
+
+
+    def update_symbol_library(self, changedSymbols):
+        """ This slot patches the symbol database and selector widgets
+        after the symbol watcher re-parsed the symbol directories
+        in changedSymbols (a dictionary mapping each directory to its
+        symbol or None).
+
+        NOTE: Changes made through the manage symbol dialog have
+        already been applied by the time they get here and are
+        therefore ignored.
+
+        """
+
+        symbolsByDir = {}
+        for symbol in self._knittingSymbols.values():
+            symbolDir = os.path.dirname(symbol["svgPath"])
+            symbolsByDir[symbolDir] = symbol
+
+        removedSymbols = []
+        addedSymbols = []
+        for (symbolDir, newSymbol) in sorted(changedSymbols.items()):
+            oldSymbol = symbolsByDir.get(symbolDir)
+
+            # an unchanged description means the svg image itself
+            # may have been edited
+            if oldSymbol and oldSymbol == newSymbol:
+                forget_symbol_svg(oldSymbol["svgPath"])
+                self.canvas.refresh_symbol(oldSymbol)
+                self.symbolDockWidget.update()
+                continue
+
+            if oldSymbol:
+                removedSymbols.append(oldSymbol)
+
+            if newSymbol:
+                if newSymbol["name"] in self._knittingSymbols and \
+                   self._knittingSymbols[newSymbol["name"]] is not oldSymbol:
+                    logger.warn("update_symbol_library: symbol %s in %s "
+                                "replaces a symbol of the same name" %
+                                (newSymbol["name"], symbolDir))
+                    removedSymbols.append(
+                            self._knittingSymbols[newSymbol["name"]])
+                addedSymbols.append(newSymbol)
+
+        if not (removedSymbols or addedSymbols):
+            return
+
+        activeWidget = self._symbolTracker.get_active_widget()
+        removedNames = set(symbol["name"] for symbol in removedSymbols)
+        if activeWidget and activeWidget.name in removedNames:
+            self._symbolTracker.unselect()
+            self.canvas.set_active_symbol(None)
+
+        # NOTE: As in refresh_symbol_widget_after_deletion the undo
+        # stack has to go, otherwise undo could bring back removed
+        # symbols
+        if removedSymbols:
+            self.recentlyUsedSymbolWidget.clear()
+            self.canvas.clear_undo_stack()
+
+        for symbol in removedSymbols:
+            self._remove_from_symbol_library(symbol["name"],
+                                             symbol["category"])
+
+        for symbol in addedSymbols:
+            self._add_to_symbol_library(symbol)
+            self.canvas.refresh_symbol(symbol)
+
+        changedNames = removedNames | set(symbol["name"] for symbol
+                                          in addedSymbols)
+        self.statusBar().showMessage("symbol library updated: %d "
+                                     "symbol(s) changed" %
+                                     len(changedNames), 3000)
+
+
+
     def update_symbol_widget(self, categoryName):
         """ Update the currently visible symbolWidgetSelector
 
@@ -828,6 +1036,72 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.selectedSymbol = self.symbolSelector[categoryName]
         self.symbolSelectorLayout.addWidget(self.selectedSymbol)
 
+        # keep showing search results until the search is cleared
+        isSearching = bool(self.symbolSearchEdit.text().strip())
+        self.selectedSymbol.setVisible(not isSearching)
+
+
+
+    def search_symbols(self, text):
+        """ Show the symbols matching text in place of the current
+        symbolSelectorWidget. An empty search restores the latter.
+
+        """
+
+        text = text.strip()
+        self.symbolSearchResults.clear()
+        if not text:
+            self._symbolSearchResults = []
+            self.symbolSearchResults.hide()
+            self.selectedSymbol.show()
+            return
+
+        if self.symbolIndex is None:
+            self.symbolIndex = SymbolIndex(self._knittingSymbols.values())
+
+        self._symbolSearchResults = self.symbolIndex.search(text)
+        maxWidth = 1
+        for symbol in self._symbolSearchResults:
+            width = int(symbol["width"])
+            maxWidth = max(maxWidth, width)
+            icon = QIcon(symbol_pixmap(symbol, width * 20, 20))
+            self.symbolSearchResults.addItem(QListWidgetItem(icon,
+                        "%s (%s)" % (symbol["name"], symbol["category"])))
+        self.symbolSearchResults.setIconSize(QSize(maxWidth * 20, 20))
+
+        self.selectedSymbol.hide()
+        self.symbolSearchResults.show()
+
+
+
+    def select_first_search_result(self):
+        """ Select the best match of the current search. """
+
+        if self.symbolSearchResults.count() > 0:
+            self.select_search_result(self.symbolSearchResults.item(0))
+
+
+
+    def select_search_result(self, item):
+        """ Activate the symbol corresponding to the search result
+        item in its symbolSelectorWidget and end the search.
+
+        """
+
+        symbol = self._symbolSearchResults[self.symbolSearchResults.row(item)]
+        key = (symbol["name"], symbol["category"])
+        if key not in self.symbolSelectorWidgets:
+            return
+
+        self.symbolSearchEdit.clear()
+        chooserEntry = self.symbolCategoryChooser.findText(symbol["category"])
+        self.symbolCategoryChooser.setCurrentIndex(chooserEntry)
+
+        selectorItem = self.symbolSelectorWidgets[key]
+        if self._symbolTracker.get_active_widget() != selectorItem:
+            selectorItem.click_me()
+        self.selectedSymbol.ensureWidgetVisible(selectorItem)
+
 
 
     def initialize_color_widget(self):
@@ -875,12 +1149,18 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         rowLabel = QLabel("row:")
 
         self.columnCounter = QLabel("NA")
-        self.connect(self.canvas, SIGNAL("col_count_changed"),
-                     (lambda x: self.columnCounter.setText(str(x))))
-
         self.rowCounter = QLabel("NA")
-        self.connect(self.canvas, SIGNAL("row_count_changed"),
-                     (lambda x: self.rowCounter.setText(str(x))))
+
+        # the counters are refreshed at most once per display frame
+        self._cellPosition = ("NA", "NA")
+        self._cellPositionTimer = QTimer(self)
+        self._cellPositionTimer.setSingleShot(True)
+        self._cellPositionTimer.setInterval(COUNTER_UPDATE_INTERVAL)
+        self.connect(self._cellPositionTimer, SIGNAL("timeout()"),
+                     self.update_row_col_counter)
+
+        self.connect(self.canvas, SIGNAL("cell_position_changed"),
+                     self.cell_position_changed)
 
         layout = QHBoxLayout()
         layout.addWidget(colLabel)
@@ -894,6 +1174,27 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
 
 
+    def cell_position_changed(self, column, row):
+        """ Record the cell under the mouse pointer and schedule an
+        update of the row/column counter.
+
+        """
+
+        self._cellPosition = (column, row)
+        if not self._cellPositionTimer.isActive():
+            self._cellPositionTimer.start()
+
+
+
+    def update_row_col_counter(self):
+        """ Show the most recently reported cell position. """
+
+        (column, row) = self._cellPosition
+        self.columnCounter.setText(str(column))
+        self.rowCounter.setText(str(row))
+
+
+
     def show_sconcho_manual(self):
         """ Show the sconcho manual. """
 
@@ -1157,9 +1458,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if not self._ok_to_continue_without_saving():
             return
 
-        if self._read_project(readFilePath):
-            self.set_project_save_file(readFilePath)
-            self.mark_project_clean()
+        self._read_project(readFilePath,
+                           partial(self._project_opened, readFilePath,
+                                   False, True))
 
 
 
@@ -1181,42 +1482,109 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             return
 
         self.settings.export_path = QFileInfo(readFilePath).absolutePath()
-        if self._read_project(readFilePath):
-            self.set_project_save_file(readFilePath)
-            self.update_recently_used_files(readFilePath)
-            self.mark_project_clean()
+        self._read_project(readFilePath,
+                           partial(self._project_opened, readFilePath,
+                                   True, True))
 
 
 
-    def _read_project(self, readFilePath):
+    def _read_project(self, readFilePath, onSuccess):
         """ This function does the hard work for opening a
         sconcho project file.
 
+        The file is parsed in a separate thread and the canvas is
+        then built in small batches so the window stays responsive.
+        onSuccess is called once the project is fully loaded.
+
+        """
+
+        self.cancel_project_loading()
+
+        readFileName = QFileInfo(readFilePath).fileName()
+        self._show_loading_progress("opening " + readFileName)
+
+        readThread = io.ReadThread(readFilePath, self)
+        self._projectReader = readThread
+        self.connect(readThread, SIGNAL("finished()"),
+                     readThread, SLOT("deleteLater()"))
+        self.connect(readThread, SIGNAL("reading_done"),
+                     partial(self._project_file_read, readThread,
+                             readFilePath, onSuccess))
+        readThread.start()
+
+
+
+    def _project_file_read(self, readThread, readFilePath, onSuccess,
+                           recordedSettings, result):
+        """ This method is called after the ReadThread is finished
+        and starts building the canvas from the parsed project.
+
         """
 
+        # ignore results of canceled reads
+        if readThread is not self._projectReader:
+            return
+        self._projectReader = None
+
         (status, errMsg, patternGridItems, legendItems, colors,
          activeItem, patternRepeats, repeatLegends, rowRepeats,
-         textItems, rowLabels, columnLabels) = \
-                 io.read_project(self.settings, readFilePath)
-
+         textItems, rowLabels, columnLabels) = result
 
         if not status:
+            self._end_project_loading()
             logger.error(msg.errorOpeningProjectTitle)
             QMessageBox.critical(self, msg.errorOpeningProjectTitle,
                                  errMsg, QMessageBox.Close)
-            return False
-
-        # add newly loaded project
-        if not self.canvas.load_previous_pattern(self._knittingSymbols,
-                                                 patternGridItems,
-                                                 #legendItems,
-                                                 patternRepeats,
-                                                 repeatLegends,
-                                                 rowRepeats,
-                                                 textItems,
-                                                 rowLabels,
-                                                 columnLabels):
-            return False
+            return
+
+        recordedSettings.apply(self.settings)
+
+        # the part of the chart currently in view is built first
+        viewport = self.graphicsView.viewport().rect()
+        visibleRect = self.graphicsView.mapToScene(viewport).boundingRect()
+        builder = self.canvas.pattern_builder(self._knittingSymbols,
+                                              patternGridItems,
+                                              legendItems,
+                                              patternRepeats,
+                                              repeatLegends,
+                                              rowRepeats,
+                                              textItems,
+                                              rowLabels,
+                                              columnLabels,
+                                              visibleRect)
+        if builder == None:
+            self._end_project_loading()
+            return
+
+        self._projectLoader = ProjectLoader(builder, self)
+        self.connect(self._projectLoader, SIGNAL("loading_progress"),
+                     self.update_loading_progress)
+        self.connect(self._projectLoader, SIGNAL("loading_done"),
+                     partial(self._project_loaded, readFilePath, colors,
+                             onSuccess))
+        self._projectLoader.start()
+
+
+
+    def _project_loaded(self, readFilePath, colors, onSuccess, status):
+        """ This method is called once the canvas is built or
+        loading was canceled.
+
+        """
+
+        self._projectLoader = None
+        self._end_project_loading()
+
+        readFileName = QFileInfo(readFilePath).fileName()
+        if not status:
+            # the old project is gone already and the partially
+            # built one is of no use, so start over with a blank one
+            self.clear_project_save_file()
+            self.canvas.create_new_canvas()
+            self.mark_project_clean()
+            self.statusBar().showMessage("canceled opening " + readFileName,
+                                         3000)
+            return
 
         set_up_colors(self.colorWidget, colors)
         self.recentlyUsedSymbolWidget.clear()
@@ -1224,19 +1592,134 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         #                               activeItem)
 
         # provide feedback in statusbar
-        readFileName = QFileInfo(readFilePath).fileName()
         self.emit(SIGNAL("update_preferences"))
         self.statusBar().showMessage("successfully opened " + readFileName,
                                      3000)
-        return True
+        onSuccess()
+
+
+
+    def _project_opened(self, filePath, updateRecentlyUsed, markClean):
+        """ Finish opening the project at filePath. """
+
+        self.set_project_save_file(filePath)
+        if updateRecentlyUsed:
+            self.update_recently_used_files(filePath)
+        if markClean:
+            self.mark_project_clean()
+
+
+
+    def is_loading_project(self):
+        """ Returns True while a project is being read or built. """
+
+        return self._projectReader != None or self._projectLoader != None
+
+
+
+    def cancel_project_loading(self):
+        """ Cancel reading or building the current project if any.
+
+        NOTE: A thread parsing the project can not be interrupted;
+        it finishes in the background and its result is ignored.
+
+        """
+
+        if self._projectReader:
+            self._projectReader = None
+            self._end_project_loading()
+            self.statusBar().showMessage("canceled opening project", 3000)
+
+        if self._projectLoader:
+            self._projectLoader.cancel()
+
+
+
+    def initialize_loading_progress(self):
+        """ Initialize the progress bar and cancel button shown
+        in the statusbar while a project is loading.
+
+        """
+
+        self._projectReader = None
+        self._projectLoader = None
+
+        self.loadingProgressBar = QProgressBar()
+        self.loadingProgressBar.setMaximumWidth(200)
+        self.loadingCancelButton = QPushButton("Cancel")
+        self.connect(self.loadingCancelButton, SIGNAL("clicked()"),
+                     self.cancel_project_loading)
+
+        self.statusBar().addPermanentWidget(self.loadingProgressBar)
+        self.statusBar().addPermanentWidget(self.loadingCancelButton)
+        self.loadingProgressBar.hide()
+        self.loadingCancelButton.hide()
+
+
+
+    def update_loading_progress(self, numDone, numTotal):
+        """ Show that numDone out of numTotal items are loaded. """
+
+        self.loadingProgressBar.setRange(0, numTotal)
+        self.loadingProgressBar.setValue(numDone)
+
+
+
+    def _show_loading_progress(self, message):
+        """ Show the loading progress and lock everything that
+        could change the canvas while it is being built.
+
+        """
+
+        # busy indicator until we know how many items there are
+        self.loadingProgressBar.setRange(0, 0)
+        self.loadingProgressBar.show()
+        self.loadingCancelButton.show()
+        self.statusBar().showMessage(message)
+
+        self.menuBar().setEnabled(False)
+        self.toolBar.setEnabled(False)
+        self.toolBar_2.setEnabled(False)
+        self.graphicsView.setInteractive(False)
+
+
+
+    def _end_project_loading(self):
+        """ Hide the loading progress and announce that loading
+        the project is over, whether it succeeded or not.
+
+        """
+
+        self._hide_loading_progress()
+        mark_phase("read project")
+        self.emit(SIGNAL("project_loading_done"))
+
+
+
+    def _hide_loading_progress(self):
+        """ Hide the loading progress and unlock the canvas. """
+
+        self.loadingProgressBar.hide()
+        self.loadingCancelButton.hide()
+        self.statusBar().clearMessage()
+
+        self.menuBar().setEnabled(True)
+        self.toolBar.setEnabled(True)
+        self.toolBar_2.setEnabled(True)
+        self.graphicsView.setInteractive(True)
 
 
 
     def create_export_bitmap_dialog(self):
-        """ Create export bitmap dialog. """
+        """ Create export bitmap dialog if it does not exist yet. """
+
+        if self.exportBitmapDialog:
+            return
 
         self.exportBitmapDialog = \
             ExportBitmapDialog(self.canvas, self._saveFilePath, self)
+        if self._saveFilePath:
+            self.exportBitmapDialog.update_export_path(self._saveFilePath)
 
         self.connect(self.exportBitmapDialog, SIGNAL("export_pattern"),
                      partial(io.export_scene, self.canvas),
@@ -1249,6 +1732,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def export_pattern_dialog(self):
         """ This function opens and export pattern dialog. """
 
+        self.create_export_bitmap_dialog()
         self.exportBitmapDialog.raise_()
         self.exportBitmapDialog.show()
 
@@ -1285,9 +1769,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
 
 
+    def create_preferences_dialog(self):
+        """ Create the preferences dialog if it does not exist yet. """
+
+        if self.preferencesDialog:
+            return
+
+        self.preferencesDialog = PreferencesDialog(self.settings, self)
+        if not self._allowAllLabelOptions:
+            self.preferencesDialog.allow_all_label_options(False)
+
+        self._set_up_preferences_connections()
+
+
+
     def open_preferences_dialog(self):
         """ Open the preferences dialog. """
 
+        self.create_preferences_dialog()
         self.preferencesDialog.raise_()
         self.preferencesDialog.show()
 
@@ -1299,26 +1798,109 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         """
 
+        self.create_manage_knitting_symbols_dialog()
         self.manageSymbolsDialog.raise_()
         self.manageSymbolsDialog.show()
 
 
 
     def create_manage_knitting_symbols_dialog(self):
-        """ Create the manage knitting symbols dialog.
+        """ Create the manage knitting symbols dialog if it does
+        not exist yet and connect it to the symbol widgets.
 
-        NOTE: We create this widget at program startup so we can
-        install a signal between it and the main window for updating
-        the symbols widget.
+        """
+
+        if self.manageSymbolsDialog:
+            return
+
+        sortedSymbols = symbols_by_category(self._knittingSymbols)
+        symbolCategories = sortedSymbols.keys()
+        personalSymbolPath = self.settings.personalSymbolPath.value
+        self.manageSymbolsDialog = \
+            ManageSymbolDialog(personalSymbolPath, symbolCategories,
+                    self.settings.normalizeCustomSymbols.value, self)
+
+        # catch signals from custom symbol dialog in case a symbol
+        # changed
+        self.connect(self.manageSymbolsDialog,
+                     SIGNAL("symbol_added"),
+                     partial(self.refresh_symbol_widget_after_addition,
+                             self._symbolTracker))
+
+        self.connect(self.manageSymbolsDialog,
+                     SIGNAL("symbol_updated"),
+                     partial(self.refresh_symbol_widget_after_update,
+                             self._symbolTracker))
+
+        self.connect(self.manageSymbolsDialog,
+                     SIGNAL("symbol_deleted"),
+                     partial(self.refresh_symbol_widget_after_deletion,
+                             self._symbolTracker))
+
+
+
+    def show_command_profiler(self):
+        """ Show the command profiler dock, creating it on first use.
+
+        NOTE: Commands are only instrumented once recording is
+        turned on in the dock.
 
         """
 
-        if not self.manageSymbolsDialog:
-            sortedSymbols = symbols_by_category(self._knittingSymbols)
-            symbolCategories = sortedSymbols.keys()
-            personalSymbolPath = self.settings.personalSymbolPath.value
-            self.manageSymbolsDialog = \
-                ManageSymbolDialog(personalSymbolPath, symbolCategories, self)
+        if not self.commandProfilerDock:
+            self.commandProfiler = CommandProfiler(self.canvas, parent = self)
+            self.commandProfilerDock = \
+                CommandProfilerDock(self.commandProfiler, self)
+            self.addDockWidget(Qt.BottomDockWidgetArea,
+                               self.commandProfilerDock)
+
+        self.commandProfilerDock.show()
+        self.commandProfilerDock.raise_()
+
+
+
+    def show_memory_report(self):
+        """ Show an estimate of the memory used by the canvas. """
+
+        if not self.memoryReportDialog:
+            self.memoryReportDialog = MemoryReportDialog(self.canvas, self)
+        else:
+            self.memoryReportDialog.refresh()
+
+        self.memoryReportDialog.show()
+        self.memoryReportDialog.raise_()
+
+
+
+    def export_paint_trace(self):
+        """ Save the frames recorded by the paint profiler as CSV. """
+
+        profiler = self.graphicsView.paintProfiler
+        if not profiler or not profiler.trace:
+            QMessageBox.information(self, msg.exportPaintTraceTitle,
+                                    msg.noPaintTraceText)
+            return
+
+        location = self.settings.export_path + "/paint_trace.csv"
+        traceFilePath = \
+             QFileDialog.getSaveFileName(self,
+                                         msg.exportPaintTraceTitle,
+                                         location,
+                                         ("csv files (*.csv);;"
+                                          "all files (*.*)"))
+        if not traceFilePath:
+            return
+
+        (status, errMsg) = profiler.write_csv(traceFilePath)
+        if not status:
+            logger.error(msg.errorExportingPaintTraceText % errMsg)
+            QMessageBox.critical(self, msg.exportPaintTraceTitle,
+                                 msg.errorExportingPaintTraceText % errMsg,
+                                 QMessageBox.Close)
+            return
+
+        self.statusBar().showMessage("paint trace written to " +
+                                     traceFilePath, 3000)
 
 
 
@@ -1328,7 +1910,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self._saveFilePath = fileName
         self.setWindowTitle(QApplication.applicationName() + ": " \
                             + QFileInfo(fileName).fileName() + "[*]")
-        self.exportBitmapDialog.update_export_path(fileName)
+        if self.exportBitmapDialog:
+            self.exportBitmapDialog.update_export_path(fileName)
 
         # store location as export path
         self.settings.export_path = QFileInfo(fileName).absolutePath()
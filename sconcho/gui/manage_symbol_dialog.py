@@ -35,6 +35,7 @@ from PyQt4.QtGui import (QDialog,
                          QInputDialog,
                          QLineEdit,
                          QMessageBox,
+                         QProgressDialog,
                          QTreeWidgetItem)
 
 from PyQt4.QtSvg import (QSvgWidget)
@@ -51,10 +52,15 @@ import sconcho.gui.symbol_widget as symbolWidget
 
 from sconcho.util.io import (readSymbolZip,
                              writezip)
+from sconcho.util.svg_normalizer import (normalize_report,
+                                         normalize_svg)
 
 # module lever logger:
 logger = logging.getLogger(__name__)
 
+# maximum number of problems listed after a symbol import
+MAX_REPORTED_IMPORT_PROBLEMS = 20
+
 
 ##########################################################################
 #
@@ -69,8 +75,14 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
     UPDATE_DELETE_ACTION = 2
 
 
-    def __init__(self, symbolPath, symbolCategories, parent = None):
-        """ Initialize the dialog. """
+    def __init__(self, symbolPath, symbolCategories, normalizeSvg = False,
+                 parent = None):
+        """ Initialize the dialog. 
+
+        If normalizeSvg is True the svg images of new symbols are
+        normalized before they are added.
+
+        """
 
         super(ManageSymbolDialog, self).__init__(parent)
         self.setupUi(self)
@@ -82,6 +94,7 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
         self._activeAction     = None
         self._selectedSymbol   = None
         self._symbolCategories = sorted(symbolCategories)
+        self._normalizeSvg     = normalizeSvg
 
         # main setup
         self._populate_category_chooser()
@@ -426,7 +439,7 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
 
         if data:
             with SymbolTempDir(self._symbolPath) as tempDir:
-                if (create_new_symbol(tempDir, data)
+                if (create_new_symbol(tempDir, data, self._normalizeSvg)
                     and remove_symbol(self._symbolPath, oldSvgName)
                     and move_symbol(tempDir + "/" + data["svgName"],
                                     self._symbolPath + "/"
@@ -490,7 +503,7 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
                                  QMessageBox.Close)
             return
 
-        if create_new_symbol(self._symbolPath, data):
+        if create_new_symbol(self._symbolPath, data, self._normalizeSvg):
             self._update_dict(data)
             self._add_symbol_to_tree_widget(data)
             self.availableSymbolsWidget.setDisabled(False)
@@ -602,7 +615,12 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
 
         # add svg image and scale as requested by width spinbox
         # we have to check if loading of the svg succeeded
-        self.svgWidget.load(filePath)
+        if self._normalizeSvg:
+            if not self._load_normalized_svg(filePath):
+                return
+        else:
+            self.svgWidget.load(filePath)
+
         if self.svgWidget.renderer().isValid():
             self._svgFilePath = filePath
             self.svgPathEdit.setText(filePath)
@@ -611,6 +629,37 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
 
 
 
+    def _load_normalized_svg(self, filePath):
+        """ Preview the normalized version of the svg image at
+        filePath and report how normalization affects its render
+        time. Returns False if the image can not be used.
+
+        """
+
+        try:
+            with open(filePath, "rb") as handle:
+                data = handle.read()
+        except (IOError, OSError) as e:
+            logger.error(msg.svgNormalizeReadError % (filePath, e))
+            return False
+
+        (status, result) = normalize_svg(data)
+        if not status:
+            QMessageBox.critical(self, msg.failedToNormalizeSvgTitle,
+                                 result, QMessageBox.Close)
+            return False
+
+        size = ManageSymbolDialog.SYMBOL_SIZE
+        report = normalize_report(data, result,
+                                  size * self.symbolWidthSpinner.value(),
+                                  size)
+        logger.info("normalized svg image %s -- %s" % (filePath, report))
+        self.svgWidget.setToolTip(report)
+        self.svgWidget.load(QByteArray(result))
+        return True
+
+
+
     def rescale_svg_item(self, item, width):
         """ Rescales the svg image if a user changes the symbol width. """
 
@@ -648,8 +697,29 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
                                             "zip files (*.zip)")
 
         if importFilePath:
-            if not readSymbolZip(self._symbolPath, importFilePath):
-
+            progressDialog = QProgressDialog(msg.importingSymbolsText,
+                                             "Cancel", 0, 0, self)
+            progressDialog.setWindowModality(Qt.WindowModal)
+            progressDialog.setMinimumDuration(500)
+
+            (status, importedSymbols, problems) = \
+                readSymbolZip(self._symbolPath, importFilePath,
+                              partial(update_import_progress, 
+                                      progressDialog),
+                              self._normalizeSvg)
+            progressDialog.close()
+
+            if problems:
+                shownProblems = problems[:MAX_REPORTED_IMPORT_PROBLEMS]
+                if len(problems) > len(shownProblems):
+                    shownProblems.append("...")
+                QMessageBox.critical(self,
+                                     msg.cannotImportSymbolsTitle,
+                                     msg.symbolImportProblemsText %
+                                     (len(importedSymbols),
+                                      "<br>".join(shownProblems)),
+                                     QMessageBox.Ok)
+            elif not status:
                 QMessageBox.critical(self,
                                      msg.cannotImportSymbolsTitle,
                                      msg.cannotImportSymbolsText,
@@ -670,6 +740,18 @@ class ManageSymbolDialog(QDialog, Ui_ManageKnittingSymbolDialog):
 #
 ###########################################################################
 
+def update_import_progress(progressDialog, numDone, numTotal):
+    """ Progress callback for readSymbolZip. Returns False if the
+    user canceled the import.
+
+    """
+
+    progressDialog.setMaximum(numTotal)
+    progressDialog.setValue(numDone)
+    return not progressDialog.wasCanceled()
+
+
+
 def generate_svg_path(symbolTopDir, symbol):
     """ Generates the path to the svg image for the given symbol."""
 
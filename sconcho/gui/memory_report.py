@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import logging
+import math
+import sys
+import types
+
+from collections import deque
+
+from PyQt4.QtCore import SIGNAL
+
+from PyQt4.QtGui import (QDialog,
+                         QFont,
+                         QGraphicsItem,
+                         QHBoxLayout,
+                         QPixmapCache,
+                         QPlainTextEdit,
+                         QPushButton,
+                         QVBoxLayout)
+
+from sconcho.util.symbol_svg import symbol_svg_data
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+# objects we never descend into while sizing python objects
+OPAQUE_TYPES = (type,
+                types.ModuleType,
+                types.FunctionType,
+                types.MethodType,
+                types.BuiltinFunctionType)
+
+# undo commands created by beginMacro have no python class of
+# their own
+MACRO_COMMAND = "macro"
+
+# bytes per pixel of the item cache pixmaps
+BYTES_PER_PIXEL = 4
+
+
+
+def canvas_memory_report(canvas):
+    """ Returns an estimate of the memory used by canvas as a
+    dictionary of plain python types, i.e., it can be written
+    as JSON as is. All sizes are in bytes.
+
+      items          : count, python and cache bytes by item class
+      renderers      : number of shared symbol renderers in use and
+                       the size of their svg data
+      undoStack      : number and bytes of undo records by class
+      copySelection  : number and bytes of copied cells
+      pixmapCacheLimit : item caches beyond this are evicted by Qt
+      totalBytes     : all of the above, with the item caches
+                       capped at pixmapCacheLimit
+
+    Python bytes are measured with sys.getsizeof and cover the
+    python wrappers and their attributes, not the C++ side of Qt
+    objects. Cache bytes are the size of the item cache pixmaps
+    at the current zoom level; only items painted so far actually
+    have one and Qt never keeps more than pixmapCacheLimit.
+
+    Every object is accounted for once. Items on the canvas are
+    sized first, then the copy selection, then the undo stack; an
+    item removed from the canvas but still referenced by the copy
+    selection and an undo record is counted for the former.
+
+    """
+
+    zoom = 1.0
+    views = canvas.views()
+    if views:
+        zoom = views[0].transform().m11()
+
+    sceneItems = canvas.items()
+
+    # objects shared by all items which don't belong to any of them
+    seen = set([id(canvas), id(canvas.settings)])
+    symbols = {}
+    for item in sceneItems:
+        seen.add(id(item))
+        symbol = getattr(item, "symbol", None)
+        if isinstance(symbol, dict) and "svgPath" in symbol:
+            seen.add(id(symbol))
+            symbols[symbol["svgPath"]] = symbol
+
+    items = {}
+    for item in sceneItems:
+        entry = items.setdefault(type(item).__name__,
+                                 { "count" : 0, "bytes" : 0,
+                                   "cacheBytes" : 0 })
+        entry["count"] += 1
+        seen.discard(id(item))
+        entry["bytes"] += python_size(item, seen)
+        entry["cacheBytes"] += item_cache_size(item, zoom)
+
+    renderers = { "count" : len(symbols), "bytes" : 0 }
+    for symbol in symbols.values():
+        data = symbol_svg_data(symbol)
+        if data is not None:
+            renderers["bytes"] += data.size()
+
+    copySelection = { "count" : len(canvas._copySelection),
+                      "bytes" : python_size(canvas._copySelection, seen) }
+
+    undoStack = { "count" : 0, "bytes" : 0, "largest" : 0,
+                  "commands" : {} }
+    for index in range(canvas._undoStack.count()):
+        command = canvas._undoStack.command(index)
+        name = type(command).__name__
+        if command.childCount() > 0:
+            name = MACRO_COMMAND
+        numBytes = undo_command_size(command, seen)
+
+        entry = undoStack["commands"].setdefault(name, { "count" : 0,
+                                                         "bytes" : 0 })
+        entry["count"] += 1
+        entry["bytes"] += numBytes
+        undoStack["count"] += 1
+        undoStack["bytes"] += numBytes
+        undoStack["largest"] = max(undoStack["largest"], numBytes)
+
+    # Qt evicts item caches beyond the pixmap cache limit
+    pixmapCacheLimit = QPixmapCache.cacheLimit() * 1024
+    cacheBytes = min(sum(entry["cacheBytes"] for entry in items.values()),
+                     pixmapCacheLimit)
+    totalBytes = sum(entry["bytes"] for entry in items.values()) + \
+                 cacheBytes + renderers["bytes"] + undoStack["bytes"] + \
+                 copySelection["bytes"]
+
+    return { "zoom" : zoom,
+             "items" : items,
+             "renderers" : renderers,
+             "undoStack" : undoStack,
+             "copySelection" : copySelection,
+             "pixmapCacheLimit" : pixmapCacheLimit,
+             "totalBytes" : totalBytes }
+
+
+
+def python_size(obj, seen):
+    """ Returns the bytes used by obj and everything reachable
+    via its attributes and containers, skipping the objects whose
+    id is in seen. Everything sized is added to seen.
+
+    """
+
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, OPAQUE_TYPES):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+
+        attributes = getattr(obj, "__dict__", None)
+        if isinstance(attributes, dict):
+            stack.append(attributes)
+
+    return size
+
+
+
+def undo_command_size(command, seen):
+    """ Returns the bytes used by command including all its child
+    commands.
+
+    """
+
+    size = python_size(command, seen)
+    for index in range(command.childCount()):
+        size += undo_command_size(command.child(index), seen)
+
+    return size
+
+
+
+def item_cache_size(item, zoom):
+    """ Returns the size of the cache pixmap of item at the given
+    zoom level or 0 if item isn't cached.
+
+    """
+
+    cacheMode = item.cacheMode()
+    if cacheMode == QGraphicsItem.NoCache:
+        return 0
+
+    if cacheMode == QGraphicsItem.ItemCoordinateCache:
+        zoom = 1.0
+
+    rect = item.boundingRect()
+    return int(math.ceil(rect.width() * zoom) *
+               math.ceil(rect.height() * zoom)) * BYTES_PER_PIXEL
+
+
+
+def format_memory_report(report):
+    """ Returns report as a human readable table. """
+
+    kib = lambda numBytes: numBytes / 1024.0
+
+    lines = ["canvas memory footprint at zoom %.2f (estimated)" %
+             report["zoom"], "",
+             "%-22s %9s %13s %13s" % ("item class", "count",
+                                      "python KiB", "cache KiB")]
+    items = report["items"]
+    for name in sorted(items, key = lambda name: -items[name]["bytes"]):
+        entry = items[name]
+        lines.append("%-22s %9d %13.1f %13.1f" %
+                     (name, entry["count"], kib(entry["bytes"]),
+                      kib(entry["cacheBytes"])))
+    lines.append("%-22s %9d %13.1f %13.1f" %
+                 ("all items", sum(e["count"] for e in items.values()),
+                  kib(sum(e["bytes"] for e in items.values())),
+                  kib(sum(e["cacheBytes"] for e in items.values()))))
+    lines.append("(Qt keeps at most %.0f KiB of item caches)" %
+                 kib(report["pixmapCacheLimit"]))
+
+    renderers = report["renderers"]
+    copySelection = report["copySelection"]
+    undoStack = report["undoStack"]
+    lines += ["",
+              "%-22s %9d %13.1f   svg data" %
+              ("symbol renderers", renderers["count"],
+               kib(renderers["bytes"])),
+              "%-22s %9d %13.1f" %
+              ("copy selection", copySelection["count"],
+               kib(copySelection["bytes"])),
+              "%-22s %9d %13.1f   largest record %.1f KiB" %
+              ("undo stack", undoStack["count"], kib(undoStack["bytes"]),
+               kib(undoStack["largest"]))]
+
+    commands = undoStack["commands"]
+    for name in sorted(commands, key = lambda name: -commands[name]["bytes"]):
+        lines.append("  %-20s %9d %13.1f" %
+                     (name, commands[name]["count"],
+                      kib(commands[name]["bytes"])))
+
+    lines += ["", "%-22s %9s %13.1f" % ("total", "",
+                                        kib(report["totalBytes"]))]
+
+    return "\n".join(lines)
+
+
+
+##########################################################################
+#
+# debug dialog showing the memory report of a canvas
+#
+##########################################################################
+class MemoryReportDialog(QDialog):
+
+
+    def __init__(self, canvas, parent = None):
+
+        super(MemoryReportDialog, self).__init__(parent)
+
+        self.canvas = canvas
+        self.setWindowTitle("sconcho: Memory Report")
+
+        self.reportView = QPlainTextEdit()
+        self.reportView.setReadOnly(True)
+        self.reportView.setLineWrapMode(QPlainTextEdit.NoWrap)
+        font = QFont("Monospace", 9)
+        font.setStyleHint(QFont.TypeWriter)
+        self.reportView.setFont(font)
+
+        refreshButton = QPushButton("refresh")
+        logButton = QPushButton("write to log")
+        closeButton = QPushButton("close")
+
+        buttonLayout = QHBoxLayout()
+        buttonLayout.addWidget(refreshButton)
+        buttonLayout.addWidget(logButton)
+        buttonLayout.addStretch()
+        buttonLayout.addWidget(closeButton)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.reportView)
+        layout.addLayout(buttonLayout)
+        self.setLayout(layout)
+        self.resize(640, 480)
+
+        self.connect(refreshButton, SIGNAL("clicked()"), self.refresh)
+        self.connect(logButton, SIGNAL("clicked()"), self.write_to_log)
+        self.connect(closeButton, SIGNAL("clicked()"), self.close)
+
+        self.refresh()
+
+
+
+    def refresh(self):
+        """ Measure the canvas again. """
+
+        self.reportView.setPlainText(
+            format_memory_report(canvas_memory_report(self.canvas)))
+
+
+
+    def write_to_log(self):
+        """ Write the report shown to the log. """
+
+        logger.info("canvas memory report\n%s" %
+                    self.reportView.toPlainText())
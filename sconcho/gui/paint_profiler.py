@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import csv
+import logging
+import time
+
+from collections import deque
+
+from sconcho.gui.pattern_canvas_objects import (PatternGridItem,
+                                                PatternHighlightItem,
+                                                PatternLabelItem,
+                                                PatternLegendText,
+                                                PatternRepeatItem)
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+# item classes the paint time is broken down by; everything
+# else is accounted for as "other"
+PROFILED_ITEM_CLASSES = (PatternGridItem,
+                         PatternHighlightItem,
+                         PatternLabelItem,
+                         PatternLegendText,
+                         PatternRepeatItem)
+OTHER_ITEMS = "other"
+
+# number of frames kept for the CSV trace
+MAX_TRACE_FRAMES = 10000
+
+# frames per second are averaged over this many seconds
+FPS_WINDOW = 1.0
+
+
+
+##########################################################################
+#
+# Collects the time spent painting each frame of a PatternView and
+# how much of it went into each class of items. The view reports the
+# beginning and end of each frame and the time spent on every item
+# painted in between.
+#
+##########################################################################
+class PaintProfiler(object):
+
+
+    def __init__(self):
+
+        self.classNames = [itemClass.__name__ for itemClass
+                           in PROFILED_ITEM_CLASSES] + [OTHER_ITEMS]
+        self.trace = deque(maxlen = MAX_TRACE_FRAMES)
+
+        self._frameTimes = deque()
+        self._frameStart = None
+        self._itemTimes = {}
+        self._itemCounts = {}
+        self._classCache = {}
+
+
+
+    def begin_frame(self):
+        """ Start timing a new frame. """
+
+        self._itemTimes = dict.fromkeys(self.classNames, 0.0)
+        self._itemCounts = dict.fromkeys(self.classNames, 0)
+        self._frameStart = time.perf_counter()
+
+
+
+    def add_item_time(self, item, duration):
+        """ Account duration seconds of painting to item's class. """
+
+        name = self._class_name(type(item))
+        self._itemTimes[name] += duration
+        self._itemCounts[name] += 1
+
+
+
+    def end_frame(self):
+        """ Finish timing the current frame. """
+
+        now = time.perf_counter()
+        frameTime = now - self._frameStart
+
+        self._frameTimes.append(now)
+        while now - self._frameTimes[0] > FPS_WINDOW:
+            self._frameTimes.popleft()
+
+        self.trace.append((time.time(), frameTime, self._itemTimes,
+                           self._itemCounts))
+
+
+
+    @property
+    def frames_per_second(self):
+        """ Returns the number of frames painted during the
+        last FPS_WINDOW seconds.
+
+        """
+
+        if not self._frameTimes or \
+           time.perf_counter() - self._frameTimes[-1] > FPS_WINDOW:
+            return 0.0
+
+        return len(self._frameTimes) / FPS_WINDOW
+
+
+
+    def summary(self):
+        """ Returns frame rate, time and per class breakdown of
+        the last frame as text.
+
+        """
+
+        if not self.trace:
+            return ""
+
+        (dummy, frameTime, itemTimes, itemCounts) = self.trace[-1]
+        lines = ["%.1f fps   %.2f ms/frame" % (self.frames_per_second,
+                                               frameTime * 1e3)]
+        for name in self.classNames:
+            if itemCounts[name]:
+                lines.append("%-20s %5d  %8.2f ms" %
+                             (name, itemCounts[name], itemTimes[name] * 1e3))
+
+        return "\n".join(lines)
+
+
+
+    def write_csv(self, fileName):
+        """ Write the trace of all recorded frames to fileName.
+        Returns a (status, errorMessage) tuple.
+
+        """
+
+        try:
+            with open(fileName, "w", newline = "") as traceFile:
+                writer = csv.writer(traceFile)
+                writer.writerow(["timestamp", "frame_ms"] +
+                                ["%s_ms" % name
+                                 for name in self.classNames] +
+                                ["%s_items" % name
+                                 for name in self.classNames])
+                for (timestamp, frameTime, itemTimes, itemCounts) in \
+                        self.trace:
+                    writer.writerow(["%.6f" % timestamp,
+                                     "%.3f" % (frameTime * 1e3)] +
+                                    ["%.3f" % (itemTimes[name] * 1e3)
+                                     for name in self.classNames] +
+                                    [itemCounts[name]
+                                     for name in self.classNames])
+        except (IOError, OSError) as e:
+            return (False, str(e))
+
+        return (True, None)
+
+
+
+    def _class_name(self, itemType):
+        """ Returns the name of the profiled class itemType belongs to. """
+
+        if itemType not in self._classCache:
+            name = OTHER_ITEMS
+            for itemClass in PROFILED_ITEM_CLASSES:
+                if issubclass(itemType, itemClass):
+                    name = itemClass.__name__
+                    break
+            self._classCache[itemType] = name
+
+        return self._classCache[itemType]
@@ -120,10 +120,22 @@ class PatternCanvas(QGraphicsScene):
 
         self._copySelection = {}
 
+        # last (column, row) reported to the row/column counter
+        self._reportedCellPosition = None
+
+        # nesting level of BulkSceneChange and cache mode of grid
+        # items at the current zoom level
+        self._bulkChangeDepth = 0
+        self._itemCacheMode = grid_item_cache_mode(1.0)
+
         self.gridLegend = {}
         self.canvasTextBoxes = {}
         self.patternRepeats = set()
 
+        # legend, text and repeat items which can be placed anywhere
+        # on the canvas; needed for computing the scene bounds
+        self._floatingItems = set()
+
         self.set_up_main_grid()
         self.set_up_labels()
 
@@ -151,6 +163,79 @@ class PatternCanvas(QGraphicsScene):
 
 
 
+    def visible_scene_bounds(self, excludeHiddenCells = False):
+        """ Returns the bounding rectangle of all visible items on
+        the canvas including a small margin.
+
+        Contrary to visible_bounding_rect this does not look at every
+        item. The extent of the grid follows from the number of rows
+        and columns, the rest comes from the labels and the few free
+        floating legend, text and pattern repeat items.
+
+        If excludeHiddenCells is True, rows and columns consisting 
+        of hidden cells only are not counted (as during exporting). 
+
+        """
+
+        bounds = self._grid_bounds(excludeHiddenCells)
+
+        for label in list(self.rowLabels.values()) + \
+                     list(self.columnLabels.values()):
+            if label.isVisible():
+                bounds = unite_rects(bounds, label.sceneBoundingRect())
+
+        for item in self._floatingItems:
+            if item.isVisible():
+                bounds = unite_rects(bounds, item.sceneBoundingRect())
+
+        margin = 10
+        bounds.adjust(-margin, -margin, margin, margin)
+        return bounds
+
+
+
+    def _grid_bounds(self, excludeHiddenCells):
+        """ Returns the rectangle covered by the visible part of
+        the pattern grid.
+
+        """
+
+        if not self.isVisible or self._numRows == 0 \
+           or self._numColumns == 0:
+            return QRectF()
+
+        minRow = 0
+        maxRow = self._numRows - 1
+        minColumn = 0
+        maxColumn = self._numColumns - 1
+
+        if excludeHiddenCells and self.hiddenCellsByRow:
+            allColumns = set(range(0, self._numColumns))
+            visibleRows = []
+            visibleColumns = set()
+            for row in range(0, self._numRows):
+                hidden = self.hiddenCellsByRow.get(row, set())
+                if len(hidden) < self._numColumns:
+                    visibleRows.append(row)
+                    visibleColumns.update(allColumns.difference(hidden))
+
+            if not visibleRows:
+                return QRectF()
+
+            minRow = visibleRows[0]
+            maxRow = visibleRows[-1]
+            minColumn = min(visibleColumns)
+            maxColumn = max(visibleColumns)
+
+        # NOTE: grid items are offset by half their pen width
+        halfPen = 0.5
+        return QRectF(minColumn * self.cell_width + halfPen,
+                      minRow * self.cell_height + halfPen,
+                      (maxColumn - minColumn + 1) * self.cell_width,
+                      (maxRow - minRow + 1) * self.cell_height)
+
+
+
     def set_up_main_grid(self):
         """ This function draws the main grid.
 
@@ -368,7 +453,9 @@ class PatternCanvas(QGraphicsScene):
         if system() == 'Windows':
             self.sceneRect()
 
-        self.invalidate()
+        # items announce their own geometry changes; only the
+        # cached background of the views needs refreshing
+        self.invalidate(self.sceneRect(), QGraphicsScene.BackgroundLayer)
 
 
 
@@ -455,11 +542,8 @@ class PatternCanvas(QGraphicsScene):
         """ Simple helper slot to undo last action. """
 
         if self._undoStack.canUndo():
-            self._undoStack.undo()
-
-        # probably inefficient but otherwise there are caching
-        # artifacts
-        self.invalidate()
+            command = self._undoStack.command(self._undoStack.index() - 1)
+            self._step_history(command, self._undoStack.undo)
 
 
 
@@ -467,11 +551,42 @@ class PatternCanvas(QGraphicsScene):
         """ Simple helper slot to redo last action. """
 
         if self._undoStack.canRedo():
-            self._undoStack.redo()
+            command = self._undoStack.command(self._undoStack.index())
+            self._step_history(command, self._undoStack.redo)
+
 
-        # probably inefficient but otherwise there are caching
-        # artifacts
-        self.invalidate()
+
+    def _step_history(self, command, step):
+        """ Undo or redo command via step and repaint what it touched.
+
+        NOTE: Commands changing the structure of the canvas add,
+        remove and move many items; just like their first push
+        they run without the scene index.
+
+        """
+
+        if reports_scene_rect(command):
+            step()
+        else:
+            with BulkSceneChange(self):
+                step()
+
+        self._invalidate_touched_rect(command)
+
+
+
+    def _invalidate_touched_rect(self, command):
+        """ Repaint the part of the scene touched by the last undo
+        or redo of command. Commands which can't tell which part
+        they touched (e.g. insertion of rows) repaint everything.
+
+        """
+
+        rect = touched_scene_rect(command)
+        if rect is None:
+            self.invalidate()
+        elif not rect.isEmpty():
+            self.invalidate(rect, QGraphicsScene.ItemLayer)
 
 
 
@@ -693,6 +808,8 @@ class PatternCanvas(QGraphicsScene):
         item = PatternGridItem(self._unitCellDim, col, row, width, height,
                                knittingSymbol, color)
         item.setPos(origin)
+        if item.cacheMode() != self._itemCacheMode:
+            item.setCacheMode(self._itemCacheMode)
 
         if isHidden:
             item.hide_cell()
@@ -751,6 +868,9 @@ class PatternCanvas(QGraphicsScene):
         elif isinstance(item, PatternRepeatItem):
             self.add_pattern_repeat_to_legend(item)
 
+        if is_floating_item(item):
+            self._floatingItems.add(item)
+
         super(PatternCanvas,self).addItem(item)
 
 
@@ -769,6 +889,8 @@ class PatternCanvas(QGraphicsScene):
             legendID = item.itemID
             self.remove_from_legend(item, legendID)
 
+        self._floatingItems.discard(item)
+
         super(PatternCanvas,self).removeItem(item)
 
 
@@ -787,7 +909,8 @@ class PatternCanvas(QGraphicsScene):
         """ Here we intercept mouse move events on the canvas.
 
         For now, we just transmit our current position in terms
-        of columns and rows.
+        of columns and rows. Since most moves stay within the same
+        cell we only emit if the position actually changed.
 
         """
 
@@ -799,14 +922,17 @@ class PatternCanvas(QGraphicsScene):
             columnString = self._numColumns - column
         else:
             columnString = "NA"
-        self.emit(SIGNAL("col_count_changed"), columnString)
 
         rowLabelOffset = self.settings.rowLabelStart.value - 1
         if row >= 0 and row <= self._numRows:
             rowString = self._numRows - row + rowLabelOffset
         else:
             rowString = "NA"
-        self.emit(SIGNAL("row_count_changed"), rowString)
+
+        if (columnString, rowString) != self._reportedCellPosition:
+            self._reportedCellPosition = (columnString, rowString)
+            self.emit(SIGNAL("cell_position_changed"), columnString,
+                      rowString)
 
         return QGraphicsScene.mouseMoveEvent(self, event)
 
@@ -1888,16 +2014,25 @@ class PatternCanvas(QGraphicsScene):
         rowPivot = pivotRows[0]
         numRowDialog = NumRowColumnDialog("rows")
         if numRowDialog.exec_():
-            numRows = numRowDialog.num
-            location = numRowDialog.location
+            self.insert_rows(rowPivot, numRowDialog.num,
+                             numRowDialog.location)
 
-            # figure out if any pattern repeats need to be moved
-            patternRepeats = \
-              repeats_to_be_shifted_after_insert_row(self.patternRepeats,
-                                                     self.cell_height,
-                                                     rowPivot, numRows)
 
-            insertRowCommand = InsertRows(self, numRows, rowPivot, location)
+
+    def insert_rows(self, rowPivot, numRows, location):
+        """ Insert numRows rows above or below (depending on
+        location) rowPivot.
+
+        """
+
+        # figure out if any pattern repeats need to be moved
+        patternRepeats = \
+          repeats_to_be_shifted_after_insert_row(self.patternRepeats,
+                                                 self.cell_height,
+                                                 rowPivot, numRows)
+
+        insertRowCommand = InsertRows(self, numRows, rowPivot, location)
+        with BulkSceneChange(self):
             self._undoStack.beginMacro("insert rows")
             self.clear_all_selected_cells()
             self._undoStack.push(insertRowCommand)
@@ -1935,15 +2070,16 @@ class PatternCanvas(QGraphicsScene):
                                                   deadRows)
 
         deleteRowsCommand = DeleteRows(self, deadRows)
-        self._undoStack.beginMacro("delete marked rows")
-        self.clear_all_selected_cells()
-        self._undoStack.push(deleteRowsCommand)
+        with BulkSceneChange(self):
+            self._undoStack.beginMacro("delete marked rows")
+            self.clear_all_selected_cells()
+            self._undoStack.push(deleteRowsCommand)
 
-        for (item, oldPos, newPos) in patternRepeats:
-            moveCommand = MoveCanvasItem(item, oldPos, newPos)
-            self._undoStack.push(moveCommand)
+            for (item, oldPos, newPos) in patternRepeats:
+                moveCommand = MoveCanvasItem(item, oldPos, newPos)
+                self._undoStack.push(moveCommand)
 
-        self._undoStack.endMacro()
+            self._undoStack.endMacro()
 
 
 
@@ -2044,15 +2180,16 @@ class PatternCanvas(QGraphicsScene):
 
             insertColCommand = InsertColumns(self, numColumns, pivot,
                                              location)
-            self._undoStack.beginMacro("insert columns")
-            self.clear_all_selected_cells()
-            self._undoStack.push(insertColCommand)
+            with BulkSceneChange(self):
+                self._undoStack.beginMacro("insert columns")
+                self.clear_all_selected_cells()
+                self._undoStack.push(insertColCommand)
 
-            for (item, oldPos, newPos) in patternRepeats:
-                moveCommand = MoveCanvasItem(item, oldPos, newPos)
-                self._undoStack.push(moveCommand)
+                for (item, oldPos, newPos) in patternRepeats:
+                    moveCommand = MoveCanvasItem(item, oldPos, newPos)
+                    self._undoStack.push(moveCommand)
 
-            self._undoStack.endMacro()
+                self._undoStack.endMacro()
 
 
 
@@ -2134,15 +2271,16 @@ class PatternCanvas(QGraphicsScene):
                                                   deadColumns)
 
         deleteColumnsCommand = DeleteColumns(self, deadColumns)
-        self._undoStack.beginMacro("delete columns")
-        self.clear_all_selected_cells()
-        self._undoStack.push(deleteColumnsCommand)
+        with BulkSceneChange(self):
+            self._undoStack.beginMacro("delete columns")
+            self.clear_all_selected_cells()
+            self._undoStack.push(deleteColumnsCommand)
 
-        for (item, oldPos, newPos) in patternRepeats:
-            moveCommand = MoveCanvasItem(item, oldPos, newPos)
-            self._undoStack.push(moveCommand)
+            for (item, oldPos, newPos) in patternRepeats:
+                moveCommand = MoveCanvasItem(item, oldPos, newPos)
+                self._undoStack.push(moveCommand)
 
-        self._undoStack.endMacro()
+            self._undoStack.endMacro()
 
 
 
@@ -2242,6 +2380,10 @@ class PatternCanvas(QGraphicsScene):
         self._copySelection = {}
         self.hiddenCellsByRow = {}
 
+        # clear() deleted the floating items; we must not touch
+        # their wrappers afterwards
+        self._floatingItems = set()
+
 
 
     def create_new_canvas(self, numRows = 10, numColumns = 10):
@@ -2252,21 +2394,68 @@ class PatternCanvas(QGraphicsScene):
         self._numRows    = numRows
         self._numColumns = numColumns
 
-        self._clear_canvas()
-        self.set_up_main_grid()
-        self.finalize_grid_change()
+        with BulkSceneChange(self):
+            self._clear_canvas()
+            self.set_up_main_grid()
+            self.finalize_grid_change()
+
+
+
+    def set_zoom_level(self, zoom):
+        """ Adjust the cache mode of all grid items to the zoom
+        factor of the view.
+
+        """
+
+        cacheMode = grid_item_cache_mode(zoom)
+        if cacheMode == self._itemCacheMode:
+            return
+
+        self._itemCacheMode = cacheMode
+        for item in self.items():
+            if isinstance(item, PatternGridItem):
+                item.setCacheMode(cacheMode)
 
 
 
     @wait_cursor
     def load_previous_pattern(self, knittingSymbols, patternGridItemInfo,
                               legendItemInfo, patternRepeats,
-                              rowRepeats, textItems,
+                              repeatLegends, rowRepeats, textItems,
                               rowLabels, columnLabels):
         """ Clear curent canvas and establishes a new canvas
         based on the passed canvas items. Returns True on success
         and False otherwise.
 
+        """
+
+        builder = self.pattern_builder(knittingSymbols, patternGridItemInfo,
+                                       legendItemInfo, patternRepeats,
+                                       repeatLegends, rowRepeats, textItems,
+                                       rowLabels, columnLabels)
+        if builder == None:
+            return False
+
+        for dummy in builder:
+            pass
+
+        return True
+
+
+
+    def pattern_builder(self, knittingSymbols, patternGridItemInfo,
+                        legendItemInfo, patternRepeats, repeatLegends,
+                        rowRepeats, textItems, rowLabels, columnLabels,
+                        firstRect = None):
+        """ Check the passed canvas items and return a generator
+        which clears the current canvas and rebuilds it one grid
+        item at a time, yielding (number of items done, total number
+        of items) after each one. Grid items inside firstRect (in
+        scene coordinates) are created first. Returns None if the
+        items can not be loaded.
+
+        Closing the generator early leaves a partially built canvas.
+
         NOTE: We have to be able to deal with bogus data (from a
         corrupted file perhaps).
 
@@ -2283,59 +2472,82 @@ class PatternCanvas(QGraphicsScene):
                                            self.cell_width,
                                            self.cell_height)
         if allPatternGridItems == None:
-            return False
+            return None
 
         allLegendItems = load_legend_items(legendItemInfo)
         if allLegendItems == None:
-            return False
+            return None
 
         allPatternRepeats = load_patternRepeat_items(patternRepeats)
         if allPatternRepeats == None:
-            return False
+            return None
+
+        allRepeatBoxLegends = load_patternRepeatLegend_items(repeatLegends)
+        if allRepeatBoxLegends == None:
+            return None
 
         allTextItems = load_text_items(textItems)
         if allTextItems == None:
-            return False
+            return None
 
-        # now that we have all canvas items, let's put them back in place
-        self._clear_canvas()
+        if firstRect:
+            allPatternGridItems.sort(key = lambda entry:
+                    not firstRect.intersects(QRectF(entry[0],
+                            QSizeF(entry[3] * self.cell_width,
+                                   entry[4] * self.cell_height))))
 
-        (self._numRows, self._numColumns) = \
-            extract_num_rows_columns(allPatternGridItems)
+        return self._build_pattern(allPatternGridItems, allLegendItems,
+                                   allPatternRepeats, allRepeatBoxLegends,
+                                   rowRepeats, allTextItems, rowLabels,
+                                   columnLabels)
 
-        for entry in allPatternGridItems:
-            item = self.create_pattern_grid_item(*entry)
-            self.addItem(item)
 
-        for entry in allLegendItems:
-            arrange_label_item(self.gridLegend, *entry)
 
-        for (repeatID, entry) in allPatternRepeats.items():
+    def _build_pattern(self, allPatternGridItems, allLegendItems,
+                       allPatternRepeats, allRepeatBoxLegends, rowRepeats,
+                       allTextItems, rowLabels, columnLabels):
+        """ Generator doing the actual work for pattern_builder. """
 
-            # also retrieve the proper legend
-            if repeatID in allRepeatBoxLegends:
-                self.add_patternRepeatItem(*entry, legendInfo = \
-                                                allRepeatBoxLegends[repeatID])
-            else:
-                self.add_patternRepeatItem(*entry,
-                                            legendInfo = None)
+        # now that we have all canvas items, let's put them back in place
+        with BulkSceneChange(self):
+            self._clear_canvas()
 
-        for rowRepeat in rowRepeats:
-            self.rowRepeatTracker.add_repeat(*rowRepeat)
+            (self._numRows, self._numColumns) = \
+                extract_num_rows_columns(allPatternGridItems)
 
-        for textItem in allTextItems:
-            self.add_text_item(*textItem)
+            numGridItems = len(allPatternGridItems)
+            for (count, entry) in enumerate(allPatternGridItems, 1):
+                item = self.create_pattern_grid_item(*entry)
+                self.addItem(item)
+                yield (count, numGridItems)
 
+            for entry in allLegendItems:
+                arrange_label_item(self.gridLegend, *entry)
 
-        self.load_row_column_labels(rowLabels, columnLabels)
+            for (repeatID, entry) in allPatternRepeats.items():
 
-        # need to clear our caches, otherwise we'll try
-        # to remove non-existing items
-        self.finalize_grid_change()
-        self.change_grid_cell_dimensions()
-        self.clear_undo_stack()
+                # also retrieve the proper legend
+                if repeatID in allRepeatBoxLegends:
+                    self.add_patternRepeatItem(*entry, legendInfo = \
+                                            allRepeatBoxLegends[repeatID])
+                else:
+                    self.add_patternRepeatItem(*entry,
+                                                legendInfo = None)
 
-        return True
+            for rowRepeat in rowRepeats:
+                self.rowRepeatTracker.add_repeat(*rowRepeat)
+
+            for textItem in allTextItems:
+                self.add_text_item(*textItem)
+
+
+            self.load_row_column_labels(rowLabels, columnLabels)
+
+            # need to clear our caches, otherwise we'll try
+            # to remove non-existing items
+            self.finalize_grid_change()
+            self.change_grid_cell_dimensions()
+            self.clear_undo_stack()
 
 
 
@@ -2613,6 +2825,20 @@ class PatternCanvas(QGraphicsScene):
 
 
 
+    def refresh_symbol(self, symbol):
+        """ Swap in the updated version symbol for all grid and legend
+        items showing a symbol of the same name and width.
+
+        """
+
+        for item in self.items():
+            if isinstance(item, (PatternGridItem, PatternLegendItem)):
+                if item.name == symbol["name"] and \
+                   item.symbol["width"] == symbol["width"]:
+                    item.refresh_symbol(symbol)
+
+
+
     def contains_symbol(self, symbolName):
         """ Returns True if the canvas contains a PatternGridItem
 
@@ -25,6 +25,7 @@ from __future__ import unicode_literals
 from __future__ import absolute_import
 
 import logging
+import math
 import uuid
 
 from PyQt4.QtCore import (Qt,
@@ -41,6 +42,7 @@ from PyQt4.QtGui import (QApplication,
                          QGraphicsLineItem,
                          QGraphicsPolygonItem,
                          QGraphicsRectItem,
+                         QGraphicsScene,
                          QGraphicsTextItem,
                          QGraphicsItemGroup,
                          QPainterPath,
@@ -61,8 +63,24 @@ if QT_VERSION < 0x040703 or system() == 'Windows':
 else:
     NO_ITEM_CACHING = False
 
+# beyond this zoom factor the device coordinate caches of grid
+# items get larger than the benefit of not re-rendering the svg
+# symbols, so we paint them directly
+MAX_CACHED_ZOOM = 3.0
+
+# the scene index is turned off during bulk changes of the canvas
+# and rebuilt afterwards with a depth tuned to the number of items
+ADAPTIVE_SCENE_INDEX = True
+BSP_ITEMS_PER_LEAF = 16
+MIN_BSP_TREE_DEPTH = 5
+MAX_BSP_TREE_DEPTH = 14
+
+# width of the frame drawn around each grid cell
+GRID_PEN_SIZE = 1.0
+
 
 from sconcho.util.canvas import *
+from sconcho.util.symbol_svg import symbol_renderer
 import sconcho.util.messages as msg
 
 # module lever logger:
@@ -102,7 +120,7 @@ class PatternGridItem(QGraphicsSvgItem):
         self.size = QSizeF(self.unitDim.width() * width,
                            self.unitDim.height() * height)
 
-        self._penSize = 1.0
+        self._penSize = GRID_PEN_SIZE
         self._pen = QPen()
         self._pen.setWidthF(self._penSize)
         self._pen.setJoinStyle(Qt.MiterJoin)
@@ -174,6 +192,7 @@ class PatternGridItem(QGraphicsSvgItem):
     def change_geometry(self, newDim):
         """ This slot changes the unit dimensions of the item. """
 
+        self.prepareGeometryChange()
         self.unitDim = newDim
         self.size    = QSizeF(self.unitDim.width() * self.width,
                               self.unitDim.height() * self.height)
@@ -185,6 +204,7 @@ class PatternGridItem(QGraphicsSvgItem):
 
         self.color = newColor
         self._backBrush = QBrush(self.color)
+        self.update()
 
 
 
@@ -214,16 +234,28 @@ class PatternGridItem(QGraphicsSvgItem):
 
 
 
+    def refresh_symbol(self, newSymbol):
+        """ Replace our symbol by an updated version of itself,
+        e.g. after its svg image changed on disk.
+
+        """
+
+        self._set_symbol(newSymbol)
+        self.update()
+
+
+
     def _set_symbol(self, newSymbol):
         """ Adds a new svg image of a knitting symbol to the scene. """
 
         self.symbol = newSymbol
-        svgPath = newSymbol["svgPath"]
-        if not self.renderer().load(svgPath):
+        renderer = symbol_renderer(newSymbol)
+        if not renderer.isValid():
             errorMessage = ("PatternGridItem._set_symbol: failed to load "
-                           "symbol %s" % svgPath)
+                           "symbol %s" % newSymbol["svgPath"])
             logger.error(errorMessage)
             return
+        self.setSharedRenderer(renderer)
 
         # apply color if present
         if "backgroundColor" in newSymbol:
@@ -381,6 +413,7 @@ class PatternLegendItem(QGraphicsSvgItem):
     def change_geometry(self, newDim):
         """ This slot changes the unit dimensions of the item. """
 
+        self.prepareGeometryChange()
         self.unitDim = newDim
         self.size    = QSizeF(self.unitDim.width() * self.width,
                               self.unitDim.height() * self.height)
@@ -395,16 +428,28 @@ class PatternLegendItem(QGraphicsSvgItem):
 
 
 
+    def refresh_symbol(self, newSymbol):
+        """ Replace our symbol by an updated version of itself,
+        e.g. after its svg image changed on disk.
+
+        """
+
+        self._set_symbol(newSymbol)
+        self.update()
+
+
+
     def _set_symbol(self, newSymbol):
         """ Adds a new svg image of a knitting symbol to the scene. """
 
         self.symbol = newSymbol
-        svgPath = newSymbol["svgPath"]
-        if not self.renderer().load(svgPath):
+        renderer = symbol_renderer(newSymbol)
+        if not renderer.isValid():
             errorMessage = ("PatternLegendItem._set_symbol: failed to load "
-                           "symbol %s" % svgPath)
+                           "symbol %s" % newSymbol["svgPath"])
             logger.error(errorMessage)
             return
+        self.setSharedRenderer(renderer)
 
         # apply color if present
         if "backgroundColor" in newSymbol:
@@ -1038,6 +1083,48 @@ class PatternTextItem(PatternLegendText):
 
 
 
+######################################################################
+#
+# helper functions
+#
+######################################################################
+def grid_item_cache_mode(zoom):
+    """ Returns the cache mode for grid items at the given zoom
+    factor of the view.
+
+    """
+
+    if NO_ITEM_CACHING or zoom > MAX_CACHED_ZOOM:
+        return QGraphicsItem.NoCache
+
+    return QGraphicsItem.DeviceCoordinateCache
+
+
+
+def bsp_tree_depth(numItems):
+    """ Returns the BSP tree depth for a scene with numItems
+    items, aiming at about BSP_ITEMS_PER_LEAF items per leaf.
+
+    """
+
+    numLeaves = max(1, numItems // BSP_ITEMS_PER_LEAF)
+    depth = int(math.ceil(math.log(numLeaves, 2)))
+
+    return min(max(depth, MIN_BSP_TREE_DEPTH), MAX_BSP_TREE_DEPTH)
+
+
+
+def is_floating_item(item):
+    """ Returns True for items which can be placed freely on the 
+    canvas as opposed to items tied to the pattern grid.
+
+    """
+
+    return isinstance(item, (PatternLegendItem, PatternLegendText,
+                             PatternRepeatItem, RepeatLegendItem))
+
+
+
 ######################################################################
 #
 # context manager taking care of hiding nostitch symbols and
@@ -1103,6 +1190,48 @@ class HiddenStitchManager(object):
 
 
 
+######################################################################
+#
+# context manager turning off the scene index while large numbers
+# of items are added, removed or moved. Keeping a BSP tree up to
+# date during bulk changes costs much more than rebuilding it once
+# afterwards. Nested use is fine, the index is only restored when
+# the outermost manager exits.
+#
+######################################################################
+class BulkSceneChange(object):
+
+    def __init__(self, canvas):
+        """ Initialize the manager for canvas. """
+
+        self.canvas = canvas
+
+
+
+    def __enter__(self):
+        """ Entry method of BulkSceneChange context manager. """
+
+        if ADAPTIVE_SCENE_INDEX:
+            if self.canvas._bulkChangeDepth == 0:
+                self.canvas.setItemIndexMethod(QGraphicsScene.NoIndex)
+            self.canvas._bulkChangeDepth += 1
+
+        return self
+
+
+
+    def __exit__(self, exc_class, exc_instance, traceback):
+        """ Exit method of BulkSceneChange context manager. """
+
+        if ADAPTIVE_SCENE_INDEX:
+            self.canvas._bulkChangeDepth -= 1
+            if self.canvas._bulkChangeDepth == 0:
+                self.canvas.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+                self.canvas.setBspTreeDepth(
+                        bsp_tree_depth(len(self.canvas.items())))
+
+
+
 ####################################################################
 #
 # helper class for creating the proper row labels
@@ -19,6 +19,7 @@
 #######################################################################
 
 import operator
+import time
 
 from PyQt4.QtCore import (QPointF,
                           QRect,
@@ -27,11 +28,16 @@ from PyQt4.QtCore import (QPointF,
                           QSizeF,
                           Qt)
 
-from PyQt4.QtGui import (QGraphicsView,
+from PyQt4.QtGui import (QColor,
+                         QFont,
+                         QGraphicsView,
+                         QLabel,
                          QPainter,
+                         QPalette,
                          QRubberBand)
 
-from sconcho.util.canvas import visible_bounding_rect
+from sconcho.gui.paint_profiler import PaintProfiler
+
 
 
 #########################################################
@@ -56,6 +62,73 @@ class PatternView(QGraphicsView):
         self.rubberBand.hide()
         self.rubberBandOrigin = None
 
+        # paint profiling is off unless requested; the profiler
+        # and its trace survive turning it off again
+        self.paintProfiler = None
+        self._profilePainting = False
+        self._profilerOverlay = None
+
+
+
+    def set_paint_profiling(self, status):
+        """ Turn paint profiling and its overlay on or off.
+
+        While profiling, Qt hands the items of each frame to
+        drawItems (IndirectPainting) so we can time them one by one.
+
+        """
+
+        if status and not self.paintProfiler:
+            self.paintProfiler = PaintProfiler()
+            self._profilerOverlay = create_profiler_overlay(self.viewport())
+
+        self._profilePainting = status
+        if self._profilerOverlay:
+            self._profilerOverlay.setVisible(status)
+        self.setOptimizationFlag(QGraphicsView.IndirectPainting, status)
+        self.viewport().update()
+
+
+
+    def paintEvent(self, event):
+        """ Time each frame and update the profiler overlay if paint
+        profiling is on.
+
+        """
+
+        if not self._profilePainting:
+            return QGraphicsView.paintEvent(self, event)
+
+        self.paintProfiler.begin_frame()
+        QGraphicsView.paintEvent(self, event)
+        self.paintProfiler.end_frame()
+
+        # the overlay is opaque so updating it does not cause
+        # another frame of the view
+        summary = self.paintProfiler.summary()
+        if summary != self._profilerOverlay.text():
+            self._profilerOverlay.setText(summary)
+            self._profilerOverlay.adjustSize()
+
+
+
+    def drawItems(self, painter, items, options):
+        """ Paint the items of a frame one at a time, accounting the
+        time spent on each to the paint profiler.
+
+        NOTE: This is only called while paint profiling is on.
+
+        """
+
+        if not self._profilePainting:
+            return QGraphicsView.drawItems(self, painter, items, options)
+
+        for (item, option) in zip(items, options):
+            start = time.perf_counter()
+            QGraphicsView.drawItems(self, painter, [item], [option])
+            self.paintProfiler.add_item_time(item,
+                                             time.perf_counter() - start)
+
 
 
     def mousePressEvent(self, event):
@@ -127,6 +200,7 @@ class PatternView(QGraphicsView):
         """ Zoom in by 10% """
 
         self.scale(1.1, 1.1)
+        self.zoom_changed()
 
 
 
@@ -134,6 +208,7 @@ class PatternView(QGraphicsView):
         """ Zoom out by 10% """
 
         self.scale(0.9, 0.9)
+        self.zoom_changed()
 
 
 
@@ -141,9 +216,10 @@ class PatternView(QGraphicsView):
         """ Fit scene into canvas. """
 
         margin = 50.0
-        rawBoundary = visible_bounding_rect(self.scene().items())
+        rawBoundary = self.scene().visible_scene_bounds()
         rawBoundary.adjust(-margin, -margin, margin, margin)
         self.fitInView(rawBoundary, Qt.KeepAspectRatio)
+        self.zoom_changed()
 
 
 
@@ -151,3 +227,34 @@ class PatternView(QGraphicsView):
         """ Resets scene to normal (initial) view. """
 
         self.resetMatrix()
+        self.zoom_changed()
+
+
+
+    def zoom_changed(self):
+        """ Let the scene adjust its caching to the new zoom level. """
+
+        self.scene().set_zoom_level(self.transform().m11())
+
+
+
+def create_profiler_overlay(parent):
+    """ Create the label showing the paint profiler summary in the
+    upper left corner of parent.
+
+    """
+
+    overlay = QLabel(parent)
+    font = QFont("Monospace", 8)
+    font.setStyleHint(QFont.TypeWriter)
+    overlay.setFont(font)
+    overlay.setMargin(5)
+
+    palette = overlay.palette()
+    palette.setColor(QPalette.Window, QColor(Qt.black))
+    palette.setColor(QPalette.WindowText, QColor(Qt.white))
+    overlay.setPalette(palette)
+    overlay.setAutoFillBackground(True)
+    overlay.move(0, 0)
+
+    return overlay
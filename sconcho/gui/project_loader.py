@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import logging
+import time
+
+from PyQt4.QtCore import (QObject,
+                          QTimer,
+                          SIGNAL)
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+# time in seconds we spend building the canvas before returning
+# to the event loop so the window stays responsive
+TIME_SLICE = 0.025
+
+
+
+##########################################################################
+#
+# Drives a pattern builder (see PatternCanvas.pattern_builder) from
+# the event loop. Each time slice creates as many canvas items as fit
+# into TIME_SLICE and then reports progress via the loading_progress
+# signal. Once the canvas is complete, or loading was canceled,
+# loading_done is emitted with True or False, respectively.
+#
+##########################################################################
+class ProjectLoader(QObject):
+
+
+    def __init__(self, builder, parent = None):
+
+        super(ProjectLoader, self).__init__(parent)
+
+        self._builder = builder
+
+
+
+    def start(self):
+        """ Start building the canvas once we're back in the
+        event loop.
+
+        """
+
+        QTimer.singleShot(0, self._build_next_slice)
+
+
+
+    def is_loading(self):
+        """ Returns True while the canvas is still being built. """
+
+        return self._builder != None
+
+
+
+    def cancel(self):
+        """ Stop building the canvas. """
+
+        if not self._builder:
+            return
+
+        self._builder.close()
+        self._builder = None
+        self.emit(SIGNAL("loading_done"), False)
+
+
+
+    def _build_next_slice(self):
+        """ Build canvas items until the time slice is used up. """
+
+        # we may have been canceled in the meantime
+        if not self._builder:
+            return
+
+        deadline = time.perf_counter() + TIME_SLICE
+        try:
+            (numDone, numTotal) = next(self._builder)
+            while time.perf_counter() < deadline:
+                (numDone, numTotal) = next(self._builder)
+        except StopIteration:
+            self._builder = None
+            self.emit(SIGNAL("loading_done"), True)
+            return
+        except Exception as e:
+            # don't leave the main window waiting for a builder
+            # that will never finish
+            logger.error("failed to build canvas: %s" % e)
+            self._builder = None
+            self.emit(SIGNAL("loading_done"), False)
+            return
+
+        self.emit(SIGNAL("loading_progress"), numDone, numTotal)
+        QTimer.singleShot(0, self._build_next_slice)
@@ -29,8 +29,6 @@ from PyQt4.QtGui import (QColor,
                          QLabel,
                          QWidget)
 
-from PyQt4.QtSvg import QSvgWidget
-
 
 from sconcho.gui.symbol_widget import (SymbolSelectorItem,
                                        SymbolSynchronizer)
@@ -173,19 +171,28 @@ class RecentlyUsedSymbolWidget(QWidget):
     def update_widget(self, symbol):
         """ Update the widget, e.g. after adding/deleting a symbol. """
 
-        # remove previous symbols
+        # remove previous symbols but hang on to the display items
+        # of symbols we keep showing
+        displayItems = {}
         for widget in self.recentSymbols:
             self.layout.removeWidget(widget)
-            widget.setParent(None)
+            item = self.widgetToSymbol.get(widget)
+            if item in self.recentSymbolsDict:
+                displayItems[item] = widget
+            else:
+                widget.setParent(None)
         self.recentSymbols = []
 
         # add new ones
         self.widgetToSymbol = {}
         for (index, item) in enumerate(self.recentSymbolsDict.keys()):
-            widget = SymbolDisplayItem(item.get_content(),
-                                       self._synchronizer)
-            self.connect(widget, SIGNAL("widget_pressed"),
-                         self.widget_clicked)
+            if item in displayItems:
+                widget = displayItems[item]
+            else:
+                widget = SymbolDisplayItem(item.get_content(),
+                                           self._synchronizer)
+                self.connect(widget, SIGNAL("widget_pressed"),
+                             self.widget_clicked)
             self.widgetToSymbol[widget] = item
             self.layout.addWidget(widget, 0, index, Qt.AlignVCenter)
             self.recentSymbols.append(widget)
@@ -225,7 +232,6 @@ class SymbolDisplayItem(SymbolSelectorItem):
                                                 parent)
 
         # adjust the size according to the symbol's svg
-        svgWidget = QSvgWidget(symbol["svgPath"])
         svgWidth = int(symbol["width"])
         self.setMinimumWidth(svgWidth * 25)
         self.setMaximumWidth(svgWidth * 25)
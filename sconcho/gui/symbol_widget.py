@@ -35,32 +35,27 @@ from PyQt4.QtGui import (QColor,
                          QWidget,
                          QWidgetItem)
 
-from PyQt4.QtSvg import QSvgWidget
+from sconcho.util.symbol_svg import SymbolIcon
 
 
 
 def generate_symbolWidgets(symbols, chooser, symbolLayout,
                            synchronizer):
-    """ Generate all symbolSelectorWidgets.
+    """ Generate the symbolSelectorWidgets.
 
-    For each category, we create a symbolSelectorWidget, add
-    the category to the selector, and store the widget in a dictionary
-    with the category name as key.
+    For each category, we add the category to the selector. The
+    symbolSelectorWidget for a category is only created when it is
+    first requested from the returned CategoryWidgets, so at startup
+    only the active category is built.
 
     The mainWindow then installs the proper widget based on the
     user selection.
     """
 
-    selectorWidgets = {}
-    widgetList = {}
     symbolsByCategory = sort_symbols_by_category(symbols)
-    for (symbolCategory, symbols) in symbolsByCategory:
+    selectorWidgets = CategoryWidgets(dict(symbolsByCategory), synchronizer)
+    for (symbolCategory, dummy) in symbolsByCategory:
         chooser.addItem(symbolCategory)
-        (widget, wList) = \
-            generate_category_widget(symbolCategory, symbols, synchronizer)
-        widgetList = dict(widgetList.items())
-        widgetList.update(wList.items())
-        selectorWidgets[symbolCategory] = widget
 
     # make "basic" the top item if it exists, otherwise
     # we pick whatever happens to be top
@@ -73,7 +68,7 @@ def generate_symbolWidgets(symbols, chooser, symbolLayout,
 
     symbolLayout.addWidget(activeWidget)
 
-    return (activeWidget, selectorWidgets, widgetList)
+    return (activeWidget, selectorWidgets, SymbolWidgetList(selectorWidgets))
 
 
 
@@ -180,6 +175,158 @@ def sort_symbols_by_category(symbols):
 
 
 
+#########################################################
+##
+## dictionary like container for the symbol selector
+## widgets of all categories. The widget of a category
+## is built on first access and kept afterwards.
+##
+#########################################################
+class CategoryWidgets(object):
+
+
+    def __init__(self, symbolsByCategory, synchronizer):
+
+        self._symbols = symbolsByCategory
+        self._synchronizer = synchronizer
+        self._widgets = {}
+        self._items = {}
+
+
+
+    def __contains__(self, category):
+
+        return category in self._symbols
+
+
+
+    def __getitem__(self, category):
+        """ Return the widget for category, building it if needed. """
+
+        if category not in self._widgets:
+            (widget, wList) = generate_category_widget(category,
+                                                self._symbols[category],
+                                                self._synchronizer)
+            self._widgets[category] = widget
+            self._items.update(wList)
+
+        return self._widgets[category]
+
+
+
+    def __delitem__(self, category):
+
+        del self._symbols[category]
+        if category in self._widgets:
+            del self._widgets[category]
+
+        for key in [key for key in self._items if key[1] == category]:
+            del self._items[key]
+
+
+
+    def is_built(self, category):
+        """ Returns True if the widget for category exists already. """
+
+        return category in self._widgets
+
+
+
+    def has_symbol(self, symbolName, category):
+        """ Returns True if symbolName is part of category. """
+
+        if category not in self._symbols:
+            return False
+
+        for symbol in self._symbols[category]:
+            if symbol["name"] == symbolName:
+                return True
+
+        return False
+
+
+
+    def selector_item(self, symbolName, category):
+        """ Return the SymbolSelectorItem for the given symbol,
+        building the widget of its category if needed.
+
+        """
+
+        if not self.has_symbol(symbolName, category):
+            raise KeyError((symbolName, category))
+
+        self[category]
+        return self._items[(symbolName, category)]
+
+
+
+    def add_symbol(self, symbol):
+        """ Add symbol to its category. The selector item is only
+        created right away if the category widget exists already.
+
+        """
+
+        category = symbol["category"]
+        self._symbols.setdefault(category, []).append(symbol)
+
+        if category in self._widgets:
+            wList = add_to_category_widget(self._widgets[category], symbol,
+                                           self._synchronizer)
+            self._items.update(wList)
+
+
+
+    def remove_symbol(self, symbolName, category):
+        """ Remove symbolName from category and return the number
+        of symbols left in category.
+
+        """
+
+        self._symbols[category] = [symbol for symbol in
+                                   self._symbols[category]
+                                   if symbol["name"] != symbolName]
+
+        if category in self._widgets:
+            remove_from_category_widget(self._widgets[category], symbolName)
+
+        key = (symbolName, category)
+        if key in self._items:
+            del self._items[key]
+
+        return len(self._symbols[category])
+
+
+
+#########################################################
+##
+## read only view mapping (name, category) of each symbol
+## to its SymbolSelectorItem. Looking up a symbol in a
+## category which has not been built yet builds it.
+##
+#########################################################
+class SymbolWidgetList(object):
+
+
+    def __init__(self, categoryWidgets):
+
+        self._categoryWidgets = categoryWidgets
+
+
+
+    def __contains__(self, key):
+
+        (symbolName, category) = key
+        return self._categoryWidgets.has_symbol(symbolName, category)
+
+
+
+    def __getitem__(self, key):
+
+        (symbolName, category) = key
+        return self._categoryWidgets.selector_item(symbolName, category)
+
+
+
 #########################################################
 ##
 ## class for managing a single symbol selector item
@@ -198,10 +345,10 @@ class SymbolSelectorItem(QFrame):
         self.setStyleSheet(self._unselectedStyleSheet)
         self.setToolTip(symbol["description"])
 
-        # add the symbol's svg
-        svgWidget = QSvgWidget(symbol["svgPath"])
+        # add the symbol's icon
+        iconWidget = SymbolIcon(symbol)
         svgWidth = int(symbol["width"]) #.toInt()[0]
-        svgWidget.setMaximumSize(QSize(svgWidth * 30, 30))
+        iconWidget.setMaximumSize(QSize(svgWidth * 30, 30))
 
         self.setMinimumSize(svgWidth * 30, 30)
         self.setMaximumSize(svgWidth * 30, 30)
@@ -209,7 +356,7 @@ class SymbolSelectorItem(QFrame):
         # finalize the layout
         layout = QHBoxLayout()
         layout.setContentsMargins( 0, 0, 0, 0 )
-        layout.addWidget(svgWidget)
+        layout.addWidget(iconWidget)
         self.setLayout(layout)
 
 
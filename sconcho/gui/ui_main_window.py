@@ -113,6 +113,9 @@ class Ui_MainWindow(object):
         self.symbolSelectorLayout = QtGui.QVBoxLayout(self.layoutWidget)
         self.symbolSelectorLayout.setMargin(0)
         self.symbolSelectorLayout.setObjectName(_fromUtf8("symbolSelectorLayout"))
+        self.symbolSearchEdit = QtGui.QLineEdit(self.layoutWidget)
+        self.symbolSearchEdit.setObjectName(_fromUtf8("symbolSearchEdit"))
+        self.symbolSelectorLayout.addWidget(self.symbolSearchEdit)
         self.symbolCategoryChooser = QtGui.QComboBox(self.layoutWidget)
         sizePolicy = QtGui.QSizePolicy(QtGui.QSizePolicy.Preferred, QtGui.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -121,6 +124,9 @@ class Ui_MainWindow(object):
         self.symbolCategoryChooser.setSizePolicy(sizePolicy)
         self.symbolCategoryChooser.setObjectName(_fromUtf8("symbolCategoryChooser"))
         self.symbolSelectorLayout.addWidget(self.symbolCategoryChooser)
+        self.symbolSearchResults = QtGui.QListWidget(self.layoutWidget)
+        self.symbolSearchResults.setObjectName(_fromUtf8("symbolSearchResults"))
+        self.symbolSelectorLayout.addWidget(self.symbolSearchResults)
         self.layoutWidget1 = QtGui.QWidget(self.SymbolSelectorSplitter)
         self.layoutWidget1.setObjectName(_fromUtf8("layoutWidget1"))
         self.verticalLayout_3 = QtGui.QVBoxLayout(self.layoutWidget1)
@@ -478,6 +484,8 @@ class Ui_MainWindow(object):
         self.menu_Resize_Grid.setTitle(_translate("MainWindow", "&Resize Grid", None))
         self.menuTools.setTitle(_translate("MainWindow", "Tools", None))
         self.symbolDockWidget.setWindowTitle(_translate("MainWindow", "sconcho: available knitting symbols", None))
+        self.symbolSearchEdit.setToolTip(_translate("MainWindow", "search symbols by name, description or category", None))
+        self.symbolSearchEdit.setPlaceholderText(_translate("MainWindow", "search symbols", None))
         self.label.setText(_translate("MainWindow", "Frequently Used Symbols", None))
         self.clearFrequentlyUsedSymbolsButton.setText(_translate("MainWindow", "Clear List", None))
         self.toolBar.setWindowTitle(_translate("MainWindow", "toolBar", None))
@@ -573,4 +581,3 @@ from sconcho.gui.pattern_view import PatternView
 from sconcho.gui.active_symbol_widget import ActiveSymbolWidget
 from sconcho.gui.recently_used_symbol_widget import RecentlyUsedSymbolWidget
 from sconcho.gui.color_widget import ColorWidget
-from . import icons_rc
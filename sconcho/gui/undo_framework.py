@@ -21,8 +21,10 @@
 
 import logging
 from copy import copy
+from itertools import chain
 
 from PyQt4.QtCore import (QPointF,
+                          QRectF,
                           Qt,
                           SIGNAL)
 
@@ -52,7 +54,8 @@ from sconcho.util.canvas import (HIDE_OPACITY,
                          shift_selection_horizontally,
                          PatternCanvasEntry)
 
-from sconcho.gui.pattern_canvas_objects import (RepeatLegendItem,
+from sconcho.gui.pattern_canvas_objects import (GRID_PEN_SIZE,
+                                        RepeatLegendItem,
                                         PatternLegendText,
                                         PatternHighlightItem,
                                         PatternTextItem)
@@ -62,6 +65,96 @@ from sconcho.gui.pattern_canvas_objects import (RepeatLegendItem,
 logger = logging.getLogger(__name__)
 
 
+###########################################################################
+#
+# helpers for determining which part of the scene a command touched.
+# Commands implementing scene_rect() return the scene rectangle
+# affected by their last undo/redo (an empty rectangle if they didn't
+# touch the scene at all); for commands without it (e.g. insertion
+# and deletion of rows/columns which shift large parts of the chart)
+# the whole scene has to be repainted.
+#
+###########################################################################
+def touched_scene_rect(command):
+    """ Returns the scene rectangle touched by the last undo/redo
+    of command or None if the command can't tell.
+
+    """
+
+    if hasattr(command, "scene_rect"):
+        return command.scene_rect()
+
+    # macros report the union of their children
+    if command.childCount() == 0:
+        return None
+
+    rect = QRectF()
+    for index in range(command.childCount()):
+        childRect = touched_scene_rect(command.child(index))
+        if childRect is None:
+            return None
+        rect = rect.united(childRect)
+
+    return rect
+
+
+
+def reports_scene_rect(command):
+    """ Returns True if command (and all its children in case of a
+    macro) can tell which part of the scene it touches. Commands
+    which can't are the ones changing the structure of the canvas,
+    e.g. insertion of rows.
+
+    """
+
+    if hasattr(command, "scene_rect"):
+        return True
+
+    if command.childCount() == 0:
+        return False
+
+    return all(reports_scene_rect(command.child(index))
+               for index in range(command.childCount()))
+
+
+
+def cells_scene_rect(canvas, cells):
+    """ Returns the scene rectangle covered by the given grid cells,
+    i.e., grid items or PatternCanvasEntries, including the frame
+    the grid items paint around them.
+
+    """
+
+    cellWidth = canvas._unitCellDim.width()
+    cellHeight = canvas._unitCellDim.height()
+
+    rect = QRectF()
+    for cell in cells:
+        rect = rect.united(QRectF(cell.column * cellWidth,
+                                  cell.row * cellHeight,
+                                  cell.width * cellWidth,
+                                  cellHeight))
+
+    if rect.isNull():
+        return rect
+
+    return rect.adjusted(-GRID_PEN_SIZE, -GRID_PEN_SIZE,
+                         GRID_PEN_SIZE, GRID_PEN_SIZE)
+
+
+
+def items_scene_rect(items):
+    """ Returns the union of the scene bounding rectangles of items. """
+
+    rect = QRectF()
+    for item in items:
+        if item:
+            rect = rect.united(item.sceneBoundingRect())
+
+    return rect
+
+
+
 ###########################################################################
 #
 # the following classes encapsulate actions for the Undo/Redo framework
@@ -1063,6 +1156,16 @@ class ActivateSymbol(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Painting of selected cells is done by a separate
+        PaintCells command; we don't touch the scene.
+
+        """
+
+        return QRectF()
+
+
+
 
 class ActivateColor(QUndoCommand):
     """ This class encapsulates the management of the currently
@@ -1114,6 +1217,13 @@ class ActivateColor(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Changing the active color doesn't touch the scene. """
+
+        return QRectF()
+
+
+
 class PaintCells(QUndoCommand):
     """ This class encapsulates the canvas paint action. I.e. all
     currently selected cells are painted with the currently
@@ -1172,6 +1282,20 @@ class PaintCells(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle covered by all cells we
+        (un)selected or painted.
+
+        """
+
+        return cells_scene_rect(self.canvas,
+                                chain(self.selectedCells or [],
+                                      self.unselectedCells or [],
+                                      self.oldSelection.values(),
+                                      self.newSelection.values()))
+
+
+
     def _redo_selectedCells(self):
         """ Redo action for selected cells. """
 
@@ -1382,6 +1506,18 @@ class MoveCanvasItem(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle covered by the item at both
+        its old and new position.
+
+        """
+
+        rect = self.canvasItem.sceneBoundingRect()
+        shift = self.newPosition - self.oldPosition
+        return rect.translated(shift).united(rect.translated(-shift))
+
+
+
 class EditPatternRepeatLegend(QUndoCommand):
     """ This class encapsulates the editing of a legend for a
     pattern repeat item the canvas.
@@ -1411,6 +1547,13 @@ class EditPatternRepeatLegend(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle of the legend item. """
+
+        return self.gridLegend[self.itemID][1].sceneBoundingRect()
+
+
+
 
 class AddPatternRepeat(QUndoCommand):
     """ This class encapsulates the creation of a pattern repeat
@@ -1468,6 +1611,17 @@ class AddPatternRepeat(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle covered by the pattern repeat
+        and the cells we (un)selected.
+
+        """
+
+        return self.patternRepeat.sceneBoundingRect().united(
+                cells_scene_rect(self.canvas, self.unselectedCells))
+
+
+
 
 class EditPatternRepeat(QUndoCommand):
     """ This class encapsulates the editing of a pattern repeat
@@ -1502,6 +1656,13 @@ class EditPatternRepeat(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle of the pattern repeat. """
+
+        return self.patternRepeat.sceneBoundingRect()
+
+
+
 
 class DeletePatternRepeat(QUndoCommand):
     """ This class encapsulates the deletion of a pattern repeat
@@ -1534,6 +1695,13 @@ class DeletePatternRepeat(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle of the pattern repeat. """
+
+        return self.patternRepeat.sceneBoundingRect()
+
+
+
 
 class ColorSelectedCells(QUndoCommand):
     """ This class encapsulates coloring of all currently
@@ -1602,6 +1770,18 @@ class ColorSelectedCells(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle covered by the colored cells.
+
+        NOTE: Legend entries are removed and added as items and
+        thus take care of repainting themselves.
+
+        """
+
+        return cells_scene_rect(self.canvas, self.selectedCells.values())
+
+
+
 
 
 class AddRowRepeat(QUndoCommand):
@@ -1638,6 +1818,16 @@ class AddRowRepeat(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Only labels change which are re-created as new items
+        and take care of repainting themselves.
+
+        """
+
+        return QRectF()
+
+
+
 
 class DeleteRowRepeat(QUndoCommand):
     """ This class encapsulates the deletion of a row repeat
@@ -1676,6 +1866,16 @@ class DeleteRowRepeat(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Only labels change which are re-created as new items
+        and take care of repainting themselves.
+
+        """
+
+        return QRectF()
+
+
+
 
 class AddTextBox(QUndoCommand):
     """ This class encapsulates the addition of a text box
@@ -1717,6 +1917,13 @@ class AddTextBox(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle of the text box. """
+
+        return self.textItem.sceneBoundingRect()
+
+
+
 class DeleteTextBox(QUndoCommand):
     """ This class encapsulates the deletion of a text box
     item on the canvas.
@@ -1749,6 +1956,13 @@ class DeleteTextBox(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle of the text box. """
+
+        return self.textItem.sceneBoundingRect()
+
+
+
 class HideLegendItem(QUndoCommand):
     """ This class encapsulateds the hiding of a legend item on
     the canvas.
@@ -1781,6 +1995,13 @@ class HideLegendItem(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle of the legend entry. """
+
+        return items_scene_rect([self.legendItem, self.legendTextItem])
+
+
+
 class HideCells(QUndoCommand):
     """ This class encapsulates the hiding of grid cells
     on the pattern canvas.
@@ -1852,6 +2073,17 @@ class HideCells(QUndoCommand):
 
 
 
+    def scene_rect(self):
+        """ Return the scene rectangle of the hidden cells. Labels
+        are re-created and take care of repainting themselves.
+
+        """
+
+        return items_scene_rect(self.canvas._item_at_row_col(row, col)
+                                for (row, col) in self.hiddenItemsPositions)
+
+
+
 
 class UnhideCells(QUndoCommand):
     """ This class encapsulates the un-hiding (aka showing) of grid
@@ -1921,3 +2153,14 @@ class UnhideCells(QUndoCommand):
 
 
         self.canvas.set_up_labels()
+
+
+
+    def scene_rect(self):
+        """ Return the scene rectangle of the unhidden cells. Labels
+        are re-created and take care of repainting themselves.
+
+        """
+
+        return items_scene_rect(self.canvas._item_at_row_col(row, col)
+                                for (row, col) in self.unhiddenItemsPositions)
@@ -31,7 +31,9 @@ except ImportError:
     QString = str
 
 from PyQt4.QtCore import (QSettings, 
-                          QVariant)
+                          QTimer,
+                          QVariant,
+                          SIGNAL)
 
 from PyQt4.QtGui import QApplication
 from sconcho.gui.main_window import MainWindow
@@ -39,6 +41,10 @@ import sconcho.util.symbol_parser as parser
 import sconcho.util.messages as msg
 import sconcho.util.settings as settings
 import sconcho.util.misc as misc
+from sconcho.util.symbol_svg import set_icon_cache_path
+from sconcho.util.startup_timer import (start_phase_timer,
+                                        mark_phase,
+                                        finish_phase_timer)
 
 # module level logger:
 logger = logging.getLogger(__name__)
@@ -49,7 +55,8 @@ ORGANIZATION_DOMAIN = "sconcho.sourceforge.net"
 APPLICATION         = "sconcho"
 
 
-def sconcho_gui_launcher(currPath, defaultSettings, knittingSymbols, fileName):
+def sconcho_gui_launcher(currPath, defaultSettings, knittingSymbols, fileName,
+                         exitAfterStartup = False):
     """ Main routine starting up the sconcho framework. """
 
 
@@ -58,15 +65,37 @@ def sconcho_gui_launcher(currPath, defaultSettings, knittingSymbols, fileName):
     app.setOrganizationName(ORGANIZATION)
     app.setOrganizationDomain(ORGANIZATION_DOMAIN)
     app.setApplicationName(APPLICATION)
+    set_icon_cache_path(defaultSettings.icon_cache_path)
+    mark_phase("application")
     window = MainWindow(currPath, defaultSettings, knittingSymbols, fileName)
 
     window.show()
     if sys.platform == "darwin":
         window.raise_()
+    mark_phase("show main window")
+
+    # report once the event loop has processed the initial paint
+    # and the project passed on the command line is loaded
+    finish = partial(finish_startup, app, exitAfterStartup)
+    if window.is_loading_project():
+        window.connect(window, SIGNAL("project_loading_done"), finish)
+    else:
+        QTimer.singleShot(0, finish)
     app.exec_()
 
 
 
+def finish_startup(app, exitAfterStartup):
+    """ Report the startup phases and quit right away if requested
+    (e.g., for benchmarking startup).
+
+    """
+
+    if finish_phase_timer() and exitAfterStartup:
+        app.quit()
+
+
+
 def create_log_file(logPath):
     """ Initialize the log file """
 
@@ -142,7 +171,7 @@ def initialize_logger(logHandle):
 
 
 
-def main(fileName=None):
+def main(fileName=None, exitAfterStartup=False):
     """ This is a simple wrapper for starting the main
     sconcho sconcho.gui.
 
@@ -150,12 +179,19 @@ def main(fileName=None):
     passed. If yes, we assume the first one was meant to
     be a sconcho spf file and then pass it on to
     sconcho_gui_launcher().
+
+    NOTE: If the launcher already started the startup timer (to
+    include the import of this module) we keep it running.
     """
 
+    start_phase_timer()
+
     # load settings
     defaultSettings = settings.DefaultSettings(ORGANIZATION, APPLICATION)
+    mark_phase("settings")
     currPath = os.path.dirname(__file__)
     symbolPaths = misc.set_up_symbol_paths(currPath, defaultSettings)
+    mark_phase("symbol paths")
 
     # set up logging if requested
     doLogging = defaultSettings.doLogging.value
@@ -167,6 +203,7 @@ def main(fileName=None):
 
     install_exception_handler(logHandle)
     initialize_logger(logHandle)
+    mark_phase("logging")
 
     # check that file exists; this is required since Sconcho.app
     # on OS X seems to pass some bogus string that then causes
@@ -180,13 +217,16 @@ def main(fileName=None):
     # before firing up the MainWindow. At the very least we
     # require to find a symbol for a "knit" stitch. If not,
     # we terminate right away.
-    knittingSymbols = parser.parse_all_symbols(symbolPaths)
+    knittingSymbols = parser.parse_all_symbols(symbolPaths,
+                                    defaultSettings.symbol_cache_file)
     try:
         knittingSymbols[QString("knit")]
     except KeyError:
         sys.exit(msg.errorOpeningKnittingSymbols % symbolPaths)
+    mark_phase("parse symbols")
 
-    sconcho_gui_launcher(currPath, defaultSettings, knittingSymbols, fileName)
+    sconcho_gui_launcher(currPath, defaultSettings, knittingSymbols, fileName,
+                         exitAfterStartup)
     logging.shutdown()
 
 
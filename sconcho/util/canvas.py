@@ -911,6 +911,21 @@ def visible_bounding_rect(items):
 
 
 
+def unite_rects(rect, otherRect):
+    """ Returns the union of two rectangles. Contrary to 
+    QRectF.united a null rectangle does not contribute.
+
+    """
+
+    if rect.isNull():
+        return QRectF(otherRect)
+    elif otherRect.isNull():
+        return QRectF(rect)
+
+    return rect.united(otherRect)
+
+
+
 def repeats_to_be_shifted_after_insert_row(repeats, cellHeight,
                                            pivot, numRows):
     """ Determine all pattern repeats that need to be
@@ -20,13 +20,13 @@
 #######################################################################
 
 import logging
+import math
 import os
-import string
 import zipfile
 
-from tempfile import mkdtemp
 from functools import partial
-from shutil import (rmtree, move)
+from shutil import (copyfileobj,
+                    rmtree)
 
 from PyQt4.QtCore import (QDataStream, 
                           QFile, 
@@ -34,10 +34,9 @@ from PyQt4.QtCore import (QDataStream,
                           QIODevice, 
                           QLineF, 
                           QPointF,
-                          QRect, 
                           QRectF, 
+                          QSizeF, 
                           QReadWriteLock, 
-                          QSize, 
                           Qt, 
                           QTextStream, 
                           QThread, 
@@ -55,8 +54,6 @@ from PyQt4.QtXml import (QDomDocument,
                          QDomElement,
                          QDomNode)
 
-from PyQt4.QtSvg import QSvgGenerator
-
 from sconcho.gui.pattern_canvas_objects import (HiddenStitchManager,
                                                 PatternGridItem, 
                                                 PatternLegendItem,
@@ -64,11 +61,15 @@ from sconcho.gui.pattern_canvas_objects import (HiddenStitchManager,
 
 from sconcho.util.canvas import (legendItem_symbol, 
                                  legendItem_text,
-                                 sort_vertices,
-                                 visible_bounding_rect)
+                                 sort_vertices)
 
 from sconcho.util.misc import wait_cursor
+from sconcho.util.render_cache import (chart_digest,
+                                       get_render_cache)
+from sconcho.util.svg_writer import write_svg
 from sconcho.util.exceptions import PatternReadError
+from sconcho.util.svg_normalizer import normalize_svg_file
+from sconcho.util.symbol_parser import parse_knitting_symbol
 import sconcho.util.messages as msg
 
 
@@ -439,15 +440,101 @@ def write_section_header(stream, name, length):
 
 
 
+###########################################################################
+#
+# this is a simple wrapper around QThread to parse projects in a
+# separate thread. Parsing only produces plain data; the canvas
+# items are created on the GUI thread.
+#
+###########################################################################
+class ReadThread(QThread):
+
+    def __init__(self, openFileName, parent = None):
+
+        super(ReadThread, self).__init__(parent)
+
+        self.openFileName = openFileName
+
+
+    def run(self):
+        """ Main routine of our ReadThread. Calls parse_project
+        and emits a signal with the results and the recorded
+        settings when done.
+
+        """
+
+        recordedSettings = SettingsRecorder()
+        result = parse_project(recordedSettings, self.openFileName)
+        self.emit(SIGNAL("reading_done"), recordedSettings, result)
+
+
+
+###########################################################################
+#
+# stand-in for DefaultSettings while a project is parsed in a worker
+# thread. The parser only ever assigns to settings.<name>.value;
+# these assignments are recorded and applied to the real settings
+# on the GUI thread via apply().
+#
+###########################################################################
+class SettingsRecorder(object):
+
+    def __init__(self):
+
+        self._values = []
+
+
+    def __getattr__(self, name):
+
+        return RecordedSetting(self._values, name)
+
+
+    def apply(self, settings):
+        """ Apply all recorded values to settings. """
+
+        for (name, value) in self._values:
+            getattr(settings, name).value = value
+
+
+
+class RecordedSetting(object):
+
+    def __init__(self, values, name):
+
+        self._values = values
+        self._name = name
+
+
+    @property
+    def value(self):
+        raise AttributeError("recorded settings can not be read")
+
+
+    @value.setter
+    def value(self, newValue):
+        self._values.append((self._name, newValue))
+
+
+
 #############################################################################
 #
-# routines for writing a project.
+# routines for reading a project.
 #
 #############################################################################
 @wait_cursor
 def read_project(settings, openFileName):
     """ Toplevel reader routine. """
 
+    return parse_project(settings, openFileName)
+
+
+
+def parse_project(settings, openFileName):
+    """ Parse openFileName without touching the GUI so this can
+    run in a worker thread if settings is a SettingsRecorder.
+
+    """
+
     status = None
     handle = None
     try:
@@ -498,8 +585,8 @@ def read_project(settings, openFileName):
         if handle is not None:
             handle.close()
         if status is not None:
-            return (False, status, None, None, None, None, None, None, 
-                    None, None)
+            return (False, status, None, None, None, None, None, None,
+                    None, None, None, None)
 
     return (True, None, patternGridItems, legendItems, colors, 
             activeSymbol, patternRepeats, repeatLegends, rowRepeats,
@@ -1195,27 +1282,34 @@ def export_scene(canvas, width, height, dpi, exportFileName):
     # any currently selected legend items
     canvas.clearFocus()
 
+    # unchanged charts exported with identical parameters are
+    # served from the render cache
+    suffix = QFileInfo(exportFileName).completeSuffix()
+    cache = get_render_cache(canvas.settings)
+    if cache:
+        cacheKey = chart_digest(canvas, width, height, dpi, suffix)
+        if cache.fetch(cacheKey, suffix, exportFileName):
+            return
+
     with HiddenStitchManager(canvas):
 
         # NOTE: We seem to need the 1px buffer region to avoid
         # the image being cut off
         margin = 10
-        theScene = visible_bounding_rect(canvas.items())
+        theScene = canvas.visible_scene_bounds(True)
         theScene.adjust(-margin, -margin, margin, margin)
 
         # check if user requested an svg file
-        svg = True if QFileInfo(exportFileName).completeSuffix() == "svg" \
-                else False
+        svg = True if suffix == "svg" else False
 
         if svg:
-            generator = QSvgGenerator()
-            generator.setFileName(exportFileName)
-            generator.setSize(QSize(width, height))
-            generator.setViewBox(QRect(0, 0, width, height))
-            generator.setTitle("sconcho generated SVG image")
-            generator.setDescription("this svg image was exported from "
-                                     "a sconcho project")
-            generator.setResolution(dpi)
+            (status, errMsg) = write_svg(canvas, width, height, theScene,
+                                         exportFileName)
+            if not status:
+                QMessageBox.critical(None, msg.errorExportingPatternTitle,
+                                     msg.errorExportingPatternText % errMsg,
+                                     QMessageBox.Close)
+                return
         else:
             generator = QImage(width+2*margin, height+2*margin, 
                                QImage.Format_ARGB32_Premultiplied)
@@ -1225,18 +1319,22 @@ def export_scene(canvas, width, height, dpi, exportFileName):
             generator.setDotsPerMeterX(dpi*inchesToMeter)
             generator.setDotsPerMeterY(dpi*inchesToMeter)
 
+            painter = QPainter(generator)
+            painter.setRenderHints(QPainter.SmoothPixmapTransform 
+                                   | QPainter.HighQualityAntialiasing 
+                                   | QPainter.TextAntialiasing )
+            painter.setBackgroundMode(Qt.TransparentMode )
 
-        painter = QPainter(generator)
-        painter.setRenderHints(QPainter.SmoothPixmapTransform 
-                               | QPainter.HighQualityAntialiasing 
-                               | QPainter.TextAntialiasing )
-        painter.setBackgroundMode(Qt.TransparentMode )
+            canvas.render(painter, QRectF(), theScene )
+            painter.end()
 
-        canvas.render(painter, QRectF(), theScene )
-        painter.end()
+            if not generator.save(exportFileName):
+                logger.error("export_scene: failed to write %s" %
+                             exportFileName)
+                return
 
-        if not svg:
-            generator.save(exportFileName)
+    if cache:
+        cache.store(cacheKey, suffix, exportFileName)
 
 
 
@@ -1246,9 +1344,59 @@ def export_scene(canvas, width, height, dpi, exportFileName):
 #
 ############################################################################
 def printer(canvas, printer):
-    """ The main print routine. """
+    """ The main print routine.
+
+    Unless pagination is turned off, the chart is printed at the
+    cell size requested in the settings and split across as many
+    pages as needed.
+
+    """
+
+    settings = canvas.settings
+    if not settings.printPaginate.value:
+        print_single_page(canvas, printer)
+        return
+
+    # conversion factor from scene to printer device coordinates
+    cellSize = settings.printCellSize.value/25.4 * printer.resolution()
+    scale = cellSize/canvas.cell_width
+    pageRect = printer.pageRect()
+    pageSize = QSizeF(pageRect.width()/scale, pageRect.height()/scale)
+
+    strips = {}
+    if settings.printRepeatLabels.value:
+        strips = get_label_strips(canvas)
+
+    bounds = canvas.visible_scene_bounds()
+    tiles = paginate(bounds, canvas.cell_width, canvas.cell_height,
+                     pageSize, settings.printPageOverlap.value, strips)
+
+    painter = QPainter(printer)
+    painter.setRenderHints(QPainter.SmoothPixmapTransform
+                          | QPainter.HighQualityAntialiasing
+                          | QPainter.TextAntialiasing)
+
+    firstPage = True
+    for tile in tiles:
+
+        # skip pages which would end up empty
+        if not any(item.isVisible() for item in canvas.items(tile)):
+            continue
+
+        if not firstPage:
+            printer.newPage()
+        firstPage = False
+
+        print_page(canvas, painter, tile, strips, scale)
+
+    painter.end()
+
 
-    theScene = visible_bounding_rect(canvas.items()) 
+
+def print_single_page(canvas, printer):
+    """ Print the whole chart scaled to fit onto a single page. """
+
+    theScene = canvas.visible_scene_bounds()
     theScene.adjust(-10, -10, 10, 10)
 
     painter = QPainter(printer)
@@ -1260,6 +1408,153 @@ def printer(canvas, printer):
 
 
 
+def print_page(canvas, painter, tile, strips, scale):
+    """ Render a single page showing the scene region tile.
+
+    The parts of the row and column label strips lying outside of
+    tile are repeated next to it; strips (or parts thereof) already
+    contained in tile are not. QGraphicsScene.render only paints
+    the items intersecting the requested region, hence the cost per
+    page does not depend on the overall size of the chart.
+
+    """
+
+    repeated = repeated_strips(tile, strips)
+    left = repeated["left"].width() if "left" in repeated else 0
+    top = repeated["top"].height() if "top" in repeated else 0
+
+    target = QRectF(left * scale, top * scale,
+                    tile.width() * scale, tile.height() * scale)
+    canvas.render(painter, target, tile)
+
+    for (side, source) in repeated.items():
+        if side in ["left", "right"]:
+            x = 0 if side == "left" else left + tile.width()
+            stripTarget = QRectF(x * scale, top * scale,
+                                 source.width() * scale,
+                                 tile.height() * scale)
+        else:
+            y = 0 if side == "top" else top + tile.height()
+            stripTarget = QRectF(left * scale, y * scale,
+                                 tile.width() * scale,
+                                 source.height() * scale)
+
+        canvas.render(painter, stripTarget, source)
+
+
+
+def repeated_strips(tile, strips):
+    """ Returns a dictionary with the scene rectangles of the parts
+    of the label strips which lie outside of tile and thus have to
+    be repeated next to it. Strips fully contained in tile are
+    omitted.
+
+    """
+
+    repeated = {}
+    for (side, strip) in strips.items():
+        if side == "left":
+            left = strip.left()
+            right = min(strip.right(), tile.left())
+        elif side == "right":
+            left = max(strip.left(), tile.right())
+            right = strip.right()
+        elif side == "top":
+            top = strip.top()
+            bottom = min(strip.bottom(), tile.top())
+        else:
+            top = max(strip.top(), tile.bottom())
+            bottom = strip.bottom()
+
+        if side in ["left", "right"]:
+            if right > left:
+                repeated[side] = QRectF(left, tile.top(), right - left,
+                                        tile.height())
+        elif bottom > top:
+            repeated[side] = QRectF(tile.left(), top, tile.width(),
+                                    bottom - top)
+
+    return repeated
+
+
+
+def get_label_strips(canvas):
+    """ Returns a dictionary with the scene rectangles occupied by
+    the visible row labels left and right of the grid and the column 
+    labels above and below of it.
+
+    """
+
+    gridCenter = QPointF(canvas._numColumns * canvas.cell_width * 0.5,
+                         canvas._numRows * canvas.cell_height * 0.5)
+
+    strips = {}
+    for label in canvas.rowLabels.values():
+        if not label.isVisible():
+            continue
+        rect = label.sceneBoundingRect()
+        side = "left" if rect.center().x() < gridCenter.x() else "right"
+        strips[side] = strips[side].united(rect) if side in strips else rect
+
+    for label in canvas.columnLabels.values():
+        if not label.isVisible():
+            continue
+        rect = label.sceneBoundingRect()
+        side = "top" if rect.center().y() < gridCenter.y() else "bottom"
+        strips[side] = strips[side].united(rect) if side in strips else rect
+
+    return strips
+
+
+
+def paginate(bounds, cellWidth, cellHeight, pageSize, overlap, strips):
+    """ Split bounds into tiles fitting onto pages of pageSize 
+    (in scene coordinates) and return them in reading order.
+
+    Tiles are aligned to the grid cells and consecutive tiles share 
+    overlap rows and columns. Space for repeated label strips is
+    reserved on each page.
+
+    """
+
+    availWidth = pageSize.width()
+    for side in ["left", "right"]:
+        if side in strips:
+            availWidth -= strips[side].width()
+
+    availHeight = pageSize.height()
+    for side in ["top", "bottom"]:
+        if side in strips:
+            availHeight -= strips[side].height()
+
+    numColumns = max(1, int(availWidth/cellWidth))
+    numRows = max(1, int(availHeight/cellHeight))
+    tileWidth = numColumns * cellWidth
+    tileHeight = numRows * cellHeight
+    stepX = max(1, numColumns - overlap) * cellWidth
+    stepY = max(1, numRows - overlap) * cellHeight
+
+    startX = math.floor(bounds.left()/cellWidth) * cellWidth
+    startY = math.floor(bounds.top()/cellHeight) * cellHeight
+
+    tiles = []
+    y = startY
+    while y < bounds.bottom():
+        x = startX
+        while x < bounds.right():
+            tiles.append(QRectF(x, y, tileWidth, tileHeight))
+            if x + tileWidth >= bounds.right():
+                break
+            x += stepX
+
+        if y + tileHeight >= bounds.bottom():
+            break
+        y += stepY
+
+    return tiles
+
+
+
 ############################################################################
 #
 # helper functions
@@ -1395,6 +1690,9 @@ def writezip(q_directory, q_zipFileName):
     """ Generate a zipfile of name zipFileName recursively
     of directory.
 
+    Files are streamed into the archive while walking the
+    directory tree.
+
     """
 
     # convert to python strings
@@ -1405,39 +1703,44 @@ def writezip(q_directory, q_zipFileName):
         return False
 
     try:
-        # gather all files
-        files = []
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for filename in filenames:
-                filePath = os.path.join(dirpath, filename)
-                shortFilepath = \
-                    os.path.join("sconcho_symbols/",
-                            str(dirpath[len(directory)+1:]), filename)
-                files.append((filePath, shortFilepath))
-
-        # add them to the zipfile
-        zipper = zipfile.ZipFile(zipFileName, "w",)
-        for (filename, shortFilename) in files:
-            zipper.write(filename, shortFilename)
-        zipper.close()
+        with zipfile.ZipFile(zipFileName, "w") as zipper:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    filePath = os.path.join(dirpath, filename)
+                    shortFilepath = \
+                        os.path.join("sconcho_symbols/",
+                                str(dirpath[len(directory)+1:]), filename)
+                    zipper.write(filePath, shortFilepath)
 
         return True
 
     # if something goes wrong we just give up
     except Exception as e:
-        #logger.error("Failed to package zip archive with custom symbols "
-        #             "due to ", e)
+        logger.error(msg.failedToExportSymbolError % e)
         return False
 
 
 
-def readSymbolZip(q_directory, q_zipFileName):
+def readSymbolZip(q_directory, q_zipFileName, progress = None,
+                  normalize = False):
     """ Read a zipped up archive of a custom sconcho symbols.
 
     This function does sanity checking and will only
     accept symbols that have the expected directory structure
     and won't overwrite already existing symbols.
 
+    The archive layout is validated from the zip member list alone
+    and each accepted symbol is streamed straight from the archive
+    into place, so every member is read exactly once. If given,
+    progress(numDone, numTotal) is called after each symbol and
+    may return False to cancel the import. If normalize is True
+    the svg images of imported symbols are normalized.
+
+    Returns a tuple (status, importedSymbols, problems) with the
+    list of imported symbol directories and a list of messages
+    describing each skipped symbol or archive entry.
+
     """
 
     # convert to python strings
@@ -1450,120 +1753,134 @@ def readSymbolZip(q_directory, q_zipFileName):
         try:
             os.mkdir(directory)
         except Exception as e:
-            return False
+            return (False, [], [msg.failedToImportSymbolError % e])
 
     # make sure zipfile exists
     if not os.path.isfile(zipFileName):
-        return False
+        return (False, [], [])
 
-    # if we encounter an exception we just give up
-    # we'll unpack things in a temp directory and then
-    # move it in place
-    with TempDir() as tempDir:
+    importedSymbols = []
+    problems = []
+    try:
+        with zipfile.ZipFile(zipFileName, "r") as zipper:
+            symbolMembers = collect_symbol_members(zipper, problems)
 
-        # unpack into tempdir
-        try:
-            with zipfile.ZipFile(zipFileName, "r") as zipper:
-                if zipper.testzip():
-                    return False
+            numSymbols = len(symbolMembers)
+            for (count, dirName) in enumerate(sorted(symbolMembers)):
+                problem = import_symbol_members(zipper, dirName,
+                                                symbolMembers[dirName],
+                                                directory, normalize)
+                if problem:
+                    logger.error(problem)
+                    problems.append(problem)
+                else:
+                    importedSymbols.append(dirName)
 
-                files = zipper.namelist()
-                for file in files:
-                    if string.find(file, "..") > 0:
-                        continue
+                if progress and progress(count + 1, numSymbols) is False:
+                    break
 
-                    zipper.extract(file, tempDir)
+    except (zipfile.BadZipfile, IOError, OSError) as e:
+        logger.error(msg.failedToUnpackZipFile % e)
+        return (False, importedSymbols, problems + 
+                [msg.failedToUnpackZipFile % e])
 
-        except Exception as e:
-            logger.error(msg.failedToUnpackZipFile % e)
-            return False
+    return (not problems, importedSymbols, problems)
 
 
-        # check each symbol directory for presence of a decription
-        # file and an svg image with the same name as the directory.
-        # Then check, that we can copy it into the custom symbol 
-        # directory without a collision. If all is well, move it there.
-        status = True
-        try:
-            topFiles = os.listdir(tempDir)
-            if len(topFiles) != 1 and topFiles[0] == "sconcho_symbols":
-                return False
-
-            allSymbolDirName = os.path.join(tempDir, "sconcho_symbols")
-            patternDirs = os.listdir(allSymbolDirName)
-            for dirName in patternDirs:
-
-                symbolDirName = os.path.join(allSymbolDirName, dirName)
-
-                # skip non-directories
-                if not os.path.isdir(symbolDirName):
-                    continue
-
-                dirContents = os.listdir(symbolDirName)
-                svgName = dirName + ".svg"
-                if not ("description" in dirContents and
-                        svgName in dirContents):
-                    logger.error(msg.directoryLayoutIncorrect % symbolDirName)
-                    status = False
-                    continue
-
-                # at this point content looks ok. Now check if there are
-                # filename clashes
-                targetPath = os.path.join(directory, dirName)
-                if os.path.exists(targetPath):
-                    logger.error(msg.symbolAlreadyExistsText % targetPath)
-                    status = False
-                    continue
-
-                # no clashes - we're good to go, let's move the files
-                os.mkdir(targetPath)
-                descriptionSrc = os.path.join(symbolDirName, "description")
-                descriptionDest = os.path.join(targetPath, "description")
-                move(descriptionSrc, descriptionDest)
-
-                svgSrc = os.path.join(symbolDirName, svgName)
-                svgDest = os.path.join(targetPath, svgName)
-                move(svgSrc, svgDest)
 
-        except Exception as e:
-            logger.error(msg.failedToImportSymbolError % e)
-            return False
+def collect_symbol_members(zipper, problems):
+    """ Group the members of zipper by symbol directory.
 
-    # all ok
-    return status 
+    Only entries of the form sconcho_symbols/<symbol>/<file> are
+    accepted; anything else is reported in problems.
 
+    """
 
+    symbolMembers = {}
+    for info in zipper.infolist():
 
+        # skip directory entries
+        if info.filename.endswith("/"):
+            continue
 
-#################################################################
-#
-# simple helper class wrapping a temporary directory inside
-# a context manager so we don't have to worry about cleanup
-#
-#################################################################
-class TempDir(object):
-    """ Context manager for seamless creation and removal of
-    temporary directories.
+        parts = info.filename.split("/")
+        if len(parts) != 3 or parts[0] != "sconcho_symbols" or \
+           not is_safe_member_name(parts[1]) or \
+           not is_safe_member_name(parts[2]):
+            problem = msg.symbolArchiveEntryInvalid % info.filename
+            logger.error(problem)
+            problems.append(problem)
+            continue
 
-    """
+        symbolMembers.setdefault(parts[1], {})[parts[2]] = info
 
-    def __enter__(self):
-        """ Create the temporary directory. """
+    return symbolMembers
 
-        self.tempDir = mkdtemp()
-        return self.tempDir
 
 
-    def __exit__(self, exc_class, exc_instance, traceback):
-        """ Remove temporary directory and everything underneath. 
+def is_safe_member_name(name):
+    """ Check that name can safely be used as a file name. """
+
+    return bool(name) and not name.startswith(".") and \
+           "\\" not in name and ":" not in name
 
-        NOTE: rmtree is dangerous. However, since we're creating
-        the temporary directory ourselves it should probably be
-        safe to do here.
-        """
 
-        if os.path.isdir(self.tempDir):
-            rmtree(self.tempDir)
+
+def import_symbol_members(zipper, dirName, members, directory,
+                          normalize = False):
+    """ Stream the archive members of the symbol dirName into
+    directory.
+
+    The files are written into a hidden staging directory first which
+    is renamed once the symbol was found valid, so neither the symbol
+    parser nor the symbol watcher ever see half imported symbols.
+    Returns None on success and a message describing the problem
+    otherwise.
+
+    """
+
+    svgName = dirName + ".svg"
+    if not ("description" in members and svgName in members):
+        return msg.directoryLayoutIncorrect % dirName
+
+    # check for filename clashes
+    targetPath = os.path.join(directory, dirName)
+    if os.path.exists(targetPath):
+        return msg.symbolAlreadyExistsText % targetPath
+
+    stagingPath = os.path.join(directory, "." + dirName + ".import")
+    try:
+        if os.path.exists(stagingPath):
+            rmtree(stagingPath)
+        os.mkdir(stagingPath)
+
+        # this also verifies the CRC of each member
+        for fileName in ("description", svgName):
+            with zipper.open(members[fileName]) as source:
+                with open(os.path.join(stagingPath, fileName), "wb") as target:
+                    copyfileobj(source, target)
+
+        symbol = parse_knitting_symbol(stagingPath.replace("\\", "/"))
+        if not symbol:
+            rmtree(stagingPath)
+            return msg.symbolDescriptionInvalid % dirName
+
+        if normalize:
+            (status, message) = normalize_svg_file(
+                                    os.path.join(stagingPath, svgName),
+                                    30 * int(symbol["width"]))
+            if not status:
+                rmtree(stagingPath)
+                return "%s: %s" % (dirName, message)
+
+        os.rename(stagingPath, targetPath)
+
+    except (zipfile.BadZipfile, IOError, OSError, ValueError) as e:
+        if os.path.isdir(stagingPath):
+            rmtree(stagingPath)
+        return msg.failedToImportSymbolError % e
+
+    return None
 
 
 
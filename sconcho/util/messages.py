@@ -93,6 +93,11 @@ errorSavingProjectTitle = "sconcho: Error Saving Project"
 errorOpeningProjectTitle = "sconcho: Error Opening Project"
 
 
+errorExportingPatternTitle = "sconcho: Error Exporting Pattern"
+errorExportingPatternText = ("Sorry, the pattern could not be exported:\n"
+                             "%s")
+
+
 ########################################################################
 ##
 ## exportBitmapDialog messages
@@ -279,7 +284,19 @@ symbolAlreadyExistsText = ("Symbol %s already exists. Refused to import "
                            "new symbol.")
 
 
-failedToImportSymbolError = ("Failed to import custom symbols due to % ")
+failedToImportSymbolError = ("Failed to import custom symbols due to %s.")
+
+
+failedToExportSymbolError = ("Failed to package zip archive with custom "
+                             "symbols due to %s.")
+
+
+symbolArchiveEntryInvalid = ("Archive entry %s is not part of a symbol "
+                             "directory. Skipping entry.")
+
+
+symbolDescriptionInvalid = ("Description of new symbol %s is invalid. "
+                            "Skipping import of symbol.")
 
 
 
@@ -292,6 +309,31 @@ failedToUnpackZipFile = ("Failed to unpack zip archive with custom symbols "
  
 
 
+########################################################################
+#
+# messages for svg normalization
+#
+########################################################################
+svgNormalizeParseError = "The svg image could not be parsed: %s."
+
+
+svgNormalizeNotSvg = "The file does not contain an svg image."
+
+
+svgNormalizeBitmap = ("The svg image contains embedded bitmaps. Please "
+                      "use a pure vector image for your symbol.")
+
+
+svgNormalizeReadError = "Failed to read svg image %s -- %s."
+
+
+svgNormalizeWriteError = "Failed to write normalized svg image %s -- %s."
+
+
+svgNormalizeReport = ("size %d -> %d bytes, render time %.2f -> %.2f ms")
+
+
+
 ########################################################################
 #
 # messages for symbolParser
@@ -302,6 +344,9 @@ failedToCopySvgText  = ("Error: Failed to copy SVG image %s into sconcho "
                         "database." )
 
 
+failedToNormalizeSvgTitle = "sconcho: Add Symbol Error"
+
+
 failedCreateDescriptionFileTitle = "sconcho: Add Symbol Error"
 failedCreateDescriptionFileText  = ("Error: Failed to create the "
         "description file for the symbol %s in category %s.")
@@ -368,12 +413,33 @@ cannotImportSymbolsText = ("Sorry, some or all of the symbols from the "
                            "check logs for more detail)")
 
 
+symbolImportProblemsText = ("Imported %d of the symbols in the symbol "
+                            "archive. The following problems were "
+                            "encountered:<p>%s")
+
+
+importingSymbolsText = "Importing custom symbols ..."
+
+
 restartAfterImportTitle = "sconcho: Please restart sconcho"
 restartAfterImportText = ("Please restart sconcho to make your newly "
                           "imported symbols available within sconcho.")
 
 
 
+########################################################################
+#
+# messages for the diagnostic tools
+#
+########################################################################
+exportPaintTraceTitle = "sconcho: Export Paint Trace"
+noPaintTraceText = ("No frames have been profiled yet. Please turn on "
+                    "Tools -> Paint Profiler and interact with the "
+                    "chart first.")
+errorExportingPaintTraceText = "Could not write paint trace:\n%s"
+
+
+
 ########################################################################
 #
 # messages for patternRepeatRowEditor dialog 
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import hashlib
+import logging
+import os
+
+from shutil import copyfile
+
+from PyQt4.QtCore import (QBuffer,
+                          QByteArray,
+                          QDataStream,
+                          QIODevice)
+
+from sconcho.gui.pattern_canvas_objects import PatternGridItem
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+# bump this whenever the rendering code changes in a way that
+# invalidates previously cached output
+RENDER_CACHE_VERSION = 1
+
+
+
+def chart_digest(canvas, *renderParameters):
+    """ Returns a hex digest uniquely identifying the rendered
+    appearance of canvas together with the given render parameters
+    (size, dpi, format, ...).
+
+    The digest covers the cell size, the symbols, colors, hidden and
+    selection state of all grid cells, the position, visibility and text of all
+    other items, the modification time of the used symbol svg files
+    and the settings affecting rendering.
+
+    """
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    stream = QDataStream(buffer)
+    stream.setVersion(QDataStream.Qt_4_5)
+
+    stream.writeInt32(RENDER_CACHE_VERSION)
+    for parameter in renderParameters:
+        stream.writeQString("%s" % parameter)
+
+    stream.writeDouble(canvas.cell_width)
+    stream.writeDouble(canvas.cell_height)
+
+    gridItems = []
+    otherItems = []
+    for item in canvas.items():
+        if isinstance(item, PatternGridItem):
+            gridItems.append(item)
+        else:
+            otherItems.append(item)
+
+    symbolPaths = set()
+    gridItems.sort(key=lambda item: (item.row, item.column))
+    for item in gridItems:
+        symbolPaths.add(item.symbol["svgPath"])
+        stream.writeQString(item.symbol["svgPath"])
+        stream.writeInt32(item.column)
+        stream.writeInt32(item.row)
+        stream.writeInt32(item.width)
+        stream << item.color
+        stream.writeBool(item.isHidden)
+        stream.writeBool(item.isVisible())
+
+        # selected cells are rendered highlighted
+        stream.writeBool(item._selected)
+
+    # non grid items are few so we simply capture everything
+    # that influences their appearance
+    otherItems.sort(key=lambda item: (item.type(), item.scenePos().x(),
+                                      item.scenePos().y()))
+    for item in otherItems:
+        stream.writeInt32(item.type())
+        stream.writeBool(item.isVisible())
+        stream.writeDouble(item.opacity())
+        stream << item.scenePos()
+        stream << item.boundingRect()
+        if hasattr(item, "toPlainText"):
+            stream.writeQString(item.toPlainText())
+        if hasattr(item, "symbol") and item.symbol:
+            symbolPaths.add(item.symbol["svgPath"])
+            stream.writeQString(item.symbol["svgPath"])
+        if hasattr(item, "color"):
+            stream << item.color
+
+    for path in sorted(symbolPaths):
+        stream.writeQString(path)
+        try:
+            stream.writeDouble(os.path.getmtime(path))
+        except OSError:
+            stream.writeDouble(0.0)
+
+    settings = canvas.settings
+    stream << settings.labelFont.value
+    stream << settings.legendFont.value
+    stream.writeQString(settings.highlightRowsColor.value)
+    stream.writeInt32(settings.highlightRowsOpacity.value)
+
+    buffer.close()
+    return hashlib.sha1(bytes(data)).hexdigest()
+
+
+
+##########################################################################
+#
+# Simple on disk cache for rendered output (exported images, print
+# previews, headless renders). Entries are files named after the
+# chart digest; least recently used entries are evicted once the
+# cache exceeds its maximum size.
+#
+##########################################################################
+class RenderCache(object):
+
+
+    def __init__(self, cachePath, maxSize):
+        """ Initialize the cache at cachePath holding at most maxSize
+        bytes.
+
+        """
+
+        self.cachePath = cachePath
+        self.maxSize = maxSize
+
+
+
+    def entry_path(self, key, suffix):
+        """ Returns the path of the cache entry for key. """
+
+        return os.path.join(self.cachePath, "%s.%s" % (key, suffix))
+
+
+
+    def fetch(self, key, suffix, targetPath):
+        """ Copy the entry for key to targetPath if present.
+        Returns True on a cache hit and False otherwise.
+
+        """
+
+        entryPath = self.entry_path(key, suffix)
+        if not os.path.isfile(entryPath):
+            return False
+
+        try:
+            copyfile(entryPath, targetPath)
+
+            # mark entry as most recently used
+            os.utime(entryPath, None)
+        except (IOError, OSError) as e:
+            logger.warn("RenderCache: failed to fetch %s -- %s" %
+                        (entryPath, e))
+            return False
+
+        return True
+
+
+
+    def store(self, key, suffix, sourcePath):
+        """ Add the file at sourcePath to the cache under key. """
+
+        if not os.path.isdir(self.cachePath):
+            try:
+                os.makedirs(self.cachePath)
+            except OSError as e:
+                logger.warn("RenderCache: failed to create %s -- %s" %
+                            (self.cachePath, e))
+                return
+
+        entryPath = self.entry_path(key, suffix)
+        try:
+            copyfile(sourcePath, entryPath)
+        except (IOError, OSError) as e:
+            logger.warn("RenderCache: failed to store %s -- %s" %
+                        (entryPath, e))
+            return
+
+        self.evict()
+
+
+
+    def evict(self):
+        """ Remove least recently used entries until the total
+        size of the cache is below maxSize.
+
+        """
+
+        evict_cache_files(self.cachePath, self.maxSize)
+
+
+
+def evict_cache_files(cachePath, maxSize):
+    """ Remove the least recently used files anywhere below
+    cachePath until their total size is below maxSize bytes.
+    Files are considered used when they were last modified.
+
+    """
+
+    entries = []
+    totalSize = 0
+    for (root, dummy, names) in os.walk(cachePath):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+            totalSize += info.st_size
+
+    entries.sort()
+    for (dummy, size, path) in entries:
+        if totalSize <= maxSize:
+            break
+        try:
+            os.remove(path)
+            totalSize -= size
+        except OSError as e:
+            logger.warn("evict_cache_files: failed to evict %s -- %s" %
+                        (path, e))
+
+
+
+def get_render_cache(settings):
+    """ Returns the render cache configured in settings or None
+    if caching is turned off.
+
+    """
+
+    maxSize = settings.renderCacheSize.value
+    if maxSize <= 0:
+        return None
+
+    return RenderCache(settings.renderCachePath.value, maxSize * 1024**2)
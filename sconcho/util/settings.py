@@ -22,10 +22,14 @@
 import logging 
 
 from PyQt4.QtCore import (QByteArray,
+                          QCoreApplication,
                           QDir,
+                          QFileInfo,
                           QPoint,
                           QSettings, 
-                          QSize)
+                          QSize,
+                          QTimer,
+                          SIGNAL)
 
 from PyQt4.QtGui import (QFont, 
                          QFontDatabase)
@@ -47,6 +51,11 @@ class DefaultSettings(QSettings):
     given category (labels, legend, etc.) can be made the default via
     pressing the corresponding 'Make Defaults' button.
 
+    The values of all preference settings are kept in a typed in
+    memory cache. Changes update the cache right away, are written
+    through to QSettings once control returns to the event loop and
+    are announced via the setting_changed signal.
+
     """
 
     # defaults 
@@ -88,6 +97,21 @@ class DefaultSettings(QSettings):
     
     DEFAULT_NUM_RECENT_SYMBOLS = "5"
 
+    # printing: charts which don't fit on a single page at the
+    # requested cell size (in mm) are split across several pages
+    DEFAULT_PRINT_PAGINATE = "1"
+    DEFAULT_PRINT_CELL_SIZE = "5"
+    DEFAULT_PRINT_PAGE_OVERLAP = "1"     # in grid cells
+    DEFAULT_PRINT_REPEAT_LABELS = "1"
+
+    # cache for rendered output; size in MB, 0 turns it off
+    DEFAULT_RENDER_CACHE_PATH = QDir.convertSeparators(
+            QDir.homePath() + "/.sconcho_cache")
+    DEFAULT_RENDER_CACHE_SIZE = "100"
+
+    # normalize the svg images of new custom symbols
+    DEFAULT_NORMALIZE_CUSTOM_SYMBOLS = "1"
+
 
 
     def __init__(self, organization, application, parent = None):
@@ -99,6 +123,15 @@ class DefaultSettings(QSettings):
         # remove old "global" namespace
         self.remove("global")
 
+        # writes of changed preference settings pending until the
+        # next pass through the event loop
+        self._pendingWrites = {}
+        self._writeTimer = QTimer(self)
+        self._writeTimer.setSingleShot(True)
+        self._writeTimer.setInterval(0)
+        self.connect(self._writeTimer, SIGNAL("timeout()"),
+                     self.write_pending_settings)
+
         # create all settings objects we need
         self.gridCellWidth = PreferenceSetting(self, 
                 DefaultSettings.DEFAULT_GRID_CELL_WIDTH,
@@ -208,6 +241,74 @@ class DefaultSettings(QSettings):
                 DefaultSettings.DEFAULT_NUM_RECENT_SYMBOLS,
                 "numRecentSymbols", "Int")
 
+        self.printPaginate = PreferenceSetting(self, 
+                DefaultSettings.DEFAULT_PRINT_PAGINATE,
+                "printPaginate", "Int")
+
+        self.printCellSize = PreferenceSetting(self, 
+                DefaultSettings.DEFAULT_PRINT_CELL_SIZE,
+                "printCellSize", "Int")
+
+        self.printPageOverlap = PreferenceSetting(self, 
+                DefaultSettings.DEFAULT_PRINT_PAGE_OVERLAP,
+                "printPageOverlap", "Int")
+
+        self.printRepeatLabels = PreferenceSetting(self, 
+                DefaultSettings.DEFAULT_PRINT_REPEAT_LABELS,
+                "printRepeatLabels", "Int")
+
+        self.renderCachePath = PreferenceSetting(self, 
+                DefaultSettings.DEFAULT_RENDER_CACHE_PATH,
+                "renderCachePath", "QString")
+
+        self.renderCacheSize = PreferenceSetting(self, 
+                DefaultSettings.DEFAULT_RENDER_CACHE_SIZE,
+                "renderCacheSize", "Int")
+
+        self.normalizeCustomSymbols = PreferenceSetting(self, 
+                DefaultSettings.DEFAULT_NORMALIZE_CUSTOM_SYMBOLS,
+                "normalizeCustomSymbols", "Int")
+
+
+
+    def schedule_write(self, name, value):
+        """ Queue value to be written to the setting name.
+
+        Without a running application there is no event loop to
+        flush the queue and we write right away.
+
+        """
+
+        if not QCoreApplication.instance():
+            self.setValue(name, value)
+            return
+
+        self._pendingWrites[name] = copy_value(value)
+        if not self._writeTimer.isActive():
+            self._writeTimer.start()
+
+
+
+    def write_pending_settings(self):
+        """ Write all queued setting changes to QSettings. """
+
+        self._writeTimer.stop()
+        pendingWrites = self._pendingWrites
+        self._pendingWrites = {}
+        for (name, value) in pendingWrites.items():
+            self.setValue(name, value)
+
+
+
+    def sync(self):
+        """ Flush all queued changes before syncing the settings
+        to permanent storage.
+
+        """
+
+        self.write_pending_settings()
+        super(DefaultSettings, self).sync()
+
 
     @property
     def main_window_size(self):
@@ -319,12 +420,52 @@ class DefaultSettings(QSettings):
 
 
 
+    @property
+    def symbol_cache_file(self):
+        """ Return the path of the cache file for parsed knitting
+        symbol descriptions. 
+
+        The cache lives next to the settings file. If the settings
+        are not stored in a file (e.g. in the Windows registry) we
+        fall back to the render cache directory.
+
+        """
+
+        settingsDir = QFileInfo(self.fileName()).absoluteDir()
+        if settingsDir.exists():
+            cacheDir = settingsDir.absolutePath()
+        else:
+            cacheDir = DefaultSettings.DEFAULT_RENDER_CACHE_PATH
+
+        return QDir.convertSeparators(cacheDir + "/symbol_cache.json")
+
+
+
+    @property
+    def icon_cache_path(self):
+        """ Return the directory for pre-rendered symbol icons or
+        None if on disk caching is turned off.
+
+        """
+
+        if self.renderCacheSize.value <= 0:
+            return None
+
+        return QDir.convertSeparators(self.renderCachePath.value + "/icons")
+
+
+
 
 ####################################################################
 #
 # this class wraps individual settings and provides getters and
 # setters for session and default values.
 #
+# The session value is converted to returnType once and cached;
+# reads never touch QSettings. Setting a new value updates the
+# cache, queues the write to QSettings with the parent settings and
+# emits setting_changed(name, value) on them.
+#
 ####################################################################
 class PreferenceSetting(object):
 
@@ -332,6 +473,7 @@ class PreferenceSetting(object):
     def __init__(self, settings, defaultValue, name, 
                  returnType = "String", errorMsg = ""):
 
+        self.name = name
         self.sessionName = "session/" + name
         self.defaultName = "default/" + name
         self.returnType = returnType
@@ -347,6 +489,9 @@ class PreferenceSetting(object):
         defaultVal = self.settings.value(self.defaultName)
         self.settings.setValue(self.sessionName, defaultVal)
 
+        self._sessionValue = defaultVal
+        self._cachedValue = self._convert(defaultVal)
+
 
         
 
@@ -354,26 +499,12 @@ class PreferenceSetting(object):
     def value(self):
         """ Return the property value. """
 
-        value = self.settings.value(self.sessionName)
-
-        status = True
-        if self.returnType == "Int":
-            value = int(value)
-        elif self.returnType == "QFont":
-            value = QFont(value)
-        elif self.returnType == "QString":
-            pass
-        else:
-            logger.error("Unknown return type %s encountered when "
-                          "retrieving settings." % self.returnType)
-
-        if not status:
-            if not self.errorMsg:
-                self.errorMsg = "Settings Error: Failed to retrieve " \
-                                "default values for " + self.defaultName
-            logger.error(self.errorMsg)
+        # QFont is mutable; hand out a copy so callers can't
+        # change the cached value behind our back
+        if self.returnType == "QFont":
+            return QFont(self._cachedValue)
 
-        return value
+        return self._cachedValue
 
 
 
@@ -381,28 +512,49 @@ class PreferenceSetting(object):
     def value(self, setting):
         """ Store the value of property. """
 
-        self._main_setter(self.sessionName, setting)
+        # for font settings we check that they exist
+        if self.returnType == "QFont" and not fontDatabase_has_font(setting):
+            return
+
+        value = self._convert(setting)
+        if value == self._cachedValue:
+            return
+
+        self._sessionValue = copy_value(setting)
+        self._cachedValue = value
+        self.settings.schedule_write(self.sessionName, setting)
+        self.settings.emit(SIGNAL("setting_changed"), self.name, self.value)
 
 
     
     def make_settings_default(self):
         """ Make the current session settings the default. """
 
-        value = self.settings.value(self.sessionName)
-        self.settings.setValue(self.defaultName, value)
+        self.settings.schedule_write(self.defaultName, self._sessionValue)
 
 
 
-    def _main_setter(self, name, value):
-        """ This function does the actual setting. """
+    def _convert(self, value):
+        """ Convert a value as stored in QSettings to returnType. """
 
-        # for font settings we check that they exist
-        if self.returnType == "QFont":
-            if fontDatabase_has_font(value):
-                fontString = value
-                self.settings.setValue(name, fontString)
+        status = True
+        if self.returnType == "Int":
+            value = int(value)
+        elif self.returnType == "QFont":
+            value = QFont(value)
+        elif self.returnType == "QString":
+            pass
         else:
-            self.settings.setValue(name, value)
+            logger.error("Unknown return type %s encountered when "
+                          "retrieving settings." % self.returnType)
+
+        if not status:
+            if not self.errorMsg:
+                self.errorMsg = "Settings Error: Failed to retrieve " \
+                                "default values for " + self.defaultName
+            logger.error(self.errorMsg)
+
+        return value
 
 
 
@@ -421,3 +573,16 @@ def fontDatabase_has_font(font):
     families = fontDatabase.families()
     
     return (font.family() in families)
+
+
+
+def copy_value(value):
+    """ Returns a copy of value if it is one of the mutable Qt
+    value types we store in settings and value itself otherwise.
+
+    """
+
+    if isinstance(value, (QByteArray, QFont, QPoint, QSize)):
+        return type(value)(value)
+
+    return value
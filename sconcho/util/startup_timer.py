@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import cProfile
+import logging
+import time
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+
+##########################################################################
+#
+# Simple wall clock timer for the phases of program startup. The
+# timer is started once (by the launcher before sconcho is imported,
+# or in main()), each completed phase is recorded via mark_phase()
+# and the summary is written to the log once the main window is up.
+# Marks recorded while the timer is not running are ignored so the
+# instrumented code can be used independently.
+#
+# With --profile-startup the launcher also asks for the summary
+# table on stdout and, optionally, a cProfile dump of startup.
+#
+##########################################################################
+_startTime = None
+_lastTime = None
+_phases = []
+_printReport = False
+_profile = None
+_profileFile = None
+
+
+
+def start_phase_timer(printReport = False, profileFile = None):
+    """ Start timing the startup phases. If requested, the summary
+    table is printed and a cProfile dump of everything until
+    finish_phase_timer() is written to profileFile.
+
+    Does nothing if the timer is already running.
+
+    """
+
+    global _startTime, _lastTime, _printReport, _profile, _profileFile
+
+    if _startTime is not None:
+        return
+
+    _printReport = printReport
+    _profileFile = profileFile
+    if profileFile:
+        _profile = cProfile.Profile()
+        _profile.enable()
+
+    _startTime = _lastTime = time.perf_counter()
+    del _phases[:]
+
+
+
+def mark_phase(name):
+    """ Record the end of the startup phase called name. """
+
+    global _lastTime
+
+    if _startTime is None:
+        return
+
+    now = time.perf_counter()
+    _phases.append((name, now - _lastTime))
+    _lastTime = now
+
+
+
+def startup_phases():
+    """ Returns a list of (phase name, duration in seconds) tuples
+    in the order the phases completed.
+
+    """
+
+    return list(_phases)
+
+
+
+def startup_report(phases):
+    """ Returns a table of phases with their start time relative to
+    the start of the timer, their duration and share of the total.
+
+    """
+
+    total = sum(duration for (dummy, duration) in phases)
+    lines = ["%-28s %10s %12s %7s" % ("startup phase", "start ms",
+                                      "duration ms", "share")]
+    start = 0.0
+    for (name, duration) in phases:
+        share = 100.0 * duration / total if total else 0.0
+        lines.append("%-28s %10.1f %12.1f %6.1f%%" %
+                     (name, start * 1e3, duration * 1e3, share))
+        start += duration
+    lines.append("%-28s %10s %12.1f" % ("total", "", total * 1e3))
+
+    return "\n".join(lines)
+
+
+
+def finish_phase_timer():
+    """ Stop the timer and log the time spent in each phase.
+    Returns False if the timer was not running.
+
+    """
+
+    global _startTime, _profile
+
+    if _startTime is None:
+        return False
+
+    total = time.perf_counter() - _startTime
+    for (name, duration) in _phases:
+        logger.info("startup phase %-28s %8.1f ms" % (name, duration * 1e3))
+    logger.info("startup total %8.1f ms" % (total * 1e3))
+
+    if _printReport:
+        print(startup_report(_phases + [("event loop", total -
+                                         (_lastTime - _startTime))]))
+
+    if _profile:
+        _profile.disable()
+        _profile.dump_stats(_profileFile)
+        logger.info("startup profile written to %s" % _profileFile)
+        _profile = None
+
+    _startTime = None
+
+    return True
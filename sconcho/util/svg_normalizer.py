@@ -0,0 +1,572 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import logging
+import math
+import os
+import re
+import time
+from xml.etree import ElementTree
+
+from PyQt4.QtCore import QByteArray
+from PyQt4.QtGui import (QImage,
+                         QPainter)
+from PyQt4.QtSvg import QSvgRenderer
+
+import sconcho.util.messages as msg
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+
+SVG_NAMESPACE   = "http://www.w3.org/2000/svg"
+XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
+
+# namespaces only used by svg editors; elements and attributes
+# in these are dropped
+EDITOR_NAMESPACES = set([
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://inkscape.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://ns.adobe.com/AdobeIllustrator/10.0/",
+    "http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/",
+    "http://ns.adobe.com/Extensibility/1.0/",
+    "http://ns.adobe.com/Flows/1.0/",
+    "http://ns.adobe.com/Graphs/1.0/",
+    "http://ns.adobe.com/ImageReplacement/1.0/",
+    "http://ns.adobe.com/SaveForWeb/1.0/",
+    "http://ns.adobe.com/Variables/1.0/",
+    "http://www.bohemiancoding.com/sketch/ns",
+    "http://creativecommons.org/ns#",
+    "http://purl.org/dc/elements/1.1/",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#"])
+
+# svg elements which do not contribute to the rendered image
+STRIPPED_ELEMENTS = set(["metadata", "title", "desc"])
+
+# elements which are never rendered directly; transforms are
+# not pushed into them
+NON_RENDERED_ELEMENTS = set(["defs", "clipPath", "mask", "pattern",
+                             "symbol", "marker", "linearGradient",
+                             "radialGradient", "filter", "style"])
+
+# container elements whose transform can be pushed down
+# to their children
+GROUP_ELEMENTS = set(["g", "a", "switch"])
+
+# elements which may carry a transform attribute
+TRANSFORMABLE_ELEMENTS = set(["g", "a", "switch", "path", "rect", "circle",
+                              "ellipse", "line", "polyline", "polygon",
+                              "text", "use"])
+
+# numeric attributes whose values are rounded
+ROUNDED_ATTRIBUTES = set(["x", "y", "width", "height", "cx", "cy", "r",
+                          "rx", "ry", "x1", "y1", "x2", "y2", "fx", "fy",
+                          "points", "viewBox", "stroke-width"])
+
+# number of decimals kept for coordinates
+COORDINATE_PRECISION = 3
+
+# number of renders averaged when measuring the render time
+RENDER_TIME_REPEATS = 20
+
+NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+SEPARATOR = r"\s*,?\s*"
+NUMBER_RE = re.compile(NUMBER)
+PATH_COMMAND_RE = re.compile(r"([MmZzLlHhVvCcSsQqTtAa])"
+                             r"([^MmZzLlHhVvCcSsQqTtAa]*)")
+ARC_RE = re.compile(SEPARATOR.join(["(%s)" % NUMBER] * 3 + ["([01])"] * 2
+                                   + ["(%s)" % NUMBER] * 2))
+TRANSFORM_RE = re.compile(r"(matrix|translate|scale|rotate|skewX|skewY)"
+                          r"\s*\(([^)]*)\)")
+
+# number of arguments of each path command
+PATH_COMMAND_ARITY = {"M" : 2, "L" : 2, "H" : 1, "V" : 1, "C" : 6,
+                      "S" : 4, "Q" : 4, "T" : 2, "A" : 7, "Z" : 0}
+
+# argument positions of the x and y coordinates of each
+# absolute path command
+PATH_X_POSITIONS = {"M" : (0,), "L" : (0,), "T" : (0,), "H" : (0,),
+                    "C" : (0, 2, 4), "S" : (0, 2), "Q" : (0, 2),
+                    "A" : (5,), "V" : (), "Z" : ()}
+PATH_Y_POSITIONS = {"M" : (1,), "L" : (1,), "T" : (1,), "V" : (0,),
+                    "C" : (1, 3, 5), "S" : (1, 3), "Q" : (1, 3),
+                    "A" : (6,), "H" : (), "Z" : ()}
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+ElementTree.register_namespace("", SVG_NAMESPACE)
+ElementTree.register_namespace("xlink", XLINK_NAMESPACE)
+
+
+
+##########################################################################
+#
+# Normalization of custom symbol svg images. Images saved by svg
+# editors carry metadata, editor specific markup, deeply nested
+# transforms and excessive coordinate precision, all of which slow
+# down every render of the symbol on the canvas. Normalizing
+#
+#  - drops metadata and all editor specific elements and attributes
+#  - pushes group transforms down to the shapes, baking pure
+#    translations right into the coordinates
+#  - rounds coordinates to COORDINATE_PRECISION decimals
+#  - rejects images with embedded bitmaps
+#
+# The rendered result is unchanged up to the rounding.
+#
+##########################################################################
+def normalize_svg(data):
+    """ Normalize the svg image in data (bytes).
+
+    Returns a tuple (status, result) with the normalized image
+    on success and an error message otherwise.
+
+    """
+
+    try:
+        root = ElementTree.fromstring(data)
+    except ElementTree.ParseError as e:
+        return (False, msg.svgNormalizeParseError % e)
+
+    if root.tag != svg_tag("svg"):
+        return (False, msg.svgNormalizeNotSvg)
+
+    for tag in ("image", "foreignObject"):
+        if root.find(".//" + svg_tag(tag)) is not None:
+            return (False, msg.svgNormalizeBitmap)
+
+    strip_editor_content(root)
+    flatten_transforms(root, IDENTITY)
+    round_coordinates(root)
+
+    return (True, b"<?xml version='1.0' encoding='UTF-8'?>\n" +
+                  ElementTree.tostring(root, encoding="utf-8"))
+
+
+
+def normalize_svg_file(svgPath, width = 30, height = 30):
+    """ Replace the svg image at svgPath by its normalized version.
+
+    Returns a tuple (status, message) with a short before/after
+    report on success and an error message otherwise.
+
+    """
+
+    try:
+        with open(svgPath, "rb") as handle:
+            data = handle.read()
+    except (IOError, OSError) as e:
+        return (False, msg.svgNormalizeReadError % (svgPath, e))
+
+    (status, result) = normalize_svg(data)
+    if not status:
+        return (False, result)
+
+    report = normalize_report(data, result, width, height)
+    tempPath = svgPath + ".tmp"
+    try:
+        with open(tempPath, "wb") as handle:
+            handle.write(result)
+        os.replace(tempPath, svgPath)
+    except (IOError, OSError) as e:
+        return (False, msg.svgNormalizeWriteError % (svgPath, e))
+
+    logger.info("normalize_svg_file: %s -- %s" % (svgPath, report))
+    return (True, report)
+
+
+
+def normalize_report(oldData, newData, width, height):
+    """ Returns a short report comparing size and render time of
+    the original and normalized svg image.
+
+    """
+
+    return msg.svgNormalizeReport % (len(oldData), len(newData),
+                                     svg_render_time(oldData, width, height),
+                                     svg_render_time(newData, width, height))
+
+
+
+def svg_render_time(data, width, height, repeats = RENDER_TIME_REPEATS):
+    """ Returns the average time in ms it takes to render the svg
+    image in data at the given size.
+
+    """
+
+    renderer = QSvgRenderer(QByteArray(data))
+    if not renderer.isValid():
+        return 0.0
+
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    painter = QPainter(image)
+    start = time.perf_counter()
+    for dummy in range(repeats):
+        renderer.render(painter)
+    elapsed = time.perf_counter() - start
+    painter.end()
+
+    return elapsed * 1000.0 / repeats
+
+
+
+def svg_tag(name):
+    """ Returns the qualified tag of svg element name. """
+
+    return "{%s}%s" % (SVG_NAMESPACE, name)
+
+
+
+def local_name(tag):
+    """ Returns tag without namespace. """
+
+    return tag.rsplit("}", 1)[-1]
+
+
+
+def namespace(tag):
+    """ Returns the namespace of tag or an empty string. """
+
+    if tag.startswith("{"):
+        return tag[1:].split("}", 1)[0]
+
+    return ""
+
+
+
+def fmt(value):
+    """ Format a float compactly with COORDINATE_PRECISION decimals. """
+
+    text = ("%.*f" % (COORDINATE_PRECISION, value)).rstrip("0").rstrip(".")
+    if text == "-0":
+        return "0"
+
+    return text
+
+
+
+def strip_editor_content(element):
+    """ Remove metadata and editor specific elements and attributes
+    below element.
+
+    """
+
+    for name in list(element.attrib):
+        if namespace(name) in EDITOR_NAMESPACES:
+            del element.attrib[name]
+
+    for child in list(element):
+        if not isinstance(child.tag, str) or \
+           namespace(child.tag) in EDITOR_NAMESPACES or \
+           (namespace(child.tag) == SVG_NAMESPACE and
+            local_name(child.tag) in STRIPPED_ELEMENTS):
+            element.remove(child)
+        else:
+            strip_editor_content(child)
+
+
+
+def flatten_transforms(element, matrix):
+    """ Push the transform matrix and those of all groups below
+    element down to the shapes.
+
+    """
+
+    for child in element:
+        if namespace(child.tag) != SVG_NAMESPACE:
+            continue
+
+        name = local_name(child.tag)
+        if name in NON_RENDERED_ELEMENTS:
+            continue
+
+        childMatrix = multiply(matrix, parse_transform(
+                                            child.get("transform", "")))
+        if name in GROUP_ELEMENTS and can_flatten_group(child):
+            child.attrib.pop("transform", None)
+            flatten_transforms(child, childMatrix)
+        elif name in GROUP_ELEMENTS:
+            set_transform(child, childMatrix)
+            flatten_transforms(child, IDENTITY)
+        elif name in TRANSFORMABLE_ELEMENTS:
+            if not (is_translation(childMatrix) and
+                    not references_paint_server(child) and
+                    translate_element(child, childMatrix[4],
+                                      childMatrix[5])):
+                set_transform(child, childMatrix)
+
+
+
+def can_flatten_group(group):
+    """ Check if the transform of group can be pushed to its
+    children. This is not possible if the group is clipped, masked
+    or filtered (since these are defined in the group's coordinate
+    system) or contains elements that can't carry a transform.
+
+    """
+
+    for attribute in ("clip-path", "mask", "filter"):
+        if attribute in group.attrib or \
+           attribute + ":" in group.get("style", ""):
+            return False
+
+    for child in group:
+        if namespace(child.tag) != SVG_NAMESPACE:
+            return False
+
+        name = local_name(child.tag)
+        if name not in TRANSFORMABLE_ELEMENTS and \
+           name not in NON_RENDERED_ELEMENTS:
+            return False
+
+    return True
+
+
+
+def references_paint_server(element):
+    """ Check if element refers to gradients, patterns, clip paths or
+    the like, which are defined in its user space and thus
+    prevent moving its coordinates.
+
+    """
+
+    for (name, value) in element.attrib.items():
+        if "url(" in value or name in ("clip-path", "mask", "filter"):
+            return True
+
+    return False
+
+
+
+def set_transform(element, matrix):
+    """ Set the transform attribute of element to matrix. """
+
+    if matrix == IDENTITY:
+        element.attrib.pop("transform", None)
+    elif is_translation(matrix):
+        element.set("transform", "translate(%s,%s)" % (fmt(matrix[4]),
+                                                        fmt(matrix[5])))
+    else:
+        # scale factors need more precision than coordinates
+        element.set("transform", "matrix(%s)" %
+                    ",".join(["%.6g" % value for value in matrix[:4]] +
+                             [fmt(value) for value in matrix[4:]]))
+
+
+
+def is_translation(matrix):
+    """ Check if matrix is a pure translation. """
+
+    return matrix[:4] == IDENTITY[:4]
+
+
+
+def multiply(m1, m2):
+    """ Returns the product m1 * m2 of two affine matrices in svg
+    (a, b, c, d, e, f) notation; m2 is applied first.
+
+    """
+
+    (a1, b1, c1, d1, e1, f1) = m1
+    (a2, b2, c2, d2, e2, f2) = m2
+    return (a1 * a2 + c1 * b2, b1 * a2 + d1 * b2,
+            a1 * c2 + c1 * d2, b1 * c2 + d1 * d2,
+            a1 * e2 + c1 * f2 + e1, b1 * e2 + d1 * f2 + f1)
+
+
+
+def parse_transform(transform):
+    """ Parse an svg transform list into a single matrix. """
+
+    matrix = IDENTITY
+    for (kind, argText) in TRANSFORM_RE.findall(transform):
+        args = [float(value) for value in NUMBER_RE.findall(argText)]
+        try:
+            matrix = multiply(matrix, transform_matrix(kind, args))
+        except IndexError:
+            logger.warn("parse_transform: ignoring malformed transform "
+                        "%s(%s)" % (kind, argText))
+
+    return matrix
+
+
+
+def transform_matrix(kind, args):
+    """ Returns the matrix of a single svg transform. """
+
+    if kind == "matrix":
+        return (args[0], args[1], args[2], args[3], args[4], args[5])
+    elif kind == "translate":
+        return (1.0, 0.0, 0.0, 1.0, args[0], args[1] if len(args) > 1
+                                                 else 0.0)
+    elif kind == "scale":
+        return (args[0], 0.0, 0.0, args[1] if len(args) > 1 else args[0],
+                0.0, 0.0)
+    elif kind == "rotate":
+        angle = math.radians(args[0])
+        (cos, sin) = (math.cos(angle), math.sin(angle))
+        rotation = (cos, sin, -sin, cos, 0.0, 0.0)
+        if len(args) >= 3:
+            (cx, cy) = (args[1], args[2])
+            return multiply(multiply((1.0, 0.0, 0.0, 1.0, cx, cy), rotation),
+                            (1.0, 0.0, 0.0, 1.0, -cx, -cy))
+        return rotation
+    elif kind == "skewX":
+        return (1.0, 0.0, math.tan(math.radians(args[0])), 1.0, 0.0, 0.0)
+    else:
+        return (1.0, math.tan(math.radians(args[0])), 0.0, 1.0, 0.0, 0.0)
+
+
+
+def translate_element(element, dx, dy):
+    """ Move the coordinates of element by (dx, dy). Returns False if
+    this is not possible for element.
+
+    """
+
+    name = local_name(element.tag)
+    if name == "path":
+        path = parse_path(element.get("d", ""))
+        if path is None:
+            return False
+        element.set("d", format_path(translate_path(path, dx, dy)))
+    elif name in ("rect", "use"):
+        shift_attribute(element, "x", dx)
+        shift_attribute(element, "y", dy)
+    elif name in ("circle", "ellipse"):
+        shift_attribute(element, "cx", dx)
+        shift_attribute(element, "cy", dy)
+    elif name == "line":
+        for (xName, yName) in (("x1", "y1"), ("x2", "y2")):
+            shift_attribute(element, xName, dx)
+            shift_attribute(element, yName, dy)
+    elif name in ("polyline", "polygon"):
+        values = [float(value) for value in
+                  NUMBER_RE.findall(element.get("points", ""))]
+        if len(values) % 2:
+            return False
+        for index in range(0, len(values), 2):
+            values[index] += dx
+            values[index + 1] += dy
+        element.set("points", " ".join(fmt(value) for value in values))
+    else:
+        return False
+
+    element.attrib.pop("transform", None)
+    return True
+
+
+
+def shift_attribute(element, name, delta):
+    """ Add delta to the numeric attribute name of element. """
+
+    match = NUMBER_RE.match(element.get(name, "0").strip())
+    value = float(match.group(0)) if match else 0.0
+    element.set(name, fmt(value + delta))
+
+
+
+def parse_path(pathData):
+    """ Parse svg path data into a list of (command, arguments)
+    tuples. Returns None if the path data is malformed.
+
+    """
+
+    if not pathData.strip():
+        return []
+
+    if pathData.strip()[0] not in "Mm":
+        return None
+
+    path = []
+    for (command, argText) in PATH_COMMAND_RE.findall(pathData):
+        if command in "Aa":
+            args = []
+            for arc in ARC_RE.finditer(argText):
+                args.extend(float(value) for value in arc.groups())
+        else:
+            args = [float(value) for value in NUMBER_RE.findall(argText)]
+
+        arity = PATH_COMMAND_ARITY[command.upper()]
+        if (arity == 0 and args) or (arity and (not args or
+                                                len(args) % arity)):
+            return None
+
+        path.append((command, args))
+
+    return path
+
+
+
+def translate_path(path, dx, dy):
+    """ Move all absolute coordinates in path by (dx, dy). """
+
+    translated = []
+    for (index, (command, args)) in enumerate(path):
+        args = list(args)
+        upperCommand = command.upper()
+        arity = PATH_COMMAND_ARITY[upperCommand]
+
+        if command.isupper():
+            for start in range(0, len(args), arity):
+                for position in PATH_X_POSITIONS[upperCommand]:
+                    args[start + position] += dx
+                for position in PATH_Y_POSITIONS[upperCommand]:
+                    args[start + position] += dy
+
+        # the first pair of a leading relative moveto is absolute
+        elif index == 0 and command == "m":
+            args[0] += dx
+            args[1] += dy
+
+        translated.append((command, args))
+
+    return translated
+
+
+
+def format_path(path):
+    """ Turn a parsed path back into compact svg path data. """
+
+    return " ".join(command + " ".join(fmt(value) for value in args)
+                    for (command, args) in path)
+
+
+
+def round_coordinates(element):
+    """ Round path data and numeric attributes below element to
+    COORDINATE_PRECISION decimals.
+
+    """
+
+    for (name, value) in element.attrib.items():
+        if name == "d":
+            path = parse_path(value)
+            if path is not None:
+                element.set(name, format_path(path))
+        elif name in ROUNDED_ATTRIBUTES:
+            element.set(name, NUMBER_RE.sub(
+                        lambda match: fmt(float(match.group(0))), value))
+
+    for child in element:
+        round_coordinates(child)
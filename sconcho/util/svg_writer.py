@@ -0,0 +1,589 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import logging
+import re
+
+from PyQt4.QtCore import (QFile,
+                          QIODevice,
+                          QTextStream)
+
+from PyQt4.QtGui import (QColor,
+                         QFontInfo,
+                         QFontMetricsF)
+
+from PyQt4.QtXml import QDomDocument
+
+from sconcho.gui.pattern_canvas_objects import (PatternGridItem,
+                                                PatternHighlightItem,
+                                                PatternLabelItem,
+                                                PatternLegendItem,
+                                                PatternLegendText,
+                                                PatternRepeatItem,
+                                                RepeatLegendItem)
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+
+SVG_NAMESPACE   = "http://www.w3.org/2000/svg"
+XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
+
+# elements of the symbol svg files that do not contribute to
+# the rendered image and are thus not copied into the export
+IGNORED_SYMBOL_ELEMENTS = ["metadata", "sodipodi:namedview", "title"]
+
+# namespace prefixes declared by the exported document; elements
+# and attributes with any other prefix (inkscape:, sodipodi:, ...)
+# are dropped from the symbol artwork
+DECLARED_PREFIXES = ["", "svg", "xlink", "xml"]
+
+
+
+def write_svg(canvas, width, height, sceneRect, exportFileName):
+    """ Write all visible items of canvas within sceneRect to
+    exportFileName. The image will have the requested width
+    and height.
+
+    Returns a tuple (status, errMsg).
+
+    """
+
+    writer = SvgChartWriter(sceneRect, width, height)
+    for item in canvas.items():
+        if item.isVisible():
+            writer.add_item(item)
+
+    return writer.save(exportFileName)
+
+
+
+##########################################################################
+#
+# Contrary to QSvgGenerator, which replays every paint call of every
+# item, this writer emits the artwork of each distinct knitting symbol
+# exactly once inside <defs> and references it via <use> for each grid
+# cell. Background colors of adjacent cells within a row are merged
+# into a single rect per run of identical color.
+#
+##########################################################################
+class SvgChartWriter(object):
+
+
+    def __init__(self, sceneRect, width, height):
+        """ Set up an empty svg document showing sceneRect at the
+        given output width and height.
+
+        """
+
+        self._sceneRect = sceneRect
+        self._width = width
+        self._height = height
+
+        # map of (svgName, width, height) -> id of corresponding def
+        self._symbolDefs = {}
+
+        self._gridItems = []
+        self._legendItems = []
+        self._highlightItems = []
+        self._repeatLegendItems = []
+        self._textItems = []
+        self._repeatItems = []
+
+
+
+    def add_item(self, item):
+        """ Sort item into the proper layer. Items we don't know
+        how to handle are skipped.
+
+        """
+
+        if isinstance(item, PatternGridItem):
+            self._gridItems.append(item)
+        elif isinstance(item, PatternLegendItem):
+            self._legendItems.append(item)
+        elif isinstance(item, PatternHighlightItem):
+            self._highlightItems.append(item)
+        elif isinstance(item, RepeatLegendItem):
+            self._repeatLegendItems.append(item)
+        elif isinstance(item, (PatternLegendText, PatternLabelItem)):
+            self._textItems.append(item)
+        elif isinstance(item, PatternRepeatItem):
+            self._repeatItems.append(item)
+
+
+
+    def save(self, fileName):
+        """ Assemble the document and write it to fileName.
+
+        Returns a tuple (status, errMsg).
+
+        """
+
+        document = self._create_document()
+
+        handle = QFile(fileName)
+        if not handle.open(QIODevice.WriteOnly | QIODevice.Truncate):
+            errMsg = ("SvgChartWriter: could not open %s for writing -- %s"
+                      % (fileName, handle.errorString()))
+            logger.error(errMsg)
+            return (False, errMsg)
+
+        stream = QTextStream(handle)
+        stream.setCodec("UTF-8")
+        stream << document.toString(1)
+        handle.close()
+
+        return (True, None)
+
+
+
+    def _create_document(self):
+        """ Generate the svg document. The layers are emitted in the
+        same order the canvas stacks them.
+
+        """
+
+        document = QDomDocument()
+        document.appendChild(document.createProcessingInstruction("xml",
+                             "version=\"1.0\" encoding=\"UTF-8\""))
+
+        root = document.createElement("svg")
+        root.setAttribute("xmlns", SVG_NAMESPACE)
+        root.setAttribute("xmlns:xlink", XLINK_NAMESPACE)
+        root.setAttribute("version", "1.1")
+        root.setAttribute("width", "%d" % self._width)
+        root.setAttribute("height", "%d" % self._height)
+        root.setAttribute("viewBox", "%s %s %s %s" %
+                          (fmt(self._sceneRect.x()),
+                           fmt(self._sceneRect.y()),
+                           fmt(self._sceneRect.width()),
+                           fmt(self._sceneRect.height())))
+        document.appendChild(root)
+
+        title = document.createElement("title")
+        title.appendChild(document.createTextNode(
+            "sconcho generated SVG image"))
+        root.appendChild(title)
+
+        defs = document.createElement("defs")
+        root.appendChild(defs)
+
+        backgrounds = document.createElement("g")
+        backgrounds.setAttribute("id", "backgrounds")
+        root.appendChild(backgrounds)
+        self._add_background_runs(document, backgrounds)
+
+        cells = document.createElement("g")
+        cells.setAttribute("id", "cells")
+        root.appendChild(cells)
+        for item in self._gridItems:
+            self._add_symbol_use(document, defs, cells, item)
+
+        legend = document.createElement("g")
+        legend.setAttribute("id", "legend")
+        root.appendChild(legend)
+        for item in self._legendItems:
+            pos = item.scenePos()
+            legend.appendChild(self._create_rect(document, pos.x(),
+                               pos.y(), item.size.width(),
+                               item.size.height(), item.color))
+            self._add_symbol_use(document, defs, legend, item)
+
+        for item in self._highlightItems:
+            rect = item.mapRectToScene(item.rect())
+            color = item.brush().color()
+            element = self._create_rect(document, rect.x(), rect.y(),
+                                        rect.width(), rect.height(), color)
+            element.setAttribute("fill-opacity",
+                                 fmt(color.alphaF() * item.opacity()))
+            root.appendChild(element)
+
+        for item in self._repeatLegendItems:
+            rect = item.mapRectToScene(item.rect())
+            element = self._create_rect(document, rect.x(), rect.y(),
+                                        rect.width(), rect.height())
+            element.setAttribute("stroke", item.color.name())
+            element.setAttribute("stroke-width", fmt(item.pen().widthF()))
+            root.appendChild(element)
+
+        for item in self._textItems:
+            self._add_text(document, root, item)
+
+        for item in self._repeatItems:
+            polygon = item.mapToScene(item.polygon())
+            points = " ".join(["%s,%s" % (fmt(point.x()), fmt(point.y()))
+                               for point in polygon])
+            element = document.createElement("polygon")
+            element.setAttribute("points", points)
+            element.setAttribute("fill", "none")
+            element.setAttribute("stroke", item.color.name())
+            element.setAttribute("stroke-width", "%d" % item.width)
+            element.setAttribute("stroke-linejoin", "miter")
+            root.appendChild(element)
+
+        return document
+
+
+
+    def _add_background_runs(self, document, parent):
+        """ Emit a single rect for each horizontal run of adjacent
+        grid cells sharing the same background color.
+
+        """
+
+        cellsByRow = {}
+        for item in self._gridItems:
+            cellsByRow.setdefault(item.row, []).append(item)
+
+        for row in sorted(cellsByRow):
+            rowCells = sorted(cellsByRow[row], key=lambda item: item.column)
+
+            runStart = rowCells[0]
+            runColor = cell_color(runStart)
+            runWidth = runStart.size.width()
+            nextColumn = runStart.column + runStart.width
+            for item in rowCells[1:]:
+                color = cell_color(item)
+                if item.column == nextColumn and color == runColor:
+                    runWidth += item.size.width()
+                else:
+                    self._add_run(document, parent, runStart, runWidth,
+                                  runColor)
+                    runStart = item
+                    runColor = color
+                    runWidth = item.size.width()
+                nextColumn = item.column + item.width
+
+            self._add_run(document, parent, runStart, runWidth, runColor)
+
+
+
+    def _add_run(self, document, parent, firstItem, width, color):
+        """ Add the rect for a single run of background color. """
+
+        pos = firstItem.scenePos()
+        halfPen = firstItem._penSize * 0.5
+        parent.appendChild(self._create_rect(document, pos.x() + halfPen,
+                           pos.y() + halfPen, width,
+                           firstItem.size.height(), color))
+
+
+
+    def _add_symbol_use(self, document, defs, parent, item):
+        """ Reference the def for item's symbol at the location of
+        item. The def is created on first use.
+
+        """
+
+        symbolID = self._symbol_def(document, defs, item)
+        if not symbolID:
+            return
+
+        pos = item.scenePos()
+        use = document.createElement("use")
+        use.setAttribute("xlink:href", "#" + symbolID)
+        use.setAttribute("x", fmt(pos.x()))
+        use.setAttribute("y", fmt(pos.y()))
+        parent.appendChild(use)
+
+
+
+    def _symbol_def(self, document, defs, item):
+        """ Return the id of the def containing the cell frame and
+        artwork of item's symbol, creating it if needed.
+
+        Returns None if the symbol svg could not be read.
+
+        """
+
+        width = item.size.width()
+        height = item.size.height()
+        key = (item.symbol["svgName"], width, height)
+        if key in self._symbolDefs:
+            return self._symbolDefs[key]
+
+        symbolID = "s%d_%s" % (len(self._symbolDefs),
+                               sanitize_id(item.symbol["svgName"]))
+        symbolRoot = load_symbol_svg(item.symbol["svgPath"])
+        if symbolRoot is None:
+            self._symbolDefs[key] = None
+            return None
+
+        group = document.createElement("g")
+        group.setAttribute("id", symbolID)
+
+        halfPen = item._penSize * 0.5
+        frame = self._create_rect(document, halfPen, halfPen, width, height)
+        frame.setAttribute("stroke", "#000000")
+        frame.setAttribute("stroke-width", fmt(item._penSize))
+        group.appendChild(frame)
+
+        # the symbol is stretched into the frame just like
+        # QSvgRenderer.render does
+        artwork = document.createElement("svg")
+        artwork.setAttribute("x", fmt(halfPen))
+        artwork.setAttribute("y", fmt(halfPen))
+        artwork.setAttribute("width", fmt(width))
+        artwork.setAttribute("height", fmt(height))
+        artwork.setAttribute("viewBox", symbol_view_box(symbolRoot))
+        artwork.setAttribute("preserveAspectRatio", "none")
+        artwork.setAttribute("overflow", "hidden")
+
+        child = symbolRoot.firstChild()
+        while not child.isNull():
+            if child.isElement() and \
+                    child.toElement().tagName() not in \
+                    IGNORED_SYMBOL_ELEMENTS:
+                imported = document.importNode(child, True)
+                if not strip_foreign_content(imported):
+                    child = child.nextSibling()
+                    continue
+                prefix_ids(imported, symbolID + "_")
+                artwork.appendChild(imported)
+            child = child.nextSibling()
+
+        group.appendChild(artwork)
+        defs.appendChild(group)
+
+        self._symbolDefs[key] = symbolID
+        return symbolID
+
+
+
+    def _add_text(self, document, parent, item):
+        """ Emit the plain text content of a text item line by line. """
+
+        text = item.toPlainText()
+        if not text:
+            return
+
+        font = item.font()
+        metrics = QFontMetricsF(font)
+        margin = item.document().documentMargin()
+        pos = item.scenePos()
+
+        element = document.createElement("text")
+        element.setAttribute("font-family", font.family())
+        element.setAttribute("font-size", "%d" % QFontInfo(font).pixelSize())
+        if font.bold():
+            element.setAttribute("font-weight", "bold")
+        if font.italic():
+            element.setAttribute("font-style", "italic")
+        element.setAttribute("fill", item.defaultTextColor().name())
+        element.setAttribute("xml:space", "preserve")
+
+        x = pos.x() + margin
+        y = pos.y() + margin + metrics.ascent()
+        for line in text.split("\n"):
+            span = document.createElement("tspan")
+            span.setAttribute("x", fmt(x))
+            span.setAttribute("y", fmt(y))
+            span.appendChild(document.createTextNode(line))
+            element.appendChild(span)
+            y += metrics.lineSpacing()
+
+        parent.appendChild(element)
+
+
+
+    def _create_rect(self, document, x, y, width, height, color = None):
+        """ Helper creating a rect element. Without a color the
+        rect is not filled.
+
+        """
+
+        rect = document.createElement("rect")
+        rect.setAttribute("x", fmt(x))
+        rect.setAttribute("y", fmt(y))
+        rect.setAttribute("width", fmt(width))
+        rect.setAttribute("height", fmt(height))
+        if color is not None:
+            rect.setAttribute("fill", QColor(color).name())
+        else:
+            rect.setAttribute("fill", "none")
+
+        return rect
+
+
+
+###########################################################################
+#
+# helper functions
+#
+###########################################################################
+def fmt(value):
+    """ Format a float compactly for use in svg attributes. """
+
+    return ("%.3f" % value).rstrip("0").rstrip(".")
+
+
+
+def cell_color(item):
+    """ Returns the name of the background color of a grid cell.
+    Symbols with their own background color take precedence, same
+    as when the cell is painted.
+
+    """
+
+    if "backgroundColor" in item.symbol:
+        return QColor(item.symbol["backgroundColor"]).name()
+
+    return item.color.name()
+
+
+
+def sanitize_id(name):
+    """ Turn name into something usable as an xml id. """
+
+    return re.sub(r"[^\w-]", r"_", name)
+
+
+
+def load_symbol_svg(svgPath):
+    """ Parse the svg file at svgPath and return its root element
+    or None on failure.
+
+    """
+
+    handle = QFile(svgPath)
+    if not handle.open(QIODevice.ReadOnly):
+        logger.error("load_symbol_svg: could not open %s" % svgPath)
+        return None
+
+    dom = QDomDocument()
+    (status, msg, line, col) = dom.setContent(handle)
+    handle.close()
+    if not status:
+        logger.error("load_symbol_svg: failed to parse %s -- %s at line "
+                     "%d column %d" % (svgPath, msg, line, col))
+        return None
+
+    return dom.documentElement()
+
+
+
+def symbol_view_box(symbolRoot):
+    """ Returns the viewBox of a symbol svg. Most of our symbols
+    don't carry one in which case it is derived from the width and
+    height attributes.
+
+    """
+
+    viewBox = symbolRoot.attribute("viewBox")
+    if viewBox:
+        return viewBox
+
+    width = strip_unit(symbolRoot.attribute("width", "100"))
+    height = strip_unit(symbolRoot.attribute("height", "100"))
+    return "0 0 %s %s" % (width, height)
+
+
+
+def strip_unit(value):
+    """ Remove a trailing unit like 'px' from an svg length. """
+
+    match = re.match(r"\s*([-+]?[0-9]*\.?[0-9]+)", value)
+    if match:
+        return match.group(1)
+
+    return "100"
+
+
+
+def name_prefix(name):
+    """ Returns the namespace prefix of a qualified name. """
+
+    if ":" in name:
+        return name.split(":", 1)[0]
+
+    return ""
+
+
+
+def strip_foreign_content(node):
+    """ Remove all elements and attributes below node whose namespace
+    prefix is not declared in the exported document, as well as any
+    namespace declarations. Returns False if node itself is foreign
+    and should be dropped altogether.
+
+    NOTE: The symbol svgs are parsed without namespace processing
+    so we go by prefix.
+
+    """
+
+    if not node.isElement():
+        return True
+
+    element = node.toElement()
+    if name_prefix(element.tagName()) not in DECLARED_PREFIXES:
+        return False
+
+    attributes = element.attributes()
+    foreignNames = []
+    for index in range(attributes.count()):
+        name = attributes.item(index).toAttr().name()
+        if name == "xmlns" or name_prefix(name) == "xmlns" or \
+                name_prefix(name) not in DECLARED_PREFIXES:
+            foreignNames.append(name)
+
+    for name in foreignNames:
+        element.removeAttribute(name)
+
+    child = node.firstChild()
+    while not child.isNull():
+        nextChild = child.nextSibling()
+        if not strip_foreign_content(child):
+            node.removeChild(child)
+        child = nextChild
+
+    return True
+
+
+
+def prefix_ids(node, prefix):
+    """ Prefix all ids below node, and the references to them, so
+    the artwork of different symbols can not clash within one
+    document.
+
+    """
+
+    if not node.isElement():
+        return
+
+    element = node.toElement()
+    if element.hasAttribute("id"):
+        element.setAttribute("id", prefix + element.attribute("id"))
+
+    attributes = element.attributes()
+    for index in range(attributes.count()):
+        attribute = attributes.item(index).toAttr()
+        value = attribute.value()
+        if "url(#" in value:
+            attribute.setValue(value.replace("url(#", "url(#" + prefix))
+        elif attribute.name().endswith("href") and value.startswith("#"):
+            attribute.setValue("#" + prefix + value[1:])
+
+    child = node.firstChild()
+    while not child.isNull():
+        prefix_ids(child, prefix)
+        child = child.nextSibling()
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import logging
+import re
+
+from bisect import (bisect_left,
+                    insort)
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+# maximum number of results returned by a search
+MAX_SEARCH_RESULTS = 50
+
+# query terms shorter than this are only matched by prefix
+MIN_FUZZY_LENGTH = 3
+
+# relative weights of the different kinds of matches
+EXACT_MATCH_SCORE = 4
+PREFIX_MATCH_SCORE = 2
+FUZZY_MATCH_SCORE = 1
+NAME_MATCH_BONUS = 1
+
+
+
+def tokenize(text):
+    """ Split text into lower case search terms. """
+
+    return re.findall(r"\w+", text.lower())
+
+
+
+def single_deletions(term):
+    """ Returns all variants of term with one character removed. """
+
+    return set(term[:i] + term[i+1:] for i in range(len(term)))
+
+
+
+##########################################################################
+#
+# In memory inverted index over name, description and category of
+# the knitting symbols. Prefix queries bisect a sorted list of all
+# indexed terms. Fuzzy queries find all terms within one edit
+# (insertion, deletion, substitution) of the query term by looking
+# up single character deletions of both in a precomputed table,
+# so no query ever scans the whole vocabulary.
+#
+##########################################################################
+class SymbolIndex(object):
+
+
+    def __init__(self, symbols = ()):
+
+        self._symbols = {}
+        self._nameTerms = {}
+        self._symbolTerms = {}
+        self._postings = {}
+        self._sortedTerms = []
+        self._deletions = {}
+
+        for symbol in symbols:
+            self.add(symbol)
+
+
+
+    def __len__(self):
+
+        return len(self._symbols)
+
+
+
+    def add(self, symbol):
+        """ Add symbol to the index, replacing any previous symbol
+        of the same name.
+
+        """
+
+        name = symbol["name"]
+        if name in self._symbols:
+            self.remove(name)
+
+        nameTerms = set(tokenize(name))
+        terms = (nameTerms | set(tokenize(symbol["description"]))
+                 | set(tokenize(symbol["category"])))
+
+        self._symbols[name] = symbol
+        self._nameTerms[name] = nameTerms
+        self._symbolTerms[name] = terms
+        for term in terms:
+            if term not in self._postings:
+                self._add_term(term)
+            self._postings[term].add(name)
+
+
+
+    def remove(self, name):
+        """ Remove the symbol called name from the index. """
+
+        if name not in self._symbols:
+            return
+
+        for term in self._symbolTerms[name]:
+            self._postings[term].discard(name)
+            if not self._postings[term]:
+                self._remove_term(term)
+
+        del self._symbols[name]
+        del self._nameTerms[name]
+        del self._symbolTerms[name]
+
+
+
+    def rename(self, oldName, symbol):
+        """ Replace the symbol called oldName by symbol. """
+
+        self.remove(oldName)
+        self.add(symbol)
+
+
+
+    def search(self, text, maxResults = MAX_SEARCH_RESULTS):
+        """ Returns the symbols matching all terms in text, best
+        matches first.
+
+        Each query term matches indexed terms it is equal to, is a
+        prefix of or, for longer terms, is within one edit of.
+
+        """
+
+        scores = None
+        for queryTerm in tokenize(text):
+            termScores = {}
+            for (term, score) in self._matching_terms(queryTerm):
+                for name in self._postings[term]:
+                    nameScore = score
+                    if term in self._nameTerms[name]:
+                        nameScore += NAME_MATCH_BONUS
+                    if nameScore > termScores.get(name, 0):
+                        termScores[name] = nameScore
+
+            if scores is None:
+                scores = termScores
+            else:
+                scores = dict((name, scores[name] + score) for
+                              (name, score) in termScores.items()
+                              if name in scores)
+
+            if not scores:
+                return []
+
+        if not scores:
+            return []
+
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0].lower()))
+        return [self._symbols[name] for (name, dummy) in
+                ranked[:maxResults]]
+
+
+
+    def _matching_terms(self, queryTerm):
+        """ Generate (term, score) for all indexed terms matching
+        queryTerm.
+
+        """
+
+        start = bisect_left(self._sortedTerms, queryTerm)
+        for term in self._sortedTerms[start:]:
+            if not term.startswith(queryTerm):
+                break
+            if term == queryTerm:
+                yield (term, EXACT_MATCH_SCORE)
+            else:
+                yield (term, PREFIX_MATCH_SCORE)
+
+        if len(queryTerm) < MIN_FUZZY_LENGTH:
+            return
+
+        candidates = set(self._deletions.get(queryTerm, ()))
+        for variant in single_deletions(queryTerm):
+            candidates.update(self._deletions.get(variant, ()))
+            if variant in self._postings:
+                candidates.add(variant)
+
+        for term in candidates:
+            if not term.startswith(queryTerm):
+                yield (term, FUZZY_MATCH_SCORE)
+
+
+
+    def _add_term(self, term):
+        """ Register a new term with the vocabulary. """
+
+        self._postings[term] = set()
+        insort(self._sortedTerms, term)
+        for variant in single_deletions(term):
+            self._deletions.setdefault(variant, set()).add(term)
+
+
+
+    def _remove_term(self, term):
+        """ Remove an unused term from the vocabulary. """
+
+        del self._postings[term]
+        del self._sortedTerms[bisect_left(self._sortedTerms, term)]
+        for variant in single_deletions(term):
+            self._deletions[variant].discard(term)
+            if not self._deletions[variant]:
+                del self._deletions[variant]
@@ -19,8 +19,13 @@
 #
 #######################################################################
 
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from tempfile import mkdtemp
+from xml.etree import ElementTree
 
 from os import path
 from shutil import (move,
@@ -34,8 +39,8 @@ from PyQt4.QtCore import (QDir,
                           QTextStream)
 
 from PyQt4.QtGui import QMessageBox
-from PyQt4.QtXml import QDomDocument
 
+from sconcho.util.svg_normalizer import normalize_svg_file
 import sconcho.util.messages as msg
 
 
@@ -43,55 +48,211 @@ import sconcho.util.messages as msg
 # at the end of the category list
 __LARGE_INT__ = 100000
 
+# version of the on disk symbol cache format; bump whenever the
+# content of the parsed symbol descriptions changes
+SYMBOL_CACHE_VERSION = 1
+
+# maximum number of threads used for parsing symbol descriptions
+MAX_PARSE_THREADS = 8
+
 
 # module lever logger:
 logger = logging.getLogger(__name__)
 
 
-def parse_all_symbols(symbolTopLevelPaths):
+def parse_all_symbols(symbolTopLevelPaths, cacheFile = None):
     """ 
     This function reads all available knitting symbols and
     returns a dictionary with them all.
-    """
 
-    symbolPaths = get_list_of_symbol_paths(symbolTopLevelPaths)
+    If cacheFile is given, the parsed symbol descriptions are
+    stored there and only symbols whose directory or description
+    changed since the last run are parsed again.
 
-    allSymbolDesc = {}
-    for path in symbolPaths:
-        symbolDesc = parse_knitting_symbol(path)
-        
-        # if there was a problem we simply skip
-        # with a short warning
-        if not symbolDesc:
-            message = ("parse_all_symbols: Could not read symbol " + path +
-                       "\nRemove the directory " + path + " to get rid of "
-                       "this warning")
-            logger.warn(message)
-            continue
+    Discovery and parsing of the symbol directories is spread across
+    a small pool of worker threads since on network mounted symbol
+    paths each file access is expensive. The workers don't touch any
+    Qt objects and results are merged in the same order as a
+    sequential parse would produce them.
+    """
 
-        # try to add symbol to symbol database
-        try:
-            symbolID = symbolDesc["name"] 
-            allSymbolDesc[symbolID] = symbolDesc
-        except KeyError:
-            continue
+    cache = {}
+    if cacheFile:
+        cache = load_symbol_cache(cacheFile)
+
+    with ThreadPoolExecutor(max_workers = MAX_PARSE_THREADS) as pool:
+        symbolPaths = get_list_of_symbol_paths(symbolTopLevelPaths, pool)
+        results = pool.map(partial(load_knitting_symbol, cache=cache),
+                           symbolPaths)
+
+        newCache = {}
+        allSymbolDesc = {}
+        for (path, (stamp, symbolDesc)) in zip(symbolPaths, results):
+            newCache[path] = {"stamp" : stamp, "symbol" : symbolDesc}
+
+            # if there was a problem we simply skip
+            # with a short warning
+            if not symbolDesc:
+                message = ("parse_all_symbols: Could not read symbol " + 
+                           path + "\nRemove the directory " + path + 
+                           " to get rid of this warning")
+                logger.warn(message)
+                continue
+
+            # try to add symbol to symbol database
+            try:
+                symbolID = symbolDesc["name"] 
+                allSymbolDesc[symbolID] = symbolDesc
+            except KeyError:
+                continue
+
+    if cacheFile and newCache != cache:
+        write_symbol_cache(cacheFile, newCache)
 
     return allSymbolDesc
 
 
 
-def get_list_of_symbol_paths(symbolTopLevelPaths):
+def parse_symbol_directories(symbolPaths):
+    """
+    Parses the symbols located at symbolPaths concurrently and
+    returns a dictionary mapping each path to its symbol description,
+    or to None if the path does not (or no longer) hold a valid
+    symbol.
+    """
+
+    with ThreadPoolExecutor(max_workers = MAX_PARSE_THREADS) as pool:
+        results = pool.map(parse_knitting_symbol, symbolPaths)
+
+        symbols = {}
+        for (symbolPath, symbolDesc) in zip(symbolPaths, results):
+            if symbolDesc and "name" not in symbolDesc:
+                symbolDesc = None
+            symbols[symbolPath] = symbolDesc
+
+    return symbols
+
+
+
+def load_knitting_symbol(symbolPath, cache):
+    """
+    Returns a tuple (stamp, symbolDesc) for the symbol located
+    at symbolPath. The symbol is only parsed if it is not present
+    in cache or has changed since.
+
+    NOTE: This function runs in worker threads.
+    """
+
+    stamp = symbol_path_stamp(symbolPath)
+    if symbolPath in cache and stamp and \
+       cache[symbolPath]["stamp"] == stamp:
+        return (stamp, cache[symbolPath]["symbol"])
+
+    return (stamp, parse_knitting_symbol(symbolPath))
+
+
+
+def symbol_path_stamp(symbolPath):
+    """
+    Returns the modification times of the symbol directory and its
+    description file, or None if either can not be accessed.
+    """
+
+    try:
+        return [os.stat(symbolPath).st_mtime,
+                os.stat(symbolPath + "/description").st_mtime]
+    except OSError:
+        return None
+
+
+
+def load_symbol_cache(cacheFile):
+    """
+    Load the symbol cache stored in cacheFile. Returns an empty
+    cache if the file does not exist, can not be read or was written
+    by a different cache version.
+    """
+
+    try:
+        with open(cacheFile, "r", encoding="utf-8") as handle:
+            content = json.load(handle)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if not isinstance(content, dict) or \
+       content.get("version") != SYMBOL_CACHE_VERSION:
+        return {}
+
+    return content.get("symbols", {})
+
+
+
+def write_symbol_cache(cacheFile, cache):
+    """
+    Write the symbol cache to cacheFile. Failures are logged but
+    are otherwise harmless since the cache is rebuilt on the next
+    start.
+    """
+
+    tempFile = cacheFile + ".tmp"
+    try:
+        cacheDir = os.path.dirname(cacheFile)
+        if cacheDir and not os.path.isdir(cacheDir):
+            os.makedirs(cacheDir)
+
+        with open(tempFile, "w", encoding="utf-8") as handle:
+            json.dump({"version" : SYMBOL_CACHE_VERSION, 
+                       "symbols" : cache}, handle)
+        os.replace(tempFile, cacheFile)
+    except (IOError, OSError) as e:
+        logger.warn("write_symbol_cache: Could not write symbol cache %s "
+                    "-- %s" % (cacheFile, e))
+
+
+
+def get_list_of_symbol_paths(symbolTopLevelPaths, pool = None):
     """
     Given a list of top level paths to directories containting
-    sconcho kitting symbols returns a QStringList of all paths to 
+    sconcho kitting symbols returns a list of all paths to 
     individual sconcho patterns.
+
+    If a thread pool is given the top level paths are listed
+    concurrently.
+    """
+
+    if pool:
+        listings = pool.map(list_symbol_directory, symbolTopLevelPaths)
+    else:
+        listings = map(list_symbol_directory, symbolTopLevelPaths)
+
+    symbolPaths = []
+    for listing in listings:
+        symbolPaths.extend(listing)
+
+    return symbolPaths
+
+
+
+def list_symbol_directory(topLevelPath):
     """
+    Returns the sorted list of paths of all (non hidden) 
+    subdirectories of topLevelPath.
+    """
+
+    absolutePath = path.abspath(topLevelPath).replace("\\", "/")
+    try:
+        entries = os.listdir(absolutePath)
+    except OSError:
+        return []
 
     symbolPaths = []
-    for path in symbolTopLevelPaths:
-        aDir = QDir(path)
-        for entry in aDir.entryList(QDir.AllDirs | QDir.NoDotAndDotDot):
-            symbolPaths.append(aDir.absolutePath() + "/" + entry)
+    for entry in sorted(entries, key=lambda name: name.lower()):
+        if entry.startswith("."):
+            continue
+
+        symbolPath = absolutePath + "/" + entry
+        if path.isdir(symbolPath):
+            symbolPaths.append(symbolPath)
 
     return symbolPaths
         
@@ -100,33 +261,40 @@ def get_list_of_symbol_paths(symbolTopLevelPaths):
 def parse_knitting_symbol(symbolPath):
     """
     Parse the knitting symbol located at path symbolPath.
+
+    NOTE: We purposefully use ElementTree instead of QDom here
+    so this function can safely be called from worker threads.
     """
 
-    descriptionFile = QFile(symbolPath + "/description")
-    if (not descriptionFile.exists()) or descriptionFile.error():
+    descriptionFile = symbolPath + "/description"
+    if not path.isfile(descriptionFile):
         return None
 
     # parse XML
-    dom = QDomDocument()
-    (status, msg, line, col) = dom.setContent(descriptionFile)
-    if not status:
+    try:
+        root = ElementTree.parse(descriptionFile).getroot()
+    except ElementTree.ParseError as e:
+        (line, col) = e.position
+        reason = str(e).rsplit(":", 1)[0]
         errorMessage = ("Failed reading pattern description in file %s -- "
                         "%s at line %d column %d" % 
-                        (descriptionFile.fileName(), msg, line, col))
+                        (descriptionFile, reason, line, col))
         logger.error(errorMessage)
         return None
+    except (IOError, OSError):
+        return None
 
     # make sure we're reading a sconcho pattern description 
-    root = dom.documentElement()
-    if root.tagName() != "sconcho":
+    if root.tag != "sconcho":
         return None
 
     # parse the actual content
-    node = root.firstChild()
-    if node.toElement().tagName() != "knittingSymbol":
+    if len(root) == 0 or root[0].tag != "knittingSymbol":
         return None
   
-    content = parse_symbol_description(node)
+    content = parse_symbol_description(root[0])
+    if not content or "svgName" not in content:
+        return None
 
     # add the absolute path
     content["svgPath"] = symbolPath + "/" + content["svgName"] + ".svg"
@@ -145,18 +313,14 @@ def parse_symbol_description(node):
 
     content = {}
 
-    item = node.firstChild()
-    while not item.isNull():
+    for item in node:
 
-        #entry = item.firstChild().toText().data()
-        entry = item.firstChild().toCharacterData().data()
+        entry = item.text if item.text else ""
 
-        if item.toElement().tagName() == "svgName":
+        if item.tag == "svgName":
             content["svgName"] = entry
 
-        # looks like we explicitly have to copy the QStringList
-        # elements into a QString otherwise the code seg faults
-        if item.toElement().tagName() == "category":
+        if item.tag == "category":
             splitEntry = entry.split(":")
             if len(splitEntry) == 1:
                 content["category"] = splitEntry[0]
@@ -168,27 +332,28 @@ def parse_symbol_description(node):
                 return None
 
 
-        if item.toElement().tagName() == "symbolName":
+        if item.tag == "symbolName":
             content["name"] = entry
 
-        if item.toElement().tagName() == "symbolDescription":
+        if item.tag == "symbolDescription":
             content["description"] = entry
 
-        if item.toElement().tagName() == "symbolWidth":
+        if item.tag == "symbolWidth":
             content["width"] = entry
 
-        if item.toElement().tagName() == "backgroundColor":
+        if item.tag == "backgroundColor":
             content["backgroundColor"] = entry
 
-        item = item.nextSibling();
-
     return content
 
 
 
-def create_new_symbol(symbolPath, data): 
+def create_new_symbol(symbolPath, data, normalize = False): 
     """ This function creates a new knitting symbol as specified by
     the user. 
+
+    If normalize is True the copied svg image is run through
+    normalize_svg_file.
     """
 
     # make sure the user's symbol directory exists. If not we
@@ -234,6 +399,15 @@ def create_new_symbol(symbolPath, data):
             logger.error(msg.failedToCopySvgText % symbolTargetSvgPath) 
             raise IOError
 
+        if normalize:
+            (status, message) = normalize_svg_file(symbolTargetSvgPath,
+                                                   30 * int(data["width"]))
+            if not status:
+                QMessageBox.critical(None, msg.failedToNormalizeSvgTitle,
+                                     message, QMessageBox.Close)
+                logger.error(message)
+                raise IOError
+
         # write the description file
         descriptionFilePath = symbolDirPath + "/" + "description"
         descriptionFileHandle = QFile(descriptionFilePath)
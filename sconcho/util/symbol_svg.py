@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import hashlib
+import logging
+import os
+
+from PyQt4.QtCore import (QByteArray,
+                          QFile,
+                          QIODevice,
+                          Qt)
+from PyQt4.QtGui import (QApplication,
+                         QPainter,
+                         QPixmap,
+                         QWidget)
+from PyQt4.QtSvg import QSvgRenderer
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+
+# bump this whenever the icon rendering changes in a way that
+# invalidates previously stored icons
+ICON_CACHE_VERSION = 1
+
+# maximum size in bytes of the icons persisted on disk
+MAX_ICON_CACHE_SIZE = 20 * 1024**2
+
+
+##########################################################################
+#
+# Symbol dictionaries only carry the metadata parsed from the
+# symbol descriptions. The svg image of a symbol is read, validated
+# and turned into a renderer the first time the symbol is painted,
+# shown in a selector or placed on the canvas. All items showing
+# the same symbol share a single renderer.
+#
+# Renderers are parented to the application since canvas items
+# only keep a C++ reference to their shared renderer; dropping a
+# renderer from the cache therefore never pulls it out from under
+# an item still using it.
+#
+##########################################################################
+_svgData = {}
+_renderers = {}
+
+# pre-rendered icons keyed by (svgPath, width, height); they are
+# persisted below _iconCachePath under a name derived from the
+# modification time and size of the svg file, so a changed svg
+# never matches a stored icon
+_pixmaps = {}
+_iconCachePath = None
+
+
+
+def _load_symbol(symbol):
+    """ Read and validate the svg image of symbol and cache the
+    result. Broken or missing images are reported once and cached
+    as an empty renderer.
+
+    """
+
+    svgPath = symbol["svgPath"]
+    data = QByteArray()
+    renderer = QSvgRenderer(QApplication.instance())
+
+    handle = QFile(svgPath)
+    if handle.open(QIODevice.ReadOnly):
+        data = handle.readAll()
+        handle.close()
+
+    if data.isEmpty() or not renderer.load(data):
+        logger.error("symbol_svg: failed to load svg image %s for "
+                     "symbol %s" % (svgPath, symbol["name"]))
+        data = None
+
+    _svgData[svgPath] = data
+    _renderers[svgPath] = renderer
+
+
+
+def symbol_renderer(symbol):
+    """ Returns the shared renderer for symbol. Use isValid() on
+    the returned renderer to check if the svg could be loaded.
+
+    """
+
+    svgPath = symbol["svgPath"]
+    if svgPath not in _renderers:
+        _load_symbol(symbol)
+
+    return _renderers[svgPath]
+
+
+
+def symbol_svg_data(symbol):
+    """ Returns the svg image of symbol or None if it is
+    missing or broken.
+
+    """
+
+    svgPath = symbol["svgPath"]
+    if svgPath not in _svgData:
+        _load_symbol(symbol)
+
+    return _svgData[svgPath]
+
+
+
+def set_icon_cache_path(path):
+    """ Persist rendered icons below path. If path is None icons
+    are only kept in memory.
+
+    """
+
+    global _iconCachePath
+    _iconCachePath = path
+
+    # NOTE: render_cache can't be imported at module level since
+    # it depends on the canvas items which depend on us
+    if path and os.path.isdir(path):
+        from sconcho.util.render_cache import evict_cache_files
+        evict_cache_files(path, MAX_ICON_CACHE_SIZE)
+
+
+
+def symbol_pixmap(symbol, width, height):
+    """ Returns a width x height pixmap showing symbol. """
+
+    key = (symbol["svgPath"], width, height)
+    if key not in _pixmaps:
+        _pixmaps[key] = _load_icon(symbol, width, height)
+
+    return _pixmaps[key]
+
+
+
+def _icon_path(svgPath, width, height):
+    """ Returns the on disk location of the icon for the current
+    version of svgPath or None if svgPath can't be accessed.
+
+    """
+
+    try:
+        info = os.stat(svgPath)
+    except OSError:
+        return None
+
+    name = "%s:%d:%r:%d" % (svgPath, ICON_CACHE_VERSION, info.st_mtime,
+                            info.st_size)
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()
+    return os.path.join(_iconCachePath, "%s_%dx%d.png" % (digest, width,
+                                                          height))
+
+
+
+def _load_icon(symbol, width, height):
+    """ Fetch the icon for symbol from disk if it was stored for
+    the current svg and render it from the svg otherwise.
+
+    """
+
+    svgPath = symbol["svgPath"]
+    iconPath = None
+    if _iconCachePath:
+        iconPath = _icon_path(svgPath, width, height)
+
+    if iconPath and os.path.isfile(iconPath):
+        pixmap = QPixmap()
+        if pixmap.load(iconPath, "PNG"):
+            # mark icon as recently used for eviction
+            try:
+                os.utime(iconPath, None)
+            except OSError:
+                pass
+            return pixmap
+
+    pixmap = QPixmap(width, height)
+    pixmap.fill(Qt.transparent)
+    renderer = symbol_renderer(symbol)
+    if renderer.isValid():
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+
+        if iconPath:
+            _store_icon(pixmap, iconPath)
+
+    return pixmap
+
+
+
+def _store_icon(pixmap, iconPath):
+    """ Write pixmap to iconPath. """
+
+    if not os.path.isdir(_iconCachePath):
+        try:
+            os.makedirs(_iconCachePath)
+        except OSError as e:
+            logger.warn("symbol_svg: failed to create %s -- %s" %
+                        (_iconCachePath, e))
+            return
+
+    if not pixmap.save(iconPath, "PNG"):
+        logger.warn("symbol_svg: failed to store icon %s" % iconPath)
+
+
+
+def forget_symbol_svg(svgPath):
+    """ Drop the cached image for svgPath so the next request
+    re-reads it from disk, e.g. after a custom symbol was changed.
+
+    """
+
+    _svgData.pop(svgPath, None)
+    _renderers.pop(svgPath, None)
+    for key in [key for key in _pixmaps if key[0] == svgPath]:
+        del _pixmaps[key]
+
+
+
+#########################################################
+##
+## widget showing the cached icon of a symbol
+##
+#########################################################
+class SymbolIcon(QWidget):
+
+
+    def __init__(self, symbol, parent = None):
+
+        super(SymbolIcon, self).__init__(parent)
+        self._symbol = symbol
+
+
+
+    def paintEvent(self, event):
+        """ Blit the icon matching our current size. """
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, symbol_pixmap(self._symbol, self.width(),
+                                               self.height()))
+        painter.end()
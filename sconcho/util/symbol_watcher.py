@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+########################################################################
+#
+# (c) 2009-2013 Markus Dittrich
+#
+# This program is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public
+# License Version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License Version 3 for more details.
+#
+# You should have received a copy of the GNU General Public
+# License along with this program; if not, write to the Free
+# Software Foundation, Inc., 59 Temple Place - Suite 330,
+# Boston, MA 02111-1307, USA.
+#
+#######################################################################
+
+import logging
+import os
+
+from PyQt4.QtCore import (QFileSystemWatcher,
+                          QObject,
+                          QThread,
+                          QTimer,
+                          SIGNAL)
+
+from sconcho.util.symbol_parser import (list_symbol_directory,
+                                        parse_symbol_directories)
+
+
+# module lever logger:
+logger = logging.getLogger(__name__)
+
+# time in ms we wait for a burst of file system changes
+# to settle before re-parsing the affected symbols
+RELOAD_DELAY = 500
+
+
+
+##########################################################################
+#
+# Watches the symbol top level paths and all symbol directories
+# below them. After a burst of changes has settled only the affected
+# symbol directories are parsed again, in a SymbolParseThread so the
+# GUI stays responsive, and the result is reported via the
+# symbols_changed signal as a dictionary mapping each affected
+# directory to its new symbol description (or None if the directory
+# no longer holds a valid symbol).
+#
+# Directory watches only report files being created, deleted or
+# renamed; the files of each symbol (description and svg image) are
+# therefore watched as well so that editing them in place marks their
+# directory as changed. Editors that save by replacing a file drop
+# its watch, which is why the files of each reloaded directory are
+# watched anew.
+#
+##########################################################################
+class SymbolLibraryWatcher(QObject):
+
+
+    def __init__(self, symbolTopLevelPaths, parent = None):
+
+        super(SymbolLibraryWatcher, self).__init__(parent)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._symbolDirs = {}
+        self._pendingTopLevelPaths = set()
+        self._pendingSymbolDirs = set()
+        self._parseThread = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(RELOAD_DELAY)
+
+        watchedPaths = []
+        for topLevelPath in symbolTopLevelPaths:
+            topLevelPath = os.path.abspath(topLevelPath).replace("\\", "/")
+            if topLevelPath in self._symbolDirs or \
+               not os.path.isdir(topLevelPath):
+                continue
+
+            symbolDirs = list_symbol_directory(topLevelPath)
+            self._symbolDirs[topLevelPath] = set(symbolDirs)
+            watchedPaths.append(topLevelPath)
+            watchedPaths.extend(symbolDirs)
+            for symbolDir in symbolDirs:
+                watchedPaths.extend(symbol_files(symbolDir))
+
+        if watchedPaths:
+            self._watcher.addPaths(watchedPaths)
+
+        self.connect(self._watcher, SIGNAL("directoryChanged(QString)"),
+                     self.directory_changed)
+
+        self.connect(self._watcher, SIGNAL("fileChanged(QString)"),
+                     self.file_changed)
+
+        self.connect(self._timer, SIGNAL("timeout()"),
+                     self.reload)
+
+
+
+    def directory_changed(self, path):
+        """ Remember the changed path and (re)start the timer. """
+
+        if path in self._symbolDirs:
+            self._pendingTopLevelPaths.add(path)
+        else:
+            self._pendingSymbolDirs.add(path)
+
+        self._timer.start()
+
+
+
+    def file_changed(self, path):
+        """ Mark the symbol directory containing path as changed. """
+
+        self.directory_changed(os.path.dirname(path))
+
+
+
+    def reload(self):
+        """ Start re-parsing all symbol directories affected by the
+        changes since the last reload. The result is reported once
+        parsing is done.
+
+        """
+
+        # changes arriving while we're parsing are picked up by
+        # the next reload
+        if self._parseThread:
+            self._timer.start()
+            return
+
+        affectedDirs = self._pendingSymbolDirs
+        for topLevelPath in self._pendingTopLevelPaths:
+            oldDirs = self._symbolDirs[topLevelPath]
+            newDirs = set(list_symbol_directory(topLevelPath))
+            self._symbolDirs[topLevelPath] = newDirs
+
+            addedDirs = newDirs - oldDirs
+            if addedDirs:
+                self._watcher.addPaths(sorted(addedDirs))
+
+            # deleted directories are dropped by the watcher itself
+            watchedDirs = set(self._watcher.directories())
+            removedDirs = [path for path in oldDirs - newDirs
+                           if path in watchedDirs]
+            if removedDirs:
+                self._watcher.removePaths(removedDirs)
+
+            affectedDirs |= addedDirs | (oldDirs - newDirs)
+
+        self._pendingTopLevelPaths = set()
+        self._pendingSymbolDirs = set()
+        if not affectedDirs:
+            return
+
+        self._watch_files(affectedDirs)
+
+        logger.info("SymbolLibraryWatcher: reloading %d symbol "
+                    "directories" % len(affectedDirs))
+        self._parseThread = SymbolParseThread(sorted(affectedDirs), self)
+        self.connect(self._parseThread, SIGNAL("parsing_done"),
+                     self._parsing_done)
+        self._parseThread.start()
+
+
+
+    def _parsing_done(self, symbols):
+        """ Report the re-parsed symbols. """
+
+        self._parseThread.wait()
+        self._parseThread.deleteLater()
+        self._parseThread = None
+
+        self.emit(SIGNAL("symbols_changed"), symbols)
+
+
+
+    def _watch_files(self, symbolDirs):
+        """ Watch the current files of symbolDirs and stop watching
+        the ones that are gone.
+
+        """
+
+        watchedFiles = set(self._watcher.files())
+        for symbolDir in symbolDirs:
+            oldFiles = set(path for path in watchedFiles
+                           if os.path.dirname(path) == symbolDir)
+            newFiles = set(symbol_files(symbolDir))
+
+            if newFiles - oldFiles:
+                self._watcher.addPaths(sorted(newFiles - oldFiles))
+            if oldFiles - newFiles:
+                self._watcher.removePaths(sorted(oldFiles - newFiles))
+
+
+
+###########################################################################
+#
+# simple wrapper around QThread to parse symbol directories without
+# blocking the GUI thread
+#
+###########################################################################
+class SymbolParseThread(QThread):
+
+    def __init__(self, symbolDirs, parent = None):
+
+        super(SymbolParseThread, self).__init__(parent)
+
+        self.symbolDirs = symbolDirs
+
+
+    def run(self):
+        """ Parse our symbol directories and emit the result. """
+
+        symbols = parse_symbol_directories(self.symbolDirs)
+        self.emit(SIGNAL("parsing_done"), symbols)
+
+
+
+def symbol_files(symbolDir):
+    """ Returns the paths of all (non hidden) files in symbolDir. """
+
+    try:
+        names = os.listdir(symbolDir)
+    except OSError:
+        return []
+
+    paths = [symbolDir + "/" + name for name in names
+             if not name.startswith(".")]
+    return [path for path in paths if os.path.isfile(path)]
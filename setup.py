@@ -10,8 +10,8 @@ def check_dependencies():
     """
 
     # python 
-    if sys.version_info < (3, 2, 0):
-        print('Sorry, sconcho needs python version 3.2 or later')
+    if sys.version_info < (3, 4, 0):
+        print('Sorry, sconcho needs python version 3.4 or later')
         print("Python Version detected: %d.%d.%d" % sys.version_info[:3])
         exit(5)
     print("Python Version: %d.%d.%d" % sys.version_info[:3])
@@ -49,6 +49,9 @@ if __name__ == "__main__":
     #make sure we copy the manual
     dataFiles.append('doc/manual.html')
 
+    # binary icon resources
+    dataFiles.append('gui/icons.rcc')
+
     setup(name='sconcho',
         version='0.2.0_b7',
         description='Program for Generating Knitting Charts',